@@ -39,11 +39,14 @@ TD-009
       result (or the already-raised exception) is what propagates.
 """
 
+import asyncio
 import time
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from langgraph.errors import GraphInterrupt
 
+from agentmap.services.logging_service import log_payload
+from agentmap.services.state_adapter_service import StateOverlay
 from agentmap.services.telemetry.constants import (
     AGENT_NAME,
     AGENT_RUN_SPAN,
@@ -62,7 +65,8 @@ class AgentLifecycleMixin:
     ``output_fields``, ``process()``, ``process_async()``, ``_pre_process()``,
     ``_post_process()``, ``_validate_multi_output()``, the ``log_*`` methods,
     and the span helpers ``_record_lifecycle_event`` / ``_set_span_status_ok``
-    / ``_record_span_exception``.
+    / ``_record_span_exception``. ``_node_result_cache`` is optional and
+    enables memoization of the node's state update.
     """
 
     # ------------------------------------------------------------------
@@ -75,6 +79,7 @@ class AgentLifecycleMixin:
         execution_id: str,
         start_time: float,
         is_async: bool = False,
+        state: Any = None,
     ) -> Dict[str, Any]:
         """Resolve process() output into a state-update dict and log completion.
 
@@ -82,6 +87,10 @@ class AgentLifecycleMixin:
         ``_execute_agent_lifecycle_async`` so the multi-output / single-output
         / no-output resolution rules stay identical between the sync and
         async paths (TD-007).
+
+        When the hooks returned a ``StateOverlay`` (see
+        ``StateAdapterService.copy_on_write``), its changed keys are merged
+        into the update; values resolved from *output* take precedence.
         """
         if isinstance(output, dict) and "state_updates" in output:
             state_updates = output["state_updates"]
@@ -103,16 +112,20 @@ class AgentLifecycleMixin:
                 self.log_debug(msg)
                 result = state_updates
             else:
+                field = self.output_fields[0]
                 msg = (
-                    f"Async set output field '{self.output_fields[0]}' = {output}"
+                    f"Async set output field '{field}' = %s"
                     if is_async
-                    else f"Set output field '{self.output_fields[0]}' = {output}"
+                    else f"Set output field '{field}' = %s"
                 )
-                self.log_debug(msg)
-                result = {self.output_fields[0]: output}
+                self.log_debug(msg, log_payload(output))
+                result = {field: output}
         else:
             result = {}
 
+        if isinstance(state, StateOverlay):
+            result = {**state.changes, **result}
+
         duration = time.time() - start_time
         label = "RUN_ASYNC" if is_async else "RUN"
         self.log_trace(
@@ -176,6 +189,79 @@ class AgentLifecycleMixin:
         )
         return error_updates
 
+    # ------------------------------------------------------------------
+    # Node result memoization (see services/graph/node_result_cache.py)
+    # ------------------------------------------------------------------
+
+    def _lookup_memoized(self, inputs: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Return ``(cache_key, cached_update)`` for a memoized node.
+
+        Both are ``None`` when no cache is attached or the inputs cannot be
+        keyed; ``cached_update`` is ``None`` on a miss. Cache failures are
+        logged and treated as a miss so they never fail the node.
+        """
+        cache = getattr(self, "_node_result_cache", None)
+        if cache is None:
+            return None, None
+        try:
+            cache_key = cache.make_key(self, inputs)
+            if cache_key is None:
+                return None, None
+            return cache_key, cache.get(cache_key)
+        except Exception as e:
+            self.log_warning(f"Node result cache lookup failed: {e}")
+            return None, None
+
+    @staticmethod
+    def _reports_failure(value: Any) -> bool:
+        """True if *value* is a dict carrying an ``error`` or a failed flag."""
+        return isinstance(value, dict) and (
+            "error" in value or value.get("last_action_success") is False
+        )
+
+    def _store_memoized(
+        self, cache_key: Any, result: Dict[str, Any], output: Any = None
+    ) -> None:
+        """Store a successful state update under *cache_key* (best effort).
+
+        Agents that catch their own exceptions (e.g. LLMAgent) return
+        ``{"error": ..., "last_action_success": False}``; such runs are not
+        stored, so a transient failure is never replayed.
+        """
+        if cache_key is None:
+            return
+        if self._reports_failure(output) or any(
+            self._reports_failure(value) for value in (result, *result.values())
+        ):
+            return
+        try:
+            self._node_result_cache.put(cache_key, self, result)
+        except Exception as e:
+            self.log_warning(f"Node result cache store failed: {e}")
+
+    def _replay_memoized(
+        self,
+        cached: Dict[str, Any],
+        span: Any,
+        tracker: Any,
+        tracking_service: Any,
+        execution_id: str,
+        start_time: float,
+        is_async: bool = False,
+    ) -> Dict[str, Any]:
+        """Return a cached state update in place of running the node."""
+        self._record_lifecycle_event(span, "agent.memoized")
+        self._set_span_status_ok(span)
+        tracking_service.record_node_result(tracker, self.name, True, result=cached)
+        self.log_debug(f"Reused memoized result for fields {list(cached)}")
+
+        duration = time.time() - start_time
+        label = "RUN_ASYNC" if is_async else "RUN"
+        self.log_trace(
+            f"\n*** AGENT {self.name} {label} MEMOIZED [{execution_id}] in {duration:.4f}s ***"
+        )
+        return cached
+
     # ------------------------------------------------------------------
     # TD-009: manual span context-manager handling
     # ------------------------------------------------------------------
@@ -358,6 +444,11 @@ class AgentLifecycleMixin:
         *span* is not None, lifecycle events are recorded on it.
         """
         tracking_service, tracker, inputs = self._lifecycle_start(state)
+        cache_key, cached = self._lookup_memoized(inputs)
+        if cached is not None:
+            return self._replay_memoized(
+                cached, span, tracker, tracking_service, execution_id, start_time
+            )
 
         try:
             self._record_lifecycle_event(span, "pre_process.start")
@@ -376,9 +467,11 @@ class AgentLifecycleMixin:
             self._set_span_status_ok(span)
             tracking_service.record_node_result(tracker, self.name, True, result=output)
 
-            return self._resolve_state_update(
-                output, execution_id, start_time, is_async=False
+            result = self._resolve_state_update(
+                output, execution_id, start_time, is_async=False, state=state
             )
+            self._store_memoized(cache_key, result, output)
+            return result
 
         except GraphInterrupt:
             self._handle_lifecycle_interrupt(
@@ -416,6 +509,13 @@ class AgentLifecycleMixin:
         GraphInterrupt propagates unchanged (REQ-F-001).
         """
         tracking_service, tracker, inputs = self._lifecycle_start(state)
+        cache_key = cached = None
+        if getattr(self, "_node_result_cache", None) is not None:
+            cache_key, cached = await asyncio.to_thread(self._lookup_memoized, inputs)
+        if cached is not None:
+            return self._replay_memoized(
+                cached, span, tracker, tracking_service, execution_id, start_time, True
+            )
 
         try:
             self._record_lifecycle_event(span, "pre_process.start")
@@ -434,9 +534,12 @@ class AgentLifecycleMixin:
             self._set_span_status_ok(span)
             tracking_service.record_node_result(tracker, self.name, True, result=output)
 
-            return self._resolve_state_update(
-                output, execution_id, start_time, is_async=True
+            result = self._resolve_state_update(
+                output, execution_id, start_time, is_async=True, state=state
             )
+            if cache_key is not None:
+                await asyncio.to_thread(self._store_memoized, cache_key, result, output)
+            return result
 
         except GraphInterrupt:
             self._handle_lifecycle_interrupt(
@@ -6,6 +6,7 @@ Infrastructure services are injected via constructor, business services via post
 """
 
 import asyncio
+import copy
 import logging
 import time
 import uuid
@@ -13,6 +14,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agentmap.agents.agent_lifecycle_mixin import AgentLifecycleMixin
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.logging_service import TRACE_LEVEL
 from agentmap.services.protocols import (
     LLMCapableAgent,
     LLMServiceProtocol,
@@ -36,6 +38,11 @@ class BaseAgent(AgentLifecycleMixin):
     # framework can map CSV input fields to agent parameters by position.
     expected_params: Optional[List[str]] = None
 
+    # Agents that write files, storage or external systems, or interact with
+    # users, set this so their nodes are never memoized (see
+    # services/graph/node_result_cache.py).
+    has_side_effects: bool = False
+
     def __init__(
         self,
         name: str,
@@ -174,18 +181,28 @@ class BaseAgent(AgentLifecycleMixin):
         return self._current_execution_tracker
 
     # Logging Methods (updated for better unknown level handling)
+    _LOG_LEVELS = {
+        "debug": logging.DEBUG,
+        "info": logging.INFO,
+        "warning": logging.WARNING,
+        "error": logging.ERROR,
+        "trace": TRACE_LEVEL,
+    }
+
     def log(self, level: str, message: str, *args, **kwargs):
-        """Log a message with the specified level and proper agent context."""
-        # Define valid logging levels
-        valid_levels = ["debug", "info", "warning", "error", "trace"]
+        """Log a message with the specified level and proper agent context.
 
+        ``args`` are %-style arguments formatted only when the record is
+        emitted; wrap large values in ``log_payload()``.
+        """
         # Use the specified level if valid, otherwise default to info
-        if level in valid_levels:
-            logger_method = getattr(self.logger, level)
-        else:
-            logger_method = self.logger.info
+        if level not in self._LOG_LEVELS:
+            level = "info"
+        if not self.logger.isEnabledFor(self._LOG_LEVELS[level]):
+            return
 
-        logger_method(f"{self._log_prefix} {message}", *args, **kwargs)
+        prefix = self._log_prefix.replace("%", "%%") if args else self._log_prefix
+        getattr(self.logger, level)(f"{prefix} {message}", *args, **kwargs)
 
     def log_debug(self, message: str, *args, **kwargs):
         """Log a debug message with agent context."""
@@ -225,11 +242,13 @@ class BaseAgent(AgentLifecycleMixin):
         Async sibling to process(). Subclasses may override this to provide
         native async work without modifying the sync process() contract.
 
-        Default behaviour (REQ-NF-001): runs the sync process() in the default
-        executor so the event loop remains responsive for sync-only subclasses.
-        This means sync-only subclasses gain async compatibility for free, while
+        Default behaviour (REQ-NF-001): runs the sync process() in an executor
+        so the event loop remains responsive for sync-only subclasses. This
+        means sync-only subclasses gain async compatibility for free, while
         native-async subclasses can override this method to avoid the executor
-        overhead.
+        overhead. The executor is the named pool configured via
+        configure_executor() during async graph assembly, or the loop's
+        default executor when none was configured.
 
         Args:
             inputs: Dictionary of input values
@@ -237,8 +256,58 @@ class BaseAgent(AgentLifecycleMixin):
         Returns:
             Output value, same logical shape as process() for equivalent inputs.
         """
-        loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.process, inputs)
+        runner = getattr(self, "_executor_runner", None)
+        if runner is None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.process, inputs)
+        if getattr(self, "_executor_in_process", False):
+            return await runner(self._detached_for_process_pool().process, inputs)
+        return await runner(self.process, inputs)
+
+    def configure_executor(self, runner: Any, in_process: bool = False) -> None:
+        """
+        Route process_async() through a named executor pool.
+
+        Args:
+            runner: Async callable ``runner(fn, *args)`` returning fn's result,
+                typically ExecutionPoolService.bind(pool, graph_name)
+            in_process: True when the runner is a process pool; process() then
+                runs on a detached copy of the agent (see
+                _detached_for_process_pool) and cannot mutate this instance.
+        """
+        self._executor_runner = runner
+        self._executor_in_process = in_process
+
+    def configure_node_result_cache(self, cache: Any) -> None:
+        """
+        Memoize this node's state update in a NodeResultCache.
+
+        Args:
+            cache: NodeResultCache keyed on this agent's configuration and
+                inputs; a cache hit skips pre_process/process/post_process.
+        """
+        self._node_result_cache = cache
+
+    def _detached_for_process_pool(self) -> "BaseAgent":
+        """
+        Shallow copy of this agent without services, for pickling into a
+        process pool worker. CPU-bound agents opting into ``executor: process``
+        must not rely on injected services inside process().
+        """
+        detached = copy.copy(self)
+        for attribute in (
+            "_execution_tracking_service",
+            "_state_adapter_service",
+            "_telemetry_service",
+            "_llm_service",
+            "_storage_service",
+            "_current_execution_tracker",
+            "_executor_runner",
+            "_node_result_cache",
+        ):
+            if hasattr(detached, attribute):
+                setattr(detached, attribute, None)
+        return detached
 
     async def run_async(self, state: Any) -> Dict[str, Any]:
         """
@@ -319,8 +388,14 @@ class BaseAgent(AgentLifecycleMixin):
         The BaseAgent.run() method recognizes 'state_updates' and returns
         all fields to LangGraph for merging into state.
 
+        Alternatively, wrap the state with
+        ``self.state_adapter_service.copy_on_write(state)`` and update it with
+        ``set_value``; the keys changed through the returned overlay are
+        merged into the node's update without copying the rest of the state.
+
         Args:
-            state: Current state (READ-ONLY - modifications discarded in run())
+            state: Current state (READ-ONLY - modifications discarded in run()
+                unless made through a copy-on-write overlay)
             inputs: Input values used for processing
             output: Output value from the process method
 
@@ -4,6 +4,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from agentmap.agents.base_agent import BaseAgent
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.logging_service import log_payload
 from agentmap.services.state_adapter_service import StateAdapterService
 
 
@@ -136,7 +137,9 @@ class BranchingAgent(BaseAgent):
             String describing the branching decision
         """
         self.log_info(
-            f"[BranchingAgent] {self.name} executed with inputs: {inputs} and prompt: {self.prompt}"
+            f"[BranchingAgent] {self.name} executed with inputs: %s and prompt: %s",
+            log_payload(inputs),
+            self.prompt,
         )
 
         # Determine success based on configured criteria
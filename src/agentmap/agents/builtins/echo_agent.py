@@ -7,6 +7,7 @@ from typing import Any, Dict, Optional
 
 from agentmap.agents.base_agent import BaseAgent
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.logging_service import log_payload
 from agentmap.services.prompt_manager_service import PromptManagerService
 from agentmap.services.protocols import PromptCapableAgent
 from agentmap.services.state_adapter_service import StateAdapterService
@@ -74,7 +75,9 @@ class EchoAgent(BaseAgent, PromptCapableAgent):
             return result
 
         # If there are inputs, return them
-        self.log_info(f"received inputs: {inputs} and prompt: '{self.prompt}'")
+        self.log_info(
+            "received inputs: %s and prompt: '%s'", log_payload(inputs), self.prompt
+        )
         if inputs:
             # For multiple inputs, return all as a dictionary to maintain structure
             if len(inputs) > 1:
@@ -1,10 +1,13 @@
 # agentmap/agents/builtins/graph_agent.py
 import logging
-from typing import Any, Dict, Optional, Tuple
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from agentmap.agents.base_agent import BaseAgent
+from agentmap.exceptions.base_exceptions import ConfigurationException
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
 from agentmap.services.function_resolution_service import FunctionResolutionService
+from agentmap.services.graph.runner.map_executor import DEFAULT_MAP_CONCURRENCY
 from agentmap.services.protocols import (
     GraphBundleCapableAgent,
     GraphBundleServiceProtocol,
@@ -26,11 +29,20 @@ class GraphAgent(BaseAgent, GraphBundleCapableAgent, GraphRunnerCapableAgent):
     there, prepares input state, and delegates execution to GraphRunnerService.
 
     Supports flexible input/output mapping and nested execution tracking.
+    In map mode ({map_over=field}) the subgraph is prepared once and run
+    for every item of a list in state, with bounded concurrency.
     Implements GraphBundleCapableAgent protocol for proper service injection.
     """
 
+    has_side_effects = True
+
     _FULL_PARENT_STATE_KEY = "__graph_agent_parent_state__"
     _MISSING = object()
+    _MAP_OPTION_KEYS = ("map_over", "item_field", "max_concurrency")
+    _MAP_DIRECTIVE_RE = re.compile(r"\{(map_over|item_field|max_concurrency)=([^}]+)\}")
+    _INTERNAL_RESULT_KEYS = frozenset(
+        {"subgraph_bundles", "__execution_summary", "__policy_success"}
+    )
 
     def __init__(
         self,
@@ -68,6 +80,8 @@ class GraphAgent(BaseAgent, GraphBundleCapableAgent, GraphRunnerCapableAgent):
         self._function_resolution_service = None
         self._graph_bundle_service = None
 
+        self._map_options = self._get_map_options()
+
     # --- Protocol-based service configuration ---
 
     def configure_graph_bundle_service(
@@ -136,6 +150,8 @@ class GraphAgent(BaseAgent, GraphBundleCapableAgent, GraphRunnerCapableAgent):
 
         The bundle is expected in inputs["subgraph_bundles"][self.name],
         placed there by GraphRunnerService._resolve_subgraph_bundles().
+        In map mode the subgraph runs once per item of the ``map_over``
+        list (see ``_get_map_options``).
 
         Args:
             inputs: Dictionary containing input values from input_fields
@@ -144,8 +160,71 @@ class GraphAgent(BaseAgent, GraphBundleCapableAgent, GraphRunnerCapableAgent):
             Output from the subgraph execution
         """
         self.log_info(f"[GraphAgent] Executing subgraph for node: {self.name}")
+        bundle = self._get_subgraph_bundle(inputs)
+
+        # Check service configuration (let configuration errors bubble up)
+        graph_runner = self.graph_runner_service
+
+        if self._map_options is not None:
+            try:
+                results = graph_runner.run_map(
+                    bundle=bundle,
+                    item_states=self._prepare_map_item_states(inputs),
+                    **self._map_run_kwargs(),
+                )
+                return self._collect_map_results(bundle, results)
+            except Exception as e:
+                return self._subgraph_error(e)
+
+        # Prepare the initial state for the subgraph
+        subgraph_state = self._prepare_subgraph_state(inputs)
+
+        try:
+            # Execute the subgraph
+            result = graph_runner.run(
+                bundle=bundle,
+                initial_state=subgraph_state,
+                is_subgraph=True,
+                **self._parent_run_kwargs(),
+            )
+            return self._handle_subgraph_result(bundle, result)
+
+        except Exception as e:
+            return self._subgraph_error(e)
+
+    async def process_async(self, inputs: Dict[str, Any]) -> Any:
+        """Async ``process``: awaits the runner's native async execution."""
+        self.log_info(f"[GraphAgent] Executing async subgraph for node: {self.name}")
+        bundle = self._get_subgraph_bundle(inputs)
+        graph_runner = self.graph_runner_service
 
-        # Read pre-resolved bundle from state
+        if self._map_options is not None:
+            try:
+                results = await graph_runner.run_map_async(
+                    bundle=bundle,
+                    item_states=self._prepare_map_item_states(inputs),
+                    **self._map_run_kwargs(),
+                )
+                return self._collect_map_results(bundle, results)
+            except Exception as e:
+                return self._subgraph_error(e)
+
+        subgraph_state = self._prepare_subgraph_state(inputs)
+
+        try:
+            result = await graph_runner.run_async(
+                bundle=bundle,
+                initial_state=subgraph_state,
+                is_subgraph=True,
+                **self._parent_run_kwargs(),
+            )
+            return self._handle_subgraph_result(bundle, result)
+
+        except Exception as e:
+            return self._subgraph_error(e)
+
+    def _get_subgraph_bundle(self, inputs: Dict[str, Any]) -> Any:
+        """Read this node's pre-resolved bundle, raising if it is missing."""
         bundle = inputs.get("subgraph_bundles", {}).get(self.name)
         if not bundle:
             raise RuntimeError(
@@ -158,51 +237,171 @@ class GraphAgent(BaseAgent, GraphBundleCapableAgent, GraphRunnerCapableAgent):
             f"[GraphAgent] Got pre-resolved bundle for '{bundle.graph_name}' "
             f"with {len(bundle.nodes) if bundle.nodes else 0} nodes"
         )
+        return bundle
 
-        # Check service configuration (let configuration errors bubble up)
-        graph_runner = self.graph_runner_service
+    def _parent_run_kwargs(self) -> Dict[str, Any]:
+        """Parent tracker and graph name for nested execution tracking."""
+        return {
+            "parent_tracker": getattr(self, "current_execution_tracker", None),
+            "parent_graph_name": (
+                self.context.get("graph_name") if self.context else None
+            ),
+        }
 
-        # Prepare the initial state for the subgraph
-        subgraph_state = self._prepare_subgraph_state(inputs)
+    def _handle_subgraph_result(self, bundle: Any, result: Any) -> Any:
+        """Turn a single subgraph run's result into this node's output."""
+        # Extract final_state from ExecutionResult
+        from agentmap.models.execution.result import ExecutionResult
+
+        if isinstance(result, ExecutionResult):
+            if not result.success:
+                self.log_error(
+                    f"[GraphAgent] Subgraph '{bundle.graph_name}' failed: {result.error}"
+                )
+                return {
+                    "error": f"Subgraph '{bundle.graph_name}' failed: {result.error}",
+                    "last_action_success": False,
+                }
+            result = result.final_state or {}
+
+        self.log_info("[GraphAgent] Subgraph execution completed successfully")
+        return self._process_subgraph_result(result)
+
+    def _subgraph_error(self, error: Exception) -> Dict[str, Any]:
+        """Output for a subgraph run that raised."""
+        self.log_error(f"[GraphAgent] Error executing subgraph: {str(error)}")
+        return {
+            "error": f"Failed to execute subgraph for node '{self.name}': {str(error)}",
+            "last_action_success": False,
+        }
 
+    # --- Map mode ---
+
+    def _get_map_options(self) -> Optional[Dict[str, Any]]:
+        """
+        Map-mode settings, or None when the node runs its subgraph once.
+
+        Set as context keys (JSON context) or as directives next to the
+        workflow reference, e.g.
+        ``{workflow=::ScoreItem}{map_over=items}{max_concurrency=8}``:
+
+        - ``map_over``: state field holding the list to fan out over
+        - ``item_field``: subgraph state field receiving each item
+          (default ``item``)
+        - ``max_concurrency``: items running at once (default 4)
+
+        Raises:
+            ConfigurationException: If ``max_concurrency`` is not a positive
+                integer
+        """
+        options = {
+            key: self.context[key]
+            for key in self._MAP_OPTION_KEYS
+            if key in self.context
+        }
+        raw_context = self.context.get("context")
+        if isinstance(raw_context, str):
+            for key, value in self._MAP_DIRECTIVE_RE.findall(raw_context):
+                options.setdefault(key, value.strip())
+        if not options.get("map_over"):
+            return None
+        raw_concurrency = options.get("max_concurrency", DEFAULT_MAP_CONCURRENCY)
         try:
-            # Get parent tracker if available for nested tracking
-            parent_tracker = getattr(self, "current_execution_tracker", None)
+            max_concurrency = int(str(raw_concurrency).strip())
+        except ValueError:
+            max_concurrency = 0
+        if max_concurrency < 1:
+            raise ConfigurationException(
+                f"Invalid max_concurrency {raw_concurrency!r} for GraphAgent node "
+                f"'{self.name}': expected a positive integer."
+            )
+        return {
+            "map_over": str(options["map_over"]),
+            "item_field": str(options.get("item_field") or "item"),
+            "max_concurrency": max_concurrency,
+        }
 
-            # Execute the subgraph
-            result = graph_runner.run(
-                bundle=bundle,
-                initial_state=subgraph_state,
-                is_subgraph=True,
-                parent_tracker=parent_tracker,
-                parent_graph_name=(
-                    self.context.get("graph_name") if self.context else None
-                ),
+    def _map_run_kwargs(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self._map_options["max_concurrency"],
+            **self._parent_run_kwargs(),
+        }
+
+    def _prepare_map_item_states(self, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        One subgraph state per item of the ``map_over`` list.
+
+        Each is the usual subgraph state (input mapping applied) without the
+        list itself, plus the item under ``item_field``.
+
+        Raises:
+            ValueError: If the ``map_over`` field is missing or not a list
+        """
+        map_over = self._map_options["map_over"]
+        items = self.state_adapter_service.get_value(
+            self._get_parent_state_for_mapping(inputs), map_over, self._MISSING
+        )
+        if items is self._MISSING:
+            items = inputs.get(map_over, self._MISSING)
+        if items is self._MISSING or not isinstance(items, (list, tuple)):
+            raise ValueError(
+                f"map_over field '{map_over}' must be a list in state "
+                f"(got {type(items).__name__ if items is not self._MISSING else 'nothing'})"
             )
 
-            # Extract final_state from ExecutionResult
-            from agentmap.models.execution.result import ExecutionResult
+        base_state = self._prepare_subgraph_state(inputs)
+        base_state.pop(map_over, None)
+        base_state.pop(self._FULL_PARENT_STATE_KEY, None)
+        item_field = self._map_options["item_field"]
+        self.log_debug(
+            f"[GraphAgent] Mapping subgraph over {len(items)} item(s) "
+            f"from '{map_over}'"
+        )
+        return [{**base_state, item_field: item} for item in items]
 
-            if isinstance(result, ExecutionResult):
-                if not result.success:
-                    self.log_error(
-                        f"[GraphAgent] Subgraph '{bundle.graph_name}' failed: {result.error}"
-                    )
-                    return {
-                        "error": f"Subgraph '{bundle.graph_name}' failed: {result.error}",
-                        "last_action_success": False,
-                    }
-                result = result.final_state or {}
+    def _collect_map_results(self, bundle: Any, results: List[Any]) -> Dict[str, Any]:
+        """
+        Ordered per-item outputs plus per-item errors.
 
-            self.log_info("[GraphAgent] Subgraph execution completed successfully")
-            return self._process_subgraph_result(result)
+        ``results[i]`` is item i's subgraph output (None if it failed) and
+        ``errors`` lists ``{"index", "error"}`` for each failed item.
+        """
+        values: List[Any] = []
+        errors: List[Dict[str, Any]] = []
+        for index, result in enumerate(results):
+            if result.success:
+                values.append(self._extract_item_result(result.final_state or {}))
+            else:
+                values.append(None)
+                errors.append({"index": index, "error": result.error})
 
-        except Exception as e:
-            self.log_error(f"[GraphAgent] Error executing subgraph: {str(e)}")
-            return {
-                "error": f"Failed to execute subgraph for node '{self.name}': {str(e)}",
-                "last_action_success": False,
-            }
+        if errors:
+            self.log_warning(
+                f"[GraphAgent] {len(errors)} of {len(results)} mapped runs of "
+                f"'{bundle.graph_name}' failed"
+            )
+        else:
+            self.log_info(
+                f"[GraphAgent] Mapped subgraph completed for {len(results)} item(s)"
+            )
+        return {
+            "results": values,
+            "errors": errors,
+            "succeeded": len(results) - len(errors),
+            "failed": len(errors),
+            "graph_success": not errors,
+        }
+
+    def _extract_item_result(self, final_state: Dict[str, Any]) -> Any:
+        """One mapped item's output, picked like ``_process_subgraph_result``."""
+        if self._get_output_mapping_target():
+            _, source_field = self.output_field.split("=", 1)
+            return final_state.get(source_field)
+        if self.output_field and self.output_field in final_state:
+            return final_state[self.output_field]
+        return {
+            k: v for k, v in final_state.items() if k not in self._INTERNAL_RESULT_KEYS
+        }
 
     def _post_process(
         self, state: Any, inputs: Dict[str, Any], output: Any
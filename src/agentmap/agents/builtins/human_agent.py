@@ -7,6 +7,7 @@ from langgraph.types import interrupt
 from agentmap.agents.builtins.suspend_agent import SuspendAgent
 from agentmap.models.human_interaction import InteractionType
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.logging_service import log_payload
 from agentmap.services.state_adapter_service import StateAdapterService
 
 
@@ -95,7 +96,10 @@ class HumanAgent(SuspendAgent):
         )
 
         # This code only runs on resume!
-        self.log_info(f"[HumanAgent] Resuming with human response: {human_response}")
+        self.log_info(
+            "[HumanAgent] Resuming with human response: %s",
+            log_payload(human_response),
+        )
 
         # Process the response and return the appropriate value
         return self._process_human_response(human_response, inputs)
@@ -116,7 +120,9 @@ class HumanAgent(SuspendAgent):
         action = human_response.get("action", "unknown")
         data = human_response.get("data", {})
 
-        self.log_debug(f"Processing human response: action={action}, data={data}")
+        self.log_debug(
+            "Processing human response: action=%s, data=%s", action, log_payload(data)
+        )
 
         # Handle different interaction types
         if self.interaction_type == InteractionType.APPROVAL:
@@ -13,6 +13,8 @@ from agentmap.services.state_adapter_service import StateAdapterService
 class InputAgent(BaseAgent):
     """Agent that prompts the user for input during execution."""
 
+    has_side_effects = True
+
     def __init__(
         self,
         name: str,
@@ -10,13 +10,21 @@ from agentmap.agents.base_agent import BaseAgent
 
 # Import memory utilities
 from agentmap.agents.builtins.llm.memory import (
+    DEFAULT_KEEP_RECENT,
+    DEFAULT_MEMORY_MAX_TOKENS,
+    ConversationMemory,
+    MemorySegmentStore,
     add_assistant_message,
     add_system_message,
     add_user_message,
     get_memory,
+    get_segment_store,
+    is_memory_reference,
+    memory_size,
     truncate_memory,
 )
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.logging_service import log_payload
 from agentmap.services.protocols import (
     LLMCapableAgent,
     LLMServiceProtocol,
@@ -98,6 +106,12 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
         # Memory configuration
         self.memory_key = self.context.get("memory_key", "memory")
         self.max_memory_messages = self.context.get("max_memory_messages", None)
+        # "messages": full list in state (default); "token": token-budgeted,
+        # summarizing memory stored in state as a segment reference
+        self.memory_max_tokens = self.context.get("memory_max_tokens")
+        self.memory_strategy = self.context.get(
+            "memory_strategy", "token" if self.memory_max_tokens else "messages"
+        )
 
         # Additional configuration properties for backward compatibility
         self.max_tokens = self.context.get("max_tokens")
@@ -272,7 +286,7 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
                 "input_field_count": len(
                     [f for f in self.input_fields if f != self.memory_key]
                 ),
-                "memory_size": len(inputs.get(self.memory_key, [])),
+                "memory_size": memory_size(inputs.get(self.memory_key, [])),
                 **self.context.get("input_context", {}),
             },
             "max_tokens": self.max_tokens,
@@ -309,27 +323,42 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
         llm_service = self.llm_service
 
         try:
-            # Initialize memory if needed (handle both direct process() calls and run() calls)
-            self._initialize_memory_if_needed(inputs)
-
             # Build user input using shared helper
             user_input = self._build_user_input(inputs)
 
             if not user_input:
                 self.log_warning("No input found in inputs")
             else:
-                self.log_info(f"Processing LLM request with input: {user_input}")
-
-            # Get memory from inputs
-            messages = get_memory(inputs, self.memory_key)
+                self.log_info(
+                    "Processing LLM request with input: %s", log_payload(user_input)
+                )
 
-            # Add user message to memory (only if we have input)
-            if user_input:
-                add_user_message(inputs, user_input, self.memory_key)
+            if self.memory_strategy == "token":
+                memory = self._load_token_memory(inputs, user_input)
+                if memory.needs_summary():
+                    try:
+                        summary = llm_service.call_llm(
+                            **self._summary_call_params(memory.summary_request())
+                        )
+                    except Exception as e:
+                        self.log_warning(f"Memory summarization failed: {e}")
+                        summary = None
+                    memory.apply_summary(summary)
+                messages = memory.build_messages()
+            else:
+                # Initialize memory if needed (handle both direct process() calls and run() calls)
+                self._initialize_memory_if_needed(inputs)
 
-                # Get updated messages
+                # Get memory from inputs
                 messages = get_memory(inputs, self.memory_key)
 
+                # Add user message to memory (only if we have input)
+                if user_input:
+                    add_user_message(inputs, user_input, self.memory_key)
+
+                    # Get updated messages
+                    messages = get_memory(inputs, self.memory_key)
+
             # Prepare routing context
             routing_context = self._prepare_routing_context(inputs)
 
@@ -362,17 +391,15 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
                 result = llm_service.call_llm(**call_params)
 
             # Add assistant response to memory
-            add_assistant_message(inputs, result, self.memory_key)
-
-            # Apply message limit if configured
-            if self.max_memory_messages:
-                truncate_memory(inputs, self.max_memory_messages, self.memory_key)
+            memory_value = self._record_assistant_message(
+                inputs, result, memory if self.memory_strategy == "token" else None
+            )
 
             # Log successful completion
             self.log_info("LLM processing completed successfully")
 
             # Return result with memory included
-            return {"output": result, self.memory_key: inputs.get(self.memory_key, [])}
+            return {"output": result, self.memory_key: memory_value}
 
         except Exception as e:
             provider_name = (
@@ -412,16 +439,105 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
         Initialize memory in inputs if not already present and add system message.
 
         Shared by sync process() and async process_async() so both paths
-        handle memory initialization identically.
+        handle memory initialization identically. A token-memory reference is
+        expanded to its message list from the configured segment store.
 
         Args:
             inputs: Dictionary of input values (mutated in place)
         """
+        if is_memory_reference(inputs.get(self.memory_key)):
+            inputs[self.memory_key] = get_memory(
+                inputs, self.memory_key, store=self._memory_segment_store()
+            )
         if self.memory_key not in inputs:
             inputs[self.memory_key] = []
             if self.resolved_prompt:
                 add_system_message(inputs, self.resolved_prompt, self.memory_key)
 
+    def _load_token_memory(
+        self, inputs: Dict[str, Any], user_input: str
+    ) -> ConversationMemory:
+        """
+        Load token-aware memory from inputs and add this turn's user message.
+
+        The system prompt is pinned when the memory has none yet.
+        """
+        memory = ConversationMemory.from_state(
+            inputs.get(self.memory_key),
+            store=self._memory_segment_store(),
+            max_tokens=int(self.memory_max_tokens or DEFAULT_MEMORY_MAX_TOKENS),
+            model=self.model,
+            keep_recent=int(
+                self.context.get("memory_keep_recent", DEFAULT_KEEP_RECENT)
+            ),
+        )
+        if not memory.system and self.resolved_prompt:
+            memory.add("system", self.resolved_prompt)
+        if user_input:
+            memory.add("user", user_input)
+        return memory
+
+    def _memory_segment_store(self) -> MemorySegmentStore:
+        """
+        Segment store from ``llm.memory`` via the LLM service (directory under
+        the configured cache path, retention limits); ``memory_segment_dir``
+        in the context overrides the directory.
+        """
+        get_config = getattr(self._llm_service, "get_memory_segment_config", None)
+        config = get_config() if callable(get_config) else None
+        if not isinstance(config, dict):
+            config = {}
+        return get_segment_store(
+            self.context.get("memory_segment_dir") or config.get("segment_dir"),
+            ttl_seconds=config.get("segment_ttl_seconds"),
+            max_files=config.get("max_segment_files"),
+        )
+
+    def _summary_call_params(self, request: Any) -> Dict[str, Any]:
+        """
+        LLM call parameters for rolling older turns into the memory summary.
+
+        Uses ``memory_summary_provider``/``memory_summary_model`` when set,
+        otherwise routes as a low-complexity summarization task so a cheap
+        model is selected.
+        """
+        provider = self.context.get("memory_summary_provider")
+        if provider:
+            return {
+                "provider": provider,
+                "messages": request,
+                "model": self.context.get("memory_summary_model"),
+                "temperature": 0.0,
+            }
+        return {
+            "provider": "auto",
+            "messages": request,
+            "routing_context": {
+                "routing_enabled": True,
+                "task_type": "summarization",
+                "complexity_override": "low",
+                "auto_detect_complexity": False,
+            },
+        }
+
+    def _record_assistant_message(
+        self,
+        inputs: Dict[str, Any],
+        result: str,
+        memory: Optional[ConversationMemory],
+    ) -> Any:
+        """Add the assistant reply to memory and return the value for state."""
+        if memory is not None:
+            memory.add("assistant", result)
+            return memory.to_state()
+
+        add_assistant_message(inputs, result, self.memory_key)
+
+        # Apply message limit if configured
+        if self.max_memory_messages:
+            truncate_memory(inputs, self.max_memory_messages, self.memory_key)
+        return inputs.get(self.memory_key, [])
+
     async def process_async(self, inputs: Dict[str, Any]) -> Any:
         """
         Async processing path for LLMAgent (REQ-F-003).
@@ -443,21 +559,37 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
         llm_service = self.llm_service
 
         try:
-            self._initialize_memory_if_needed(inputs)
-
             user_input = self._build_user_input(inputs)
 
             if not user_input:
                 self.log_warning("No input found in inputs")
             else:
-                self.log_info(f"Processing LLM request with input: {user_input}")
+                self.log_info(
+                    "Processing LLM request with input: %s", log_payload(user_input)
+                )
 
-            messages = get_memory(inputs, self.memory_key)
+            if self.memory_strategy == "token":
+                memory = self._load_token_memory(inputs, user_input)
+                if memory.needs_summary():
+                    try:
+                        summary_response = await llm_service.call_llm_async(
+                            **self._summary_call_params(memory.summary_request())
+                        )
+                        summary = summary_response.text
+                    except Exception as e:
+                        self.log_warning(f"Memory summarization failed: {e}")
+                        summary = None
+                    memory.apply_summary(summary)
+                messages = memory.build_messages()
+            else:
+                self._initialize_memory_if_needed(inputs)
 
-            if user_input:
-                add_user_message(inputs, user_input, self.memory_key)
                 messages = get_memory(inputs, self.memory_key)
 
+                if user_input:
+                    add_user_message(inputs, user_input, self.memory_key)
+                    messages = get_memory(inputs, self.memory_key)
+
             routing_context = self._prepare_routing_context(inputs)
 
             if routing_context:
@@ -485,14 +617,13 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
             # Extract the text from the LLMResponse
             result = response.text
 
-            add_assistant_message(inputs, result, self.memory_key)
-
-            if self.max_memory_messages:
-                truncate_memory(inputs, self.max_memory_messages, self.memory_key)
+            memory_value = self._record_assistant_message(
+                inputs, result, memory if self.memory_strategy == "token" else None
+            )
 
             self.log_info("LLM processing completed successfully")
 
-            return {"output": result, self.memory_key: inputs.get(self.memory_key, [])}
+            return {"output": result, self.memory_key: memory_value}
 
         except Exception as e:
             provider_name = (
@@ -557,6 +688,8 @@ class LLMAgent(BaseAgent, LLMCapableAgent, PromptCapableAgent):
                 "temperature": self.temperature,
                 "memory_key": self.memory_key,
                 "max_memory_messages": self.max_memory_messages,
+                "memory_strategy": self.memory_strategy,
+                "memory_max_tokens": self.memory_max_tokens,
                 "prompt_resolved": (
                     self.resolved_prompt != self.prompt
                     if hasattr(self, "resolved_prompt")
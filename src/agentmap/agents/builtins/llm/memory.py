@@ -3,11 +3,24 @@ Memory management for AgentMap LLM agents.
 
 This module provides utilities for managing conversation history in graph state,
 following LangGraph's state-based memory approach.
+
+The list helpers (get_memory, add_message, truncate_memory, ...) keep the full
+message list in state. ConversationMemory is the token-aware alternative used
+by LLMAgent's ``memory_strategy: token``: it budgets by tokens, rolls older
+turns into a running summary and keeps only a segment reference in state.
 """
 
+import json
+import math
+import os
+import re
+import threading
 import time
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -31,7 +44,9 @@ class Message:
 
 
 def get_memory(
-    state: Dict[str, Any], memory_key: str = "memory"
+    state: Dict[str, Any],
+    memory_key: str = "memory",
+    store: Optional["MemorySegmentStore"] = None,
 ) -> List[Dict[str, str]]:
     """
     Get the message history from state, initializing if needed.
@@ -39,6 +54,7 @@ def get_memory(
     Args:
         state: The graph state
         memory_key: Key to use for storing memory in state
+        store: Segment store for token-aware references (default store if None)
 
     Returns:
         List of message dictionaries in format ready for LLM API
@@ -49,10 +65,19 @@ def get_memory(
 
     # Get memory and ensure it's a list
     memory = state[memory_key]
+    if is_memory_reference(memory):
+        return ConversationMemory.from_state(memory, store=store).history()
     if not isinstance(memory, list):
         memory = []
         state[memory_key] = memory
 
+    # Already-normalized history is returned as-is (no copy); callers that
+    # add messages go through add_message(), which never mutates it in place.
+    if all(
+        isinstance(msg, dict) and "role" in msg and "content" in msg for msg in memory
+    ):
+        return memory
+
     # Convert all entries to proper message dictionaries
     messages = []
     for msg in memory:
@@ -85,11 +110,8 @@ def add_message(
     # Get current messages
     messages = get_memory(state, memory_key)
 
-    # Add new message
-    messages.append({"role": role, "content": content})
-
-    # Update state
-    state[memory_key] = messages
+    # Add new message on a new list so earlier state snapshots stay unchanged
+    state[memory_key] = messages + [{"role": role, "content": content}]
 
     return state
 
@@ -154,3 +176,438 @@ def truncate_memory(
 
     state[memory_key] = truncated
     return state
+
+
+# ---------------------------------------------------------------------------
+# Token-aware memory (memory_strategy: "token")
+# ---------------------------------------------------------------------------
+#
+# Instead of the full message list, graph state holds a small reference:
+#
+#   {"__memory_segment__": <segment id>, "length": n, "summarized": k,
+#    "summary": "...", "system": [...]}
+#
+# Conversation turns live in an append-only JSONL segment on disk, so each
+# checkpoint stores the reference rather than re-serializing the history.
+# Turns [0, k) have been rolled into ``summary``; turns [k, n) are sent
+# verbatim, trimmed to the token budget.
+
+#
+# Segments are pruned by retention (``llm.memory`` in the app config): files
+# not written for ``segment_ttl_seconds`` are deleted, then the least recently
+# written beyond ``max_segment_files``. A reference to a pruned segment keeps
+# its summary and system messages; the new turns start a fresh segment.
+#
+# References come from graph state, which workflow inputs can set: segment ids
+# must be uuid4 hex, and the store directory is always the configured one.
+
+MEMORY_REFERENCE_KEY = "__memory_segment__"
+# Fallback when no configuration is available; LLMAgent uses
+# ``llm.memory.segment_dir``, which defaults to ``<paths.cache>/memory_segments``.
+DEFAULT_SEGMENT_DIR = os.path.join("agentmap_data", "cache", "memory_segments")
+DEFAULT_SEGMENT_TTL_SECONDS = 7 * 86400
+DEFAULT_MAX_SEGMENT_FILES = 10000
+DEFAULT_MEMORY_MAX_TOKENS = 4000
+DEFAULT_KEEP_RECENT = 4
+
+# Per-message framing overhead (role markers, separators) in chat APIs.
+_MESSAGE_OVERHEAD_TOKENS = 4
+# Minimum time between retention scans of a segment directory.
+_PRUNE_INTERVAL_SECONDS = 60.0
+_SEGMENT_ID_RE = re.compile(r"[a-f0-9]{32}")
+_encodings: Dict[str, Any] = {}
+
+SUMMARY_SYSTEM_PROMPT = (
+    "You maintain a running summary of a conversation. Merge the existing "
+    "summary with the new turns into one concise summary that keeps facts, "
+    "decisions, names and open questions. Reply with the summary only."
+)
+
+
+def _get_encoding(model: Optional[str]) -> Any:
+    """tiktoken encoding for ``model`` (None when tiktoken is unavailable)."""
+    key = model or ""
+    if key not in _encodings:
+        try:
+            import tiktoken
+
+            try:
+                _encodings[key] = tiktoken.encoding_for_model(model or "gpt-4o")
+            except KeyError:
+                _encodings[key] = tiktoken.get_encoding("cl100k_base")
+        except ImportError:
+            _encodings[key] = None
+    return _encodings[key]
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count tokens in ``text`` for ``model``.
+
+    Uses the local tiktoken tokenizer when installed (it ships with the ``llm``
+    extra); otherwise falls back to a ~4 characters per token estimate, which
+    is close for English text across OpenAI, Anthropic and Google models.
+    """
+    if not text:
+        return 0
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(
+    messages: List[Dict[str, Any]], model: Optional[str] = None
+) -> int:
+    """Count tokens for a list of chat messages, including framing overhead."""
+    return sum(
+        count_tokens(str(msg.get("content", "")), model) + _MESSAGE_OVERHEAD_TOKENS
+        for msg in messages
+    )
+
+
+def is_memory_reference(value: Any) -> bool:
+    """True if ``value`` is a token-aware memory reference."""
+    return isinstance(value, dict) and MEMORY_REFERENCE_KEY in value
+
+
+def memory_size(value: Any) -> int:
+    """Number of messages held by a memory list or reference."""
+    if is_memory_reference(value):
+        return len(value.get("system", [])) + int(value.get("length", 0))
+    return len(value) if isinstance(value, list) else 0
+
+
+class MemorySegmentStore:
+    """
+    Append-only JSONL segments holding conversation turns.
+
+    Segments are immutable up to any recorded length: appending to a segment
+    whose file has grown past the caller's length (e.g. after resuming from an
+    older checkpoint) forks a new segment with the caller's prefix, so every
+    reference keeps resolving to the history it was created with. Recently
+    used segments are cached in memory.
+
+    Retention: whenever a segment is created or forked (at most once per
+    minute), segments idle for longer than ``ttl_seconds`` are deleted, then
+    the least recently written beyond ``max_files``. 0 disables either limit.
+    """
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_SEGMENT_DIR,
+        cache_size: int = 64,
+        ttl_seconds: float = DEFAULT_SEGMENT_TTL_SECONDS,
+        max_files: int = DEFAULT_MAX_SEGMENT_FILES,
+    ):
+        self.directory = Path(directory)
+        self.cache_size = cache_size
+        self.ttl_seconds = ttl_seconds
+        self.max_files = max_files
+        self._cache: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._last_prune: Optional[float] = None
+
+    def _path(self, segment_id: str) -> Path:
+        """
+        Segment file for ``segment_id``.
+
+        Raises:
+            ValueError: If the id is not a uuid4 hex string (ids arrive via
+                graph state and must never name a path outside the store)
+        """
+        if not isinstance(segment_id, str) or not _SEGMENT_ID_RE.fullmatch(segment_id):
+            raise ValueError(
+                f"Refusing to build a memory segment path from invalid id "
+                f"{segment_id!r}. Expected 32 lowercase hex characters."
+            )
+        return self.directory / f"{segment_id}.jsonl"
+
+    def _load(self, segment_id: str) -> List[Dict[str, Any]]:
+        messages = self._cache.get(segment_id)
+        if messages is None:
+            messages = []
+            try:
+                with open(self._path(segment_id), "r", encoding="utf-8") as f:
+                    messages = [json.loads(line) for line in f if line.strip()]
+            except FileNotFoundError:
+                pass
+            self._remember(segment_id, messages)
+        else:
+            self._cache.move_to_end(segment_id)
+        return messages
+
+    def _remember(self, segment_id: str, messages: List[Dict[str, Any]]) -> None:
+        self._cache[segment_id] = messages
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def read(
+        self, segment_id: str, start: int = 0, end: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Return messages ``[start, end)`` of a segment."""
+        with self._lock:
+            return list(self._load(segment_id)[start:end])
+
+    def append(
+        self,
+        segment_id: Optional[str],
+        length: int,
+        messages: List[Dict[str, Any]],
+    ) -> Tuple[str, int]:
+        """
+        Append messages after the first ``length`` entries of a segment.
+
+        Returns:
+            ``(segment_id, new_length)``; the id differs from the input when a
+            new segment was created or forked.
+        """
+        with self._lock:
+            if segment_id is None:
+                segment_id, prefix = uuid.uuid4().hex, []
+            else:
+                existing = self._load(segment_id)
+                if len(existing) == length:
+                    prefix = None
+                else:
+                    segment_id, prefix = uuid.uuid4().hex, existing[:length]
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            lines = [json.dumps(m, ensure_ascii=False) for m in (prefix or [])]
+            lines.extend(json.dumps(m, ensure_ascii=False) for m in messages)
+            with open(self._path(segment_id), "a", encoding="utf-8") as f:
+                f.write("".join(line + "\n" for line in lines))
+
+            if prefix is None:
+                cached = self._load(segment_id)
+            else:
+                cached = list(prefix)
+                self._remember(segment_id, cached)
+            cached.extend(messages)
+
+            if prefix is not None and (
+                self._last_prune is None
+                or time.monotonic() - self._last_prune >= _PRUNE_INTERVAL_SECONDS
+            ):
+                self._prune()
+            return segment_id, len(cached)
+
+    def prune(self) -> int:
+        """Apply the retention limits now; returns the number of segments deleted."""
+        with self._lock:
+            return self._prune()
+
+    def _prune(self) -> int:
+        self._last_prune = time.monotonic()
+        if not self.ttl_seconds and not self.max_files:
+            return 0
+
+        segments = []
+        for path in self.directory.glob("*.jsonl"):
+            try:
+                segments.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+        segments.sort(reverse=True)
+
+        cutoff = time.time() - self.ttl_seconds if self.ttl_seconds else None
+        removed = 0
+        for index, (mtime, path) in enumerate(segments):
+            expired = cutoff is not None and mtime < cutoff
+            if not expired and not (self.max_files and index >= self.max_files):
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            self._cache.pop(path.stem, None)
+            removed += 1
+        return removed
+
+
+_segment_stores: Dict[str, MemorySegmentStore] = {}
+_segment_stores_lock = threading.Lock()
+
+
+def get_segment_store(
+    directory: Optional[str] = None,
+    ttl_seconds: Optional[float] = None,
+    max_files: Optional[int] = None,
+) -> MemorySegmentStore:
+    """
+    Shared store per directory, so its cache survives across agent calls.
+
+    Retention limits that are given replace the store's current ones.
+    """
+    directory = str(directory or DEFAULT_SEGMENT_DIR)
+    with _segment_stores_lock:
+        store = _segment_stores.get(directory)
+        if store is None:
+            store = _segment_stores[directory] = MemorySegmentStore(directory)
+        if ttl_seconds is not None:
+            store.ttl_seconds = ttl_seconds
+        if max_files is not None:
+            store.max_files = max_files
+        return store
+
+
+class ConversationMemory:
+    """
+    Token-budgeted conversation memory backed by a segment reference.
+
+    Typical use per LLM call: ``from_state`` -> ``add`` the user turn ->
+    (``summary_request`` / ``apply_summary`` when ``needs_summary``) ->
+    ``build_messages`` -> ``add`` the assistant turn -> ``to_state``.
+    """
+
+    def __init__(
+        self,
+        store: Optional[MemorySegmentStore] = None,
+        max_tokens: int = DEFAULT_MEMORY_MAX_TOKENS,
+        model: Optional[str] = None,
+        keep_recent: int = DEFAULT_KEEP_RECENT,
+    ):
+        self.store = store or get_segment_store()
+        self.max_tokens = max_tokens
+        self.model = model
+        self.keep_recent = keep_recent
+        self.segment_id: Optional[str] = None
+        self.length = 0
+        self.summarized = 0
+        self.summary = ""
+        self.system: List[Dict[str, str]] = []
+        self._pending: List[Dict[str, str]] = []
+        self._summary_end: Optional[int] = None
+
+    @classmethod
+    def from_state(cls, value: Any, **kwargs: Any) -> "ConversationMemory":
+        """
+        Load memory from a state value: a reference, a legacy message list
+        (migrated on the next ``to_state``) or None.
+
+        Segments are read from ``store`` (the default store if None); the
+        reference never chooses the directory.
+        """
+        memory = cls(**kwargs)
+        if is_memory_reference(value):
+            memory.segment_id = value[MEMORY_REFERENCE_KEY]
+            memory.length = int(value.get("length", 0))
+            memory.summarized = int(value.get("summarized", 0))
+            memory.summary = value.get("summary", "")
+            memory.system = list(value.get("system", []))
+        elif isinstance(value, list):
+            for msg in get_memory({"memory": value}):
+                memory.add(msg["role"], msg["content"])
+        return memory
+
+    def add(self, role: str, content: str) -> None:
+        """Add a message; system messages are pinned outside the segment."""
+        message = {"role": role, "content": content}
+        if role == "system":
+            self.system.append(message)
+        else:
+            self._pending.append(message)
+
+    def _unsummarized(self) -> List[Dict[str, Any]]:
+        stored = (
+            self.store.read(self.segment_id, self.summarized, self.length)
+            if self.segment_id and self.summarized < self.length
+            else []
+        )
+        return stored + self._pending
+
+    def _fixed_messages(self) -> List[Dict[str, str]]:
+        fixed = list(self.system)
+        if self.summary:
+            fixed.append(
+                {
+                    "role": "system",
+                    "content": f"Summary of the earlier conversation:\n{self.summary}",
+                }
+            )
+        return fixed
+
+    def needs_summary(self) -> bool:
+        """True if the history exceeds the budget and older turns can be rolled up."""
+        turns = self._unsummarized()
+        if len(turns) <= self.keep_recent:
+            return False
+        total = count_message_tokens(self._fixed_messages() + turns, self.model)
+        return total > self.max_tokens
+
+    def summary_request(self) -> List[Dict[str, str]]:
+        """Messages asking an LLM to fold the older turns into the summary."""
+        turns = self._unsummarized()
+        older = turns[: max(0, len(turns) - self.keep_recent)]
+        self._summary_end = self.summarized + len(older)
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in older)
+        return [
+            {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": (
+                    f"Existing summary:\n{self.summary or '(none)'}\n\n"
+                    f"New turns:\n{transcript}"
+                ),
+            },
+        ]
+
+    def apply_summary(self, summary: Optional[str]) -> None:
+        """
+        Record the summary for the turns of the last ``summary_request``.
+        A None summary (summarization failed) drops those turns instead.
+        """
+        end = self._summary_end
+        if end is None:
+            end = self.summarized + max(0, len(self._unsummarized()) - self.keep_recent)
+        if summary is not None:
+            self.summary = summary.strip()
+        # Pending (not yet stored) turns must be persisted before the
+        # summarized index can move past them.
+        if end > self.length:
+            self._flush()
+        self.summarized = min(end, self.length)
+        self._summary_end = None
+
+    def build_messages(self) -> List[Dict[str, str]]:
+        """
+        Messages for the LLM: system prompt(s), running summary and the most
+        recent turns that fit the token budget (the latest turn always kept).
+        """
+        fixed = self._fixed_messages()
+        budget = self.max_tokens - count_message_tokens(fixed, self.model)
+        recent: List[Dict[str, str]] = []
+        for message in reversed(self._unsummarized()):
+            cost = count_message_tokens([message], self.model)
+            if recent and cost > budget:
+                break
+            recent.append({"role": message["role"], "content": message["content"]})
+            budget -= cost
+        return fixed + recent[::-1]
+
+    def history(self) -> List[Dict[str, str]]:
+        """Full message history (system messages first); reads the segment."""
+        stored = self.store.read(self.segment_id) if self.segment_id else []
+        stored = stored[: self.length]
+        return list(self.system) + stored + self._pending
+
+    def _flush(self) -> None:
+        if self._pending:
+            flushed = len(self._pending)
+            self.segment_id, self.length = self.store.append(
+                self.segment_id, self.length, self._pending
+            )
+            self._pending = []
+            # A pruned segment forks empty: only the new turns are stored.
+            self.summarized = min(self.summarized, self.length - flushed)
+
+    def to_state(self) -> Dict[str, Any]:
+        """Persist pending turns and return the reference for graph state."""
+        self._flush()
+        return {
+            MEMORY_REFERENCE_KEY: self.segment_id,
+            "length": self.length,
+            "summarized": self.summarized,
+            "summary": self.summary,
+            "system": list(self.system),
+        }
@@ -10,6 +10,7 @@ from typing import Any, Dict, Optional, Tuple
 
 from agentmap.agents.base_agent import BaseAgent
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.orchestrator_node_filtering import NodeFilter
 from agentmap.services.orchestrator_service import OrchestratorService
 from agentmap.services.protocols import (
     LLMCapableAgent,
@@ -84,6 +85,8 @@ class OrchestratorAgent(BaseAgent, LLMCapableAgent, OrchestrationCapableAgent):
 
         # Node Registry - will be injected separately (not part of standard protocols yet)
         self.node_registry = None
+        # True when assembly injected a registry already narrowed by node_filter
+        self.node_registry_prefiltered = False
 
         if self._logger:
             self.log_debug(
@@ -106,14 +109,7 @@ class OrchestratorAgent(BaseAgent, LLMCapableAgent, OrchestrationCapableAgent):
 
     def _parse_node_filter(self, context: dict) -> str:
         """Parse node filter from various context formats."""
-        if "nodes" in context:
-            return context["nodes"]
-        elif "node_type" in context:
-            return f"nodeType:{context['node_type']}"
-        elif "nodeType" in context:
-            return f"nodeType:{context['nodeType']}"
-        else:
-            return "all"
+        return NodeFilter.filter_from_context(context)
 
     # Properties for service coordination
     @property
@@ -173,11 +169,14 @@ class OrchestratorAgent(BaseAgent, LLMCapableAgent, OrchestrationCapableAgent):
         self.log_debug(f"Input text: '{input_text}'")
 
         # Get available nodes (primary: CSV runtime, fallback: injected registry)
+        node_filter = self.node_filter
         available_nodes = self._get_nodes_from_inputs(inputs)
         if not available_nodes:
             available_nodes = self.node_registry
             if available_nodes:
                 self.log_debug("Using injected node registry as no CSV nodes provided")
+                if self.node_registry_prefiltered:
+                    node_filter = "all"
         else:
             self.log_debug(f"Using CSV-provided nodes: {list(available_nodes.keys())}")
 
@@ -200,7 +199,7 @@ class OrchestratorAgent(BaseAgent, LLMCapableAgent, OrchestrationCapableAgent):
                 available_nodes=available_nodes,
                 strategy=self.matching_strategy,
                 confidence_threshold=self.confidence_threshold,
-                node_filter=self.node_filter,
+                node_filter=node_filter,
                 llm_config=llm_config,
                 context=context,
             )
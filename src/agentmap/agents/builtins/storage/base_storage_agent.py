@@ -7,7 +7,9 @@ with utilities for accessing data stores and handling operations.
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
 import logging
 from typing import Any, Callable, Dict, Optional, Tuple, TypeVar, cast
 
@@ -46,6 +48,13 @@ def log_operation(func: F) -> F:
     return cast(F, wrapper)
 
 
+def _is_truthy(value: Any) -> bool:
+    """Boolean flag from agent inputs/context, which may arrive as strings."""
+    if isinstance(value, str):
+        return value.strip().lower() in ("true", "yes", "1", "on")
+    return bool(value)
+
+
 class BaseStorageAgent(BaseAgent, StorageCapableAgent):
     """
     Base class for all storage agents in AgentMap.
@@ -254,6 +263,97 @@ class BaseStorageAgent(BaseAgent, StorageCapableAgent):
             # Handle error
             return self._handle_operation_error(e, collection, inputs)
 
+    async def process_async(self, inputs: Dict[str, Any]) -> Any:
+        """
+        Async template method: same steps as process(), but the storage
+        operation runs through _execute_operation_async() so agents whose
+        service has a native async API await it instead of holding an
+        executor thread. Subclasses that override process() itself keep
+        the BaseAgent behaviour of running it in the executor.
+
+        Args:
+            inputs: Dictionary of input values
+
+        Returns:
+            Operation result
+        """
+        if type(self).process is not BaseStorageAgent.process:
+            return await super().process_async(inputs)
+
+        class_name = self.__class__.__name__
+        self.log_debug(f"[{class_name}] Starting process_async")
+        collection = self.get_collection(inputs)
+        self._log_operation_start(collection, inputs)
+        try:
+            self._validate_inputs(inputs)
+            result = await self._execute_operation_async(collection, inputs)
+            result = self._process_result(result, inputs)
+        except Exception as e:
+            result = self._handle_operation_error(e, collection, inputs)
+        self.log_debug(f"[{class_name}] Completed process_async")
+        return result
+
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> Any:
+        """
+        Async storage operation. Defaults to running _execute_operation() in
+        the agent's executor; agents override it to await the service's
+        async API (see _call_storage_async).
+        """
+        return await self._run_in_executor(self._execute_operation, collection, inputs)
+
+    async def _call_storage_async(
+        self, service: Any, operation: str, **kwargs: Any
+    ) -> Any:
+        """
+        Await ``service.a<operation>(**kwargs)``, e.g. ``aread`` for "read".
+
+        Services without a native coroutine for the operation (custom
+        services, test doubles) have the sync method run in the executor.
+        """
+        async_method = getattr(service, f"a{operation}", None)
+        if inspect.iscoroutinefunction(async_method):
+            return await async_method(**kwargs)
+        sync_method = getattr(service, operation)
+        return await self._run_in_executor(functools.partial(sync_method, **kwargs))
+
+    def _is_batch_write(self, inputs: Dict[str, Any], data: Any) -> bool:
+        """
+        Whether a write should go through the service's ``batch_write``.
+
+        Batch mode is requested with a truthy ``batch`` input (or ``batch``
+        in the agent context) and applies when ``data`` is a list of records.
+        """
+        return isinstance(data, list) and _is_truthy(
+            inputs.get("batch", self.context.get("batch", False))
+        )
+
+    def _batch_write_kwargs(
+        self, write_kwargs: Dict[str, Any], inputs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Turn single-write arguments into ``batch_write`` arguments.
+
+        Per-item document IDs come from ``id_field``; ``atomic`` (input or
+        context, default true) controls whether one failed item rolls back
+        the whole batch.
+        """
+        batch_kwargs = {
+            k: v for k, v in write_kwargs.items() if k not in ("document_id", "path")
+        }
+        batch_kwargs["atomic"] = _is_truthy(
+            inputs.get("atomic", self.context.get("atomic", True))
+        )
+        return batch_kwargs
+
+    async def _run_in_executor(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call on the configured executor pool, if any."""
+        runner = getattr(self, "_executor_runner", None)
+        if runner is None or getattr(self, "_executor_in_process", False):
+            # Process pools can't run bound methods of services; use threads.
+            return await asyncio.to_thread(fn, *args)
+        return await runner(fn, *args)
+
     def _log_operation_start(self, collection: str, inputs: Dict[str, Any]) -> None:
         """
         Log the start of a storage operation.
@@ -8,6 +8,7 @@ Follows the modernized BaseAgent contract with constructor injection.
 
 from __future__ import annotations
 
+import inspect
 import logging
 from typing import Any, Dict, Optional
 
@@ -113,41 +114,66 @@ class BlobReaderAgent(BaseAgent, BlobStorageCapableAgent):
         """
         self.log_debug(f"Processing blob read with inputs: {list(inputs.keys())}")
 
-        # Extract blob URI from inputs using state adapter
-        blob_uri = None
-        for key in ["blob_uri", "uri", "path", "file_path", "blob_path"]:
-            if key in inputs and inputs[key]:
-                blob_uri = inputs[key]
-                break
-
-        if not blob_uri:
-            raise ValueError(
-                "Missing required blob URI. Provide one of: blob_uri, uri, path, "
-                "file_path, or blob_path"
-            )
-
+        blob_uri = self._resolve_blob_uri(inputs)
         self.log_info(f"Reading blob from: {blob_uri}")
 
         try:
             # Use dependency-injected blob storage service
             blob_data = self.blob_storage_service.read_blob(blob_uri)
+        except Exception as e:
+            self._log_read_error(blob_uri, e)
+            raise
 
-            self.log_info(
-                f"Successfully read blob: {blob_uri} ({len(blob_data)} bytes)"
-            )
+        self.log_info(f"Successfully read blob: {blob_uri} ({len(blob_data)} bytes)")
 
-            # Return raw bytes - let downstream agents handle JSON parsing if needed
-            return blob_data
+        # Return raw bytes - let downstream agents handle JSON parsing if needed
+        return blob_data
 
-        except FileNotFoundError:
-            error_msg = f"Blob not found: {blob_uri}"
-            self.log_error(error_msg)
-            raise
+    async def process_async(self, inputs: Dict[str, Any]) -> bytes:
+        """
+        Async sibling of process(): awaits the blob service's native async
+        read instead of occupying an executor thread. Services without
+        ``aread_blob`` fall back to running process() in the executor.
+        """
+        if not inspect.iscoroutinefunction(
+            getattr(self.blob_storage_service, "aread_blob", None)
+        ):
+            return await super().process_async(inputs)
+        self.log_debug(f"Processing blob read with inputs: {list(inputs.keys())}")
+        blob_uri = self._resolve_blob_uri(inputs)
+        self.log_info(f"Reading blob from: {blob_uri}")
+
+        try:
+            blob_data = await self.blob_storage_service.aread_blob(blob_uri)
         except Exception as e:
-            error_msg = f"Failed to read blob {blob_uri}: {str(e)}"
-            self.log_error(error_msg)
+            self._log_read_error(blob_uri, e)
             raise
 
+        self.log_info(f"Successfully read blob: {blob_uri} ({len(blob_data)} bytes)")
+        return blob_data
+
+    @staticmethod
+    def _resolve_blob_uri(inputs: Dict[str, Any]) -> str:
+        """
+        Extract the blob URI from the first populated URI-like input.
+
+        Raises:
+            ValueError: If no URI input is present
+        """
+        for key in ["blob_uri", "uri", "path", "file_path", "blob_path"]:
+            if key in inputs and inputs[key]:
+                return inputs[key]
+        raise ValueError(
+            "Missing required blob URI. Provide one of: blob_uri, uri, path, "
+            "file_path, or blob_path"
+        )
+
+    def _log_read_error(self, blob_uri: str, error: Exception) -> None:
+        if isinstance(error, FileNotFoundError):
+            self.log_error(f"Blob not found: {blob_uri}")
+        else:
+            self.log_error(f"Failed to read blob {blob_uri}: {str(error)}")
+
     def _get_child_service_info(self) -> Optional[Dict[str, Any]]:
         """
         Provide blob storage-specific service information for debugging.
@@ -8,9 +8,10 @@ Follows the modernized BaseAgent contract with constructor injection.
 
 from __future__ import annotations
 
+import inspect
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from agentmap.agents.base_agent import BaseAgent
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
@@ -34,6 +35,8 @@ class BlobWriterAgent(BaseAgent, BlobStorageCapableAgent):
     Focuses purely on blob operations while providing convenient data conversion.
     """
 
+    has_side_effects = True
+
     def __init__(
         self,
         name: str,
@@ -113,7 +116,60 @@ class BlobWriterAgent(BaseAgent, BlobStorageCapableAgent):
         """
         self.log_debug(f"Processing blob write with inputs: {list(inputs.keys())}")
 
-        # Extract blob URI from inputs
+        blob_uri, data = self._resolve_write_inputs(inputs)
+        self.log_info(f"Writing blob to: {blob_uri}")
+
+        try:
+            # Convert data to bytes if needed (convenient data conversion)
+            bytes_data = self._convert_to_bytes(data)
+
+            # Use dependency-injected blob storage service
+            result = self.blob_storage_service.write_blob(blob_uri, bytes_data)
+
+            self.log_info(
+                f"Successfully wrote blob: {blob_uri} ({len(bytes_data)} bytes)"
+            )
+
+            # Return write result with operation details
+            return result
+
+        except Exception as e:
+            error_msg = f"Failed to write blob {blob_uri}: {str(e)}"
+            self.log_error(error_msg)
+            raise
+
+    async def process_async(self, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async sibling of process(): awaits the blob service's native async
+        write instead of occupying an executor thread. Services without
+        ``awrite_blob`` fall back to running process() in the executor.
+        """
+        if not inspect.iscoroutinefunction(
+            getattr(self.blob_storage_service, "awrite_blob", None)
+        ):
+            return await super().process_async(inputs)
+        self.log_debug(f"Processing blob write with inputs: {list(inputs.keys())}")
+        blob_uri, data = self._resolve_write_inputs(inputs)
+        self.log_info(f"Writing blob to: {blob_uri}")
+
+        try:
+            bytes_data = self._convert_to_bytes(data)
+            result = await self.blob_storage_service.awrite_blob(blob_uri, bytes_data)
+        except Exception as e:
+            self.log_error(f"Failed to write blob {blob_uri}: {str(e)}")
+            raise
+
+        self.log_info(f"Successfully wrote blob: {blob_uri} ({len(bytes_data)} bytes)")
+        return result
+
+    @staticmethod
+    def _resolve_write_inputs(inputs: Dict[str, Any]) -> Tuple[str, Any]:
+        """
+        Extract the blob URI and the data to write from the inputs.
+
+        Raises:
+            ValueError: If the URI or the data is missing
+        """
         blob_uri = None
         for key in ["blob_uri", "uri", "path", "file_path", "blob_path"]:
             if key in inputs and inputs[key]:
@@ -126,7 +182,6 @@ class BlobWriterAgent(BaseAgent, BlobStorageCapableAgent):
                 "file_path, or blob_path"
             )
 
-        # Extract data from inputs
         data = None
         for key in ["data", "content", "payload", "body"]:
             if key in inputs and inputs[key] is not None:
@@ -137,27 +192,7 @@ class BlobWriterAgent(BaseAgent, BlobStorageCapableAgent):
             raise ValueError(
                 "Missing required data. Provide one of: data, content, payload, or body"
             )
-
-        self.log_info(f"Writing blob to: {blob_uri}")
-
-        try:
-            # Convert data to bytes if needed (convenient data conversion)
-            bytes_data = self._convert_to_bytes(data)
-
-            # Use dependency-injected blob storage service
-            result = self.blob_storage_service.write_blob(blob_uri, bytes_data)
-
-            self.log_info(
-                f"Successfully wrote blob: {blob_uri} ({len(bytes_data)} bytes)"
-            )
-
-            # Return write result with operation details
-            return result
-
-        except Exception as e:
-            error_msg = f"Failed to write blob {blob_uri}: {str(e)}"
-            self.log_error(error_msg)
-            raise
+        return blob_uri, data
 
     @staticmethod
     def _convert_to_bytes(data: Any) -> bytes:
@@ -27,27 +27,27 @@ class CSVReaderAgent(CSVAgent):
             CSV data in requested format
         """
         self.log_info(f"Reading from {collection}")
+        return self.csv_service.read(**self._read_kwargs(collection, inputs))
 
-        # Extract parameters for the service
-        document_id = inputs.get("document_id") or inputs.get("id")
-        query = inputs.get("query")
-        path = inputs.get("path")
-
-        # Extract format and other CSV-specific parameters
-        output_format = inputs.get("format", "records")
-        id_field = inputs.get("id_field", "id")
-
-        # Call the CSV storage service
-        result = self.csv_service.read(
-            collection=collection,
-            document_id=document_id,
-            query=query,
-            path=path,
-            format=output_format,
-            id_field=id_field,
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> Any:
+        """Async read via CSVStorageService.aread()."""
+        self.log_info(f"Reading from {collection}")
+        return await self._call_storage_async(
+            self.csv_service, "read", **self._read_kwargs(collection, inputs)
         )
 
-        return result
+    def _read_kwargs(self, collection: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build CSVStorageService.read() arguments from the inputs."""
+        return {
+            "collection": collection,
+            "document_id": inputs.get("document_id") or inputs.get("id"),
+            "query": inputs.get("query"),
+            "path": inputs.get("path"),
+            "format": inputs.get("format", "records"),
+            "id_field": inputs.get("id_field", "id"),
+        }
 
     def _log_operation_start(self, collection: str, inputs: Dict[str, Any]) -> None:
         """
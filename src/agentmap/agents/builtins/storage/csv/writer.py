@@ -20,6 +20,8 @@ class CSVWriterAgent(CSVAgent):
     Delegates all CSV operations to the service layer for clean separation of concerns.
     """
 
+    has_side_effects = True
+
     def _execute_operation(
         self, collection: str, inputs: Dict[str, Any]
     ) -> DocumentResult:
@@ -34,7 +36,38 @@ class CSVWriterAgent(CSVAgent):
             Write operation result
         """
         self.log_info(f"Writing to {collection}")
+        write_kwargs = self._write_kwargs(collection, inputs)
+        if isinstance(write_kwargs, DocumentResult):
+            return write_kwargs
+        if self._is_batch_write(inputs, write_kwargs["data"]):
+            return self.csv_service.batch_write(
+                **self._batch_write_kwargs(write_kwargs, inputs)
+            )
+        return self.csv_service.write(**write_kwargs)
+
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> DocumentResult:
+        """Async write via CSVStorageService.awrite() (or batch_write)."""
+        self.log_info(f"Writing to {collection}")
+        write_kwargs = self._write_kwargs(collection, inputs)
+        if isinstance(write_kwargs, DocumentResult):
+            return write_kwargs
+        if self._is_batch_write(inputs, write_kwargs["data"]):
+            return await self._call_storage_async(
+                self.csv_service,
+                "batch_write",
+                **self._batch_write_kwargs(write_kwargs, inputs),
+            )
+        return await self._call_storage_async(self.csv_service, "write", **write_kwargs)
+
+    def _write_kwargs(self, collection: str, inputs: Dict[str, Any]) -> Any:
+        """
+        Build CSVStorageService.write() arguments from the inputs.
 
+        Returns:
+            Keyword arguments, or an error DocumentResult when there is no data
+        """
         # Get the data to write - use 'data' field if present, otherwise use input fields directly
         if "data" in inputs:
             # Backward compatibility: use 'data' field if it exists
@@ -49,6 +82,8 @@ class CSVWriterAgent(CSVAgent):
                 "collection",
                 "file_path",
                 "csv_file",
+                "batch",
+                "atomic",
             }
             data = {k: v for k, v in inputs.items() if k not in control_fields}
 
@@ -73,18 +108,13 @@ class CSVWriterAgent(CSVAgent):
         )  # Don't force a default, let service auto-detect
 
         # Build kwargs for the CSV storage service
-        write_kwargs = {}
+        write_kwargs = {
+            "collection": collection,
+            "data": data,
+            "document_id": document_id,
+            "mode": mode,
+            "path": path,
+        }
         if id_field is not None:
             write_kwargs["id_field"] = id_field
-
-        # Call the CSV storage service
-        result = self.csv_service.write(
-            collection=collection,
-            data=data,
-            document_id=document_id,
-            mode=mode,
-            path=path,
-            **write_kwargs,
-        )
-
-        return result
+        return write_kwargs
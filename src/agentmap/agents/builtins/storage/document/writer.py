@@ -23,6 +23,8 @@ class DocumentWriterAgent(DocumentStorageAgent):
     Concrete implementations are provided for JSON, Firebase, etc.
     """
 
+    has_side_effects = True
+
     def _validate_inputs(self, inputs: Dict[str, Any]) -> None:
         """
         Validate inputs for write operations.
@@ -141,19 +141,25 @@ class FileReaderAgent(BaseStorageAgent, FileCapableAgent):
         """
         Execute read operation for file using FileStorageService.
         """
-        document_id = inputs.get("document_id")
-        query = inputs.get("query")
-        path = inputs.get("path")
-        output_format = inputs.get("format", "default")
-        # Call the FileStorageService read method
-        result = self.file_service.read(
-            collection=collection,
-            document_id=document_id,
-            query=query,
-            path=path,
-            format=output_format,
+        return self.file_service.read(**self._read_kwargs(collection, inputs))
+
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> Any:
+        """Async read via FileStorageService.aread()."""
+        return await self._call_storage_async(
+            self.file_service, "read", **self._read_kwargs(collection, inputs)
         )
-        return result
+
+    def _read_kwargs(self, collection: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build FileStorageService.read() arguments from the inputs."""
+        return {
+            "collection": collection,
+            "document_id": inputs.get("document_id"),
+            "query": inputs.get("query"),
+            "path": inputs.get("path"),
+            "format": inputs.get("format", "default"),
+        }
 
     def _handle_operation_error(
         self, error: Exception, collection: str, inputs: Dict[str, Any]
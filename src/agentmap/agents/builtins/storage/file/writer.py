@@ -25,6 +25,8 @@ class FileWriterAgent(BaseStorageAgent, FileCapableAgent):
     with support for different write modes including append and update.
     """
 
+    has_side_effects = True
+
     def __init__(
         self,
         name: str,
@@ -166,23 +168,41 @@ class FileWriterAgent(BaseStorageAgent, FileCapableAgent):
         """
         Execute write operation for file using FileStorageService.
         """
-        data = inputs.get("data")
+        write_kwargs = self._write_kwargs(collection, inputs)
+        if isinstance(write_kwargs, DocumentResult):
+            return write_kwargs
+        return self.file_service.write(**write_kwargs)
+
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> DocumentResult:
+        """Async write via FileStorageService.awrite()."""
+        write_kwargs = self._write_kwargs(collection, inputs)
+        if isinstance(write_kwargs, DocumentResult):
+            return write_kwargs
+        return await self._call_storage_async(
+            self.file_service, "write", **write_kwargs
+        )
+
+    def _write_kwargs(self, collection: str, inputs: Dict[str, Any]) -> Any:
+        """
+        Build FileStorageService.write() arguments from the inputs.
+
+        Returns:
+            Keyword arguments, or an error DocumentResult for an invalid mode
+        """
         mode_str = inputs.get("mode", "append").lower()
         try:
             mode = WriteMode.from_string(mode_str)
         except ValueError as e:
             return DocumentResult(success=False, file_path=collection, error=str(e))
-        document_id = inputs.get("document_id")
-        path = inputs.get("path")
-        # Call the FileStorageService write method
-        result = self.file_service.write(
-            collection=collection,
-            data=data,
-            document_id=document_id,
-            mode=mode,
-            path=path,
-        )
-        return result
+        return {
+            "collection": collection,
+            "data": inputs.get("data"),
+            "document_id": inputs.get("document_id"),
+            "mode": mode,
+            "path": inputs.get("path"),
+        }
 
     def _handle_operation_error(
         self, error: Exception, collection: str, inputs: Dict[str, Any]
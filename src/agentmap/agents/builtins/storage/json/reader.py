@@ -31,26 +31,34 @@ class JSONDocumentReaderAgent(JSONDocumentAgent):
             JSON data based on query and path
         """
         self.log_info(f"Reading from {collection}")
+        result = self.json_service.read(**self._read_kwargs(collection, inputs))
+        return self._wrap_result(result, collection, inputs)
 
-        # Extract parameters for the service
-        document_id = inputs.get("document_id") or inputs.get("id")
-        query = inputs.get("query")
-        path = inputs.get("path")
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> Any:
+        """Async read via JSONStorageService.aread()."""
+        self.log_info(f"Reading from {collection}")
+        result = await self._call_storage_async(
+            self.json_service, "read", **self._read_kwargs(collection, inputs)
+        )
+        return self._wrap_result(result, collection, inputs)
 
-        # Extract JSON-specific parameters
-        output_format = inputs.get("format", "raw")
-        id_field = inputs.get("id_field", "id")
-        use_envelope = inputs.get("use_envelope", False)
+    def _read_kwargs(self, collection: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build JSONStorageService.read() arguments from the inputs."""
+        return {
+            "collection": collection,
+            "document_id": inputs.get("document_id") or inputs.get("id"),
+            "query": inputs.get("query"),
+            "path": inputs.get("path"),
+            "format": inputs.get("format", "raw"),
+            "id_field": inputs.get("id_field", "id"),
+        }
 
-        # Call the JSON storage service
-        result = self.json_service.read(
-            collection=collection,
-            document_id=document_id,
-            query=query,
-            path=path,
-            format=output_format,
-            id_field=id_field,
-        )
+    def _wrap_result(self, result: Any, collection: str, inputs: Dict[str, Any]) -> Any:
+        """Apply the optional ``use_envelope`` wrapper to a read result."""
+        document_id = inputs.get("document_id") or inputs.get("id")
+        use_envelope = inputs.get("use_envelope", False)
 
         # Handle envelope format if requested (for backward compatibility)
         if use_envelope and result is not None:
@@ -20,6 +20,8 @@ class JSONDocumentWriterAgent(JSONDocumentAgent):
     Delegates all JSON operations to the service layer for clean separation of concerns.
     """
 
+    has_side_effects = True
+
     def _execute_operation(
         self, collection: str, inputs: Dict[str, Any]
     ) -> DocumentResult:
@@ -34,7 +36,40 @@ class JSONDocumentWriterAgent(JSONDocumentAgent):
             Result of the write operation
         """
         self.log_info(f"Writing to {collection}")
+        write_kwargs = self._write_kwargs(collection, inputs)
+        if isinstance(write_kwargs, DocumentResult):
+            return write_kwargs
+        if self._is_batch_write(inputs, write_kwargs["data"]):
+            return self.json_service.batch_write(
+                **self._batch_write_kwargs(write_kwargs, inputs)
+            )
+        return self.json_service.write(**write_kwargs)
+
+    async def _execute_operation_async(
+        self, collection: str, inputs: Dict[str, Any]
+    ) -> DocumentResult:
+        """Async write via JSONStorageService.awrite() (or batch_write)."""
+        self.log_info(f"Writing to {collection}")
+        write_kwargs = self._write_kwargs(collection, inputs)
+        if isinstance(write_kwargs, DocumentResult):
+            return write_kwargs
+        if self._is_batch_write(inputs, write_kwargs["data"]):
+            return await self._call_storage_async(
+                self.json_service,
+                "batch_write",
+                **self._batch_write_kwargs(write_kwargs, inputs),
+            )
+        return await self._call_storage_async(
+            self.json_service, "write", **write_kwargs
+        )
+
+    def _write_kwargs(self, collection: str, inputs: Dict[str, Any]) -> Any:
+        """
+        Build JSONStorageService.write() arguments from the inputs.
 
+        Returns:
+            Keyword arguments, or an error DocumentResult for bad inputs
+        """
         # Get the data to write
         data = inputs.get("data")
         if data is None:
@@ -54,14 +89,11 @@ class JSONDocumentWriterAgent(JSONDocumentAgent):
         path = inputs.get("path")
         id_field = inputs.get("id_field", "id")
 
-        # Call the JSON storage service
-        result = self.json_service.write(
-            collection=collection,
-            data=data,
-            document_id=document_id,
-            mode=mode,
-            path=path,
-            id_field=id_field,
-        )
-
-        return result
+        return {
+            "collection": collection,
+            "data": data,
+            "document_id": document_id,
+            "mode": mode,
+            "path": path,
+            "id_field": id_field,
+        }
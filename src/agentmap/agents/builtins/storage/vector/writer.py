@@ -23,6 +23,8 @@ class VectorWriterAgent(VectorAgent):
     Delegates all vector operations to the service layer for clean separation of concerns.
     """
 
+    has_side_effects = True
+
     def __init__(
         self,
         name: str,
@@ -75,6 +75,8 @@ class SuspendAgent(BaseAgent, MessagingCapableAgent):
                 return {"approved": decision == "approve"}
     """
 
+    has_side_effects = True
+
     def __init__(
         self,
         execution_tracking_service: ExecutionTrackingService,
@@ -22,6 +22,8 @@ class ToolAgent(BaseAgent, LLMCapableAgent, ToolSelectionCapableAgent):
     Follows OrchestratorAgent pattern: data container with service delegation.
     """
 
+    has_side_effects = True
+
     def __init__(
         self,
         name: str,
@@ -0,0 +1,161 @@
+"""
+CLI batches commands - manage watched LLM batches.
+
+``agentmap batches watch`` hands a submitted batch to the persisted watch
+list; the batch watcher (inside ``agentmap serve``, or standalone via
+``agentmap batches run``) polls every watched batch together and resumes the
+workflow recorded with ``--resume-thread`` once the batch completes.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Optional
+
+import typer
+
+from agentmap.deployment.cli.utils.cli_presenter import (
+    map_exception_to_exit_code,
+    print_err,
+)
+from agentmap.runtime_api import (
+    list_watched_batches_async,
+    poll_watched_batches_async,
+    start_batch_watcher,
+    stop_batch_watcher,
+    unwatch_batch_async,
+    watch_batch_async,
+)
+
+batches_cmd = typer.Typer(name="batches", help="Watch in-flight LLM batches")
+
+_CONFIG_OPTION = typer.Option(None, "--config", "-c", help="Path to custom config file")
+
+
+def _fail(action: str, e: Exception) -> None:
+    print_err(f"Failed to {action}: {str(e)}")
+    raise typer.Exit(code=map_exception_to_exit_code(e))
+
+
+@batches_cmd.command("watch")
+def watch_command(
+    batch_id: str = typer.Argument(..., help="agentmap_batch_id to watch"),
+    resume_thread: Optional[str] = typer.Option(
+        None,
+        "--resume-thread",
+        help="Suspended workflow thread to resume when the batch completes",
+    ),
+    config_file: Optional[str] = _CONFIG_OPTION,
+):
+    """
+    Add a submitted batch to the watch list.
+
+    Examples:
+        agentmap batches watch amatch_0a1b...
+        agentmap batches watch amatch_0a1b... --resume-thread thread-123
+    """
+    try:
+        result = asyncio.run(
+            watch_batch_async(
+                batch_id, resume_thread_id=resume_thread, config_file=config_file
+            )
+        )
+    except Exception as e:
+        _fail("watch batch", e)
+    entry = result["outputs"]
+    typer.echo(f"Watching {entry['agentmap_batch_id']} ({entry['status']})")
+
+
+@batches_cmd.command("unwatch")
+def unwatch_command(
+    batch_id: str = typer.Argument(..., help="agentmap_batch_id to stop watching"),
+    config_file: Optional[str] = _CONFIG_OPTION,
+):
+    """Remove a batch from the watch list (the batch keeps running)."""
+    try:
+        asyncio.run(unwatch_batch_async(batch_id, config_file=config_file))
+    except Exception as e:
+        _fail("unwatch batch", e)
+    typer.echo(f"Stopped watching {batch_id}")
+
+
+@batches_cmd.command("list")
+def list_command(
+    json_output: bool = typer.Option(False, "--json", help="Print raw JSON"),
+    config_file: Optional[str] = _CONFIG_OPTION,
+):
+    """List watched batches, soonest next poll first."""
+    try:
+        result = asyncio.run(list_watched_batches_async(config_file=config_file))
+    except Exception as e:
+        _fail("list watched batches", e)
+    watches = result["outputs"]["watches"]
+    if json_output:
+        typer.echo(json.dumps(watches, indent=2))
+        return
+    if not watches:
+        typer.echo("No batches are being watched")
+        return
+    for entry in watches:
+        next_poll = datetime.fromtimestamp(entry["next_poll_at"]).strftime("%H:%M:%S")
+        resume = (
+            f"  resume={entry['resume_thread_id']}"
+            if entry.get("resume_thread_id")
+            else ""
+        )
+        typer.echo(
+            f"{entry['agentmap_batch_id']}  {entry['provider']:<9} "
+            f"{entry['status']:<11} next poll {next_poll}  polls={entry['polls']}"
+            f"{resume}"
+        )
+
+
+@batches_cmd.command("poll")
+def poll_command(
+    force: bool = typer.Option(
+        False, "--force", help="Poll every watched batch, not only due ones"
+    ),
+    config_file: Optional[str] = _CONFIG_OPTION,
+):
+    """Run one watcher pass now and resume workflows for completed batches."""
+    try:
+        result = asyncio.run(
+            poll_watched_batches_async(force=force, config_file=config_file)
+        )
+    except Exception as e:
+        _fail("poll watched batches", e)
+    outputs = result["outputs"]
+    for summary in outputs["completed"]:
+        resumed = ""
+        if summary.get("resume_thread_id"):
+            resumed = " (resumed)" if summary.get("resumed") else " (resume failed)"
+        typer.echo(f"{summary['agentmap_batch_id']} -> {summary['status']}{resumed}")
+    typer.echo(
+        f"{len(outputs['completed'])} completed, {outputs['watching']} still watched"
+    )
+
+
+async def _run_watcher(config_file: Optional[str]) -> None:
+    await start_batch_watcher(config_file=config_file)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stop_batch_watcher()
+
+
+@batches_cmd.command("run")
+def run_watcher_command(config_file: Optional[str] = _CONFIG_OPTION):
+    """
+    Run the batch watcher in the foreground.
+
+    The HTTP server only runs the watcher itself when
+    ``llm.batch_watch.start_with_server`` is true.
+    """
+    try:
+        typer.echo("Starting AgentMap batch watcher... Press Ctrl+C to stop")
+        asyncio.run(_run_watcher(config_file))
+    except KeyboardInterrupt:
+        typer.echo("\nBatch watcher stopped by user")
+        raise typer.Exit(code=0)
+    except Exception as e:
+        _fail("run batch watcher", e)
@@ -20,7 +20,20 @@ from agentmap.deployment.cli.utils.cli_presenter import (
 def diagnose_cmd(
     config_file: Optional[str] = typer.Option(
         None, "--config", "-c", help="Path to custom config file"
-    )
+    ),
+    startup: bool = typer.Option(
+        False,
+        "--startup",
+        help="Profile cold-start import time and DI provider construction time",
+    ),
+    top: int = typer.Option(
+        15, "--top", help="Number of entries per ranked list in --startup mode"
+    ),
+    baseline_out: Optional[str] = typer.Option(
+        None,
+        "--baseline-out",
+        help="With --startup: write the measured timings as a baseline JSON file",
+    ),
 ):
     """
     Check and display dependency status for all components.
@@ -28,6 +41,10 @@ def diagnose_cmd(
     This command follows the facade pattern defined in SPEC-DEP-001 for
     consistent behavior across all deployment adapters.
     """
+    if startup:
+        _diagnose_startup(config_file, top, baseline_out)
+        return
+
     # Lazy import to avoid DI container initialization at module load
     from agentmap.runtime_api import diagnose_system, ensure_initialized
 
@@ -169,3 +186,58 @@ def diagnose_cmd(
         print_err(str(e))
         exit_code = map_exception_to_exit_code(e)
         raise typer.Exit(code=exit_code)
+
+
+def _diagnose_startup(
+    config_file: Optional[str], top: int, baseline_out: Optional[str]
+) -> None:
+    """Print a ranked cold-start report (imports and provider construction)."""
+    from agentmap.runtime.startup_ops import write_startup_baseline
+    from agentmap.runtime_api import profile_startup
+
+    try:
+        typer.echo("AgentMap Startup Profile")
+        typer.echo("========================")
+        typer.echo("\nProfiling a cold start in a fresh interpreter...")
+
+        profile = profile_startup(config_file=config_file, top=top)["outputs"]
+
+        typer.echo(
+            f"\n  import agentmap.runtime_api: {profile['runtime_api_import_ms']:.1f} ms"
+        )
+        typer.echo(
+            f"  initialize_di():             {profile['container_build_ms']:.1f} ms"
+        )
+        typer.echo(
+            f"  Modules imported:            {profile['module_count']} "
+            f"({profile['total_import_ms']:.1f} ms total)"
+        )
+        heavy = profile["heavy_modules_loaded"]
+        if heavy:
+            typer.secho(
+                f"  ⚠️ Heavy modules imported by runtime_api: {', '.join(heavy)}",
+                fg=typer.colors.YELLOW,
+            )
+
+        typer.echo("\nProvider construction (incremental, slowest first):")
+        for provider in profile["providers"][:top]:
+            suffix = f"  ❌ {provider['error']}" if provider["error"] else ""
+            typer.echo(f"  {provider['ms']:9.1f} ms  {provider['name']}{suffix}")
+
+        typer.echo("\nTop-level packages by cumulative import time:")
+        for record in profile["top_imports_cumulative"]:
+            typer.echo(f"  {record['cumulative_ms']:9.1f} ms  {record['module']}")
+
+        typer.echo("\nModules by self import time:")
+        for record in profile["top_imports_self"]:
+            typer.echo(f"  {record['self_ms']:9.1f} ms  {record['module']}")
+
+        if baseline_out:
+            write_startup_baseline(profile, baseline_out)
+            typer.secho(
+                f"\n✅ Baseline written to {baseline_out}", fg=typer.colors.GREEN
+            )
+
+    except Exception as e:
+        print_err(str(e))
+        raise typer.Exit(code=map_exception_to_exit_code(e))
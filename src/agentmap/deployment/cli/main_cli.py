@@ -11,6 +11,7 @@ import typer
 
 from agentmap._version import __version__
 from agentmap.deployment.cli.auth_command import auth_cmd
+from agentmap.deployment.cli.batches_command import batches_cmd
 from agentmap.deployment.cli.diagnose_command import diagnose_cmd
 from agentmap.deployment.cli.init_command import init_command
 from agentmap.deployment.cli.refresh_command import refresh_cmd
@@ -20,6 +21,8 @@ from agentmap.deployment.cli.scaffold_command import scaffold_command
 from agentmap.deployment.cli.serve_command import serve_command
 from agentmap.deployment.cli.update_bundle_command import update_bundle_command
 from agentmap.deployment.cli.validate_command import validate_command
+from agentmap.deployment.cli.warmup_command import warmup_cmd
+from agentmap.deployment.cli.worker_command import worker_command
 
 # from agentmap.core.cli.validation_commands import (
 #     validate_all_cmd,
@@ -70,6 +73,8 @@ app.command("update-bundle")(update_bundle_command)
 # app.command("export")(export_command)
 app.command("resume")(resume_command)
 app.command("serve")(serve_command)
+app.command("worker")(worker_command)
+app.add_typer(batches_cmd, name="batches")
 
 
 # ============================================================================
@@ -94,6 +99,7 @@ app.command("validate")(validate_command)  # Bundle-based validation
 # ============================================================================
 
 app.command("refresh")(refresh_cmd)
+app.command("warmup")(warmup_cmd)
 # app.command("validate-cache")(validate_cache_cmd)
 app.command("diagnose")(diagnose_cmd)
 # app.command("inspect-graph")(inspect_graph_cmd)
@@ -0,0 +1,78 @@
+"""
+CLI warmup command handler.
+
+Builds the warm-start snapshot (declarations) and primes the provider
+availability cache so later CLI runs, serverless cold starts and HTTP workers
+can skip recomputing them. Intended to run as a deploy/build step; the
+snapshot is opt-in via ``warm_start.enabled``.
+"""
+
+from typing import Optional
+
+import typer
+
+# Lazy import: moved to function to avoid DI container init at module load
+
+
+def warmup_cmd(
+    keep_existing: bool = typer.Option(
+        False,
+        "--keep-existing",
+        help="Reuse still-valid snapshot sections instead of rebuilding them",
+    ),
+    config_file: Optional[str] = typer.Option(
+        None, "--config", "-c", help="Path to custom config file"
+    ),
+):
+    """
+    Build the warm-start snapshot used to speed up startup.
+
+    The snapshot is keyed on the AgentMap version and the contents of the
+    config files, so it is rebuilt automatically whenever either changes.
+    """
+    # Lazy import to avoid DI container initialization at module load
+    from agentmap.runtime_api import warmup
+
+    try:
+        typer.echo("🔥 Building Warm-Start Snapshot")
+        typer.echo("=" * 40)
+
+        result = warmup(rebuild=not keep_existing, config_file=config_file)
+        outputs = result["outputs"]
+        snapshot = outputs["snapshot"]
+
+        if not result["success"]:
+            typer.secho(
+                f"⚠️  Warm-start snapshot disabled: {result['metadata']['reason']}",
+                fg=typer.colors.YELLOW,
+            )
+            raise typer.Exit(code=1)
+
+        typer.echo(
+            f"\n📚 Declarations: {outputs['agents']} agents, "
+            f"{outputs['services']} services "
+            f"({outputs['timings']['declarations'] * 1000:.1f} ms)"
+        )
+
+        available_llm = [p for p, ok in outputs["llm_results"].items() if ok]
+        available_storage = [s for s, ok in outputs["storage_results"].items() if ok]
+        typer.echo(
+            f"🔌 Availability checked in "
+            f"{outputs['timings']['availability'] * 1000:.1f} ms"
+        )
+        typer.echo(f"  LLM Providers Available: {', '.join(available_llm) or 'none'}")
+        typer.echo(
+            f"  Storage Types Available: {', '.join(available_storage) or 'none'}"
+        )
+
+        typer.echo(f"\n💾 Snapshot: {snapshot['snapshot_path']}")
+        typer.echo(f"  Key: {snapshot['key'][:16]}…")
+        typer.echo(f"  Sections: {', '.join(snapshot['sections'])}")
+
+        typer.secho("\n✅ Warm-start snapshot ready!", fg=typer.colors.GREEN)
+    except typer.Exit:
+        raise
+
+    except Exception as e:
+        typer.secho(f"❌ Failed to build warm-start snapshot: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
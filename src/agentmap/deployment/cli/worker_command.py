@@ -0,0 +1,58 @@
+"""
+CLI worker command - runs a queued-execution worker pool.
+
+Workers drain the same durable job queue the HTTP server's ``/jobs`` routes
+submit to, so execution capacity can be scaled independently of the API
+process. The server runs no workers of its own unless
+``execution.job_queue.start_with_server`` is true.
+"""
+
+import asyncio
+from typing import Optional
+
+import typer
+
+from agentmap.deployment.cli.utils.cli_presenter import (
+    map_exception_to_exit_code,
+    print_err,
+)
+from agentmap.runtime_api import start_job_workers, stop_job_workers
+
+
+async def _run_workers(config_file: Optional[str], workers: Optional[int]) -> None:
+    pool = await start_job_workers(config_file=config_file, workers=workers)
+    typer.echo(f"Job worker pool running with {pool.num_workers} worker(s)")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await stop_job_workers()
+
+
+def worker_command(
+    config_file: Optional[str] = typer.Option(
+        None, "--config", "-c", help="Path to custom config file"
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers",
+        "-w",
+        min=1,
+        help="Number of concurrent workers (default: execution.job_queue.workers)",
+    ),
+):
+    """
+    Run a worker pool that executes jobs submitted via POST /jobs.
+
+    Examples:
+        agentmap worker --config agentmap_local_config.yaml
+        agentmap worker --workers 8
+    """
+    try:
+        typer.echo("Starting AgentMap job workers... Press Ctrl+C to stop")
+        asyncio.run(_run_workers(config_file, workers))
+    except KeyboardInterrupt:
+        typer.echo("\nWorkers stopped by user")
+        raise typer.Exit(code=0)
+    except Exception as e:
+        print_err(f"Failed to run workers: {str(e)}")
+        raise typer.Exit(code=map_exception_to_exit_code(e))
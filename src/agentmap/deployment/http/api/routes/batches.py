@@ -0,0 +1,146 @@
+"""Watched LLM batch routes for the HTTP adapter.
+
+Batches submitted through ``LLMService.submit_batch`` can be handed to the
+server's batch watcher with ``POST /batches/watches/{batch_id}`` instead of
+being polled by each client.  The watcher polls all watched batches together
+and, when ``resume_thread_id`` is given, resumes that suspended workflow once
+the batch reaches a terminal status.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, Field
+
+from agentmap.deployment.http.api.dependencies import requires_auth
+from agentmap.exceptions.runtime_exceptions import AgentMapNotInitialized, BatchNotFound
+from agentmap.runtime_api import (
+    list_watched_batches_async,
+    poll_watched_batches_async,
+    unwatch_batch_async,
+    watch_batch_async,
+)
+
+
+class WatchBatchRequest(BaseModel):
+    """Request to watch a submitted batch."""
+
+    resume_thread_id: Optional[str] = Field(
+        None, description="Suspended workflow thread to resume on completion"
+    )
+
+
+class BatchWatchResponse(BaseModel):
+    """A watched batch."""
+
+    agentmap_batch_id: str = Field(..., description="AgentMap batch identifier")
+    provider: str = Field(..., description="Batch provider")
+    status: str = Field(..., description="Last observed batch status")
+    watched_at: float = Field(..., description="Watch start (epoch seconds)")
+    next_poll_at: float = Field(..., description="Next poll time (epoch seconds)")
+    interval: float = Field(..., description="Current poll interval in seconds")
+    polls: int = Field(0, description="Polls made while watching")
+    resume_thread_id: Optional[str] = Field(
+        None, description="Workflow thread resumed on completion"
+    )
+
+
+class BatchWatchListResponse(BaseModel):
+    """Watched batches."""
+
+    watches: List[BatchWatchResponse] = Field(
+        ..., description="Watched batches, soonest next poll first"
+    )
+    watcher_running: bool = Field(
+        ..., description="True when this server runs a batch watcher"
+    )
+
+
+class BatchPollResponse(BaseModel):
+    """Outcome of one watcher pass."""
+
+    completed: List[Dict[str, Any]] = Field(
+        ..., description="Batches that reached a terminal status in this pass"
+    )
+    watching: int = Field(..., description="Batches still being watched")
+
+
+router = APIRouter(prefix="/batches", tags=["Batches"])
+
+
+@router.get("/watches", response_model=BatchWatchListResponse)
+@requires_auth("read")
+async def list_watches(request: Request):
+    """List watched batches."""
+    try:
+        result = await list_watched_batches_async(
+            config_file=getattr(request.app.state, "config_file", None)
+        )
+        return BatchWatchListResponse(
+            watches=[BatchWatchResponse(**w) for w in result["outputs"]["watches"]],
+            watcher_running=result["metadata"]["watcher_running"],
+        )
+
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/watches/poll", response_model=BatchPollResponse)
+@requires_auth("execute")
+async def poll_watches(
+    request: Request,
+    force: bool = Query(False, description="Poll every watched batch, not just due"),
+):
+    """Run one watcher pass now and resume workflows for completed batches."""
+    try:
+        result = await poll_watched_batches_async(
+            force=force, config_file=getattr(request.app.state, "config_file", None)
+        )
+        return BatchPollResponse(**result["outputs"])
+
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/watches/{batch_id}", response_model=BatchWatchResponse, status_code=202)
+@requires_auth("execute")
+async def watch_batch(
+    batch_id: str, request: Request, request_body: Optional[WatchBatchRequest] = None
+):
+    """Watch a submitted batch until it completes."""
+    try:
+        result = await watch_batch_async(
+            batch_id,
+            resume_thread_id=request_body.resume_thread_id if request_body else None,
+            config_file=getattr(request.app.state, "config_file", None),
+        )
+        return BatchWatchResponse(**result["outputs"])
+
+    except BatchNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/watches/{batch_id}")
+@requires_auth("execute")
+async def unwatch_batch(batch_id: str, request: Request):
+    """Stop watching a batch (the provider batch keeps running)."""
+    try:
+        result = await unwatch_batch_async(
+            batch_id, config_file=getattr(request.app.state, "config_file", None)
+        )
+        return result["outputs"]
+
+    except BatchNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,216 @@
+"""Queued execution routes for the HTTP adapter.
+
+Submit/poll/cancel counterpart to ``routes/execute.py``: instead of running
+the workflow inside the request, ``POST /jobs/{graph_id}`` enqueues it in the
+durable job queue and returns ``202`` with a job id immediately.  Workers
+(inside this server, or ``agentmap worker`` processes sharing the same queue
+file) execute it; clients poll ``GET /jobs/{job_id}`` for the result and may
+cancel with ``DELETE /jobs/{job_id}``.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, HTTPException, Query, Request
+from pydantic import BaseModel, Field
+
+from agentmap.deployment.http.api.dependencies import requires_auth
+from agentmap.deployment.http.api.routes._shared import (
+    normalize_graph_identifier,
+    to_serializable,
+)
+from agentmap.exceptions.runtime_exceptions import (
+    AgentMapNotInitialized,
+    InvalidInputs,
+    JobNotFound,
+)
+from agentmap.runtime_api import (
+    cancel_job_async,
+    get_job_async,
+    list_jobs_async,
+    submit_job_async,
+)
+
+
+class SubmitJobRequest(BaseModel):
+    """Request to enqueue a workflow execution."""
+
+    inputs: Dict[str, Any] = Field(
+        default_factory=dict, description="Input state passed into the workflow"
+    )
+    priority: int = Field(0, description="Higher priorities are executed first")
+    execution_id: Optional[str] = Field(
+        None, description="Optional client supplied tracking identifier"
+    )
+    force_create: bool = Field(
+        False,
+        description="Force recreation of bundle even if cached version exists",
+    )
+
+
+class JobResponse(BaseModel):
+    """State of a queued execution job."""
+
+    job_id: str = Field(..., description="Job identifier used for polling")
+    graph_id: str = Field(..., description="Graph identifier being executed")
+    status: str = Field(
+        ...,
+        description=(
+            "Job status: queued | running | completed | suspended | failed | "
+            "cancelled"
+        ),
+    )
+    priority: int = Field(0, description="Job priority")
+    execution_id: Optional[str] = Field(
+        None, description="Echo of the supplied execution identifier"
+    )
+    created_at: float = Field(..., description="Submit time (epoch seconds)")
+    started_at: Optional[float] = Field(None, description="Start time")
+    finished_at: Optional[float] = Field(None, description="Finish time")
+    expires_at: Optional[float] = Field(
+        None, description="Time after which the result is purged"
+    )
+    attempts: int = Field(0, description="Number of times the job was claimed")
+    cancel_requested: bool = Field(False, description="True once cancel was asked")
+    thread_id: Optional[str] = Field(
+        None, description="Thread identifier when execution is suspended"
+    )
+    outputs: Optional[Any] = Field(None, description="Final workflow outputs")
+    error: Optional[str] = Field(None, description="Error message when failed")
+
+
+class JobListResponse(BaseModel):
+    """Page of queued execution jobs."""
+
+    jobs: List[JobResponse] = Field(..., description="Jobs, newest first")
+    counts: Dict[str, int] = Field(..., description="Queue-wide counts by status")
+    limit: int = Field(..., description="Page size")
+    offset: int = Field(..., description="Page offset")
+
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def _build_job_response(job: Dict[str, Any]) -> JobResponse:
+    """Normalize a job record (runtime facade ``outputs``) into JobResponse."""
+    result = job.get("result") or {}
+    outputs = result.get("outputs")
+    if isinstance(outputs, dict):
+        outputs = {k: v for k, v in outputs.items() if k != "__execution_summary"}
+    return JobResponse(
+        job_id=job["job_id"],
+        graph_id=job["graph_name"],
+        status=job["status"],
+        priority=job.get("priority", 0),
+        execution_id=job.get("execution_id"),
+        created_at=job["created_at"],
+        started_at=job.get("started_at"),
+        finished_at=job.get("finished_at"),
+        expires_at=job.get("expires_at"),
+        attempts=job.get("attempts", 0),
+        cancel_requested=job.get("cancel_requested", False),
+        thread_id=result.get("thread_id"),
+        outputs=to_serializable(outputs),
+        error=job.get("error"),
+    )
+
+
+@router.post("/{graph_id:path}", response_model=JobResponse, status_code=202)
+@requires_auth("execute")
+async def submit_job(graph_id: str, request_body: SubmitJobRequest, request: Request):
+    """
+    Enqueue a workflow execution and return its job id without waiting.
+
+    Graph ID format: workflow::graph (also accepts workflow/graph).
+    """
+    try:
+        graph_identifier = normalize_graph_identifier(graph_id)
+        if not graph_identifier or graph_identifier.count("::") > 1:
+            raise InvalidInputs(f"Invalid graph identifier format: {graph_identifier}")
+
+        config_file = getattr(request.app.state, "config_file", None)
+        result = await submit_job_async(
+            graph_identifier,
+            request_body.inputs,
+            priority=request_body.priority,
+            execution_id=request_body.execution_id,
+            force_create=request_body.force_create,
+            config_file=config_file,
+        )
+        return _build_job_response(result["outputs"])
+
+    except InvalidInputs as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("", response_model=JobListResponse)
+@requires_auth("read")
+async def list_jobs(
+    request: Request,
+    status: Optional[str] = Query(None, description="Filter by job status"),
+    graph: Optional[str] = Query(None, description="Filter by graph identifier"),
+    limit: int = Query(100, ge=1, le=1000, description="Page size"),
+    offset: int = Query(0, ge=0, description="Page offset"),
+):
+    """List queued, running and retained jobs (newest first)."""
+    try:
+        result = await list_jobs_async(
+            status=status,
+            graph_name=normalize_graph_identifier(graph) if graph else None,
+            limit=limit,
+            offset=offset,
+            config_file=getattr(request.app.state, "config_file", None),
+        )
+        outputs = result["outputs"]
+        return JobListResponse(
+            jobs=[_build_job_response(job) for job in outputs["jobs"]],
+            counts=outputs["counts"],
+            limit=limit,
+            offset=offset,
+        )
+
+    except InvalidInputs as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+@requires_auth("read")
+async def get_job(job_id: str, request: Request):
+    """Poll a job's status; ``outputs`` is populated once it has finished."""
+    try:
+        result = await get_job_async(
+            job_id, config_file=getattr(request.app.state, "config_file", None)
+        )
+        return _build_job_response(result["outputs"])
+
+    except JobNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/{job_id}", response_model=JobResponse)
+@requires_auth("execute")
+async def cancel_job(job_id: str, request: Request):
+    """Cancel a queued or running job (no-op for finished jobs)."""
+    try:
+        result = await cancel_job_async(
+            job_id, config_file=getattr(request.app.state, "config_file", None)
+        )
+        return _build_job_response(result["outputs"])
+
+    except JobNotFound as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except AgentMapNotInitialized as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
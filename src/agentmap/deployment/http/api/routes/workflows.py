@@ -4,7 +4,7 @@ Workflow query routes - Simple and clean.
 
 from typing import List, Optional
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel, Field
 
 from agentmap.deployment.http.api.dependencies import requires_auth
@@ -35,6 +35,12 @@ class WorkflowSummary(BaseModel):
         ..., description="Number of graphs defined in the workflow"
     )
     total_nodes: int = Field(..., description="Total nodes across all graphs")
+    graphs: List[str] = Field(
+        default_factory=list, description="Names of the matching graphs"
+    )
+    agent_types: List[str] = Field(
+        default_factory=list, description="Agent types used by the matching graphs"
+    )
 
 
 class WorkflowListResponse(BaseModel):
@@ -42,7 +48,9 @@ class WorkflowListResponse(BaseModel):
 
     repository_path: str = Field(..., description="CSV repository path")
     workflows: List[WorkflowSummary] = Field(..., description="Available workflows")
-    total_count: int = Field(..., description="Total workflow count")
+    total_count: int = Field(..., description="Matching workflow count")
+    offset: int = Field(0, description="Page offset")
+    limit: Optional[int] = Field(None, description="Page size (None for all)")
 
 
 class NodeInfo(BaseModel):
@@ -70,15 +78,25 @@ router = APIRouter(prefix="/workflows", tags=["Workflows"])
 
 @router.get("", response_model=WorkflowListResponse)
 @requires_auth("read")
-async def list_workflows(request: Request):
-    """List all available workflows."""
+async def list_workflows(
+    request: Request,
+    search: Optional[str] = Query(
+        None, description="Substring of the workflow or graph name"
+    ),
+    agent_type: Optional[str] = Query(
+        None, description="Only workflows with a graph using this agent type"
+    ),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size"),
+    offset: int = Query(0, ge=0, description="Page offset"),
+):
+    """List available workflows, served from the workflow catalog."""
     try:
         # TD-018/TD-049: ensure_initialized_async offloads the synchronous
         # filesystem I/O behind a thread boundary (REQ-NF-001) instead of
         # blocking the event loop on this async request path.
         await ensure_initialized_async()
 
-        result = await list_graphs_async()
+        result = await list_graphs_async(search=search, agent_type=agent_type)
         if not result.get("success"):
             raise HTTPException(
                 status_code=500, detail=result.get("error", "Failed to list graphs")
@@ -96,50 +114,45 @@ async def list_workflows(request: Request):
                     repository_path = repo_meta["repository_path"]
                     break
 
+        # Graphs of one workflow share its catalog entry, so the file-level
+        # fields are identical; only the graph names and agent types differ.
         workflows_by_name = {}
         for graph in graphs:
             workflow_name = graph.get("workflow") or graph.get("name")
             if not workflow_name:
                 continue
 
-            base_data = {
-                "name": workflow_name,
-                "filename": graph.get("filename", ""),
-                "file_path": graph.get("file_path", ""),
-                "file_size": int(graph.get("file_size", 0) or 0),
-                "last_modified": float(graph.get("last_modified", 0.0) or 0.0),
-                "graph_count": int(graph.get("graph_count_in_workflow", 0) or 0),
-                "total_nodes": int(graph.get("total_nodes", 0) or 0),
-            }
-
             existing = workflows_by_name.get(workflow_name)
             if existing is None:
-                workflows_by_name[workflow_name] = base_data
-            else:
-                existing["graph_count"] = max(
-                    existing["graph_count"], base_data["graph_count"]
-                )
-                existing["total_nodes"] = max(
-                    existing["total_nodes"], base_data["total_nodes"]
-                )
-                existing["file_size"] = max(
-                    existing["file_size"], base_data["file_size"]
-                )
-                existing["last_modified"] = max(
-                    existing["last_modified"], base_data["last_modified"]
-                )
-
+                existing = workflows_by_name[workflow_name] = {
+                    "name": workflow_name,
+                    "filename": graph.get("filename", ""),
+                    "file_path": graph.get("file_path", ""),
+                    "file_size": int(graph.get("file_size", 0) or 0),
+                    "last_modified": float(graph.get("last_modified", 0.0) or 0.0),
+                    "graph_count": int(graph.get("graph_count_in_workflow", 0) or 0),
+                    "total_nodes": int(graph.get("total_nodes", 0) or 0),
+                    "graphs": [],
+                    "agent_types": set(),
+                }
+            existing["graphs"].append(graph.get("name", ""))
+            existing["agent_types"].update(graph.get("agent_types") or [])
+
+        matching = sorted(workflows_by_name.values(), key=lambda item: item["name"])
+        page_end = None if limit is None else offset + limit
         workflows = [
-            WorkflowSummary(**data)
-            for data in sorted(
-                workflows_by_name.values(), key=lambda item: item["name"]
+            WorkflowSummary(
+                **{**data, "agent_types": sorted(data["agent_types"])},
             )
+            for data in matching[offset:page_end]
         ]
 
         return WorkflowListResponse(
             repository_path=str(repository_path),
             workflows=workflows,
-            total_count=len(workflows),
+            total_count=len(matching),
+            offset=offset,
+            limit=limit,
         )
 
     except AgentMapNotInitialized as e:
@@ -23,7 +23,14 @@ from agentmap.exceptions.runtime_exceptions import (
 )
 
 # ✅ FACADE PATTERN: Only import from runtime facade
-from agentmap.runtime_api import ensure_initialized, get_container
+from agentmap.runtime_api import (
+    ensure_initialized,
+    get_container,
+    start_batch_watcher,
+    start_job_workers,
+    stop_batch_watcher,
+    stop_job_workers,
+)
 
 
 # Legacy Response Models (for backward compatibility)
@@ -65,12 +72,34 @@ def create_lifespan(config_file: Optional[str] = None):
                 # Services will be initialized on first use if pre-warm fails
                 pass
 
+            # Queued execution: run a job worker pool inside the server only when
+            # opted in (execution.job_queue.start_with_server); by default
+            # workers are deployed separately with `agentmap worker`.
+            try:
+                job_config = container.app_config_service().get_job_queue_config()
+                if job_config.get("start_with_server", False):
+                    await start_job_workers(config_file=config_file)
+            except Exception as e:
+                print(f"Warning: job worker pool not started: {e}")
+
+            # Watched LLM batches: poll them from this server only when opted in
+            # (llm.batch_watch.start_with_server); otherwise run
+            # `agentmap batches run`.
+            try:
+                watch_config = container.app_config_service().get_batch_watch_config()
+                if watch_config.get("start_with_server", False):
+                    await start_batch_watcher(config_file=config_file)
+            except Exception as e:
+                print(f"Warning: batch watcher not started: {e}")
+
             print("AgentMap runtime initialized successfully")
             yield
         except Exception as e:
             print(f"Failed to initialize AgentMap runtime: {e}")
             raise
         finally:
+            await stop_batch_watcher()
+            await stop_job_workers()
             print("AgentMap runtime shutting down")
 
     return lifespan
@@ -234,6 +263,14 @@ Error responses include detailed validation information and suggestions for reso
                     "url": "https://jwwelbor.github.io/AgentMap/docs/intro",
                 },
             },
+            {
+                "name": "Jobs",
+                "description": "Queued workflow execution: submit, poll and cancel",
+            },
+            {
+                "name": "Batches",
+                "description": "Watched LLM batches: watch, list, poll and unwatch",
+            },
             {
                 "name": "Information & Diagnostics",
                 "description": "System information, health checks, and diagnostics",
@@ -246,9 +283,13 @@ Error responses include detailed validation information and suggestions for reso
         # Import facade-based route modules (these need to be converted)
         try:
             from agentmap.deployment.http.api.routes.admin import router as admin_router
+            from agentmap.deployment.http.api.routes.batches import (
+                router as batches_router,
+            )
             from agentmap.deployment.http.api.routes.execute import (
                 router as execution_router,
             )
+            from agentmap.deployment.http.api.routes.jobs import router as jobs_router
             from agentmap.deployment.http.api.routes.stream import (
                 router as stream_router,
             )
@@ -263,6 +304,8 @@ Error responses include detailed validation information and suggestions for reso
             app.include_router(stream_router)
             app.include_router(execution_router)
             app.include_router(workflow_router)
+            app.include_router(jobs_router)
+            app.include_router(batches_router)
             app.include_router(admin_router)
         except ImportError as e:
             print(f"Warning: Could not import route modules: {e}")
@@ -13,6 +13,7 @@ class BootstrapContainer(containers.DeclarativeContainer):
     availability_cache_service = providers.Dependency()
     custom_agents_config = providers.Dependency()
     llm_models_config_service = providers.Dependency()
+    warm_start_snapshot_service = providers.Dependency()
 
     # --- Registry Models --------------------------------------------------------
 
@@ -69,7 +70,9 @@ class BootstrapContainer(containers.DeclarativeContainer):
     )
 
     @staticmethod
-    def _create_declaration_registry_service(app_config_service, logging_service):
+    def _create_declaration_registry_service(
+        app_config_service, logging_service, warm_start_snapshot_service
+    ):
         from agentmap.services.declaration_parser import DeclarationParser
         from agentmap.services.declaration_registry_service import (
             DeclarationRegistryService,
@@ -80,7 +83,11 @@ class BootstrapContainer(containers.DeclarativeContainer):
             PythonDeclarationSource,
         )
 
-        registry = DeclarationRegistryService(app_config_service, logging_service)
+        registry = DeclarationRegistryService(
+            app_config_service,
+            logging_service,
+            snapshot_service=warm_start_snapshot_service,
+        )
         parser = DeclarationParser(logging_service)
         registry.add_source(PythonDeclarationSource(parser, logging_service))
         registry.add_source(
@@ -98,6 +105,7 @@ class BootstrapContainer(containers.DeclarativeContainer):
         _create_declaration_registry_service,
         app_config_service,
         logging_service,
+        warm_start_snapshot_service,
     )
 
     @staticmethod
@@ -89,6 +89,31 @@ class CoreContainer(containers.DeclarativeContainer):
         logging_service,
     )
 
+    # --- Warm-start snapshot ----------------------------------------------------
+
+    @staticmethod
+    def _create_warm_start_snapshot_service(app_config_service, logging_service):
+        from agentmap.services.config.warm_start_snapshot_service import (
+            WarmStartSnapshotService,
+        )
+
+        warm_start_config = app_config_service.get_warm_start_config()
+        return WarmStartSnapshotService(
+            snapshot_path=warm_start_config["snapshot_path"],
+            logging_service=logging_service,
+            config_files=[
+                app_config_service.get_config_file_path(),
+                app_config_service.get_storage_config_path(),
+            ],
+            enabled=warm_start_config["enabled"],
+        )
+
+    warm_start_snapshot_service = providers.Singleton(
+        _create_warm_start_snapshot_service,
+        app_config_service,
+        logging_service,
+    )
+
     # --- Config convenience callables -------------------------------------------
 
     logging_config = providers.Callable(
@@ -159,6 +184,26 @@ class CoreContainer(containers.DeclarativeContainer):
         logging_service,
     )
 
+    @staticmethod
+    def _create_job_queue_service(app_config_service, logging_service):
+        from agentmap.services.job_queue_service import JobQueueService
+
+        job_config = app_config_service.get_job_queue_config()
+        return JobQueueService(
+            db_path=job_config["db_path"],
+            logging_service=logging_service,
+            result_ttl_seconds=job_config["result_ttl_seconds"],
+            max_concurrent_per_graph=job_config["max_concurrent_per_graph"],
+            graph_limits=job_config["graph_limits"],
+            max_attempts=job_config["max_attempts"],
+        )
+
+    job_queue_service = providers.Singleton(
+        _create_job_queue_service,
+        app_config_service,
+        logging_service,
+    )
+
     def get_cache_status(self) -> Dict[str, Any]:
         cache_service = self.availability_cache_service()
         if cache_service and hasattr(cache_service, "get_cache_stats"):
@@ -88,6 +88,21 @@ class GraphAgentContainer(containers.DeclarativeContainer):
         blob_storage_service,
     )
 
+    # Per-node result memoization; None unless execution.node_cache.enabled.
+    @staticmethod
+    def _create_node_result_cache(app_config_service, logging_service):
+        config = app_config_service.get_node_cache_config()
+        if not isinstance(config, dict) or config.get("enabled") is not True:
+            return None
+
+        from agentmap.services.graph.node_result_cache import NodeResultCache
+
+        return NodeResultCache(config, logging_service)
+
+    node_result_cache = providers.Singleton(
+        _create_node_result_cache, app_config_service, logging_service
+    )
+
     @staticmethod
     def _create_graph_agent_instantiation_service(
         agent_factory_service,
@@ -100,6 +115,7 @@ class GraphAgentContainer(containers.DeclarativeContainer):
         declaration_registry_service,
         telemetry_service,
         file_path_service,
+        node_result_cache,
     ):
         from agentmap.services.graph.graph_agent_instantiation_service import (
             GraphAgentInstantiationService,
@@ -116,6 +132,7 @@ class GraphAgentContainer(containers.DeclarativeContainer):
             declaration_registry_service,
             telemetry_service,
             file_path_service=file_path_service,
+            node_result_cache=node_result_cache,
         )
 
     graph_agent_instantiation_service = providers.Singleton(
@@ -130,4 +147,5 @@ class GraphAgentContainer(containers.DeclarativeContainer):
         declaration_registry_service,
         telemetry_service,
         file_path_service,
+        node_result_cache,
     )
@@ -71,6 +71,18 @@ class GraphCoreContainer(containers.DeclarativeContainer):
         logging_service,
     )
 
+    @staticmethod
+    def _create_execution_pool_service(app_config_service, logging_service):
+        from agentmap.services.execution_pool_service import ExecutionPoolService
+
+        return ExecutionPoolService(app_config_service, logging_service)
+
+    execution_pool_service = providers.Singleton(
+        _create_execution_pool_service,
+        app_config_service,
+        logging_service,
+    )
+
     # --- Graph Factory & Assembly -----------------------------------------------
 
     @staticmethod
@@ -93,6 +105,7 @@ class GraphCoreContainer(containers.DeclarativeContainer):
         function_resolution_service,
         graph_factory_service,
         orchestrator_service,
+        execution_pool_service,
     ):
         from agentmap.services.graph.graph_assembly_service import GraphAssemblyService
 
@@ -104,6 +117,7 @@ class GraphCoreContainer(containers.DeclarativeContainer):
             function_resolution_service,
             graph_factory_service,
             orchestrator_service,
+            execution_pool_service,
         )
 
     graph_assembly_service = providers.Singleton(
@@ -115,6 +129,7 @@ class GraphCoreContainer(containers.DeclarativeContainer):
         function_resolution_service,
         graph_factory_service,
         orchestrator_service,
+        execution_pool_service,
     )
 
     # --- Protocol & Registry Services -------------------------------------------
@@ -157,6 +172,20 @@ class GraphCoreContainer(containers.DeclarativeContainer):
         logging_service,
     )
 
+    @staticmethod
+    def _create_workflow_catalog_service(app_config_service, logging_service):
+        from agentmap.services.graph.workflow_catalog_service import (
+            WorkflowCatalogService,
+        )
+
+        return WorkflowCatalogService(app_config_service, logging_service)
+
+    workflow_catalog_service = providers.Singleton(
+        _create_workflow_catalog_service,
+        app_config_service,
+        logging_service,
+    )
+
     # --- Bundle Services --------------------------------------------------------
 
     @staticmethod
@@ -295,17 +324,22 @@ class GraphCoreContainer(containers.DeclarativeContainer):
     )
 
     @staticmethod
-    def _create_graph_checkpoint_service(system_storage_manager, logging_service):
+    def _create_graph_checkpoint_service(
+        system_storage_manager, logging_service, execution_pool_service
+    ):
         from agentmap.services.graph.graph_checkpoint_service import (
             GraphCheckpointService,
         )
 
-        return GraphCheckpointService(system_storage_manager, logging_service)
+        return GraphCheckpointService(
+            system_storage_manager, logging_service, execution_pool_service
+        )
 
     graph_checkpoint_service = providers.Singleton(
         _create_graph_checkpoint_service,
         system_storage_manager,
         logging_service,
+        execution_pool_service,
     )
 
     # --- Interaction Handler ----------------------------------------------------
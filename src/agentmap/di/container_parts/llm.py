@@ -24,9 +24,24 @@ class LLMContainer(containers.DeclarativeContainer):
     # `llm_service` is a Singleton -- override budget_guard BEFORE the first
     # `llm_service()` resolution, or the override has no effect.
     # There is deliberately no competing per-call registration path
-    # (Decision 4).
+    # (Decision 4). Without an override the default is the built-in
+    # LocalBudgetLedger when `llm.budget_ledger.enabled` is true, else None.
+    @staticmethod
+    def _create_default_budget_guard(app_config_service, logging_service):
+        config = app_config_service.get_llm_budget_ledger_config()
+        if not isinstance(config, dict) or config.get("enabled") is not True:
+            return None
+
+        from agentmap.services.llm.budget_ledger import LocalBudgetLedger
+
+        return LocalBudgetLedger(config, logging_service)
+
     budget_guard = providers.Dependency()
-    budget_guard.set_default(providers.Object(None))
+    budget_guard.set_default(
+        providers.Singleton(
+            _create_default_budget_guard, app_config_service, logging_service
+        )
+    )
 
     @staticmethod
     def _create_llm_routing_config_service(
@@ -105,7 +120,7 @@ class LLMContainer(containers.DeclarativeContainer):
 
     @staticmethod
     def _make_batch_adapter(
-        provider_key, adapter_cls, app_config_service, logging_service
+        provider_key, adapter_cls, app_config_service, logging_service, **adapter_kwargs
     ):
         from agentmap.exceptions import LLMDependencyError
 
@@ -118,7 +133,7 @@ class LLMContainer(containers.DeclarativeContainer):
             )
             return None
         try:
-            return adapter_cls(api_key=api_key, logger=logger)
+            return adapter_cls(api_key=api_key, logger=logger, **adapter_kwargs)
         except LLMDependencyError as exc:
             logger.warning(
                 "llm_batch.dependency_missing adapter=%s: %s",
@@ -146,13 +161,34 @@ class LLMContainer(containers.DeclarativeContainer):
 
     @staticmethod
     def _create_openai_batch_adapter(app_config_service, logging_service):
+        import os
+
         from agentmap.services.llm.openai_batch_adapter import OpenAIBatchAdapter
 
+        # Shard manifests live next to the batch handles so logical sharded
+        # batches can be polled and fetched after a restart.
+        sharding = app_config_service.get_value("llm.openai_batch", {}) or {}
+        batch_dir = app_config_service.get_value(
+            "llm.batch_dir", "agentmap_data/llm_batches"
+        )
+        adapter_kwargs = {
+            "spool_dir": sharding.get("spool_dir")
+            or os.path.join(batch_dir, "openai_spool")
+        }
+        for key in (
+            "max_requests_per_shard",
+            "max_bytes_per_shard",
+            "max_shard_retries",
+        ):
+            if sharding.get(key) is not None:
+                adapter_kwargs[key] = int(sharding[key])
+
         return LLMContainer._make_batch_adapter(
             "openai",
             OpenAIBatchAdapter,
             app_config_service,
             logging_service,
+            **adapter_kwargs,
         )
 
     openai_batch_adapter = providers.Singleton(
@@ -185,7 +221,8 @@ class LLMContainer(containers.DeclarativeContainer):
         batch_dir = app_config_service.get_value(
             "llm.batch_dir", "agentmap_data/llm_batches"
         )
-        return BatchHandleRepository(batch_dir=batch_dir)
+        index_path = app_config_service.get_value("llm.batch_index_path", None)
+        return BatchHandleRepository(batch_dir=batch_dir, index_path=index_path)
 
     batch_handle_repository = providers.Singleton(
         _create_batch_handle_repository,
@@ -256,3 +293,24 @@ class LLMContainer(containers.DeclarativeContainer):
         batch_handle_repository,
         budget_guard,
     )
+
+    @staticmethod
+    def _create_llm_batch_watch_service(
+        llm_service, batch_handle_repository, app_config_service, logging_service
+    ):
+        from agentmap.services.llm_batch_watch_service import LLMBatchWatchService
+
+        return LLMBatchWatchService(
+            llm_service,
+            batch_handle_repository,
+            app_config_service,
+            logging_service,
+        )
+
+    llm_batch_watch_service = providers.Singleton(
+        _create_llm_batch_watch_service,
+        llm_service,
+        batch_handle_repository,
+        app_config_service,
+        logging_service,
+    )
@@ -71,6 +71,9 @@ class TelemetryContainer(containers.DeclarativeContainer):
                     protocol=telemetry_config.get("protocol", "grpc"),
                     resource_attributes=telemetry_config.get("resource", {}),
                     logger=logger,
+                    sampling=telemetry_config.get("sampling"),
+                    limits=telemetry_config.get("limits"),
+                    batch=telemetry_config.get("batch"),
                 )
         except Exception as exc:
             if logger:
@@ -118,8 +121,13 @@ def _read_telemetry_config(app_config_service, logger):
         return defaults
 
 
-def _create_otel_service():
-    """Attempt to create OTELTelemetryService, return None on failure."""
+def _create_otel_service(telemetry_config=None):
+    """Attempt to create OTELTelemetryService, return None on failure.
+
+    Subsystems switched off under ``telemetry.subsystems`` and the
+    ``telemetry.limits.max_attribute_length`` cap are applied by the
+    service itself, so they also hold under a host TracerProvider.
+    """
     try:
         import opentelemetry.trace  # noqa: F401
 
@@ -127,7 +135,15 @@ def _create_otel_service():
             OTELTelemetryService,
         )
 
-        return OTELTelemetryService()
+        telemetry_config = telemetry_config or {}
+        subsystems = telemetry_config.get("subsystems") or {}
+        limits = telemetry_config.get("limits") or {}
+        return OTELTelemetryService(
+            disabled_subsystems=[
+                name for name, enabled in subsystems.items() if not enabled
+            ],
+            max_attribute_length=limits.get("max_attribute_length"),
+        )
     except (ImportError, AttributeError, Exception):
         return None
 
@@ -143,7 +159,7 @@ def _create_noop_service():
 
 def _create_service_no_bootstrap(logging_service, telemetry_config):
     """Create telemetry service without bootstrap, storing content flags."""
-    service = _create_otel_service()
+    service = _create_otel_service(telemetry_config)
     if service is None:
         try:
             logger = logging_service.get_logger("agentmap.di.telemetry")
@@ -164,7 +180,7 @@ def _create_service_no_bootstrap(logging_service, telemetry_config):
 
 def _create_service_with_flags(logging_service, telemetry_config):
     """Create telemetry service and store content capture flags."""
-    service = _create_otel_service()
+    service = _create_otel_service(telemetry_config)
     if service is None:
         try:
             logger = logging_service.get_logger("agentmap.di.telemetry")
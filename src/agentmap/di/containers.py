@@ -57,6 +57,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
         availability_cache_service=_expose(_core, "availability_cache_service"),
         custom_agents_config=_expose(_core, "custom_agents_config"),
         llm_models_config_service=_expose(_core, "llm_models_config_service"),
+        warm_start_snapshot_service=_expose(_core, "warm_start_snapshot_service"),
     )
 
     _llm = providers.Container(
@@ -161,6 +162,8 @@ class ApplicationContainer(containers.DeclarativeContainer):
     auth_service = _expose(_core, "auth_service")
     file_path_service = _expose(_core, "file_path_service")
     prompt_manager_service = _expose(_core, "prompt_manager_service")
+    job_queue_service = _expose(_core, "job_queue_service")
+    warm_start_snapshot_service = _expose(_core, "warm_start_snapshot_service")
     llm_models_config_service = _expose(_core, "llm_models_config_service")
 
     # --- Telemetry re-exports ---------------------------------------------------
@@ -205,6 +208,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     routing_cache = _expose(_llm, "routing_cache")
     llm_routing_service = _expose(_llm, "llm_routing_service")
     llm_service = _expose(_llm, "llm_service")
+    llm_batch_watch_service = _expose(_llm, "llm_batch_watch_service")
 
     # --- Host registry re-exports ----------------------------------------------
 
@@ -220,11 +224,13 @@ class ApplicationContainer(containers.DeclarativeContainer):
     execution_tracking_service = _expose(_graph_core, "execution_tracking_service")
     execution_policy_service = _expose(_graph_core, "execution_policy_service")
     graph_factory_service = _expose(_graph_core, "graph_factory_service")
+    execution_pool_service = _expose(_graph_core, "execution_pool_service")
     graph_assembly_service = _expose(_graph_core, "graph_assembly_service")
     protocol_requirements_analyzer = _expose(
         _graph_core, "protocol_requirements_analyzer"
     )
     graph_registry_service = _expose(_graph_core, "graph_registry_service")
+    workflow_catalog_service = _expose(_graph_core, "workflow_catalog_service")
     graph_bundle_service = _expose(_graph_core, "graph_bundle_service")
     bundle_update_service = _expose(_graph_core, "bundle_update_service")
     graph_scaffold_service = _expose(_graph_core, "graph_scaffold_service")
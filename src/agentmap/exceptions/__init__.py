@@ -22,8 +22,10 @@ from agentmap.exceptions.messaaging_exceptions import (
 from agentmap.exceptions.runtime_exceptions import (
     AgentMapError,
     AgentMapNotInitialized,
+    BatchNotFound,
     GraphNotFound,
     InvalidInputs,
+    JobNotFound,
 )
 from agentmap.exceptions.service_exceptions import (
     FunctionResolutionException,
@@ -40,6 +42,7 @@ from agentmap.exceptions.storage_exceptions import (
     CollectionNotFoundError,
     DocumentNotFoundError,
     StorageAuthenticationError,
+    StorageChecksumError,
     StorageConfigurationError,
     StorageConnectionError,
     StorageError,
@@ -79,6 +82,7 @@ __all__ = [
     "LLMResolvedCallError",
     "LLMBudgetExceededError",
     "StorageAuthenticationError",
+    "StorageChecksumError",
     "StorageConnectionError",
     "StorageConfigurationError",
     "StorageError",
@@ -94,6 +98,8 @@ __all__ = [
     # Runtime API exceptions
     "AgentMapError",
     "AgentMapNotInitialized",
+    "BatchNotFound",
     "GraphNotFound",
     "InvalidInputs",
+    "JobNotFound",
 ]
@@ -41,3 +41,22 @@ class InvalidInputs(AgentMapError):
     def __init__(self, reason: str):
         super().__init__(f"Invalid inputs: {reason}")
         self.reason = reason
+
+
+class JobNotFound(AgentMapError):
+    """Raised when a queued execution job id is unknown (or already purged)."""
+
+    def __init__(self, job_id: str):
+        super().__init__(f"Job not found: {job_id}")
+        self.job_id = job_id
+
+
+class BatchNotFound(AgentMapError):
+    """Raised when an LLM batch id has no persisted handle (or is not watched)."""
+
+    def __init__(self, agentmap_batch_id: str, detail: Optional[str] = None):
+        msg = f"Batch not found: {agentmap_batch_id}"
+        if detail:
+            msg += f" ({detail})"
+        super().__init__(msg)
+        self.agentmap_batch_id = agentmap_batch_id
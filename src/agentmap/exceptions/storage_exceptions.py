@@ -44,6 +44,10 @@ class StorageValidationError(StorageError):
     """Exception raised when storage data validation fails."""
 
 
+class StorageChecksumError(StorageValidationError):
+    """Exception raised when blob content does not match its expected checksum."""
+
+
 class StorageOperationError(StorageError):
     """Exception raised when there is an error performing a storage operation."""
 
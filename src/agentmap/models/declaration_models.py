@@ -6,7 +6,7 @@ that work with any source format (Python dicts, YAML, etc.). These models
 serve as the single source of truth for all declaration data regardless of format.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
 from typing import Any, Dict, List, Optional, Set
 
 
@@ -160,6 +160,43 @@ class AgentDeclaration:
         """
         return [req.name for req in self.protocol_requirements if req.requires]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation (capabilities as a sorted list)
+        """
+        data = asdict(self)
+        data["capabilities"] = sorted(self.capabilities)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AgentDeclaration":
+        """Create AgentDeclaration from the output of ``to_dict``.
+
+        Args:
+            data: Dictionary containing agent declaration data
+
+        Returns:
+            AgentDeclaration instance
+        """
+        return cls(
+            agent_type=data["agent_type"],
+            class_path=data["class_path"],
+            service_requirements=[
+                ServiceRequirement.from_dict(req)
+                for req in data.get("service_requirements", [])
+            ],
+            protocol_requirements=[
+                ProtocolRequirement.from_dict(req)
+                for req in data.get("protocol_requirements", [])
+            ],
+            capabilities=set(data.get("capabilities", [])),
+            metadata=dict(data.get("metadata", {})),
+            config=dict(data.get("config", {})),
+            source=data.get("source", ""),
+        )
+
 
 @dataclass
 class ServiceDeclaration:
@@ -194,3 +231,24 @@ class ServiceDeclaration:
     metadata: Dict[str, Any] = field(default_factory=dict)
     config: Dict[str, Any] = field(default_factory=dict)
     source: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary representation of the declaration
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ServiceDeclaration":
+        """Create ServiceDeclaration from the output of ``to_dict``.
+
+        Args:
+            data: Dictionary containing service declaration data
+
+        Returns:
+            ServiceDeclaration instance
+        """
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
@@ -11,15 +11,18 @@ Existing callers that import directly from the submodule paths (e.g.
 work unchanged — this __init__ does NOT alter the submodule layout.
 """
 
+from .job import ExecutionJob, JobStatus
 from .progress_event import WorkflowProgressEvent
 from .result import ExecutionResult
 from .summary import ExecutionSummary, NodeExecution
 from .tracker import ExecutionTracker
 
 __all__ = [
+    "ExecutionJob",
     "ExecutionResult",
     "ExecutionSummary",
     "ExecutionTracker",
+    "JobStatus",
     "NodeExecution",
     "WorkflowProgressEvent",
 ]
@@ -0,0 +1,88 @@
+"""
+Data-only models for queued (asynchronous) workflow execution jobs.
+
+An ``ExecutionJob`` is the durable record behind the submit/poll/cancel
+execution API: the HTTP adapter enqueues one, a worker pool claims and runs
+it through the runtime facade, and callers poll it until it reaches a
+terminal status.  Persistence lives in ``JobQueueService``; this module
+carries no business logic.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, Optional
+
+
+class JobStatus(str, Enum):
+    """
+    Lifecycle status of a queued execution job.
+
+    ``queued`` and ``running`` are the only non-terminal states.
+    ``completed``, ``suspended`` and ``failed`` mirror the execution statuses
+    reported by the synchronous ``/execute`` route; ``cancelled`` is set when
+    the caller cancels before (or while) the job runs.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    SUSPENDED = "suspended"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    @property
+    def is_terminal(self) -> bool:
+        """True when no further transitions are expected for this status."""
+        return self not in (JobStatus.QUEUED, JobStatus.RUNNING)
+
+
+@dataclass
+class ExecutionJob:
+    """
+    Durable record of a single queued workflow execution.
+
+    Timestamps are epoch seconds (``time.time()``) so they sort and compare
+    cheaply inside SQLite.  ``result`` holds the JSON-serializable runtime
+    facade payload once the job finishes; ``expires_at`` is set on the
+    terminal transition and drives result-retention cleanup.
+    """
+
+    job_id: str
+    graph_name: str
+    status: JobStatus
+    inputs: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 0
+    execution_id: Optional[str] = None
+    force_create: bool = False
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    expires_at: Optional[float] = None
+    attempts: int = 0
+    cancel_requested: bool = False
+    worker_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a plain, JSON-serializable dict (status as its string value)."""
+        return {
+            "job_id": self.job_id,
+            "graph_name": self.graph_name,
+            "status": (
+                self.status.value if isinstance(self.status, JobStatus) else self.status
+            ),
+            "inputs": self.inputs,
+            "priority": self.priority,
+            "execution_id": self.execution_id,
+            "force_create": self.force_create,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "expires_at": self.expires_at,
+            "attempts": self.attempts,
+            "cancel_requested": self.cancel_requested,
+            "worker_id": self.worker_id,
+            "result": self.result,
+            "error": self.error,
+        }
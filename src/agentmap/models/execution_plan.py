@@ -0,0 +1,70 @@
+"""
+ExecutionPlan data model for AgentMap graph bundles.
+
+Static facts about a graph's routing, computed once when the bundle is
+created (``services/graph/execution_plan_builder.py``) and stored with it,
+so graph assembly and orchestration read them instead of re-deriving them
+from ``bundle.nodes`` on every run. Data-only, like the other models.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+@dataclass
+class OrchestratorPlan:
+    """Routing candidates of one orchestrator node.
+
+    Attributes:
+        node_filter: The node filter string from the node's context
+            (``"all"``, ``"nodeType:<type>"`` or ``"a|b|c"``).
+        filter_kind: Parsed filter kind: ``"all"``, ``"node_type"`` or ``"names"``.
+        filter_values: Parsed filter operands (the type, or the node names).
+        candidates: Graph nodes the filter admits, in CSV order.
+        failure_target: Node the dynamic router takes when the orchestrator fails.
+    """
+
+    node_filter: str
+    filter_kind: str
+    filter_values: List[str] = field(default_factory=list)
+    candidates: List[str] = field(default_factory=list)
+    failure_target: Optional[str] = None
+
+
+@dataclass
+class ExecutionPlan:
+    """Precomputed static analysis of a graph.
+
+    Attributes:
+        entry_point: Starting node.
+        node_order: Node names in CSV order.
+        routing: Per-node edge kind: ``"none"`` (terminal), ``"static"``,
+            ``"function"`` (``func:`` router) or ``"orchestrator"``.
+        successors: Nodes each node can route to. Function routers list their
+            declared targets; orchestrators list their candidates.
+        reachable: Nodes reachable from the entry point, in CSV order.
+        unreachable: Nodes no path from the entry point reaches.
+        levels: Topological levels of the reachable nodes; nodes of one cycle
+            share a level.
+        parallel_groups: ``{"node", "condition", "targets"}`` per fan-out edge.
+        fan_in: Nodes with more than one predecessor, mapped to those
+            predecessors.
+        terminal_nodes: Nodes without outgoing edges.
+        cycles: Strongly connected node groups (including self-loops).
+        orchestrators: Orchestrator node name -> its ``OrchestratorPlan``.
+        version: Plan format version.
+    """
+
+    entry_point: Optional[str]
+    node_order: List[str] = field(default_factory=list)
+    routing: Dict[str, str] = field(default_factory=dict)
+    successors: Dict[str, List[str]] = field(default_factory=dict)
+    reachable: List[str] = field(default_factory=list)
+    unreachable: List[str] = field(default_factory=list)
+    levels: List[List[str]] = field(default_factory=list)
+    parallel_groups: List[Dict[str, object]] = field(default_factory=list)
+    fan_in: Dict[str, List[str]] = field(default_factory=dict)
+    terminal_nodes: List[str] = field(default_factory=list)
+    cycles: List[List[str]] = field(default_factory=list)
+    orchestrators: Dict[str, OrchestratorPlan] = field(default_factory=dict)
+    version: int = 1
@@ -8,6 +8,7 @@ for representing workflow graph structure.
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
+from .execution_plan import ExecutionPlan
 from .node import Node
 
 
@@ -19,8 +20,10 @@ class Graph:
         name: The name of the graph
         entry_point: Optional entry point node name
         nodes: Dictionary mapping node names to Node objects
+        execution_plan: Optional precomputed static analysis from the bundle
     """
 
     name: str
     entry_point: Optional[str] = None
     nodes: Dict[str, Node] = field(default_factory=dict)
+    execution_plan: Optional[ExecutionPlan] = None
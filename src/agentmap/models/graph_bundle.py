@@ -14,6 +14,7 @@ if TYPE_CHECKING:
         RunScopedDeclarationRegistry,
     )
 
+from .execution_plan import ExecutionPlan
 from .node import Node
 
 
@@ -47,6 +48,7 @@ class GraphBundle:
 
     # Phase 2: Optimization metadata
     graph_structure: Optional[Dict[str, Any]] = None  # NEW: Structure analysis
+    execution_plan: Optional[ExecutionPlan] = None  # Precomputed static routing
     protocol_mappings: Optional[Dict[str, str]] = (
         None  # NEW: Protocol -> implementation
     )
@@ -212,6 +214,7 @@ class GraphBundle:
         # New Phase 2 parameters
         graph_structure: Optional[Dict[str, Any]] = None,
         protocol_mappings: Optional[Dict[str, str]] = None,
+        execution_plan: Optional[ExecutionPlan] = None,
         # New Phase 3 parameters
         validation_metadata: Optional[Dict[str, Any]] = None,
         missing_declarations: Optional[Set[str]] = None,
@@ -238,6 +241,7 @@ class GraphBundle:
             custom_agents: Optional set of user-defined agents
             graph_structure: Optional graph structure analysis for optimization
             protocol_mappings: Optional protocol to implementation mappings
+            execution_plan: Optional precomputed static execution plan
             validation_metadata: Optional validation and integrity data
             missing_declarations: Optional set of agent types without declarations
             missing_services: Optional set of required services with no declaration
@@ -264,6 +268,7 @@ class GraphBundle:
             # Phase 2: Optimization metadata
             graph_structure=graph_structure,
             protocol_mappings=protocol_mappings,
+            execution_plan=execution_plan,
             # Phase 3: Validation metadata
             validation_metadata=validation_metadata,
             missing_declarations=missing_declarations,
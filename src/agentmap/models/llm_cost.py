@@ -87,4 +87,4 @@ class LLMBudgetCheck:
     max_possible_output_cost: Optional[Decimal]
     message_count: int
     input_chars: int
-    attempt_kind: str  # "primary" | "fallback"
+    attempt_kind: str  # "primary" | "fallback" | "hedge"
@@ -85,6 +85,8 @@ class StorageResult(Generic[T]):
     updated_ids: Optional[List[str]] = None
     deleted_ids: Optional[List[str]] = None
     is_collection: Optional[bool] = None
+    error_count: Optional[int] = None
+    item_results: Optional[List["StorageResult"]] = None  # batch_write, per item
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the result to a dictionary, filtering out None values."""
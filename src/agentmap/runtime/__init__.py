@@ -12,9 +12,26 @@ Preferred import path going forward:
 Legacy imports via `agentmap.runtime_api` continue to work.
 """
 
+from .batch_ops import (
+    list_watched_batches_async,
+    poll_watched_batches_async,
+    start_batch_watcher,
+    stop_batch_watcher,
+    unwatch_batch_async,
+    watch_batch_async,
+)
 from .bundle_ops import scaffold_agents, update_bundle
 from .init_ops import ensure_initialized, get_container
+from .job_ops import (
+    cancel_job_async,
+    get_job_async,
+    list_jobs_async,
+    start_job_workers,
+    stop_job_workers,
+    submit_job_async,
+)
 from .runtime_manager import RuntimeManager
+from .startup_ops import profile_startup
 from .system_ops import (
     diagnose_system,
     get_config,
@@ -23,6 +40,7 @@ from .system_ops import (
     get_version,
     refresh_cache,
     validate_cache,
+    warmup,
 )
 from .workflow_ops import (
     inspect_graph,
@@ -52,10 +70,24 @@ __all__ = [
     "inspect_graph_async",
     "validate_workflow",
     "validate_workflow_async",
+    "submit_job_async",
+    "get_job_async",
+    "cancel_job_async",
+    "list_jobs_async",
+    "start_job_workers",
+    "stop_job_workers",
+    "watch_batch_async",
+    "unwatch_batch_async",
+    "list_watched_batches_async",
+    "poll_watched_batches_async",
+    "start_batch_watcher",
+    "stop_batch_watcher",
     "update_bundle",
     "scaffold_agents",
     "refresh_cache",
     "validate_cache",
+    "warmup",
+    "profile_startup",
     "get_config",
     "diagnose_system",
     "RuntimeManager",
@@ -0,0 +1,269 @@
+"""Watched LLM batch operations.
+
+``LLMService.wait_for_batch`` blocks one caller per batch.  The functions here
+instead register batches with the persisted ``LLMBatchWatchService`` and let
+one ``BatchWatcher`` — started inside the HTTP server, or standalone via
+``agentmap batches run`` — poll every due batch in a single pass.
+When a watched batch reaches a terminal status the watcher resumes the
+suspended workflow recorded for it (``resume_thread_id``), passing a summary
+of the batch as the resume ``response_data``.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+from agentmap.exceptions import LLMServiceError
+from agentmap.exceptions.runtime_exceptions import BatchNotFound
+from agentmap.runtime.runtime_manager import RuntimeManager
+
+from .init_ops import ensure_initialized_async
+from .workflow_ops import resume_workflow_async
+
+_logger = logging.getLogger("agentmap.runtime.batches")
+
+# Handle fields passed to resumed workflows (request_id_map can be large).
+_RESUME_SUMMARY_FIELDS = (
+    "agentmap_batch_id",
+    "provider_batch_id",
+    "provider",
+    "model",
+    "status",
+    "ended_at",
+    "request_counts",
+)
+
+
+def _get_batch_watch_service():
+    return RuntimeManager.get_container().llm_batch_watch_service()
+
+
+def _batch_summary(handle) -> Dict[str, Any]:
+    data = handle.to_dict()
+    return {key: data.get(key) for key in _RESUME_SUMMARY_FIELDS}
+
+
+async def _process_completions(
+    completions: List[Dict[str, Any]], config_file: Optional[str]
+) -> List[Dict[str, Any]]:
+    """Resume workflows waiting on completed batches; return summaries."""
+    processed = []
+    for completion in completions:
+        summary = _batch_summary(completion["handle"])
+        thread_id = completion.get("resume_thread_id")
+        if thread_id:
+            token = json.dumps(
+                {
+                    "thread_id": thread_id,
+                    "response_action": "continue",
+                    "response_data": {"batch": summary},
+                }
+            )
+            try:
+                result = await resume_workflow_async(token, config_file=config_file)
+                summary["resumed"] = bool(result.get("success"))
+            except Exception as e:
+                _logger.error(
+                    "[BatchWatcher] Resuming thread %s for batch %s failed: %s",
+                    thread_id,
+                    summary["agentmap_batch_id"],
+                    e,
+                )
+                summary["resumed"] = False
+                summary["resume_error"] = str(e)
+            summary["resume_thread_id"] = thread_id
+        processed.append(summary)
+    return processed
+
+
+class BatchWatcher:
+    """
+    A single asyncio task polling every watched batch as it becomes due.
+
+    Each tick runs ``LLMBatchWatchService.poll_due`` in a thread (provider
+    calls and file I/O are blocking) and then resumes workflows for batches
+    that completed.  The tick sleeps until the earliest watched batch is due,
+    bounded by ``tick_seconds`` so watches added by other processes are
+    noticed promptly.
+    """
+
+    def __init__(self, watch_service, *, config_file: Optional[str] = None) -> None:
+        self._service = watch_service
+        self._config_file = config_file
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True between ``start()`` and ``stop()``."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Spawn the watcher task (idempotent)."""
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+        _logger.info("[BatchWatcher] Started")
+
+    async def stop(self) -> None:
+        """Cancel the watcher task; watches stay persisted."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            _logger.info("[BatchWatcher] Stopped")
+
+    def notify(self) -> None:
+        """Wake the watcher after a local ``watch`` (no-op when not started)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def tick(self, force: bool = False) -> List[Dict[str, Any]]:
+        """Poll due batches once and process completions."""
+        completions = await asyncio.to_thread(self._service.poll_due, force)
+        return await _process_completions(completions, self._config_file)
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                _logger.warning("[BatchWatcher] Poll pass failed: %s", e)
+            delay = await asyncio.to_thread(self._service.seconds_until_next_poll)
+            delay = self._service.tick_seconds if delay is None else delay
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=min(max(delay, 0.01), self._service.tick_seconds),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+# ---------------------------------------------------------------------------
+# Process-wide watcher (one per process, like the job worker pool).
+# ---------------------------------------------------------------------------
+
+_batch_watcher: Optional[BatchWatcher] = None
+
+
+def get_batch_watcher() -> Optional[BatchWatcher]:
+    """Return the watcher started in this process, or ``None``."""
+    return _batch_watcher
+
+
+async def start_batch_watcher(*, config_file: Optional[str] = None) -> BatchWatcher:
+    """Start this process's batch watcher (idempotent)."""
+    global _batch_watcher
+    await ensure_initialized_async(config_file=config_file)
+    if _batch_watcher is not None and _batch_watcher.is_running:
+        return _batch_watcher
+    _batch_watcher = BatchWatcher(_get_batch_watch_service(), config_file=config_file)
+    await _batch_watcher.start()
+    return _batch_watcher
+
+
+async def stop_batch_watcher() -> None:
+    """Stop this process's batch watcher if one is running."""
+    global _batch_watcher
+    watcher, _batch_watcher = _batch_watcher, None
+    if watcher is not None:
+        await watcher.stop()
+
+
+async def watch_batch_async(
+    agentmap_batch_id: str,
+    *,
+    resume_thread_id: Optional[str] = None,
+    config_file: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Watch a persisted batch until it reaches a terminal status.
+
+    Args:
+        agentmap_batch_id: Id of a handle saved by ``LLMService.submit_batch``.
+        resume_thread_id: Suspended workflow thread to resume on completion.
+        config_file: Optional configuration file path.
+
+    Raises:
+        BatchNotFound: if no handle is persisted under ``agentmap_batch_id``.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    try:
+        entry = await asyncio.to_thread(
+            _get_batch_watch_service().watch,
+            agentmap_batch_id,
+            resume_thread_id=resume_thread_id,
+        )
+    except LLMServiceError as e:
+        raise BatchNotFound(agentmap_batch_id, str(e)) from e
+    if _batch_watcher is not None:
+        _batch_watcher.notify()
+    return {
+        "success": True,
+        "outputs": entry,
+        "metadata": {"agentmap_batch_id": agentmap_batch_id},
+    }
+
+
+async def unwatch_batch_async(
+    agentmap_batch_id: str, *, config_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Stop watching a batch (the batch itself is not cancelled).
+
+    Raises:
+        BatchNotFound: if the batch is not being watched.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    removed = await asyncio.to_thread(
+        _get_batch_watch_service().unwatch, agentmap_batch_id
+    )
+    if not removed:
+        raise BatchNotFound(agentmap_batch_id, "not watched")
+    return {
+        "success": True,
+        "outputs": {"agentmap_batch_id": agentmap_batch_id, "watched": False},
+        "metadata": {"agentmap_batch_id": agentmap_batch_id},
+    }
+
+
+async def list_watched_batches_async(
+    *, config_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """List watched batches, soonest next poll first."""
+    await ensure_initialized_async(config_file=config_file)
+    watches = await asyncio.to_thread(_get_batch_watch_service().list_watches)
+    return {
+        "success": True,
+        "outputs": {"watches": watches},
+        "metadata": {
+            "count": len(watches),
+            "watcher_running": bool(_batch_watcher and _batch_watcher.is_running),
+        },
+    }
+
+
+async def poll_watched_batches_async(
+    *, force: bool = False, config_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run one watcher pass now: poll due batches and resume completed workflows.
+
+    Args:
+        force: Poll every watched batch, not only those that are due.
+        config_file: Optional configuration file path.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    service = _get_batch_watch_service()
+    completions = await asyncio.to_thread(service.poll_due, force)
+    completed = await _process_completions(completions, config_file)
+    remaining = await asyncio.to_thread(service.list_watches)
+    return {
+        "success": True,
+        "outputs": {"completed": completed, "watching": len(remaining)},
+        "metadata": {"force": force},
+    }
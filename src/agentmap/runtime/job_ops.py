@@ -0,0 +1,421 @@
+"""Queued (asynchronous) workflow execution operations.
+
+``run_workflow_async`` executes a graph inside the caller's request; the
+functions here instead enqueue the execution in the durable
+``JobQueueService`` and return immediately with a job id.  A
+``JobWorkerPool`` — started inside the HTTP server, or standalone via
+``agentmap worker`` so workers scale independently of the API process —
+claims jobs by priority (respecting per-graph concurrency caps), runs them
+through ``run_workflow_async`` and records the result for polling.
+
+Cancellation is cooperative across processes: ``cancel_job_async`` flags a
+running job in the queue, and the worker that owns it observes the flag on
+its next heartbeat and cancels the execution task.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Any, Dict, Optional
+
+from agentmap.exceptions.runtime_exceptions import (
+    AgentMapNotInitialized,
+    GraphNotFound,
+    InvalidInputs,
+    JobNotFound,
+)
+from agentmap.models.execution.job import ExecutionJob, JobStatus
+from agentmap.runtime.runtime_manager import RuntimeManager
+
+from .init_ops import ensure_initialized_async
+from .workflow_ops import run_workflow_async
+
+_logger = logging.getLogger("agentmap.runtime.jobs")
+
+
+def _job_status_for_result(result: Dict[str, Any]) -> JobStatus:
+    """Map a runtime facade payload onto the terminal job status."""
+    if result.get("interrupted"):
+        return JobStatus.SUSPENDED
+    return JobStatus.COMPLETED if result.get("success") else JobStatus.FAILED
+
+
+class JobWorkerPool:
+    """
+    A fixed number of asyncio worker tasks draining the durable job queue.
+
+    Each worker claims one job at a time (the claim itself runs in a thread,
+    as it is blocking SQLite I/O), runs it as a child task, and heartbeats the
+    job every ``poll_interval`` seconds while it runs so that crashed workers
+    can be detected (``JobQueueService.recover_stale``) and cross-process
+    cancel requests are honoured.  Idle workers sleep until ``notify()`` is
+    called (local submit) or ``poll_interval`` elapses (remote submit).
+    """
+
+    def __init__(
+        self,
+        job_queue_service,
+        *,
+        workers: int = 4,
+        poll_interval: float = 1.0,
+        cleanup_interval: float = 300.0,
+        config_file: Optional[str] = None,
+    ) -> None:
+        self._queue = job_queue_service
+        self._num_workers = max(1, int(workers))
+        self._poll_interval = float(poll_interval)
+        self._cleanup_interval = float(cleanup_interval)
+        self._config_file = config_file
+        # Heartbeats happen every poll_interval; a job is only considered
+        # orphaned after many missed beats (and never sooner than 30s).
+        self._stale_after = max(30.0, self._poll_interval * 10)
+        self._pool_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: list = []
+        self._running: Dict[str, asyncio.Task] = {}
+        self._stopping = False
+
+    @property
+    def is_running(self) -> bool:
+        """True between ``start()`` and ``stop()``."""
+        return bool(self._tasks) and not self._stopping
+
+    @property
+    def num_workers(self) -> int:
+        """Number of concurrent worker tasks in this pool."""
+        return self._num_workers
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of jobs currently executing in this pool."""
+        return len(self._running)
+
+    async def start(self) -> None:
+        """Recover orphaned jobs and spawn the worker and cleanup tasks."""
+        if self._tasks:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        await asyncio.to_thread(self._queue.recover_stale, self._stale_after)
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(f"{self._pool_id}/{index}"))
+            for index in range(self._num_workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._maintenance_loop()))
+        _logger.info(
+            "[JobWorkerPool] Started %d worker(s) (pool %s)",
+            self._num_workers,
+            self._pool_id,
+        )
+
+    async def stop(self) -> None:
+        """
+        Stop all workers.
+
+        In-flight executions are cancelled and their jobs are released back
+        to the queue so another worker (or the next start) picks them up.
+        """
+        self._stopping = True
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        _logger.info("[JobWorkerPool] Stopped (pool %s)", self._pool_id)
+
+    def notify(self) -> None:
+        """Wake idle workers after a local submit (no-op when not started)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def cancel_local(self, job_id: str) -> bool:
+        """Cancel ``job_id`` immediately if this pool is executing it."""
+        task = self._running.get(job_id)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    async def _worker_loop(self, worker_id: str) -> None:
+        while not self._stopping:
+            try:
+                job = await asyncio.to_thread(self._queue.claim_next, worker_id)
+            except Exception as e:
+                _logger.error("[JobWorkerPool] Failed to claim a job: %s", e)
+                job = None
+
+            if job is None:
+                await self._wait_for_work()
+                continue
+
+            await self._run_job(job)
+
+    async def _wait_for_work(self) -> None:
+        self._wakeup.clear()
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _run_job(self, job: ExecutionJob) -> None:
+        task = asyncio.create_task(
+            run_workflow_async(
+                graph_name=job.graph_name,
+                inputs=job.inputs,
+                force_create=job.force_create,
+                config_file=self._config_file,
+            )
+        )
+        self._running[job.job_id] = task
+        cancelled_by_request = False
+        try:
+            while not task.done():
+                done, _ = await asyncio.wait({task}, timeout=self._poll_interval)
+                if done:
+                    break
+                if await asyncio.to_thread(self._queue.heartbeat, job.job_id):
+                    cancelled_by_request = True
+                    task.cancel()
+            result = await task
+        except asyncio.CancelledError:
+            if not task.done():
+                task.cancel()
+            if self._stopping and not cancelled_by_request:
+                # Pool shutdown: hand the job back rather than failing it.
+                await asyncio.to_thread(self._queue.release, job.job_id)
+                raise
+            await asyncio.to_thread(
+                self._queue.finish,
+                job.job_id,
+                JobStatus.CANCELLED,
+                error="Cancelled by request",
+            )
+            if self._stopping:
+                raise
+            return
+        except (GraphNotFound, InvalidInputs, AgentMapNotInitialized) as e:
+            await asyncio.to_thread(
+                self._queue.finish, job.job_id, JobStatus.FAILED, error=str(e)
+            )
+            return
+        except Exception as e:
+            _logger.error("[JobWorkerPool] Job %s failed: %s", job.job_id, e)
+            await asyncio.to_thread(
+                self._queue.finish,
+                job.job_id,
+                JobStatus.FAILED,
+                error=f"{type(e).__name__}: {e}",
+            )
+            return
+        finally:
+            self._running.pop(job.job_id, None)
+
+        await asyncio.to_thread(
+            self._queue.finish,
+            job.job_id,
+            _job_status_for_result(result),
+            result=result,
+            error=result.get("error"),
+        )
+
+    async def _maintenance_loop(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.to_thread(self._queue.purge_expired)
+                await asyncio.to_thread(self._queue.recover_stale, self._stale_after)
+            except Exception as e:
+                _logger.warning("[JobWorkerPool] Maintenance pass failed: %s", e)
+            await asyncio.sleep(self._cleanup_interval)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide pool (one per process, like the async facade semaphore).
+# ---------------------------------------------------------------------------
+
+_job_worker_pool: Optional[JobWorkerPool] = None
+
+
+def get_job_worker_pool() -> Optional[JobWorkerPool]:
+    """Return the pool started in this process, or ``None``."""
+    return _job_worker_pool
+
+
+def _get_job_queue_service():
+    return RuntimeManager.get_container().job_queue_service()
+
+
+async def start_job_workers(
+    *,
+    config_file: Optional[str] = None,
+    workers: Optional[int] = None,
+) -> JobWorkerPool:
+    """
+    Start this process's job worker pool (idempotent).
+
+    Args:
+        config_file: Optional configuration file path.
+        workers: Override for ``execution.job_queue.workers``.
+
+    Returns:
+        The running ``JobWorkerPool``.
+    """
+    global _job_worker_pool
+    await ensure_initialized_async(config_file=config_file)
+    if _job_worker_pool is not None and _job_worker_pool.is_running:
+        return _job_worker_pool
+
+    container = RuntimeManager.get_container()
+    job_config = container.app_config_service().get_job_queue_config()
+    _job_worker_pool = JobWorkerPool(
+        container.job_queue_service(),
+        workers=workers or job_config["workers"],
+        poll_interval=job_config["poll_interval_seconds"],
+        cleanup_interval=job_config["cleanup_interval_seconds"],
+        config_file=config_file,
+    )
+    await _job_worker_pool.start()
+    return _job_worker_pool
+
+
+async def stop_job_workers() -> None:
+    """Stop this process's job worker pool if one is running."""
+    global _job_worker_pool
+    pool, _job_worker_pool = _job_worker_pool, None
+    if pool is not None:
+        await pool.stop()
+
+
+def _job_response(job: ExecutionJob, **metadata: Any) -> Dict[str, Any]:
+    return {
+        "success": True,
+        "outputs": job.to_dict(),
+        "metadata": {"job_id": job.job_id, **metadata},
+    }
+
+
+async def submit_job_async(
+    graph_name: str,
+    inputs: Dict[str, Any],
+    *,
+    priority: int = 0,
+    execution_id: Optional[str] = None,
+    force_create: bool = False,
+    config_file: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Enqueue a workflow execution and return immediately.
+
+    Args:
+        graph_name: The name or identifier of the graph to run.
+        inputs: Dict of input values for the graph.
+        priority: Higher values are claimed first.
+        execution_id: Optional client supplied tracking identifier.
+        force_create: Force recreation of the bundle when the job runs.
+        config_file: Optional configuration file path.
+
+    Returns:
+        Dict whose ``outputs`` is the queued job record.
+
+    Raises:
+        InvalidInputs: if the graph identifier or inputs are malformed.
+        AgentMapNotInitialized: if runtime has not been initialized.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    if not graph_name or not graph_name.strip():
+        raise InvalidInputs("Graph identifier cannot be empty")
+    if not isinstance(inputs, dict):
+        raise InvalidInputs("Job inputs must be a mapping")
+
+    job = await asyncio.to_thread(
+        _get_job_queue_service().submit,
+        graph_name,
+        inputs,
+        priority=priority,
+        execution_id=execution_id,
+        force_create=force_create,
+    )
+    if _job_worker_pool is not None:
+        _job_worker_pool.notify()
+    return _job_response(job, submitted_at=time.time())
+
+
+async def get_job_async(
+    job_id: str, *, config_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Return the current record (status, and result once finished) for a job.
+
+    Raises:
+        JobNotFound: if the job is unknown or its result has expired.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    job = await asyncio.to_thread(_get_job_queue_service().get, job_id)
+    if job is None:
+        raise JobNotFound(job_id)
+    return _job_response(job)
+
+
+async def cancel_job_async(
+    job_id: str, *, config_file: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Cancel a queued or running job.
+
+    Queued jobs are cancelled immediately; running jobs are cancelled by
+    their worker on its next heartbeat (immediately when the worker lives in
+    this process).  Cancelling a finished job is a no-op.
+
+    Raises:
+        JobNotFound: if the job is unknown or its result has expired.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    job = await asyncio.to_thread(_get_job_queue_service().request_cancel, job_id)
+    if job is None:
+        raise JobNotFound(job_id)
+    if (
+        job.status == JobStatus.RUNNING
+        and _job_worker_pool is not None
+        and _job_worker_pool.cancel_local(job_id)
+    ):
+        job.cancel_requested = True
+    return _job_response(job, cancel_requested=job.cancel_requested)
+
+
+async def list_jobs_async(
+    *,
+    status: Optional[str] = None,
+    graph_name: Optional[str] = None,
+    limit: int = 100,
+    offset: int = 0,
+    config_file: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    List jobs, newest first, with per-status counts for the whole queue.
+
+    Raises:
+        InvalidInputs: if ``status`` is not a known job status.
+    """
+    await ensure_initialized_async(config_file=config_file)
+    if status is not None and status not in {s.value for s in JobStatus}:
+        raise InvalidInputs(
+            f"Unknown job status '{status}'. "
+            f"Valid statuses: {', '.join(s.value for s in JobStatus)}"
+        )
+    queue = _get_job_queue_service()
+    jobs = await asyncio.to_thread(
+        queue.list_jobs,
+        status=status,
+        graph_name=graph_name,
+        limit=limit,
+        offset=offset,
+    )
+    counts = await asyncio.to_thread(queue.count_by_status)
+    return {
+        "success": True,
+        "outputs": {
+            "jobs": [job.to_dict() for job in jobs],
+            "counts": counts,
+        },
+        "metadata": {"limit": limit, "offset": offset},
+    }
@@ -0,0 +1,240 @@
+"""
+Startup profiling: import-time and DI construction cost of a cold start.
+
+Measurements run in a fresh interpreter (``python -X importtime``) because the
+calling process has usually imported most of AgentMap already. The child
+imports ``agentmap.runtime_api``, builds the DI container with
+``initialize_di`` and resolves a list of providers one at a time, so each
+provider's time is the incremental cost of constructing it (and whatever
+dependencies it is the first to need).
+
+Used by ``agentmap diagnose --startup`` and by the startup benchmark in
+``tests/benchmark/test_startup_time.py``.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Providers whose construction time is reported by default: the core services
+# plus the heavy LLM / storage / telemetry / graph stacks.
+DEFAULT_PROFILE_PROVIDERS = (
+    "app_config_service",
+    "logging_service",
+    "availability_cache_service",
+    "telemetry_service",
+    "declaration_registry_service",
+    "features_registry_service",
+    "dependency_checker_service",
+    "storage_service_manager",
+    "llm_service",
+    "graph_bundle_service",
+    "graph_runner_service",
+)
+
+# Third-party packages that `import agentmap.runtime_api` must not pull in;
+# they are imported lazily by the services that need them.
+HEAVY_MODULES = frozenset(
+    {
+        "pandas",
+        "langgraph",
+        "langchain",
+        "langchain_core",
+        "langchain_openai",
+        "langchain_anthropic",
+        "langchain_google_genai",
+        "openai",
+        "anthropic",
+        "opentelemetry.sdk",
+    }
+)
+
+_RESULT_MARKER = "__AGENTMAP_STARTUP_PROFILE__"
+
+_CHILD_SCRIPT = """
+import json, sys, time
+config_file, provider_names, heavy_modules = json.loads(sys.argv[1])
+started = time.perf_counter()
+import agentmap.runtime_api
+imported = time.perf_counter()
+heavy_loaded = sorted(m for m in heavy_modules if m in sys.modules)
+from agentmap.di import initialize_di
+container = initialize_di(config_file)
+built = time.perf_counter()
+providers = []
+for name in provider_names:
+    t0 = time.perf_counter()
+    error = None
+    try:
+        getattr(container, name)()
+    except Exception as exc:
+        error = f"{type(exc).__name__}: {exc}"
+    providers.append({"name": name, "ms": (time.perf_counter() - t0) * 1000, "error": error})
+print(%r + json.dumps({
+    "runtime_api_import_ms": (imported - started) * 1000,
+    "container_build_ms": (built - imported) * 1000,
+    "heavy_modules_loaded": heavy_loaded,
+    "providers": providers,
+}), flush=True)
+""" % (_RESULT_MARKER,)
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """
+    Parse ``python -X importtime`` output into per-module records.
+
+    Returns:
+        One dict per module with ``module``, ``self_ms``, ``cumulative_ms``
+        and ``depth`` (nesting level in the import tree).
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+            self_us = int(self_us)
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            continue  # header line ("self [us] | cumulative | imported package")
+        stripped = name.rstrip()
+        module = stripped.lstrip()
+        records.append(
+            {
+                "module": module,
+                "self_ms": self_us / 1000,
+                "cumulative_ms": cumulative_us / 1000,
+                "depth": (len(stripped) - len(module) - 1) // 2,
+            }
+        )
+    return records
+
+
+def profile_startup(
+    *,
+    config_file: Optional[str] = None,
+    providers: Optional[Sequence[str]] = None,
+    top: int = 25,
+    timeout: float = 300.0,
+) -> Dict[str, Any]:
+    """
+    Profile a cold start in a fresh interpreter.
+
+    Args:
+        config_file: Optional configuration file path for ``initialize_di``.
+        providers: Container providers to construct (default
+            ``DEFAULT_PROFILE_PROVIDERS``).
+        top: Number of modules to keep in each ranked import list.
+        timeout: Seconds to wait for the child interpreter.
+
+    Returns:
+        Dict whose ``outputs`` hold ``runtime_api_import_ms``,
+        ``container_build_ms``, ``providers`` (ranked by time),
+        ``top_imports_cumulative`` (top-level packages ranked by cumulative
+        time), ``top_imports_self`` and ``heavy_modules_loaded``.
+
+    Raises:
+        RuntimeError: If the child interpreter fails or reports no result.
+    """
+    provider_names = list(providers or DEFAULT_PROFILE_PROVIDERS)
+    env = dict(os.environ)
+    src_root = str(Path(__file__).resolve().parents[2])
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (src_root, env.get("PYTHONPATH")) if p
+    )
+
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            _CHILD_SCRIPT,
+            json.dumps([config_file, provider_names, sorted(HEAVY_MODULES)]),
+        ],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        env=env,
+    )
+
+    result = None
+    for line in completed.stdout.splitlines():
+        if line.startswith(_RESULT_MARKER):
+            result = json.loads(line[len(_RESULT_MARKER) :])
+    if completed.returncode != 0 or result is None:
+        tail = "\n".join(completed.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(
+            f"Startup profiling subprocess failed (exit {completed.returncode}): {tail}"
+        )
+
+    imports = parse_importtime(completed.stderr)
+    # Only the first time a top-level package appears is its real cost.
+    top_level: Dict[str, Dict[str, Any]] = {}
+    for record in imports:
+        root = record["module"].split(".", 1)[0]
+        current = top_level.get(root)
+        if current is None or record["cumulative_ms"] > current["cumulative_ms"]:
+            top_level[root] = {"module": root, "cumulative_ms": record["cumulative_ms"]}
+
+    profile = {
+        "python": sys.version.split()[0],
+        "runtime_api_import_ms": round(result["runtime_api_import_ms"], 1),
+        "container_build_ms": round(result["container_build_ms"], 1),
+        "total_import_ms": round(sum(r["self_ms"] for r in imports), 1),
+        "module_count": len(imports),
+        "providers": sorted(result["providers"], key=lambda p: p["ms"], reverse=True),
+        "top_imports_cumulative": sorted(
+            top_level.values(), key=lambda r: r["cumulative_ms"], reverse=True
+        )[:top],
+        "top_imports_self": sorted(imports, key=lambda r: r["self_ms"], reverse=True)[
+            :top
+        ],
+        "heavy_modules_loaded": result["heavy_modules_loaded"],
+    }
+    return {
+        "success": True,
+        "outputs": profile,
+        "metadata": {"config_file": config_file, "providers": provider_names},
+    }
+
+
+def write_startup_baseline(profile: Dict[str, Any], path: str) -> Dict[str, Any]:
+    """Write the timing fields of ``profile`` as a baseline JSON file."""
+    baseline = {
+        "python": profile["python"],
+        "runtime_api_import_ms": profile["runtime_api_import_ms"],
+        "container_build_ms": profile["container_build_ms"],
+        "providers": {p["name"]: round(p["ms"], 1) for p in profile["providers"]},
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return baseline
+
+
+def compare_to_baseline(
+    profile: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.5
+) -> List[str]:
+    """
+    List startup regressions relative to a baseline.
+
+    A metric regresses when it exceeds ``baseline * (1 + tolerance)``;
+    tolerance is generous because wall-clock import time is noisy.
+
+    Returns:
+        Human-readable regression descriptions (empty if none).
+    """
+    regressions = []
+    for key in ("runtime_api_import_ms", "container_build_ms"):
+        limit = baseline.get(key)
+        if limit is not None and profile[key] > limit * (1 + tolerance):
+            regressions.append(
+                f"{key}: {profile[key]:.1f} ms > baseline {limit:.1f} ms "
+                f"(+{tolerance:.0%} allowed)"
+            )
+    return regressions
@@ -76,6 +76,81 @@ def refresh_cache(
         raise RuntimeError(f"Failed to refresh cache: {e}")
 
 
+def warmup(
+    *,
+    rebuild: bool = True,
+    config_file: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Build the warm-start snapshot so later processes start without recomputing.
+
+    Intended for deploy pipelines (``agentmap warmup``): loads the declaration
+    registry (persisting it to the snapshot) and validates LLM and storage
+    providers, priming the unified availability cache, which persists and
+    reloads availability on its own.
+
+    Args:
+        rebuild: Discard any existing snapshot first (default True).
+        config_file: Optional configuration file path.
+
+    Returns:
+        Dict containing snapshot info, section timings and availability results.
+
+    Raises:
+        AgentMapNotInitialized: if runtime has not been initialized.
+    """
+    import time
+
+    from .init_ops import ensure_initialized
+    from .runtime_manager import RuntimeManager
+
+    ensure_initialized(config_file=config_file)
+
+    try:
+        container = RuntimeManager.get_container()
+        snapshot = container.warm_start_snapshot_service()
+        if not snapshot.enabled:
+            return {
+                "success": False,
+                "outputs": {"snapshot": snapshot.get_snapshot_info()},
+                "metadata": {
+                    "reason": "warm_start.enabled is false; set it to true to "
+                    "use the snapshot"
+                },
+            }
+        if rebuild:
+            snapshot.invalidate()
+
+        timings: Dict[str, float] = {}
+
+        started = time.perf_counter()
+        registry = container.declaration_registry_service()
+        registry.load_all()
+        timings["declarations"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        dependency_checker = container.dependency_checker_service()
+        llm_results = dependency_checker.discover_and_validate_providers("llm")
+        storage_results = dependency_checker.discover_and_validate_providers("storage")
+        timings["availability"] = time.perf_counter() - started
+
+        return {
+            "success": True,
+            "outputs": {
+                "snapshot": snapshot.get_snapshot_info(),
+                "agents": len(registry.get_all_agent_types()),
+                "services": len(registry.get_all_service_names()),
+                "llm_results": llm_results,
+                "storage_results": storage_results,
+                "timings": timings,
+            },
+            "metadata": {"rebuild": rebuild},
+        }
+
+    except Exception as e:
+        raise RuntimeError(f"Failed to build warm-start snapshot: {e}")
+
+
 def validate_cache(
     *,
     clear: bool = False,
@@ -454,9 +529,16 @@ def get_health(*, config_file: Optional[str] = None) -> Dict[str, Any]:
         except Exception:
             status = "degraded"
 
+        outputs = {"status": status, "initialized": True}
+        try:
+            # Executor pool saturation (active/queued per named pool)
+            outputs["executors"] = container.execution_pool_service().get_metrics()
+        except Exception:
+            pass
+
         return {
             "success": True,
-            "outputs": {"status": status, "initialized": True},
+            "outputs": outputs,
             "metadata": {"config_file": config_file},
         }
     except Exception as e:
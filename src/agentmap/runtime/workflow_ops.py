@@ -5,7 +5,7 @@ import json
 import os
 import threading
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, NoReturn, Optional
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, NoReturn, Optional
 
 from agentmap.exceptions.agent_exceptions import ExecutionInterruptedException
 from agentmap.exceptions.runtime_exceptions import (
@@ -15,11 +15,15 @@ from agentmap.exceptions.runtime_exceptions import (
 )
 from agentmap.exceptions.validation_exceptions import ValidationException
 from agentmap.runtime.runtime_manager import RuntimeManager
-from agentmap.services.graph.graph_bundle_service import GraphBundleService
-from agentmap.services.graph.graph_runner_service import GraphRunnerService
 
 from .init_ops import ensure_initialized, ensure_initialized_async
 
+if TYPE_CHECKING:
+    # Annotation-only: importing these at module load pulls in langgraph,
+    # langchain and pandas for every `import agentmap.runtime_api`.
+    from agentmap.services.graph.graph_bundle_service import GraphBundleService
+    from agentmap.services.graph.graph_runner_service import GraphRunnerService
+
 
 def _resolve_csv_path(graph_identifier: str, container) -> tuple[Path, str]:
     """
@@ -202,18 +206,40 @@ def run_workflow(
 
 
 def list_graphs(
-    *, profile: Optional[str] = None, config_file: Optional[str] = None
+    *,
+    profile: Optional[str] = None,
+    config_file: Optional[str] = None,
+    search: Optional[str] = None,
+    agent_type: Optional[str] = None,
+    workflow: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     List available graphs in the configured graph store.
 
+    Served from the workflow catalog, which only re-reads CSVs that changed
+    since the last call.
+
     Args:
         profile: Optional profile/environment.
         config_file: Optional configuration file path.
+        search: Case-insensitive substring of the graph or workflow name.
+        agent_type: Only graphs that use this agent type.
+        workflow: Only graphs from this workflow (e.g. "sub/orders").
+        offset: Number of matching graphs to skip.
+        limit: Maximum number of graphs to return (None for all).
 
     Returns:
-        Dict containing structured list of graphs with metadata.
+        Dict containing structured list of graphs with metadata;
+        ``total_count`` counts all matches, before offset/limit.
+
+    Raises:
+        InvalidInputs: if offset or limit is negative.
     """
+    if offset < 0 or (limit is not None and limit < 0):
+        raise InvalidInputs("offset and limit must not be negative")
+
     # Ensure runtime is initialized
     ensure_initialized(config_file=config_file)
 
@@ -221,89 +247,26 @@ def list_graphs(
         # Get services from RuntimeManager
         container = RuntimeManager.get_container()
         app_config_service = container.app_config_service()
+        catalog_service = container.workflow_catalog_service()
 
         # Get CSV repository path
         csv_repository = app_config_service.get_csv_repository_path()
 
-        graphs = []
-
-        if csv_repository.exists():
-            # Find all CSV files (workflows), including subfolders
-            csv_files = list(csv_repository.glob("**/*.csv"))
-
-            for csv_file in csv_files:
-                try:
-                    # Get basic file info
-                    file_stat = csv_file.stat()
-                    # Compute workflow name as relative path without .csv extension
-                    # e.g. "testgraph" for top-level, "subfolder/testgraph" for nested
-                    relative = csv_file.relative_to(csv_repository)
-                    workflow_name = str(relative.with_suffix("")).replace("\\", "/")
-
-                    # Try to get graph count using pandas for performance
-                    graph_count = 0
-                    total_nodes = 0
-                    graph_names = []
-
-                    try:
-                        import pandas as pd
-
-                        df = pd.read_csv(csv_file)
-
-                        if "GraphName" in df.columns:
-                            unique_graphs = df["GraphName"].dropna().unique()
-                            graph_count = len(unique_graphs)
-                            graph_names = unique_graphs.tolist()
-
-                        total_nodes = len(df)
-
-                    except Exception:
-                        # If parsing fails, just use workflow name as single graph
-                        graph_count = 1
-                        graph_names = [workflow_name]
-
-                    # Create entries for each graph in the workflow
-                    if graph_names:
-                        for graph_name in graph_names:
-                            graphs.append(
-                                _graph_entry(
-                                    csv_file,
-                                    file_stat,
-                                    workflow_name,
-                                    graph_name,
-                                    total_nodes,
-                                    graph_count,
-                                    profile,
-                                    csv_repository,
-                                )
-                            )
-                    else:
-                        # Fallback: use workflow name as graph name
-                        graphs.append(
-                            _graph_entry(
-                                csv_file,
-                                file_stat,
-                                workflow_name,
-                                workflow_name,
-                                total_nodes,
-                                1,
-                                profile,
-                                csv_repository,
-                            )
-                        )
-
-                except Exception:
-                    # Skip files that can't be processed
-                    continue
-
-        # Sort by name for consistent ordering
-        graphs.sort(key=lambda g: g["name"])
+        graphs = [
+            _graph_entry(record, profile, csv_repository)
+            for record in catalog_service.find_graphs(
+                search=search, agent_type=agent_type, workflow=workflow
+            )
+        ]
+        page_end = None if limit is None else offset + limit
 
         return {
             "success": True,
             "outputs": {
-                "graphs": graphs,
+                "graphs": graphs[offset:page_end],
                 "total_count": len(graphs),
+                "offset": offset,
+                "limit": limit,
             },
             "metadata": {
                 "profile": profile,
@@ -588,26 +551,19 @@ def validate_workflow(
         raise RuntimeError(f"Unexpected error during validation: {e}")
 
 
-def _graph_entry(
-    csv_file,
-    file_stat,
-    workflow_name,
-    graph_name,
-    total_nodes,
-    graph_count,
-    profile,
-    csv_repository,
-):
-    """Create a graph entry dictionary."""
+def _graph_entry(record, profile, csv_repository):
+    """Create a graph entry dictionary from a workflow catalog record."""
     return {
-        "name": graph_name,
-        "workflow": workflow_name,
-        "filename": csv_file.name,
-        "file_path": str(csv_file),
-        "file_size": file_stat.st_size,
-        "last_modified": file_stat.st_mtime,
-        "total_nodes": total_nodes,
-        "graph_count_in_workflow": graph_count,
+        "name": record["graph_name"],
+        "workflow": record["workflow"],
+        "filename": record["filename"],
+        "file_path": record["file_path"],
+        "file_size": record["file_size"],
+        "last_modified": record["last_modified"],
+        "total_nodes": record["total_nodes"],
+        "graph_count_in_workflow": record["graph_count"],
+        "node_count": record["node_count"],
+        "agent_types": record["agent_types"],
         "meta": {
             "type": "csv_workflow",
             "repository_path": str(csv_repository),
@@ -1180,14 +1136,35 @@ def _get_async_facade_semaphore() -> asyncio.Semaphore:
 
 
 async def list_graphs_async(
-    *, profile: Optional[str] = None, config_file: Optional[str] = None
+    *,
+    profile: Optional[str] = None,
+    config_file: Optional[str] = None,
+    search: Optional[str] = None,
+    agent_type: Optional[str] = None,
+    workflow: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
 ) -> Dict[str, Any]:
     """Async sibling of list_graphs.  Isolates filesystem scanning in a thread."""
+    # Only forward the filters actually given, so the call matches the
+    # plain list_graphs(profile=, config_file=) shape when there are none.
+    filters = {
+        name: value
+        for name, value in (
+            ("search", search),
+            ("agent_type", agent_type),
+            ("workflow", workflow),
+            ("offset", offset or None),
+            ("limit", limit),
+        )
+        if value is not None
+    }
     async with _get_async_facade_semaphore():
         return await asyncio.to_thread(
             list_graphs,
             profile=profile,
             config_file=config_file,
+            **filters,
         )
 
 
@@ -8,17 +8,35 @@ from any launch point (CLI, serverless adapters, embedded apps).
 It re-exports the public functions from the split runtime modules.
 """
 
+from .runtime.batch_ops import (
+    list_watched_batches_async,
+    poll_watched_batches_async,
+    start_batch_watcher,
+    stop_batch_watcher,
+    unwatch_batch_async,
+    watch_batch_async,
+)
 from .runtime.bundle_ops import scaffold_agents, update_bundle
 from .runtime.init_ops import (
     ensure_initialized,
     ensure_initialized_async,
     get_container,
 )
+from .runtime.job_ops import (
+    cancel_job_async,
+    get_job_async,
+    list_jobs_async,
+    start_job_workers,
+    stop_job_workers,
+    submit_job_async,
+)
+from .runtime.startup_ops import profile_startup
 from .runtime.system_ops import (
     diagnose_system,
     get_config,
     refresh_cache,
     validate_cache,
+    warmup,
 )
 from .runtime.workflow_ops import (
     inspect_graph,
@@ -53,10 +71,24 @@ __all__ = [
     "inspect_graph_async",
     "validate_workflow",
     "validate_workflow_async",
+    "submit_job_async",
+    "get_job_async",
+    "cancel_job_async",
+    "list_jobs_async",
+    "start_job_workers",
+    "stop_job_workers",
+    "watch_batch_async",
+    "unwatch_batch_async",
+    "list_watched_batches_async",
+    "poll_watched_batches_async",
+    "start_batch_watcher",
+    "stop_batch_watcher",
     "update_bundle",
     "scaffold_agents",
     "refresh_cache",
     "validate_cache",
+    "warmup",
+    "profile_startup",
     "get_config",
     "diagnose_system",
 ]
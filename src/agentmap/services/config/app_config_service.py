@@ -205,6 +205,130 @@ class AppConfigService:
         """
         return self._llm_manager.get_pricing_config()
 
+    def get_llm_budget_ledger_config(self) -> Dict[str, Any]:
+        """Get the built-in LLM budget ledger configuration.
+
+        Reads ``llm.budget_ledger``:
+
+          enabled                  — register LocalBudgetLedger as the budget guard
+          path                     — SQLite ledger file
+                                     (default ``<paths.cache>/llm_budget_ledger.sqlite3``)
+          limits                   — list of {daily_limit, tenant?, graph?}
+          reservation_ttl_seconds  — how long an unsettled reservation counts
+          default_output_tokens    — output bound when a call reports none
+          chars_per_token          — input-size to token estimate
+          unpriced                 — ``allow`` or ``deny`` calls with no price
+
+        Raises:
+            ConfigurationException: If the section, a limit or a numeric
+                setting is invalid.
+        """
+        defaults = {
+            "enabled": False,
+            "path": str(self.get_cache_path() / "llm_budget_ledger.sqlite3"),
+            "limits": [],
+            "reservation_ttl_seconds": 900.0,
+            "default_output_tokens": 1024,
+            "chars_per_token": 4.0,
+            "unpriced": "allow",
+        }
+        ledger_config = self.get_value("llm.budget_ledger", {})
+        if not isinstance(ledger_config, dict):
+            raise ConfigurationException(
+                "Invalid llm.budget_ledger configuration: expected a mapping, "
+                f"got {type(ledger_config).__name__} ({ledger_config!r})."
+            )
+        merged = self._merge_with_defaults(ledger_config, defaults)
+
+        enabled = merged.get("enabled")
+        if isinstance(enabled, str):
+            enabled = enabled.strip().lower() in ("1", "true", "yes", "on")
+        merged["enabled"] = bool(enabled)
+        merged["path"] = str(merged.get("path") or defaults["path"])
+
+        for key in (
+            "reservation_ttl_seconds",
+            "default_output_tokens",
+            "chars_per_token",
+        ):
+            value = self._coerce_sse_numeric(merged.get(key))
+            if value is None or not math.isfinite(value) or value <= 0:
+                raise ConfigurationException(
+                    f"Invalid llm.budget_ledger.{key}: {merged.get(key)!r} "
+                    "must be a finite number > 0."
+                )
+            merged[key] = value
+        merged["default_output_tokens"] = int(merged["default_output_tokens"])
+
+        if merged.get("unpriced") not in ("allow", "deny"):
+            raise ConfigurationException(
+                "Invalid llm.budget_ledger.unpriced: "
+                f"{merged.get('unpriced')!r} must be 'allow' or 'deny'."
+            )
+
+        limits = merged.get("limits") or []
+        if not isinstance(limits, list):
+            raise ConfigurationException(
+                "Invalid llm.budget_ledger.limits: expected a list, "
+                f"got {type(limits).__name__}."
+            )
+        for i, limit in enumerate(limits):
+            daily = (
+                self._coerce_sse_numeric(limit.get("daily_limit"))
+                if isinstance(limit, dict)
+                else None
+            )
+            if daily is None or not math.isfinite(daily) or daily < 0:
+                raise ConfigurationException(
+                    f"Invalid llm.budget_ledger.limits[{i}]: {limit!r} needs a "
+                    "finite daily_limit >= 0."
+                )
+        merged["limits"] = limits
+        return merged
+
+    def get_llm_memory_config(self) -> Dict[str, Any]:
+        """Get the segment store configuration for token-aware LLM memory.
+
+        Reads ``llm.memory``:
+
+          segment_dir          — JSONL segment directory
+                                 (default ``<paths.cache>/memory_segments``)
+          segment_ttl_seconds  — delete segments not written for this long
+                                 (0 = no expiry)
+          max_segment_files    — keep at most this many segments, oldest
+                                 deleted first (0 = unbounded)
+
+        Raises:
+            ConfigurationException: If ``llm.memory`` is not a mapping or a
+                numeric setting is non-numeric or negative.
+        """
+        defaults = {
+            "segment_dir": str(self.get_cache_path() / "memory_segments"),
+            "segment_ttl_seconds": 7 * 86400,
+            "max_segment_files": 10000,
+        }
+        memory_config = self.get_value("llm.memory", {})
+        if not isinstance(memory_config, dict):
+            raise ConfigurationException(
+                "Invalid llm.memory configuration: expected a mapping, "
+                f"got {type(memory_config).__name__} ({memory_config!r})."
+            )
+        merged = self._merge_with_defaults(memory_config, defaults)
+        merged["segment_dir"] = str(
+            merged.get("segment_dir") or defaults["segment_dir"]
+        )
+
+        for key in ("segment_ttl_seconds", "max_segment_files"):
+            value = self._coerce_sse_numeric(merged.get(key))
+            if value is None or not math.isfinite(value) or value < 0:
+                raise ConfigurationException(
+                    f"Invalid llm.memory.{key}: {merged.get(key)!r} "
+                    "must be a finite number >= 0."
+                )
+            merged[key] = value
+        merged["max_segment_files"] = int(merged["max_segment_files"])
+        return merged
+
     # Routing accessors
     def get_routing_config(self) -> Dict[str, Any]:
         """Get the routing configuration with default values."""
@@ -303,6 +427,375 @@ class AppConfigService:
 
         return self._merge_with_defaults(validation_config, defaults)
 
+    def get_job_queue_config(self) -> Dict[str, Any]:
+        """Get the queued-execution (job queue / worker pool) configuration.
+
+        Reads ``execution.job_queue``:
+
+          db_path                   — SQLite file holding the durable queue
+          workers                   — asyncio worker tasks per worker pool
+          poll_interval_seconds     — idle poll / cancel-check cadence
+          result_ttl_seconds        — retention of finished job results
+          cleanup_interval_seconds  — how often expired results are purged
+          max_concurrent_per_graph  — default per-graph running cap (0 = none)
+          graph_limits              — per-graph overrides of that cap
+          max_attempts              — claims before a job whose worker died
+                                      is failed instead of re-queued
+          start_with_server         — run a worker pool inside the HTTP server
+                                      (off by default; run ``agentmap worker``)
+
+        Raises:
+            ConfigurationException: If ``execution.job_queue`` is not a mapping
+                or a numeric setting is non-numeric or out of range.
+        """
+        defaults = {
+            "db_path": "agentmap_data/jobs/jobs.db",
+            "workers": 4,
+            "poll_interval_seconds": 1.0,
+            "result_ttl_seconds": 86400,
+            "cleanup_interval_seconds": 300,
+            "max_concurrent_per_graph": 0,
+            "graph_limits": {},
+            "max_attempts": 3,
+            "start_with_server": False,
+        }
+
+        job_config = self.get_value("execution.job_queue", {})
+        if not isinstance(job_config, dict):
+            raise ConfigurationException(
+                "Invalid execution.job_queue configuration: expected a mapping, "
+                f"got {type(job_config).__name__} ({job_config!r})."
+            )
+
+        merged = self._merge_with_defaults(job_config, defaults)
+        for key, min_allowed in (
+            ("workers", 1),
+            ("poll_interval_seconds", 0.01),
+            ("result_ttl_seconds", 0),
+            ("cleanup_interval_seconds", 1),
+            ("max_concurrent_per_graph", 0),
+            ("max_attempts", 1),
+        ):
+            numeric_value = self._coerce_sse_numeric(merged.get(key))
+            if (
+                numeric_value is None
+                or not math.isfinite(numeric_value)
+                or numeric_value < min_allowed
+            ):
+                raise ConfigurationException(
+                    f"Invalid execution.job_queue.{key}: {merged.get(key)!r} must "
+                    f"be a finite number >= {min_allowed}."
+                )
+            merged[key] = numeric_value
+        for key in (
+            "workers",
+            "result_ttl_seconds",
+            "max_concurrent_per_graph",
+            "max_attempts",
+        ):
+            merged[key] = int(merged[key])
+
+        if not isinstance(merged["graph_limits"], dict):
+            raise ConfigurationException(
+                "Invalid execution.job_queue.graph_limits: expected a mapping of "
+                "graph name -> max concurrent jobs."
+            )
+        merged["graph_limits"] = self._coerce_graph_limits(
+            "execution.job_queue.graph_limits", merged["graph_limits"]
+        )
+        return merged
+
+    def _coerce_graph_limits(
+        self, path: str, graph_limits: Dict[Any, Any]
+    ) -> Dict[str, int]:
+        """Validate a graph name -> concurrency cap mapping (caps >= 0).
+
+        Raises:
+            ConfigurationException: If a cap is non-numeric or negative.
+        """
+        coerced = {}
+        for name, limit in graph_limits.items():
+            value = self._coerce_sse_numeric(limit)
+            if value is None or not math.isfinite(value) or value < 0:
+                raise ConfigurationException(
+                    f"Invalid {path}.{name}: {limit!r} must be a finite number >= 0."
+                )
+            coerced[str(name)] = int(value)
+        return coerced
+
+    def get_batch_watch_config(self) -> Dict[str, Any]:
+        """Get the LLM batch watcher configuration.
+
+        Reads ``llm.batch_watch``:
+
+          poll_interval_seconds      — first poll delay for a newly watched batch
+          max_poll_interval_seconds  — cap of the per-batch exponential backoff
+          tick_seconds               — how often the watcher checks for due batches
+          watchlist_path             — JSON file persisting watched batch ids
+                                       (default ``<llm.batch_dir>/watchlist.json``)
+          start_with_server          — run the watcher inside the HTTP server
+                                       (off by default; run ``agentmap batches run``)
+
+        Raises:
+            ConfigurationException: If ``llm.batch_watch`` is not a mapping or
+                an interval is non-numeric or not positive.
+        """
+        batch_dir = self.get_value("llm.batch_dir", "agentmap_data/llm_batches")
+        defaults = {
+            "poll_interval_seconds": 30.0,
+            "max_poll_interval_seconds": 600.0,
+            "tick_seconds": 5.0,
+            "watchlist_path": os.path.join(batch_dir, "watchlist.json"),
+            "start_with_server": False,
+        }
+
+        watch_config = self.get_value("llm.batch_watch", {})
+        if not isinstance(watch_config, dict):
+            raise ConfigurationException(
+                "Invalid llm.batch_watch configuration: expected a mapping, "
+                f"got {type(watch_config).__name__} ({watch_config!r})."
+            )
+
+        merged = self._merge_with_defaults(watch_config, defaults)
+        for key in (
+            "poll_interval_seconds",
+            "max_poll_interval_seconds",
+            "tick_seconds",
+        ):
+            numeric_value = self._coerce_sse_numeric(merged.get(key))
+            if (
+                numeric_value is None
+                or not math.isfinite(numeric_value)
+                or numeric_value <= 0
+            ):
+                raise ConfigurationException(
+                    f"Invalid llm.batch_watch.{key}: {merged.get(key)!r} must be "
+                    "a finite number > 0."
+                )
+            merged[key] = float(numeric_value)
+        merged["max_poll_interval_seconds"] = max(
+            merged["max_poll_interval_seconds"], merged["poll_interval_seconds"]
+        )
+        return merged
+
+    def get_workflow_catalog_config(self) -> Dict[str, Any]:
+        """Get the workflow catalog configuration.
+
+        Reads ``workflow_catalog``:
+
+          watch                  — refresh the catalog from a background
+                                   poller instead of on every listing call
+          poll_interval_seconds  — how often the poller rescans the repository
+          catalog_path           — JSON file persisting the catalog
+                                   (default ``<paths.cache>/workflow_catalog.json``)
+
+        Raises:
+            ConfigurationException: If ``workflow_catalog`` is not a mapping or
+                the poll interval is non-numeric or not positive.
+        """
+        default_path = str(self.get_cache_path() / "workflow_catalog.json")
+        defaults = {
+            "watch": False,
+            "poll_interval_seconds": 5.0,
+            "catalog_path": default_path,
+        }
+
+        catalog_config = self.get_value("workflow_catalog", {})
+        if not isinstance(catalog_config, dict):
+            raise ConfigurationException(
+                "Invalid workflow_catalog configuration: expected a mapping, "
+                f"got {type(catalog_config).__name__} ({catalog_config!r})."
+            )
+
+        merged = self._merge_with_defaults(catalog_config, defaults)
+        interval = self._coerce_sse_numeric(merged.get("poll_interval_seconds"))
+        if interval is None or not math.isfinite(interval) or interval <= 0:
+            raise ConfigurationException(
+                "Invalid workflow_catalog.poll_interval_seconds: "
+                f"{merged.get('poll_interval_seconds')!r} must be a finite number > 0."
+            )
+        merged["poll_interval_seconds"] = float(interval)
+        watch = merged.get("watch")
+        if isinstance(watch, str):
+            watch = watch.strip().lower() in ("1", "true", "yes", "on")
+        merged["watch"] = bool(watch)
+        merged["catalog_path"] = str(merged.get("catalog_path") or default_path)
+        return merged
+
+    def get_executor_config(self) -> Dict[str, Any]:
+        """Get the named executor pool configuration for async graph execution.
+
+        Reads ``execution.executors``:
+
+          pools                     — name -> {kind: thread|process, max_workers}
+                                      merged over the built-in ``agent``,
+                                      ``storage_io`` and ``process`` pools
+                                      (max_workers 0 disables a pool)
+          default_agent_pool        — pool used for sync agent work
+          max_concurrent_per_graph  — default per-graph cap on in-flight pool
+                                      work (0 = none)
+          graph_limits              — per-graph overrides of that cap
+
+        Raises:
+            ConfigurationException: If ``execution.executors`` is not a
+                mapping, a pool is malformed or a limit is negative.
+        """
+        default_pools = {
+            "agent": {"kind": "thread", "max_workers": 16},
+            "storage_io": {"kind": "thread", "max_workers": 8},
+            "process": {"kind": "process", "max_workers": 0},
+        }
+        executor_config = self.get_value("execution.executors", {})
+        if not isinstance(executor_config, dict):
+            raise ConfigurationException(
+                "Invalid execution.executors configuration: expected a mapping, "
+                f"got {type(executor_config).__name__} ({executor_config!r})."
+            )
+
+        pools_config = executor_config.get("pools") or {}
+        if not isinstance(pools_config, dict):
+            raise ConfigurationException(
+                "Invalid execution.executors.pools: expected a mapping of "
+                "pool name -> {kind, max_workers}."
+            )
+        pools: Dict[str, Dict[str, Any]] = {}
+        for name in list(default_pools) + [
+            n for n in pools_config if n not in default_pools
+        ]:
+            pool = dict(default_pools.get(name, {"kind": "thread", "max_workers": 4}))
+            override = pools_config.get(name) or {}
+            if not isinstance(override, dict):
+                raise ConfigurationException(
+                    f"Invalid execution.executors.pools.{name}: expected a mapping."
+                )
+            pool.update(override)
+            if pool["kind"] not in ("thread", "process"):
+                raise ConfigurationException(
+                    f"Invalid execution.executors.pools.{name}.kind: "
+                    f"{pool['kind']!r} must be 'thread' or 'process'."
+                )
+            workers = self._coerce_sse_numeric(pool["max_workers"])
+            if workers is None or not math.isfinite(workers) or workers < 0:
+                raise ConfigurationException(
+                    f"Invalid execution.executors.pools.{name}.max_workers: "
+                    f"{pool['max_workers']!r} must be a finite number >= 0."
+                )
+            pool["max_workers"] = int(workers)
+            pools[name] = pool
+
+        merged = self._merge_with_defaults(
+            {k: v for k, v in executor_config.items() if k != "pools"},
+            {
+                "default_agent_pool": "agent",
+                "max_concurrent_per_graph": 0,
+                "graph_limits": {},
+            },
+        )
+        cap = self._coerce_sse_numeric(merged["max_concurrent_per_graph"])
+        if cap is None or not math.isfinite(cap) or cap < 0:
+            raise ConfigurationException(
+                "Invalid execution.executors.max_concurrent_per_graph: "
+                f"{merged['max_concurrent_per_graph']!r} must be a finite number >= 0."
+            )
+        if not isinstance(merged["graph_limits"], dict):
+            raise ConfigurationException(
+                "Invalid execution.executors.graph_limits: expected a mapping of "
+                "graph name -> max concurrent pool tasks."
+            )
+        merged["max_concurrent_per_graph"] = int(cap)
+        merged["graph_limits"] = self._coerce_graph_limits(
+            "execution.executors.graph_limits", merged["graph_limits"]
+        )
+        merged["pools"] = pools
+        return merged
+
+    def get_node_cache_config(self) -> Dict[str, Any]:
+        """Get the per-node result memoization configuration.
+
+        Reads ``execution.node_cache``:
+
+          enabled       — build the NodeResultCache at all
+          path          — SQLite cache file
+                          (default ``<paths.cache>/node_results.sqlite3``)
+          namespace     — mixed into every key; change it to invalidate
+          ttl_seconds   — entry lifetime (0 = no expiry)
+          max_entries   — LRU entry cap (0 = unbounded)
+          max_bytes     — LRU cap on stored result bytes (0 = unbounded)
+          memoize_all   — memoize every side-effect-free node, not only
+                          nodes with ``memoize: true`` in their Context
+
+        Raises:
+            ConfigurationException: If ``execution.node_cache`` is not a
+                mapping or a numeric setting is non-numeric or negative.
+        """
+        defaults = {
+            "enabled": False,
+            "path": str(self.get_cache_path() / "node_results.sqlite3"),
+            "namespace": "",
+            "ttl_seconds": 86400,
+            "max_entries": 10000,
+            "max_bytes": 256 * 1024 * 1024,
+            "memoize_all": False,
+        }
+        cache_config = self.get_value("execution.node_cache", {})
+        if not isinstance(cache_config, dict):
+            raise ConfigurationException(
+                "Invalid execution.node_cache configuration: expected a mapping, "
+                f"got {type(cache_config).__name__} ({cache_config!r})."
+            )
+        merged = self._merge_with_defaults(cache_config, defaults)
+
+        for key in ("enabled", "memoize_all"):
+            flag = merged.get(key)
+            if isinstance(flag, str):
+                flag = flag.strip().lower() in ("1", "true", "yes", "on")
+            merged[key] = bool(flag)
+        merged["path"] = str(merged.get("path") or defaults["path"])
+        merged["namespace"] = str(merged.get("namespace") or "")
+
+        for key in ("ttl_seconds", "max_entries", "max_bytes"):
+            value = self._coerce_sse_numeric(merged.get(key))
+            if value is None or not math.isfinite(value) or value < 0:
+                raise ConfigurationException(
+                    f"Invalid execution.node_cache.{key}: {merged.get(key)!r} "
+                    "must be a finite number >= 0."
+                )
+            merged[key] = value
+        merged["max_entries"] = int(merged["max_entries"])
+        merged["max_bytes"] = int(merged["max_bytes"])
+        return merged
+
+    # Warm-start snapshot accessors
+    def get_warm_start_config(self) -> Dict[str, Any]:
+        """Get the warm-start snapshot configuration.
+
+        Reads ``warm_start``:
+
+          enabled        — restore startup state from the snapshot when fresh
+          snapshot_path  — snapshot file (default: <paths.cache>/warm_start_snapshot.json)
+
+        Raises:
+            ConfigurationException: If ``warm_start`` is not a mapping.
+        """
+        defaults = {
+            "enabled": False,
+            "snapshot_path": str(self.get_cache_path() / "warm_start_snapshot.json"),
+        }
+
+        warm_start_config = self.get_value("warm_start", {})
+        if not isinstance(warm_start_config, dict):
+            raise ConfigurationException(
+                "Invalid warm_start configuration: expected a mapping, "
+                f"got {type(warm_start_config).__name__} ({warm_start_config!r})."
+            )
+
+        merged = self._merge_with_defaults(warm_start_config, defaults)
+        merged["enabled"] = bool(merged["enabled"])
+        merged["snapshot_path"] = str(
+            merged["snapshot_path"] or defaults["snapshot_path"]
+        )
+        return merged
+
     # Authentication accessors
     def get_auth_config(self) -> Dict[str, Any]:
         """Get authentication configuration with default values."""
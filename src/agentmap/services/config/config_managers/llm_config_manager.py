@@ -42,7 +42,7 @@ class LLMConfigManager(BaseConfigManager):
 
     def get_resilience_config(self) -> Dict[str, Any]:
         """
-        Get LLM resilience configuration (retry + circuit breaker) with defaults.
+        Get LLM resilience configuration (retry, circuit breaker, hedging) with defaults.
 
         Returns:
             Dictionary containing resilience configuration.
@@ -61,6 +61,16 @@ class LLMConfigManager(BaseConfigManager):
                 "failure_threshold": 5,
                 "reset_timeout": 60,
             },
+            "hedging": {
+                "enabled": False,
+                "percentile": 95,
+                "min_samples": 20,
+                "initial_delay_seconds": 2.0,
+                "min_delay_seconds": 0.25,
+                "max_delay_seconds": 10.0,
+                "max_hedge_rate": 0.1,
+                "window": 200,
+            },
         }
 
         return self._merge_with_defaults(resilience_config, defaults)
@@ -1,5 +1,6 @@
 """Telemetry configuration manager."""
 
+import math
 from typing import Any, Dict
 
 from agentmap.exceptions.base_exceptions import ConfigurationException
@@ -9,6 +10,7 @@ from agentmap.services.config.config_managers.base_config_manager import (
 
 VALID_EXPORTERS = {"otlp", "console", "none"}
 VALID_PROTOCOLS = {"grpc", "http/protobuf"}
+VALID_SUBSYSTEMS = {"workflow", "agent", "llm", "storage"}
 
 DEFAULTS = {
     "enabled": False,
@@ -24,6 +26,30 @@ DEFAULTS = {
     "resource": {
         "service.name": "agentmap",
     },
+    "sampling": {
+        "ratio": 1.0,
+        "parent_based": True,
+        "graph_overrides": {},
+        "keep_errors": False,
+        "slow_span_ms": None,
+    },
+    "subsystems": {
+        "workflow": True,
+        "agent": True,
+        "llm": True,
+        "storage": True,
+    },
+    "limits": {
+        "max_attribute_length": 4096,
+        "max_attributes_per_span": None,
+        "max_events_per_span": None,
+    },
+    "batch": {
+        "max_queue_size": 2048,
+        "max_export_batch_size": 512,
+        "schedule_delay_ms": 5000,
+        "export_timeout_ms": 30000,
+    },
 }
 
 
@@ -171,3 +197,82 @@ class TelemetryConfigManager(BaseConfigManager):
                         f"Invalid telemetry resource attribute '{key}': "
                         f"'{value}'. OTEL resource attributes must be strings"
                     )
+
+        for section in ("sampling", "subsystems", "limits", "batch"):
+            if not isinstance(config.get(section), dict):
+                raise ConfigurationException(
+                    f"Invalid telemetry {section} configuration: "
+                    f"'{config.get(section)}'. Must be a mapping"
+                )
+
+        # Validate sampling
+        sampling = config["sampling"]
+        self._validate_ratio("sampling.ratio", sampling["ratio"])
+        for key in ("parent_based", "keep_errors"):
+            if not isinstance(sampling[key], bool):
+                raise ConfigurationException(
+                    f"Invalid telemetry sampling.{key} value: "
+                    f"'{sampling[key]}'. Must be a boolean (true/false)"
+                )
+        if not isinstance(sampling["graph_overrides"], dict):
+            raise ConfigurationException(
+                "Invalid telemetry sampling.graph_overrides value: "
+                f"'{sampling['graph_overrides']}'. Must be a mapping of "
+                "graph name to ratio"
+            )
+        for graph, ratio in sampling["graph_overrides"].items():
+            self._validate_ratio(f"sampling.graph_overrides.{graph}", ratio)
+        slow_span_ms = sampling["slow_span_ms"]
+        if slow_span_ms is not None and (
+            isinstance(slow_span_ms, bool)
+            or not isinstance(slow_span_ms, (int, float))
+            or not math.isfinite(slow_span_ms)
+            or slow_span_ms < 0
+        ):
+            raise ConfigurationException(
+                f"Invalid telemetry sampling.slow_span_ms value: "
+                f"'{slow_span_ms}'. Must be null or a non-negative number"
+            )
+
+        # Validate subsystem switches
+        for key, value in config["subsystems"].items():
+            if key not in VALID_SUBSYSTEMS:
+                raise ConfigurationException(
+                    f"Invalid telemetry subsystem: '{key}'. "
+                    f"Valid options: {', '.join(sorted(VALID_SUBSYSTEMS))}"
+                )
+            if not isinstance(value, bool):
+                raise ConfigurationException(
+                    f"Invalid telemetry subsystems.{key} value: "
+                    f"'{value}'. Must be a boolean (true/false)"
+                )
+
+        # Validate limits (null = SDK default) and batch sizes
+        for section, nullable in (("limits", True), ("batch", False)):
+            for key, value in config[section].items():
+                if value is None and nullable:
+                    continue
+                if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                    raise ConfigurationException(
+                        f"Invalid telemetry {section}.{key} value: "
+                        f"'{value}'. Must be a positive integer"
+                    )
+        batch = config["batch"]
+        if batch["max_export_batch_size"] > batch["max_queue_size"]:
+            raise ConfigurationException(
+                "Invalid telemetry batch configuration: max_export_batch_size "
+                f"({batch['max_export_batch_size']}) exceeds max_queue_size "
+                f"({batch['max_queue_size']})"
+            )
+
+    @staticmethod
+    def _validate_ratio(name: str, value: Any) -> None:
+        if (
+            isinstance(value, bool)
+            or not isinstance(value, (int, float))
+            or not 0.0 <= value <= 1.0
+        ):
+            raise ConfigurationException(
+                f"Invalid telemetry {name} value: '{value}'. "
+                "Must be a number between 0.0 and 1.0"
+            )
@@ -0,0 +1,250 @@
+"""
+Warm-start snapshot for AgentMap startup state.
+
+Persists startup artifacts that are pure functions of the installed package
+and its configuration files (the declaration registry contents) so that
+CLI runs, serverless cold starts and HTTP workers can reload them instead of
+recomputing. ``agentmap warmup`` builds the snapshot during deploys. Opt-in
+via ``warm_start.enabled``.
+
+Only declarations are snapshotted. The resolved config is a single YAML parse
+of the same files the key hashes, the protocol-to-service map is rebuilt from
+the restored service declarations, provider availability has its own
+persisted cache, and heavy services are already lazy DI singletons, so none
+of them would save measurable startup time.
+
+The snapshot is a single JSON file. Its key is a hash of the AgentMap version,
+the Python version and the contents of the registered config files; each
+section additionally records a hash of the files it was derived from
+(e.g. ``custom_agents.yaml``). A stale key or section is ignored, never an
+error: callers fall back to computing the value and saving it again.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from agentmap.services.logging_service import LoggingService
+
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+def _hash_files(paths: Iterable[Union[str, Path]]) -> str:
+    """Hash path names and contents; missing files hash as 'missing'."""
+    digest = hashlib.sha256()
+    for path in sorted(str(p) for p in paths if p):
+        digest.update(path.encode("utf-8"))
+        try:
+            with open(path, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+class WarmStartSnapshotService:
+    """
+    Load and save named sections of the warm-start snapshot file.
+
+    Sections are plain JSON-serializable dicts. ``load_section`` returns None
+    when the snapshot is disabled, missing, corrupt, built for a different
+    package/config, or when the section's own dependency files changed.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Union[str, Path],
+        logging_service: LoggingService,
+        config_files: Optional[Iterable[Union[str, Path]]] = None,
+        enabled: bool = False,
+    ):
+        self.snapshot_path = Path(snapshot_path)
+        self.logger = logging_service.get_class_logger(self)
+        self.enabled = enabled
+        self._config_files: List[str] = [str(p) for p in (config_files or []) if p]
+        self._lock = threading.RLock()
+        self._key: Optional[str] = None
+        self._document: Optional[Dict[str, Any]] = None
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------ key
+
+    @property
+    def key(self) -> str:
+        """Snapshot key for the running package, interpreter and config files."""
+        if self._key is None:
+            from agentmap._version import __version__
+
+            digest = hashlib.sha256()
+            digest.update(f"agentmap={__version__}".encode("utf-8"))
+            digest.update(f"python={sys.version_info[:3]}".encode("utf-8"))
+            digest.update(f"format={SNAPSHOT_FORMAT_VERSION}".encode("utf-8"))
+            digest.update(_hash_files(self._config_files).encode("utf-8"))
+            self._key = digest.hexdigest()
+        return self._key
+
+    # ------------------------------------------------------------- sections
+
+    def load_section(
+        self, name: str, dependencies: Iterable[Union[str, Path]] = ()
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return a fresh snapshot section or None.
+
+        Args:
+            name: Section name (e.g. "declarations")
+            dependencies: Files the section was derived from
+
+        Returns:
+            The section data if the snapshot key and dependency hash match
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            document = self._read()
+            section = (document or {}).get("sections", {}).get(name)
+            if section is None or section.get("dependencies") != _hash_files(
+                dependencies
+            ):
+                self.misses += 1
+                self.logger.debug(f"[WarmStartSnapshotService] Miss for '{name}'")
+                return None
+
+            self.hits += 1
+            self.logger.debug(f"[WarmStartSnapshotService] Hit for '{name}'")
+            return section.get("data")
+
+    def save_section(
+        self,
+        name: str,
+        data: Dict[str, Any],
+        dependencies: Iterable[Union[str, Path]] = (),
+    ) -> bool:
+        """
+        Store a section and atomically rewrite the snapshot file.
+
+        Returns:
+            True if the snapshot file was written
+        """
+        if not self.enabled:
+            return False
+
+        with self._lock:
+            document = self._read() or self._new_document()
+            document["sections"][name] = {
+                "dependencies": _hash_files(dependencies),
+                "saved_at": datetime.now(timezone.utc).isoformat(),
+                "data": data,
+            }
+            return self._write(document)
+
+    def invalidate(self) -> None:
+        """Delete the snapshot file and forget any loaded state."""
+        with self._lock:
+            self._document = None
+            self._loaded = True
+            try:
+                self.snapshot_path.unlink()
+                self.logger.debug(
+                    f"[WarmStartSnapshotService] Removed snapshot {self.snapshot_path}"
+                )
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self.logger.warning(
+                    f"[WarmStartSnapshotService] Could not remove snapshot: {e}"
+                )
+
+    def get_snapshot_info(self) -> Dict[str, Any]:
+        """Describe the snapshot for diagnostics."""
+        with self._lock:
+            document = self._read()
+            return {
+                "enabled": self.enabled,
+                "snapshot_path": str(self.snapshot_path),
+                "exists": self.snapshot_path.exists(),
+                "key": self.key,
+                "valid": document is not None,
+                "created_at": (document or {}).get("created_at"),
+                "sections": sorted((document or {}).get("sections", {})),
+                "config_files": list(self._config_files),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    # ------------------------------------------------------------ file I/O
+
+    def _new_document(self) -> Dict[str, Any]:
+        return {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "key": self.key,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "sections": {},
+        }
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        """Read the snapshot once per process; None unless it matches our key."""
+        if self._loaded:
+            return self._document
+
+        self._loaded = True
+        self._document = None
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"[WarmStartSnapshotService] Ignoring unreadable snapshot "
+                f"{self.snapshot_path}: {e}"
+            )
+            return None
+
+        if not isinstance(document, dict) or document.get("key") != self.key:
+            self.logger.info(
+                "[WarmStartSnapshotService] Snapshot is stale "
+                "(package or config changed); it will be rebuilt"
+            )
+            return None
+
+        document.setdefault("sections", {})
+        self._document = document
+        return document
+
+    def _write(self, document: Dict[str, Any]) -> bool:
+        """Write via a temp file + os.replace so readers never see partial JSON."""
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=".warm_start_", suffix=".tmp", dir=self.snapshot_path.parent
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(document, f, default=str)
+                os.replace(tmp_path, self.snapshot_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning(
+                f"[WarmStartSnapshotService] Could not write snapshot "
+                f"{self.snapshot_path}: {e}"
+            )
+            return False
+
+        self._document = document
+        self._loaded = True
+        return True
@@ -5,15 +5,17 @@ Provides parsing functionality to convert CSV data into GraphSpec and NodeSpec
 domain models, handling edge targets, input fields, and other structured data.
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Union
 
-import pandas as pd
-
 from agentmap.models.graph_spec import GraphSpec, NodeSpec
 from agentmap.services.csv_graph_parser.column_config import CSVColumnConfig
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from agentmap.services.logging_service import LoggingService
 
 
@@ -278,6 +280,8 @@ class CSVRowParser:
         Returns:
             String value, never None
         """
+        import pandas as pd
+
         value = row.get(field_name, default)
 
         # Handle pandas NaN values
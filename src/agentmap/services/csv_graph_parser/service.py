@@ -7,11 +7,11 @@ extracted from GraphBuilderService and leverages proven patterns from
 CSVValidationService.
 """
 
+from __future__ import annotations
+
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
-import pandas as pd
-
 from agentmap.models.graph_spec import GraphSpec, NodeSpec
 from agentmap.models.node import Node
 from agentmap.models.validation.validation_models import ValidationResult
@@ -22,6 +22,8 @@ from agentmap.services.csv_graph_parser.validators import CSVStructureValidator
 from agentmap.services.logging_service import LoggingService
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from agentmap.services.declaration_registry_service import (
         DeclarationRegistryService,
     )
@@ -80,6 +82,8 @@ class CSVGraphParserService:
             FileNotFoundError: If CSV file doesn't exist
             ValueError: If CSV structure is invalid
         """
+        import pandas as pd
+
         csv_path = Path(csv_path)
         self.logger.info(f"[CSVGraphParserService] Parsing CSV: {csv_path}")
 
@@ -154,6 +158,8 @@ class CSVGraphParserService:
         Returns:
             ValidationResult with validation details
         """
+        import pandas as pd
+
         result = ValidationResult(
             file_path=str(csv_path), file_type="csv", is_valid=True
         )
@@ -5,13 +5,13 @@ Provides validation functionality for CSV structure and row content,
 generating detailed validation results with errors and warnings.
 """
 
+from __future__ import annotations
+
 from collections import defaultdict
 from difflib import get_close_matches
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
-import pandas as pd
-
 from agentmap.models.validation.validation_models import ValidationResult
 from agentmap.services.csv_graph_parser.column_config import CSVColumnConfig
 
@@ -25,6 +25,8 @@ except ImportError:
     _KNOWN_AGENT_TYPES = None
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from agentmap.services.logging_service import LoggingService
 
 
@@ -137,6 +139,7 @@ class CSVStructureValidator:
             df: DataFrame to validate
             result: ValidationResult to populate with findings
         """
+        import pandas as pd
         from pydantic import ValidationError as PydanticValidationError
 
         from agentmap.models.validation.csv_row_model import CSVRowModel
@@ -197,6 +200,8 @@ class CSVStructureValidator:
                 (builtin + custom). Falls back to builtin-only constants
                 if not provided.
         """
+        import pandas as pd
+
         edge_columns = self.column_config.edge_columns
 
         # --- Single-pass data collection ---
@@ -247,6 +252,8 @@ class CSVStructureValidator:
     @staticmethod
     def _parse_pipe_field(row, col: str) -> List[str]:
         """Parse a pipe-separated field value into a list of stripped strings."""
+        import pandas as pd
+
         value = row.get(col)
         if pd.isna(value) or not str(value).strip():
             return []
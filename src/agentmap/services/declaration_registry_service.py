@@ -352,12 +352,26 @@ class DeclarationRegistryService:
     eliminating circular dependencies through declaration-only analysis.
     """
 
+    SNAPSHOT_SECTION = "declarations"
+
     def __init__(
-        self, app_config_service: AppConfigService, logging_service: LoggingService
+        self,
+        app_config_service: AppConfigService,
+        logging_service: LoggingService,
+        snapshot_service: Optional[Any] = None,
     ):
-        """Initialize with dependency injection."""
+        """Initialize with dependency injection.
+
+        Args:
+            app_config_service: Application configuration service
+            logging_service: Logging service
+            snapshot_service: Optional WarmStartSnapshotService; when set,
+                load_all() restores declarations from the warm-start snapshot
+                instead of re-parsing every source
+        """
         self.app_config_service = app_config_service
         self.logger = logging_service.get_class_logger(self)
+        self.snapshot_service = snapshot_service
 
         # Core data storage
         self._sources: List[DeclarationSource] = []
@@ -380,6 +394,9 @@ class DeclarationRegistryService:
 
         Later sources override earlier ones to enable customization.
         """
+        if self._load_from_snapshot():
+            return
+
         self.logger.debug("Loading declarations from all sources")
 
         new_agents: Dict[str, AgentDeclaration] = {}
@@ -397,6 +414,62 @@ class DeclarationRegistryService:
         self.logger.info(
             f"Loaded {len(self._agents)} agents and {len(self._services)} services"
         )
+        self._save_snapshot()
+
+    def _snapshot_dependencies(self) -> List[Any]:
+        """Files the loaded declarations depend on (for snapshot validation)."""
+        files: List[Any] = []
+        for source in self._sources:
+            files.extend(source.get_source_files())
+        return files
+
+    def _load_from_snapshot(self) -> bool:
+        """Restore declarations from the warm-start snapshot if it is fresh."""
+        if self.snapshot_service is None:
+            return False
+        try:
+            data = self.snapshot_service.load_section(
+                self.SNAPSHOT_SECTION, self._snapshot_dependencies()
+            )
+            if not data:
+                return False
+            self._agents = {
+                name: AgentDeclaration.from_dict(decl)
+                for name, decl in data["agents"].items()
+            }
+            self._services = {
+                name: ServiceDeclaration.from_dict(decl)
+                for name, decl in data["services"].items()
+            }
+        except Exception as e:
+            self.logger.warning(f"Ignoring unusable warm-start snapshot: {e}")
+            return False
+
+        self.logger.info(
+            f"Restored {len(self._agents)} agents and {len(self._services)} "
+            f"services from warm-start snapshot"
+        )
+        return True
+
+    def _save_snapshot(self) -> None:
+        """Persist the freshly loaded declarations to the warm-start snapshot."""
+        if self.snapshot_service is None:
+            return
+        try:
+            self.snapshot_service.save_section(
+                self.SNAPSHOT_SECTION,
+                {
+                    "agents": {
+                        name: decl.to_dict() for name, decl in self._agents.items()
+                    },
+                    "services": {
+                        name: decl.to_dict() for name, decl in self._services.items()
+                    },
+                },
+                self._snapshot_dependencies(),
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not save warm-start snapshot: {e}")
 
     def get_agent_declaration(self, agent_type: str) -> Optional[AgentDeclaration]:
         """
@@ -1,7 +1,8 @@
 """Base declaration source interface."""
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from pathlib import Path
+from typing import Dict, List
 
 from agentmap.models.declaration_models import AgentDeclaration, ServiceDeclaration
 
@@ -31,3 +32,15 @@ class DeclarationSource(ABC):
         Returns:
             Dictionary mapping service names to ServiceDeclaration models
         """
+
+    def get_source_files(self) -> List[Path]:
+        """
+        Files this source reads declarations from.
+
+        Used to key the warm-start snapshot; sources backed only by code
+        (covered by the package version) return an empty list.
+
+        Returns:
+            List of file paths whose contents determine this source's output
+        """
+        return []
@@ -1,7 +1,7 @@
 """Custom agents YAML declaration source."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from agentmap.models.declaration_models import AgentDeclaration, ServiceDeclaration
 from agentmap.services.declaration_parser import DeclarationParser
@@ -88,6 +88,10 @@ class CustomAgentYAMLSource(DeclarationSource):
         )
         return {}
 
+    def get_source_files(self) -> List[Path]:
+        """Return the YAML file this source reads."""
+        return [self._get_custom_agents_path()]
+
     def _get_custom_agents_path(self) -> Path:
         """
         Get the path to the custom_agents.yaml file from configuration.
@@ -1,7 +1,7 @@
 """Host services YAML declaration source."""
 
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from agentmap.models.declaration_models import AgentDeclaration, ServiceDeclaration
 from agentmap.services.declaration_parser import DeclarationParser
@@ -78,6 +78,10 @@ class HostServiceYAMLSource(DeclarationSource):
         self.logger.debug(f"Loaded {len(services)} host service declarations")
         return services
 
+    def get_source_files(self) -> List[Path]:
+        """Return the YAML file this source reads."""
+        return [self._get_host_services_path()]
+
     def _get_host_services_path(self) -> Path:
         """Get the path to the host_services.yaml file from configuration."""
         custom_agents_dir = self.config.get_custom_agents_path()
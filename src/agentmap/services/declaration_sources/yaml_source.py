@@ -1,7 +1,7 @@
 """YAML file declaration source for agent and service declarations."""
 
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List
 
 from agentmap.models.declaration_models import AgentDeclaration, ServiceDeclaration
 from agentmap.services.declaration_parser import DeclarationParser
@@ -40,6 +40,10 @@ class YAMLDeclarationSource(DeclarationSource):
         self.logger = logging_service.get_class_logger(self)
         self.logger.debug(f"[YAMLDeclarationSource] Initialized for path: {self.path}")
 
+    def get_source_files(self) -> List[Path]:
+        """Return the YAML file this source reads."""
+        return [self.path]
+
     def load_agents(self) -> Dict[str, AgentDeclaration]:
         """
         Load agent declarations from YAML file.
@@ -0,0 +1,296 @@
+"""
+Named executor pools for blocking work inside async graph execution.
+
+Async graphs hand blocking work to executors: sync agents' ``process()``,
+checkpoint file I/O and similar. Sharing the event loop's default executor
+lets a few slow agents starve checkpoint writes, so this service keeps
+separate, bounded pools:
+
+- ``agent``: thread pool for sync agent work (the default agent pool)
+- ``storage_io``: thread pool for checkpoint and storage I/O
+- ``process``: optional process pool for CPU-bound agents, selected per node
+  with ``executor: process`` in the CSV Context column
+
+Further pools can be declared under ``execution.executors.pools``. Each pool
+records saturation metrics, and work submitted on behalf of a graph can be
+capped per graph (``max_concurrent_per_graph`` / ``graph_limits``).
+"""
+
+import asyncio
+import contextvars
+import functools
+import pickle
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from agentmap.exceptions.base_exceptions import ConfigurationException
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.logging_service import LoggingService
+
+
+class _PoolStats:
+    """Thread-safe submission counters for one pool."""
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.saturated_submissions = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+
+    def on_submit(self) -> None:
+        with self._lock:
+            in_flight = self.submitted - self.completed - self.failed
+            if in_flight >= self.max_workers:
+                self.saturated_submissions += 1
+            self.submitted += 1
+            self.peak_in_flight = max(self.peak_in_flight, in_flight + 1)
+
+    def on_done(self, future: Any) -> None:
+        with self._lock:
+            if future.cancelled() or future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            in_flight = self.submitted - self.completed - self.failed
+            return {
+                "max_workers": self.max_workers,
+                "active": min(in_flight, self.max_workers),
+                "queued": max(0, in_flight - self.max_workers),
+                "saturation": round(in_flight / self.max_workers, 3),
+                "peak_in_flight": self.peak_in_flight,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "saturated_submissions": self.saturated_submissions,
+            }
+
+
+class ExecutionPoolService:
+    """Owns the named executor pools and per-graph concurrency caps."""
+
+    AGENT_POOL = "agent"
+    STORAGE_IO_POOL = "storage_io"
+    PROCESS_POOL = "process"
+
+    def __init__(
+        self, app_config_service: AppConfigService, logging_service: LoggingService
+    ):
+        self.logger = logging_service.get_class_logger(self)
+        config = app_config_service.get_executor_config()
+
+        self._pool_config: Dict[str, Dict[str, Any]] = config["pools"]
+        self.default_agent_pool = config["default_agent_pool"]
+        self._default_graph_limit = config["max_concurrent_per_graph"]
+        self._graph_limits: Dict[str, int] = config["graph_limits"]
+
+        self._executors: Dict[str, Executor] = {}
+        self._stats: Dict[str, _PoolStats] = {
+            name: _PoolStats(pool["max_workers"])
+            for name, pool in self._pool_config.items()
+            if pool["max_workers"] > 0
+        }
+        if self.default_agent_pool not in self._stats:
+            raise ConfigurationException(
+                f"Invalid execution.executors.default_agent_pool: "
+                f"'{self.default_agent_pool}' is not an enabled pool."
+            )
+        self._graph_waiting: Dict[str, int] = {}
+        self._graph_running: Dict[str, int] = {}
+        # asyncio semaphores are bound to the loop they are first used on, so
+        # keep one set of graph semaphores per running loop.
+        self._graph_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+        self.logger.debug(
+            f"[ExecutionPoolService] Pools: "
+            f"{ {n: s.max_workers for n, s in self._stats.items()} }, "
+            f"default graph cap: {self._default_graph_limit or 'none'}"
+        )
+
+    # ---------------------------------------------------------------- pools
+
+    def has_pool(self, name: str) -> bool:
+        """True if ``name`` is a configured, enabled pool."""
+        return name in self._stats
+
+    def is_process_pool(self, name: str) -> bool:
+        """True if ``name`` is an enabled process pool."""
+        return self.has_pool(name) and self._pool_config[name]["kind"] == "process"
+
+    def resolve_pool(self, name: Optional[str]) -> str:
+        """Return ``name`` if enabled, otherwise the default agent pool."""
+        if name and self.has_pool(name):
+            return name
+        if name:
+            self.logger.warning(
+                f"[ExecutionPoolService] Pool '{name}' is not configured or "
+                f"disabled; using '{self.default_agent_pool}'"
+            )
+        return self.default_agent_pool
+
+    def resolve_agent_pool(self, agent: Any) -> str:
+        """
+        Pick the pool for an agent from its ``executor`` context key.
+
+        Process pools pickle the agent (for BaseAgent, its service-free
+        detached copy) into the worker, so agents that cannot be pickled fall
+        back to the default agent pool with a warning.
+        """
+        context = getattr(agent, "context", None)
+        requested = context.get("executor") if isinstance(context, dict) else None
+        pool = self.resolve_pool(requested)
+        if self.is_process_pool(pool):
+            detach = getattr(agent, "_detached_for_process_pool", None)
+            try:
+                pickle.dumps(detach() if detach else agent)
+            except Exception as e:
+                self.logger.warning(
+                    f"[ExecutionPoolService] Agent '{getattr(agent, 'name', agent)}' "
+                    f"cannot run in process pool '{pool}' (not picklable: {e}); "
+                    f"using '{self.default_agent_pool}'"
+                )
+                return self.default_agent_pool
+        return pool
+
+    def _get_executor(self, name: str) -> Executor:
+        with self._lock:
+            executor = self._executors.get(name)
+            if executor is None:
+                pool = self._pool_config[name]
+                if pool["kind"] == "process":
+                    executor = ProcessPoolExecutor(max_workers=pool["max_workers"])
+                else:
+                    executor = ThreadPoolExecutor(
+                        max_workers=pool["max_workers"],
+                        thread_name_prefix=f"agentmap-{name}",
+                    )
+                self._executors[name] = executor
+            return executor
+
+    # ------------------------------------------------------------- running
+
+    async def run(
+        self,
+        pool_name: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        graph_name: Optional[str] = None,
+    ) -> Any:
+        """
+        Run ``fn(*args)`` in a named pool and await the result.
+
+        Thread pools run ``fn`` in a copy of the caller's context (as
+        ``asyncio.to_thread`` does) so tracing context propagates. When
+        ``graph_name`` has a concurrency cap, the call waits for a slot first.
+        """
+        pool_name = self.resolve_pool(pool_name)
+        semaphore = self._get_graph_semaphore(graph_name)
+        if semaphore is None:
+            return await self._submit(pool_name, fn, args)
+
+        self._count(self._graph_waiting, graph_name, 1)
+        try:
+            await semaphore.acquire()
+        finally:
+            self._count(self._graph_waiting, graph_name, -1)
+        self._count(self._graph_running, graph_name, 1)
+        try:
+            return await self._submit(pool_name, fn, args)
+        finally:
+            self._count(self._graph_running, graph_name, -1)
+            semaphore.release()
+
+    def bind(
+        self, pool_name: str, graph_name: Optional[str] = None
+    ) -> Callable[..., Any]:
+        """Return an ``async (fn, *args)`` runner fixed to a pool and graph."""
+        return functools.partial(self.run, pool_name, graph_name=graph_name)
+
+    async def _submit(self, pool_name: str, fn: Callable[..., Any], args: Any) -> Any:
+        executor = self._get_executor(pool_name)
+        stats = self._stats[pool_name]
+        if isinstance(executor, ThreadPoolExecutor):
+            context = contextvars.copy_context()
+            future = executor.submit(context.run, fn, *args)
+        else:
+            future = executor.submit(fn, *args)
+        stats.on_submit()
+        future.add_done_callback(stats.on_done)
+        return await asyncio.wrap_future(future)
+
+    # ---------------------------------------------------------- graph caps
+
+    def get_graph_limit(self, graph_name: Optional[str]) -> int:
+        """Concurrency cap for a graph (0 = uncapped)."""
+        if not graph_name:
+            return 0
+        return self._graph_limits.get(graph_name, self._default_graph_limit)
+
+    def _get_graph_semaphore(
+        self, graph_name: Optional[str]
+    ) -> Optional[asyncio.Semaphore]:
+        limit = self.get_graph_limit(graph_name)
+        if limit <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._graph_semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(graph_name)
+            if semaphore is None:
+                semaphore = semaphores[graph_name] = asyncio.Semaphore(limit)
+            return semaphore
+
+    def _count(self, counter: Dict[str, int], graph_name: str, delta: int) -> None:
+        with self._lock:
+            counter[graph_name] = counter.get(graph_name, 0) + delta
+
+    # ------------------------------------------------------------- metrics
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Per-pool saturation metrics and per-graph cap usage."""
+        with self._lock:
+            graphs = {
+                name: {
+                    "limit": self.get_graph_limit(name),
+                    "running": self._graph_running.get(name, 0),
+                    "waiting": self._graph_waiting.get(name, 0),
+                }
+                for name in set(self._graph_running) | set(self._graph_waiting)
+            }
+        return {
+            "pools": {
+                name: {
+                    "kind": self._pool_config[name]["kind"],
+                    "started": name in self._executors,
+                    **stats.snapshot(),
+                }
+                for name, stats in self._stats.items()
+            },
+            "graphs": graphs,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down every started pool; pools restart lazily on next use."""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for name, executor in executors.items():
+            executor.shutdown(wait=wait)
+            self.logger.debug(f"[ExecutionPoolService] Shut down pool '{name}'")
+
+    def get_service_info(self) -> Dict[str, Any]:
+        """Get service information for debugging."""
+        return {
+            "service": "ExecutionPoolService",
+            "default_agent_pool": self.default_agent_pool,
+            "max_concurrent_per_graph": self._default_graph_limit,
+            "graph_limits": dict(self._graph_limits),
+            **self.get_metrics(),
+        }
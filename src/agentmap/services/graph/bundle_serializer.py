@@ -4,6 +4,11 @@ from typing import Any, Dict, Optional
 
 from agentmap.models.graph_bundle import GraphBundle
 from agentmap.models.node import Node
+from agentmap.services.graph.execution_plan_builder import (
+    build_execution_plan,
+    execution_plan_from_dict,
+    execution_plan_to_dict,
+)
 from agentmap.services.logging_service import LoggingService
 
 
@@ -81,6 +86,11 @@ class BundleSerializer:
             # Optimization metadata (Phase 2)
             "graph_structure": bundle.graph_structure or {},
             "protocol_mappings": bundle.protocol_mappings or {},
+            "execution_plan": (
+                execution_plan_to_dict(bundle.execution_plan)
+                if bundle.execution_plan
+                else None
+            ),
             # Validation metadata (Phase 3)
             "validation_metadata": bundle.validation_metadata or {},
             "missing_declarations": set_to_list(bundle.missing_declarations),
@@ -156,6 +166,9 @@ class BundleSerializer:
                 # Phase 2: Optimization metadata
                 graph_structure=data.get("graph_structure"),
                 protocol_mappings=data.get("protocol_mappings"),
+                # Bundles saved before execution plans existed are analysed now
+                execution_plan=execution_plan_from_dict(data.get("execution_plan"))
+                or build_execution_plan(nodes, data.get("entry_point")),
                 # Phase 3: Validation metadata
                 validation_metadata=data.get("validation_metadata"),
                 missing_declarations=list_to_set(
@@ -57,13 +57,22 @@ class EdgeProcessor:
         node_name: str,
         edges: Dict[str, Union[str, List[str]]],
         orchestrator_nodes: List[str],
+        routing: Optional[str] = None,
     ) -> None:
-        """Process edges for a node and add them to the graph."""
+        """Process edges for a node and add them to the graph.
+
+        *routing* is the node's kind from the bundle's execution plan
+        (``"none"``, ``"static"``, ``"function"`` or ``"orchestrator"``);
+        when given, only function-routed nodes are scanned for ``func:``
+        references.
+        """
         if node_name in orchestrator_nodes:
             return
-        if not edges:
+        if not edges or routing == "none":
             return
-        if self._try_add_function_edge(builder, node_name, edges):
+        if routing in (None, "function") and self._try_add_function_edge(
+            builder, node_name, edges
+        ):
             return
         self._add_standard_edges(builder, node_name, edges)
 
@@ -253,14 +262,10 @@ class EdgeProcessor:
                 if not self.state_adapter.get_value(state, "last_action_success", True):
                     return failure_target
 
-            # Get the next node from state
-            next_node = self.state_adapter.get_value(state, "__next_node")
-
-            # Clear the routing directive after reading
-            if next_node:
-                self.state_adapter.set_value(state, "__next_node", None)
-
-            return next_node
+            # Get the next node from state. Routers cannot update state in
+            # LangGraph, so the directive is left for the orchestrator to
+            # overwrite on its next run rather than copied here to clear it.
+            return self.state_adapter.get_value(state, "__next_node")
 
         # Create path_map for LangGraph 1.x compatibility
         # Map each node name to itself so LangGraph knows valid destinations
@@ -0,0 +1,304 @@
+"""
+Static execution plan analysis for graph bundles.
+
+Builds the ``ExecutionPlan`` stored in a ``GraphBundle`` when the bundle is
+created: per-node routing kind and successors, reachability from the entry
+point, topological levels, fan-out groups, fan-in points, terminal nodes,
+cycles and each orchestrator's candidate nodes with its parsed node filter.
+Graph assembly and orchestrator injection read the plan instead of
+re-deriving these facts from ``bundle.nodes`` on every run, and
+``validate_execution_plan`` reports unreachable nodes and cycles without
+any LLM routing.
+
+Orchestrator nodes are recognised by the built-in ``orchestrator`` agent
+type. An orchestrator's successors are its candidates (excluding itself)
+plus its failure target; a ``func:`` router's successors are the node
+names declared in its other edges.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from agentmap.models.execution_plan import ExecutionPlan, OrchestratorPlan
+from agentmap.models.node import Node
+from agentmap.services.orchestrator_node_filtering import NodeFilter
+
+ORCHESTRATOR_AGENT_TYPES = frozenset({"orchestrator"})
+
+_FUNC_PREFIX = "func:"
+
+
+def _edge_targets(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(target) for target in value]
+    return [str(value)]
+
+
+def _routing_kind(node: Node) -> str:
+    if (node.agent_type or "").strip().lower() in ORCHESTRATOR_AGENT_TYPES:
+        return "orchestrator"
+    if not node.edges:
+        return "none"
+    for value in node.edges.values():
+        if isinstance(value, str) and value.startswith(_FUNC_PREFIX):
+            return "function"
+    return "static"
+
+
+def _plan_orchestrator(node: Node, nodes: Dict[str, Node]) -> OrchestratorPlan:
+    node_filter = NodeFilter.filter_from_context(
+        node.context if isinstance(node.context, dict) else {}
+    )
+    kind, values = NodeFilter.parse_node_filter(node_filter)
+    registry = {name: {"type": other.agent_type or ""} for name, other in nodes.items()}
+    candidates = list(NodeFilter.apply_parsed_filter(registry, kind, values))
+    failure = node.edges.get("failure")
+    return OrchestratorPlan(
+        node_filter=str(node_filter),
+        filter_kind=kind,
+        filter_values=values,
+        candidates=candidates,
+        failure_target=failure if isinstance(failure, str) else None,
+    )
+
+
+def _successors(
+    name: str, node: Node, kind: str, plan: Optional[OrchestratorPlan], known: set
+) -> List[str]:
+    if kind == "orchestrator":
+        targets = [c for c in plan.candidates if c != name]
+        if plan.failure_target:
+            targets.append(plan.failure_target)
+    else:
+        targets = [
+            target
+            for value in node.edges.values()
+            for target in _edge_targets(value)
+            if not target.startswith(_FUNC_PREFIX)
+        ]
+    ordered: List[str] = []
+    for target in targets:
+        if target in known and target not in ordered:
+            ordered.append(target)
+    return ordered
+
+
+def _reachable(entry_point: Optional[str], successors: Dict[str, List[str]]) -> set:
+    if entry_point not in successors:
+        return set()
+    seen = {entry_point}
+    stack = [entry_point]
+    while stack:
+        for target in successors[stack.pop()]:
+            if target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+def _strongly_connected(
+    order: List[str], successors: Dict[str, List[str]]
+) -> List[List[str]]:
+    """Tarjan's algorithm, iterative; components in reverse topological order."""
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    on_stack: set = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+
+    for root in order:
+        if root in index:
+            continue
+        work = [(root, 0)]
+        while work:
+            name, child = work.pop()
+            if child == 0:
+                index[name] = low[name] = len(index)
+                stack.append(name)
+                on_stack.add(name)
+            targets = successors[name]
+            if child < len(targets):
+                work.append((name, child + 1))
+                target = targets[child]
+                if target not in index:
+                    work.append((target, 0))
+                elif target in on_stack:
+                    low[name] = min(low[name], index[target])
+                continue
+            if low[name] == index[name]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == name:
+                        break
+                components.append(component)
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[name])
+    return components
+
+
+def _levels(
+    order: List[str],
+    successors: Dict[str, List[str]],
+    components: List[List[str]],
+    reachable: set,
+) -> List[List[str]]:
+    component_of = {
+        name: i for i, component in enumerate(components) for name in component
+    }
+    level: Dict[int, int] = {}
+    # Tarjan yields sinks first, so walking components backwards visits
+    # every component after all of its predecessors.
+    for i in range(len(components) - 1, -1, -1):
+        if not any(name in reachable for name in components[i]):
+            continue
+        level.setdefault(i, 0)
+        for name in components[i]:
+            for target in successors[name]:
+                j = component_of[target]
+                if j != i:
+                    level[j] = max(level.get(j, 0), level[i] + 1)
+
+    grouped: Dict[int, List[str]] = {}
+    for name in order:
+        if name in reachable:
+            grouped.setdefault(level[component_of[name]], []).append(name)
+    return [grouped[depth] for depth in sorted(grouped)]
+
+
+def build_execution_plan(
+    nodes: Dict[str, Node], entry_point: Optional[str] = None
+) -> ExecutionPlan:
+    """Analyse *nodes* into an ``ExecutionPlan``.
+
+    Args:
+        nodes: Node name -> Node, in CSV order
+        entry_point: Starting node (defaults to the first node)
+
+    Returns:
+        ExecutionPlan for the graph
+    """
+    order = list(nodes)
+    if entry_point is None and order:
+        entry_point = order[0]
+    known = set(order)
+
+    routing: Dict[str, str] = {}
+    orchestrators: Dict[str, OrchestratorPlan] = {}
+    successors: Dict[str, List[str]] = {}
+    parallel_groups: List[Dict[str, Any]] = []
+    for name, node in nodes.items():
+        kind = _routing_kind(node)
+        routing[name] = kind
+        if kind == "orchestrator":
+            orchestrators[name] = _plan_orchestrator(node, nodes)
+        successors[name] = _successors(name, node, kind, orchestrators.get(name), known)
+        for condition, value in node.edges.items():
+            if isinstance(value, list) and len(value) > 1:
+                parallel_groups.append(
+                    {"node": name, "condition": condition, "targets": list(value)}
+                )
+
+    predecessors: Dict[str, List[str]] = {name: [] for name in order}
+    for name in order:
+        for target in successors[name]:
+            predecessors[target].append(name)
+
+    reachable = _reachable(entry_point, successors)
+    components = _strongly_connected(order, successors)
+    position = {name: i for i, name in enumerate(order)}
+    cycles = [
+        sorted(component, key=position.__getitem__)
+        for component in reversed(components)
+        if len(component) > 1 or component[0] in successors[component[0]]
+    ]
+
+    return ExecutionPlan(
+        entry_point=entry_point,
+        node_order=order,
+        routing=routing,
+        successors=successors,
+        reachable=[name for name in order if name in reachable],
+        unreachable=[name for name in order if name not in reachable],
+        levels=_levels(order, successors, components, reachable),
+        parallel_groups=parallel_groups,
+        fan_in={name: preds for name, preds in predecessors.items() if len(preds) > 1},
+        terminal_nodes=[name for name in order if routing[name] == "none"],
+        cycles=cycles,
+        orchestrators=orchestrators,
+    )
+
+
+def validate_execution_plan(plan: ExecutionPlan) -> List[str]:
+    """Warnings for unreachable nodes, cycles and empty orchestrator filters."""
+    warnings = []
+    if plan.unreachable:
+        warnings.append(
+            f"Nodes not reachable from entry point '{plan.entry_point}': "
+            f"{', '.join(plan.unreachable)}"
+        )
+    for cycle in plan.cycles:
+        path = " -> ".join(cycle + [cycle[0]])
+        warnings.append(f"Cycle detected: {path}")
+    for name, orchestrator in plan.orchestrators.items():
+        if not [c for c in orchestrator.candidates if c != name]:
+            warnings.append(
+                f"Orchestrator '{name}' node filter '{orchestrator.node_filter}' "
+                "matches no other nodes"
+            )
+    return warnings
+
+
+def execution_plan_to_dict(plan: ExecutionPlan) -> Dict[str, Any]:
+    """JSON-ready representation of *plan* for bundle serialization."""
+    return {
+        "version": plan.version,
+        "entry_point": plan.entry_point,
+        "node_order": plan.node_order,
+        "routing": plan.routing,
+        "successors": plan.successors,
+        "reachable": plan.reachable,
+        "unreachable": plan.unreachable,
+        "levels": plan.levels,
+        "parallel_groups": plan.parallel_groups,
+        "fan_in": plan.fan_in,
+        "terminal_nodes": plan.terminal_nodes,
+        "cycles": plan.cycles,
+        "orchestrators": {
+            name: {
+                "node_filter": orchestrator.node_filter,
+                "filter_kind": orchestrator.filter_kind,
+                "filter_values": orchestrator.filter_values,
+                "candidates": orchestrator.candidates,
+                "failure_target": orchestrator.failure_target,
+            }
+            for name, orchestrator in plan.orchestrators.items()
+        },
+    }
+
+
+def execution_plan_from_dict(data: Optional[Dict[str, Any]]) -> Optional[ExecutionPlan]:
+    """Inverse of ``execution_plan_to_dict``; ``None`` for missing or stale data."""
+    if not isinstance(data, dict) or data.get("version") != ExecutionPlan.version:
+        return None
+    return ExecutionPlan(
+        entry_point=data.get("entry_point"),
+        node_order=list(data.get("node_order", [])),
+        routing=dict(data.get("routing", {})),
+        successors={k: list(v) for k, v in data.get("successors", {}).items()},
+        reachable=list(data.get("reachable", [])),
+        unreachable=list(data.get("unreachable", [])),
+        levels=[list(level) for level in data.get("levels", [])],
+        parallel_groups=list(data.get("parallel_groups", [])),
+        fan_in={k: list(v) for k, v in data.get("fan_in", {}).items()},
+        terminal_nodes=list(data.get("terminal_nodes", [])),
+        cycles=[list(cycle) for cycle in data.get("cycles", [])],
+        orchestrators={
+            name: OrchestratorPlan(**orchestrator)
+            for name, orchestrator in data.get("orchestrators", {}).items()
+        },
+    )
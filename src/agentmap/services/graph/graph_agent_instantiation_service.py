@@ -57,6 +57,7 @@ class GraphAgentInstantiationService:
         declaration_registry_service: Optional[DeclarationRegistryService] = None,
         telemetry_service: Optional[Any] = None,
         file_path_service: Optional[FilePathService] = None,
+        node_result_cache: Optional[Any] = None,
     ):
         """
         Initialize with required services for agent instantiation.
@@ -74,6 +75,8 @@ class GraphAgentInstantiationService:
             telemetry_service: Optional telemetry service for agent instrumentation
             file_path_service: Optional path validation service. Forwarded to
                 GraphToolLoadingService to enforce path security on tool sources.
+            node_result_cache: Optional NodeResultCache attached to agents whose
+                nodes opt into memoization.
         """
         self.agent_factory = agent_factory_service
         self.agent_injection = agent_service_injection_service
@@ -83,6 +86,7 @@ class GraphAgentInstantiationService:
         self.graph_bundle_service = graph_bundle_service
         self.declaration_registry = declaration_registry_service
         self.telemetry_service = telemetry_service
+        self.node_result_cache = node_result_cache
         self.logger = logging_service.get_class_logger(self)
         self._graph_runner_service = None  # Late-bound to avoid circular dependency
 
@@ -323,6 +327,9 @@ class GraphAgentInstantiationService:
         # Phase 3: Tool Binding - Configure tools for ToolCapableAgent instances
         self._configure_tools(bundle, agent_instance, node_name)
 
+        # Attach the node result cache to memoized, side-effect-free agents
+        self._configure_node_result_cache(agent_instance, node_name)
+
         # Step 3: Store instance in node_registry
         bundle.node_instances[node_name] = agent_instance
 
@@ -405,6 +412,17 @@ class GraphAgentInstantiationService:
         except Exception:
             pass  # Telemetry wiring must never crash agent instantiation
 
+    def _configure_node_result_cache(self, agent_instance: Any, node_name: str) -> None:
+        """Attach the node result cache when the node opts into memoization."""
+        cache = self.node_result_cache
+        if cache is None or not hasattr(agent_instance, "configure_node_result_cache"):
+            return
+        if cache.should_memoize(agent_instance):
+            agent_instance.configure_node_result_cache(cache)
+            self.logger.debug(
+                f"[GraphAgentInstantiationService] Memoizing results of: {node_name}"
+            )
+
     def _inject_services(
         self,
         agent_instance: Any,
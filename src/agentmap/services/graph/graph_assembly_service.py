@@ -11,8 +11,10 @@ from typing import Any, Dict, Optional
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
 
+from agentmap.models.execution_plan import ExecutionPlan
 from agentmap.models.graph import Graph
 from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.execution_pool_service import ExecutionPoolService
 from agentmap.services.features_registry_service import FeaturesRegistryService
 from agentmap.services.function_resolution_service import FunctionResolutionService
 from agentmap.services.graph.edge_processor import EdgeProcessor
@@ -35,6 +37,7 @@ class GraphAssemblyService:
         function_resolution_service: FunctionResolutionService,
         graph_factory_service: GraphFactoryService,
         orchestrator_service: Any,
+        execution_pool_service: Optional[ExecutionPoolService] = None,
     ):
         self.config = app_config_service
         self.logger = logging_service.get_class_logger(self)
@@ -44,6 +47,7 @@ class GraphAssemblyService:
         self.function_resolution = function_resolution_service
         self.graph_factory_service = graph_factory_service
         self.orchestrator_service = orchestrator_service
+        self.execution_pools = execution_pool_service
 
         # Initialize helper services
         self.state_schema_builder = StateSchemaBuilder(
@@ -57,6 +61,7 @@ class GraphAssemblyService:
         self.builder = StateGraph(state_schema=state_schema)
         self.orchestrator_nodes: list = []
         self.orchestrator_node_registry: Optional[Dict[str, Any]] = None
+        self.execution_plan: Optional[ExecutionPlan] = None
         self.injection_stats = {
             "orchestrators_found": 0,
             "orchestrators_injected": 0,
@@ -81,6 +86,8 @@ class GraphAssemblyService:
 
     def _ensure_entry_point(self, graph: Graph) -> None:
         """Ensure graph has an entry point, detecting one if needed."""
+        if not graph.entry_point and self.execution_plan:
+            graph.entry_point = self.execution_plan.entry_point
         if not graph.entry_point:
             graph.entry_point = self.graph_factory_service.detect_entry_point(graph)
             self.logger.debug(f"Factory detected entry point: '{graph.entry_point}'")
@@ -98,14 +105,21 @@ class GraphAssemblyService:
         """Process all nodes and their edges."""
         node_names = list(graph.nodes.keys())
         self.logger.debug(f"Processing {len(node_names)} nodes: {node_names}")
+        routing = self.execution_plan.routing if self.execution_plan else {}
 
         for node_name, node in graph.nodes.items():
             if node_name not in agent_instances:
                 raise ValueError(f"No agent instance found for node: {node_name}")
             agent_instance = agent_instances[node_name]
-            self.add_node(node_name, agent_instance, use_async=use_async)
+            self.add_node(
+                node_name, agent_instance, use_async=use_async, graph_name=graph.name
+            )
             self.edge_processor.process_node_edges(
-                self.builder, node_name, node.edges, self.orchestrator_nodes
+                self.builder,
+                node_name,
+                node.edges,
+                self.orchestrator_nodes,
+                routing=routing.get(node_name),
             )
 
     def _add_orchestrator_routers(self, graph: Graph) -> None:
@@ -186,6 +200,11 @@ class GraphAssemblyService:
         self._validate_graph(graph)
         self._initialize_builder(graph)
         self.orchestrator_node_registry = orchestrator_node_registry
+        self.execution_plan = (
+            graph.execution_plan
+            if isinstance(graph.execution_plan, ExecutionPlan)
+            else None
+        )
         self._ensure_entry_point(graph)
         self._process_all_nodes(graph, agent_instances, use_async=use_async)
 
@@ -241,7 +260,13 @@ class GraphAssemblyService:
             use_async=True,
         )
 
-    def add_node(self, name: str, agent_instance: Any, use_async: bool = False) -> None:
+    def add_node(
+        self,
+        name: str,
+        agent_instance: Any,
+        use_async: bool = False,
+        graph_name: Optional[str] = None,
+    ) -> None:
         """Add a node to the graph with its agent instance.
 
         Args:
@@ -249,14 +274,21 @@ class GraphAssemblyService:
             agent_instance: Agent instance to bind.
             use_async: When True, bind agent_instance.run_async instead of
                 agent_instance.run.  Defaults to False for backwards compatibility.
+            graph_name: Graph the node belongs to; selects the per-graph
+                concurrency cap for executor-pool work.
         """
         if use_async:
+            runner = self._get_executor_runner(name, agent_instance, graph_name)
             if hasattr(agent_instance, "run_async"):
                 callable_ = agent_instance.run_async
             else:
                 _sync_run = agent_instance.run
 
-                async def _async_wrapper(state: Any, _run: Any = _sync_run) -> Any:
+                async def _async_wrapper(
+                    state: Any, _run: Any = _sync_run, _runner: Any = runner
+                ) -> Any:
+                    if _runner is not None:
+                        return await _runner(_run, state)
                     loop = asyncio.get_running_loop()
                     return await loop.run_in_executor(None, _run, state)
 
@@ -274,7 +306,7 @@ class GraphAssemblyService:
             try:
                 agent_instance.configure_orchestrator_service(self.orchestrator_service)
                 if self.orchestrator_node_registry:
-                    agent_instance.node_registry = self.orchestrator_node_registry
+                    self._inject_orchestrator_registry(name, agent_instance)
                     self.logger.debug(
                         f"Injected orchestrator service and node registry into '{name}'"
                     )
@@ -291,6 +323,48 @@ class GraphAssemblyService:
 
         self.logger.debug(f"Added node: '{name}' ({class_name})")
 
+    def _inject_orchestrator_registry(self, name: str, agent_instance: Any) -> None:
+        """Give an orchestrator its node registry, pre-filtered when planned.
+
+        With an execution plan the registry is narrowed to the node's
+        precomputed candidates, so the orchestrator skips re-applying its
+        node filter on every run.
+        """
+        registry = self.orchestrator_node_registry
+        planned = (
+            self.execution_plan.orchestrators.get(name) if self.execution_plan else None
+        )
+        candidates = {
+            node: registry[node]
+            for node in (planned.candidates if planned else ())
+            if node in registry
+        }
+        if not candidates:
+            agent_instance.node_registry = registry
+            return
+        agent_instance.node_registry = candidates
+        agent_instance.node_registry_prefiltered = True
+
+    def _get_executor_runner(
+        self, name: str, agent_instance: Any, graph_name: Optional[str]
+    ) -> Any:
+        """Bind the agent's sync work to its named executor pool, if configured.
+
+        Agents exposing configure_executor() (BaseAgent) route process_async()
+        through the runner; the runner is also returned for wrapping agents
+        that only have a sync run().
+        """
+        if self.execution_pools is None:
+            return None
+        pool = self.execution_pools.resolve_agent_pool(agent_instance)
+        runner = self.execution_pools.bind(pool, graph_name)
+        if hasattr(agent_instance, "configure_executor"):
+            agent_instance.configure_executor(
+                runner, in_process=self.execution_pools.is_process_pool(pool)
+            )
+        self.logger.debug(f"Node '{name}' sync work runs in executor pool '{pool}'")
+        return runner
+
     def get_injection_summary(self) -> Dict[str, int]:
         """Get summary of registry injection statistics."""
         return self.injection_stats.copy()
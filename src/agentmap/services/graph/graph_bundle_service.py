@@ -10,6 +10,12 @@ from agentmap.services.config.app_config_service import AppConfigService
 from agentmap.services.csv_graph_parser_service import CSVGraphParserService
 from agentmap.services.declaration_registry_service import DeclarationRegistryService
 from agentmap.services.file_path_service import FilePathService
+from agentmap.services.graph.execution_plan_builder import (
+    build_execution_plan,
+    execution_plan_from_dict,
+    execution_plan_to_dict,
+    validate_execution_plan,
+)
 from agentmap.services.graph.graph_registry_service import GraphRegistryService
 from agentmap.services.logging_service import LoggingService
 from agentmap.services.protocol_requirements_analyzer import (
@@ -613,6 +619,11 @@ class GraphBundleService:
             # Optimization metadata (Phase 2)
             "graph_structure": bundle.graph_structure or {},
             "protocol_mappings": bundle.protocol_mappings or {},
+            "execution_plan": (
+                execution_plan_to_dict(bundle.execution_plan)
+                if bundle.execution_plan
+                else None
+            ),
             # Validation metadata (Phase 3)
             "validation_metadata": bundle.validation_metadata or {},
             "missing_declarations": set_to_list(bundle.missing_declarations),
@@ -720,6 +731,9 @@ class GraphBundleService:
                 # Phase 2: Optimization metadata
                 graph_structure=data.get("graph_structure"),
                 protocol_mappings=data.get("protocol_mappings"),
+                # Bundles saved before execution plans existed are analysed now
+                execution_plan=execution_plan_from_dict(data.get("execution_plan"))
+                or build_execution_plan(nodes, data.get("entry_point")),
                 # Phase 3: Validation metadata
                 validation_metadata=data.get("validation_metadata"),
                 missing_declarations=list_to_set(
@@ -817,6 +831,7 @@ class GraphBundleService:
         # Phase 2: Optimization metadata
         # graph_structure = self._analyze_graph_structure(nodes) # this doesn't really do anythign right now... not needed.
         protocol_mappings = self._extract_protocol_mappings()
+        execution_plan = build_execution_plan(nodes, entry_point)
 
         # Phase 3: Validation metadata
         validation_metadata = self._generate_validation_metadata(nodes)
@@ -840,6 +855,7 @@ class GraphBundleService:
             # Phase 2: Optimization metadata
             # graph_structure=graph_structure,
             protocol_mappings=protocol_mappings,
+            execution_plan=execution_plan,
             # Phase 3: Validation metadata
             validation_metadata=validation_metadata,
         )
@@ -958,6 +974,11 @@ class GraphBundleService:
                 f"These agents will need to be defined before graph execution. execute 'scaffold' command"
             )
 
+        # Log routing problems found by the static execution plan
+        if bundle.execution_plan:
+            for warning in validate_execution_plan(bundle.execution_plan):
+                self.logger.warning(f"Graph '{bundle.graph_name}': {warning}")
+
         return bundle
 
     def lookup_bundle(self, csv_hash, graph_name):
@@ -38,6 +38,7 @@ class GraphCheckpointService(BaseCheckpointSaver):
         self,
         system_storage_manager: SystemStorageManager,
         logging_service: LoggingService,
+        execution_pool_service: Optional[Any] = None,
     ):
         """
         Initialize the graph checkpoint service.
@@ -45,9 +46,13 @@ class GraphCheckpointService(BaseCheckpointSaver):
         Args:
             system_storage_manager: System storage manager for checkpoint file storage
             logging_service: Logging service for obtaining logger instances
+            execution_pool_service: Optional ExecutionPoolService; async
+                checkpoint I/O then runs in its ``storage_io`` pool instead of
+                the default executor shared with agent work
         """
         super().__init__()
         self.logger = logging_service.get_class_logger(self)
+        self.execution_pools = execution_pool_service
 
         # Get file storage for checkpoints namespace
         # This creates: cache/checkpoints/ directory
@@ -283,12 +288,20 @@ class GraphCheckpointService(BaseCheckpointSaver):
     # ===== Async LangGraph interface (T-E04-F04-004) =====
     # LangGraph's ainvoke() calls aget_tuple / aput / aput_writes.
     # BaseCheckpointSaver raises NotImplementedError for all three.
-    # We delegate to the sync variants via asyncio.to_thread so the file I/O
-    # stays off the event loop without blocking it.
+    # We delegate to the sync variants on a worker thread so the file I/O
+    # stays off the event loop without blocking it: the storage_io pool when an
+    # ExecutionPoolService is wired in, asyncio.to_thread otherwise.
+
+    async def _run_io(self, fn: Any, *args: Any) -> Any:
+        """Run blocking checkpoint I/O on the storage_io pool or a worker thread."""
+        pools = self.execution_pools
+        if pools is not None and pools.has_pool(pools.STORAGE_IO_POOL):
+            return await pools.run(pools.STORAGE_IO_POOL, fn, *args)
+        return await asyncio.to_thread(fn, *args)
 
     async def aget_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
         """Async variant of get_tuple. Delegates via worker-thread seam."""
-        return await asyncio.to_thread(self.get_tuple, config)
+        return await self._run_io(self.get_tuple, config)
 
     async def aput(
         self,
@@ -298,9 +311,7 @@ class GraphCheckpointService(BaseCheckpointSaver):
         new_versions: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Async variant of put. Delegates via worker-thread seam."""
-        return await asyncio.to_thread(
-            self.put, config, checkpoint, metadata, new_versions
-        )
+        return await self._run_io(self.put, config, checkpoint, metadata, new_versions)
 
     async def aput_writes(
         self,
@@ -310,7 +321,7 @@ class GraphCheckpointService(BaseCheckpointSaver):
         task_path: str = "",
     ) -> None:
         """Async variant of put_writes. Delegates via worker-thread seam."""
-        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+        await self._run_io(self.put_writes, config, writes, task_id, task_path)
 
     # ===== GraphCheckpointServiceProtocol Implementation =====
 
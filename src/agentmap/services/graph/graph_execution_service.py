@@ -17,10 +17,14 @@ from agentmap.exceptions.agent_exceptions import ExecutionInterruptedException
 from agentmap.models.execution.result import ExecutionResult
 from agentmap.services.execution_policy_service import ExecutionPolicyService
 from agentmap.services.execution_tracking_service import ExecutionTrackingService
-from agentmap.services.logging_service import LoggingService
+from agentmap.services.logging_service import LoggingService, lazy_log
 from agentmap.services.state_adapter_service import StateAdapterService
 
 
+def _state_keys(state: Any) -> Any:
+    return list(state.keys()) if hasattr(state, "keys") else "N/A"
+
+
 @dataclass
 class _TerminalStreamResult:
     """D-8 typed terminal sentinel for ``stream_compiled_graph_async``.
@@ -113,7 +117,8 @@ class GraphExecutionService:
                 f"[GraphExecutionService] Starting graph invocation: {graph_name}"
             )
             self.logger.debug(
-                f"[GraphExecutionService] Initial state keys: {list(initial_state.keys())}"
+                "[GraphExecutionService] Initial state keys: %s",
+                lazy_log(list, initial_state.keys()),
             )
 
             # Invoke the graph (with optional config for checkpoint support)
@@ -132,11 +137,11 @@ class GraphExecutionService:
 
             # Log final state info
             self.logger.debug(
-                f"[GraphExecutionService] Final state type: {type(final_state)}"
+                "[GraphExecutionService] Final state type: %s", type(final_state)
             )
             self.logger.debug(
-                f"[GraphExecutionService] Final state keys: "
-                f"{list(final_state.keys()) if hasattr(final_state, 'keys') else 'N/A'}"
+                "[GraphExecutionService] Final state keys: %s",
+                lazy_log(_state_keys, final_state),
             )
 
             # Complete execution tracking
@@ -301,7 +306,8 @@ class GraphExecutionService:
                 f"[GraphExecutionService] Starting async graph invocation: {graph_name}"
             )
             self.logger.debug(
-                f"[GraphExecutionService] Initial state keys: {list(initial_state.keys())}"
+                "[GraphExecutionService] Initial state keys: %s",
+                lazy_log(list, initial_state.keys()),
             )
 
             # Prefer native async surface; fall back to worker-thread seam for
@@ -330,11 +336,11 @@ class GraphExecutionService:
                     raise
 
             self.logger.debug(
-                f"[GraphExecutionService] Async final state type: {type(final_state)}"
+                "[GraphExecutionService] Async final state type: %s", type(final_state)
             )
             self.logger.debug(
-                f"[GraphExecutionService] Async final state keys: "
-                f"{list(final_state.keys()) if hasattr(final_state, 'keys') else 'N/A'}"
+                "[GraphExecutionService] Async final state keys: %s",
+                lazy_log(_state_keys, final_state),
             )
 
             # Reuse the same tracking, policy, and metadata-injection path as
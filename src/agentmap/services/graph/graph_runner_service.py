@@ -17,7 +17,7 @@ import re
 import threading
 from contextlib import AsyncExitStack
 from pathlib import Path
-from typing import Any, AsyncGenerator, Dict, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from langgraph.errors import GraphInterrupt
 
@@ -37,12 +37,16 @@ from agentmap.services.graph.graph_bundle_service import GraphBundleService
 from agentmap.services.graph.graph_checkpoint_service import GraphCheckpointService
 from agentmap.services.graph.graph_execution_service import GraphExecutionService
 from agentmap.services.graph.runner import (
+    DEFAULT_MAP_CONCURRENCY,
     CheckpointManager,
     GraphInterruptHandler,
     create_bundle_context,
     create_node_registry_from_bundle,
+    map_states,
+    map_states_async,
 )
 from agentmap.services.interaction_handler_service import InteractionHandlerService
+from agentmap.services.llm.budget_ledger import budget_scope
 from agentmap.services.logging_service import LoggingService
 
 
@@ -185,8 +189,18 @@ class GraphRunnerService:
         if initial_state is None:
             initial_state = {}
 
-        if self._telemetry_service is not None:
-            return self._run_with_telemetry(
+        # Attribute LLM spend in this run to the graph (budget ledger).
+        with budget_scope(graph=graph_name):
+            if self._telemetry_service is not None:
+                return self._run_with_telemetry(
+                    bundle,
+                    initial_state,
+                    parent_graph_name,
+                    parent_tracker,
+                    is_subgraph,
+                    validate_agents,
+                )
+            return self._run_core(
                 bundle,
                 initial_state,
                 parent_graph_name,
@@ -194,14 +208,6 @@ class GraphRunnerService:
                 is_subgraph,
                 validate_agents,
             )
-        return self._run_core(
-            bundle,
-            initial_state,
-            parent_graph_name,
-            parent_tracker,
-            is_subgraph,
-            validate_agents,
-        )
 
     def _run_with_telemetry(
         self,
@@ -411,6 +417,7 @@ class GraphRunnerService:
                 name=bundle_with_instances.graph_name or "",
                 nodes=bundle_with_instances.nodes or {},
                 entry_point=bundle_with_instances.entry_point,
+                execution_plan=bundle_with_instances.execution_plan,
             )
 
             # Get agent instances from bundle's node_registry
@@ -975,6 +982,174 @@ class GraphRunnerService:
     # Async runner path (REQ-F-004, REQ-F-006, REQ-F-007, REQ-F-008)
     # ------------------------------------------------------------------
 
+    # ------------------------------------------------------------------
+    # Map execution: one prepared graph, many initial states
+    # ------------------------------------------------------------------
+
+    def run_map(
+        self,
+        bundle: GraphBundle,
+        item_states: List[dict],
+        max_concurrency: int = DEFAULT_MAP_CONCURRENCY,
+        parent_graph_name: Optional[str] = None,
+        parent_tracker: Optional[Any] = None,
+    ) -> List[ExecutionResult]:
+        """
+        Run one graph over many initial states, reusing a single assembly.
+
+        The scoped registry, agent instances and compiled graph are built
+        once and every item state is invoked against them on a bounded
+        thread pool.  Node executions of all items are recorded on one
+        tracker, linked to ``parent_tracker`` when given.
+
+        Args:
+            bundle: Prepared GraphBundle to run for every item
+            item_states: Initial state for each item
+            max_concurrency: Maximum number of items running at once
+            parent_graph_name: Name of the calling graph (for logging)
+            parent_tracker: Execution tracker of the calling graph
+
+        Returns:
+            One ExecutionResult per item, in item order; failed items carry
+            ``success=False`` and ``error`` (execution_summary is None)
+
+        Raises:
+            ValueError: If the graph needs checkpoint support (suspend or
+                human nodes cannot pause individual mapped items)
+            Exception: Any error from preparing the graph
+        """
+        item_states = list(item_states)
+        executable_graph, execution_tracker = self._prepare_map_run(
+            bundle, item_states, max_concurrency, parent_graph_name, async_mode=False
+        )
+        results = map_states(
+            executable_graph.invoke,
+            bundle.graph_name or "",
+            item_states,
+            max_concurrency,
+        )
+        self._finish_map_run(bundle, results, execution_tracker, parent_tracker)
+        return results
+
+    async def run_map_async(
+        self,
+        bundle: GraphBundle,
+        item_states: List[dict],
+        max_concurrency: int = DEFAULT_MAP_CONCURRENCY,
+        parent_graph_name: Optional[str] = None,
+        parent_tracker: Optional[Any] = None,
+    ) -> List[ExecutionResult]:
+        """Async ``run_map``: items run as tasks against an async assembly.
+
+        Same arguments, results and errors as ``run_map``; no thread is
+        used per item.
+        """
+        item_states = list(item_states)
+        executable_graph, execution_tracker = self._prepare_map_run(
+            bundle, item_states, max_concurrency, parent_graph_name, async_mode=True
+        )
+        results = await map_states_async(
+            executable_graph.ainvoke,
+            bundle.graph_name or "",
+            item_states,
+            max_concurrency,
+        )
+        self._finish_map_run(bundle, results, execution_tracker, parent_tracker)
+        return results
+
+    def _prepare_map_run(
+        self,
+        bundle: GraphBundle,
+        item_states: List[dict],
+        max_concurrency: int,
+        parent_graph_name: Optional[str],
+        async_mode: bool,
+    ) -> tuple:
+        """Build the registry, agents and compiled graph shared by all items.
+
+        Nested subgraph bundles are resolved once (``workflow_field``
+        directives read the first item) and injected into every item state.
+
+        Returns:
+            ``(executable_graph, execution_tracker)``
+        """
+        graph_name = bundle.graph_name or ""
+        self._check_missing_services(bundle)
+        if self.graph_bundle_service.requires_checkpoint_support(bundle):
+            raise ValueError(
+                f"Cannot map over graph '{graph_name}': it needs checkpoint "
+                f"support (suspend/human nodes), which mapped items do not have"
+            )
+
+        self.logger.info(
+            f"⭐ Mapping graph {graph_name} over {len(item_states)} item(s) "
+            f"(max_concurrency={max_concurrency}"
+            + (f", parent: {parent_graph_name})" if parent_graph_name else ")")
+        )
+
+        # Run-local registry, as in the async path: never written back to the
+        # shared bundle.
+        self.declaration_registry.create_scoped_registry_for_bundle(bundle)
+        execution_tracker = self.execution_tracking.create_tracker()
+
+        resolved: Dict[str, Any] = dict(item_states[0]) if item_states else {}
+        self._resolve_subgraph_bundles(bundle, resolved)
+        if "subgraph_bundles" in resolved:
+            for state in item_states:
+                state["subgraph_bundles"] = resolved["subgraph_bundles"]
+
+        bundle_with_instances = self.graph_instantiation.instantiate_agents(
+            bundle, execution_tracker
+        )
+        if not bundle_with_instances.node_instances:
+            raise RuntimeError("No agent instances found in bundle.node_registry")
+
+        from agentmap.models.graph import Graph
+
+        graph = Graph(
+            name=bundle_with_instances.graph_name or "",
+            nodes=bundle_with_instances.nodes or {},
+            entry_point=bundle_with_instances.entry_point,
+            execution_plan=bundle_with_instances.execution_plan,
+        )
+        node_definitions = create_node_registry_from_bundle(
+            bundle_with_instances, self.logger
+        )
+        assemble = (
+            self.graph_assembly.assemble_graph_async
+            if async_mode
+            else self.graph_assembly.assemble_graph
+        )
+        executable_graph = assemble(
+            graph=graph,
+            agent_instances=bundle_with_instances.node_instances,
+            orchestrator_node_registry=node_definitions,
+        )
+        return executable_graph, execution_tracker
+
+    def _finish_map_run(
+        self,
+        bundle: GraphBundle,
+        results: List[ExecutionResult],
+        execution_tracker: Any,
+        parent_tracker: Optional[Any],
+    ) -> None:
+        """Close the shared tracker, link it to the parent and log totals."""
+        graph_name = bundle.graph_name or ""
+        self.execution_tracking.complete_execution(execution_tracker)
+        if parent_tracker:
+            self.execution_tracking.record_subgraph_execution(
+                tracker=parent_tracker,
+                subgraph_name=graph_name,
+                subgraph_tracker=execution_tracker,
+            )
+        failed = sum(1 for result in results if not result.success)
+        log = self.logger.warning if failed else self.logger.info
+        log(
+            f"Mapped graph {graph_name} finished: "
+            f"{len(results) - failed} succeeded, {failed} failed"
+        )
+
     async def run_async(
         self,
         bundle: GraphBundle,
@@ -1021,8 +1196,17 @@ class GraphRunnerService:
         if initial_state is None:
             initial_state = {}
 
-        if self._telemetry_service is not None:
-            return await self._run_async_with_telemetry(
+        with budget_scope(graph=graph_name):
+            if self._telemetry_service is not None:
+                return await self._run_async_with_telemetry(
+                    bundle,
+                    initial_state,
+                    parent_graph_name,
+                    parent_tracker,
+                    is_subgraph,
+                    validate_agents,
+                )
+            return await self._run_core_async(
                 bundle,
                 initial_state,
                 parent_graph_name,
@@ -1030,14 +1214,6 @@ class GraphRunnerService:
                 is_subgraph,
                 validate_agents,
             )
-        return await self._run_core_async(
-            bundle,
-            initial_state,
-            parent_graph_name,
-            parent_tracker,
-            is_subgraph,
-            validate_agents,
-        )
 
     async def _run_async_with_telemetry(
         self,
@@ -1272,6 +1448,7 @@ class GraphRunnerService:
             name=bundle_with_instances.graph_name or "",
             nodes=bundle_with_instances.nodes or {},
             entry_point=bundle_with_instances.entry_point,
+            execution_plan=bundle_with_instances.execution_plan,
         )
 
         if not bundle_with_instances.node_instances:
@@ -0,0 +1,255 @@
+"""
+Content-addressed cache of node results for opt-in memoization.
+
+A memoized node's state update is stored under a SHA-256 digest of the
+agent class, the node's prompt and context (its CSV configuration,
+including output fields and model settings) and a canonical JSON encoding
+of the input values it read from state. Re-running a graph after editing
+one node therefore replays the unchanged upstream nodes from the cache
+instead of repeating their LLM or storage calls, while any change to a
+node's configuration or inputs produces a new key.
+
+Nodes opt in with ``memoize: true`` in their CSV Context, or all nodes do
+when ``execution.node_cache.memoize_all`` is set. Agents that declare
+``has_side_effects`` (writers, human interaction, tools, subgraphs) are
+never memoized. Inputs or results that are not JSON-serializable bypass
+the cache for that call.
+
+Entries live in one SQLite file with a TTL and entry-count / byte-size
+limits enforced by least-recently-used eviction. Editing an agent's code
+does not change its key; clear the cache (or change ``namespace``) after
+such edits.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# Bump when the key or value encoding changes.
+CACHE_FORMAT_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS node_results (
+    key TEXT PRIMARY KEY,
+    agent_class TEXT NOT NULL,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS node_results_accessed
+    ON node_results (accessed_at);
+"""
+
+_TRUE_STRINGS = ("1", "true", "yes", "on")
+
+
+@contextmanager
+def _connect(path: str) -> Iterator[sqlite3.Connection]:
+    # Autocommit mode; writes that evict open BEGIN IMMEDIATE explicitly.
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA busy_timeout = 30000")
+        yield conn
+    finally:
+        conn.close()
+
+
+def _canonical_json(value: Any) -> str:
+    """Deterministic JSON; raises TypeError/ValueError for unsupported values."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+class NodeResultCache:
+    """
+    SQLite-backed, content-addressed store of node state updates.
+
+    Constructed from the ``execution.node_cache`` config dict (see
+    ``AppConfigService.get_node_cache_config()``) and a logging service.
+    ``GraphAgentInstantiationService`` attaches it to every agent for which
+    ``should_memoize()`` is true.
+    """
+
+    def __init__(self, config: Dict[str, Any], logging_service):
+        self._logger = logging_service.get_class_logger(self)
+        self.path = config["path"]
+        self.namespace = str(config.get("namespace") or "")
+        self.ttl_seconds = float(config.get("ttl_seconds") or 0)
+        self.max_entries = int(config.get("max_entries") or 0)
+        self.max_bytes = int(config.get("max_bytes") or 0)
+        self.memoize_all = bool(config.get("memoize_all", False))
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with _connect(self.path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Memoization policy and keys
+    # ------------------------------------------------------------------
+
+    def should_memoize(self, agent: Any) -> bool:
+        """True if *agent*'s node opted in and the agent has no side effects."""
+        if getattr(agent, "has_side_effects", False):
+            return False
+        context = getattr(agent, "context", None) or {}
+        opted_in = context.get("memoize", self.memoize_all)
+        if isinstance(opted_in, str):
+            return opted_in.strip().lower() in _TRUE_STRINGS
+        return bool(opted_in)
+
+    def make_key(self, agent: Any, inputs: Dict[str, Any]) -> Optional[str]:
+        """Digest of the agent class, node configuration and input values.
+
+        Returns ``None`` when the configuration or inputs cannot be encoded
+        canonically, in which case the call is not memoized.
+        """
+        agent_class = type(agent)
+        try:
+            encoded = _canonical_json(
+                {
+                    "version": CACHE_FORMAT_VERSION,
+                    "namespace": self.namespace,
+                    "agent": f"{agent_class.__module__}.{agent_class.__qualname__}",
+                    "prompt": getattr(agent, "prompt", None),
+                    "context": getattr(agent, "context", None) or {},
+                    "inputs": inputs,
+                }
+            )
+        except (TypeError, ValueError) as e:
+            self._logger.debug(
+                f"[NodeResultCache] Not memoizing {getattr(agent, 'name', '?')}: {e}"
+            )
+            return None
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached state update for *key*, or ``None`` on a miss."""
+        now = time.time()
+        with _connect(self.path) as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM node_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM node_results WHERE key = ?", (key,))
+                return None
+            conn.execute(
+                "UPDATE node_results SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return json.loads(value)
+
+    def put(self, key: str, agent: Any, result: Dict[str, Any]) -> bool:
+        """Store *result* under *key*; returns False if it cannot be encoded."""
+        try:
+            value = _canonical_json(result)
+            # Tuples, non-string keys etc. would replay as a different value.
+            if json.loads(value) != result:
+                raise ValueError("result does not round-trip through JSON")
+        except (TypeError, ValueError) as e:
+            self._logger.debug(
+                f"[NodeResultCache] Result of {getattr(agent, 'name', '?')} "
+                f"is not cacheable: {e}"
+            )
+            return False
+
+        size = len(value.encode("utf-8"))
+        if self.max_bytes and size > self.max_bytes:
+            return False
+
+        agent_class = type(agent)
+        now = time.time()
+        with _connect(self.path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO node_results (key, agent_class, value, "
+                    "size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        f"{agent_class.__module__}.{agent_class.__qualname__}",
+                        value,
+                        size,
+                        now,
+                        now,
+                    ),
+                )
+                self._evict(conn, now)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return True
+
+    def purge_expired(self) -> int:
+        """Delete entries older than the TTL; returns the number removed."""
+        if not self.ttl_seconds:
+            return 0
+        with _connect(self.path) as conn:
+            cursor = conn.execute(
+                "DELETE FROM node_results WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            return cursor.rowcount
+
+    def clear(self) -> int:
+        """Delete every entry; returns the number removed."""
+        with _connect(self.path) as conn:
+            return conn.execute("DELETE FROM node_results").rowcount
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Entry count and total stored bytes."""
+        with _connect(self.path) as conn:
+            entries, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM node_results"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": total_bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _evict(self, conn, now: float) -> None:
+        if self.ttl_seconds:
+            conn.execute(
+                "DELETE FROM node_results WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            )
+        if not (self.max_entries or self.max_bytes):
+            return
+
+        entries, total_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM node_results"
+        ).fetchone()
+        excess_entries = max(0, entries - self.max_entries) if self.max_entries else 0
+        excess_bytes = max(0, total_bytes - self.max_bytes) if self.max_bytes else 0
+        if not (excess_entries or excess_bytes):
+            return
+
+        doomed = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM node_results ORDER BY accessed_at, created_at"
+        ):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            doomed.append(key)
+            excess_entries -= 1
+            excess_bytes -= size
+        conn.executemany(
+            "DELETE FROM node_results WHERE key = ?", [(key,) for key in doomed]
+        )
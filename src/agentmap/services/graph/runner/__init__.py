@@ -7,6 +7,11 @@ to improve maintainability and separation of concerns.
 
 from agentmap.services.graph.runner.checkpoint_manager import CheckpointManager
 from agentmap.services.graph.runner.interrupt_handler import GraphInterruptHandler
+from agentmap.services.graph.runner.map_executor import (
+    DEFAULT_MAP_CONCURRENCY,
+    map_states,
+    map_states_async,
+)
 from agentmap.services.graph.runner.utils import (
     create_bundle_context,
     create_node_registry_from_bundle,
@@ -17,4 +22,7 @@ __all__ = [
     "CheckpointManager",
     "create_node_registry_from_bundle",
     "create_bundle_context",
+    "DEFAULT_MAP_CONCURRENCY",
+    "map_states",
+    "map_states_async",
 ]
@@ -148,6 +148,7 @@ class CheckpointManager:
                 name=bundle_with_instances.graph_name or "",
                 nodes=bundle_with_instances.nodes or {},
                 entry_point=bundle_with_instances.entry_point,
+                execution_plan=bundle_with_instances.execution_plan,
             )
 
             executable_graph = self.graph_assembly.assemble_with_checkpoint(
@@ -331,6 +332,7 @@ class CheckpointManager:
                 name=bundle_with_instances.graph_name or "",
                 nodes=bundle_with_instances.nodes or {},
                 entry_point=bundle_with_instances.entry_point,
+                execution_plan=bundle_with_instances.execution_plan,
             )
 
             executable_graph = self.graph_assembly.assemble_with_checkpoint_async(
@@ -0,0 +1,106 @@
+"""
+Fan-out of one assembled graph over many initial states.
+
+Used by ``GraphRunnerService.run_map`` / ``run_map_async``: the graph is
+prepared once (registry, agents, assembly) and each item state is invoked
+against it, at most ``max_concurrency`` at a time.  Results come back in
+item order, one ``ExecutionResult`` per item; an item that raises or ends
+with ``last_action_success`` false is reported as failed without affecting
+the others.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List
+
+from agentmap.models.execution.result import ExecutionResult
+
+DEFAULT_MAP_CONCURRENCY = 4
+
+
+def _item_result(
+    graph_name: str, final_state: Any, start_time: float
+) -> ExecutionResult:
+    success = True
+    error = None
+    if (
+        isinstance(final_state, dict)
+        and final_state.get("last_action_success") is False
+    ):
+        success = False
+        error = final_state.get("error") or "Subgraph ended with a failed action"
+    return ExecutionResult(
+        graph_name=graph_name,
+        final_state=final_state,
+        execution_summary=None,
+        success=success,
+        total_duration=time.time() - start_time,
+        error=error,
+    )
+
+
+def _error_result(
+    graph_name: str, state: Dict[str, Any], error: Exception, start_time: float
+) -> ExecutionResult:
+    return ExecutionResult(
+        graph_name=graph_name,
+        final_state=state,
+        execution_summary=None,
+        success=False,
+        total_duration=time.time() - start_time,
+        error=str(error) or type(error).__name__,
+    )
+
+
+def map_states(
+    invoke: Callable[[Dict[str, Any]], Any],
+    graph_name: str,
+    states: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_MAP_CONCURRENCY,
+) -> List[ExecutionResult]:
+    """Run ``invoke`` over ``states`` on a bounded thread pool, in order."""
+
+    def run_item(state: Dict[str, Any]) -> ExecutionResult:
+        start_time = time.time()
+        try:
+            return _item_result(graph_name, invoke(state), start_time)
+        except Exception as e:
+            return _error_result(graph_name, state, e, start_time)
+
+    if not states:
+        return []
+    workers = max(1, min(int(max_concurrency), len(states)))
+    if workers == 1:
+        return [run_item(state) for state in states]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="agentmap-map"
+    ) as pool:
+        return list(pool.map(run_item, states))
+
+
+async def map_states_async(
+    ainvoke: Callable[[Dict[str, Any]], Awaitable[Any]],
+    graph_name: str,
+    states: List[Dict[str, Any]],
+    max_concurrency: int = DEFAULT_MAP_CONCURRENCY,
+) -> List[ExecutionResult]:
+    """Await ``ainvoke`` over ``states``, at most ``max_concurrency`` at once.
+
+    Items run as tasks on the current loop (no thread per item).
+    Cancellation propagates to every in-flight item.
+    """
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def run_item(state: Dict[str, Any]) -> ExecutionResult:
+        async with semaphore:
+            start_time = time.time()
+            try:
+                return _item_result(graph_name, await ainvoke(state), start_time)
+            except Exception as e:
+                return _error_result(graph_name, state, e, start_time)
+
+    return list(await asyncio.gather(*(run_item(state) for state in states)))
+
+
+__all__ = ["DEFAULT_MAP_CONCURRENCY", "map_states", "map_states_async"]
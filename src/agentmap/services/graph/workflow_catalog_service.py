@@ -0,0 +1,434 @@
+"""
+WorkflowCatalogService for AgentMap.
+
+Keeps a persistent catalog of the workflow CSVs in the CSV repository (path,
+size, mtime, content hash, graph names, node counts, agent types) so that
+listing and searching workflows does not re-read every CSV.
+
+Each refresh walks the repository and compares every file's stat signature
+(size, mtime) with the catalog; only files whose signature changed are read.
+A changed signature with an unchanged content hash just updates the
+signature, anything else is re-parsed.  With ``workflow_catalog.watch``
+enabled a background poller does the walk, and listing calls are served
+straight from memory.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.csv_graph_parser.column_config import CSVColumnConfig
+from agentmap.services.logging_service import LoggingService
+
+# A file modified this close to the moment it was read may change again
+# without its mtime moving (coarse filesystem timestamps), so its signature
+# is not trusted on the next refresh and the content hash is checked instead.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class WorkflowCatalogService:
+    """
+    Incrementally maintained catalog of the workflows in the CSV repository.
+
+    Thread-safe; refreshes are serialized so concurrent listing calls share
+    one repository walk.
+    """
+
+    CATALOG_SCHEMA_VERSION = "1.0.0"
+
+    def __init__(
+        self,
+        app_config_service: AppConfigService,
+        logging_service: LoggingService,
+    ):
+        """Initialize WorkflowCatalogService with required dependencies.
+
+        Args:
+            app_config_service: Application configuration service
+            logging_service: Logging service for proper dependency injection
+        """
+        self.config = app_config_service
+        self.logger = logging_service.get_class_logger(self)
+        self.catalog_path = app_config_service.get_workflow_catalog_config()[
+            "catalog_path"
+        ]
+        self._column_config = CSVColumnConfig()
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._repository: Optional[str] = None
+        self._loaded = False
+        self._dirty = False
+
+        self._watch_thread: Optional[threading.Thread] = None
+        self._watch_stop = threading.Event()
+
+    # --- Queries ----------------------------------------------------------------
+
+    def list_workflows(self) -> List[Dict[str, Any]]:
+        """All catalogued workflows, sorted by workflow name."""
+        self._ensure_fresh()
+        with self._lock:
+            entries = [dict(entry) for entry in self._entries.values()]
+        return sorted(entries, key=lambda entry: entry["workflow"])
+
+    def get_workflow(self, workflow_name: str) -> Optional[Dict[str, Any]]:
+        """Catalog entry for one workflow (e.g. ``"sub/orders"``), if present."""
+        self._ensure_fresh()
+        with self._lock:
+            for entry in self._entries.values():
+                if entry["workflow"] == workflow_name:
+                    return dict(entry)
+        return None
+
+    def find_graphs(
+        self,
+        search: Optional[str] = None,
+        agent_type: Optional[str] = None,
+        workflow: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Graph-level records matching the filters, sorted by graph then workflow.
+
+        Args:
+            search: Case-insensitive substring of the graph or workflow name
+            agent_type: Only graphs using this agent type (case-insensitive)
+            workflow: Only graphs from this workflow
+
+        Returns:
+            One record per (workflow, graph): the workflow's catalog fields
+            plus ``graph_name``, ``node_count`` and the graph's ``agent_types``
+        """
+        needle = search.lower() if search else None
+        wanted_type = agent_type.lower() if agent_type else None
+        records = []
+        for entry in self.list_workflows():
+            if workflow is not None and entry["workflow"] != workflow:
+                continue
+            for graph in entry["graphs"]:
+                if needle and not (
+                    needle in graph["name"].lower()
+                    or needle in entry["workflow"].lower()
+                ):
+                    continue
+                if wanted_type and wanted_type not in (
+                    t.lower() for t in graph["agent_types"]
+                ):
+                    continue
+                record = {k: v for k, v in entry.items() if k != "graphs"}
+                record.update(
+                    graph_name=graph["name"],
+                    node_count=graph["node_count"],
+                    agent_types=graph["agent_types"],
+                )
+                records.append(record)
+        records.sort(key=lambda r: (r["graph_name"], r["workflow"]))
+        return records
+
+    # --- Maintenance ------------------------------------------------------------
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the catalog in line with the repository.
+
+        Args:
+            force: Re-read and re-parse every file regardless of its signature
+
+        Returns:
+            Counts of ``added``, ``updated``, ``removed`` and ``unchanged`` files
+        """
+        repository = self.config.get_csv_repository_path()
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        with self._lock:
+            self._ensure_loaded(repository)
+            previous = self._entries
+            current: Dict[str, Dict[str, Any]] = {}
+
+            for file_path, relative, file_stat in self._scan(repository):
+                entry = previous.get(relative)
+                if (
+                    entry is not None
+                    and not force
+                    and self._signature_trusted(entry, file_stat)
+                ):
+                    current[relative] = entry
+                    stats["unchanged"] += 1
+                    continue
+
+                try:
+                    with open(file_path, "rb") as f:
+                        content = f.read()
+                except OSError as e:
+                    self.logger.debug(f"Skipping unreadable workflow {file_path}: {e}")
+                    continue
+
+                content_hash = hashlib.sha256(content).hexdigest()
+                if (
+                    entry is not None
+                    and not force
+                    and entry["content_hash"] == content_hash
+                ):
+                    entry = dict(entry)
+                    stats["unchanged"] += 1
+                else:
+                    workflow_name = relative[: -len(".csv")]
+                    entry = {
+                        "workflow": workflow_name,
+                        "filename": os.path.basename(file_path),
+                        "file_path": file_path,
+                        "content_hash": content_hash,
+                        **self._parse_workflow(content, workflow_name),
+                    }
+                    stats["updated" if relative in previous else "added"] += 1
+
+                if relative not in previous or (
+                    previous[relative]["file_size"],
+                    previous[relative]["mtime_ns"],
+                ) != (file_stat.st_size, file_stat.st_mtime_ns):
+                    self._dirty = True
+                entry.update(self._stat_fields(file_stat))
+                current[relative] = entry
+
+            stats["removed"] = len(set(previous) - set(current))
+            if stats["removed"]:
+                self._dirty = True
+            self._entries = current
+            self._persist_catalog()
+
+        if stats["added"] or stats["updated"] or stats["removed"]:
+            self.logger.debug(
+                f"Workflow catalog refreshed: {stats['added']} added, "
+                f"{stats['updated']} updated, {stats['removed']} removed"
+            )
+        return stats
+
+    def start_watching(self, poll_interval: Optional[float] = None) -> None:
+        """
+        Keep the catalog fresh from a daemon thread.
+
+        While watching, listing calls are answered from memory without
+        walking the repository.  Idempotent.
+        """
+        if poll_interval is None:
+            poll_interval = self.config.get_workflow_catalog_config()[
+                "poll_interval_seconds"
+            ]
+        with self._lock:
+            if self._watch_thread is not None and self._watch_thread.is_alive():
+                return
+            self.refresh()
+            self._watch_stop.clear()
+            self._watch_thread = threading.Thread(
+                target=self._watch_loop,
+                args=(float(poll_interval),),
+                name="agentmap-workflow-catalog",
+                daemon=True,
+            )
+            self._watch_thread.start()
+        self.logger.info(
+            f"Watching workflow repository every {poll_interval:g}s for catalog updates"
+        )
+
+    def stop_watching(self) -> None:
+        """Stop the background poller, if running."""
+        self._watch_stop.set()
+        thread = self._watch_thread
+        if thread is not None:
+            thread.join(timeout=5.0)
+        self._watch_thread = None
+
+    @property
+    def is_watching(self) -> bool:
+        """Whether the background poller is running."""
+        return self._watch_thread is not None and self._watch_thread.is_alive()
+
+    # --- Internals --------------------------------------------------------------
+
+    def _ensure_fresh(self) -> None:
+        if self.is_watching:
+            return
+        if self.config.get_workflow_catalog_config()["watch"]:
+            self.start_watching()
+        else:
+            self.refresh()
+
+    def _watch_loop(self, poll_interval: float) -> None:
+        while not self._watch_stop.wait(poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                self.logger.warning(f"Workflow catalog refresh failed: {e}")
+
+    @staticmethod
+    def _scan(repository: Path):
+        """Yield (absolute path, relative POSIX path, stat) for each CSV."""
+        root = str(repository)
+        if not os.path.isdir(root):
+            return
+        for directory, _, filenames in os.walk(root):
+            for filename in filenames:
+                if not filename.endswith(".csv"):
+                    continue
+                file_path = os.path.join(directory, filename)
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    continue
+                relative = os.path.relpath(file_path, root).replace(os.sep, "/")
+                yield file_path, relative, file_stat
+
+    @staticmethod
+    def _stat_fields(file_stat: os.stat_result) -> Dict[str, Any]:
+        return {
+            "file_size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+            "last_modified": file_stat.st_mtime,
+            "verified_ns": time.time_ns(),
+        }
+
+    @staticmethod
+    def _signature_trusted(entry: Dict[str, Any], file_stat: os.stat_result) -> bool:
+        if (entry["file_size"], entry["mtime_ns"]) != (
+            file_stat.st_size,
+            file_stat.st_mtime_ns,
+        ):
+            return False
+        return entry["mtime_ns"] < entry["verified_ns"] - _RACY_WINDOW_NS
+
+    def _parse_workflow(self, content: bytes, workflow_name: str) -> Dict[str, Any]:
+        """
+        Graph names, node counts and agent types of one workflow CSV.
+
+        Reads only the GraphName and AgentType columns (any of their aliases).
+        A file without a GraphName column (or without any graph rows) is
+        catalogued as a single graph named after the workflow; an unparseable
+        one likewise, with ``parse_error`` set.
+        """
+        graphs: Dict[str, Dict[str, Any]] = {}
+        total_nodes = 0
+        parse_error = None
+        try:
+            reader = csv.reader(io.StringIO(content.decode("utf-8-sig")))
+            header = [
+                self._column_config.get_canonical_name(column.strip())
+                for column in next(reader, [])
+            ]
+            graph_index = self._column_index(header, "GraphName")
+            agent_index = self._column_index(header, "AgentType")
+
+            for row in reader:
+                if not any(cell.strip() for cell in row):
+                    continue
+                total_nodes += 1
+                if graph_index is None:
+                    graph_name = workflow_name
+                else:
+                    graph_name = self._cell(row, graph_index)
+                    if not graph_name:
+                        continue
+                graph = graphs.setdefault(
+                    graph_name,
+                    {"name": graph_name, "node_count": 0, "agent_types": set()},
+                )
+                graph["node_count"] += 1
+                graph["agent_types"].add(self._cell(row, agent_index) or "default")
+        except (UnicodeDecodeError, csv.Error) as e:
+            parse_error = str(e)
+            graphs = {}
+            total_nodes = 0
+
+        if not graphs:
+            graphs[workflow_name] = {
+                "name": workflow_name,
+                "node_count": 0,
+                "agent_types": set(),
+            }
+
+        graph_list = [
+            {**graph, "agent_types": sorted(graph["agent_types"])}
+            for graph in graphs.values()
+        ]
+        return {
+            "graphs": graph_list,
+            "graph_count": len(graph_list),
+            "total_nodes": total_nodes,
+            "agent_types": sorted(
+                {t for graph in graph_list for t in graph["agent_types"]}
+            ),
+            "parse_error": parse_error,
+        }
+
+    @staticmethod
+    def _column_index(header: List[str], column: str) -> Optional[int]:
+        return header.index(column) if column in header else None
+
+    @staticmethod
+    def _cell(row: List[str], index: Optional[int]) -> str:
+        if index is None or index >= len(row):
+            return ""
+        return row[index].strip()
+
+    # --- Persistence ------------------------------------------------------------
+
+    def _ensure_loaded(self, repository: Path) -> None:
+        """Load the persisted catalog once, discarding it if it is for another repository."""
+        repository_key = str(Path(repository).resolve())
+        if self._loaded and self._repository == repository_key:
+            return
+        self._entries = {}
+        self._repository = repository_key
+        self._loaded = True
+
+        try:
+            with open(self.catalog_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"Ignoring unreadable workflow catalog {self.catalog_path}: {e}"
+            )
+            return
+
+        if not data:
+            return
+        if data.get("version") != self.CATALOG_SCHEMA_VERSION:
+            self.logger.info("Workflow catalog schema changed, rebuilding")
+            return
+        if data.get("repository") != repository_key:
+            self.logger.info("Workflow catalog is for another repository, rebuilding")
+            return
+        self._entries = data.get("entries", {})
+        self.logger.debug(f"Loaded {len(self._entries)} workflows from catalog")
+
+    def _persist_catalog(self) -> None:
+        """Write the catalog atomically (temp file + ``os.replace``)."""
+        if not self._dirty:
+            return
+        data = {
+            "version": self.CATALOG_SCHEMA_VERSION,
+            "repository": self._repository,
+            "entries": self._entries,
+        }
+        tmp_path = None
+        try:
+            directory = os.path.dirname(self.catalog_path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump(data, tmp)
+            os.replace(tmp_path, self.catalog_path)
+            self._dirty = False
+        except OSError as e:
+            self.logger.error(f"Failed to persist workflow catalog: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
@@ -0,0 +1,430 @@
+"""
+SQLite-backed durable queue for asynchronous workflow execution jobs.
+
+The HTTP adapter's submit/poll/cancel routes and the runtime worker pool
+(``agentmap.runtime.job_ops``) share this queue.  It lives in a single
+SQLite file so that the API process and any number of worker processes on
+the same host see one consistent queue; every claim runs inside a
+``BEGIN IMMEDIATE`` transaction, so two workers can never claim the same job.
+
+Scheduling order is ``priority DESC, created_at ASC`` restricted to graphs
+that are below their concurrency cap (``max_concurrent_per_graph`` with
+optional per-graph overrides; 0 means uncapped).  Finished jobs keep their
+result until ``expires_at`` (finish time + ``result_ttl_seconds``), after which
+``purge_expired`` removes them.
+"""
+
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from agentmap.models.execution.job import ExecutionJob, JobStatus
+from agentmap.services.logging_service import LoggingService
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    graph_name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    inputs TEXT NOT NULL,
+    execution_id TEXT,
+    force_create INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    expires_at REAL,
+    heartbeat_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker_id TEXT,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_claim ON jobs (status, priority DESC, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_graph_status ON jobs (graph_name, status);
+CREATE INDEX IF NOT EXISTS idx_jobs_expires ON jobs (expires_at);
+"""
+
+
+def _json_default(value: Any) -> Any:
+    """``json.dumps`` fallback for runtime payloads (summaries, datetimes)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+class JobQueueService:
+    """
+    Durable, multi-process-safe job queue stored in a local SQLite file.
+
+    Connections are opened per operation (SQLite connections are not safe to
+    share across the threads ``asyncio.to_thread`` hands work to), with WAL
+    journaling so pollers never block the worker that is committing a result.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        logging_service: LoggingService,
+        result_ttl_seconds: int = 86400,
+        max_concurrent_per_graph: int = 0,
+        graph_limits: Optional[Mapping[str, int]] = None,
+        max_attempts: int = 3,
+    ) -> None:
+        self._db_path = str(db_path)
+        self.logger = logging_service.get_class_logger(self)
+        self.result_ttl_seconds = int(result_ttl_seconds)
+        self.max_concurrent_per_graph = int(max_concurrent_per_graph)
+        self.graph_limits: Dict[str, int] = dict(graph_limits or {})
+        self.max_attempts = max(1, int(max_attempts))
+
+        parent = os.path.dirname(self._db_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+        self.logger.debug(f"[JobQueueService] Initialized queue at {self._db_path}")
+
+    @property
+    def db_path(self) -> str:
+        """Path of the backing SQLite file."""
+        return self._db_path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # isolation_level=None: autocommit, with explicit BEGIN IMMEDIATE where
+        # a read-then-write must be atomic across processes.
+        conn = sqlite3.connect(self._db_path, timeout=30.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        graph_name: str,
+        inputs: Optional[Dict[str, Any]] = None,
+        *,
+        priority: int = 0,
+        execution_id: Optional[str] = None,
+        force_create: bool = False,
+    ) -> ExecutionJob:
+        """Enqueue a workflow execution and return its ``queued`` record."""
+        job = ExecutionJob(
+            job_id=f"job_{uuid.uuid4().hex}",
+            graph_name=graph_name,
+            status=JobStatus.QUEUED,
+            inputs=dict(inputs or {}),
+            priority=int(priority),
+            execution_id=execution_id,
+            force_create=bool(force_create),
+            created_at=time.time(),
+        )
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (job_id, graph_name, status, priority, inputs, "
+                "execution_id, force_create, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    job.job_id,
+                    job.graph_name,
+                    job.status.value,
+                    job.priority,
+                    json.dumps(job.inputs, default=_json_default),
+                    job.execution_id,
+                    int(job.force_create),
+                    job.created_at,
+                ),
+            )
+        self.logger.debug(
+            f"[JobQueueService] Queued {job.job_id} for graph '{graph_name}' "
+            f"(priority={job.priority})"
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[ExecutionJob]:
+        """Return the job record, or ``None`` if unknown or already purged."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(
+        self,
+        *,
+        status: Optional[str] = None,
+        graph_name: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[ExecutionJob]:
+        """List jobs, newest first, optionally filtered by status and graph."""
+        clauses: List[str] = []
+        params: List[Any] = []
+        if status:
+            clauses.append("status = ?")
+            params.append(JobStatus(status).value)
+        if graph_name:
+            clauses.append("graph_name = ?")
+            params.append(graph_name)
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.extend([int(limit), int(offset)])
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM jobs {where}"
+                "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                params,
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def count_by_status(self) -> Dict[str, int]:
+        """Return ``{status: count}`` for every status currently present."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+            ).fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def request_cancel(self, job_id: str) -> Optional[ExecutionJob]:
+        """
+        Cancel a job.
+
+        A queued job is cancelled immediately.  A running job is flagged with
+        ``cancel_requested``; the worker that owns it observes the flag on its
+        next heartbeat and cancels the execution.  Terminal jobs are returned
+        unchanged.  Returns ``None`` when the job does not exist.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT status FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row["status"] == JobStatus.QUEUED.value:
+                conn.execute(
+                    "UPDATE jobs SET status = ?, cancel_requested = 1, "
+                    "finished_at = ?, expires_at = ? WHERE job_id = ?",
+                    (
+                        JobStatus.CANCELLED.value,
+                        now,
+                        now + self.result_ttl_seconds,
+                        job_id,
+                    ),
+                )
+            elif row["status"] == JobStatus.RUNNING.value:
+                conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ?",
+                    (job_id,),
+                )
+        return self.get(job_id)
+
+    # ------------------------------------------------------------------
+    # Worker side
+    # ------------------------------------------------------------------
+
+    def limit_for(self, graph_name: str) -> int:
+        """Concurrency cap for ``graph_name`` (0 = uncapped)."""
+        return int(self.graph_limits.get(graph_name, self.max_concurrent_per_graph))
+
+    def claim_next(self, worker_id: str) -> Optional[ExecutionJob]:
+        """
+        Atomically claim the highest-priority runnable job for ``worker_id``.
+
+        Jobs whose graph is at its concurrency cap are skipped (not blocked on),
+        so a saturated graph never starves lower-priority work for other graphs.
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            running = conn.execute(
+                "SELECT graph_name, COUNT(*) AS n FROM jobs "
+                "WHERE status = ? GROUP BY graph_name",
+                (JobStatus.RUNNING.value,),
+            ).fetchall()
+            saturated = [
+                row["graph_name"]
+                for row in running
+                if 0 < self.limit_for(row["graph_name"]) <= row["n"]
+            ]
+            exclude = ""
+            if saturated:
+                exclude = f"AND graph_name NOT IN ({','.join('?' * len(saturated))}) "
+            row = conn.execute(
+                f"SELECT job_id FROM jobs WHERE status = ? {exclude}"
+                "ORDER BY priority DESC, created_at ASC LIMIT 1",
+                (JobStatus.QUEUED.value, *saturated),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = ?, started_at = ?, "
+                "heartbeat_at = ?, attempts = attempts + 1 WHERE job_id = ?",
+                (JobStatus.RUNNING.value, worker_id, now, now, row["job_id"]),
+            )
+            claimed = conn.execute(
+                "SELECT * FROM jobs WHERE job_id = ?", (row["job_id"],)
+            ).fetchone()
+        return self._row_to_job(claimed)
+
+    def heartbeat(self, job_id: str) -> bool:
+        """Record liveness for a running job; return its ``cancel_requested`` flag."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE jobs SET heartbeat_at = ? WHERE job_id = ? AND status = ?",
+                (time.time(), job_id, JobStatus.RUNNING.value),
+            )
+            row = conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def finish(
+        self,
+        job_id: str,
+        status: JobStatus,
+        *,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """
+        Move a running job to a terminal ``status`` and start its retention TTL.
+
+        Returns ``False`` if the job was no longer running (e.g. purged or
+        re-queued by stale-job recovery), in which case nothing is written.
+        """
+        if not JobStatus(status).is_terminal:
+            raise ValueError(f"finish() requires a terminal status, got {status!r}")
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, "
+                "finished_at = ?, expires_at = ? WHERE job_id = ? AND status = ?",
+                (
+                    JobStatus(status).value,
+                    (
+                        json.dumps(result, default=_json_default)
+                        if result is not None
+                        else None
+                    ),
+                    error,
+                    now,
+                    now + self.result_ttl_seconds,
+                    job_id,
+                    JobStatus.RUNNING.value,
+                ),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, job_id: str) -> bool:
+        """Return a running job to the queue (worker shutdown), keeping its attempts."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = NULL, started_at = NULL, "
+                "heartbeat_at = NULL WHERE job_id = ? AND status = ?",
+                (JobStatus.QUEUED.value, job_id, JobStatus.RUNNING.value),
+            )
+        return cursor.rowcount == 1
+
+    def recover_stale(self, stale_after_seconds: float) -> int:
+        """
+        Re-queue running jobs whose worker stopped heartbeating (crash, kill).
+
+        Jobs that already used ``max_attempts`` are failed instead, so a
+        workflow that reliably crashes its worker cannot loop forever.
+        Returns the number of jobs recovered (re-queued or failed).
+        """
+        now = time.time()
+        cutoff = now - float(stale_after_seconds)
+        with self._transaction() as conn:
+            stale = conn.execute(
+                "SELECT job_id, attempts FROM jobs WHERE status = ? "
+                "AND COALESCE(heartbeat_at, started_at, 0) < ?",
+                (JobStatus.RUNNING.value, cutoff),
+            ).fetchall()
+            for row in stale:
+                if row["attempts"] >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, error = ?, finished_at = ?, "
+                        "expires_at = ? WHERE job_id = ?",
+                        (
+                            JobStatus.FAILED.value,
+                            f"Worker lost after {row['attempts']} attempt(s)",
+                            now,
+                            now + self.result_ttl_seconds,
+                            row["job_id"],
+                        ),
+                    )
+                else:
+                    conn.execute(
+                        "UPDATE jobs SET status = ?, worker_id = NULL, "
+                        "started_at = NULL, heartbeat_at = NULL WHERE job_id = ?",
+                        (JobStatus.QUEUED.value, row["job_id"]),
+                    )
+        if stale:
+            self.logger.warning(
+                f"[JobQueueService] Recovered {len(stale)} stale running job(s)"
+            )
+        return len(stale)
+
+    def purge_expired(self, now: Optional[float] = None) -> int:
+        """Delete finished jobs whose retention TTL has elapsed; return the count."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time() if now is None else now,),
+            )
+        if cursor.rowcount:
+            self.logger.debug(
+                f"[JobQueueService] Purged {cursor.rowcount} expired job(s)"
+            )
+        return cursor.rowcount
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> ExecutionJob:
+        return ExecutionJob(
+            job_id=row["job_id"],
+            graph_name=row["graph_name"],
+            status=JobStatus(row["status"]),
+            inputs=json.loads(row["inputs"]) if row["inputs"] else {},
+            priority=row["priority"],
+            execution_id=row["execution_id"],
+            force_create=bool(row["force_create"]),
+            created_at=row["created_at"],
+            started_at=row["started_at"],
+            finished_at=row["finished_at"],
+            expires_at=row["expires_at"],
+            attempts=row["attempts"],
+            cancel_requested=bool(row["cancel_requested"]),
+            worker_id=row["worker_id"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+        )
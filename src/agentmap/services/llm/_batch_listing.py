@@ -0,0 +1,58 @@
+"""
+Shared multi-batch polling via provider list endpoints.
+
+Anthropic and OpenAI both expose a paginated, newest-first batch listing that
+returns the same objects as ``retrieve``.  Polling many in-flight batches from
+a listing costs one call per page instead of one call per batch, so adapters
+implement an optional ``poll_many`` on top of ``poll_via_listing``.
+
+Usage::
+
+    from agentmap.services.llm._batch_listing import poll_via_listing
+
+    results = poll_via_listing(
+        ids, self._client.batches.list(limit=100), self._to_poll_result, self.poll
+    )
+"""
+
+from typing import Any, Callable, Dict, Iterable, List
+
+from agentmap.models.llm_batch import BatchPollResult
+
+# Upper bound on listed batches scanned per call; anything not seen by then
+# (old batches deep in the listing) is polled individually instead.
+DEFAULT_MAX_LIST_SCAN = 1000
+
+
+def poll_via_listing(
+    provider_batch_ids: List[str],
+    listing: Iterable[Any],
+    to_poll_result: Callable[[Any], BatchPollResult],
+    poll_one: Callable[[str], BatchPollResult],
+    max_scan: int = DEFAULT_MAX_LIST_SCAN,
+) -> Dict[str, BatchPollResult]:
+    """
+    Resolve ``provider_batch_ids`` from ``listing``, falling back to ``poll_one``.
+
+    ``listing`` is an auto-paginating iterator of provider batch objects
+    (anything with an ``id`` attribute).  Iteration stops as soon as every
+    wanted id has been seen or ``max_scan`` objects were read, so pages are
+    only fetched while they can still contribute.
+
+    Returns a dict keyed by provider batch id covering every requested id.
+    """
+    wanted = set(provider_batch_ids)
+    results: Dict[str, BatchPollResult] = {}
+    if wanted:
+        for scanned, batch in enumerate(listing, start=1):
+            batch_id = getattr(batch, "id", None)
+            if batch_id in wanted and batch_id not in results:
+                results[batch_id] = to_poll_result(batch)
+                if len(results) == len(wanted):
+                    break
+            if scanned >= max_scan:
+                break
+    for batch_id in provider_batch_ids:
+        if batch_id not in results:
+            results[batch_id] = poll_one(batch_id)
+    return results
@@ -23,6 +23,7 @@ from agentmap.services.llm._batch_ids import CUSTOM_ID_RE as _CUSTOM_ID_RE
 from agentmap.services.llm._batch_ids import (
     build_request_id_map as _build_request_id_map,
 )
+from agentmap.services.llm._batch_listing import poll_via_listing
 
 
 class AnthropicBatchAdapter:
@@ -144,7 +145,24 @@ class AnthropicBatchAdapter:
         Unknown ``processing_status`` values map to ``LLMBatchStatus.FAILED``.
         """
         batch = self._client.messages.batches.retrieve(provider_batch_id)
+        return self._to_poll_result(batch)
 
+    def poll_many(self, provider_batch_ids: List[str]) -> Dict[str, BatchPollResult]:
+        """
+        Poll several batches from the paginated batch listing.
+
+        One ``messages.batches.list`` page covers up to 100 batches; ids not
+        found in the recent listing are polled individually.
+        """
+        return poll_via_listing(
+            provider_batch_ids,
+            self._client.messages.batches.list(limit=100),
+            self._to_poll_result,
+            self.poll,
+        )
+
+    def _to_poll_result(self, batch: Any) -> BatchPollResult:
+        """Normalize an SDK batch object into a ``BatchPollResult``."""
         counts: Optional[LLMBatchRequestCounts] = None
         if hasattr(batch, "request_counts") and batch.request_counts is not None:
             rc = batch.request_counts
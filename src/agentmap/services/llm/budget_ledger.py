@@ -0,0 +1,608 @@
+"""
+SQLite-backed budget ledger implementing ``LLMBudgetGuardProtocol``.
+
+``LocalBudgetLedger`` is the shipped budget guard: each pre-dispatch check
+atomically *reserves* the call's estimated worst-case cost against every
+matching daily limit, and each receipt *settles* that reservation at the
+receipt's actual ``cost``. Reservations that never settle (failed tiers,
+crashed processes) stop counting after ``reservation_ttl_seconds``.
+
+All reads and writes go through one SQLite file opened with a fresh
+connection per operation, and every reservation runs inside
+``BEGIN IMMEDIATE``, so concurrent fan-outs in any number of threads or
+processes on one host cannot overshoot a limit between "check" and "reserve".
+
+Spend is attributed to a ``(tenant, graph)`` scope read from a ContextVar;
+hosts set it with ``budget_scope()``. Graph runs set ``graph`` automatically.
+
+Reservations are matched to receipts through a per-call list, also held in a
+ContextVar. ``LLMService`` opens it with ``call_reservations()`` before
+dispatch, so a hedge or fallback running in its own task reserves into the
+same list the caller's ``observe_receipt`` settles.
+
+Amounts are stored as integer micro-units of the catalog currency, matching
+the 6-decimal quantization of ``LLMCostBreakdown``.
+"""
+
+import asyncio
+import contextvars
+import math
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import ROUND_CEILING, Decimal
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from agentmap.exceptions.service_exceptions import LLMBudgetExceededError
+from agentmap.models.llm_cost import LLMBudgetCheck
+from agentmap.models.llm_execution import LLMResponse
+
+DEFAULT_SCOPE_VALUE = "default"
+_MICROS = Decimal(1_000_000)
+_REPORT_FIELDS = ("day", "tenant", "graph", "provider", "model")
+
+_scope: "contextvars.ContextVar[Tuple[str, str]]" = contextvars.ContextVar(
+    "agentmap_budget_scope", default=(DEFAULT_SCOPE_VALUE, DEFAULT_SCOPE_VALUE)
+)
+# Reservation ids opened by the current call, settled/released on receipt.
+_open_reservations: "contextvars.ContextVar[Optional[List[str]]]" = (
+    contextvars.ContextVar("agentmap_budget_reservations", default=None)
+)
+
+
+class _CallReservations(list):
+    """Reservation ids of one LLM call, shared by every task of that call."""
+
+    ledger: Optional["LocalBudgetLedger"] = None
+
+
+@contextmanager
+def budget_scope(
+    tenant: Optional[str] = None, graph: Optional[str] = None
+) -> Iterator[Tuple[str, str]]:
+    """Attribute LLM spend inside the block to ``tenant`` and/or ``graph``.
+
+    Omitted values are inherited from the enclosing scope.
+    """
+    current_tenant, current_graph = _scope.get()
+    token = _scope.set((tenant or current_tenant, graph or current_graph))
+    try:
+        yield _scope.get()
+    finally:
+        _scope.reset(token)
+
+
+def current_budget_scope() -> Tuple[str, str]:
+    """Return the ``(tenant, graph)`` scope LLM spend is attributed to."""
+    return _scope.get()
+
+
+@asynccontextmanager
+async def call_reservations() -> AsyncIterator[None]:
+    """Collect the reservations of one LLM call in a list all its tasks share.
+
+    Enter before dispatch: tasks spawned inside (the primary and hedge of a
+    hedged call) inherit the list, so ``observe_receipt`` in the caller sees
+    and settles the winner and releases the loser. Reservations still open
+    on exit, from a call that ended without a receipt, are released.
+    """
+    reservations = _CallReservations()
+    token = _open_reservations.set(reservations)
+    try:
+        yield
+    finally:
+        _open_reservations.reset(token)
+        if reservations and reservations.ledger is not None:
+            await asyncio.to_thread(reservations.ledger.release, list(reservations))
+
+
+@dataclass(frozen=True)
+class BudgetLimit:
+    """One daily spending cap.
+
+    ``tenant`` / ``graph``: ``None`` sums spend across all values, ``"*"``
+    applies the cap separately to each value, anything else restricts the
+    cap to that one value.
+    """
+
+    daily_limit: Decimal
+    tenant: Optional[str] = None
+    graph: Optional[str] = None
+
+    def applies_to(self, tenant: str, graph: str) -> bool:
+        return self.tenant in (None, "*", tenant) and self.graph in (None, "*", graph)
+
+    def describe(self, tenant: str, graph: str) -> str:
+        parts = []
+        if self.tenant is not None:
+            parts.append(f"tenant={tenant}")
+        if self.graph is not None:
+            parts.append(f"graph={graph}")
+        return ", ".join(parts) or "all spend"
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS budget_ledger (
+    id TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    tenant TEXT NOT NULL,
+    graph TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    attempt_kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    reserved_micros INTEGER NOT NULL,
+    cost_micros INTEGER,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    settled_at REAL,
+    pid INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS budget_ledger_scope
+    ON budget_ledger (day, tenant, graph);
+CREATE INDEX IF NOT EXISTS budget_ledger_open
+    ON budget_ledger (status, provider, model, created_at);
+"""
+
+# Spend that counts against a limit: settled cost plus live reservations.
+_SPEND_SQL = (
+    "SELECT COALESCE(SUM(CASE WHEN status = 'settled' THEN cost_micros "
+    "WHEN status = 'reserved' AND expires_at > ? THEN reserved_micros "
+    "ELSE 0 END), 0) FROM budget_ledger WHERE day = ?"
+)
+
+
+class LocalBudgetLedger:
+    """
+    Budget guard with atomic reserve-then-settle on a local SQLite ledger.
+
+    Constructed from the ``llm.budget_ledger`` config dict (see
+    ``AppConfigService.get_llm_budget_ledger_config()``) and a logging
+    service. Register it as ``LLMService``'s ``budget_guard``; the DI
+    container does so when ``llm.budget_ledger.enabled`` is true.
+    """
+
+    def __init__(self, config: Dict[str, Any], logging_service):
+        self._logger = logging_service.get_class_logger(self)
+        self.path = config["path"]
+        self.limits = [
+            BudgetLimit(
+                daily_limit=Decimal(str(limit["daily_limit"])),
+                tenant=limit.get("tenant"),
+                graph=limit.get("graph"),
+            )
+            for limit in config.get("limits") or []
+        ]
+        self.reservation_ttl = float(config.get("reservation_ttl_seconds", 900))
+        self.default_output_tokens = int(config.get("default_output_tokens", 1024))
+        self.chars_per_token = float(config.get("chars_per_token", 4))
+        self.deny_unpriced = config.get("unpriced", "allow") == "deny"
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # LLMBudgetGuardProtocol
+    # ------------------------------------------------------------------
+
+    async def check_before_dispatch(self, check: LLMBudgetCheck) -> None:
+        """Reserve the call's estimated cost or raise ``LLMBudgetExceededError``."""
+        estimate = self.estimate_cost(check)
+        if estimate is None:
+            if self.deny_unpriced:
+                raise LLMBudgetExceededError(
+                    f"No price configured for {check.resolved_provider}/"
+                    f"{check.resolved_model}; unpriced calls are denied"
+                )
+            estimate = Decimal(0)
+
+        opened = _open_reservations.get()
+        if isinstance(opened, _CallReservations):
+            opened.ledger = self
+        elif opened is None or check.attempt_kind == "primary":
+            # No call_reservations() around this call: a primary check starts
+            # a new call, and anything still open in this context belongs to
+            # a previous call that failed without a receipt.
+            if opened:
+                await asyncio.to_thread(self._release, list(opened))
+            opened = []
+            _open_reservations.set(opened)
+
+        tenant, graph = _scope.get()
+        reservation_id = await asyncio.to_thread(
+            self.reserve,
+            estimate,
+            check.resolved_provider,
+            check.resolved_model,
+            tenant=tenant,
+            graph=graph,
+            attempt_kind=check.attempt_kind,
+        )
+        opened.append(reservation_id)
+
+    async def observe_receipt(self, receipt: LLMResponse) -> None:
+        """Settle the reservation for ``receipt`` at its actual cost."""
+        opened = _open_reservations.get() or []
+        candidates = list(opened)
+        if isinstance(opened, _CallReservations):
+            opened.clear()
+        else:
+            _open_reservations.set(None)
+        cost = receipt.cost.total_cost if receipt.cost is not None else None
+        tenant, graph = _scope.get()
+        await asyncio.to_thread(
+            self.settle,
+            receipt.resolved_provider,
+            receipt.resolved_model,
+            cost,
+            candidates=candidates,
+            tenant=tenant,
+            graph=graph,
+        )
+
+    # ------------------------------------------------------------------
+    # Ledger operations
+    # ------------------------------------------------------------------
+
+    def estimate_cost(self, check: LLMBudgetCheck) -> Optional[Decimal]:
+        """Worst-case cost of a call from its input size and output bound.
+
+        Returns ``None`` when the resolved model has no configured rates.
+        """
+        rates = check.rates
+        if rates is None or (
+            rates.input_per_1m is None and rates.output_per_1m is None
+        ):
+            return None
+        input_tokens = math.ceil(check.input_chars / self.chars_per_token)
+        estimate = Decimal(input_tokens) * (rates.input_per_1m or 0) / _MICROS
+        if check.max_possible_output_cost is not None:
+            estimate += check.max_possible_output_cost
+        elif rates.output_per_1m is not None:
+            output_tokens = check.max_output_tokens or self.default_output_tokens
+            estimate += Decimal(output_tokens) * rates.output_per_1m / _MICROS
+        return estimate
+
+    def reserve(
+        self,
+        amount: Decimal,
+        provider: str,
+        model: str,
+        *,
+        tenant: str = DEFAULT_SCOPE_VALUE,
+        graph: str = DEFAULT_SCOPE_VALUE,
+        attempt_kind: str = "primary",
+    ) -> str:
+        """Atomically check every matching limit and record a reservation.
+
+        Returns:
+            The reservation id
+
+        Raises:
+            LLMBudgetExceededError: If the reservation would exceed a limit
+        """
+        micros = self._to_micros(amount, ROUND_CEILING)
+        now = time.time()
+        day = self._today()
+        reservation_id = uuid.uuid4().hex
+
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for limit in self.limits:
+                    if not limit.applies_to(tenant, graph):
+                        continue
+                    spent = self._spend(conn, now, day, limit, tenant, graph)
+                    cap = self._to_micros(limit.daily_limit)
+                    if spent + micros > cap:
+                        raise LLMBudgetExceededError(
+                            f"Daily LLM budget exceeded for "
+                            f"{limit.describe(tenant, graph)}: "
+                            f"{self._from_micros(spent)} spent or reserved of "
+                            f"{limit.daily_limit}, call needs up to "
+                            f"{self._from_micros(micros)}"
+                        )
+                conn.execute(
+                    "INSERT INTO budget_ledger (id, day, tenant, graph, provider, "
+                    "model, attempt_kind, status, reserved_micros, created_at, "
+                    "expires_at, pid) VALUES (?, ?, ?, ?, ?, ?, ?, 'reserved', ?, "
+                    "?, ?, ?)",
+                    (
+                        reservation_id,
+                        day,
+                        tenant,
+                        graph,
+                        provider,
+                        model,
+                        attempt_kind,
+                        micros,
+                        now,
+                        now + self.reservation_ttl,
+                        os.getpid(),
+                    ),
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return reservation_id
+
+    def settle(
+        self,
+        provider: str,
+        model: str,
+        cost: Optional[Decimal],
+        *,
+        candidates: Sequence[str] = (),
+        tenant: str = DEFAULT_SCOPE_VALUE,
+        graph: str = DEFAULT_SCOPE_VALUE,
+    ) -> Optional[str]:
+        """Settle the reservation matching ``provider``/``model`` at ``cost``.
+
+        The reservation is picked from ``candidates`` (the ids this call
+        opened), preferring the newest one for the same provider and model,
+        else the newest still open; the remaining candidates are released.
+        Without an open candidate the cost is recorded as a new settled
+        entry, so a receipt never settles another call's reservation. A
+        ``None`` cost (unpriced receipt) keeps the reserved estimate.
+
+        Returns:
+            The id of the settled ledger entry
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = None
+                if candidates:
+                    marks = ",".join("?" * len(candidates))
+                    row = conn.execute(
+                        f"SELECT id, reserved_micros FROM budget_ledger WHERE id IN "
+                        f"({marks}) AND status = 'reserved' ORDER BY "
+                        f"provider = ? AND model = ? DESC, created_at DESC LIMIT 1",
+                        (*candidates, provider, model),
+                    ).fetchone()
+
+                if row is not None:
+                    entry_id, reserved = row
+                    cost_micros = reserved if cost is None else self._to_micros(cost)
+                    conn.execute(
+                        "UPDATE budget_ledger SET status = 'settled', "
+                        "cost_micros = ?, settled_at = ? WHERE id = ?",
+                        (cost_micros, now, entry_id),
+                    )
+                else:
+                    entry_id = uuid.uuid4().hex
+                    cost_micros = 0 if cost is None else self._to_micros(cost)
+                    conn.execute(
+                        "INSERT INTO budget_ledger (id, day, tenant, graph, "
+                        "provider, model, attempt_kind, status, reserved_micros, "
+                        "cost_micros, created_at, expires_at, settled_at, pid) "
+                        "VALUES (?, ?, ?, ?, ?, ?, 'unreserved', 'settled', 0, ?, "
+                        "?, ?, ?, ?)",
+                        (
+                            entry_id,
+                            self._today(),
+                            tenant,
+                            graph,
+                            provider,
+                            model,
+                            cost_micros,
+                            now,
+                            now,
+                            now,
+                            os.getpid(),
+                        ),
+                    )
+
+                others = [c for c in candidates if c != entry_id]
+                if others:
+                    self._release_in(conn, others)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return entry_id
+
+    def release(self, reservation_ids: Sequence[str]) -> None:
+        """Release open reservations without recording spend."""
+        self._release(list(reservation_ids))
+
+    # ------------------------------------------------------------------
+    # Reports
+    # ------------------------------------------------------------------
+
+    def get_budget_status(
+        self,
+        tenant: str = DEFAULT_SCOPE_VALUE,
+        graph: str = DEFAULT_SCOPE_VALUE,
+        day: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Spend against every limit that applies to ``tenant``/``graph``.
+
+        Returns:
+            One dict per applicable limit with ``limit``, ``settled``,
+            ``reserved`` and ``remaining`` (all ``Decimal``)
+        """
+        day_key = (day or self._today_date()).isoformat()
+        now = time.time()
+        status = []
+        with self._connect() as conn:
+            for limit in self.limits:
+                if not limit.applies_to(tenant, graph):
+                    continue
+                where, params = self._limit_filter(limit, tenant, graph)
+                settled, reserved = conn.execute(
+                    "SELECT COALESCE(SUM(CASE WHEN status = 'settled' THEN "
+                    "cost_micros ELSE 0 END), 0), COALESCE(SUM(CASE WHEN "
+                    "status = 'reserved' AND expires_at > ? THEN reserved_micros "
+                    f"ELSE 0 END), 0) FROM budget_ledger WHERE day = ?{where}",
+                    (now, day_key, *params),
+                ).fetchone()
+                used = self._from_micros(settled + reserved)
+                status.append(
+                    {
+                        "scope": limit.describe(tenant, graph),
+                        "tenant": limit.tenant,
+                        "graph": limit.graph,
+                        "limit": limit.daily_limit,
+                        "settled": self._from_micros(settled),
+                        "reserved": self._from_micros(reserved),
+                        "remaining": max(limit.daily_limit - used, Decimal(0)),
+                    }
+                )
+        return status
+
+    def spend_report(
+        self,
+        start_day: Optional[date] = None,
+        end_day: Optional[date] = None,
+        group_by: Sequence[str] = ("day", "tenant", "graph"),
+        tenant: Optional[str] = None,
+        graph: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Settled spend and call counts grouped by ledger fields.
+
+        Args:
+            start_day: First day to include (default: today)
+            end_day: Last day to include (default: ``start_day``)
+            group_by: Any of ``day``, ``tenant``, ``graph``, ``provider``,
+                ``model``
+            tenant: Only include this tenant
+            graph: Only include this graph
+
+        Returns:
+            One dict per group with the grouped fields, ``cost`` (``Decimal``)
+            and ``calls``, ordered by the grouped fields
+        """
+        unknown = [f for f in group_by if f not in _REPORT_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Cannot group spend by {unknown}; choose from {_REPORT_FIELDS}"
+            )
+        start = (start_day or self._today_date()).isoformat()
+        end = (end_day or start_day or self._today_date()).isoformat()
+        where = "status = 'settled' AND day BETWEEN ? AND ?"
+        params: List[Any] = [start, end]
+        if tenant is not None:
+            where += " AND tenant = ?"
+            params.append(tenant)
+        if graph is not None:
+            where += " AND graph = ?"
+            params.append(graph)
+        columns = ", ".join(group_by)
+        select = f"{columns}, " if group_by else ""
+        grouping = f" GROUP BY {columns} ORDER BY {columns}" if group_by else ""
+
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT {select}COALESCE(SUM(cost_micros), 0), COUNT(*) "
+                f"FROM budget_ledger WHERE {where}{grouping}",
+                params,
+            ).fetchall()
+        report = []
+        for row in rows:
+            entry = dict(zip(group_by, row))
+            entry["cost"] = self._from_micros(row[len(group_by)])
+            entry["calls"] = row[len(group_by) + 1]
+            report.append(entry)
+        return report
+
+    def purge_before(self, day: date) -> int:
+        """Delete ledger entries older than ``day``; returns the count."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "DELETE FROM budget_ledger WHERE day < ?", (day.isoformat(),)
+            )
+            return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        # Autocommit mode: transactions are opened explicitly with
+        # BEGIN IMMEDIATE so the limit check and insert hold the write lock.
+        return _ClosingConnection(self.path)
+
+    def _spend(
+        self,
+        conn: sqlite3.Connection,
+        now: float,
+        day: str,
+        limit: BudgetLimit,
+        tenant: str,
+        graph: str,
+    ) -> int:
+        where, params = self._limit_filter(limit, tenant, graph)
+        return conn.execute(_SPEND_SQL + where, (now, day, *params)).fetchone()[0]
+
+    @staticmethod
+    def _limit_filter(
+        limit: BudgetLimit, tenant: str, graph: str
+    ) -> Tuple[str, Tuple[str, ...]]:
+        where, params = "", []
+        if limit.tenant is not None:
+            where += " AND tenant = ?"
+            params.append(tenant)
+        if limit.graph is not None:
+            where += " AND graph = ?"
+            params.append(graph)
+        return where, tuple(params)
+
+    def _release(self, reservation_ids: List[str]) -> None:
+        if not reservation_ids:
+            return
+        with self._connect() as conn:
+            self._release_in(conn, reservation_ids)
+
+    @staticmethod
+    def _release_in(conn: sqlite3.Connection, reservation_ids: List[str]) -> None:
+        marks = ",".join("?" * len(reservation_ids))
+        conn.execute(
+            f"UPDATE budget_ledger SET status = 'released', settled_at = ? "
+            f"WHERE status = 'reserved' AND id IN ({marks})",
+            (time.time(), *reservation_ids),
+        )
+
+    @staticmethod
+    def _today_date() -> date:
+        return datetime.now(timezone.utc).date()
+
+    def _today(self) -> str:
+        return self._today_date().isoformat()
+
+    @staticmethod
+    def _to_micros(amount: Decimal, rounding: Optional[str] = None) -> int:
+        scaled = Decimal(amount) * _MICROS
+        if rounding is not None:
+            return int(scaled.to_integral_value(rounding=rounding))
+        return int(scaled.to_integral_value())
+
+    @staticmethod
+    def _from_micros(micros: int) -> Decimal:
+        return (Decimal(micros) / _MICROS).quantize(Decimal("0.000001"))
+
+
+class _ClosingConnection:
+    """Context manager yielding an autocommit SQLite connection, then closing it."""
+
+    def __init__(self, path: str):
+        self._path = path
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA busy_timeout = 30000")
+        return self._conn
+
+    def __exit__(self, *exc_info) -> None:
+        self._conn.close()
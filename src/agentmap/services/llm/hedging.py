@@ -0,0 +1,271 @@
+"""
+Hedged requests across the LLM fallback ladder (tail-latency control).
+
+When ``llm.resilience.hedging.enabled`` is set, a direct async call whose
+primary tier has not answered within a per-route, percentile-based delay
+fires the first fallback-ladder tier in parallel.  The first success wins
+and the loser is cancelled; if the primary fails while the hedge is still
+in flight the hedge's answer is used.  When both fail the primary's error
+surfaces unchanged, so the ordinary fallback ladder still runs.
+
+Hedges are bounded two ways:
+
+* **Budget** -- the hedge tier dispatches through
+  ``LLMService._invoke_with_resilience_async(attempt_kind="hedge")``, so a
+  registered budget guard sees (and may refuse) every hedge before any
+  spend.  A refusal only cancels the hedge; the primary keeps running.
+* **Rate** -- at most ``max_hedge_rate`` of a route's calls may hedge, so a
+  slow provider cannot double the request volume.
+
+``LLMHedgeController`` owns the per-route latency windows and counters; it
+has no provider knowledge -- ``LLMService`` supplies the coroutine factories.
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional
+
+from agentmap.services.llm._budget_guard_refusal import BudgetGuardRefusal
+
+HEDGE_OUTCOME_FIRED = "fired"
+HEDGE_OUTCOME_WON = "won"
+HEDGE_OUTCOME_LOST = "lost"
+HEDGE_OUTCOME_FAILED = "failed"
+HEDGE_OUTCOME_BUDGET_REFUSED = "budget_refused"
+HEDGE_OUTCOME_RATE_LIMITED = "rate_limited"
+
+
+@dataclass(frozen=True)
+class HedgeConfig:
+    """Resolved ``llm.resilience.hedging`` settings."""
+
+    enabled: bool = False
+    percentile: float = 95.0
+    min_samples: int = 20
+    initial_delay_seconds: float = 2.0
+    min_delay_seconds: float = 0.25
+    max_delay_seconds: float = 10.0
+    max_hedge_rate: float = 0.1
+    window: int = 200
+
+    @classmethod
+    def from_dict(cls, cfg: Optional[Dict[str, Any]]) -> "HedgeConfig":
+        if not isinstance(cfg, dict):
+            cfg = {}
+        defaults = cls()
+        return cls(
+            enabled=bool(cfg.get("enabled", defaults.enabled)),
+            percentile=float(cfg.get("percentile", defaults.percentile)),
+            min_samples=int(cfg.get("min_samples", defaults.min_samples)),
+            initial_delay_seconds=float(
+                cfg.get("initial_delay_seconds", defaults.initial_delay_seconds)
+            ),
+            min_delay_seconds=float(
+                cfg.get("min_delay_seconds", defaults.min_delay_seconds)
+            ),
+            max_delay_seconds=float(
+                cfg.get("max_delay_seconds", defaults.max_delay_seconds)
+            ),
+            max_hedge_rate=float(cfg.get("max_hedge_rate", defaults.max_hedge_rate)),
+            window=max(1, int(cfg.get("window", defaults.window))),
+        )
+
+
+class _RouteStats:
+    """Latency window and hedge counters for one ``provider:model`` route."""
+
+    __slots__ = ("latencies", "calls", "outcomes")
+
+    def __init__(self, window: int) -> None:
+        self.latencies: Deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.outcomes: Dict[str, int] = {}
+
+
+class LLMHedgeController:
+    """Per-route hedge delay, hedge-rate cap, and the primary/hedge race."""
+
+    def __init__(
+        self,
+        config: HedgeConfig,
+        on_outcome: Optional[Callable[[str, str, str], None]] = None,
+    ) -> None:
+        """
+        Args:
+            config: Resolved hedging settings.
+            on_outcome: Optional ``(provider, model, outcome)`` callback, used
+                by ``LLMService`` to record the hedge metric.
+        """
+        self.config = config
+        self._on_outcome = on_outcome
+        self._routes: Dict[str, _RouteStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.config.enabled
+
+    # ------------------------------------------------------------------
+    # Per-route bookkeeping
+    # ------------------------------------------------------------------
+
+    def _route(self, provider: str, model: str) -> _RouteStats:
+        key = f"{provider}:{model}"
+        stats = self._routes.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._routes.setdefault(key, _RouteStats(self.config.window))
+        return stats
+
+    def record_latency(self, provider: str, model: str, seconds: float) -> None:
+        """Add one primary-tier latency sample to the route's window."""
+        self._route(provider, model).latencies.append(seconds)
+
+    def hedge_delay(self, provider: str, model: str) -> float:
+        """Seconds to wait on the primary before hedging this route.
+
+        The configured percentile of the route's recent latencies, clamped to
+        ``[min_delay_seconds, max_delay_seconds]``; ``initial_delay_seconds``
+        until ``min_samples`` latencies have been observed.
+        """
+        cfg = self.config
+        samples = sorted(self._route(provider, model).latencies)
+        if not samples or len(samples) < cfg.min_samples:
+            return cfg.initial_delay_seconds
+        rank = math.ceil(cfg.percentile / 100.0 * len(samples)) - 1
+        delay = samples[min(max(rank, 0), len(samples) - 1)]
+        return min(max(delay, cfg.min_delay_seconds), cfg.max_delay_seconds)
+
+    def _record(self, provider: str, model: str, outcome: str) -> None:
+        stats = self._route(provider, model)
+        with self._lock:
+            stats.outcomes[outcome] = stats.outcomes.get(outcome, 0) + 1
+        if self._on_outcome is not None:
+            self._on_outcome(provider, model, outcome)
+
+    def _acquire_hedge(self, provider: str, model: str) -> bool:
+        """Reserve a hedge for this route unless its hedge rate is at the cap."""
+        stats = self._route(provider, model)
+        with self._lock:
+            fired = stats.outcomes.get(HEDGE_OUTCOME_FIRED, 0)
+            if fired + 1 > self.config.max_hedge_rate * stats.calls:
+                return False
+            stats.outcomes[HEDGE_OUTCOME_FIRED] = fired + 1
+        if self._on_outcome is not None:
+            self._on_outcome(provider, model, HEDGE_OUTCOME_FIRED)
+        return True
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-route call/hedge counts, hedge rate and current delay."""
+        with self._lock:
+            routes = {
+                key: (stats.calls, dict(stats.outcomes))
+                for key, stats in self._routes.items()
+            }
+        result = {}
+        for key, (calls, outcomes) in routes.items():
+            provider, _, model = key.partition(":")
+            fired = outcomes.get(HEDGE_OUTCOME_FIRED, 0)
+            result[key] = {
+                "calls": calls,
+                "hedges": fired,
+                "hedge_rate": fired / calls if calls else 0.0,
+                "hedge_wins": outcomes.get(HEDGE_OUTCOME_WON, 0),
+                "budget_refused": outcomes.get(HEDGE_OUTCOME_BUDGET_REFUSED, 0),
+                "rate_limited": outcomes.get(HEDGE_OUTCOME_RATE_LIMITED, 0),
+                "delay_seconds": self.hedge_delay(provider, model),
+            }
+        return result
+
+    # ------------------------------------------------------------------
+    # The race
+    # ------------------------------------------------------------------
+
+    async def run(
+        self,
+        provider: str,
+        model: str,
+        primary: Callable[[], Awaitable[Any]],
+        hedge: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run ``primary()``, hedging with ``hedge()`` if it is slow.
+
+        Raises the primary's exception when neither side succeeds.
+        """
+        stats = self._route(provider, model)
+        with self._lock:
+            stats.calls += 1
+        delay = self.hedge_delay(provider, model)
+        started = time.monotonic()
+        primary_task = asyncio.ensure_future(primary())
+        hedge_task: Optional[asyncio.Future] = None
+        try:
+            done, _ = await asyncio.wait({primary_task}, timeout=delay)
+            if not done:
+                hedge_task = self._start_hedge(provider, model, hedge)
+            if hedge_task is None:
+                result = await primary_task
+                self.record_latency(provider, model, time.monotonic() - started)
+                return result
+            return await self._race(provider, model, primary_task, hedge_task, started)
+        finally:
+            for task in (primary_task, hedge_task):
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()  # the loser
+                elif not task.cancelled():
+                    task.exception()  # mark retrieved; the outcome is recorded
+
+    def _start_hedge(
+        self,
+        provider: str,
+        model: str,
+        hedge: Callable[[], Awaitable[Any]],
+    ) -> Optional[asyncio.Future]:
+        if not self._acquire_hedge(provider, model):
+            self._record(provider, model, HEDGE_OUTCOME_RATE_LIMITED)
+            return None
+        return asyncio.ensure_future(hedge())
+
+    async def _race(
+        self,
+        provider: str,
+        model: str,
+        primary_task: asyncio.Future,
+        hedge_task: asyncio.Future,
+        started: float,
+    ) -> Any:
+        pending = {primary_task, hedge_task}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                error = task.exception()
+                if task is hedge_task:
+                    if error is None:
+                        # The primary took at least this long; keep the
+                        # censored sample so the percentile is not biased low.
+                        self.record_latency(provider, model, time.monotonic() - started)
+                        self._record(provider, model, HEDGE_OUTCOME_WON)
+                        return task.result()
+                    self._record(
+                        provider,
+                        model,
+                        (
+                            HEDGE_OUTCOME_BUDGET_REFUSED
+                            if isinstance(error, BudgetGuardRefusal)
+                            else HEDGE_OUTCOME_FAILED
+                        ),
+                    )
+                elif error is None:
+                    self.record_latency(provider, model, time.monotonic() - started)
+                    if hedge_task in pending:
+                        self._record(provider, model, HEDGE_OUTCOME_LOST)
+                    return task.result()
+        return primary_task.result()  # both failed: re-raise the primary's error
@@ -11,13 +11,22 @@ OpenAI-specific concerns handled here:
 - Result demux: ``files.content(result_ref)`` → parse JSONL → map by ``custom_id``
 - Usage normalization: ``prompt_tokens`` → ``input_tokens``, ``completion_tokens``
   → ``output_tokens`` (no cache fields for OpenAI)
+- Spooling and sharding: request lines are streamed to JSONL spool files on
+  disk instead of being assembled in memory, and a submission that exceeds the
+  per-file request or byte limit is split into several provider batches
+  tracked under one logical id (``amshard_…``) with an on-disk manifest
 
 Pattern mirrors ``anthropic_batch_adapter.py``.
 """
 
 import json
+import os
+import shutil
+import tempfile
+import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from pathlib import Path
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
 
 from agentmap.exceptions import LLMDependencyError, LLMServiceError
 from agentmap.models.llm_batch import (
@@ -31,6 +40,33 @@ from agentmap.services.llm._batch_ids import CUSTOM_ID_RE as _CUSTOM_ID_RE
 from agentmap.services.llm._batch_ids import (
     build_request_id_map as _build_request_id_map,
 )
+from agentmap.services.llm._batch_listing import poll_via_listing
+
+# OpenAI caps a batch input file at 50,000 requests and 200 MB; stay a little
+# under the byte cap to leave room for multipart overhead.
+DEFAULT_MAX_REQUESTS_PER_SHARD = 50_000
+DEFAULT_MAX_BYTES_PER_SHARD = 190 * 1024 * 1024
+DEFAULT_MAX_SHARD_RETRIES = 2
+
+# Prefix of logical batch ids that stand for several provider batches.
+SHARDED_BATCH_PREFIX = "amshard_"
+
+_MANIFEST_FILE = "manifest.json"
+_TERMINAL_STATUSES = frozenset(
+    {
+        LLMBatchStatus.ENDED,
+        LLMBatchStatus.FAILED,
+        LLMBatchStatus.EXPIRED,
+        LLMBatchStatus.CANCELED,
+    }
+)
+_RETRYABLE_STATUSES = frozenset({LLMBatchStatus.FAILED, LLMBatchStatus.EXPIRED})
+# Per-item status reported for requests of a shard that produced no output.
+_SHARD_ITEM_STATUS = {
+    LLMBatchStatus.EXPIRED: "expired",
+    LLMBatchStatus.CANCELED: "canceled",
+    LLMBatchStatus.FAILED: "errored",
+}
 
 
 class OpenAIBatchAdapter:
@@ -50,6 +86,14 @@ class OpenAIBatchAdapter:
     The caller never sees a file id; the return tuple is
     ``(provider_batch_id, request_id_map, expires_at)`` — same shape as
     ``AnthropicBatchAdapter.submit``.
+
+    Request lines are streamed to spool files under ``spool_dir``. When a
+    submission exceeds ``max_requests_per_shard`` or ``max_bytes_per_shard``
+    it is split into consecutive shards, each submitted as its own provider
+    batch. The returned id is then a logical ``amshard_…`` id whose manifest
+    lives in ``spool_dir``; ``poll``, ``cancel`` and ``fetch_results`` accept
+    it transparently, failed or expired shards are resubmitted up to
+    ``max_shard_retries`` times, and results come back in request order.
     """
 
     # Satisfies BatchAdapterProtocol class attributes.
@@ -69,7 +113,21 @@ class OpenAIBatchAdapter:
         "cancelled": LLMBatchStatus.CANCELED,
     }
 
-    def __init__(self, api_key: str, logger: Any) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        logger: Any,
+        spool_dir: Optional[str] = None,
+        max_requests_per_shard: int = DEFAULT_MAX_REQUESTS_PER_SHARD,
+        max_bytes_per_shard: int = DEFAULT_MAX_BYTES_PER_SHARD,
+        max_shard_retries: int = DEFAULT_MAX_SHARD_RETRIES,
+    ) -> None:
+        if max_requests_per_shard < 1 or max_bytes_per_shard < 1:
+            raise LLMServiceError(
+                "OpenAI batch shard limits must be positive: "
+                f"max_requests_per_shard={max_requests_per_shard}, "
+                f"max_bytes_per_shard={max_bytes_per_shard}"
+            )
         try:
             import openai  # noqa: PLC0415
         except ImportError:
@@ -79,6 +137,12 @@ class OpenAIBatchAdapter:
             )
         self._client = openai.OpenAI(api_key=api_key)
         self._logger = logger
+        self._spool_dir = Path(
+            spool_dir or os.path.join(tempfile.gettempdir(), "agentmap_openai_batch")
+        )
+        self._max_requests = max_requests_per_shard
+        self._max_bytes = max_bytes_per_shard
+        self._max_shard_retries = max(0, max_shard_retries)
 
     @staticmethod
     def _epoch_to_iso8601(epoch_value: Any) -> Optional[str]:
@@ -116,19 +180,48 @@ class OpenAIBatchAdapter:
         then calls ``batches.create``.  The file id never crosses the service
         boundary.
 
+        Lines are streamed to spool files rather than built in memory. A
+        submission that fits in one shard behaves exactly as a plain batch;
+        a larger one returns a logical ``amshard_…`` id (see class docstring).
+
         Returns ``(provider_batch_id, request_id_map, expires_at)`` where
         ``request_id_map`` maps each caller ``request_id`` to its ``custom_id``
         sent to OpenAI.
         """
         request_id_map = _build_request_id_map(specs, _CUSTOM_ID_RE)
 
-        jsonl_bytes = self._build_jsonl(specs, request_id_map, resolved_params)
+        logical_id = f"{SHARDED_BATCH_PREFIX}{uuid.uuid4().hex}"
+        spool = self._spool_dir / logical_id
+        spool.mkdir(parents=True, exist_ok=True)
+        try:
+            shards = self._spool_jsonl(specs, request_id_map, resolved_params, spool)
+            if len(shards) == 1:
+                provider_batch_id, expires_at = self._create_batch(
+                    spool / shards[0]["file"]
+                )
+                shutil.rmtree(spool, ignore_errors=True)
+                return provider_batch_id, request_id_map, expires_at
+            expires_at = self._submit_shards(logical_id, spool, shards)
+        except BaseException:
+            shutil.rmtree(spool, ignore_errors=True)
+            raise
+
+        self._logger.info(
+            "llm_batch.openai_sharded logical_id=%s shards=%d requests=%d",
+            logical_id,
+            len(shards),
+            len(specs),
+        )
+        return logical_id, request_id_map, expires_at
 
+    def _create_batch(self, path: Path) -> Tuple[str, Optional[str]]:
+        """Upload one spool file and create its batch; return ``(id, expires_at)``."""
         # Stage the file; file_id stays local — never returned to caller
-        file_obj = self._client.files.create(
-            file=("batch_requests.jsonl", jsonl_bytes),
-            purpose="batch",
-        )
+        with open(path, "rb") as fh:
+            file_obj = self._client.files.create(
+                file=("batch_requests.jsonl", fh),
+                purpose="batch",
+            )
         file_id = getattr(file_obj, "id", None)
         if not file_id:
             raise LLMServiceError(
@@ -153,16 +246,16 @@ class OpenAIBatchAdapter:
         if hasattr(response, "expires_at") and response.expires_at is not None:
             expires_at = self._epoch_to_iso8601(response.expires_at)
 
-        return provider_batch_id, request_id_map, expires_at
+        return provider_batch_id, expires_at
 
-    def _build_jsonl(
+    def _iter_jsonl_lines(
         self,
         specs: List[LLMRequest],
         request_id_map: Dict[str, str],
         resolved_params: List[Dict[str, Any]],
-    ) -> bytes:
+    ) -> Iterator[bytes]:
         """
-        Build JSONL bytes for the OpenAI Batch API.
+        Yield one encoded JSONL line (without newline) per spec.
 
         Each line is a JSON object with keys: ``custom_id``, ``method``,
         ``url``, ``body``.  The ``body`` follows the Chat Completions schema.
@@ -176,7 +269,6 @@ class OpenAIBatchAdapter:
                 f"specs/resolved_params length mismatch: {len(specs)} specs vs "
                 f"{len(resolved_params)} resolved param dicts — this is a bug."
             )
-        lines = []
         for spec, rp in zip(specs, resolved_params):
             custom_id = request_id_map[spec.request_id]
             body: Dict[str, Any] = {"messages": spec.messages}
@@ -188,9 +280,273 @@ class OpenAIBatchAdapter:
                 "url": "/v1/chat/completions",
                 "body": body,
             }
-            lines.append(json.dumps(record).encode())
+            yield json.dumps(record).encode()
 
-        return b"\n".join(lines)
+    def _spool_jsonl(
+        self,
+        specs: List[LLMRequest],
+        request_id_map: Dict[str, str],
+        resolved_params: List[Dict[str, Any]],
+        spool: Path,
+    ) -> List[Dict[str, Any]]:
+        """
+        Stream JSONL lines into shard files under ``spool``.
+
+        A new shard starts whenever the next line would push the current one
+        past the request-count or byte limit. Returns one descriptor per shard
+        with its file name and the ``[start, end)`` range of request positions.
+        """
+        shards: List[Dict[str, Any]] = []
+        fh = None
+        size = 0
+        try:
+            for position, line in enumerate(
+                self._iter_jsonl_lines(specs, request_id_map, resolved_params)
+            ):
+                line_size = len(line) + 1
+                if line_size > self._max_bytes:
+                    raise LLMServiceError(
+                        f"Batch request {specs[position].request_id!r} serializes to "
+                        f"{line_size} bytes, above the {self._max_bytes}-byte "
+                        "OpenAI batch file limit."
+                    )
+                current = shards[-1] if shards else None
+                if (
+                    current is None
+                    or current["end"] - current["start"] >= self._max_requests
+                    or size + line_size > self._max_bytes
+                ):
+                    if fh is not None:
+                        fh.close()
+                    current = {
+                        "index": len(shards),
+                        "file": f"shard_{len(shards):04d}.jsonl",
+                        "start": position,
+                        "end": position,
+                    }
+                    shards.append(current)
+                    fh = open(spool / current["file"], "wb")
+                    size = 0
+                fh.write(line + b"\n")
+                size += line_size
+                current["end"] = position + 1
+        finally:
+            if fh is not None:
+                fh.close()
+        if not shards:
+            # An empty submission still goes out as one (empty) batch file.
+            (spool / "shard_0000.jsonl").touch()
+            shards.append(
+                {"index": 0, "file": "shard_0000.jsonl", "start": 0, "end": 0}
+            )
+        return shards
+
+    # ------------------------------------------------------------------
+    # Sharded batches
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def is_sharded(provider_batch_id: Optional[str]) -> bool:
+        """True if ``provider_batch_id`` is a logical id for a sharded batch."""
+        return bool(provider_batch_id) and provider_batch_id.startswith(
+            SHARDED_BATCH_PREFIX
+        )
+
+    def _submit_shards(
+        self, logical_id: str, spool: Path, shards: List[Dict[str, Any]]
+    ) -> Optional[str]:
+        """
+        Submit every shard and write the manifest; return the earliest expiry.
+
+        If the first shard cannot be submitted the error propagates (nothing
+        was created). Later shard failures are recorded as ``failed`` shards
+        so the next ``poll`` retries them instead of orphaning the shards
+        that did go out.
+        """
+        expiries = []
+        for shard in shards:
+            shard.update(
+                batch_id=None,
+                status=LLMBatchStatus.IN_PROGRESS.value,
+                attempts=1,
+                output_file_id=None,
+                ended_at=None,
+                counts=None,
+            )
+            try:
+                shard["batch_id"], expires_at = self._create_batch(
+                    spool / shard["file"]
+                )
+            except Exception as exc:
+                if shard["index"] == 0:
+                    raise
+                self._logger.warning(
+                    "llm_batch.openai_shard_submit_failed logical_id=%s shard=%d: %s",
+                    logical_id,
+                    shard["index"],
+                    exc,
+                )
+                shard["status"] = LLMBatchStatus.FAILED.value
+                continue
+            if expires_at:
+                expiries.append(expires_at)
+
+        self._save_manifest(
+            logical_id,
+            {"logical_id": logical_id, "canceled": False, "shards": shards},
+        )
+        return min(expiries) if expiries else None
+
+    def _manifest_path(self, logical_id: str) -> Path:
+        return self._spool_dir / logical_id / _MANIFEST_FILE
+
+    def _load_manifest(self, logical_id: str) -> Dict[str, Any]:
+        path = self._manifest_path(logical_id)
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except FileNotFoundError:
+            raise LLMServiceError(
+                f"OpenAIBatchAdapter: no shard manifest for {logical_id!r} at "
+                f"{path} — the spool directory may have been removed or belongs "
+                "to another host."
+            )
+
+    def _save_manifest(self, logical_id: str, manifest: Dict[str, Any]) -> None:
+        path = self._manifest_path(logical_id)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(manifest, fh)
+        os.replace(tmp_path, path)
+
+    def _poll_sharded(self, logical_id: str) -> BatchPollResult:
+        """Poll every open shard, retry failed ones, and aggregate status."""
+        manifest = self._load_manifest(logical_id)
+        spool = self._spool_dir / logical_id
+        for shard in manifest["shards"]:
+            status = LLMBatchStatus(shard["status"])
+            if status not in _TERMINAL_STATUSES and shard["batch_id"]:
+                result = self._poll_single(shard["batch_id"])
+                status = result.status
+                shard["status"] = status.value
+                shard["output_file_id"] = result.result_ref
+                shard["ended_at"] = result.ended_at
+                shard["counts"] = (
+                    vars(result.request_counts) if result.request_counts else None
+                )
+            if (
+                status in _RETRYABLE_STATUSES
+                and not manifest["canceled"]
+                and shard["attempts"] <= self._max_shard_retries
+                and (spool / shard["file"]).exists()
+            ):
+                self._retry_shard(logical_id, spool, shard)
+
+        statuses = [LLMBatchStatus(shard["status"]) for shard in manifest["shards"]]
+        aggregate = self._aggregate_status(statuses)
+        if aggregate in _TERMINAL_STATUSES:
+            # Nothing can be retried any more; keep only the manifest.
+            for shard in manifest["shards"]:
+                (spool / shard["file"]).unlink(missing_ok=True)
+        self._save_manifest(logical_id, manifest)
+
+        counts = LLMBatchRequestCounts()
+        for shard in manifest["shards"]:
+            for key, value in (shard.get("counts") or {}).items():
+                if value is not None:
+                    setattr(counts, key, (getattr(counts, key) or 0) + value)
+        ended = [s["ended_at"] for s in manifest["shards"] if s.get("ended_at")]
+        return BatchPollResult(
+            status=aggregate,
+            request_counts=counts,
+            result_ref=logical_id if aggregate in _TERMINAL_STATUSES else None,
+            ended_at=(
+                max(ended) if aggregate in _TERMINAL_STATUSES and ended else None
+            ),
+        )
+
+    def _retry_shard(self, logical_id: str, spool: Path, shard: Dict[str, Any]) -> None:
+        """Resubmit a failed or expired shard from its spool file."""
+        shard["attempts"] += 1
+        self._logger.warning(
+            "llm_batch.openai_shard_retry logical_id=%s shard=%d status=%s attempt=%d",
+            logical_id,
+            shard["index"],
+            shard["status"],
+            shard["attempts"],
+        )
+        try:
+            shard["batch_id"], _ = self._create_batch(spool / shard["file"])
+        except Exception as exc:
+            self._logger.warning(
+                "llm_batch.openai_shard_submit_failed logical_id=%s shard=%d: %s",
+                logical_id,
+                shard["index"],
+                exc,
+            )
+            shard["status"] = LLMBatchStatus.FAILED.value
+            return
+        shard.update(
+            status=LLMBatchStatus.IN_PROGRESS.value,
+            output_file_id=None,
+            ended_at=None,
+            counts=None,
+        )
+
+    @staticmethod
+    def _aggregate_status(statuses: List[LLMBatchStatus]) -> LLMBatchStatus:
+        """
+        Fold shard statuses into one logical status.
+
+        Any open shard keeps the batch open. Once every shard is terminal the
+        batch is ``ended`` unless all shards share the same non-success status;
+        requests of shards that produced no output are reported per item by
+        ``fetch_results``.
+        """
+        if LLMBatchStatus.IN_PROGRESS in statuses:
+            return LLMBatchStatus.IN_PROGRESS
+        if LLMBatchStatus.CANCELING in statuses:
+            return LLMBatchStatus.CANCELING
+        distinct = set(statuses)
+        if len(distinct) == 1 and LLMBatchStatus.ENDED not in distinct:
+            return statuses[0]
+        return LLMBatchStatus.ENDED
+
+    def _fetch_sharded(
+        self, logical_id: str, request_id_map: Dict[str, str]
+    ) -> Generator[LLMBatchResult, None, None]:
+        """Yield results shard by shard, each shard sorted into request order."""
+        manifest = self._load_manifest(logical_id)
+        ordered_ids = list(request_id_map.values())
+        position = {custom_id: i for i, custom_id in enumerate(ordered_ids)}
+        custom_to_spec = {v: k for k, v in request_id_map.items()}
+
+        for shard in manifest["shards"]:
+            status = LLMBatchStatus(shard["status"])
+            if status == LLMBatchStatus.ENDED and shard.get("output_file_id"):
+                records = sorted(
+                    self._iter_output_records(shard["output_file_id"], custom_to_spec),
+                    key=lambda record: position[record[0]],
+                )
+                for _, result in records:
+                    yield result
+                continue
+
+            item_status = _SHARD_ITEM_STATUS.get(status, "errored")
+            for custom_id in ordered_ids[shard["start"] : shard["end"]]:
+                yield LLMBatchResult(
+                    request_id=custom_to_spec[custom_id],
+                    status=item_status,
+                    error=LLMExecutionError(
+                        error_type=f"shard_{status.value}",
+                        message=(
+                            f"OpenAI batch shard {shard['index']} of {logical_id} "
+                            f"finished as {status.value!r} without output after "
+                            f"{shard['attempts']} attempt(s)."
+                        ),
+                        retryable=True,
+                    ),
+                )
 
     # ------------------------------------------------------------------
     # Poll
@@ -204,8 +560,44 @@ class OpenAIBatchAdapter:
         ``result_ref`` is set to ``output_file_id`` so the service can pass it
         straight to ``fetch_results`` without any extra mapping.
         Unknown ``status`` values map to ``LLMBatchStatus.FAILED``.
+
+        For a sharded logical id every open shard is polled, failed or expired
+        shards are resubmitted while retries remain, and the aggregated status
+        is returned with the logical id as ``result_ref`` once terminal.
         """
-        batch = self._client.batches.retrieve(provider_batch_id)
+        if self.is_sharded(provider_batch_id):
+            return self._poll_sharded(provider_batch_id)
+        return self._poll_single(provider_batch_id)
+
+    def poll_many(self, provider_batch_ids: List[str]) -> Dict[str, BatchPollResult]:
+        """
+        Poll several batches from the paginated batch listing.
+
+        Plain batches are resolved from ``batches.list`` pages (100 per call)
+        with an individual fallback; sharded logical ids are polled shard by
+        shard through ``poll`` as usual.
+        """
+        plain = [bid for bid in provider_batch_ids if not self.is_sharded(bid)]
+        results = (
+            poll_via_listing(
+                plain,
+                self._client.batches.list(limit=100),
+                self._to_poll_result,
+                self._poll_single,
+            )
+            if plain
+            else {}
+        )
+        for batch_id in provider_batch_ids:
+            if batch_id not in results:
+                results[batch_id] = self.poll(batch_id)
+        return results
+
+    def _poll_single(self, provider_batch_id: str) -> BatchPollResult:
+        return self._to_poll_result(self._client.batches.retrieve(provider_batch_id))
+
+    def _to_poll_result(self, batch: Any) -> BatchPollResult:
+        """Normalize an SDK batch object into a ``BatchPollResult``."""
 
         counts: Optional[LLMBatchRequestCounts] = None
         if hasattr(batch, "request_counts") and batch.request_counts is not None:
@@ -231,7 +623,7 @@ class OpenAIBatchAdapter:
                 "OpenAIBatchAdapter.poll: unknown status %r for batch %s — "
                 "mapping to FAILED",
                 raw_status,
-                provider_batch_id,
+                getattr(batch, "id", None),
             )
 
         output_file_id: Optional[str] = getattr(batch, "output_file_id", None)
@@ -258,9 +650,25 @@ class OpenAIBatchAdapter:
         Cancel an in-progress batch.
 
         Delegates to ``client.batches.cancel()``.  The caller is responsible
-        for polling afterwards to observe the status transition.
+        for polling afterwards to observe the status transition.  For a sharded
+        logical id every open shard is canceled and no further shard retries
+        are made.
         """
-        self._client.batches.cancel(provider_batch_id)
+        if not self.is_sharded(provider_batch_id):
+            self._client.batches.cancel(provider_batch_id)
+            return
+        manifest = self._load_manifest(provider_batch_id)
+        manifest["canceled"] = True
+        for shard in manifest["shards"]:
+            status = LLMBatchStatus(shard["status"])
+            if status in _TERMINAL_STATUSES:
+                if status in _RETRYABLE_STATUSES and not shard["batch_id"]:
+                    shard["status"] = LLMBatchStatus.CANCELED.value
+                continue
+            if shard["batch_id"]:
+                self._client.batches.cancel(shard["batch_id"])
+                shard["status"] = LLMBatchStatus.CANCELING.value
+        self._save_manifest(provider_batch_id, manifest)
 
     # ------------------------------------------------------------------
     # Fetch results
@@ -282,6 +690,10 @@ class OpenAIBatchAdapter:
         Yields ``LLMBatchResult`` for each JSONL record.  Records whose
         ``custom_id`` is absent from ``request_id_map`` are skipped (logged as
         a warning) to tolerate any extra records the provider may inject.
+
+        For a sharded logical id, shards are read in order and each shard's
+        records are sorted back into request order; requests of shards that
+        ended without output yield ``expired``/``canceled``/``errored`` results.
         """
         if result_ref is None:
             raise LLMServiceError(
@@ -291,10 +703,20 @@ class OpenAIBatchAdapter:
                 "OpenAI dashboard for details."
             )
 
+        if self.is_sharded(provider_batch_id):
+            yield from self._fetch_sharded(provider_batch_id, request_id_map)
+            return
+
         # Build reverse map: custom_id → original request_id
         custom_to_spec: Dict[str, str] = {v: k for k, v in request_id_map.items()}
-
-        file_response = self._client.files.content(result_ref)
+        for _, result in self._iter_output_records(result_ref, custom_to_spec):
+            yield result
+
+    def _iter_output_records(
+        self, output_file_id: str, custom_to_spec: Dict[str, str]
+    ) -> Generator[Tuple[str, LLMBatchResult], None, None]:
+        """Stream an output file, yielding ``(custom_id, LLMBatchResult)`` pairs."""
+        file_response = self._client.files.content(output_file_id)
         iter_lines = getattr(file_response, "iter_lines", None)
         line_iter = None
         if callable(iter_lines):
@@ -336,7 +758,7 @@ class OpenAIBatchAdapter:
 
             # Item-level error (the request itself failed)
             if error_payload:
-                yield LLMBatchResult(
+                yield custom_id, LLMBatchResult(
                     request_id=request_id,
                     status="errored",
                     error=LLMExecutionError(
@@ -348,7 +770,7 @@ class OpenAIBatchAdapter:
                 continue
 
             if response_payload is None:
-                yield LLMBatchResult(
+                yield custom_id, LLMBatchResult(
                     request_id=request_id,
                     status="errored",
                     error=LLMExecutionError(
@@ -368,7 +790,7 @@ class OpenAIBatchAdapter:
             if status_code != 200:
                 # HTTP-level error from the provider
                 error_detail = body.get("error", {}) if isinstance(body, dict) else {}
-                yield LLMBatchResult(
+                yield custom_id, LLMBatchResult(
                     request_id=request_id,
                     status="errored",
                     error=LLMExecutionError(
@@ -389,7 +811,7 @@ class OpenAIBatchAdapter:
                 content = msg.get("content")
 
             if not content:
-                yield LLMBatchResult(
+                yield custom_id, LLMBatchResult(
                     request_id=request_id,
                     status="errored",
                     error=LLMExecutionError(
@@ -415,7 +837,7 @@ class OpenAIBatchAdapter:
                     cache_read_input_tokens=None,
                 )
 
-            yield LLMBatchResult(
+            yield custom_id, LLMBatchResult(
                 request_id=request_id,
                 status="succeeded",
                 resolved_provider="openai",
@@ -4,16 +4,29 @@ File-backed JSON persistence for LLMBatchHandle objects (E05-F03).
 Persists batch handles to a directory as ``{agentmap_batch_id}.json`` files.
 No ``api_key`` is ever written to disk — credentials are injected at adapter
 level and are never part of the handle.
+
+The JSON files remain the durable record. Alongside them a SQLite index
+(``{batch_dir}/index.sqlite3`` by default) holds one row per handle with its
+status, provider, model, optional graph name / thread id and timestamps, so
+questions like "which batches are still pending for graph X" or "purge
+everything older than 7 days" are answered by one indexed query instead of
+listing and parsing every file. Handle files written before the index
+existed (or by a process that crashed between the file write and the index
+update) are imported the first time a repository instance touches the index.
 """
 
 import json
 import os
 import re
+import sqlite3
 import tempfile
-from typing import Any, Dict
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 from agentmap.exceptions import LLMServiceError
-from agentmap.models.llm_batch import LLMBatchHandle
+from agentmap.models.llm_batch import LLMBatchHandle, LLMBatchStatus
 
 # Defense-in-depth: an agentmap_batch_id must be exactly this shape before it is
 # ever composed into a filesystem path. The service layer (restore_batch) already
@@ -21,6 +34,56 @@ from agentmap.models.llm_batch import LLMBatchHandle
 # hand-constructed caller cannot path-traverse out of the batch directory.
 _AGENTMAP_BATCH_ID_RE = re.compile(r"^amatch_[a-f0-9]{32}$")
 
+TERMINAL_BATCH_STATUSES = frozenset(
+    {
+        LLMBatchStatus.ENDED,
+        LLMBatchStatus.EXPIRED,
+        LLMBatchStatus.CANCELED,
+        LLMBatchStatus.FAILED,
+    }
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS batch_handles (
+    agentmap_batch_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT,
+    graph_name TEXT,
+    thread_id TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS batch_handles_status
+    ON batch_handles (status, provider);
+CREATE INDEX IF NOT EXISTS batch_handles_graph
+    ON batch_handles (graph_name, status);
+CREATE INDEX IF NOT EXISTS batch_handles_thread
+    ON batch_handles (thread_id);
+CREATE INDEX IF NOT EXISTS batch_handles_created
+    ON batch_handles (created_at);
+"""
+
+# graph_name / thread_id are index-only tags: a save without them keeps the
+# tags recorded by an earlier save or tag() call.
+_UPSERT = """
+INSERT INTO batch_handles (agentmap_batch_id, status, provider, model,
+    graph_name, thread_id, created_at, updated_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (agentmap_batch_id) DO UPDATE SET
+    status = excluded.status,
+    provider = excluded.provider,
+    model = excluded.model,
+    graph_name = COALESCE(excluded.graph_name, batch_handles.graph_name),
+    thread_id = COALESCE(excluded.thread_id, batch_handles.thread_id),
+    created_at = excluded.created_at,
+    updated_at = excluded.updated_at,
+    data = excluded.data
+"""
+
+StatusFilter = Union[LLMBatchStatus, str, Iterable[Union[LLMBatchStatus, str]]]
+
 
 def _require_safe_batch_id(agentmap_batch_id: str) -> None:
     """Reject any batch id that is not a path-safe ``amatch_<32 hex>`` token."""
@@ -31,6 +94,39 @@ def _require_safe_batch_id(agentmap_batch_id: str) -> None:
         )
 
 
+@contextmanager
+def _connect(path: str) -> Iterator[sqlite3.Connection]:
+    # Autocommit mode; multi-row writes open BEGIN IMMEDIATE explicitly.
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA busy_timeout = 30000")
+        yield conn
+    finally:
+        conn.close()
+
+
+def _status_value(status: Union[LLMBatchStatus, str]) -> str:
+    return status.value if isinstance(status, LLMBatchStatus) else str(status)
+
+
+def _status_values(statuses: StatusFilter) -> List[str]:
+    if isinstance(statuses, (LLMBatchStatus, str)):
+        return [_status_value(statuses)]
+    return [_status_value(status) for status in statuses]
+
+
+def _created_epoch(handle: LLMBatchHandle, default: float) -> float:
+    """``handle.created_at`` (ISO-8601) as epoch seconds, else *default*."""
+    if handle.created_at:
+        try:
+            return datetime.fromisoformat(
+                handle.created_at.replace("Z", "+00:00")
+            ).timestamp()
+        except ValueError:
+            pass
+    return default
+
+
 class BatchHandleRepository:
     """
     File-backed repository for ``LLMBatchHandle`` persistence.
@@ -38,43 +134,58 @@ class BatchHandleRepository:
     Each handle is stored as ``{batch_dir}/{agentmap_batch_id}.json``.
     The batch directory is created on first save (F-HIGH-1 fix).
     Writes are atomic via a temp file + os.replace (TD-2 fix).
+    Every save also updates the SQLite index used by ``query()``,
+    ``set_status()`` and ``purge()``.
     """
 
-    def __init__(self, batch_dir: str) -> None:
+    def __init__(self, batch_dir: str, index_path: Optional[str] = None) -> None:
         self._batch_dir = batch_dir
+        self._index_path = index_path or os.path.join(batch_dir, "index.sqlite3")
+        self._index_ready = False
 
-    def save(self, handle: LLMBatchHandle) -> None:
+    def save(
+        self,
+        handle: LLMBatchHandle,
+        *,
+        graph_name: Optional[str] = None,
+        thread_id: Optional[str] = None,
+    ) -> None:
         """
         Serialize ``handle`` to a JSON file in the batch directory.
 
         Creates ``batch_dir`` if it does not exist (including nested parents),
         then writes atomically via a temp file + ``os.replace`` so a crash
-        mid-write cannot leave a partial/corrupt JSON file.
+        mid-write cannot leave a partial/corrupt JSON file. The index row is
+        updated afterwards; ``graph_name`` / ``thread_id`` tag the handle for
+        ``query()`` and are kept from earlier saves when omitted.
+        """
+        self.save_many([handle], graph_name=graph_name, thread_id=thread_id)
+
+    def save_many(
+        self,
+        handles: Iterable[LLMBatchHandle],
+        *,
+        graph_name: Optional[str] = None,
+        thread_id: Optional[str] = None,
+    ) -> None:
         """
-        _require_safe_batch_id(handle.agentmap_batch_id)
+        Persist several handles, updating the index in one transaction.
+
+        Used for the status updates of a polling pass. Each handle file is
+        written atomically as in ``save()``.
+        """
+        handles = list(handles)
+        for handle in handles:
+            _require_safe_batch_id(handle.agentmap_batch_id)
+        if not handles:
+            return
         os.makedirs(self._batch_dir, exist_ok=True)
-        data = handle.to_dict()
-        file_path = os.path.join(self._batch_dir, f"{handle.agentmap_batch_id}.json")
-        # Atomic write: write to a temp file in the same dir, then replace.
-        tmp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=self._batch_dir,
-                delete=False,
-                suffix=".tmp",
-            ) as tmp:
-                tmp_path = tmp.name
-                json.dump(data, tmp, indent=2, default=str)
-            os.replace(tmp_path, file_path)
-        except Exception:
-            if tmp_path is not None:
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
-            raise
+        rows = []
+        for handle in handles:
+            data = self._write_file(handle)
+            now = time.time()
+            rows.append(self._index_row(handle, data, graph_name, thread_id, now, now))
+        self._upsert_rows(rows)
 
     def load(self, agentmap_batch_id: str) -> LLMBatchHandle:
         """Load a handle from disk by its agentmap_batch_id."""
@@ -98,7 +209,8 @@ class BatchHandleRepository:
         """
         Delete a persisted handle file from disk (TD-001, spec §1.5).
 
-        Idempotent: deleting an already-absent handle is not an error.
+        Idempotent: deleting an already-absent handle is not an error. The
+        handle's index row is removed as well.
 
         Returns:
             ``True`` if a file was deleted, ``False`` if it did not exist.
@@ -107,6 +219,299 @@ class BatchHandleRepository:
         file_path = os.path.join(self._batch_dir, f"{agentmap_batch_id}.json")
         try:
             os.unlink(file_path)
-            return True
+            deleted = True
         except FileNotFoundError:
-            return False
+            deleted = False
+        if os.path.exists(self._index_path):
+            with _connect(self._index_path) as conn:
+                conn.execute(
+                    "DELETE FROM batch_handles WHERE agentmap_batch_id = ?",
+                    (agentmap_batch_id,),
+                )
+        return deleted
+
+    # ------------------------------------------------------------------
+    # Indexed queries and bulk operations
+    # ------------------------------------------------------------------
+
+    def tag(
+        self,
+        agentmap_batch_id: str,
+        *,
+        graph_name: Optional[str] = None,
+        thread_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Record the graph and/or thread a persisted handle belongs to.
+
+        Returns:
+            ``False`` if no handle is indexed under ``agentmap_batch_id``.
+        """
+        _require_safe_batch_id(agentmap_batch_id)
+        self._ensure_index()
+        with _connect(self._index_path) as conn:
+            cursor = conn.execute(
+                "UPDATE batch_handles SET "
+                "graph_name = COALESCE(?, graph_name), "
+                "thread_id = COALESCE(?, thread_id) "
+                "WHERE agentmap_batch_id = ?",
+                (graph_name, thread_id, agentmap_batch_id),
+            )
+            return cursor.rowcount > 0
+
+    def query(
+        self,
+        *,
+        status: Optional[StatusFilter] = None,
+        provider: Optional[str] = None,
+        graph_name: Optional[str] = None,
+        thread_id: Optional[str] = None,
+        older_than: Optional[float] = None,
+        newer_than: Optional[float] = None,
+        limit: Optional[int] = None,
+    ) -> List[LLMBatchHandle]:
+        """
+        Handles matching every given filter, oldest first.
+
+        Args:
+            status: One status or an iterable of statuses.
+            provider: Canonical provider name.
+            graph_name: Graph tag recorded by ``save()`` / ``tag()``.
+            thread_id: Thread tag recorded by ``save()`` / ``tag()``.
+            older_than: Only handles created more than this many seconds ago.
+            newer_than: Only handles created less than this many seconds ago.
+            limit: Maximum number of handles returned.
+        """
+        where, params = self._where(
+            status, provider, graph_name, thread_id, older_than, newer_than
+        )
+        sql = f"SELECT data FROM batch_handles{where} ORDER BY created_at"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        self._ensure_index()
+        with _connect(self._index_path) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self.load_from_dict(json.loads(data)) for (data,) in rows]
+
+    def set_status(
+        self, agentmap_batch_ids: Iterable[str], status: Union[LLMBatchStatus, str]
+    ) -> int:
+        """
+        Set the status of several persisted handles at once.
+
+        Handles are rewritten through ``save_many()``, so files and index stay
+        in step. Ids without a persisted handle are skipped.
+
+        Returns:
+            Number of handles updated.
+        """
+        new_status = LLMBatchStatus(_status_value(status))
+        updated = []
+        for agentmap_batch_id in agentmap_batch_ids:
+            try:
+                handle = self.load(agentmap_batch_id)
+            except FileNotFoundError:
+                continue
+            if handle.status != new_status:
+                handle.status = new_status
+                updated.append(handle)
+        self.save_many(updated)
+        return len(updated)
+
+    def purge(
+        self,
+        older_than: float,
+        *,
+        status: Optional[StatusFilter] = None,
+    ) -> List[str]:
+        """
+        Delete handles created more than ``older_than`` seconds ago.
+
+        Only terminal handles (ended, expired, canceled, failed) are removed
+        unless ``status`` names the statuses to purge explicitly, so batches
+        still in flight are never lost to retention.
+
+        Returns:
+            The ids of the deleted handles.
+        """
+        if status is None:
+            status = TERMINAL_BATCH_STATUSES
+        where, params = self._where(status, None, None, None, older_than, None)
+        self._ensure_index()
+        with _connect(self._index_path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                doomed = [
+                    agentmap_batch_id
+                    for (agentmap_batch_id,) in conn.execute(
+                        f"SELECT agentmap_batch_id FROM batch_handles{where}", params
+                    )
+                ]
+                conn.executemany(
+                    "DELETE FROM batch_handles WHERE agentmap_batch_id = ?",
+                    [(agentmap_batch_id,) for agentmap_batch_id in doomed],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        # Rows go first: a file left behind by a crash is re-imported and
+        # purged on a later pass, never indexed without its file.
+        for agentmap_batch_id in doomed:
+            try:
+                os.unlink(os.path.join(self._batch_dir, f"{agentmap_batch_id}.json"))
+            except FileNotFoundError:
+                pass
+        return doomed
+
+    def import_files(self) -> int:
+        """
+        Index handle files that are missing from, or newer than, the index.
+
+        This is the migration path for batch directories written before the
+        index existed; it runs automatically on first use of the index.
+        Unreadable or malformed files are skipped.
+
+        Returns:
+            Number of handles imported.
+        """
+        self._open_index()
+        self._index_ready = True
+        try:
+            names = os.listdir(self._batch_dir)
+        except FileNotFoundError:
+            return 0
+        with _connect(self._index_path) as conn:
+            indexed = dict(
+                conn.execute("SELECT agentmap_batch_id, updated_at FROM batch_handles")
+            )
+
+        rows = []
+        for name in names:
+            agentmap_batch_id, ext = os.path.splitext(name)
+            if ext != ".json" or not _AGENTMAP_BATCH_ID_RE.match(agentmap_batch_id):
+                continue
+            file_path = os.path.join(self._batch_dir, name)
+            try:
+                mtime = os.path.getmtime(file_path)
+                if mtime <= indexed.get(agentmap_batch_id, float("-inf")):
+                    continue
+                handle = self.load(agentmap_batch_id)
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                continue
+            if handle.agentmap_batch_id != agentmap_batch_id:
+                continue
+            rows.append(
+                self._index_row(handle, handle.to_dict(), None, None, mtime, mtime)
+            )
+        self._upsert_rows(rows)
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _write_file(self, handle: LLMBatchHandle) -> Dict[str, Any]:
+        data = handle.to_dict()
+        file_path = os.path.join(self._batch_dir, f"{handle.agentmap_batch_id}.json")
+        # Atomic write: write to a temp file in the same dir, then replace.
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                encoding="utf-8",
+                dir=self._batch_dir,
+                delete=False,
+                suffix=".tmp",
+            ) as tmp:
+                tmp_path = tmp.name
+                json.dump(data, tmp, indent=2, default=str)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            raise
+        return data
+
+    @staticmethod
+    def _index_row(
+        handle: LLMBatchHandle,
+        data: Dict[str, Any],
+        graph_name: Optional[str],
+        thread_id: Optional[str],
+        created_default: float,
+        updated_at: float,
+    ) -> tuple:
+        return (
+            handle.agentmap_batch_id,
+            _status_value(handle.status),
+            handle.provider,
+            handle.model,
+            graph_name,
+            thread_id,
+            _created_epoch(handle, created_default),
+            updated_at,
+            json.dumps(data, default=str),
+        )
+
+    def _upsert_rows(self, rows: List[tuple]) -> None:
+        if not rows:
+            return
+        self._ensure_index()
+        with _connect(self._index_path) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany(_UPSERT, rows)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _open_index(self) -> None:
+        directory = os.path.dirname(self._index_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with _connect(self._index_path) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _ensure_index(self) -> None:
+        if not self._index_ready:
+            self.import_files()
+
+    @staticmethod
+    def _where(
+        status: Optional[StatusFilter],
+        provider: Optional[str],
+        graph_name: Optional[str],
+        thread_id: Optional[str],
+        older_than: Optional[float],
+        newer_than: Optional[float],
+    ) -> tuple:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if status is not None:
+            values = _status_values(status)
+            clauses.append(f"status IN ({', '.join('?' * len(values)) or 'NULL'})")
+            params.extend(values)
+        for column, value in (
+            ("provider", provider),
+            ("graph_name", graph_name),
+            ("thread_id", thread_id),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        now = time.time()
+        if older_than is not None:
+            clauses.append("created_at < ?")
+            params.append(now - older_than)
+        if newer_than is not None:
+            clauses.append("created_at >= ?")
+            params.append(now - newer_than)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
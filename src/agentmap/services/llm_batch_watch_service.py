@@ -0,0 +1,309 @@
+"""
+Multiplexed watcher for many in-flight LLM batches.
+
+``LLMService.wait_for_batch`` runs one backoff loop per handle, which does not
+scale to hundreds of outstanding batches.  This service keeps a single,
+persisted watch list instead: each watched batch has its own next-poll time
+and exponential backoff, and every ``poll_due`` pass polls all due batches
+together through ``LLMService.poll_batches`` (one list call per provider page
+where the adapter supports it).
+
+The watch list is a small JSON file next to the batch handles
+(``llm.batch_watch.watchlist_path``), re-read on every operation so a CLI
+process can add watches that a server-side watcher then picks up, and so
+watches survive restarts.  Every read-modify-write of the file holds an
+exclusive ``flock`` on ``<watchlist_path>.lock``, so concurrent processes
+never overwrite each other's changes.  Completion callbacks are in-process only; the
+persisted equivalent is ``resume_thread_id``, which the runtime watcher uses
+to resume a suspended workflow once its batch reaches a terminal status.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from agentmap.exceptions import LLMServiceError
+from agentmap.models.llm_batch import LLMBatchHandle, LLMBatchStatus
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.llm_batch_repository import BatchHandleRepository
+from agentmap.services.logging_service import LoggingService
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+BatchCallback = Callable[[LLMBatchHandle], Any]
+
+_TERMINAL_STATUSES = frozenset(
+    {
+        LLMBatchStatus.ENDED,
+        LLMBatchStatus.FAILED,
+        LLMBatchStatus.EXPIRED,
+        LLMBatchStatus.CANCELED,
+    }
+)
+
+
+class LLMBatchWatchService:
+    """Persisted watch list plus batched polling for LLM batch handles."""
+
+    def __init__(
+        self,
+        llm_service: Any,
+        batch_handle_repository: BatchHandleRepository,
+        app_config_service: AppConfigService,
+        logging_service: LoggingService,
+    ):
+        self.llm_service = llm_service
+        self.repository = batch_handle_repository
+        self.logger = logging_service.get_class_logger(self)
+
+        config = app_config_service.get_batch_watch_config()
+        self.poll_interval = config["poll_interval_seconds"]
+        self.max_poll_interval = config["max_poll_interval_seconds"]
+        self.tick_seconds = config["tick_seconds"]
+        self.watchlist_path = config["watchlist_path"]
+
+        self._callbacks: Dict[str, List[BatchCallback]] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------ watching
+
+    def watch(
+        self,
+        handle: Union[LLMBatchHandle, str],
+        *,
+        resume_thread_id: Optional[str] = None,
+        on_complete: Optional[BatchCallback] = None,
+    ) -> Dict[str, Any]:
+        """
+        Start watching a batch (idempotent) and return its watch entry.
+
+        ``handle`` is a handle or the ``agentmap_batch_id`` of a persisted one;
+        handles passed in are saved so the watch survives restarts, and
+        ``resume_thread_id`` is recorded as the handle's thread tag in the
+        repository index.  The first poll is due immediately, so batches that
+        already finished complete on the next pass.
+
+        Raises:
+            LLMServiceError: If the id is malformed or no handle is persisted.
+        """
+        if isinstance(handle, LLMBatchHandle):
+            self.repository.save(handle)
+        else:
+            handle = self._load_handle(handle)
+        batch_id = handle.agentmap_batch_id
+        if resume_thread_id:
+            self.repository.tag(batch_id, thread_id=resume_thread_id)
+
+        with self._watchlist_lock():
+            entries = self._load()
+            entry = entries.get(batch_id)
+            if entry is None:
+                entry = {
+                    "agentmap_batch_id": batch_id,
+                    "provider": handle.provider,
+                    "status": handle.status.value,
+                    "watched_at": time.time(),
+                    "next_poll_at": time.time(),
+                    "interval": self.poll_interval,
+                    "polls": 0,
+                    "resume_thread_id": None,
+                }
+                entries[batch_id] = entry
+            if resume_thread_id:
+                entry["resume_thread_id"] = resume_thread_id
+            self._save(entries)
+            if on_complete is not None:
+                self._callbacks.setdefault(batch_id, []).append(on_complete)
+
+        self.logger.info(
+            f"[LLMBatchWatchService] Watching {batch_id} ({handle.provider}, "
+            f"{handle.status.value}); {len(entries)} batch(es) watched"
+        )
+        return dict(entry)
+
+    def add_callback(self, agentmap_batch_id: str, callback: BatchCallback) -> None:
+        """Register an in-process completion callback for a watched batch."""
+        with self._lock:
+            if agentmap_batch_id not in self._load():
+                raise LLMServiceError(
+                    f"Batch {agentmap_batch_id!r} is not being watched."
+                )
+            self._callbacks.setdefault(agentmap_batch_id, []).append(callback)
+
+    def unwatch(self, agentmap_batch_id: str) -> bool:
+        """Stop watching a batch; returns False if it was not watched."""
+        with self._watchlist_lock():
+            entries = self._load()
+            removed = entries.pop(agentmap_batch_id, None) is not None
+            if removed:
+                self._save(entries)
+            self._callbacks.pop(agentmap_batch_id, None)
+        return removed
+
+    def list_watches(self) -> List[Dict[str, Any]]:
+        """Watch entries, soonest next poll first."""
+        with self._lock:
+            entries = list(self._load().values())
+        return sorted(entries, key=lambda entry: entry["next_poll_at"])
+
+    def seconds_until_next_poll(self) -> Optional[float]:
+        """Seconds until the earliest watched batch is due (None if idle)."""
+        entries = self.list_watches()
+        if not entries:
+            return None
+        return max(0.0, entries[0]["next_poll_at"] - time.time())
+
+    # ------------------------------------------------------------- polling
+
+    def poll_due(self, force: bool = False) -> List[Dict[str, Any]]:
+        """
+        Poll every due batch (all watched batches when ``force``) in one pass.
+
+        Terminal batches are removed from the watch list and their callbacks
+        fired; the rest are rescheduled with doubled (capped) intervals.
+
+        Returns one completion record per batch that reached a terminal
+        status: ``{"handle": LLMBatchHandle, "resume_thread_id": str|None}``.
+        """
+        now = time.time()
+        with self._lock:
+            due_ids = [
+                entry["agentmap_batch_id"]
+                for entry in self._load().values()
+                if force or entry["next_poll_at"] <= now
+            ]
+        if not due_ids:
+            return []
+
+        handles = []
+        missing = []
+        for batch_id in due_ids:
+            try:
+                handles.append(self._load_handle(batch_id))
+            except LLMServiceError as e:
+                self.logger.warning(f"[LLMBatchWatchService] Dropping watch: {e}")
+                missing.append(batch_id)
+
+        polled = self.llm_service.poll_batches(handles) if handles else []
+
+        completions = []
+        now = time.time()
+        with self._watchlist_lock():
+            entries = self._load()
+            for batch_id in missing:
+                entries.pop(batch_id, None)
+            for handle in polled:
+                entry = entries.get(handle.agentmap_batch_id)
+                if entry is None:  # unwatched while polling
+                    continue
+                entry["polls"] += 1
+                entry["status"] = handle.status.value
+                if handle.status in _TERMINAL_STATUSES:
+                    del entries[handle.agentmap_batch_id]
+                    completions.append(
+                        {
+                            "handle": handle,
+                            "resume_thread_id": entry.get("resume_thread_id"),
+                            "callbacks": self._callbacks.pop(
+                                handle.agentmap_batch_id, []
+                            ),
+                        }
+                    )
+                    continue
+                entry["interval"] = min(entry["interval"] * 2, self.max_poll_interval)
+                entry["next_poll_at"] = now + entry["interval"]
+            self._save(entries)
+
+        self.logger.debug(
+            f"[LLMBatchWatchService] Polled {len(polled)} batch(es), "
+            f"{len(completions)} completed"
+        )
+        for completion in completions:
+            handle = completion["handle"]
+            for callback in completion.pop("callbacks"):
+                try:
+                    callback(handle)
+                except Exception as e:
+                    self.logger.error(
+                        f"[LLMBatchWatchService] Completion callback for "
+                        f"{handle.agentmap_batch_id} failed: {e}"
+                    )
+        return completions
+
+    # --------------------------------------------------------- persistence
+
+    def _load_handle(self, agentmap_batch_id: str) -> LLMBatchHandle:
+        try:
+            return self.repository.load(agentmap_batch_id)
+        except FileNotFoundError:
+            raise LLMServiceError(
+                f"No persisted batch handle for {agentmap_batch_id!r}."
+            ) from None
+
+    @contextmanager
+    def _watchlist_lock(self):
+        """
+        Hold the watch list for a read-modify-write.
+
+        Takes the in-process lock and an exclusive ``flock`` on the lock file
+        next to the watch list; where ``fcntl`` is unavailable (Windows) only
+        threads of this process are serialized.
+        """
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            directory = os.path.dirname(self.watchlist_path) or "."
+            os.makedirs(directory, exist_ok=True)
+            with open(f"{self.watchlist_path}.lock", "ab") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.watchlist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self.logger.warning(
+                f"[LLMBatchWatchService] Ignoring unreadable watch list "
+                f"{self.watchlist_path}: {e}"
+            )
+            return {}
+        return {entry["agentmap_batch_id"]: entry for entry in data.get("watches", [])}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.watchlist_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump({"watches": list(entries.values())}, tmp, indent=2)
+            os.replace(tmp_path, self.watchlist_path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get_service_info(self) -> Dict[str, Any]:
+        """Get service information for debugging."""
+        return {
+            "service": "LLMBatchWatchService",
+            "watchlist_path": self.watchlist_path,
+            "watched": len(self.list_watches()),
+            "poll_interval_seconds": self.poll_interval,
+            "max_poll_interval_seconds": self.max_poll_interval,
+        }
@@ -183,6 +183,16 @@ class LLMFallbackHandler(LLMFallbackAsyncLadderMixin):
 
         return plan
 
+    def get_hedge_tiers(
+        self, original_provider: str, original_model: str
+    ) -> List[tuple]:
+        """Tiers a hedged request may race the primary against, in ladder order.
+
+        The hedge uses the same plan as the fallback ladder so a hedge never
+        targets a model the ladder would not also have tried.
+        """
+        return self._build_tier_plan(original_provider, original_model)
+
     def try_with_fallback(
         self,
         original_provider: str,
@@ -20,6 +20,7 @@ from typing import (
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Awaitable,
     Dict,
     List,
     NoReturn,
@@ -38,6 +39,7 @@ from agentmap.exceptions import (
     LLMTimeoutError,
 )
 from agentmap.models.llm_batch import (
+    BatchPollResult,
     LLMBatchHandle,
     LLMBatchResult,
     LLMBatchStatus,
@@ -65,7 +67,9 @@ from agentmap.services.llm._budget_guard_refusal import (
     mark_budget_guard_refusal_context,
     telemetry_safe_marker,
 )
+from agentmap.services.llm.budget_ledger import call_reservations
 from agentmap.services.llm.cost_calculator import LLMCostCalculator
+from agentmap.services.llm.hedging import HedgeConfig, LLMHedgeController
 from agentmap.services.llm.stream_seam import stream_provider
 from agentmap.services.llm.tool_call_extraction import (
     extract_tool_calls,
@@ -106,6 +110,7 @@ from agentmap.services.telemetry.constants import (
     LLM_CALL_SPAN,
     METRIC_DIM_BATCH_STATUS,
     METRIC_DIM_ERROR_TYPE,
+    METRIC_DIM_HEDGE_OUTCOME,
     METRIC_DIM_MODEL,
     METRIC_DIM_PROVIDER,
     METRIC_DIM_TIER,
@@ -117,6 +122,7 @@ from agentmap.services.telemetry.constants import (
     METRIC_LLM_DURATION,
     METRIC_LLM_ERRORS,
     METRIC_LLM_FALLBACK,
+    METRIC_LLM_HEDGE,
     METRIC_LLM_ROUTING_CACHE_HIT,
     METRIC_LLM_TOKENS_INPUT,
     METRIC_LLM_TOKENS_OUTPUT,
@@ -246,6 +252,12 @@ class LLMService:
             failures_threshold=cb_cfg.get("failure_threshold", 5),
             reset_seconds=cb_cfg.get("reset_timeout", 60),
         )
+        # Opt-in hedged requests: race the first fallback tier against a slow
+        # primary (services/llm/hedging.py). Disabled unless configured.
+        self._hedging = LLMHedgeController(
+            HedgeConfig.from_dict(self._resilience_config.get("hedging")),
+            on_outcome=self._record_hedge_metric,
+        )
 
         # Track whether routing is enabled
         self._routing_enabled = routing_service is not None
@@ -258,6 +270,7 @@ class LLMService:
         self._metric_cache_hit = None
         self._metric_circuit_breaker = None
         self._metric_fallback = None
+        self._metric_hedge = None
         self._metric_batch_submitted = None
         self._metric_batch_poll = None
         self._metric_batch_results_fetched = None
@@ -305,6 +318,11 @@ class LLMService:
                     unit="1",
                     description="Fallback activations",
                 )
+                self._metric_hedge = telemetry_service.create_counter(
+                    METRIC_LLM_HEDGE,
+                    unit="1",
+                    description="Hedged request events",
+                )
                 self._metric_batch_submitted = telemetry_service.create_counter(
                     METRIC_LLM_BATCH_SUBMITTED_COUNT,
                     unit="1",
@@ -773,11 +791,16 @@ class LLMService:
         unchanged -- ``call_llm_async`` is the outermost boundary that unwraps
         it, so it survives the telemetry wrapper's own except-Exception nets
         too (REQ-F-003 / NFR-F-003).
+
+        ``call_reservations()`` is entered here, before hedging splits the
+        call into tasks, so the budget ledger's reservations for every tier
+        are visible to the single ``_observe_receipt`` below.
         """
-        response = await self._dispatch_async_core(
-            messages, provider, model, temperature, routing_context, **kwargs
-        )
-        await self._observe_receipt(response)
+        async with call_reservations():
+            response = await self._dispatch_async_core(
+                messages, provider, model, temperature, routing_context, **kwargs
+            )
+            await self._observe_receipt(response)
         return response
 
     async def _dispatch_async_core(
@@ -1288,6 +1311,82 @@ class LLMService:
             max_output_tokens=max_output_tokens,
         )
 
+    async def _invoke_direct_maybe_hedged(
+        self,
+        client: Any,
+        messages: List[LLMMessage],
+        provider: str,
+        current_model: str,
+        cache_system_prompt: bool,
+        tools: Optional[List[Dict[str, Any]]],
+        max_output_tokens: Optional[int],
+    ) -> LLMResponse:
+        """Invoke the primary tier, hedging to the first ladder tier when slow.
+
+        Hedging applies only where the fallback ladder would -- never to
+        tool-bound calls (REQ-F-008) and only with routing configured. A
+        primary failure that the hedge cannot rescue propagates unchanged
+        into ``_handle_direct_call_exception``.
+        """
+
+        def primary() -> Awaitable[LLMResponse]:
+            return self._bind_and_invoke_direct(
+                client,
+                messages,
+                provider,
+                current_model,
+                cache_system_prompt,
+                tools,
+                max_output_tokens,
+            )
+
+        tier = None
+        if (
+            self._hedging.enabled
+            and not tools
+            and self.features_registry
+            and self.routing_config
+        ):
+            tier = self._select_hedge_tier(provider, current_model)
+        if tier is None:
+            return await primary()
+        return await self._hedging.run(
+            provider,
+            current_model,
+            primary,
+            lambda: self._invoke_hedge_tier(tier[0], tier[1], messages),
+        )
+
+    def _select_hedge_tier(self, provider: str, model: str) -> Optional[tuple]:
+        """First ladder tier with a closed circuit breaker, or ``None``."""
+        for tier in self._fallback_handler.get_hedge_tiers(provider, model):
+            if not self._circuit_breaker.is_open(*tier):
+                return tier
+        return None
+
+    async def _invoke_hedge_tier(
+        self, provider: str, model: str, messages: List[LLMMessage]
+    ) -> LLMResponse:
+        """Dispatch the hedge exactly as the fallback ladder would a tier.
+
+        ``attempt_kind="hedge"`` lets a budget guard price (and refuse) the
+        parallel spend; a refusal only cancels the hedge.
+        """
+        self._logger.info(f"Hedging slow primary with '{provider}:{model}'")
+        config = dict(self._provider_utils.get_provider_config(provider))
+        config["model"] = model
+        client = self._client_factory.get_or_create_client(provider, config)
+        langchain_messages = self._message_utils.convert_messages_to_langchain(
+            LLMMessageService.strip_cache_control(messages)
+        )
+        return await self._invoke_with_resilience_async(
+            client, langchain_messages, provider, model, attempt_kind="hedge"
+        )
+
+    def get_hedge_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-route hedged-request statistics (calls, hedges, hedge rate, wins)."""
+        return self._hedging.get_stats()
+
     def _raise_for_tool_bound_failure(
         self, provider: str, current_model: str, typed_error: Exception
     ) -> NoReturn:
@@ -1405,7 +1504,7 @@ class LLMService:
             config = self._resolve_config(provider, model, temperature, max_tokens)
             current_model = config.get("model", "unknown")
             client = self._client_factory.get_or_create_client(provider, config)
-            return await self._bind_and_invoke_direct(
+            return await self._invoke_direct_maybe_hedged(
                 client,
                 messages,
                 provider,
@@ -2176,6 +2275,16 @@ class LLMService:
         """
         return self._routing_enabled
 
+    def get_memory_segment_config(self) -> Dict[str, Any]:
+        """
+        Get the segment store settings for token-aware LLMAgent memory.
+
+        Returns:
+            ``llm.memory`` configuration (segment directory under the cache
+            path and its retention limits)
+        """
+        return self.configuration.get_llm_memory_config()
+
     # ------------------------------------------------------------------
     # Vision / multimodal helpers
     # ------------------------------------------------------------------
@@ -2960,7 +3069,98 @@ class LLMService:
             handle.status.value,
         )
         poll_result = adapter.poll(handle.provider_batch_id)
+        return self._apply_batch_poll_result(handle, poll_result)
+
+    def poll_batches(self, handles: List[LLMBatchHandle]) -> List[LLMBatchHandle]:
+        """
+        Poll many batch handles, amortizing provider calls where possible.
+
+        Handles are grouped by provider; adapters that implement ``poll_many``
+        (list endpoints) are polled once per group, others handle by handle.
+        Expired handles are returned unchanged, and a handle whose poll fails
+        is returned unchanged with the error logged so one bad batch cannot
+        stall the rest.  Results keep the order of ``handles``.  Updated
+        handles are persisted together through the repository's ``save_many``
+        when it has one.
+        """
+        updated: Dict[str, LLMBatchHandle] = {}
+        polled: List[LLMBatchHandle] = []
+        by_provider: Dict[str, List[LLMBatchHandle]] = {}
+        for handle in handles:
+            if handle.status == LLMBatchStatus.EXPIRED:
+                updated[handle.agentmap_batch_id] = handle
+            else:
+                by_provider.setdefault(handle.provider, []).append(handle)
+
+        for provider, group in by_provider.items():
+            adapter = self._get_adapter(provider)
+            poll_many = getattr(adapter, "poll_many", None)
+            results: Dict[str, BatchPollResult] = {}
+            if callable(poll_many) and len(group) > 1:
+                self._logger.info(
+                    "llm_batch.poll_many provider=%s handles=%d",
+                    provider,
+                    len(group),
+                )
+                try:
+                    results = poll_many([h.provider_batch_id for h in group])
+                except Exception as exc:
+                    self._logger.warning(
+                        "llm_batch.poll_many_failed provider=%s: %s — polling "
+                        "individually",
+                        provider,
+                        exc,
+                    )
+            for handle in group:
+                try:
+                    poll_result = results.get(handle.provider_batch_id)
+                    if poll_result is None:
+                        self._logger.info(
+                            "llm_batch.poll provider=%s status=%s",
+                            handle.provider,
+                            handle.status.value,
+                        )
+                        poll_result = adapter.poll(handle.provider_batch_id)
+                    polled.append(
+                        self._apply_batch_poll_result(
+                            handle, poll_result, persist=False
+                        )
+                    )
+                    updated[handle.agentmap_batch_id] = polled[-1]
+                except Exception as exc:
+                    self._logger.warning(
+                        "llm_batch.poll_failed agentmap_batch_id=%s: %s",
+                        handle.agentmap_batch_id,
+                        exc,
+                    )
+                    updated[handle.agentmap_batch_id] = handle
+
+        # One repository write for the whole pass (single index transaction).
+        if polled and self._batch_repo is not None:
+            try:
+                save_many = getattr(self._batch_repo, "save_many", None)
+                if callable(save_many):
+                    save_many(polled)
+                else:
+                    for handle in polled:
+                        self._batch_repo.save(handle)
+            except Exception as exc:
+                self._logger.warning(
+                    "llm_batch.persist_failed handles=%d: %s", len(polled), exc
+                )
+
+        return [updated[handle.agentmap_batch_id] for handle in handles]
 
+    def _apply_batch_poll_result(
+        self,
+        handle: LLMBatchHandle,
+        poll_result: BatchPollResult,
+        persist: bool = True,
+    ) -> LLMBatchHandle:
+        """Build, persist and record the handle that reflects ``poll_result``.
+
+        ``poll_batches`` passes ``persist=False`` and saves the whole pass at once.
+        """
         updated = LLMBatchHandle(
             agentmap_batch_id=handle.agentmap_batch_id,
             provider_batch_id=handle.provider_batch_id,
@@ -2976,7 +3176,7 @@ class LLMService:
             created_at=handle.created_at,
         )
 
-        if self._batch_repo is not None:
+        if persist and self._batch_repo is not None:
             self._batch_repo.save(updated)
 
         self._record_batch_poll_metric(
@@ -3751,6 +3951,26 @@ class LLMService:
         except Exception:
             pass
 
+    def _record_hedge_metric(self, provider: str, model: str, outcome: str) -> None:
+        """Record one hedged-request event on the hedge counter.
+
+        Guards: short-circuits if telemetry_service is None.
+        Error isolation: catches all exceptions silently.
+        """
+        if self._telemetry_service is None or self._metric_hedge is None:
+            return
+        try:
+            self._metric_hedge.add(
+                1,
+                {
+                    METRIC_DIM_PROVIDER: provider,
+                    METRIC_DIM_MODEL: model,
+                    METRIC_DIM_HEDGE_OUTCOME: outcome,
+                },
+            )
+        except Exception:
+            pass
+
     def _record_circuit_breaker_metric_on_open(self, provider: str, model: str) -> None:
         """Increment circuit breaker gauge when a circuit opens.
 
@@ -8,7 +8,8 @@ ONLY way to get loggers in the application - no helper methods or bypasses allow
 
 import logging
 import logging.config
-from typing import Any, Dict, Optional
+import reprlib
+from typing import Any, Callable, Dict, Optional
 
 from agentmap.exceptions.service_exceptions import LoggingNotConfiguredException
 
@@ -35,6 +36,74 @@ def trace(message, *args, **kwargs):
 logging.trace = trace
 
 
+# Deferred formatting helpers.
+#
+# Pass these as %-style arguments so nothing is rendered unless a handler
+# emits the record. The level check itself is cheap: ``Logger.isEnabledFor``
+# caches its answer per level until the logging configuration changes.
+#
+#   logger.debug("Set %s = %s", field, log_payload(output))
+#   logger.debug("Summary: %s", lazy_log(build_summary, state))
+
+DEFAULT_MAX_PAYLOAD_CHARS = 1000
+
+_payload_repr = reprlib.Repr()
+_payload_repr.maxlevel = 4
+_payload_repr.maxdict = _payload_repr.maxlist = _payload_repr.maxtuple = 50
+_payload_repr.maxset = _payload_repr.maxfrozenset = _payload_repr.maxdeque = 50
+_payload_repr.maxstring = DEFAULT_MAX_PAYLOAD_CHARS
+_payload_repr.maxother = 200
+
+
+class LogPayload:
+    """Renders a possibly large value lazily and bounded in size.
+
+    Strings are clipped to ``max_chars``. Containers are rendered with
+    ``reprlib``, which stops walking them once its per-container limits
+    are hit, so a multi-megabyte state is never formatted in full.
+    """
+
+    __slots__ = ("_value", "_max_chars")
+
+    def __init__(self, value: Any, max_chars: int = DEFAULT_MAX_PAYLOAD_CHARS):
+        self._value = value
+        self._max_chars = max_chars
+
+    def __str__(self) -> str:
+        value = self._value
+        text = value if isinstance(value, str) else _payload_repr.repr(value)
+        if len(text) <= self._max_chars:
+            return text
+        return f"{text[:self._max_chars]}... [{len(text) - self._max_chars} more chars]"
+
+    __repr__ = __str__
+
+
+class LazyLogMessage:
+    """Calls ``func(*args)`` only when the log record is formatted."""
+
+    __slots__ = ("_func", "_args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self._func = func
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args))
+
+    __repr__ = __str__
+
+
+def log_payload(value: Any, max_chars: int = DEFAULT_MAX_PAYLOAD_CHARS) -> LogPayload:
+    """Wrap *value* for deferred, size-bounded rendering in a log message."""
+    return LogPayload(value, max_chars)
+
+
+def lazy_log(func: Callable[..., Any], *args: Any) -> LazyLogMessage:
+    """Wrap ``func(*args)`` so it runs only if the log record is emitted."""
+    return LazyLogMessage(func, *args)
+
+
 class LoggingService:
     """
     Centralized logging service for dependency injection.
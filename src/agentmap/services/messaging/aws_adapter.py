@@ -6,11 +6,15 @@ interface for publishing messages to AWS SNS topics or SQS queues.
 """
 
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from agentmap.exceptions import MessagingConnectionError
 from agentmap.models.storage.types import StorageResult
 
+# SNS PublishBatch and SQS SendMessageBatch limits.
+MAX_BATCH_ENTRIES = 10
+MAX_BATCH_BYTES = 256 * 1024
+
 
 class AWSMessageAdapter:
     """
@@ -250,6 +254,191 @@ class AWSMessageAdapter:
                 operation="publish_message",
             )
 
+    async def publish_batch(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        attributes: Optional[List[Dict[str, str]]] = None,
+    ) -> StorageResult:
+        """
+        Publish messages with SNS ``publish_batch`` or SQS ``send_message_batch``.
+
+        Messages are sent in chunks of at most 10 entries and 256 KiB, the
+        limits of both APIs.
+
+        Args:
+            topic: Topic/queue name to publish to
+            messages: Message payloads
+            attributes: Optional attributes, one dict per message
+
+        Returns:
+            StorageResult whose ``item_results`` holds one result per message
+        """
+        attributes = attributes or [None] * len(messages)
+        try:
+            if self.service_type == "sns":
+                topic_arn = await self._get_topic_arn(topic)
+                if not topic_arn:
+                    return StorageResult(
+                        success=False,
+                        error=f"Failed to get topic ARN for: {topic}",
+                        operation="publish_batch",
+                    )
+
+                def send(entries):
+                    return self._sns_client.publish_batch(
+                        TopicArn=topic_arn,
+                        PublishBatchRequestEntries=[
+                            {
+                                "Id": e["Id"],
+                                "Message": e["Body"],
+                                "MessageAttributes": e["MessageAttributes"],
+                            }
+                            for e in entries
+                        ],
+                    )
+
+            elif self.service_type == "sqs":
+                queue_url = await self._get_queue_url(topic)
+                if not queue_url:
+                    return StorageResult(
+                        success=False,
+                        error=f"Failed to get queue URL for: {topic}",
+                        operation="publish_batch",
+                    )
+
+                def send(entries):
+                    return self._sqs_client.send_message_batch(
+                        QueueUrl=queue_url,
+                        Entries=[
+                            {
+                                "Id": e["Id"],
+                                "MessageBody": e["Body"],
+                                "MessageAttributes": e["MessageAttributes"],
+                            }
+                            for e in entries
+                        ],
+                    )
+
+            else:
+                return StorageResult(
+                    success=False,
+                    error=f"Unsupported service type: {self.service_type}",
+                    operation="publish_batch",
+                )
+
+            item_results = self._send_in_chunks(topic, messages, attributes, send)
+
+        except Exception as e:
+            self.logger.error(f"Error in AWS batch publish operation: {str(e)}")
+            return StorageResult(
+                success=False,
+                error=f"AWS batch publish error: {str(e)}",
+                operation="publish_batch",
+            )
+
+        failed = sum(1 for r in item_results if not r.success)
+        self.logger.debug(
+            f"Published {len(item_results) - failed}/{len(item_results)} "
+            f"{self.service_type.upper()} messages to {topic}"
+        )
+        return StorageResult(
+            success=failed == 0,
+            error=(
+                f"{failed} of {len(item_results)} messages failed" if failed else None
+            ),
+            operation="publish_batch",
+            total_affected=len(item_results) - failed,
+            item_results=item_results,
+        )
+
+    def _send_in_chunks(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        attributes: List[Optional[Dict[str, str]]],
+        send: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+    ) -> List[StorageResult]:
+        """Send entries in API-sized chunks and map responses back by entry Id."""
+        results: List[Optional[StorageResult]] = [None] * len(messages)
+
+        chunks: List[List[Tuple[int, Dict[str, Any]]]] = [[]]
+        chunk_bytes = 0
+        for index, (message, message_attributes) in enumerate(
+            zip(messages, attributes)
+        ):
+            body = json.dumps(message)
+            size = len(body.encode("utf-8"))
+            if chunks[-1] and (
+                len(chunks[-1]) >= MAX_BATCH_ENTRIES
+                or chunk_bytes + size > MAX_BATCH_BYTES
+            ):
+                chunks.append([])
+                chunk_bytes = 0
+            chunks[-1].append(
+                (
+                    index,
+                    {
+                        "Id": str(index),
+                        "Body": body,
+                        "MessageAttributes": self._message_attributes(
+                            message_attributes
+                        ),
+                    },
+                )
+            )
+            chunk_bytes += size
+
+        for chunk in chunks:
+            try:
+                response = send([entry for _, entry in chunk])
+            except Exception as e:
+                self.logger.error(f"AWS batch request to {topic} failed: {str(e)}")
+                for index, _ in chunk:
+                    results[index] = StorageResult(
+                        success=False,
+                        error=f"Batch request failed: {str(e)}",
+                        operation="publish_message",
+                    )
+                continue
+
+            for entry in response.get("Successful", []):
+                results[int(entry["Id"])] = StorageResult(
+                    success=True,
+                    data={
+                        "message_id": entry.get("MessageId"),
+                        "topic": topic,
+                        "service": self.service_type,
+                    },
+                    operation="publish_message",
+                )
+            for entry in response.get("Failed", []):
+                results[int(entry["Id"])] = StorageResult(
+                    success=False,
+                    error=f"{entry.get('Code')}: {entry.get('Message')}",
+                    operation="publish_message",
+                )
+
+        return [
+            r
+            or StorageResult(
+                success=False,
+                error="No result returned for message",
+                operation="publish_message",
+            )
+            for r in results
+        ]
+
+    @staticmethod
+    def _message_attributes(
+        attributes: Optional[Dict[str, str]],
+    ) -> Dict[str, Dict[str, str]]:
+        """Convert attributes to SNS/SQS MessageAttributes."""
+        return {
+            key: {"DataType": "String", "StringValue": str(value)}
+            for key, value in (attributes or {}).items()
+        }
+
     async def create_topic(self, topic_name: str) -> StorageResult:
         """
         Create a topic/queue if it doesn't exist.
@@ -6,7 +6,8 @@ interface for publishing messages to Azure Service Bus topics or queues.
 """
 
 import json
-from typing import Any, Dict, Optional
+import uuid
+from typing import Any, Dict, List, Optional
 
 from agentmap.exceptions import MessagingConnectionError
 from agentmap.models.storage.types import StorageResult
@@ -215,6 +216,138 @@ class AzureMessageAdapter:
                 operation="publish_message",
             )
 
+    async def publish_batch(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        attributes: Optional[List[Dict[str, str]]] = None,
+    ) -> StorageResult:
+        """
+        Publish messages to a Service Bus topic or queue using message batches.
+
+        Messages are packed into ``ServiceBusMessageBatch`` objects; a new
+        batch is started whenever the current one reaches the entity's size
+        limit. A message too large for an empty batch is reported as failed.
+
+        Args:
+            topic: Topic/queue name to publish to
+            messages: Message payloads
+            attributes: Optional attributes, one dict per message
+
+        Returns:
+            StorageResult whose ``item_results`` holds one result per message
+        """
+        attributes = attributes or [None] * len(messages)
+        item_results: List[Optional[StorageResult]] = [None] * len(messages)
+
+        def sent(indices, sb_messages, error=None):
+            for index, sb_message in zip(indices, sb_messages):
+                if error is None:
+                    item_results[index] = StorageResult(
+                        success=True,
+                        data={
+                            "message_id": sb_message.message_id,
+                            "topic": topic,
+                            "service": self.service_type,
+                        },
+                        operation="publish_message",
+                    )
+                else:
+                    item_results[index] = StorageResult(
+                        success=False, error=error, operation="publish_message"
+                    )
+
+        try:
+            from azure.servicebus import ServiceBusMessage
+            from azure.servicebus.exceptions import MessageSizeExceededError
+
+            if self.service_type == "topic":
+                sender = self._client.get_topic_sender(topic_name=topic)
+            elif self.service_type == "queue":
+                sender = self._client.get_queue_sender(queue_name=topic)
+            else:
+                return StorageResult(
+                    success=False,
+                    error=f"Unsupported service type: {self.service_type}",
+                    operation="publish_batch",
+                )
+
+            with sender:
+
+                def send(batch, indices, sb_messages):
+                    try:
+                        sender.send_messages(batch)
+                        sent(indices, sb_messages)
+                    except Exception as e:
+                        self.logger.error(
+                            f"Azure batch send to {topic} failed: {str(e)}"
+                        )
+                        sent(indices, sb_messages, f"Batch send failed: {str(e)}")
+
+                batch, indices, sb_messages = sender.create_message_batch(), [], []
+                for index, (message, message_attributes) in enumerate(
+                    zip(messages, attributes)
+                ):
+                    sb_message = ServiceBusMessage(
+                        json.dumps(message),
+                        message_id=str(uuid.uuid4()),
+                        application_properties={
+                            key: str(value)
+                            for key, value in (message_attributes or {}).items()
+                        },
+                    )
+                    try:
+                        batch.add_message(sb_message)
+                    except MessageSizeExceededError:
+                        if not indices:
+                            sent([index], [sb_message], "Message exceeds batch size")
+                            continue
+                        send(batch, indices, sb_messages)
+                        batch, indices, sb_messages = (
+                            sender.create_message_batch(),
+                            [],
+                            [],
+                        )
+                        try:
+                            batch.add_message(sb_message)
+                        except MessageSizeExceededError:
+                            sent([index], [sb_message], "Message exceeds batch size")
+                            continue
+                    indices.append(index)
+                    sb_messages.append(sb_message)
+                if indices:
+                    send(batch, indices, sb_messages)
+
+        except Exception as e:
+            self.logger.error(f"Error in Azure batch publish operation: {str(e)}")
+            return StorageResult(
+                success=False,
+                error=f"Azure batch publish error: {str(e)}",
+                operation="publish_batch",
+            )
+
+        item_results = [
+            r
+            or StorageResult(
+                success=False, error="Message not sent", operation="publish_message"
+            )
+            for r in item_results
+        ]
+        failed = sum(1 for r in item_results if not r.success)
+        self.logger.debug(
+            f"Published {len(item_results) - failed}/{len(item_results)} "
+            f"messages to Azure Service Bus {self.service_type} {topic}"
+        )
+        return StorageResult(
+            success=failed == 0,
+            error=(
+                f"{failed} of {len(item_results)} messages failed" if failed else None
+            ),
+            operation="publish_batch",
+            total_affected=len(item_results) - failed,
+            item_results=item_results,
+        )
+
     async def create_topic(self, topic_name: str) -> StorageResult:
         """
         Create a topic/queue if it doesn't exist.
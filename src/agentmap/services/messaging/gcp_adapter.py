@@ -6,7 +6,7 @@ interface for publishing messages to Google Cloud Pub/Sub topics.
 """
 
 import json
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from agentmap.exceptions import MessagingConnectionError
 from agentmap.models.storage.types import StorageResult
@@ -67,9 +67,16 @@ class GCPMessageAdapter:
                         "Please set project_id in config or configure default credentials."
                     )
 
-            # Create publisher client
+            # Create publisher client; the client library coalesces concurrent
+            # publishes according to its batch settings.
             try:
-                self._publisher = pubsub_v1.PublisherClient()
+                batch_settings = self.config.get("batch_settings")
+                if batch_settings:
+                    self._publisher = pubsub_v1.PublisherClient(
+                        batch_settings=pubsub_v1.types.BatchSettings(**batch_settings)
+                    )
+                else:
+                    self._publisher = pubsub_v1.PublisherClient()
                 self.logger.debug(
                     f"GCP Pub/Sub client initialized for project: {self.project_id}"
                 )
@@ -147,6 +154,85 @@ class GCPMessageAdapter:
                 operation="publish_message",
             )
 
+    async def publish_batch(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        attributes: Optional[List[Dict[str, str]]] = None,
+    ) -> StorageResult:
+        """
+        Publish messages to a GCP Pub/Sub topic as one client-side batch.
+
+        All messages are handed to the publisher before any result is awaited,
+        so the client library sends them in as few requests as its batch
+        settings allow.
+
+        Args:
+            topic: Topic name to publish to
+            messages: Message payloads
+            attributes: Optional attributes, one dict per message
+
+        Returns:
+            StorageResult whose ``item_results`` holds one result per message
+        """
+        attributes = attributes or [None] * len(messages)
+        try:
+            topic_path = self._publisher.topic_path(self.project_id, topic)
+            futures = []
+            for message, message_attributes in zip(messages, attributes):
+                pub_attributes = {
+                    key: str(value) for key, value in (message_attributes or {}).items()
+                }
+                futures.append(
+                    self._publisher.publish(
+                        topic_path,
+                        data=json.dumps(message).encode("utf-8"),
+                        **pub_attributes,
+                    )
+                )
+
+        except Exception as e:
+            self.logger.error(f"Error in GCP batch publish operation: {str(e)}")
+            return StorageResult(
+                success=False,
+                error=f"GCP batch publish error: {str(e)}",
+                operation="publish_batch",
+            )
+
+        item_results = []
+        for future in futures:
+            try:
+                item_results.append(
+                    StorageResult(
+                        success=True,
+                        data={"message_id": future.result(), "topic": topic},
+                        operation="publish_message",
+                    )
+                )
+            except Exception as e:
+                item_results.append(
+                    StorageResult(
+                        success=False,
+                        error=f"Failed to publish message: {str(e)}",
+                        operation="publish_message",
+                    )
+                )
+
+        failed = sum(1 for r in item_results if not r.success)
+        self.logger.debug(
+            f"Published {len(item_results) - failed}/{len(item_results)} "
+            f"messages to {topic}"
+        )
+        return StorageResult(
+            success=failed == 0,
+            error=(
+                f"{failed} of {len(item_results)} messages failed" if failed else None
+            ),
+            operation="publish_batch",
+            total_affected=len(item_results) - failed,
+            item_results=item_results,
+        )
+
     async def create_topic(self, topic_name: str) -> StorageResult:
         """
         Create a topic if it doesn't exist.
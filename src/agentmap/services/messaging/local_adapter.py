@@ -2,27 +2,77 @@
 Local file-based messaging adapter for AgentMap.
 
 This module provides a local file-based implementation of the CloudMessageAdapter
-interface for testing and development purposes. Messages are stored as JSON files
-in a local directory structure.
+interface for testing, development and offline load tests. Each topic is an
+append-only log split into segments:
+
+    <storage_path>/<topic>/
+        00000000000000000000.log    one JSON message per line
+        00000000000000000000.index  fixed-width (position, message id) per offset
+        .consumers/<group>.json     committed offset of each consumer group
+        .lock                       held exclusively while a process appends
+
+Offsets are dense and never reused, so consumers resume from a committed
+position and retention drops whole segments without rewriting anything.
+
+Topics written by earlier versions hold one ``<timestamp>_<id>.json`` file per
+message. The first time such a topic is opened those files are appended to
+its log in timestamp order, keeping their message ids, and then deleted.
 """
 
 import json
+import os
+import struct
+import tempfile
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from agentmap.exceptions import MessagingConnectionError
 from agentmap.models.storage.types import StorageResult
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Byte position of the record in the .log file, then the raw message UUID.
+_INDEX_ENTRY = struct.Struct("<Q16s")
+_OFFSET_WIDTH = 20
+_CONSUMERS_DIR = ".consumers"
+_LOCK_FILE = ".lock"
+
+
+class _ActiveSegment:
+    """Write-side state for the newest segment of one topic."""
+
+    def __init__(self, base_offset: int, count: int, size: int):
+        self.base_offset = base_offset
+        self.count = count
+        self.size = size
+
+    @property
+    def next_offset(self) -> int:
+        return self.base_offset + self.count
+
 
 class LocalMessageAdapter:
     """
-    Local file-based messaging adapter.
-
-    This adapter implements the CloudMessageAdapter interface for
-    local development and testing, storing messages as JSON files
-    in a directory structure organized by topic.
+    Local segmented-log messaging adapter.
+
+    Implements the CloudMessageAdapter interface on local disk. Publishing
+    appends to the topic's active segment; consumers read by offset through
+    the segment index, so listing, consuming and retention cost is
+    proportional to what is read rather than to the size of the topic.
+
+    Any number of processes may publish to and consume from one storage
+    path. Appends, recovery and retention hold an exclusive ``flock`` on the
+    topic's lock file and re-read the newest segment's size under it, so
+    writers in different processes never share an offset. Where ``fcntl`` is
+    unavailable (Windows) only writers within one process are serialized.
     """
 
     def __init__(self, config: Dict[str, Any], logger):
@@ -30,12 +80,25 @@ class LocalMessageAdapter:
         Initialize the local messaging adapter.
 
         Args:
-            config: Local configuration with storage path
+            config: Local configuration with storage path and segment limits
             logger: Logger instance for logging operations
         """
         self.config = config or {}
         self.logger = logger
         self.storage_path = None
+        self.segment_max_messages = int(self.config.get("segment_max_messages", 10000))
+        self.segment_max_bytes = int(
+            self.config.get("segment_max_bytes", 16 * 1024 * 1024)
+        )
+        self.fsync = bool(self.config.get("fsync", False))
+
+        self._lock = threading.RLock()
+        self._active: Dict[str, _ActiveSegment] = {}
+        self._migrated_topics: set = set()
+        # Topics whose lock file this adapter currently holds.
+        self._locked_topics: set = set()
+        # Uncommitted consumer positions, keyed by (topic, group).
+        self._positions: Dict[Tuple[str, str], int] = {}
 
         # Initialize storage
         self._initialize_storage()
@@ -81,6 +144,10 @@ class LocalMessageAdapter:
                 f"Failed to initialize local messaging storage: {str(e)}"
             )
 
+    # ------------------------------------------------------------------
+    # Publishing
+    # ------------------------------------------------------------------
+
     async def publish(
         self,
         topic: str,
@@ -96,68 +163,391 @@ class LocalMessageAdapter:
             attributes: Optional message attributes
 
         Returns:
-            StorageResult indicating success/failure
+            StorageResult with the message ID and its offset in the topic
         """
         try:
-            # Generate unique message ID
-            message_id = str(uuid.uuid4())
-            timestamp = datetime.utcnow().isoformat()
+            (record,), segment_path = self._append(topic, [message], attributes)
+            self.logger.debug(
+                f"Published local message to {topic}: {record['message_id']}"
+            )
+            return StorageResult(
+                success=True,
+                data={
+                    "message_id": record["message_id"],
+                    "topic": topic,
+                    "offset": record["offset"],
+                    "file_path": segment_path,
+                    "timestamp": record["timestamp"],
+                },
+                operation="publish_message",
+            )
 
-            # Create topic directory if it doesn't exist
-            topic_dir = self.storage_path / topic
-            topic_dir.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            self.logger.error(f"Error in local publish operation: {str(e)}")
+            return StorageResult(
+                success=False,
+                error=f"Local publish error: {str(e)}",
+                operation="publish_message",
+            )
 
-            # Build complete message structure
-            complete_message = {
-                "message_id": message_id,
-                "timestamp": timestamp,
-                "topic": topic,
-                "payload": message,
-                "attributes": attributes or {},
-                "source": "local_adapter",
-            }
+    async def publish_batch(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        attributes: Union[Dict[str, str], List[Dict[str, str]], None] = None,
+    ) -> StorageResult:
+        """
+        Publish several messages with one write per segment.
 
-            # Create filename with timestamp and message ID
-            filename = (
-                f"{timestamp.replace(':', '-').replace('.', '-')}_{message_id}.json"
-            )
-            message_file = topic_dir / filename
+        Args:
+            topic: Topic name
+            messages: Message payloads, appended in order
+            attributes: Optional attributes, either shared by every message or
+                a list parallel to ``messages``
 
-            # Write message to file
-            try:
-                with open(message_file, "w", encoding="utf-8") as f:
-                    json.dump(complete_message, f, indent=2, ensure_ascii=False)
+        Returns:
+            StorageResult with the message IDs and the offset range written;
+            ``item_results`` holds one result per message
+        """
+        if not messages:
+            return StorageResult(
+                success=True,
+                data={"topic": topic, "message_ids": [], "count": 0},
+                operation="publish_batch",
+            )
+        try:
+            records, segment_path = self._append(topic, messages, attributes)
+            self.logger.debug(f"Published {len(records)} local messages to {topic}")
+            return StorageResult(
+                success=True,
+                data={
+                    "topic": topic,
+                    "message_ids": [r["message_id"] for r in records],
+                    "first_offset": records[0]["offset"],
+                    "last_offset": records[-1]["offset"],
+                    "count": len(records),
+                    "file_path": segment_path,
+                },
+                operation="publish_batch",
+                item_results=[
+                    StorageResult(
+                        success=True,
+                        data={
+                            "message_id": r["message_id"],
+                            "topic": topic,
+                            "offset": r["offset"],
+                            "timestamp": r["timestamp"],
+                        },
+                        operation="publish_message",
+                    )
+                    for r in records
+                ],
+            )
 
-                self.logger.debug(f"Published local message to {topic}: {message_id}")
+        except Exception as e:
+            self.logger.error(f"Error in local batch publish operation: {str(e)}")
+            return StorageResult(
+                success=False,
+                error=f"Local batch publish error: {str(e)}",
+                operation="publish_batch",
+            )
 
-                return StorageResult(
-                    success=True,
-                    data={
-                        "message_id": message_id,
-                        "topic": topic,
-                        "file_path": str(message_file),
-                        "timestamp": timestamp,
-                    },
-                    operation="publish_message",
+    def _append(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        attributes: Union[Dict[str, str], List[Dict[str, str]], None],
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Append messages to the topic log, rolling segments as they fill."""
+        if isinstance(attributes, list):
+            if len(attributes) != len(messages):
+                raise ValueError(
+                    f"Got {len(attributes)} attribute sets for {len(messages)} messages"
                 )
+            per_message = attributes
+        else:
+            per_message = [attributes] * len(messages)
+        timestamp = datetime.utcnow().isoformat()
+        return self._append_records(
+            topic,
+            [
+                {
+                    "message_id": str(uuid.uuid4()),
+                    "timestamp": timestamp,
+                    "topic": topic,
+                    "payload": message,
+                    "attributes": message_attributes or {},
+                    "source": "local_adapter",
+                }
+                for message, message_attributes in zip(messages, per_message)
+            ],
+        )
+
+    def _append_records(
+        self, topic: str, entries: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """Assign offsets to complete records and append them to the log."""
+        topic_dir = self.storage_path / topic
+        records = []
+
+        with self._topic_lock(topic_dir):
+            active = self._active_segment(topic, topic_dir)
+            pending: List[Tuple[bytes, bytes]] = []
+            pending_bytes = 0
+
+            for entry in entries:
+                if self._segment_full(active, len(pending), pending_bytes):
+                    self._write_segment(topic_dir, active, pending)
+                    active = self._roll(topic, topic_dir, active.next_offset)
+                    pending, pending_bytes = [], 0
+
+                message_id = uuid.UUID(entry["message_id"])
+                record = {
+                    "message_id": entry["message_id"],
+                    "offset": active.next_offset + len(pending),
+                    **{k: v for k, v in entry.items() if k != "message_id"},
+                }
+                line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+                pending.append((line, message_id.bytes))
+                pending_bytes += len(line)
+                records.append(record)
+
+            self._write_segment(topic_dir, active, pending)
+
+        return records, str(self._log_path(topic_dir, active.base_offset))
+
+    def _segment_full(
+        self, active: _ActiveSegment, pending_count: int, pending_bytes: int
+    ) -> bool:
+        count = active.count + pending_count
+        return count > 0 and (
+            count >= self.segment_max_messages
+            or active.size + pending_bytes >= self.segment_max_bytes
+        )
+
+    def _write_segment(
+        self,
+        topic_dir: Path,
+        active: _ActiveSegment,
+        pending: List[Tuple[bytes, bytes]],
+    ) -> None:
+        """Write pending records to the log first, then their index entries."""
+        if not pending:
+            return
+        index = bytearray()
+        position = active.size
+        for line, message_id in pending:
+            index += _INDEX_ENTRY.pack(position, message_id)
+            position += len(line)
+
+        with open(self._log_path(topic_dir, active.base_offset), "ab") as log:
+            log.write(b"".join(line for line, _ in pending))
+            self._flush(log)
+        with open(self._index_path(topic_dir, active.base_offset), "ab") as idx:
+            idx.write(bytes(index))
+            self._flush(idx)
+
+        active.size = position
+        active.count += len(pending)
+
+    def _flush(self, handle) -> None:
+        if self.fsync:
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def _roll(self, topic: str, topic_dir: Path, base_offset: int) -> _ActiveSegment:
+        """Start a new empty segment at ``base_offset``."""
+        self._log_path(topic_dir, base_offset).touch()
+        self._index_path(topic_dir, base_offset).touch()
+        active = _ActiveSegment(base_offset, 0, 0)
+        self._active[topic] = active
+        return active
+
+    @contextmanager
+    def _topic_lock(self, topic_dir: Path):
+        """
+        Serialize writers to one topic across threads and processes.
 
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to write message file {message_file}: {str(e)}"
-                )
-                return StorageResult(
-                    success=False,
-                    error=f"Failed to write message file: {str(e)}",
-                    operation="publish_message",
+        Holds the adapter lock and an exclusive ``flock`` on the topic's lock
+        file. Re-entrant within the holding thread, so a migration that
+        appends while the lock is held does not wait on itself.
+        """
+        with self._lock:
+            topic = topic_dir.name
+            if fcntl is None or topic in self._locked_topics:
+                yield
+                return
+            topic_dir.mkdir(parents=True, exist_ok=True)
+            with open(topic_dir / _LOCK_FILE, "ab") as handle:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+                self._locked_topics.add(topic)
+                try:
+                    yield
+                finally:
+                    self._locked_topics.discard(topic)
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def _active_segment(self, topic: str, topic_dir: Path) -> _ActiveSegment:
+        """
+        Return write-side state for the topic, reconciled with the files.
+
+        Called under the topic lock. Another process may have appended to or
+        rolled the topic since this adapter last wrote, so the cached state is
+        only reused while the newest segment's log and index still have the
+        sizes it recorded; otherwise the segment is recovered from disk.
+        """
+        topic_dir.mkdir(parents=True, exist_ok=True)
+        bases = self._segment_bases(topic_dir)
+        if not bases:
+            self._roll(topic, topic_dir, 0)
+        else:
+            active = self._active.get(topic)
+            if active is None or not self._is_current(topic_dir, active, bases[-1]):
+                self._active[topic] = self._recover_segment(topic_dir, bases[-1])
+        self._migrate_legacy_messages(topic_dir)
+        return self._active[topic]
+
+    def _is_current(
+        self, topic_dir: Path, active: _ActiveSegment, newest_base: int
+    ) -> bool:
+        """Whether ``active`` still describes the newest segment on disk."""
+        if active.base_offset != newest_base:
+            return False
+        try:
+            index_size = self._index_path(topic_dir, newest_base).stat().st_size
+            log_size = self._log_path(topic_dir, newest_base).stat().st_size
+        except FileNotFoundError:
+            return False
+        return (
+            index_size == active.count * _INDEX_ENTRY.size and log_size == active.size
+        )
+
+    def _migrate_legacy_messages(self, topic_dir: Path) -> None:
+        """
+        Append a topic's per-message JSON files from the old layout to its log.
+
+        Runs once per topic and adapter instance. Files are imported in
+        timestamp order with their original message ids, then deleted; ids
+        already present in the log (from an interrupted migration) are not
+        appended twice. Unreadable files are left in place and logged.
+        """
+        topic = topic_dir.name
+        if topic in self._migrated_topics:
+            return
+        with self._lock:
+            if topic in self._migrated_topics:
+                return
+            self._migrated_topics.add(topic)
+            if not topic_dir.is_dir():
+                return
+            with self._topic_lock(topic_dir):
+                self._import_legacy_messages(topic_dir)
+
+    def _import_legacy_messages(self, topic_dir: Path) -> None:
+        """Append the legacy files found in ``topic_dir``, under the topic lock."""
+        topic = topic_dir.name
+        legacy_files = [
+            p
+            for p in topic_dir.glob("*.json")
+            if p.is_file() and not p.name.startswith(".")
+        ]
+        if not legacy_files:
+            return
+
+        entries = []
+        imported = []
+        for path in legacy_files:
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                uuid.UUID(data["message_id"])
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                self.logger.warning(
+                    f"Skipping unreadable legacy message file {path}: {e}"
                 )
+                continue
+            imported.append(path)
+            if self.read_message(topic, data["message_id"]) is not None:
+                continue
+            entries.append(
+                {
+                    "message_id": data["message_id"],
+                    "timestamp": data.get("timestamp"),
+                    "topic": data.get("topic", topic),
+                    "payload": data.get("payload"),
+                    "attributes": data.get("attributes") or {},
+                    "source": data.get("source", "local_adapter"),
+                }
+            )
 
-        except Exception as e:
-            self.logger.error(f"Error in local publish operation: {str(e)}")
-            return StorageResult(
-                success=False,
-                error=f"Local publish error: {str(e)}",
-                operation="publish_message",
+        entries.sort(key=lambda entry: entry["timestamp"] or "")
+        if entries:
+            self._append_records(topic, entries)
+        for path in imported:
+            path.unlink()
+        self.logger.info(
+            f"Migrated {len(entries)} legacy message files into topic {topic}"
+        )
+
+    def _recover_segment(self, topic_dir: Path, base_offset: int) -> _ActiveSegment:
+        """
+        Reconcile the newest segment's log and index after an interrupted write.
+
+        The log is written before the index, so complete log lines missing
+        from the index are re-indexed and a trailing partial line is cut off.
+        Only called under the topic lock, when no other writer can be midway
+        through an append.
+        """
+        log_path = self._log_path(topic_dir, base_offset)
+        index_path = self._index_path(topic_dir, base_offset)
+        log_path.touch()
+        index_path.touch()
+
+        count = index_path.stat().st_size // _INDEX_ENTRY.size
+        end = 0
+        with open(log_path, "rb") as log:
+            if count:
+                position, _ = self._index_entry(index_path, count - 1)
+                log.seek(position)
+                line = log.readline()
+                if line.endswith(b"\n"):
+                    end = position + len(line)
+                else:
+                    count -= 1
+                    end = position
+            log.seek(end)
+            tail = log.read()
+
+        entries = bytearray()
+        position = end
+        for line in tail.splitlines(keepends=True):
+            try:
+                if not line.endswith(b"\n"):
+                    raise ValueError("partial record")
+                message_id = uuid.UUID(json.loads(line)["message_id"])
+            except (ValueError, KeyError, TypeError):
+                break
+            entries += _INDEX_ENTRY.pack(position, message_id.bytes)
+            position += len(line)
+
+        with open(index_path, "r+b") as idx:
+            idx.truncate(count * _INDEX_ENTRY.size)
+            idx.seek(0, os.SEEK_END)
+            idx.write(bytes(entries))
+        count += len(entries) // _INDEX_ENTRY.size
+
+        if log_path.stat().st_size != position:
+            self.logger.warning(
+                f"Truncating partial record in {log_path} at byte {position}"
             )
+            with open(log_path, "r+b") as log:
+                log.truncate(position)
+
+        return _ActiveSegment(base_offset, count, position)
+
+    # ------------------------------------------------------------------
+    # Topics
+    # ------------------------------------------------------------------
 
     async def create_topic(self, topic_name: str) -> StorageResult:
         """
@@ -179,8 +569,8 @@ class LocalMessageAdapter:
             metadata = {
                 "topic_name": topic_name,
                 "created_at": datetime.utcnow().isoformat(),
-                "message_count": 0,
                 "adapter_type": "local",
+                "format": "segmented_log",
             }
 
             # Only create metadata if it doesn't exist
@@ -228,11 +618,68 @@ class LocalMessageAdapter:
             self.logger.error(f"Failed to list topics: {str(e)}")
             return []
 
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def get_offsets(self, topic: str) -> Dict[str, int]:
+        """
+        Get the retained offset range of a topic.
+
+        Returns:
+            ``{"start_offset", "end_offset"}`` where ``end_offset`` is the
+            offset the next published message will receive
+        """
+        segments = self._segments(self.storage_path / topic)
+        if not segments:
+            return {"start_offset": 0, "end_offset": 0}
+        return {
+            "start_offset": segments[0][0],
+            "end_offset": segments[-1][0] + segments[-1][1],
+        }
+
+    def read_from(
+        self, topic: str, offset: int, max_messages: int = 100
+    ) -> list[Dict[str, Any]]:
+        """
+        Read up to ``max_messages`` consecutive messages starting at ``offset``.
+
+        Offsets below the retained range start at the oldest retained message.
+
+        Args:
+            topic: Topic name
+            offset: First offset to read
+            max_messages: Maximum number of messages to return
+
+        Returns:
+            Full messages in offset order
+        """
+        topic_dir = self.storage_path / topic
+        messages: List[Dict[str, Any]] = []
+        if max_messages <= 0:
+            return messages
+
+        for base, count in self._segments(topic_dir):
+            if base + count <= offset:
+                continue
+            relative = max(offset - base, 0)
+            wanted = min(count - relative, max_messages - len(messages))
+            position, _ = self._index_entry(self._index_path(topic_dir, base), relative)
+            with open(self._log_path(topic_dir, base), "rb") as log:
+                log.seek(position)
+                for _ in range(wanted):
+                    messages.append(json.loads(log.readline()))
+            if len(messages) >= max_messages:
+                break
+        return messages
+
     def list_messages(
         self, topic: str, limit: Optional[int] = None
     ) -> list[Dict[str, Any]]:
         """
-        List messages in a topic.
+        List messages in a topic, most recent first.
+
+        Only the tail of the log needed to satisfy ``limit`` is read.
 
         Args:
             topic: Topic name to list messages from
@@ -243,44 +690,24 @@ class LocalMessageAdapter:
         """
         try:
             topic_dir = self.storage_path / topic
-            if not topic_dir.exists():
-                return []
-
             messages = []
-            message_files = sorted(
-                [
-                    f
-                    for f in topic_dir.iterdir()
-                    if f.is_file()
-                    and f.suffix == ".json"
-                    and not f.name.startswith(".")
-                ],
-                key=lambda x: x.stat().st_mtime,
-                reverse=True,  # Most recent first
-            )
-
-            for message_file in message_files:
+            for base, count in reversed(self._segments(topic_dir)):
+                wanted = count if not limit else min(count, limit - len(messages))
+                for record in reversed(
+                    self.read_from(topic, base + count - wanted, wanted)
+                ):
+                    messages.append(
+                        {
+                            "message_id": record.get("message_id"),
+                            "offset": record.get("offset"),
+                            "timestamp": record.get("timestamp"),
+                            "topic": record.get("topic"),
+                            "file_path": str(self._log_path(topic_dir, base)),
+                            "attributes": record.get("attributes", {}),
+                        }
+                    )
                 if limit and len(messages) >= limit:
                     break
-
-                try:
-                    with open(message_file, "r", encoding="utf-8") as f:
-                        message_data = json.load(f)
-                        messages.append(
-                            {
-                                "message_id": message_data.get("message_id"),
-                                "timestamp": message_data.get("timestamp"),
-                                "topic": message_data.get("topic"),
-                                "file_path": str(message_file),
-                                "attributes": message_data.get("attributes", {}),
-                            }
-                        )
-                except Exception as e:
-                    self.logger.warning(
-                        f"Failed to read message file {message_file}: {str(e)}"
-                    )
-                    continue
-
             return messages
 
         except Exception as e:
@@ -291,6 +718,8 @@ class LocalMessageAdapter:
         """
         Read a specific message by ID.
 
+        The lookup scans the fixed-width index files rather than the logs.
+
         Args:
             topic: Topic name
             message_id: Message ID to read
@@ -299,24 +728,22 @@ class LocalMessageAdapter:
             Message data or None if not found
         """
         try:
-            topic_dir = self.storage_path / topic
-            if not topic_dir.exists():
-                return None
-
-            # Find message file containing the message ID
-            for message_file in topic_dir.iterdir():
-                if message_file.is_file() and message_file.suffix == ".json":
-                    try:
-                        with open(message_file, "r", encoding="utf-8") as f:
-                            message_data = json.load(f)
-                            if message_data.get("message_id") == message_id:
-                                return message_data
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to read message file {message_file}: {str(e)}"
-                        )
-                        continue
+            needle = uuid.UUID(message_id).bytes
+        except (ValueError, TypeError, AttributeError):
+            return None
 
+        try:
+            topic_dir = self.storage_path / topic
+            for base, _ in reversed(self._segments(topic_dir)):
+                index = self._index_path(topic_dir, base).read_bytes()
+                found = index.find(needle)
+                while found != -1 and found % _INDEX_ENTRY.size != 8:
+                    found = index.find(needle, found + 1)
+                if found == -1:
+                    continue
+                relative = found // _INDEX_ENTRY.size
+                (record,) = self.read_from(topic, base + relative, 1)
+                return record
             return None
 
         except Exception as e:
@@ -325,6 +752,121 @@ class LocalMessageAdapter:
             )
             return None
 
+    # ------------------------------------------------------------------
+    # Consumer groups
+    # ------------------------------------------------------------------
+
+    def consume(
+        self,
+        topic: str,
+        group: str,
+        max_messages: int = 100,
+        auto_commit: bool = False,
+    ) -> list[Dict[str, Any]]:
+        """
+        Fetch the next messages for a consumer group.
+
+        Each call continues from where the previous one stopped. Positions
+        only survive a restart once committed; uncommitted messages are
+        delivered again by a new adapter instance (at-least-once).
+
+        Args:
+            topic: Topic name
+            group: Consumer group name
+            max_messages: Maximum number of messages to return
+            auto_commit: Commit the new position before returning
+
+        Returns:
+            Full messages in offset order
+        """
+        with self._lock:
+            position = self.get_position(topic, group)
+            messages = self.read_from(topic, position, max_messages)
+            if messages:
+                position = messages[-1]["offset"] + 1
+            self._positions[(topic, group)] = position
+        if auto_commit and messages:
+            self.commit(topic, group, position)
+        return messages
+
+    def get_position(self, topic: str, group: str) -> int:
+        """Get the next offset ``consume`` will return for a group."""
+        position = self._positions.get((topic, group))
+        if position is None:
+            position = self.get_committed_offset(topic, group) or 0
+        return max(position, self.get_offsets(topic)["start_offset"])
+
+    def seek(self, topic: str, group: str, offset: int) -> None:
+        """Move a group's uncommitted position to ``offset``."""
+        with self._lock:
+            self._positions[(topic, group)] = offset
+
+    def commit(
+        self, topic: str, group: str, offset: Optional[int] = None
+    ) -> StorageResult:
+        """
+        Commit a consumer group's position.
+
+        Args:
+            topic: Topic name
+            group: Consumer group name
+            offset: Next offset to consume; defaults to the current position
+
+        Returns:
+            StorageResult with the committed offset
+        """
+        try:
+            with self._lock:
+                if offset is None:
+                    offset = self.get_position(topic, group)
+                self._positions[(topic, group)] = offset
+                self._write_json(
+                    self._consumer_path(topic, group),
+                    {
+                        "topic": topic,
+                        "group": group,
+                        "offset": offset,
+                        "committed_at": datetime.utcnow().isoformat(),
+                    },
+                )
+            return StorageResult(
+                success=True,
+                data={"topic": topic, "group": group, "offset": offset},
+                operation="commit_offset",
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to commit offset for group {group} on {topic}: {str(e)}"
+            )
+            return StorageResult(
+                success=False,
+                error=f"Failed to commit offset: {str(e)}",
+                operation="commit_offset",
+            )
+
+    def get_committed_offset(self, topic: str, group: str) -> Optional[int]:
+        """Get a group's committed offset, or None if it never committed."""
+        try:
+            with open(self._consumer_path(topic, group), "r", encoding="utf-8") as f:
+                return int(json.load(f)["offset"])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            self.logger.warning(
+                f"Ignoring unreadable offset for group {group} on {topic}: {e}"
+            )
+            return None
+
+    def _consumer_groups(self, topic: str) -> List[str]:
+        consumers_dir = self.storage_path / topic / _CONSUMERS_DIR
+        if not consumers_dir.is_dir():
+            return []
+        return sorted(p.stem for p in consumers_dir.glob("*.json"))
+
+    # ------------------------------------------------------------------
+    # Housekeeping
+    # ------------------------------------------------------------------
+
     def get_storage_info(self) -> Dict[str, Any]:
         """
         Get information about local storage usage.
@@ -340,26 +882,37 @@ class LocalMessageAdapter:
                 "storage_size_bytes": 0,
             }
 
-            if self.storage_path.exists():
-                for topic_dir in self.storage_path.iterdir():
-                    if topic_dir.is_dir() and not topic_dir.name.startswith("."):
-                        topic_info = {
-                            "name": topic_dir.name,
-                            "message_count": 0,
-                            "size_bytes": 0,
+            for topic in self.list_topics():
+                topic_dir = self.storage_path / topic
+                segments = self._segments(topic_dir)
+                offsets = self.get_offsets(topic)
+                size = sum(
+                    self._log_path(topic_dir, base).stat().st_size
+                    + self._index_path(topic_dir, base).stat().st_size
+                    for base, _ in segments
+                )
+                groups = {}
+                for group in self._consumer_groups(topic):
+                    committed = self.get_committed_offset(topic, group)
+                    if committed is not None:
+                        groups[group] = {
+                            "committed_offset": committed,
+                            "lag": offsets["end_offset"]
+                            - max(committed, offsets["start_offset"]),
                         }
-
-                        for message_file in topic_dir.iterdir():
-                            if (
-                                message_file.is_file()
-                                and message_file.suffix == ".json"
-                            ):
-                                topic_info["message_count"] += 1
-                                topic_info["size_bytes"] += message_file.stat().st_size
-
-                        info["topics"].append(topic_info)
-                        info["total_messages"] += topic_info["message_count"]
-                        info["storage_size_bytes"] += topic_info["size_bytes"]
+                topic_info = {
+                    "name": topic,
+                    "message_count": sum(count for _, count in segments),
+                    "size_bytes": size,
+                    "segment_count": len(segments),
+                    "start_offset": offsets["start_offset"],
+                    "end_offset": offsets["end_offset"],
+                    "consumer_groups": groups,
+                }
+
+                info["topics"].append(topic_info)
+                info["total_messages"] += topic_info["message_count"]
+                info["storage_size_bytes"] += topic_info["size_bytes"]
 
             return info
 
@@ -369,7 +922,11 @@ class LocalMessageAdapter:
 
     def cleanup_old_messages(self, topic: str, max_age_days: int = 30) -> int:
         """
-        Clean up old messages from a topic.
+        Drop segments whose newest message is older than ``max_age_days``.
+
+        Retention works on whole segments, so a segment is kept while any of
+        its messages is still young enough. When the newest segment expires an
+        empty segment takes its place, keeping offsets monotonic for consumers.
 
         Args:
             topic: Topic name to clean up
@@ -383,21 +940,28 @@ class LocalMessageAdapter:
             if not topic_dir.exists():
                 return 0
 
-            import time
-
             cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
             deleted_count = 0
 
-            for message_file in topic_dir.iterdir():
-                if message_file.is_file() and message_file.suffix == ".json":
-                    if message_file.stat().st_mtime < cutoff_time:
-                        try:
-                            message_file.unlink()
-                            deleted_count += 1
-                        except Exception as e:
-                            self.logger.warning(
-                                f"Failed to delete old message file {message_file}: {str(e)}"
-                            )
+            with self._topic_lock(topic_dir):
+                segments = self._segments(topic_dir)
+                for i, (base, count) in enumerate(segments):
+                    log_path = self._log_path(topic_dir, base)
+                    if log_path.stat().st_mtime >= cutoff_time:
+                        break
+                    if i == len(segments) - 1:
+                        if count == 0:
+                            break
+                        self._roll(topic, topic_dir, base + count)
+                    try:
+                        self._index_path(topic_dir, base).unlink()
+                        log_path.unlink()
+                        deleted_count += count
+                    except OSError as e:
+                        self.logger.warning(
+                            f"Failed to delete old segment {log_path}: {str(e)}"
+                        )
+                        break
 
             self.logger.info(
                 f"Cleaned up {deleted_count} old messages from topic {topic}"
@@ -413,3 +977,62 @@ class LocalMessageAdapter:
         from agentmap.services.messaging.messaging_service import CloudProvider
 
         return CloudProvider.LOCAL
+
+    # ------------------------------------------------------------------
+    # File layout helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _log_path(topic_dir: Path, base_offset: int) -> Path:
+        return topic_dir / f"{base_offset:0{_OFFSET_WIDTH}d}.log"
+
+    @staticmethod
+    def _index_path(topic_dir: Path, base_offset: int) -> Path:
+        return topic_dir / f"{base_offset:0{_OFFSET_WIDTH}d}.index"
+
+    def _consumer_path(self, topic: str, group: str) -> Path:
+        return self.storage_path / topic / _CONSUMERS_DIR / f"{group}.json"
+
+    @staticmethod
+    def _segment_bases(topic_dir: Path) -> List[int]:
+        if not topic_dir.is_dir():
+            return []
+        return sorted(
+            int(p.stem)
+            for p in topic_dir.glob("*.log")
+            if p.stem.isdigit() and len(p.stem) == _OFFSET_WIDTH
+        )
+
+    def _segments(self, topic_dir: Path) -> List[Tuple[int, int]]:
+        """Return ``(base_offset, message_count)`` for each retained segment."""
+        if topic_dir.name not in self._migrated_topics:
+            self._migrate_legacy_messages(topic_dir)
+        segments = []
+        for base in self._segment_bases(topic_dir):
+            try:
+                size = self._index_path(topic_dir, base).stat().st_size
+            except FileNotFoundError:
+                continue
+            segments.append((base, size // _INDEX_ENTRY.size))
+        return segments
+
+    @staticmethod
+    def _index_entry(index_path: Path, relative: int) -> Tuple[int, bytes]:
+        with open(index_path, "rb") as idx:
+            idx.seek(relative * _INDEX_ENTRY.size)
+            return _INDEX_ENTRY.unpack(idx.read(_INDEX_ENTRY.size))
+
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+                json.dump(data, tmp, indent=2)
+            os.replace(tmp_path, path)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
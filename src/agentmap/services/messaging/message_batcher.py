@@ -0,0 +1,143 @@
+"""
+Background message batcher for MessagingService.
+
+Coalesces messages published to the same provider and topic into one
+adapter batch call. A buffer is flushed when it reaches ``max_messages``
+or ``max_bytes``, or ``linger_seconds`` after its first message arrived,
+whichever comes first. Every submitter awaits the result for its own
+message.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from agentmap.models.storage.types import StorageResult
+
+# (message, attributes) pairs handed to the send callback.
+BatchEntry = Tuple[Dict[str, Any], Dict[str, str]]
+SendBatch = Callable[[Hashable, List[BatchEntry]], Awaitable[List[StorageResult]]]
+
+
+class _Buffer:
+    def __init__(self):
+        self.entries: List[BatchEntry] = []
+        self.futures: List[asyncio.Future] = []
+        self.size = 0
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MessageBatcher:
+    """
+    Per-topic message coalescing on top of an async batch send callback.
+
+    Buffers belong to the event loop that created them, so the batcher is
+    safe to share between ``asyncio.run`` calls and threads running their
+    own loops.
+    """
+
+    def __init__(
+        self,
+        send_batch: SendBatch,
+        logger,
+        max_messages: int = 100,
+        max_bytes: int = 256 * 1024,
+        linger_seconds: float = 0.05,
+    ):
+        """
+        Args:
+            send_batch: Coroutine sending ``entries`` for a key; returns one
+                StorageResult per entry, in order
+            logger: Logger instance
+            max_messages: Flush a buffer once it holds this many messages
+            max_bytes: Flush a buffer once its serialized size reaches this
+            linger_seconds: Longest a message waits for its batch to fill
+        """
+        self._send_batch = send_batch
+        self.logger = logger
+        self.max_messages = max(1, int(max_messages))
+        self.max_bytes = max(1, int(max_bytes))
+        self.linger_seconds = max(0.0, float(linger_seconds))
+        self._buffers: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], _Buffer] = {}
+        self._inflight: set = set()
+
+    async def submit(
+        self, key: Hashable, message: Dict[str, Any], attributes: Dict[str, str]
+    ) -> StorageResult:
+        """
+        Queue one message and wait for the result of the batch it joins.
+
+        Args:
+            key: Batch key, typically ``(provider, topic)``
+            message: Message body
+            attributes: Message attributes
+
+        Returns:
+            StorageResult for this message
+        """
+        loop = asyncio.get_running_loop()
+        self._discard_closed_loops()
+        buffer_key = (loop, key)
+        buffer = self._buffers.get(buffer_key)
+        if buffer is None:
+            buffer = self._buffers[buffer_key] = _Buffer()
+
+        future = loop.create_future()
+        buffer.entries.append((message, attributes))
+        buffer.futures.append(future)
+        buffer.size += len(json.dumps(message, default=str))
+
+        if len(buffer.entries) >= self.max_messages or buffer.size >= self.max_bytes:
+            self._flush_later(buffer_key)
+        elif buffer.timer is None:
+            buffer.timer = loop.call_later(
+                self.linger_seconds, self._flush_later, buffer_key
+            )
+        return await future
+
+    async def flush(self) -> None:
+        """Send every buffer of the running loop and wait for all sends."""
+        loop = asyncio.get_running_loop()
+        for buffer_key in [k for k in self._buffers if k[0] is loop]:
+            self._flush_later(buffer_key)
+        pending = [t for t in self._inflight if t.get_loop() is loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def pending_count(self) -> int:
+        """Number of messages buffered and not yet sent."""
+        return sum(len(b.entries) for b in self._buffers.values())
+
+    def _discard_closed_loops(self) -> None:
+        # A loop closed with messages still buffered has no one awaiting them.
+        for buffer_key in [k for k in self._buffers if k[0].is_closed()]:
+            del self._buffers[buffer_key]
+
+    def _flush_later(
+        self, buffer_key: Tuple[asyncio.AbstractEventLoop, Hashable]
+    ) -> None:
+        buffer = self._buffers.pop(buffer_key, None)
+        if buffer is None:
+            return
+        if buffer.timer is not None:
+            buffer.timer.cancel()
+        task = asyncio.get_running_loop().create_task(self._send(buffer_key[1], buffer))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _send(self, key: Hashable, buffer: _Buffer) -> None:
+        try:
+            results = await self._send_batch(key, buffer.entries)
+        except Exception as e:
+            self.logger.error(f"Batch send for {key} failed: {e}")
+            results = [
+                StorageResult(
+                    success=False,
+                    error=f"Batch send failed: {e}",
+                    operation="publish_message",
+                )
+            ] * len(buffer.entries)
+
+        for future, result in zip(buffer.futures, results):
+            if not future.done():
+                future.set_result(result)
@@ -1,8 +1,9 @@
 # src/agentmap/services/messaging_service.py
 
+import asyncio
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 
 from agentmap.exceptions import (
     MessagingServiceUnavailableError,
@@ -11,6 +12,7 @@ from agentmap.models.storage.types import StorageResult
 from agentmap.services.config.app_config_service import AppConfigService
 from agentmap.services.config.availability_cache_service import AvailabilityCacheService
 from agentmap.services.logging_service import LoggingService
+from agentmap.services.messaging.message_batcher import MessageBatcher
 
 
 class CloudProvider(Enum):
@@ -47,6 +49,12 @@ class CloudMessageAdapter(Protocol):
         """Create topic if it doesn't exist."""
         ...
 
+    # Optional: adapters may also implement
+    #   async publish_batch(topic, messages, attributes) -> StorageResult
+    # where ``attributes`` is a list parallel to ``messages`` and the result's
+    # ``item_results`` holds one StorageResult per message, in order.
+    # MessagingService falls back to concurrent ``publish`` calls otherwise.
+
     def get_provider(self) -> CloudProvider:
         """Get the cloud provider type."""
         ...
@@ -81,6 +89,9 @@ class MessagingService:
         # Initialize adapters with availability checking
         self._initialize_adapters()
 
+        # Optional coalescing of publish_message calls into adapter batches
+        self._batcher = self._create_batcher()
+
     def _load_messaging_config(self) -> Dict[str, Any]:
         """Load messaging configuration from app config."""
         try:
@@ -138,6 +149,19 @@ class MessagingService:
                 self.logger.error(f"Failed to initialize {provider_name} adapter: {e}")
                 self._available_providers[provider_name] = False
 
+    def _create_batcher(self) -> Optional[MessageBatcher]:
+        """Create the background batcher when ``messaging.batching`` enables it."""
+        batching = self.messaging_config.get("batching") or {}
+        if not batching.get("enabled", False):
+            return None
+        return MessageBatcher(
+            self._send_batched,
+            self.logger,
+            max_messages=batching.get("max_messages", 100),
+            max_bytes=batching.get("max_bytes", 256 * 1024),
+            linger_seconds=batching.get("linger_ms", 50) / 1000.0,
+        )
+
     def _check_provider_availability(self, provider: CloudProvider) -> bool:
         """
         Check and cache provider availability.
@@ -282,7 +306,110 @@ class MessagingService:
         Raises:
             MessagingServiceUnavailableError: If no suitable provider is available
         """
-        # Select provider
+        provider, adapter = self._resolve_adapter(provider)
+
+        # Build standardized message format
+        message = self._build_message(
+            message_type=message_type,
+            payload=payload,
+            metadata=metadata,
+            thread_id=thread_id,
+            priority=priority,
+        )
+
+        # Add message attributes for filtering/routing
+        attributes = self._build_attributes(message_type, priority, thread_id)
+
+        if self._batcher is not None:
+            return await self._batcher.submit((provider, topic), message, attributes)
+
+        # Publish with retry logic
+        return await self._publish_with_retry(
+            adapter=adapter, topic=topic, message=message, attributes=attributes
+        )
+
+    async def publish_batch(
+        self,
+        topic: str,
+        messages: List[Dict[str, Any]],
+        provider: Optional[CloudProvider] = None,
+    ) -> StorageResult:
+        """
+        Publish several messages to one topic with the adapter's batch call.
+
+        Each entry takes the keyword arguments of ``publish_message``:
+        ``message_type`` and ``payload`` (required), and optionally
+        ``metadata``, ``priority`` and ``thread_id``. Failed messages are
+        retried under the retry policy; messages that already succeeded are
+        not sent again.
+
+        Args:
+            topic: Topic/queue name to publish to
+            messages: Message specifications
+            provider: Specific provider to use (or use default)
+
+        Returns:
+            StorageResult whose ``item_results`` holds one result per message
+            and ``ids`` the message IDs, both in input order
+
+        Raises:
+            MessagingServiceUnavailableError: If no suitable provider is available
+        """
+        provider, adapter = self._resolve_adapter(provider)
+
+        entries = []
+        for spec in messages:
+            priority = spec.get("priority", MessagePriority.NORMAL)
+            if not isinstance(priority, MessagePriority):
+                priority = MessagePriority(priority)
+            message = self._build_message(
+                message_type=spec["message_type"],
+                payload=spec.get("payload", {}),
+                metadata=spec.get("metadata"),
+                thread_id=spec.get("thread_id"),
+                priority=priority,
+            )
+            attributes = self._build_attributes(
+                spec["message_type"], priority, spec.get("thread_id")
+            )
+            entries.append((message, attributes))
+
+        item_results = await self._publish_batch_with_retry(adapter, topic, entries)
+
+        errors = [
+            f"Message {i}: {r.error}"
+            for i, r in enumerate(item_results)
+            if not r.success
+        ]
+        published = len(item_results) - len(errors)
+        self.logger.info(
+            f"Published {published}/{len(item_results)} messages to {topic} "
+            f"via {provider.value}"
+        )
+        error_msg = None
+        if errors:
+            error_msg = "; ".join(errors[:5])
+            if len(errors) > 5:
+                error_msg += f" (and {len(errors) - 5} more errors)"
+        return StorageResult(
+            success=not errors,
+            operation="publish_batch",
+            error=error_msg,
+            total_affected=published,
+            error_count=len(errors) if errors else None,
+            ids=[message["message_id"] for message, _ in entries],
+            item_results=item_results,
+        )
+
+    async def flush(self) -> None:
+        """Send messages held by the background batcher on the running loop."""
+        if self._batcher is not None:
+            await self._batcher.flush()
+
+    def _resolve_adapter(
+        self, provider: Optional[CloudProvider]
+    ) -> Tuple[CloudProvider, CloudMessageAdapter]:
+        """Select the requested or default provider and its adapter."""
         if provider is None:
             provider_name = self.messaging_config.get("default_provider", "local")
             try:
@@ -299,17 +426,13 @@ class MessagingService:
                 f"No adapter available for provider: {provider.value}. "
                 f"Available providers: {', '.join(available_providers)}"
             )
+        return provider, adapter
 
-        # Build standardized message format
-        message = self._build_message(
-            message_type=message_type,
-            payload=payload,
-            metadata=metadata,
-            thread_id=thread_id,
-            priority=priority,
-        )
-
-        # Add message attributes for filtering/routing
+    @staticmethod
+    def _build_attributes(
+        message_type: str, priority: MessagePriority, thread_id: Optional[str]
+    ) -> Dict[str, str]:
+        """Build message attributes for filtering/routing."""
         attributes = {
             "message_type": message_type,
             "priority": priority.value,
@@ -318,11 +441,7 @@ class MessagingService:
         }
         if thread_id:
             attributes["thread_id"] = thread_id
-
-        # Publish with retry logic
-        return await self._publish_with_retry(
-            adapter=adapter, topic=topic, message=message, attributes=attributes
-        )
+        return attributes
 
     def _build_message(
         self,
@@ -375,8 +494,6 @@ class MessagingService:
 
             # Wait before retry (if not last attempt)
             if attempt < max_retries - 1:
-                import asyncio
-
                 wait_time = backoff[min(attempt, len(backoff) - 1)]
                 await asyncio.sleep(wait_time)
 
@@ -387,6 +504,97 @@ class MessagingService:
             operation="publish_message",
         )
 
+    async def _send_batched(
+        self,
+        key: Tuple[CloudProvider, str],
+        entries: List[Tuple[Dict[str, Any], Dict[str, str]]],
+    ) -> List[StorageResult]:
+        """Send callback for the background batcher."""
+        provider, topic = key
+        return await self._publish_batch_with_retry(
+            self.adapters[provider], topic, entries
+        )
+
+    async def _publish_batch_with_retry(
+        self,
+        adapter: CloudMessageAdapter,
+        topic: str,
+        entries: List[Tuple[Dict[str, Any], Dict[str, str]]],
+    ) -> List[StorageResult]:
+        """Publish a batch, retrying only the messages that failed."""
+        retry_config = self.messaging_config.get("retry_policy", {})
+        max_retries = retry_config.get("max_retries", 3)
+        backoff = retry_config.get("backoff_seconds", [1, 2, 4])
+
+        results: List[Optional[StorageResult]] = [None] * len(entries)
+        pending = list(range(len(entries)))
+
+        for attempt in range(max_retries):
+            sent = await self._send_batch(adapter, topic, [entries[i] for i in pending])
+            failed = []
+            for index, result in zip(pending, sent):
+                results[index] = result
+                if not result.success:
+                    failed.append(index)
+            pending = failed
+            if not pending:
+                break
+
+            self.logger.warning(
+                f"Batch publish attempt {attempt + 1}: "
+                f"{len(pending)}/{len(entries)} messages to {topic} failed"
+            )
+            if attempt < max_retries - 1:
+                wait_time = backoff[min(attempt, len(backoff) - 1)]
+                await asyncio.sleep(wait_time)
+
+        return results
+
+    async def _send_batch(
+        self,
+        adapter: CloudMessageAdapter,
+        topic: str,
+        entries: List[Tuple[Dict[str, Any], Dict[str, str]]],
+    ) -> List[StorageResult]:
+        """Send one batch through the adapter; one result per entry."""
+        if not entries:
+            return []
+
+        publish_batch = getattr(adapter, "publish_batch", None)
+        if publish_batch is None:
+            sent = await asyncio.gather(
+                *(adapter.publish(topic, m, a) for m, a in entries),
+                return_exceptions=True,
+            )
+            return [
+                (
+                    StorageResult(
+                        success=False,
+                        error=f"Publish exception: {r}",
+                        operation="publish_message",
+                    )
+                    if isinstance(r, BaseException)
+                    else r
+                )
+                for r in sent
+            ]
+
+        try:
+            result = await publish_batch(
+                topic, [m for m, _ in entries], [a for _, a in entries]
+            )
+        except Exception as e:
+            self.logger.error(f"Batch publish to {topic} raised: {e}")
+            result = StorageResult(success=False, error=f"Batch publish exception: {e}")
+
+        items = result.item_results
+        if not items or len(items) != len(entries):
+            item = StorageResult(
+                success=result.success, error=result.error, operation="publish_message"
+            )
+            items = [item] * len(entries)
+        return items
+
     def _generate_message_id(self) -> str:
         """Generate unique message ID."""
         import uuid
@@ -444,6 +652,7 @@ class MessagingService:
                 self.messaging_config.get("message_templates", {})
             ),
             "retry_policy": self.messaging_config.get("retry_policy", {}),
+            "batching": self._batcher is not None,
         }
 
     def get_available_providers(self) -> List[str]:
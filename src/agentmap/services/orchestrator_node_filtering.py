@@ -2,24 +2,60 @@
 Node filtering utilities for OrchestratorService.
 """
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 
 class NodeFilter:
     @staticmethod
-    def apply_node_filter(
-        nodes: Dict[str, Dict[str, Any]], node_filter: str
-    ) -> Dict[str, Dict[str, Any]]:
-        if not nodes or node_filter == "all":
-            return nodes
+    def filter_from_context(context: Optional[Dict[str, Any]]) -> str:
+        """Node filter string configured in an orchestrator node's context."""
+        context = context or {}
+        if "nodes" in context:
+            return context["nodes"]
+        elif "node_type" in context:
+            return f"nodeType:{context['node_type']}"
+        elif "nodeType" in context:
+            return f"nodeType:{context['nodeType']}"
+        else:
+            return "all"
+
+    @staticmethod
+    def parse_node_filter(node_filter: str) -> Tuple[str, List[str]]:
+        """Split a filter string into ``(kind, values)``.
+
+        ``kind`` is ``"names"`` for ``"a|b|c"``, ``"node_type"`` for
+        ``"nodeType:<type>"`` and ``"all"`` for anything else.
+        """
+        if not isinstance(node_filter, str) or node_filter == "all":
+            return "all", []
         if "|" in node_filter:
-            node_names = [name.strip() for name in node_filter.split("|")]
-            return {name: info for name, info in nodes.items() if name in node_names}
+            return "names", [name.strip() for name in node_filter.split("|")]
         elif node_filter.startswith("nodeType:"):
-            type_filter = node_filter.split(":", 1)[1].strip()
+            return "node_type", [node_filter.split(":", 1)[1].strip()]
+        return "all", []
+
+    @staticmethod
+    def apply_parsed_filter(
+        nodes: Dict[str, Dict[str, Any]], kind: str, values: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        if not nodes or kind == "all":
+            return nodes
+        if kind == "names":
+            return {name: info for name, info in nodes.items() if name in values}
+        elif kind == "node_type":
+            type_filter = values[0].lower()
             return {
                 name: info
                 for name, info in nodes.items()
-                if info.get("type", "").lower() == type_filter.lower()
+                if info.get("type", "").lower() == type_filter
             }
         return nodes
+
+    @staticmethod
+    def apply_node_filter(
+        nodes: Dict[str, Dict[str, Any]], node_filter: str
+    ) -> Dict[str, Dict[str, Any]]:
+        if not nodes or node_filter == "all":
+            return nodes
+        kind, values = NodeFilter.parse_node_filter(node_filter)
+        return NodeFilter.apply_parsed_filter(nodes, kind, values)
@@ -11,13 +11,24 @@ import importlib.util
 import logging
 import os
 import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 
 from agentmap.services.config.app_config_service import AppConfigService
 from agentmap.services.logging_service import LoggingService
+from agentmap.services.prompt_template_cache import PromptTemplateCache
+
+# Resolved prompts that start with one of these are "not found"/error
+# placeholders and are never cached, so a file created later is picked up.
+_UNCACHEABLE_RESULT_PREFIXES = (
+    "[Prompt file not found:",
+    "[YAML prompt file not found:",
+    "[Error reading",
+)
 
 
 class PromptManagerService:
@@ -51,7 +62,25 @@ class PromptManagerService:
         )
         self.enable_cache = prompts_config.get("enable_cache", True)
         self.template_location = "agentmap.templates.system"
-        self._cache = {}
+        self.cache_max_entries = max(
+            1, int(prompts_config.get("cache_max_entries", 512))
+        )
+
+        # Resolved references, kept in LRU order (oldest first). file:/yaml:
+        # entries are validated against the source file's (mtime, size).
+        # Agents resolve prompts from worker threads, so the LRU state and
+        # the YAML document cache are guarded by _cache_lock.
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_sources: Dict[str, Tuple[str, Optional[Tuple[int, int]]]] = {}
+        # Parsed YAML documents keyed by path, so many yaml:file#key
+        # references to the same file parse it once per modification.
+        self._yaml_documents: "OrderedDict[str, Tuple[Tuple[int, int], Any]]" = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+        self._template_cache = PromptTemplateCache(
+            int(prompts_config.get("template_cache_size", 256))
+        )
         self._registry = self._load_registry()
 
         self.prompts_dir.mkdir(parents=True, exist_ok=True)
@@ -163,28 +192,107 @@ class PromptManagerService:
         if not prompt_ref or not isinstance(prompt_ref, str):
             return prompt_ref
 
-        if self.enable_cache and prompt_ref in self._cache:
-            self.logger.debug(f"Prompt cache hit: {prompt_ref}")
-            return self._cache[prompt_ref]
+        if self.enable_cache:
+            cached = self._get_cached(prompt_ref)
+            if cached is not None:
+                self.logger.debug(f"Prompt cache hit: {prompt_ref}")
+                return cached
 
         try:
+            source = None
             if prompt_ref.startswith("prompt:"):
                 result = self._resolve_registry_prompt(prompt_ref[7:])
             elif prompt_ref.startswith("file:"):
-                result = self._resolve_file_prompt(prompt_ref[5:])
+                source = self._find_resource(prompt_ref[5:])
+                result = self._resolve_file_prompt(prompt_ref[5:], source)
             elif prompt_ref.startswith("yaml:"):
-                result = self._resolve_yaml_prompt(prompt_ref[5:])
+                source = self._find_yaml_source(prompt_ref[5:])
+                result = self._resolve_yaml_prompt(prompt_ref[5:], source)
             else:
                 return prompt_ref
 
-            if self.enable_cache:
-                self._cache[prompt_ref] = result
+            if self.enable_cache and not result.startswith(
+                _UNCACHEABLE_RESULT_PREFIXES
+            ):
+                self._put_cached(prompt_ref, result, source)
 
             return result
         except Exception as e:
             self.logger.error(f"Error resolving prompt reference '{prompt_ref}': {e}")
             return f"[Error resolving prompt: {prompt_ref}]"
 
+    @staticmethod
+    def _source_signature(path: Any) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of a prompt source file, or None if it cannot be stat'ed."""
+        try:
+            stat = os.stat(str(path))
+        except (OSError, TypeError, ValueError):
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _get_cached(self, prompt_ref: str) -> Optional[str]:
+        """Return a still-valid cached prompt (None on a miss) and mark it used."""
+        with self._cache_lock:
+            result = self._cache.get(prompt_ref)
+            if result is None:
+                return None
+            self._cache.move_to_end(prompt_ref)
+            source = self._cache_sources.get(prompt_ref)
+        if source is None:
+            return result
+
+        path, signature = source
+        if self._source_signature(path) == signature:
+            return result
+        self.logger.debug(f"Prompt source changed, reloading: {prompt_ref}")
+        with self._cache_lock:
+            if self._cache_sources.get(prompt_ref) == source:
+                self._cache.pop(prompt_ref, None)
+                self._cache_sources.pop(prompt_ref, None)
+        return None
+
+    def _put_cached(self, prompt_ref: str, result: str, source: Any) -> None:
+        """Insert a resolved prompt, evicting the least recently used entry."""
+        signature = self._source_signature(source) if source is not None else None
+        with self._cache_lock:
+            self._cache[prompt_ref] = result
+            self._cache.move_to_end(prompt_ref)
+            if source is not None:
+                self._cache_sources[prompt_ref] = (str(source), signature)
+            else:
+                self._cache_sources.pop(prompt_ref, None)
+
+            while len(self._cache) > self.cache_max_entries:
+                oldest, _ = self._cache.popitem(last=False)
+                self._cache_sources.pop(oldest, None)
+
+    def _find_yaml_source(self, yaml_ref: str) -> Optional[Path]:
+        """Locate the file behind a yaml:path#key reference."""
+        if "#" not in yaml_ref:
+            return None
+        return self._find_resource(yaml_ref.split("#", 1)[0])
+
+    def _load_yaml_document(self, path: Any) -> Any:
+        """Parse a YAML prompt file, reusing the parse while the file is unchanged."""
+        signature = self._source_signature(path)
+        key = str(path)
+        if self.enable_cache and signature is not None:
+            with self._cache_lock:
+                cached = self._yaml_documents.get(key)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        with open(path, "r") as f:
+            data = yaml.safe_load(f)
+
+        if self.enable_cache and signature is not None:
+            with self._cache_lock:
+                self._yaml_documents[key] = (signature, data)
+                self._yaml_documents.move_to_end(key)
+                while len(self._yaml_documents) > self.cache_max_entries:
+                    self._yaml_documents.popitem(last=False)
+        return data
+
     def _resolve_registry_prompt(self, prompt_name: str) -> str:
         """Resolve prompt from registry by name."""
         if prompt_name in self._registry:
@@ -194,9 +302,10 @@ class PromptManagerService:
         self.logger.warning(f"Prompt '{prompt_name}' not found in registry")
         return f"[Prompt not found: {prompt_name}]"
 
-    def _resolve_file_prompt(self, file_path: str) -> str:
+    def _resolve_file_prompt(self, file_path: str, path: Optional[Path] = None) -> str:
         """Resolve prompt from file path."""
-        path = self._find_resource(file_path)
+        if path is None:
+            path = self._find_resource(file_path)
         if not path:
             self.logger.warning(f"Prompt file not found: {file_path}")
             return f"[Prompt file not found: {file_path}]"
@@ -212,7 +321,7 @@ class PromptManagerService:
             self.logger.error(f"Error reading prompt file '{path}': {e}")
             return f"[Error reading prompt file: {file_path}]"
 
-    def _resolve_yaml_prompt(self, yaml_ref: str) -> str:
+    def _resolve_yaml_prompt(self, yaml_ref: str, path: Optional[Path] = None) -> str:
         """Resolve prompt from YAML file with key path."""
         if "#" not in yaml_ref:
             self.logger.warning(
@@ -221,15 +330,15 @@ class PromptManagerService:
             return f"[Invalid YAML reference (missing #key): {yaml_ref}]"
 
         file_path, key_path = yaml_ref.split("#", 1)
-        path = self._find_resource(file_path)
+        if path is None:
+            path = self._find_resource(file_path)
 
         if not path:
             self.logger.warning(f"YAML prompt file not found: {yaml_ref}")
             return f"[YAML prompt file not found: {file_path}]"
 
         try:
-            with open(path, "r") as f:
-                data = yaml.safe_load(f)
+            data = self._load_yaml_document(path)
 
             keys = key_path.split(".")
             value = data
@@ -263,8 +372,12 @@ class PromptManagerService:
         return self._registry.copy()
 
     def clear_cache(self) -> None:
-        """Clear prompt resolution cache."""
-        self._cache.clear()
+        """Clear prompt resolution, YAML document and compiled template caches."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_sources.clear()
+            self._yaml_documents.clear()
+        self._template_cache.clear()
         self.logger.debug("Cleared prompt cache")
 
     def format_prompt(self, prompt_ref_or_text: str, values: Dict[str, Any]) -> str:
@@ -289,28 +402,14 @@ class PromptManagerService:
             else prompt_ref_or_text
         )
 
+        template = self._template_cache.get(prompt_text)
         try:
-            from langchain_core.prompts import PromptTemplate
-
-            prompt_template = PromptTemplate(
-                template=prompt_text, input_variables=list(values.keys())
-            )
-            return prompt_template.format(**values)
+            return template.format(values)
         except Exception as e:
             self.logger.warning(
-                f"Error using LangChain PromptTemplate: {e}, falling back to standard formatting"
+                f"Error formatting prompt: {e}, falling back to placeholder replacement"
             )
-            try:
-                return prompt_text.format(**values)
-            except Exception as e2:
-                self.logger.error(
-                    f"Error formatting prompt with standard formatting: {e2}"
-                )
-                result = prompt_text
-                for key, value in values.items():
-                    placeholder = "{" + key + "}"
-                    result = result.replace(placeholder, str(value))
-                return result
+            return template.replace(values)
 
     def get_service_info(self) -> Dict[str, Any]:
         """
@@ -326,6 +425,9 @@ class PromptManagerService:
             "registry_path": str(self.registry_path),
             "cache_enabled": self.enable_cache,
             "cache_size": len(self._cache),
+            "cache_max_entries": self.cache_max_entries,
+            "yaml_documents_cached": len(self._yaml_documents),
+            "template_cache": self._template_cache.stats(),
             "registry_size": len(self._registry),
             "supported_prefixes": ["prompt:", "file:", "yaml:"],
         }
@@ -0,0 +1,152 @@
+"""
+Compiled prompt templates for PromptManagerService.
+
+``format_prompt`` used to build a LangChain ``PromptTemplate`` on every call.
+Templates are now parsed once with ``string.Formatter.parse`` and kept in a
+bounded LRU keyed by the template text, so repeated formatting of the same
+prompt is a dict lookup plus a join over pre-split segments.
+
+Formatting semantics match the previous PromptTemplate -> ``str.format`` ->
+placeholder-replacement chain:
+
+- simple ``{name}`` fields (with optional ``!conv`` / ``:spec``) use the fast
+  segment formatter; extra values are ignored,
+- attribute/index fields (``{user.name}``, ``{items[0]}``) and nested format
+  specs use ``str.format_map``,
+- positional fields, unparseable templates and missing variables raise, and
+  the caller falls back to plain ``{name}`` replacement.
+"""
+
+import string
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+_FORMATTER = string.Formatter()
+
+# Compilation modes
+MODE_FAST = "fast"
+MODE_FORMAT_MAP = "format_map"
+MODE_REPLACE = "replace"
+
+
+class CompiledPromptTemplate:
+    """A prompt template parsed once and reusable for any set of values."""
+
+    __slots__ = ("template", "variables", "mode", "_segments")
+
+    def __init__(
+        self,
+        template: str,
+        variables: Tuple[str, ...],
+        mode: str,
+        segments: Optional[List[Tuple[str, Optional[str], str, Optional[str]]]],
+    ) -> None:
+        self.template = template
+        self.variables = variables
+        self.mode = mode
+        self._segments = segments
+
+    @classmethod
+    def compile(cls, template: str) -> "CompiledPromptTemplate":
+        """Parse ``template`` and choose the cheapest formatter that is exact."""
+        try:
+            parsed = list(_FORMATTER.parse(template))
+        except ValueError:
+            # Unbalanced braces: only placeholder replacement can handle it.
+            return cls(template, (), MODE_REPLACE, None)
+
+        segments = []
+        variables: List[str] = []
+        mode = MODE_FAST
+        for literal, field_name, format_spec, conversion in parsed:
+            if field_name is None:
+                segments.append((literal, None, "", None))
+                continue
+            if field_name == "" or field_name.isdigit():
+                # Positional fields can never be satisfied from a mapping.
+                return cls(template, tuple(variables), MODE_REPLACE, None)
+            base_name = field_name.split(".", 1)[0].split("[", 1)[0]
+            if base_name not in variables:
+                variables.append(base_name)
+            if base_name != field_name or "{" in (format_spec or ""):
+                mode = MODE_FORMAT_MAP
+            segments.append((literal, field_name, format_spec or "", conversion))
+
+        return cls(
+            template,
+            tuple(variables),
+            mode,
+            segments if mode == MODE_FAST else None,
+        )
+
+    def format(self, values: Mapping[str, Any]) -> str:
+        """
+        Render with ``values``.
+
+        Raises:
+            KeyError, IndexError, ValueError, AttributeError: when the template
+                cannot be rendered exactly (missing variable, bad spec, or a
+                template that only supports placeholder replacement).
+        """
+        if self.mode == MODE_FAST:
+            parts = []
+            for literal, field_name, format_spec, conversion in self._segments:
+                parts.append(literal)
+                if field_name is not None:
+                    value = values[field_name]
+                    if conversion:
+                        value = _FORMATTER.convert_field(value, conversion)
+                    parts.append(format(value, format_spec))
+            return "".join(parts)
+        if self.mode == MODE_FORMAT_MAP:
+            return self.template.format_map(values)
+        raise ValueError("Template requires placeholder replacement")
+
+    def replace(self, values: Mapping[str, Any]) -> str:
+        """Best-effort ``{name}`` substitution that never raises."""
+        result = self.template
+        for key, value in values.items():
+            result = result.replace("{" + key + "}", str(value))
+        return result
+
+
+class PromptTemplateCache:
+    """Thread-safe bounded LRU of ``CompiledPromptTemplate`` keyed by template text."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, CompiledPromptTemplate]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, template: str) -> CompiledPromptTemplate:
+        """Return the compiled form of ``template``, compiling on first use."""
+        with self._lock:
+            compiled = self._entries.get(template)
+            if compiled is not None:
+                self._entries.move_to_end(template)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = CompiledPromptTemplate.compile(template)
+        with self._lock:
+            self._entries[template] = compiled
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -7,8 +7,6 @@ specific services through dependency injection.
 
 from typing import TYPE_CHECKING, Any, Dict, List, Protocol, runtime_checkable
 
-from langchain_core.tools import Tool
-
 from agentmap.services.protocols.service_protocols import (
     BlobStorageServiceProtocol,
     EmbeddingServiceProtocol,
@@ -22,6 +20,8 @@ from agentmap.services.protocols.service_protocols import (
 )
 
 if TYPE_CHECKING:
+    from langchain_core.tools import Tool
+
     from agentmap.services.orchestrator_service import OrchestratorService
     from agentmap.services.storage.csv_service import CSVStorageService
     from agentmap.services.storage.file_service import FileStorageService
@@ -201,7 +201,7 @@ class ToolCapableAgent(Protocol):
     for enhanced functionality like web search, calculations, or custom operations.
     """
 
-    def configure_tools(self, tools: List[Tool]) -> None:
+    def configure_tools(self, tools: List["Tool"]) -> None:
         """
         Configure tools for this agent.
 
@@ -56,6 +56,11 @@ class BatchAdapterProtocol(Protocol):
         ``"google"``).  Must match the registry key used in DI wiring.
     supports_cancel : bool
         ``True`` when the provider API supports cancelling an in-flight batch.
+
+    Adapters may also implement ``poll_many(provider_batch_ids) -> Dict[str,
+    BatchPollResult]`` to poll several batches per provider call (e.g. from a
+    list endpoint); ``LLMService.poll_batches`` falls back to ``poll`` when it
+    is absent.
     """
 
     provider_name: str
@@ -421,6 +426,15 @@ class LLMServiceProtocol(Protocol):
         """
         ...
 
+    def poll_batches(self, handles: List[LLMBatchHandle]) -> List[LLMBatchHandle]:
+        """
+        Poll many handles at once, using provider list endpoints when available.
+
+        Returns updated handles in input order; a handle whose poll fails is
+        returned unchanged.
+        """
+        ...
+
     def cancel_batch(self, handle: LLMBatchHandle) -> LLMBatchHandle:
         """
         Request cancellation of an active batch.
@@ -764,6 +778,28 @@ class GraphRunnerServiceProtocol(Protocol):
         """Execute a graph bundle asynchronously and return the result (REQ-F-004)."""
         ...
 
+    def run_map(
+        self,
+        bundle: Any,  # GraphBundle
+        item_states: List[dict],
+        max_concurrency: int = 4,
+        parent_graph_name: Optional[str] = None,
+        parent_tracker: Optional[Any] = None,
+    ) -> List[Any]:  # List[ExecutionResult]
+        """Run a graph bundle once per item state, reusing one assembly."""
+        ...
+
+    async def run_map_async(
+        self,
+        bundle: Any,  # GraphBundle
+        item_states: List[dict],
+        max_concurrency: int = 4,
+        parent_graph_name: Optional[str] = None,
+        parent_tracker: Optional[Any] = None,
+    ) -> List[Any]:  # List[ExecutionResult]
+        """Async ``run_map``; items run as tasks rather than threads."""
+        ...
+
     async def resume_from_checkpoint_async(
         self,
         bundle: Any,  # GraphBundle
@@ -6,7 +6,12 @@ including complexity analysis, provider selection, and model optimization.
 """
 
 # Import other modules that don't have circular dependencies
-from agentmap.services.routing.cache import CacheEntry, RoutingCache
+from agentmap.services.routing.cache import (
+    CacheEntry,
+    RoutingCache,
+    RoutingCacheBackend,
+    SQLiteRoutingCacheBackend,
+)
 from agentmap.services.routing.circuit_breaker import CircuitBreaker
 from agentmap.services.routing.complexity_analyzer import PromptComplexityAnalyzer
 
@@ -39,6 +44,8 @@ __all__ = [
     "PromptComplexityAnalyzer",
     "RoutingCache",
     "CacheEntry",
+    "RoutingCacheBackend",
+    "SQLiteRoutingCacheBackend",
     # Utility functions
     "get_valid_complexity_levels",
     # Note: LLMRoutingService removed from __all__ to avoid circular import
@@ -3,16 +3,31 @@ Routing decision caching for LLM routing system.
 
 Provides intelligent caching of routing decisions to improve performance
 and reduce repeated complexity analysis for identical requests.
+
+The in-process cache is an ``OrderedDict`` LRU guarded by a lock, so lookups,
+recency updates and evictions are O(1) and safe to call from executor threads
+and concurrent async fan-out.  An optional shared backend
+(``SQLiteRoutingCacheBackend``) lets several worker processes on one host
+reuse each other's routing decisions: local misses fall through to it and
+new decisions are written through to it.
 """
 
 import hashlib
+import json
+import os
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Protocol
 
 from agentmap.services.logging_service import LoggingService
 from agentmap.services.routing.types import RoutingDecision, TaskComplexity
 
+# Separator for cache key fields; cannot appear in task types or provider names.
+_KEY_SEPARATOR = "\x1f"
+
 
 @dataclass
 class CacheEntry:
@@ -23,8 +38,9 @@ class CacheEntry:
     decision: RoutingDecision
     timestamp: float
     hit_count: int = 0
+    ttl: Optional[float] = None  # Per-entry TTL; cache default when None
 
-    def is_expired(self, ttl: int) -> bool:
+    def is_expired(self, ttl: float) -> bool:
         """Check if the cache entry has expired."""
         return time.time() - self.timestamp > ttl
 
@@ -34,6 +50,106 @@ class CacheEntry:
         self.timestamp = time.time()
 
 
+class RoutingCacheBackend(Protocol):
+    """
+    Shared store consulted on local cache misses.
+
+    Decisions are exchanged as ``RoutingDecision.to_dict()`` payloads so any
+    backend can serialize them without knowing the dataclass.
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored decision dict, or None if missing or expired."""
+        ...
+
+    def put(self, key: str, decision: Dict[str, Any], ttl: float) -> None:
+        """Store a decision dict for ``ttl`` seconds."""
+        ...
+
+    def clear(self) -> None:
+        """Remove every stored decision."""
+        ...
+
+
+class SQLiteRoutingCacheBackend:
+    """
+    Routing cache backend shared between processes through a SQLite file.
+
+    Each thread gets its own connection (SQLite connections are not shareable
+    across threads); WAL mode lets readers proceed while another process
+    writes.  Expired rows are pruned, and the table is capped at ``max_rows``,
+    every ``prune_every`` writes.
+    """
+
+    def __init__(self, path: str, max_rows: int = 10000, prune_every: int = 256):
+        self.path = path
+        self.max_rows = max_rows
+        self.prune_every = prune_every
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS routing_cache ("
+                "key TEXT PRIMARY KEY, decision TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT decision FROM routing_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            )
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def put(self, key: str, decision: Dict[str, Any], ttl: float) -> None:
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO routing_cache VALUES (?, ?, ?, ?)",
+                (key, json.dumps(decision), now, now + ttl),
+            )
+        with self._writes_lock:
+            self._writes += 1
+            prune = self._writes % self.prune_every == 0
+        if prune:
+            self.prune()
+
+    def prune(self) -> None:
+        """Drop expired rows and the oldest rows beyond ``max_rows``."""
+        with self._connection() as conn:
+            conn.execute(
+                "DELETE FROM routing_cache WHERE expires_at <= ?", (time.time(),)
+            )
+            conn.execute(
+                "DELETE FROM routing_cache WHERE key IN ("
+                "SELECT key FROM routing_cache ORDER BY stored_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.max_rows,),
+            )
+
+    def clear(self) -> None:
+        with self._connection() as conn:
+            conn.execute("DELETE FROM routing_cache")
+
+
 class RoutingCache:
     """
     Cache for routing decisions to improve performance.
@@ -57,14 +173,18 @@ class RoutingCache:
         """
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self._cache: Dict[str, CacheEntry] = {}
-        self._access_order: List[str] = []  # For LRU eviction
+        # Iteration order is recency order: least recently used first.
+        self._cache: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._backend: Optional[RoutingCacheBackend] = None
         self._logger = logging_service.get_class_logger(self)
 
         # Statistics
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._expirations = 0
+        self._shared_hits = 0
 
     def update_cache_parameters(self, max_size: int, default_ttl: int) -> None:
         """
@@ -74,8 +194,20 @@ class RoutingCache:
             max_size: Maximum number of entries to cache
             default_ttl: Default time-to-live in seconds
         """
-        self.max_size = max_size
-        self.default_ttl = default_ttl
+        with self._lock:
+            self.max_size = max_size
+            self.default_ttl = default_ttl
+            while len(self._cache) > self.max_size:
+                self._evict_lru()
+
+    def set_backend(self, backend: Optional[RoutingCacheBackend]) -> None:
+        """
+        Attach (or detach with None) a shared backend for cross-process reuse.
+
+        Args:
+            backend: Backend consulted on local misses and written through on put
+        """
+        self._backend = backend
 
     def _generate_cache_key(
         self,
@@ -100,19 +232,18 @@ class RoutingCache:
         Returns:
             Cache key string
         """
-        # Create a normalized representation of the routing parameters
-        key_data = {
-            "task_type": task_type,
-            "complexity": str(complexity),
-            "prompt_hash": prompt_hash,
-            "available_providers": sorted(available_providers),
-            "provider_preference": provider_preference,
-            "cost_optimization": cost_optimization,
-        }
-
-        # Create hash of the key data
-        key_string = str(sorted(key_data.items()))
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # Provider availability is a set; preference order is significant.
+        key_string = _KEY_SEPARATOR.join(
+            (
+                str(task_type),
+                complexity.name,
+                prompt_hash,
+                ",".join(sorted(available_providers)),
+                ",".join(provider_preference),
+                "1" if cost_optimization else "0",
+            )
+        )
+        return hashlib.blake2b(key_string.encode(), digest_size=16).hexdigest()
 
     def _hash_prompt(self, prompt: str) -> str:
         """
@@ -122,9 +253,27 @@ class RoutingCache:
             prompt: The prompt text
 
         Returns:
-            MD5 hash of the prompt
+            BLAKE2b (128-bit) hex digest of the prompt
         """
-        return hashlib.md5(prompt.encode()).hexdigest()
+        return hashlib.blake2b(prompt.encode(), digest_size=16).hexdigest()
+
+    def _key_for(
+        self,
+        task_type: str,
+        complexity: TaskComplexity,
+        prompt: str,
+        available_providers: List[str],
+        provider_preference: Optional[List[str]],
+        cost_optimization: bool,
+    ) -> str:
+        return self._generate_cache_key(
+            task_type,
+            complexity,
+            self._hash_prompt(prompt),
+            available_providers,
+            provider_preference or [],
+            cost_optimization,
+        )
 
     def get(
         self,
@@ -146,50 +295,80 @@ class RoutingCache:
             available_providers: List of available providers
             provider_preference: Preferred providers
             cost_optimization: Whether cost optimization is enabled
-            ttl: Custom TTL (uses default if None)
+            ttl: Custom TTL (uses the entry's TTL, then the default, if None)
 
         Returns:
-            Cached routing decision or None if not found/expired
+            Copy of the cached routing decision (``cache_hit=True``) or None
+            if not found/expired
         """
-        if provider_preference is None:
-            provider_preference = []
-
-        prompt_hash = self._hash_prompt(prompt)
-        cache_key = self._generate_cache_key(
+        cache_key = self._key_for(
             task_type,
             complexity,
-            prompt_hash,
+            prompt,
             available_providers,
             provider_preference,
             cost_optimization,
         )
 
+        with self._lock:
+            decision = self._get_local(cache_key, ttl)
+            if decision is None and self._backend is None:
+                self._misses += 1
+                return None
+
+        if decision is None:
+            decision = self._get_shared(cache_key)
+            if decision is None:
+                with self._lock:
+                    self._misses += 1
+                return None
+
+        self._logger.trace(f"Cache hit for key: {cache_key[:8]}...")
+        # Callers get their own copy so shared entries are never mutated.
+        return replace(decision, cache_hit=True)
+
+    def _get_local(
+        self, cache_key: str, ttl: Optional[int]
+    ) -> Optional[RoutingDecision]:
+        """Look a key up locally, dropping it if expired (lock held)."""
         entry = self._cache.get(cache_key)
         if entry is None:
-            self._misses += 1
             return None
 
-        # Check if expired
-        cache_ttl = ttl if ttl is not None else self.default_ttl
+        cache_ttl = ttl if ttl is not None else self._entry_ttl(entry)
         if entry.is_expired(cache_ttl):
-            self._remove_entry(cache_key)
-            self._misses += 1
+            del self._cache[cache_key]
+            self._expirations += 1
             return None
 
-        # Update access order for LRU
-        if cache_key in self._access_order:
-            self._access_order.remove(cache_key)
-        self._access_order.append(cache_key)
-
-        # Update entry statistics
+        self._cache.move_to_end(cache_key)
         entry.touch()
         self._hits += 1
+        return entry.decision
+
+    def _get_shared(self, cache_key: str) -> Optional[RoutingDecision]:
+        """Look a key up in the shared backend and promote hits locally."""
+        try:
+            data = self._backend.get(cache_key)
+        except Exception as e:
+            self._logger.warning(f"Shared routing cache read failed: {e}")
+            return None
+        if data is None:
+            return None
 
-        # Mark as cache hit in the decision
-        decision = entry.decision
-        decision.cache_hit = True
-
-        self._logger.trace(f"Cache hit for key: {cache_key[:8]}...")
+        decision = RoutingDecision(
+            provider=data["provider"],
+            model=data["model"],
+            complexity=TaskComplexity.from_string(data["complexity"]),
+            confidence=data.get("confidence", 1.0),
+            reasoning=data.get("reasoning", ""),
+            fallback_used=data.get("fallback_used", False),
+            max_tokens=data.get("max_tokens"),
+        )
+        with self._lock:
+            self._store(cache_key, CacheEntry(decision=decision, timestamp=time.time()))
+            self._hits += 1
+            self._shared_hits += 1
         return decision
 
     def put(
@@ -201,6 +380,7 @@ class RoutingCache:
         decision: RoutingDecision,
         provider_preference: List[str] = None,
         cost_optimization: bool = True,
+        ttl: Optional[int] = None,
     ) -> None:
         """
         Cache a routing decision.
@@ -213,58 +393,68 @@ class RoutingCache:
             decision: The routing decision to cache
             provider_preference: Preferred providers
             cost_optimization: Whether cost optimization is enabled
+            ttl: TTL for this entry (uses default if None)
         """
-        if provider_preference is None:
-            provider_preference = []
-
-        prompt_hash = self._hash_prompt(prompt)
-        cache_key = self._generate_cache_key(
+        cache_key = self._key_for(
             task_type,
             complexity,
-            prompt_hash,
+            prompt,
             available_providers,
             provider_preference,
             cost_optimization,
         )
+        entry = CacheEntry(decision=decision, timestamp=time.time(), ttl=ttl)
 
-        # Evict if at max size
-        if len(self._cache) >= self.max_size and cache_key not in self._cache:
-            self._evict_lru()
+        with self._lock:
+            self._store(cache_key, entry)
 
-        # Create cache entry
-        entry = CacheEntry(decision=decision, timestamp=time.time())
+        if self._backend is not None:
+            try:
+                self._backend.put(
+                    cache_key,
+                    replace(decision, cache_hit=False).to_dict(),
+                    self._entry_ttl(entry),
+                )
+            except Exception as e:
+                self._logger.warning(f"Shared routing cache write failed: {e}")
 
-        self._cache[cache_key] = entry
+        self._logger.debug(f"Cached decision for key: {cache_key[:8]}...")
 
-        # Update access order
-        if cache_key in self._access_order:
-            self._access_order.remove(cache_key)
-        self._access_order.append(cache_key)
+    def _entry_ttl(self, entry: CacheEntry) -> float:
+        return entry.ttl if entry.ttl is not None else self.default_ttl
 
-        self._logger.debug(f"Cached decision for key: {cache_key[:8]}...")
+    def _store(self, cache_key: str, entry: CacheEntry) -> None:
+        """Insert as most recently used, evicting if full (lock held)."""
+        if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+        else:
+            while self._cache and len(self._cache) >= self.max_size:
+                self._evict_lru()
+        self._cache[cache_key] = entry
 
     def _evict_lru(self) -> None:
-        """Evict the least recently used cache entry."""
-        if not self._access_order:
+        """Evict the least recently used cache entry (lock held)."""
+        if not self._cache:
             return
 
-        lru_key = self._access_order.pop(0)
-        self._remove_entry(lru_key)
+        lru_key, _ = self._cache.popitem(last=False)
         self._evictions += 1
 
         self._logger.debug(f"Evicted LRU entry: {lru_key[:8]}...")
 
     def _remove_entry(self, cache_key: str) -> None:
         """Remove an entry from the cache."""
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-        if cache_key in self._access_order:
-            self._access_order.remove(cache_key)
+        self._cache.pop(cache_key, None)
 
     def clear(self) -> None:
-        """Clear all cached entries."""
-        self._cache.clear()
-        self._access_order.clear()
+        """Clear all cached entries, including the shared backend's."""
+        with self._lock:
+            self._cache.clear()
+        if self._backend is not None:
+            try:
+                self._backend.clear()
+            except Exception as e:
+                self._logger.warning(f"Shared routing cache clear failed: {e}")
         self._logger.debug("Cache cleared")
 
     def cleanup_expired(self, ttl: Optional[int] = None) -> int:
@@ -272,20 +462,20 @@ class RoutingCache:
         Remove all expired entries from the cache.
 
         Args:
-            ttl: Custom TTL (uses default if None)
+            ttl: Custom TTL (uses each entry's TTL, then the default, if None)
 
         Returns:
             Number of entries removed
         """
-        cache_ttl = ttl if ttl is not None else self.default_ttl
-        expired_keys = []
-
-        for key, entry in self._cache.items():
-            if entry.is_expired(cache_ttl):
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            self._remove_entry(key)
+        with self._lock:
+            expired_keys = [
+                key
+                for key, entry in self._cache.items()
+                if entry.is_expired(ttl if ttl is not None else self._entry_ttl(entry))
+            ]
+            for key in expired_keys:
+                del self._cache[key]
+            self._expirations += len(expired_keys)
 
         if expired_keys:
             self._logger.debug(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -299,21 +489,32 @@ class RoutingCache:
         Returns:
             Dictionary containing cache statistics
         """
-        total_requests = self._hits + self._misses
-        hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            size = len(self._cache)
+            evictions, expirations = self._evictions, self._expirations
+            shared_hits = self._shared_hits
+
+        total_requests = hits + misses
+        hit_rate = hits / total_requests if total_requests > 0 else 0.0
 
         return {
-            "size": len(self._cache),
+            "size": size,
             "max_size": self.max_size,
-            "hits": self._hits,
-            "misses": self._misses,
+            "hits": hits,
+            "misses": misses,
             "hit_rate": hit_rate,
-            "evictions": self._evictions,
+            "evictions": evictions,
+            "expirations": expirations,
+            "shared_hits": shared_hits,
             "total_requests": total_requests,
         }
 
     def reset_stats(self) -> None:
         """Reset cache statistics."""
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._expirations = 0
+            self._shared_hits = 0
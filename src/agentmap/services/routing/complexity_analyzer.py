@@ -3,11 +3,18 @@ Complexity analysis system for LLM routing.
 
 This module provides intelligent complexity analysis for prompts and contexts,
 helping to determine appropriate model selection based on task requirements.
+
+Prompt analysis runs on every routed LLM call, so it is kept cheap: all
+keyword/structure patterns are matched in one combined regex pass, prompts
+longer than ``max_analysis_chars`` are analyzed on a head+tail sample, and
+per-(prompt, task type) results are memoized in a bounded LRU.
 """
 
+import hashlib
 import re
-from collections import Counter
-from typing import Any, Dict, List
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from agentmap.services.config.app_config_service import AppConfigService
 from agentmap.services.logging_service import LoggingService
@@ -18,6 +25,41 @@ from agentmap.services.routing.types import (
     get_complexity_order,
 )
 
+# Keyword categories for prompt keyword/structure analysis (matched as words,
+# case-insensitively); "questions" also counts "?".
+_PATTERN_WORDS = {
+    "questions": ("what", "how", "why", "when", "where", "who"),
+    "commands": ("analyze", "create", "generate", "explain", "compare", "write"),
+    "technical_terms": (
+        "api",
+        "json",
+        "sql",
+        "http",
+        "algorithm",
+        "function",
+        "class",
+    ),
+    "complexity_indicators": (
+        "complex",
+        "detailed",
+        "comprehensive",
+        "advanced",
+        "in-depth",
+    ),
+    "urgency_indicators": ("urgent", "critical", "emergency", "important", "asap"),
+    "creative_indicators": (
+        "creative",
+        "imagine",
+        "story",
+        "narrative",
+        "artistic",
+        "innovative",
+    ),
+}
+
+# (prompt complexity, task type signal) memoized per prompt + task type
+_PromptAnalysis = Tuple[TaskComplexity, ComplexitySignal]
+
 
 class PromptComplexityAnalyzer:
     """
@@ -44,8 +86,20 @@ class PromptComplexityAnalyzer:
         self.analysis_methods = self._load_analysis_methods()
         self.keyword_weights = self._load_keyword_weights()
         self.context_thresholds = self._load_context_thresholds()
+        self.max_analysis_chars = self.complexity_config.get(
+            "max_analysis_chars", 20000
+        )
+        self.cache_size = self.complexity_config.get("cache_size", 1024)
         self._logger = logging_service.get_class_logger(self)
 
+        # Memoized prompt analysis: (prompt digest, task type) -> signals
+        self._analysis_cache: "OrderedDict[Tuple[bytes, str], _PromptAnalysis]" = (
+            OrderedDict()
+        )
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         # Compile regex patterns for efficiency
         self._compile_patterns()
 
@@ -91,30 +145,40 @@ class PromptComplexityAnalyzer:
     def _compile_patterns(self):
         """Compile regex patterns for prompt structure analysis."""
         self.patterns = {
-            "questions": re.compile(
-                r"\?|\bwhat\b|\bhow\b|\bwhy\b|\bwhen\b|\bwhere\b|\bwho\b", re.IGNORECASE
-            ),
-            "commands": re.compile(
-                r"\banalyze\b|\bcreate\b|\bgenerate\b|\bexplain\b|\bcompare\b|\bwrite\b",
-                re.IGNORECASE,
-            ),
-            "technical_terms": re.compile(
-                r"\bAPI\b|\bJSON\b|\bSQL\b|\bHTTP\b|\balgorithm\b|\bfunction\b|\bclass\b",
+            name: re.compile(
+                ("\\?|" if name == "questions" else "")
+                + "|".join(rf"\b{re.escape(word)}\b" for word in words),
                 re.IGNORECASE,
-            ),
-            "complexity_indicators": re.compile(
-                r"\bcomplex\b|\bdetailed\b|\bcomprehensive\b|\badvanced\b|\bin-depth\b",
-                re.IGNORECASE,
-            ),
-            "urgency_indicators": re.compile(
-                r"\burgent\b|\bcritical\b|\bemergency\b|\bimportant\b|\basap\b",
-                re.IGNORECASE,
-            ),
-            "creative_indicators": re.compile(
-                r"\bcreative\b|\bimagine\b|\bstory\b|\bnarrative\b|\bartistic\b|\binnovative\b",
-                re.IGNORECASE,
-            ),
+            )
+            for name, words in _PATTERN_WORDS.items()
         }
+        # One findall over lowercased text: "?" or any category word between
+        # word boundaries.  The categories share no words, so mapping each hit
+        # back to its category counts exactly what each pattern's findall
+        # would.
+        self._word_categories = {"?": "questions"}
+        for name, words in _PATTERN_WORDS.items():
+            self._word_categories.update(dict.fromkeys(words, name))
+        alternation = "|".join(
+            re.escape(word) for words in _PATTERN_WORDS.values() for word in words
+        )
+        self._combined_pattern = re.compile(rf"\?|\b(?:{alternation})\b")
+
+    def _count_pattern_matches(self, prompt: str) -> Dict[str, int]:
+        """Count matches for every pattern category in a single pass."""
+        counts = dict.fromkeys(self.patterns, 0)
+        word_categories = self._word_categories
+        for word in self._combined_pattern.findall(prompt.lower()):
+            counts[word_categories[word]] += 1
+        return counts
+
+    def _analysis_text(self, prompt: str) -> str:
+        """Return the prompt, or a head+tail sample if it exceeds the cap."""
+        cap = self.max_analysis_chars
+        if not cap or len(prompt) <= cap:
+            return prompt
+        half = cap // 2
+        return prompt[:half] + "\n" + prompt[-half:]
 
     def analyze_prompt_complexity(self, prompt: str) -> TaskComplexity:
         """Analyze prompt text to determine complexity."""
@@ -123,19 +187,28 @@ class PromptComplexityAnalyzer:
 
         signals = []
 
-        # Length-based analysis
+        # Length-based analysis (always on the full prompt)
         if self.analysis_methods["prompt_length"]:
             length_signal = self._analyze_prompt_length(prompt)
             signals.append(length_signal)
 
+        # Keyword and structure analysis share one pass over the (sampled) text
+        text = self._analysis_text(prompt)
+        counts = None
+        if (
+            self.analysis_methods["keyword_analysis"]
+            or self.analysis_methods["structure_analysis"]
+        ):
+            counts = self._count_pattern_matches(text)
+
         # Keyword-based analysis
         if self.analysis_methods["keyword_analysis"]:
-            keyword_signal = self._analyze_prompt_keywords(prompt)
+            keyword_signal = self._analyze_prompt_keywords(text, counts)
             signals.append(keyword_signal)
 
         # Structure-based analysis
         if self.analysis_methods["structure_analysis"]:
-            structure_signal = self._analyze_prompt_structure(prompt)
+            structure_signal = self._analyze_prompt_structure(text, counts)
             signals.append(structure_signal)
 
         # Combine signals
@@ -169,9 +242,12 @@ class PromptComplexityAnalyzer:
             source="prompt_length",
         )
 
-    def _analyze_prompt_keywords(self, prompt: str) -> ComplexitySignal:
+    def _analyze_prompt_keywords(
+        self, prompt: str, counts: Optional[Dict[str, int]] = None
+    ) -> ComplexitySignal:
         """Analyze prompt keywords to determine complexity."""
-        prompt.lower()
+        if counts is None:
+            counts = self._count_pattern_matches(prompt)
         complexity_scores = {
             TaskComplexity.LOW: 0,
             TaskComplexity.MEDIUM: 0,
@@ -180,29 +256,29 @@ class PromptComplexityAnalyzer:
         }
 
         # Check for urgency indicators (critical)
-        urgency_matches = len(self.patterns["urgency_indicators"].findall(prompt))
+        urgency_matches = counts["urgency_indicators"]
         if urgency_matches > 0:
             complexity_scores[TaskComplexity.CRITICAL] += urgency_matches * 2.0
 
         # Check for complexity indicators (high)
-        complexity_matches = len(self.patterns["complexity_indicators"].findall(prompt))
+        complexity_matches = counts["complexity_indicators"]
         if complexity_matches > 0:
             complexity_scores[TaskComplexity.HIGH] += complexity_matches * 1.5
 
         # Check for technical terms (medium-high)
-        technical_matches = len(self.patterns["technical_terms"].findall(prompt))
+        technical_matches = counts["technical_terms"]
         if technical_matches > 0:
             complexity_scores[TaskComplexity.HIGH] += technical_matches * 1.0
             complexity_scores[TaskComplexity.MEDIUM] += technical_matches * 0.5
 
         # Check for creative indicators (medium-high)
-        creative_matches = len(self.patterns["creative_indicators"].findall(prompt))
+        creative_matches = counts["creative_indicators"]
         if creative_matches > 0:
             complexity_scores[TaskComplexity.HIGH] += creative_matches * 1.2
             complexity_scores[TaskComplexity.MEDIUM] += creative_matches * 0.8
 
         # Check for command complexity
-        command_matches = len(self.patterns["commands"].findall(prompt))
+        command_matches = counts["commands"]
         if command_matches > 2:
             complexity_scores[TaskComplexity.HIGH] += 1.0
         elif command_matches > 0:
@@ -229,8 +305,12 @@ class PromptComplexityAnalyzer:
             source="keyword_analysis",
         )
 
-    def _analyze_prompt_structure(self, prompt: str) -> ComplexitySignal:
+    def _analyze_prompt_structure(
+        self, prompt: str, counts: Optional[Dict[str, int]] = None
+    ) -> ComplexitySignal:
         """Analyze prompt structure to determine complexity."""
+        if counts is None:
+            counts = self._count_pattern_matches(prompt)
         structure_score = 0
         reasoning_parts = []
 
@@ -241,7 +321,7 @@ class PromptComplexityAnalyzer:
             reasoning_parts.append(f"{sentences} sentences")
 
         # Count questions
-        questions = len(self.patterns["questions"].findall(prompt))
+        questions = counts["questions"]
         if questions > 3:
             structure_score += 1
             reasoning_parts.append(f"{questions} questions")
@@ -390,7 +470,7 @@ class PromptComplexityAnalyzer:
         base_complexity = TaskComplexity.from_string(default_complexity)
 
         # Check for task-specific complexity keywords
-        prompt_lower = prompt.lower()
+        prompt_lower = self._analysis_text(prompt).lower()
         keyword_scores = {}
 
         for complexity_level, keywords in complexity_keywords.items():
@@ -482,12 +562,11 @@ class PromptComplexityAnalyzer:
 
         signals = []
 
-        # Prompt analysis
-        prompt_complexity = self.analyze_prompt_complexity(prompt)
+        # Prompt and task type analysis (memoized per prompt + task type)
+        prompt_complexity, task_signal = self._analyze_prompt_for_task(
+            prompt, task_type
+        )
         signals.append(prompt_complexity)
-
-        # Task type analysis
-        task_signal = self.analyze_task_type_complexity(task_type, prompt)
         signals.append(task_signal.complexity)
 
         # Context analysis
@@ -512,3 +591,52 @@ class PromptComplexityAnalyzer:
         )
 
         return final_complexity
+
+    def _analyze_prompt_for_task(self, prompt: str, task_type: str) -> _PromptAnalysis:
+        """Prompt and task type signals, memoized by prompt digest + task type."""
+        if not self.cache_size:
+            return (
+                self.analyze_prompt_complexity(prompt),
+                self.analyze_task_type_complexity(task_type, prompt),
+            )
+
+        key = (
+            hashlib.blake2b(prompt.encode(), digest_size=16).digest(),
+            task_type,
+        )
+        with self._cache_lock:
+            cached = self._analysis_cache.get(key)
+            if cached is not None:
+                self._analysis_cache.move_to_end(key)
+                self._cache_hits += 1
+                return cached
+            self._cache_misses += 1
+
+        result = (
+            self.analyze_prompt_complexity(prompt),
+            self.analyze_task_type_complexity(task_type, prompt),
+        )
+        with self._cache_lock:
+            self._analysis_cache[key] = result
+            while len(self._analysis_cache) > self.cache_size:
+                self._analysis_cache.popitem(last=False)
+        return result
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get prompt analysis cache statistics."""
+        with self._cache_lock:
+            hits, misses = self._cache_hits, self._cache_misses
+            size = len(self._analysis_cache)
+        total = hits + misses
+        return {
+            "size": size,
+            "max_size": self.cache_size,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total else 0.0,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop memoized prompt analysis (e.g. after routing config changes)."""
+        with self._cache_lock:
+            self._analysis_cache.clear()
@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from agentmap.services.config.llm_routing_config_service import LLMRoutingConfigService
 from agentmap.services.logging_service import LoggingService
 from agentmap.services.routing.activity_routing import ActivityRoutingTable
-from agentmap.services.routing.cache import RoutingCache
+from agentmap.services.routing.cache import RoutingCache, SQLiteRoutingCacheBackend
 from agentmap.services.routing.complexity_analyzer import PromptComplexityAnalyzer
 from agentmap.services.routing.fallback_handler import FallbackHandler
 from agentmap.services.routing.model_selector import ModelSelector
@@ -73,6 +73,11 @@ class LLMRoutingService:
             self.cache.update_cache_parameters(
                 max_size=cache_size, default_ttl=cache_ttl
             )
+            # Optional cross-process cache shared by workers on one host
+            shared_path = self.routing_config.performance.get("shared_cache_path")
+            if isinstance(shared_path, str) and shared_path:
+                self.cache.set_backend(SQLiteRoutingCacheBackend(shared_path))
+                self._logger.info(f"Routing cache shared via {shared_path}")
         else:
             self.cache = None
 
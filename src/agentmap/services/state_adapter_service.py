@@ -6,12 +6,84 @@ Following YAGNI principle, this service only wraps the set_value method that is
 actually used in the codebase. Additional methods can be added as needed.
 """
 
-from typing import Any, Dict, List, Optional, TypeVar
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, TypeVar
 
 # Type variable for state objects
 StateType = TypeVar("StateType", Dict[str, Any], object)
 
 
+class StateOverlay(Mapping):
+    """
+    Copy-on-write view of a state mapping.
+
+    Reads fall through to the shared base state; writes land in a small
+    dict of changed keys, so updating a large state costs O(changed keys)
+    rather than a copy of every key. ``changes`` is the LangGraph partial
+    update for the keys written through the overlay.
+
+    Overlays never mutate their base. Keys cannot be deleted, because a
+    LangGraph partial update has no way to express a removal.
+    """
+
+    __slots__ = ("_base", "_changes")
+
+    def __init__(self, base: Mapping, changes: Optional[Dict[str, Any]] = None):
+        if isinstance(base, StateOverlay):
+            changes = {**base._changes, **(changes or {})}
+            base = base._base
+        self._base = base
+        self._changes: Dict[str, Any] = dict(changes) if changes else {}
+
+    @property
+    def changes(self) -> Dict[str, Any]:
+        """Keys written through this overlay, as a partial state update."""
+        return dict(self._changes)
+
+    def with_value(self, key: Any, value: Any) -> "StateOverlay":
+        """Return a new overlay with *key* set, sharing this overlay's base."""
+        return StateOverlay(self._base, {**self._changes, key: value})
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the merged state as a plain dict."""
+        return {**self._base, **self._changes}
+
+    def copy(self) -> "StateOverlay":
+        return StateOverlay(self._base, self._changes)
+
+    def __getitem__(self, key: Any) -> Any:
+        if key in self._changes:
+            return self._changes[key]
+        return self._base[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._changes[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        raise TypeError("StateOverlay does not support deleting state keys")
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._changes or key in self._base
+
+    def __iter__(self) -> Iterator[Any]:
+        changes = self._changes
+        for key in self._base:
+            if key not in changes:
+                yield key
+        yield from changes
+
+    def __len__(self) -> int:
+        return len(self._base) + sum(
+            1 for key in self._changes if key not in self._base
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"StateOverlay(<{len(self._base)} base keys>, "
+            f"changed={list(self._changes)})"
+        )
+
+
 class StateAdapterService:
     """
     Service for state format abstraction and manipulation.
@@ -107,6 +179,10 @@ class StateAdapterService:
         Returns:
             New state object with updated value
         """
+        # Copy-on-write overlay: only the changed keys are copied
+        if isinstance(state, StateOverlay):
+            return state.with_value(key, value)
+
         # Dictionary state (most common case)
         if isinstance(state, dict):
             new_state = state.copy()
@@ -138,6 +214,49 @@ class StateAdapterService:
             raise e
             # return state
 
+    @staticmethod
+    def copy_on_write(state: Any) -> Any:
+        """
+        Wrap a mapping state in a copy-on-write overlay.
+
+        ``set_value`` on the result no longer copies the whole state, and
+        the agent lifecycle merges the overlay's changed keys into the
+        node's state update. Non-mapping states are returned unchanged.
+
+        Args:
+            state: State object (dict, Pydantic model, etc.)
+
+        Returns:
+            A ``StateOverlay`` over *state*, or *state* itself
+        """
+        if isinstance(state, Mapping) and not isinstance(state, StateOverlay):
+            return StateOverlay(state)
+        return state
+
+    @staticmethod
+    def merge_updates(state: StateType, updates: Dict[str, Any]) -> StateType:
+        """
+        Apply several updates at once, copying the state at most once.
+
+        Args:
+            state: Current state object
+            updates: Dictionary of updates to apply
+
+        Returns:
+            New state object with all updates applied
+        """
+        if not updates:
+            return state
+        if isinstance(state, StateOverlay):
+            return StateOverlay(state, updates)
+        if isinstance(state, dict):
+            return {**state, **updates}
+
+        current_state = state
+        for key, value in updates.items():
+            current_state = StateAdapterService.set_value(current_state, key, value)
+        return current_state
+
     @staticmethod
     def get_inputs(
         state: Any,
@@ -206,19 +325,28 @@ class StateAdapterService:
             "capabilities": {
                 "state_manipulation": True,
                 "immutable_updates": True,
+                "copy_on_write": True,
                 "multiple_state_types": True,
                 "error_handling": True,
             },
-            "methods": ["set_value", "get_inputs", "has_value", "get_value"],
+            "methods": [
+                "set_value",
+                "get_inputs",
+                "has_value",
+                "get_value",
+                "copy_on_write",
+                "merge_updates",
+            ],
             "available_state_types": [
                 "dict",
                 "pydantic_models",
                 "objects_with_copy_method",
                 "objects_with_attributes",
+                "state_overlays",
             ],
             "yagni_compliance": {
                 "methods_wrapped": 1,
-                "methods_available": 4,
+                "methods_available": 6,
                 "reason": "Only set_value method is currently used in GraphRunnerService",
             },
         }
@@ -239,32 +367,3 @@ class StateAdapterService:
 
     #     # No tracking data available
     #     return default
-
-    # @staticmethod
-    # def merge_updates(state: StateType, updates: Dict[str, Any]) -> StateType:
-    #     """
-    #     Merge multiple updates into the state efficiently.
-    #     This is useful for applying partial updates from agents.
-
-    #     Args:
-    #         state: Current state object
-    #         updates: Dictionary of updates to apply
-
-    #     Returns:
-    #         New state object with all updates applied
-    #     """
-    #     if not updates:
-    #         return state
-
-    #     # For AgentMapState/TypedDict, merge efficiently
-    #     if isinstance(state, dict):
-    #         new_state = state.copy()
-    #         new_state.update(updates)
-    #         return new_state
-
-    #     # Apply updates one by one for other state types
-    #     current_state = state
-    #     for key, value in updates.items():
-    #         current_state = StateAdapter.set_value(current_state, key, value)
-
-    #     return current_state
@@ -16,6 +16,7 @@ from agentmap.services.custom_agent_declaration_manager import (
     CustomAgentDeclarationManager,
 )
 from agentmap.services.declaration_registry_service import DeclarationRegistryService
+from agentmap.services.graph.execution_plan_builder import build_execution_plan
 from agentmap.services.logging_service import LoggingService
 
 
@@ -165,6 +166,9 @@ class StaticBundleAnalyzer:
         # Find entry point
         entry_point = list(nodes.keys())[0]  # self._find_entry_point(nodes)
 
+        # Precompute routing facts so assembly and orchestration need not
+        execution_plan = build_execution_plan(nodes, entry_point)
+
         # Create validation metadata
         validation_metadata = {
             "csv_path": str(csv_path),
@@ -175,6 +179,8 @@ class StaticBundleAnalyzer:
             "has_missing_services": len(missing_services) > 0,
             "has_parallel_routing": self._has_parallel_routing(nodes),
             "parallel_edge_count": self._count_parallel_edges(nodes),
+            "unreachable_nodes": execution_plan.unreachable,
+            "cycle_count": len(execution_plan.cycles),
         }
 
         # protocol map will contain all protocol mappings
@@ -191,6 +197,7 @@ class StaticBundleAnalyzer:
             entry_point=entry_point,
             validation_metadata=validation_metadata,
             protocol_mappings=protocol_mappings,
+            execution_plan=execution_plan,
             missing_declarations=missing_declarations,
             missing_services=missing_services,
             agent_mappings=agent_mappings,
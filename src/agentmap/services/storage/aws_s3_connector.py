@@ -5,10 +5,78 @@ This module provides an AWS-specific implementation of the BlobStorageConnector
 interface for reading and writing JSON files in S3 buckets.
 """
 
-from typing import Any, Dict, Tuple
+import base64
+import hashlib
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from agentmap.exceptions import StorageConnectionError, StorageOperationError
 from agentmap.services.storage.base_connector import BlobStorageConnector
+from agentmap.services.storage.blob_streaming import DEFAULT_CHUNK_SIZE, MultipartUpload
+
+
+def _content_md5(data: bytes) -> str:
+    """Base64 MD5 for the ``ContentMD5`` header (S3 verifies it server-side)."""
+    return base64.b64encode(hashlib.md5(data, usedforsecurity=False).digest()).decode()
+
+
+class _S3MultipartUpload(MultipartUpload):
+    """
+    S3 multipart upload. The upload id is created with the first part, so a
+    blob that fits in one part goes up as a single ``PutObject`` instead.
+    Every request carries a ``ContentMD5`` so S3 rejects corrupted parts.
+    """
+
+    parallel = True
+    min_part_size = 5 * 1024 * 1024  # S3 minimum for all but the last part
+
+    def __init__(self, client: Any, bucket: str, key: str):
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._upload_id: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def _ensure_upload_id(self) -> str:
+        with self._lock:
+            if self._upload_id is None:
+                response = self._client.create_multipart_upload(
+                    Bucket=self._bucket, Key=self._key
+                )
+                self._upload_id = response["UploadId"]
+            return self._upload_id
+
+    def upload_part(self, part_number: int, data: bytes) -> Dict[str, Any]:
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._ensure_upload_id(),
+            PartNumber=part_number,
+            Body=data,
+            ContentMD5=_content_md5(data),
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    def upload_single(self, data: bytes) -> Dict[str, Any]:
+        response = self._client.put_object(
+            Bucket=self._bucket, Key=self._key, Body=data, ContentMD5=_content_md5(data)
+        )
+        return {"etag": response.get("ETag")}
+
+    def complete(self, parts: List[Any]) -> Dict[str, Any]:
+        response = self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._ensure_upload_id(),
+            MultipartUpload={"Parts": parts},
+        )
+        return {"etag": response.get("ETag")}
+
+    def abort(self) -> None:
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
 
 
 class AWSS3Connector(BlobStorageConnector):
@@ -160,42 +228,7 @@ class AWSS3Connector(BlobStorageConnector):
         try:
             # Parse URI into bucket and object key
             bucket_name, object_key = self._parse_s3_uri(uri)
-
-            # Check if bucket exists
-            try:
-                self.client.head_bucket(Bucket=bucket_name)
-            except Exception as e:
-                # Check error type to determine if bucket doesn't exist
-                if (
-                    hasattr(e, "response")
-                    and e.response.get("Error", {}).get("Code") == "404"
-                ):
-                    # Create bucket if it doesn't exist
-                    self.log_info(f"Creating bucket: {bucket_name}")
-                    bucket_params = {"Bucket": bucket_name}
-                    if self.region and self.region != "us-east-1":
-                        bucket_params["CreateBucketConfiguration"] = {
-                            "LocationConstraint": self.region
-                        }
-                    try:
-                        self.client.create_bucket(**bucket_params)
-                    except Exception as bucket_error:
-                        return self._handle_provider_error(
-                            "creating",
-                            bucket_name,
-                            bucket_error,
-                            raise_error=True,
-                            resource_type="bucket",
-                        )
-                else:
-                    # Some other error accessing the bucket
-                    return self._handle_provider_error(
-                        "accessing",
-                        bucket_name,
-                        e,
-                        raise_error=True,
-                        resource_type="bucket",
-                    )
+            self._ensure_bucket(bucket_name)
 
             # Put object
             try:
@@ -213,6 +246,138 @@ class AWSS3Connector(BlobStorageConnector):
                 "writing", uri, e, raise_error=True, resource_type="object"
             )
 
+    def _ensure_bucket(self, bucket_name: str) -> None:
+        """Create ``bucket_name`` if it does not exist yet.
+
+        Raises:
+            StorageOperationError: If the bucket can't be accessed or created
+        """
+        try:
+            self.client.head_bucket(Bucket=bucket_name)
+        except Exception as e:
+            # Check error type to determine if bucket doesn't exist
+            if (
+                hasattr(e, "response")
+                and e.response.get("Error", {}).get("Code") == "404"
+            ):
+                # Create bucket if it doesn't exist
+                self.log_info(f"Creating bucket: {bucket_name}")
+                bucket_params = {"Bucket": bucket_name}
+                if self.region and self.region != "us-east-1":
+                    bucket_params["CreateBucketConfiguration"] = {
+                        "LocationConstraint": self.region
+                    }
+                try:
+                    self.client.create_bucket(**bucket_params)
+                except Exception as bucket_error:
+                    self._handle_provider_error(
+                        "creating",
+                        bucket_name,
+                        bucket_error,
+                        raise_error=True,
+                        resource_type="bucket",
+                    )
+            else:
+                # Some other error accessing the bucket
+                self._handle_provider_error(
+                    "accessing",
+                    bucket_name,
+                    e,
+                    raise_error=True,
+                    resource_type="bucket",
+                )
+
+    def get_blob_info(self, uri: str) -> Dict[str, Any]:
+        """
+        Get object size and ETag with a ``HeadObject`` request.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        try:
+            bucket_name, object_key = self._parse_s3_uri(uri)
+            response = self.client.head_object(Bucket=bucket_name, Key=object_key)
+        except Exception as e:
+            if hasattr(e, "response") and e.response.get("Error", {}).get("Code") in (
+                "404",
+                "NoSuchKey",
+            ):
+                e = Exception("Object not found")
+            return self._handle_provider_error(
+                "reading", uri, e, raise_error=True, resource_type="object"
+            )
+        return {
+            "size": response["ContentLength"],
+            "etag": response.get("ETag"),
+            "last_modified": response.get("LastModified"),
+        }
+
+    def iter_blob(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream an object, or its ``[start, end)`` byte range, with a ranged
+        ``GetObject`` -- only the requested bytes cross the network.
+
+        Raises:
+            FileNotFoundError: If the object doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        if end is not None and end <= start:
+            return iter(())
+        try:
+            bucket_name, object_key = self._parse_s3_uri(uri)
+            params = {"Bucket": bucket_name, "Key": object_key}
+            if start or end is not None:
+                last = "" if end is None else str(end - 1)
+                params["Range"] = f"bytes={start}-{last}"
+            response = self.client.get_object(**params)
+        except self.client.exceptions.NoSuchKey:
+            return self._handle_provider_error(
+                "reading",
+                uri,
+                Exception("Object not found"),
+                raise_error=True,
+                resource_type="object",
+            )
+        except (StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "reading", uri, e, raise_error=True, resource_type="object"
+            )
+        return self._iter_body(response["Body"], chunk_size)
+
+    @staticmethod
+    def _iter_body(body: Any, chunk_size: int) -> Iterator[bytes]:
+        try:
+            yield from body.iter_chunks(chunk_size)
+        finally:
+            body.close()
+
+    def start_multipart_upload(self, uri: str) -> MultipartUpload:
+        """
+        Begin an S3 multipart upload (parallel parts, per-part ``ContentMD5``).
+
+        Raises:
+            StorageOperationError: If the bucket can't be accessed or created
+        """
+        try:
+            bucket_name, object_key = self._parse_s3_uri(uri)
+            self._ensure_bucket(bucket_name)
+            return _S3MultipartUpload(self.client, bucket_name, object_key)
+        except (StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "writing", uri, e, raise_error=True, resource_type="object"
+            )
+
     def blob_exists(self, uri: str) -> bool:
         """
         Check if an object exists in S3.
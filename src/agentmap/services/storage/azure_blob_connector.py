@@ -5,10 +5,42 @@ This module provides an Azure-specific implementation of the BlobStorageConnecto
 interface for reading and writing JSON files in Azure Blob Storage.
 """
 
-from typing import Any, Dict
+import asyncio
+import base64
+from typing import Any, AsyncGenerator, Dict, Iterator, List, Optional, Tuple
 
 from agentmap.exceptions import StorageConnectionError, StorageOperationError
 from agentmap.services.storage.base_connector import BlobStorageConnector
+from agentmap.services.storage.blob_streaming import DEFAULT_CHUNK_SIZE, MultipartUpload
+
+
+class _AzureBlockUpload(MultipartUpload):
+    """
+    Block blob upload: parts are staged as blocks in parallel (each with
+    ``validate_content`` so Azure checks its MD5) and committed in order.
+    Uncommitted blocks are garbage-collected by Azure, so abort is a no-op.
+    """
+
+    parallel = True
+
+    def __init__(self, blob_client: Any):
+        self._blob_client = blob_client
+
+    def upload_part(self, part_number: int, data: bytes) -> str:
+        block_id = base64.b64encode(f"{part_number:08d}".encode()).decode()
+        self._blob_client.stage_block(block_id, data, validate_content=True)
+        return block_id
+
+    def complete(self, parts: List[Any]) -> Dict[str, Any]:
+        from azure.storage.blob import BlobBlock
+
+        response = self._blob_client.commit_block_list(
+            [BlobBlock(block_id=block_id) for block_id in parts]
+        )
+        return {"etag": (response or {}).get("etag")}
+
+    def abort(self) -> None:
+        """Uncommitted blocks expire on their own; nothing to delete."""
 
 
 class AzureBlobConnector(BlobStorageConnector):
@@ -34,6 +66,9 @@ class AzureBlobConnector(BlobStorageConnector):
         self.account_name = None
         self.account_key = None
         self.default_container = None
+        # aio clients are bound to the event loop that created them; each is
+        # closed (and its entry dropped) when that loop shuts down
+        self._async_clients: Dict[Any, Tuple[Any, AsyncGenerator[None, None]]] = {}
 
     def _initialize_client(self) -> None:
         """
@@ -218,6 +253,96 @@ class AzureBlobConnector(BlobStorageConnector):
                 "writing", uri, e, raise_error=True, resource_type="blob"
             )
 
+    def _get_blob_client(self, uri: str, create_container: bool = False) -> Any:
+        """Resolve the blob client for ``uri``, optionally creating its container."""
+        container_name, blob_path = self._parse_azure_uri(uri)
+        container_client = self.client.get_container_client(container_name)
+        if create_container:
+            try:
+                container_client.get_container_properties()
+            except Exception:
+                self.log_info(f"Creating container: {container_name}")
+                try:
+                    container_client.create_container()
+                except Exception as e:
+                    self._handle_provider_error(
+                        "creating",
+                        container_name,
+                        e,
+                        raise_error=True,
+                        resource_type="container",
+                    )
+        return container_client.get_blob_client(blob_path)
+
+    def get_blob_info(self, uri: str) -> Dict[str, Any]:
+        """
+        Get blob size and ETag from its properties.
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        try:
+            properties = self._get_blob_client(uri).get_blob_properties()
+        except (StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "accessing", uri, e, raise_error=True, resource_type="blob"
+            )
+        return {
+            "size": properties.size,
+            "etag": properties.etag,
+            "last_modified": properties.last_modified,
+        }
+
+    def iter_blob(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream a blob, or its ``[start, end)`` byte range, with a ranged
+        download. Chunk size follows the client's ``max_chunk_get_size``.
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        if end is not None and end <= start:
+            return iter(())
+        try:
+            length = None if end is None else end - start
+            offset = start if (start or length is not None) else None
+            downloader = self._get_blob_client(uri).download_blob(
+                offset=offset, length=length
+            )
+        except (StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "downloading", uri, e, raise_error=True, resource_type="blob"
+            )
+        return downloader.chunks()
+
+    def start_multipart_upload(self, uri: str) -> MultipartUpload:
+        """
+        Begin a block blob upload (blocks staged in parallel, MD5-validated).
+
+        Raises:
+            StorageOperationError: If the container can't be accessed or created
+        """
+        try:
+            return _AzureBlockUpload(self._get_blob_client(uri, create_container=True))
+        except (StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "writing", uri, e, raise_error=True, resource_type="blob"
+            )
+
     def blob_exists(self, uri: str) -> bool:
         """
         Check if a blob exists in Azure Blob Storage.
@@ -257,6 +382,130 @@ class AzureBlobConnector(BlobStorageConnector):
             self.log_warning(f"Error checking blob existence {uri}: {str(e)}")
             return False
 
+    # ------------------------------------------------------------------
+    # Native async I/O (azure.storage.blob.aio; needs aiohttp)
+    # ------------------------------------------------------------------
+
+    def _create_async_client(self) -> Optional[Any]:
+        """Create an aio client from the sync client's settings, or None."""
+        try:
+            from azure.storage.blob.aio import BlobServiceClient
+        except ImportError:
+            return None
+        self.client  # resolves connection settings
+        if self.connection_string:
+            return BlobServiceClient.from_connection_string(self.connection_string)
+        endpoint = f"https://{self.account_name}.blob.core.windows.net"
+        if self.account_key:
+            return BlobServiceClient(account_url=endpoint, credential=self.account_key)
+        return BlobServiceClient(account_url=f"{endpoint}{self.sas_token}")
+
+    async def _close_with_loop(
+        self, loop: Any, service_client: Any
+    ) -> AsyncGenerator[None, None]:
+        """
+        Suspended until ``loop`` shuts down: ``asyncio.run`` (or any owner
+        calling ``loop.shutdown_asyncgens()``) finalizes it, which closes the
+        client's aiohttp session.
+        """
+        try:
+            yield
+        finally:
+            self._async_clients.pop(loop, None)
+            if service_client is not None:
+                await service_client.close()
+
+    async def _async_service_client(self) -> Optional[Any]:
+        """aio service client for the running loop, or None."""
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None:
+            service_client = self._create_async_client()
+            closer = self._close_with_loop(loop, service_client)
+            await closer.__anext__()
+            entry = self._async_clients[loop] = (service_client, closer)
+        return entry[0]
+
+    async def _async_blob_client(self, uri: str) -> Optional[Any]:
+        """aio blob client for ``uri`` on the running loop, or None."""
+        service_client = await self._async_service_client()
+        if service_client is None:
+            return None
+        container_name, blob_path = self._parse_azure_uri(uri)
+        return service_client.get_blob_client(container_name, blob_path)
+
+    async def aclose(self) -> None:
+        """Close the running loop's aio client now instead of at loop shutdown."""
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+
+    @staticmethod
+    def _is_not_found(error: Exception) -> bool:
+        try:
+            from azure.core.exceptions import ResourceNotFoundError
+        except ImportError:
+            return False
+        return isinstance(error, ResourceNotFoundError)
+
+    async def aread_blob(self, uri: str) -> bytes:
+        """
+        Read a blob with the aio client (thread offload if aio is unavailable).
+
+        Raises:
+            FileNotFoundError: If the container or blob doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        blob_client = await self._async_blob_client(uri)
+        if blob_client is None:
+            return await super().aread_blob(uri)
+        try:
+            downloader = await blob_client.download_blob()
+            return await downloader.readall()
+        except Exception as e:
+            if self._is_not_found(e):
+                raise FileNotFoundError(f"Blob not found: {uri}") from e
+            return self._handle_provider_error(
+                "downloading", uri, e, raise_error=True, resource_type="blob"
+            )
+
+    async def awrite_blob(self, uri: str, data: bytes) -> None:
+        """
+        Write a blob with the aio client, creating its container if missing.
+
+        Raises:
+            StorageOperationError: If the write operation fails
+        """
+        blob_client = await self._async_blob_client(uri)
+        if blob_client is None:
+            return await super().awrite_blob(uri, data)
+        try:
+            try:
+                await blob_client.upload_blob(data, overwrite=True)
+            except Exception as e:
+                if not self._is_not_found(e):
+                    raise
+                container_name, _ = self._parse_azure_uri(uri)
+                self.log_info(f"Creating container: {container_name}")
+                service_client = await self._async_service_client()
+                await service_client.create_container(container_name)
+                await blob_client.upload_blob(data, overwrite=True)
+        except Exception as e:
+            return self._handle_provider_error(
+                "writing", uri, e, raise_error=True, resource_type="blob"
+            )
+
+    async def ablob_exists(self, uri: str) -> bool:
+        """Check blob existence with the aio client."""
+        blob_client = await self._async_blob_client(uri)
+        if blob_client is None:
+            return await super().ablob_exists(uri)
+        try:
+            return await blob_client.exists()
+        except Exception as e:
+            self.log_warning(f"Error checking blob existence {uri}: {str(e)}")
+            return False
+
     def _parse_azure_uri(self, uri: str) -> tuple[str, str]:
         """
         Parse Azure URI into container and blob path.
@@ -5,8 +5,11 @@ This module provides the abstract base class for storage services,
 following the Template Method pattern and established service patterns.
 """
 
+import asyncio
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 from agentmap.services.config.storage_config_service import StorageConfigService
 from agentmap.services.file_path_service import FilePathService
@@ -15,6 +18,12 @@ from agentmap.services.storage.config_loader import ConfigLoaderMixin
 from agentmap.services.storage.error_handling import ErrorHandlerMixin
 from agentmap.services.storage.path_resolver import PathResolverMixin
 from agentmap.services.storage.protocols import StorageService
+from agentmap.services.storage.transaction import (
+    StorageTransaction,
+    activate_transaction,
+    deactivate_transaction,
+    get_active_transaction,
+)
 from agentmap.services.storage.types import (
     StorageResult,
     StorageServiceConfigurationError,
@@ -313,6 +322,62 @@ class BaseStorageService(
             collection, data, document_id, mode, path, **kwargs
         )
 
+    # ------------------------------------------------------------------
+    # Async API
+    #
+    # Defaults offload the sync method (telemetry included) to a worker
+    # thread so the event loop never blocks on file or network I/O.
+    # Backends with a natively async client, or with operations too cheap
+    # to be worth a thread hop, override these.
+    # ------------------------------------------------------------------
+
+    async def aread(
+        self,
+        collection: str,
+        document_id: Optional[str] = None,
+        query: Optional[Dict[str, Any]] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """Async ``read``; runs it in a worker thread unless overridden."""
+        return await self._run_blocking(
+            self.read, collection, document_id, query, path, **kwargs
+        )
+
+    async def awrite(
+        self,
+        collection: str,
+        data: Any,
+        document_id: Optional[str] = None,
+        mode: WriteMode = WriteMode.WRITE,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> StorageResult:
+        """Async ``write``; runs it in a worker thread unless overridden."""
+        return await self._run_blocking(
+            self.write, collection, data, document_id, mode, path, **kwargs
+        )
+
+    async def adelete(
+        self,
+        collection: str,
+        document_id: Optional[str] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> StorageResult:
+        """Async ``delete``; runs it in a worker thread unless overridden."""
+        return await self._run_blocking(
+            self.delete, collection, document_id, path, **kwargs
+        )
+
+    async def aexists(self, collection: str, document_id: Optional[str] = None) -> bool:
+        """Async ``exists``; runs it in a worker thread unless overridden."""
+        return await self._run_blocking(self.exists, collection, document_id)
+
+    async def _run_blocking(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking storage call in the default executor."""
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
     def _read_with_telemetry(
         self,
         collection: str,
@@ -469,44 +534,176 @@ class BaseStorageService(
             Exception: Provider-specific exceptions for deletion failures
         """
 
+    # ------------------------------------------------------------------
+    # Transactions and batch writes
+    #
+    # File-backed services stage reads and writes inside ``transaction()``
+    # and commit each touched file once (see ``transaction.py``).  Services
+    # without staging support run the block's writes directly.
+    # ------------------------------------------------------------------
+
+    #: Whether writes inside ``transaction()`` are staged and committed
+    #: atomically.  Services that set this implement ``_write_staged_file``.
+    supports_transactions: bool = False
+
+    @contextmanager
+    def transaction(self) -> Iterator[Optional[StorageTransaction]]:
+        """
+        Stage writes made in this context and commit them in one I/O pass.
+
+        Inside the block, reads see the staged writes.  On normal exit every
+        touched file is written once and atomically replaced; on an exception
+        nothing is written.  Nested blocks join the outermost transaction.
+        The transaction is scoped to the current thread or asyncio task.
+
+        Yields:
+            The open StorageTransaction, or None when the service does not
+            support transactions (writes then apply immediately)
+        """
+        current = self._current_transaction()
+        if current is not None or not self.supports_transactions:
+            yield current
+            return
+
+        txn = StorageTransaction(self)
+        token = activate_transaction(txn)
+        try:
+            yield txn
+        except BaseException:
+            txn.discard()
+            raise
+        finally:
+            deactivate_transaction(token)
+
+        staged = len(txn.staged_paths)
+        txn.commit(self._write_staged_file)
+        self._logger.debug(
+            f"[{self.provider_name}] Committed transaction ({staged} file(s))"
+        )
+
+    def _current_transaction(self) -> Optional[StorageTransaction]:
+        """The transaction open for this service in the current context."""
+        return get_active_transaction(self)
+
+    def _file_exists(self, file_path: str) -> bool:
+        """``os.path.exists`` as seen from inside the current transaction."""
+        txn = self._current_transaction()
+        if txn is None:
+            return os.path.exists(file_path)
+        return txn.exists(file_path)
+
+    def _remove_file(self, file_path: str) -> None:
+        """``os.remove``, deferred to commit inside a transaction."""
+        txn = self._current_transaction()
+        if txn is None:
+            os.remove(file_path)
+        else:
+            txn.stage_delete(file_path)
+
+    def _write_staged_file(self, file_path: str, content: Any, **options) -> None:
+        """Serialize staged ``content`` to ``file_path`` during commit."""
+        raise NotImplementedError(
+            f"{self.provider_name} storage does not support transactions"
+        )
+
     def batch_write(
         self,
         collection: str,
         data: List[Dict[str, Any]],
         mode: WriteMode = WriteMode.WRITE,
+        id_field: Optional[str] = None,
+        atomic: bool = True,
         **kwargs,
     ) -> StorageResult:
-        """Write multiple documents/records in a batch operation."""
+        """
+        Write multiple documents/records in one transaction.
+
+        Each item goes through ``write()`` inside ``transaction()``, so
+        file-backed services read and rewrite the collection once instead
+        of once per item.
+
+        Args:
+            collection: Collection/table/file identifier
+            data: Items to write
+            mode: Write mode for all items
+            id_field: Item field holding each item's document ID (passed to
+                ``write`` as ``document_id`` and ``id_field``)
+            atomic: Write nothing if any item fails (default); when False,
+                the successful items are committed
+            **kwargs: Passed to every ``write`` call
+
+        Returns:
+            StorageResult whose ``item_results`` holds one result per item
+        """
         self._logger.debug(
             f"[{self.provider_name}] Performing batch write of {len(data)} items"
         )
 
-        total_written = 0
-        errors = []
+        item_results: List[StorageResult] = []
+        errors: List[str] = []
 
-        for i, item in enumerate(data):
-            try:
-                result = self.write(collection, item, mode=mode, **kwargs)
-                if result.success:
-                    total_written += 1
-                else:
-                    errors.append(f"Item {i}: {result.error}")
-            except Exception as e:
-                errors.append(f"Item {i}: {str(e)}")
+        try:
+            with self.transaction() as txn:
+                for i, item in enumerate(data):
+                    result = self._write_batch_item(
+                        collection, item, mode, id_field, **kwargs
+                    )
+                    item_results.append(result)
+                    if not result.success:
+                        errors.append(f"Item {i}: {result.error}")
+                if errors and atomic and txn is not None:
+                    txn.discard()
+        except Exception as e:
+            self._logger.error(
+                f"[{self.provider_name}] Batch commit failed for {collection}: {e}"
+            )
+            return self._create_error_result(
+                "batch_write",
+                f"Batch commit failed: {e}",
+                collection=collection,
+                total_affected=0,
+                item_results=item_results,
+            )
 
+        written = len(item_results) - len(errors)
         if errors:
             error_msg = "; ".join(errors[:5])
             if len(errors) > 5:
                 error_msg += f" (and {len(errors) - 5} more errors)"
+            rolled_back = atomic and self.supports_transactions
+            if rolled_back:
+                error_msg = f"Batch rolled back, nothing written: {error_msg}"
 
             return self._create_error_result(
                 "batch_write",
                 error_msg,
                 collection=collection,
-                total_affected=total_written,
+                total_affected=0 if rolled_back else written,
                 error_count=len(errors),
+                item_results=item_results,
             )
 
         return self._create_success_result(
-            "batch_write", collection=collection, total_affected=total_written
+            "batch_write",
+            collection=collection,
+            total_affected=written,
+            item_results=item_results,
         )
+
+    def _write_batch_item(
+        self,
+        collection: str,
+        item: Any,
+        mode: WriteMode,
+        id_field: Optional[str],
+        **kwargs,
+    ) -> StorageResult:
+        """Write one ``batch_write`` item, turning exceptions into results."""
+        if id_field is not None and isinstance(item, dict):
+            kwargs["id_field"] = id_field
+            if item.get(id_field) is not None:
+                kwargs["document_id"] = str(item[id_field])
+        try:
+            return self.write(collection, item, mode=mode, **kwargs)
+        except Exception as e:
+            return self._create_error_result("write", str(e), collection=collection)
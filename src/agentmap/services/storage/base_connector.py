@@ -7,12 +7,20 @@ allowing JSON agents to seamlessly work with various cloud providers.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
 from urllib.parse import unquote, urlparse
 
 from agentmap.exceptions import StorageConnectionError, StorageOperationError
+from agentmap.services.storage.blob_streaming import (
+    DEFAULT_CHUNK_SIZE,
+    BufferedMultipartUpload,
+    MultipartUpload,
+    slice_chunks,
+)
 
 
 class BlobStorageConnector(ABC):
@@ -105,6 +113,76 @@ class BlobStorageConnector(ABC):
             True if the blob exists, False otherwise
         """
 
+    def get_blob_info(self, uri: str) -> Dict[str, Any]:
+        """
+        Get blob metadata without transferring its content.
+
+        Args:
+            uri: URI of the blob
+
+        Returns:
+            Dictionary with at least ``size`` (bytes) and ``etag`` (an opaque
+            version token that changes whenever the content changes)
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+
+        Note:
+            Default implementation downloads the blob and derives the ETag
+            from its MD5. Subclasses should override with a metadata request.
+        """
+        data = self.read_blob(uri)
+        return {
+            "size": len(data),
+            "etag": hashlib.md5(data, usedforsecurity=False).hexdigest(),
+        }
+
+    def iter_blob(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream a blob, or its ``[start, end)`` byte range, in chunks.
+
+        Args:
+            uri: URI of the blob to read
+            start: First byte offset to return
+            end: Byte offset to stop before (None for end of blob)
+            chunk_size: Preferred chunk size in bytes
+
+        Returns:
+            Iterator of byte chunks
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+            StorageOperationError: For other storage-related errors
+
+        Note:
+            Default implementation reads the whole blob and slices it.
+            Subclasses should override with ranged/streaming downloads.
+        """
+        return slice_chunks(self.read_blob(uri), start, end, chunk_size)
+
+    def start_multipart_upload(self, uri: str) -> MultipartUpload:
+        """
+        Begin a multipart upload to ``uri``.
+
+        Args:
+            uri: URI where the blob should be written
+
+        Returns:
+            Upload session; nothing is visible at ``uri`` until it completes
+
+        Note:
+            Default implementation buffers parts in memory and calls
+            ``write_blob`` on completion. Subclasses should override with the
+            provider's native multipart/block upload.
+        """
+        return BufferedMultipartUpload(lambda data: self.write_blob(uri, data))
+
     def list_blobs(self, prefix: str, **kwargs) -> list[str]:
         """
         List blobs with given prefix.
@@ -141,6 +219,27 @@ class BlobStorageConnector(ABC):
             f"delete_blob not implemented for {self.__class__.__name__}"
         )
 
+    # ------------------------------------------------------------------
+    # Async API -- defaults run the sync method in a worker thread;
+    # connectors with an async SDK override them with native calls.
+    # ------------------------------------------------------------------
+
+    async def aread_blob(self, uri: str) -> bytes:
+        """Async ``read_blob``."""
+        return await asyncio.to_thread(self.read_blob, uri)
+
+    async def awrite_blob(self, uri: str, data: bytes) -> None:
+        """Async ``write_blob``."""
+        await asyncio.to_thread(self.write_blob, uri, data)
+
+    async def ablob_exists(self, uri: str) -> bool:
+        """Async ``blob_exists``."""
+        return await asyncio.to_thread(self.blob_exists, uri)
+
+    async def adelete_blob(self, uri: str) -> None:
+        """Async ``delete_blob``."""
+        await asyncio.to_thread(self.delete_blob, uri)
+
     def parse_uri(self, uri: str) -> Dict[str, str]:
         """
         Parse a blob URI into components.
@@ -0,0 +1,195 @@
+"""
+Local disk cache for blob reads, keyed by ETag.
+
+A full read of a blob is teed into ``<directory>/<key>.data`` while the
+caller consumes it; ``<key>.json`` records the blob's ETag, size and
+SHA-256.  A later read is served from disk when the provider still reports
+the same ETag -- one metadata request instead of a download.  Within
+``revalidate_seconds`` of the last validation even that request is skipped,
+so repeated reads inside one workflow run cost no network at all.
+
+Writes and deletes made through ``BlobStorageService`` invalidate the entry
+immediately; changes made by other writers are noticed at the next
+revalidation.  Entries are evicted least-recently-used once the cache
+exceeds ``max_bytes``.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from agentmap.services.storage.blob_streaming import DEFAULT_CHUNK_SIZE, iter_file_range
+
+DEFAULT_CACHE_DIRECTORY = "agentmap_data/cache/blob"
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_REVALIDATE_SECONDS = 30.0
+
+
+class BlobDiskCache:
+    """ETag-validated on-disk copies of whole blobs (thread-safe)."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIRECTORY,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        revalidate_seconds: float = DEFAULT_REVALIDATE_SECONDS,
+    ):
+        self.directory = directory
+        self.max_bytes = int(max_bytes)
+        self.revalidate_seconds = float(revalidate_seconds)
+        self._validated: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, uri: str) -> tuple:
+        key = hashlib.sha256(uri.encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, key)
+        return base + ".data", base + ".json"
+
+    def _load_meta(self, uri: str) -> Optional[Dict[str, Any]]:
+        data_path, meta_path = self._paths(uri)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if meta.get("uri") != uri or not os.path.exists(data_path):
+            return None
+        return meta
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get_fresh(self, uri: str) -> Optional[Dict[str, Any]]:
+        """Entry validated within ``revalidate_seconds``, with no provider call."""
+        with self._lock:
+            validated_at = self._validated.get(uri)
+        if validated_at is None:
+            return None
+        if time.monotonic() - validated_at >= self.revalidate_seconds:
+            return None
+        return self._load_meta(uri)
+
+    def lookup(self, uri: str, etag: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Entry for ``uri`` if it was cached at ``etag``; marks it validated."""
+        meta = self._load_meta(uri)
+        if meta is None or not etag or meta.get("etag") != etag:
+            return None
+        with self._lock:
+            self._validated[uri] = time.monotonic()
+        return meta
+
+    def iter_cached(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a cached blob (or byte range) from disk.
+
+        Raises:
+            OSError: If the entry was evicted since it was looked up
+        """
+        data_path, _ = self._paths(uri)
+        handle = open(data_path, "rb")
+        os.utime(data_path)  # LRU: eviction removes the least recently read
+        self._count("hits")
+        return iter_file_range(handle, start, end, chunk_size)
+
+    def tee(
+        self, uri: str, etag: Optional[str], chunks: Iterable[bytes]
+    ) -> Iterator[bytes]:
+        """Pass ``chunks`` through, storing them once fully consumed.
+
+        A stream that is abandoned or fails part-way leaves no entry.
+        """
+        self._count("misses")
+        if not etag:
+            yield from chunks
+            return
+        data_path, meta_path = self._paths(uri)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+        hasher = hashlib.sha256()
+        size = 0
+        committed = False
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in chunks:
+                    tmp.write(chunk)
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    yield chunk
+            # Drop the old metadata first so no reader pairs it with new data.
+            self._remove(meta_path)
+            os.replace(tmp_path, data_path)
+            committed = True
+            meta = {
+                "uri": uri,
+                "etag": etag,
+                "size": size,
+                "sha256": hasher.hexdigest(),
+                "stored_at": time.time(),
+            }
+            meta_tmp = meta_path + ".tmp"
+            with open(meta_tmp, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            os.replace(meta_tmp, meta_path)
+            with self._lock:
+                self._validated[uri] = time.monotonic()
+                self._stats["stores"] += 1
+        finally:
+            if not committed and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._evict()
+
+    def invalidate(self, uri: str) -> None:
+        """Drop the cached copy of ``uri`` (if any)."""
+        with self._lock:
+            self._validated.pop(uri, None)
+        for path in self._paths(uri):
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Remove every cached blob."""
+        with self._lock:
+            self._validated.clear()
+        for name in os.listdir(self.directory):
+            if name.endswith((".data", ".json")):
+                self._remove(os.path.join(self.directory, name))
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".data"):
+                st = entry.stat()
+                entries.append((st.st_mtime, st.st_size, entry.path))
+                total += st.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            self._remove(path[: -len(".data")] + ".json")
+            self._remove(path)
+            self._count("evictions")
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss/store/eviction counters."""
+        with self._lock:
+            return dict(self._stats)
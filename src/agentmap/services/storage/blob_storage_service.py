@@ -7,10 +7,24 @@ and local file storage. It follows AgentMap's service-based architecture pattern
 and leverages existing blob connector infrastructure.
 """
 
+import asyncio
 import json
-from typing import Any, Callable, Dict, List, Optional, Type
+import shutil
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from agentmap.exceptions import (
+    StorageChecksumError,
     StorageConnectionError,
     StorageOperationError,
 )
@@ -25,6 +39,19 @@ from agentmap.services.storage.base_connector import (
     get_connector_for_uri,
     normalize_json_uri,
 )
+from agentmap.services.storage.blob_cache import (
+    DEFAULT_CACHE_DIRECTORY,
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_REVALIDATE_SECONDS,
+    BlobDiskCache,
+)
+from agentmap.services.storage.blob_streaming import (
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PART_SIZE,
+    BlobReader,
+    BlobWriter,
+)
 
 
 class BlobStorageService(BlobStorageServiceProtocol):
@@ -56,6 +83,8 @@ class BlobStorageService(BlobStorageServiceProtocol):
         self._available_providers: Dict[str, bool] = {}
         self._provider_factories: Dict[str, Type[BlobStorageConnector]] = {}
         self._initialize_provider_registry()
+        self._streaming = self._config_section("streaming")
+        self._cache = self._create_cache()
         self._logger.info("BlobStorageService initialized")
 
     def _load_blob_config(self) -> Dict[str, Any]:
@@ -68,6 +97,29 @@ class BlobStorageService(BlobStorageServiceProtocol):
             self._logger.warning(f"Failed to load blob storage config: {e}")
             return {}
 
+    def _config_section(self, name: str) -> Dict[str, Any]:
+        section = self._config.get(name) if isinstance(self._config, dict) else None
+        return section if isinstance(section, dict) else {}
+
+    def _create_cache(self) -> Optional[BlobDiskCache]:
+        """Create the ETag disk cache when ``blob.cache.enabled`` is set."""
+        cfg = self._config_section("cache")
+        if not cfg.get("enabled", False):
+            return None
+        try:
+            cache = BlobDiskCache(
+                directory=cfg.get("directory", DEFAULT_CACHE_DIRECTORY),
+                max_bytes=cfg.get("max_bytes", DEFAULT_CACHE_MAX_BYTES),
+                revalidate_seconds=cfg.get(
+                    "revalidate_seconds", DEFAULT_REVALIDATE_SECONDS
+                ),
+            )
+            self._logger.debug(f"Blob disk cache enabled at {cache.directory}")
+            return cache
+        except Exception as e:
+            self._logger.warning(f"Blob disk cache disabled: {e}")
+            return None
+
     def _initialize_provider_registry(self) -> None:
         """Initialize the provider registry with available connectors."""
         self._register_cloud_provider(
@@ -222,11 +274,15 @@ class BlobStorageService(BlobStorageServiceProtocol):
         return "file"
 
     def read_blob(self, uri: str, **kwargs) -> bytes:
-        """Read blob from storage."""
+        """Read blob from storage (through the disk cache when enabled)."""
         self._logger.debug(f"Reading blob: {uri}")
         try:
-            connector = self._get_connector(uri)
-            data = connector.read_blob(uri)
+            if self._cache is not None:
+                with self.open_read(uri) as reader:
+                    data = reader.readall()
+            else:
+                connector = self._get_connector(uri)
+                data = connector.read_blob(uri)
             self._logger.debug(f"Successfully read blob: {uri} ({len(data)} bytes)")
             return data
         except FileNotFoundError:
@@ -240,6 +296,7 @@ class BlobStorageService(BlobStorageServiceProtocol):
         self._logger.debug(f"Writing blob: {uri} ({len(data)} bytes)")
         try:
             connector = self._get_connector(uri)
+            self._invalidate_cached(uri)
             connector.write_blob(uri, data)
             result = {
                 "success": True,
@@ -286,6 +343,7 @@ class BlobStorageService(BlobStorageServiceProtocol):
         self._logger.debug(f"Deleting blob: {uri}")
         try:
             connector = self._get_connector(uri)
+            self._invalidate_cached(uri)
             if hasattr(connector, "delete_blob"):
                 connector.delete_blob(uri)
             else:
@@ -301,6 +359,307 @@ class BlobStorageService(BlobStorageServiceProtocol):
             self._logger.error(f"Failed to delete blob {uri}: {e}")
             raise StorageOperationError(f"Failed to delete blob: {str(e)}") from e
 
+    # ------------------------------------------------------------------
+    # Async API -- native where the connector has an async SDK (Azure aio),
+    # otherwise the connector's blocking call runs in a worker thread.
+    # ------------------------------------------------------------------
+
+    async def aread_blob(self, uri: str, **kwargs) -> bytes:
+        """Async ``read_blob``."""
+        if self._cache is not None:
+            # The disk cache is blocking file I/O; keep it off the loop.
+            return await asyncio.to_thread(self.read_blob, uri, **kwargs)
+        self._logger.debug(f"Reading blob (async): {uri}")
+        try:
+            data = await self._get_connector(uri).aread_blob(uri)
+            self._logger.debug(f"Successfully read blob: {uri} ({len(data)} bytes)")
+            return data
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Failed to read blob {uri}: {e}")
+            raise StorageOperationError(f"Failed to read blob: {str(e)}") from e
+
+    async def awrite_blob(self, uri: str, data: bytes, **kwargs) -> Dict[str, Any]:
+        """Async ``write_blob``."""
+        self._logger.debug(f"Writing blob (async): {uri} ({len(data)} bytes)")
+        try:
+            connector = self._get_connector(uri)
+            self._invalidate_cached(uri)
+            await connector.awrite_blob(uri, data)
+            self._logger.debug(f"Successfully wrote blob: {uri}")
+            return {
+                "success": True,
+                "uri": uri,
+                "size": len(data),
+                "provider": self._get_provider_from_uri(uri),
+            }
+        except Exception as e:
+            self._logger.error(f"Failed to write blob {uri}: {e}")
+            raise StorageOperationError(f"Failed to write blob: {str(e)}") from e
+
+    async def ablob_exists(self, uri: str) -> bool:
+        """Async ``blob_exists``."""
+        try:
+            return await self._get_connector(uri).ablob_exists(uri)
+        except Exception as e:
+            self._logger.warning(f"Error checking blob existence {uri}: {e}")
+            return False
+
+    async def adelete_blob(self, uri: str, **kwargs) -> Dict[str, Any]:
+        """Async ``delete_blob``."""
+        self._logger.debug(f"Deleting blob (async): {uri}")
+        try:
+            connector = self._get_connector(uri)
+            self._invalidate_cached(uri)
+            await connector.adelete_blob(uri)
+            self._logger.debug(f"Successfully deleted blob: {uri}")
+            return {
+                "success": True,
+                "uri": uri,
+                "provider": self._get_provider_from_uri(uri),
+            }
+        except Exception as e:
+            self._logger.error(f"Failed to delete blob {uri}: {e}")
+            raise StorageOperationError(f"Failed to delete blob: {str(e)}") from e
+
+    # ------------------------------------------------------------------
+    # Streaming and ranged I/O
+    # ------------------------------------------------------------------
+
+    def get_blob_info(self, uri: str) -> Dict[str, Any]:
+        """Get blob size and ETag without downloading it."""
+        try:
+            return self._get_connector(uri).get_blob_info(uri)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Failed to get blob info {uri}: {e}")
+            raise StorageOperationError(f"Failed to get blob info: {str(e)}") from e
+
+    def open_read(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        *,
+        chunk_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> BlobReader:
+        """
+        Open a blob, or its ``[start, end)`` byte range, for streaming reads.
+
+        Returns a read-only file object (``read``, ``readinto``, ``readline``,
+        ``iter_chunks()``); close it (or use ``with``) to release the
+        underlying connection. Only the requested range is transferred.
+
+        With ``blob.cache.enabled``, full reads are stored on local disk keyed
+        by the blob's ETag and later reads -- full or ranged -- are served
+        from disk while the ETag is unchanged.
+
+        Args:
+            uri: URI of the blob to read
+            start: First byte offset
+            end: Byte offset to stop before (None for end of blob)
+            chunk_size: Transfer chunk size (default ``blob.streaming.chunk_size``)
+            expected_sha256: Hex SHA-256 of the bytes being read; a mismatch
+                raises ``StorageChecksumError`` at end of stream
+            use_cache: Set False to bypass the disk cache for this read
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+            StorageOperationError: For other storage errors
+        """
+        chunk_size = chunk_size or self._streaming.get("chunk_size", DEFAULT_CHUNK_SIZE)
+        self._logger.debug(f"Opening blob for read: {uri} [{start}:{end}]")
+        try:
+            connector = self._get_connector(uri)
+            cache = self._cache if use_cache else None
+            if cache is not None:
+                reader = self._open_cached(
+                    connector, cache, uri, start, end, chunk_size, expected_sha256
+                )
+                if reader is not None:
+                    return reader
+            return BlobReader(
+                connector.iter_blob(uri, start, end, chunk_size),
+                uri=uri,
+                expected_sha256=expected_sha256,
+            )
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            self._logger.error(f"Failed to open blob {uri}: {e}")
+            raise StorageOperationError(f"Failed to read blob: {str(e)}") from e
+
+    def _open_cached(
+        self,
+        connector: BlobStorageConnector,
+        cache: BlobDiskCache,
+        uri: str,
+        start: int,
+        end: Optional[int],
+        chunk_size: int,
+        expected_sha256: Optional[str],
+    ) -> Optional[BlobReader]:
+        """Serve from the disk cache, or tee a full read into it.
+
+        Returns None for a ranged read of an uncached blob (a partial body
+        can't be cached), leaving the caller to stream it directly.
+        """
+        meta = cache.get_fresh(uri)
+        info = None
+        if meta is None:
+            info = connector.get_blob_info(uri)
+            meta = cache.lookup(uri, info.get("etag"))
+        if meta is not None:
+            try:
+                chunks = cache.iter_cached(uri, start, end, chunk_size)
+            except OSError:
+                meta = None  # evicted since lookup; fall through to download
+            else:
+                self._logger.debug(f"Blob cache hit: {uri}")
+                return BlobReader(
+                    chunks,
+                    uri=uri,
+                    size=meta["size"],
+                    etag=meta["etag"],
+                    expected_sha256=expected_sha256,
+                )
+        if start or end is not None:
+            return None
+        info = info or connector.get_blob_info(uri)
+        return BlobReader(
+            cache.tee(
+                uri, info.get("etag"), connector.iter_blob(uri, 0, None, chunk_size)
+            ),
+            uri=uri,
+            size=info.get("size"),
+            etag=info.get("etag"),
+            expected_sha256=expected_sha256,
+        )
+
+    def iter_blob(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Stream a blob (or byte range) as chunks; see ``open_read``."""
+        reader = self.open_read(uri, start, end, **kwargs)
+        try:
+            yield from reader.iter_chunks()
+        finally:
+            reader.close()
+
+    def read_range(self, uri: str, start: int, end: Optional[int] = None) -> bytes:
+        """Read the ``[start, end)`` byte range of a blob."""
+        with self.open_read(uri, start, end) as reader:
+            return reader.readall()
+
+    def open_write(
+        self,
+        uri: str,
+        *,
+        part_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> BlobWriter:
+        """
+        Open a blob for streaming writes.
+
+        Returns a write-only file object backed by the provider's multipart
+        upload (S3 multipart, Azure staged blocks, GCS resumable upload,
+        local temp file + rename). Parts of ``part_size`` bytes are uploaded
+        as they fill -- up to ``max_concurrency`` at once where the provider
+        allows -- so memory stays bounded. Nothing is visible at ``uri``
+        until ``close()``; leaving a ``with`` block on an exception aborts
+        the upload. After ``close()``, ``writer.result`` holds the size,
+        SHA-256, part count and ETag (when reported).
+
+        Raises:
+            StorageOperationError: If the upload can't be started
+        """
+        self._logger.debug(f"Opening blob for write: {uri}")
+        try:
+            connector = self._get_connector(uri)
+            upload = connector.start_multipart_upload(uri)
+        except Exception as e:
+            self._logger.error(f"Failed to open blob {uri} for write: {e}")
+            raise StorageOperationError(f"Failed to write blob: {str(e)}") from e
+        self._invalidate_cached(uri)
+        return BlobWriter(
+            upload,
+            uri=uri,
+            part_size=part_size or self._streaming.get("part_size", DEFAULT_PART_SIZE),
+            max_concurrency=max_concurrency
+            or self._streaming.get("max_concurrency", DEFAULT_MAX_CONCURRENCY),
+            on_complete=lambda _result: self._invalidate_cached(uri),
+        )
+
+    def write_stream(
+        self,
+        uri: str,
+        source: Union[BinaryIO, Iterable[bytes]],
+        *,
+        expected_sha256: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Stream a file object or an iterable of byte chunks to a blob.
+
+        Args:
+            uri: URI where the blob should be written
+            source: Readable binary file object, or iterable of ``bytes``
+            expected_sha256: Hex SHA-256 the written content must match; on
+                mismatch the upload is aborted and nothing is committed
+            **kwargs: ``part_size`` / ``max_concurrency`` for ``open_write``
+
+        Returns:
+            Write result with ``size``, ``sha256``, ``parts`` and ``etag``
+
+        Raises:
+            StorageChecksumError: If ``expected_sha256`` doesn't match
+            StorageOperationError: If the write fails
+        """
+        writer = self.open_write(uri, **kwargs)
+        try:
+            if hasattr(source, "read"):
+                shutil.copyfileobj(source, writer, writer.part_size)
+            else:
+                for chunk in source:
+                    writer.write(chunk)
+            if expected_sha256:
+                writer.verify_sha256(expected_sha256)
+            writer.close()
+        except BaseException as e:
+            writer.abort()
+            if isinstance(e, (StorageOperationError, StorageChecksumError)) or not (
+                isinstance(e, Exception)
+            ):
+                raise
+            self._logger.error(f"Failed to stream blob {uri}: {e}")
+            raise StorageOperationError(f"Failed to write blob: {str(e)}") from e
+        self._logger.debug(
+            f"Streamed blob: {uri} ({writer.result['size']} bytes, "
+            f"{writer.result['parts']} parts)"
+        )
+        return {
+            "success": True,
+            "uri": uri,
+            "provider": self._get_provider_from_uri(uri),
+            **writer.result,
+        }
+
+    def _invalidate_cached(self, uri: str) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(uri)
+
+    def get_cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Disk cache hit/miss counters, or None when the cache is disabled."""
+        return self._cache.get_stats() if self._cache is not None else None
+
     def read_json(self, uri: str, **kwargs) -> Any:
         """Read JSON data from blob storage."""
         uri = normalize_json_uri(uri)
@@ -0,0 +1,387 @@
+"""
+Streaming primitives shared by the blob storage connectors.
+
+``BlobStorageConnector.read_blob``/``write_blob`` move whole ``bytes``
+objects.  The helpers here let connectors expose the same objects as
+chunk iterators (optionally byte-ranged) and as multipart uploads, and let
+``BlobStorageService`` wrap both in file-like objects:
+
+- ``BlobReader`` -- a read-only ``io.RawIOBase`` over a chunk iterator that
+  hashes what it reads and can verify a SHA-256 at end of stream.
+- ``BlobWriter`` -- a write-only file object that cuts writes into parts and
+  hands them to a ``MultipartUpload``, uploading up to ``max_concurrency``
+  parts at once when the provider allows parallel parts.
+- ``MultipartUpload`` -- the per-provider upload session contract, with
+  ``BufferedMultipartUpload`` as the whole-object fallback.
+
+Ranges follow Python slice semantics: ``start`` inclusive, ``end``
+exclusive, ``end=None`` meaning "to the end of the blob".
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+from abc import ABC, abstractmethod
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional
+
+from agentmap.exceptions import StorageChecksumError, StorageOperationError
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def slice_chunks(
+    data: bytes, start: int = 0, end: Optional[int] = None, chunk_size: int = 0
+) -> Iterator[bytes]:
+    """Yield ``data[start:end]`` in ``chunk_size`` pieces (one piece if 0)."""
+    view = memoryview(data)[start:end]
+    step = chunk_size or len(view) or 1
+    for offset in range(0, len(view), step):
+        yield bytes(view[offset : offset + step])
+
+
+def range_length(start: int, end: Optional[int], size: int) -> int:
+    """Number of bytes a ``[start, end)`` range covers in a blob of ``size``."""
+    stop = size if end is None else min(end, size)
+    return max(0, stop - start)
+
+
+def iter_file_range(
+    handle: BinaryIO, start: int, end: Optional[int], chunk_size: int
+) -> Iterator[bytes]:
+    """Yield ``[start, end)`` of an open binary file, closing it when done."""
+    with handle:
+        handle.seek(start)
+        remaining = None if end is None else max(0, end - start)
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = handle.read(size)
+            if not chunk:
+                return
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
+
+
+class BlobReader(io.RawIOBase):
+    """
+    Read-only file object over an iterator of byte chunks.
+
+    Supports ``read``/``readinto``/``readline`` (so it can be wrapped in
+    ``io.BufferedReader`` or ``io.TextIOWrapper``) and ``iter_chunks()`` for
+    zero-copy chunk streaming.  Every byte read is fed to a SHA-256; when
+    ``expected_sha256`` is given a mismatch at end of stream raises
+    ``StorageChecksumError``.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        uri: str = "",
+        size: Optional[int] = None,
+        etag: Optional[str] = None,
+        expected_sha256: Optional[str] = None,
+    ):
+        super().__init__()
+        self.uri = uri
+        self.size = size
+        self.etag = etag
+        self._chunks = iter(chunks)
+        self._buffer = memoryview(b"")
+        self._hasher = hashlib.sha256()
+        self._expected = expected_sha256.lower() if expected_sha256 else None
+        self._exhausted = False
+
+    def readable(self) -> bool:
+        return True
+
+    @property
+    def sha256(self) -> Optional[str]:
+        """Hex SHA-256 of the bytes read, once the stream is exhausted."""
+        return self._hasher.hexdigest() if self._exhausted else None
+
+    def _next_chunk(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._hasher.update(chunk)
+                self._buffer = memoryview(chunk)
+                return True
+        self._finish()
+        return False
+
+    def _finish(self) -> None:
+        if self._exhausted:
+            return
+        self._exhausted = True
+        actual = self._hasher.hexdigest()
+        if self._expected and actual != self._expected:
+            raise StorageChecksumError(
+                f"Checksum mismatch reading {self.uri or 'blob'}: "
+                f"expected sha256 {self._expected}, got {actual}",
+                operation="read",
+                collection=self.uri or None,
+            )
+
+    def readinto(self, b) -> int:
+        if self.closed:
+            raise ValueError("I/O operation on closed blob reader")
+        filled = 0
+        while filled < len(b):
+            if not self._buffer and (self._exhausted or not self._next_chunk()):
+                break
+            count = min(len(b) - filled, len(self._buffer))
+            b[filled : filled + count] = self._buffer[:count]
+            self._buffer = self._buffer[count:]
+            filled += count
+        return filled
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the remaining content chunk by chunk (verifying at the end)."""
+        if self._buffer:
+            pending, self._buffer = bytes(self._buffer), memoryview(b"")
+            yield pending
+        while not self._exhausted and self._next_chunk():
+            pending, self._buffer = bytes(self._buffer), memoryview(b"")
+            yield pending
+
+    def close(self) -> None:
+        if not self.closed:
+            close = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()  # release the provider stream / cache file early
+        super().close()
+
+
+class MultipartUpload(ABC):
+    """
+    One in-progress upload session.
+
+    ``upload_part`` is called with 1-based part numbers; when ``parallel`` is
+    True parts may arrive concurrently and out of order, otherwise they are
+    sent sequentially in order.  ``complete`` receives the per-part tokens
+    in part order and returns provider metadata (at least ``etag`` when
+    known).
+    """
+
+    #: Parts may be uploaded concurrently.
+    parallel: bool = False
+    #: Provider minimum for every part but the last (e.g. 5 MiB on S3).
+    min_part_size: int = 0
+
+    @abstractmethod
+    def upload_part(self, part_number: int, data: bytes) -> Any:
+        """Upload one part and return the token ``complete`` needs for it."""
+
+    @abstractmethod
+    def complete(self, parts: List[Any]) -> Dict[str, Any]:
+        """Commit the uploaded parts as the final blob."""
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Discard the uploaded parts; the target blob is left untouched."""
+
+    def upload_single(self, data: bytes) -> Dict[str, Any]:
+        """Upload a blob that fits in one part.
+
+        Providers with a cheaper single-request upload (e.g. S3 ``PutObject``)
+        override this to skip the multipart session entirely.
+        """
+        return self.complete([self.upload_part(1, data)])
+
+
+class BufferedMultipartUpload(MultipartUpload):
+    """Fallback upload for connectors without native multipart support.
+
+    Parts are held in memory and written with one ``write_blob`` call on
+    ``complete`` -- streaming callers keep working, without the memory win.
+    """
+
+    def __init__(self, write_fn: Callable[[bytes], Any]):
+        self._write_fn = write_fn
+        self._parts: Dict[int, bytes] = {}
+
+    def upload_part(self, part_number: int, data: bytes) -> int:
+        self._parts[part_number] = data
+        return part_number
+
+    def complete(self, parts: List[Any]) -> Dict[str, Any]:
+        self._write_fn(b"".join(self._parts[number] for number in parts))
+        self._parts.clear()
+        return {}
+
+    def abort(self) -> None:
+        self._parts.clear()
+
+
+class BlobWriter:
+    """
+    Write-only file object that streams into a ``MultipartUpload``.
+
+    Writes are cut into ``part_size`` parts (raised to the provider's
+    ``min_part_size``).  With a parallel-capable upload at most
+    ``max_concurrency`` parts are in flight, so memory stays bounded at
+    roughly ``(max_concurrency + 1) * part_size`` whatever the blob size.
+    ``close()`` commits the upload and sets ``result``; leaving a ``with``
+    block on an exception -- or calling ``abort()`` -- discards it.
+    """
+
+    def __init__(
+        self,
+        upload: MultipartUpload,
+        *,
+        uri: str = "",
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        on_complete: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ):
+        self.uri = uri
+        self.result: Optional[Dict[str, Any]] = None
+        self._upload = upload
+        self._part_size = max(int(part_size), upload.min_part_size, 1)
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._on_complete = on_complete
+        self._buffer = bytearray()
+        self._hasher = hashlib.sha256()
+        self._size = 0
+        self._parts: List[Any] = []
+        self._futures: Dict[Future, int] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def part_size(self) -> int:
+        return self._part_size
+
+    def verify_sha256(self, expected: str) -> None:
+        """Check everything written so far against ``expected`` (hex SHA-256).
+
+        Call before ``close()`` so a mismatch can abort instead of commit.
+
+        Raises:
+            StorageChecksumError: If the digests differ
+        """
+        actual = self._hasher.hexdigest()
+        if actual != expected.lower():
+            raise StorageChecksumError(
+                f"Checksum mismatch writing {self.uri or 'blob'}: "
+                f"expected sha256 {expected.lower()}, got {actual}",
+                operation="write",
+                collection=self.uri or None,
+            )
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        if self._closed:
+            raise ValueError("I/O operation on closed blob writer")
+        view = memoryview(data).cast("B")
+        self._hasher.update(view)
+        self._size += len(view)
+        self._buffer += view
+        while len(self._buffer) >= self._part_size:
+            part = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit(part)
+        return len(view)
+
+    def flush(self) -> None:
+        """Parts are uploaded as they fill; nothing to flush early."""
+
+    def _submit(self, data: bytes) -> None:
+        self._parts.append(None)
+        number = len(self._parts)
+        if not self._upload.parallel or self._max_concurrency == 1:
+            self._parts[number - 1] = self._upload.upload_part(number, data)
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency,
+                thread_name_prefix="agentmap-blob-upload",
+            )
+        while len(self._futures) >= self._max_concurrency:
+            self._drain(FIRST_COMPLETED)
+        future = self._executor.submit(self._upload.upload_part, number, data)
+        self._futures[future] = number
+
+    def _drain(self, return_when: str = ALL_COMPLETED) -> None:
+        done, _ = wait(list(self._futures), return_when=return_when)
+        for future in done:
+            number = self._futures.pop(future)
+            self._parts[number - 1] = future.result()  # re-raises part errors
+
+    def close(self) -> None:
+        """Upload the final part and commit the blob."""
+        if self._closed:
+            return
+        try:
+            if not self._parts:
+                data = bytes(self._buffer)
+                self._buffer.clear()
+                metadata = self._upload.upload_single(data)
+                self._parts.append(None)
+            else:
+                if self._buffer:
+                    self._submit(bytes(self._buffer))
+                    self._buffer.clear()
+                self._drain()
+                metadata = self._upload.complete(self._parts)
+        except BaseException:
+            self.abort()
+            raise
+        self._shutdown()
+        self._closed = True
+        self.result = {
+            **(metadata or {}),
+            "size": self._size,
+            "sha256": self._hasher.hexdigest(),
+            "parts": len(self._parts),
+        }
+        if self._on_complete is not None:
+            self._on_complete(self.result)
+
+    def abort(self) -> None:
+        """Discard everything uploaded so far."""
+        if self._closed:
+            return
+        self._closed = True
+        for future in self._futures:
+            future.cancel()
+        self._shutdown()
+        try:
+            self._upload.abort()
+        except Exception as e:
+            raise StorageOperationError(
+                f"Failed to abort upload to {self.uri or 'blob'}: {e}",
+                operation="write",
+                collection=self.uri or None,
+            ) from e
+
+    def _shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._futures.clear()
+
+    def __enter__(self) -> "BlobWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -19,6 +19,7 @@ Refactoring Note:
 - CSVPathResolver: File path resolution logic
 """
 
+import io
 import os
 from typing import Any, Dict, List, Optional
 
@@ -50,6 +51,8 @@ class CSVStorageService(BaseStorageService):
     - Follows configuration architecture patterns from docs/contributing/architecture/configuration-patterns.md
     """
 
+    supports_transactions = True
+
     def __init__(
         self,
         provider_name: str,
@@ -237,6 +240,15 @@ class CSVStorageService(BaseStorageService):
         # Ensure file handler is initialized
         if not hasattr(self, "_file_handler") or self._file_handler is None:
             _ = self.client
+        txn = self._current_transaction()
+        if txn is not None and txn.is_staged(file_path):
+            if not txn.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            staged = txn.get(file_path)
+            if not kwargs:
+                return staged
+            # Parser options only apply to text, so re-parse the staged frame
+            file_path = io.StringIO(staged.to_csv(index=False))
         try:
             return self._file_handler.read_csv_file(file_path, **kwargs)
         except FileNotFoundError:
@@ -250,7 +262,9 @@ class CSVStorageService(BaseStorageService):
         """
         Write DataFrame to CSV file.
 
-        Delegates to CSVFileHandler for file writing.
+        Delegates to CSVFileHandler for file writing.  Inside
+        ``transaction()`` the frame is staged instead (appends are merged
+        into the staged frame).
 
         Args:
             df: DataFrame to write
@@ -265,6 +279,12 @@ class CSVStorageService(BaseStorageService):
         # Ensure file handler is initialized
         if not hasattr(self, "_file_handler") or self._file_handler is None:
             _ = self.client
+        txn = self._current_transaction()
+        if txn is not None:
+            if mode == "a" and self._file_exists(file_path):
+                df = pd.concat([self._read_csv_file(file_path), df], ignore_index=True)
+            txn.stage(file_path, df, **kwargs)
+            return
         try:
             # Ensure base directory exists when using injection (deferred from _initialize_client)
             if self.base_directory:
@@ -278,6 +298,12 @@ class CSVStorageService(BaseStorageService):
         except Exception as e:
             self._handle_error("write_csv", e, file_path=file_path)
 
+    def _write_staged_file(
+        self, file_path: str, content: pd.DataFrame, **options
+    ) -> None:
+        """Write a frame staged by ``transaction()`` at commit time."""
+        self._write_csv_file(content, file_path, mode="w", **options)
+
     def _detect_id_column(self, df: pd.DataFrame) -> Optional[str]:
         """
         Detect the ID column using smart detection logic.
@@ -351,7 +377,7 @@ class CSVStorageService(BaseStorageService):
         try:
             file_path = self._get_file_path(collection)
 
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 self._logger.debug(f"CSV file does not exist: {file_path}")
                 return None
 
@@ -464,7 +490,7 @@ class CSVStorageService(BaseStorageService):
             # Extract service-specific parameters that shouldn't go to pandas
             id_field = kwargs.pop("id_field", None)  # Extract id_field from kwargs
             file_path = self._get_file_path(collection)
-            file_existed = os.path.exists(file_path)
+            file_existed = self._file_exists(file_path)
 
             if not file_existed and not self.configuration.is_csv_auto_create_enabled():
                 return self._create_error_result(
@@ -756,8 +782,8 @@ class CSVStorageService(BaseStorageService):
 
             if document_id is None:
                 # Delete entire file
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+                if self._file_exists(file_path):
+                    self._remove_file(file_path)
                     return self._create_success_result(
                         "delete",
                         collection=collection,
@@ -770,7 +796,7 @@ class CSVStorageService(BaseStorageService):
                     )
 
             # Delete specific row(s)
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 return self._create_error_result(
                     "delete", f"File not found: {file_path}", collection=collection
                 )
@@ -879,10 +905,10 @@ class CSVStorageService(BaseStorageService):
 
             if document_id is None:
                 # Check if file exists
-                return os.path.exists(file_path)
+                return self._file_exists(file_path)
 
             # Check if document exists in file
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 return False
 
             df = self._read_csv_file(file_path)
@@ -939,7 +965,7 @@ class CSVStorageService(BaseStorageService):
         try:
             file_path = self._get_file_path(collection)
 
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 return 0
 
             df = self._read_csv_file(file_path)
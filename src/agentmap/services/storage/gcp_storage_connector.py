@@ -6,10 +6,42 @@ interface for reading and writing JSON files in Google Cloud Storage buckets.
 """
 
 import os
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from agentmap.exceptions import StorageConnectionError, StorageOperationError
 from agentmap.services.storage.base_connector import BlobStorageConnector
+from agentmap.services.storage.blob_streaming import DEFAULT_CHUNK_SIZE, MultipartUpload
+
+
+class _GCSResumableUpload(MultipartUpload):
+    """
+    Resumable upload through ``Blob.open("wb")``. GCS objects are written as
+    one sequential stream, so parts are sent in order rather than in
+    parallel; the object only appears once the stream is closed.
+    """
+
+    def __init__(self, blob: Any):
+        self._blob = blob
+        self._writer: Optional[Any] = None
+
+    def upload_part(self, part_number: int, data: bytes) -> int:
+        if self._writer is None:
+            self._writer = self._blob.open("wb")
+        self._writer.write(data)
+        return len(data)
+
+    def upload_single(self, data: bytes) -> Dict[str, Any]:
+        self._blob.upload_from_string(data)
+        return {"etag": self._blob.etag}
+
+    def complete(self, parts: List[Any]) -> Dict[str, Any]:
+        self._writer.close()
+        self._blob.reload()
+        return {"etag": self._blob.etag}
+
+    def abort(self) -> None:
+        """Drop the resumable session without finalizing the object."""
+        self._writer = None
 
 
 class GCPStorageConnector(BlobStorageConnector):
@@ -241,6 +273,127 @@ class GCPStorageConnector(BlobStorageConnector):
                 "writing", uri, e, raise_error=True, resource_type="blob"
             )
 
+    def _get_bucket(self, bucket_name: str, create: bool = False) -> Any:
+        """Resolve ``bucket_name``, optionally creating it when missing."""
+        bucket = self.client.bucket(bucket_name)
+        if create and not bucket.exists():
+            self.log_info(f"Creating bucket: {bucket_name}")
+            try:
+                if self.project_id:
+                    self.client.create_bucket(bucket, project=self.project_id)
+                else:
+                    self.client.create_bucket(bucket)
+            except Exception as e:
+                self._handle_provider_error(
+                    "creating",
+                    bucket_name,
+                    e,
+                    raise_error=True,
+                    resource_type="bucket",
+                )
+        return bucket
+
+    def _get_existing_blob(self, uri: str) -> Any:
+        """Fetch blob metadata, raising ``FileNotFoundError`` when missing."""
+        bucket_name, blob_path = self._parse_gs_uri(uri)
+        blob = self.client.bucket(bucket_name).get_blob(blob_path)
+        if blob is None:
+            self._handle_provider_error(
+                "reading",
+                uri,
+                Exception(f"Blob {blob_path} not found"),
+                raise_error=True,
+                resource_type="blob",
+            )
+        return blob
+
+    def get_blob_info(self, uri: str) -> Dict[str, Any]:
+        """
+        Get blob size and ETag from its metadata.
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        try:
+            blob = self._get_existing_blob(uri)
+        except (FileNotFoundError, StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "reading", uri, e, raise_error=True, resource_type="blob"
+            )
+        return {
+            "size": blob.size,
+            "etag": blob.etag,
+            "generation": blob.generation,
+            "last_modified": blob.updated,
+        }
+
+    def iter_blob(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream a blob, or its ``[start, end)`` byte range, as a sequence of
+        ranged downloads pinned to one object generation, so a concurrent
+        overwrite can't splice two versions together.
+
+        Raises:
+            FileNotFoundError: If the blob doesn't exist
+            StorageOperationError: For other storage-related errors
+        """
+        try:
+            blob = self._get_existing_blob(uri)
+        except (FileNotFoundError, StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "reading", uri, e, raise_error=True, resource_type="blob"
+            )
+        stop = blob.size if end is None else min(end, blob.size)
+        return self._iter_ranges(uri, blob, start, stop, chunk_size)
+
+    def _iter_ranges(
+        self, uri: str, blob: Any, start: int, stop: int, chunk_size: int
+    ) -> Iterator[bytes]:
+        position = start
+        while position < stop:
+            last = min(position + chunk_size, stop) - 1  # GCS ranges are inclusive
+            try:
+                chunk = blob.download_as_bytes(
+                    start=position, end=last, if_generation_match=blob.generation
+                )
+            except Exception as e:
+                self._handle_provider_error(
+                    "downloading", uri, e, raise_error=True, resource_type="blob"
+                )
+            if not chunk:
+                return
+            position += len(chunk)
+            yield chunk
+
+    def start_multipart_upload(self, uri: str) -> MultipartUpload:
+        """
+        Begin a resumable (sequential, chunked) upload.
+
+        Raises:
+            StorageOperationError: If the bucket can't be accessed or created
+        """
+        try:
+            bucket_name, blob_path = self._parse_gs_uri(uri)
+            bucket = self._get_bucket(bucket_name, create=True)
+            return _GCSResumableUpload(bucket.blob(blob_path))
+        except (StorageOperationError, StorageConnectionError):
+            raise
+        except Exception as e:
+            return self._handle_provider_error(
+                "writing", uri, e, raise_error=True, resource_type="blob"
+            )
+
     def blob_exists(self, uri: str) -> bool:
         """
         Check if a blob exists in Google Cloud Storage.
@@ -39,6 +39,8 @@ class JSONStorageService(BaseStorageService):
     - Follows configuration architecture patterns from docs/contributing/architecture/configuration-patterns.md
     """
 
+    supports_transactions = True
+
     def __init__(
         self,
         provider_name: str,
@@ -272,6 +274,11 @@ class JSONStorageService(BaseStorageService):
             FileNotFoundError: If the file doesn't exist
             ValueError: If the file contains invalid JSON
         """
+        txn = self._current_transaction()
+        if txn is not None and txn.is_staged(file_path):
+            if not txn.exists(file_path):
+                raise FileNotFoundError(f"File not found: {file_path}")
+            return txn.get(file_path)
         try:
             with self._open_json_file(file_path, "r") as f:
                 return json.load(f, **kwargs)
@@ -285,7 +292,7 @@ class JSONStorageService(BaseStorageService):
 
     def _write_json_file(self, file_path: str, data: Any, **kwargs) -> None:
         """
-        Write data to a JSON file.
+        Write data to a JSON file (staged instead inside ``transaction()``).
 
         Args:
             file_path: Path to the JSON file
@@ -296,6 +303,10 @@ class JSONStorageService(BaseStorageService):
             PermissionError: If the file can't be written
             TypeError: If the data contains non-serializable objects
         """
+        txn = self._current_transaction()
+        if txn is not None:
+            txn.stage(file_path, data, **kwargs)
+            return
         try:
             # Extract indent from client config if not provided
             indent = kwargs.pop("indent", self.client.get("indent", 2))
@@ -308,6 +319,10 @@ class JSONStorageService(BaseStorageService):
             self._logger.error(error_msg)
             raise ValueError(error_msg)
 
+    def _write_staged_file(self, file_path: str, content: Any, **options) -> None:
+        """Write a file staged by ``transaction()`` at commit time."""
+        self._write_json_file(file_path, content, **options)
+
     def _apply_path(self, data: Any, path: str) -> Any:
         """
         Extract data from a nested structure using dot notation.
@@ -832,7 +847,7 @@ class JSONStorageService(BaseStorageService):
         try:
             file_path = self._get_file_path(collection)
 
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 self._logger.debug(f"JSON file does not exist: {file_path}")
                 return None
 
@@ -913,7 +928,7 @@ class JSONStorageService(BaseStorageService):
             # Extract service-specific parameters
             id_field = kwargs.pop("id_field", "id")
 
-            file_existed = os.path.exists(file_path)
+            file_existed = self._file_exists(file_path)
 
             if mode == WriteMode.WRITE:
                 # Simple write operation
@@ -1109,7 +1124,7 @@ class JSONStorageService(BaseStorageService):
             # Extract service-specific parameters
             id_field = kwargs.pop("id_field", "id")
 
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 return self._create_error_result(
                     "delete", f"File not found: {file_path}", collection=collection
                 )
@@ -1125,7 +1140,7 @@ class JSONStorageService(BaseStorageService):
 
             # Handle deleting entire file
             if document_id is None and path is None and not query:
-                os.remove(file_path)
+                self._remove_file(file_path)
                 return self._create_success_result(
                     "delete",
                     collection=collection,
@@ -1278,7 +1293,7 @@ class JSONStorageService(BaseStorageService):
         try:
             file_path = self._get_file_path(collection)
 
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 return False
 
             # Extract service-specific parameters
@@ -1339,7 +1354,7 @@ class JSONStorageService(BaseStorageService):
         try:
             file_path = self._get_file_path(collection)
 
-            if not os.path.exists(file_path):
+            if not self._file_exists(file_path):
                 return 0
 
             # Read the file
@@ -6,9 +6,52 @@ interface, serving as a fallback when cloud storage is not specified.
 """
 
 import os
-from typing import Any, Dict
+import tempfile
+from typing import Any, Dict, Iterator, List, Optional
 
 from agentmap.services.storage.base_connector import BlobStorageConnector
+from agentmap.services.storage.blob_streaming import (
+    DEFAULT_CHUNK_SIZE,
+    MultipartUpload,
+    iter_file_range,
+)
+
+
+def _file_etag(st: os.stat_result) -> str:
+    """Version token for a local file: changes with mtime or size."""
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
+
+class _LocalFileUpload(MultipartUpload):
+    """
+    Streams parts into a temporary file next to the target and renames it
+    into place on completion, so readers never see a partial file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        fd, self._tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path),
+            prefix=f".{os.path.basename(path)}.",
+            suffix=".part",
+        )
+        self._file = os.fdopen(fd, "wb")
+
+    def upload_part(self, part_number: int, data: bytes) -> int:
+        self._file.write(data)
+        return len(data)
+
+    def complete(self, parts: List[Any]) -> Dict[str, Any]:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        return {"etag": _file_etag(os.stat(self.path))}
+
+    def abort(self) -> None:
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
 
 
 class LocalFileConnector(BlobStorageConnector):
@@ -139,6 +182,79 @@ class LocalFileConnector(BlobStorageConnector):
             self.log_warning(f"Error checking file existence {uri}: {str(e)}")
             return False
 
+    def get_blob_info(self, uri: str) -> Dict[str, Any]:
+        """
+        Get size and ETag of a local file from ``os.stat``.
+
+        Args:
+            uri: Path to the file
+
+        Returns:
+            Dictionary with ``size``, ``etag`` and ``last_modified``
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+        """
+        path = self._resolve_path(uri)
+        try:
+            st = os.stat(path)
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"File not found: {path}")
+        except FileNotFoundError as e:
+            return self._handle_provider_error(
+                "reading", path, e, raise_error=True, resource_type="file"
+            )
+        return {
+            "size": st.st_size,
+            "etag": _file_etag(st),
+            "last_modified": st.st_mtime,
+        }
+
+    def iter_blob(
+        self,
+        uri: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Stream a local file, or its ``[start, end)`` byte range, in chunks.
+
+        The file is opened immediately so a missing file fails here rather
+        than on first iteration.
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist
+            StorageOperationError: For other file-related errors
+        """
+        path = self._resolve_path(uri)
+        try:
+            if not os.path.isfile(path):
+                raise FileNotFoundError(f"File not found: {path}")
+            handle = open(path, "rb")
+        except (FileNotFoundError, PermissionError) as e:
+            return self._handle_provider_error(
+                "reading", path, e, raise_error=True, resource_type="file"
+            )
+        return iter_file_range(handle, start, end, chunk_size)
+
+    def start_multipart_upload(self, uri: str) -> MultipartUpload:
+        """
+        Begin a streamed write to a local file.
+
+        Parts are appended to a temporary file in the target directory and
+        atomically renamed over the target on completion. Parts are written
+        sequentially -- there is nothing to gain from parallel local writes.
+        """
+        path = self._resolve_path(uri)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            return _LocalFileUpload(path)
+        except Exception as e:
+            return self._handle_provider_error(
+                "writing", path, e, raise_error=True, resource_type="file"
+            )
+
     def _resolve_path(self, uri: str) -> str:
         """
         Resolve URI to local file path.
@@ -12,7 +12,7 @@ Note: This module has been refactored into smaller components:
 
 import time
 from copy import deepcopy
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from agentmap.services.storage.base import BaseStorageService
 from agentmap.services.storage.memory_helpers import MemoryStorageHelpers
@@ -630,6 +630,18 @@ class MemoryStorageService(BaseStorageService):
             self._logger.debug(f"Error checking existence: {e}")
             return False
 
+    async def _run_blocking(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run memory operations inline on the event loop.
+
+        They never touch disk once the client exists, so a thread hop would
+        cost more than the operation. The first call can load a persistence
+        file, so it still goes to a worker thread.
+        """
+        if self._client is None:
+            return await super()._run_blocking(fn, *args, **kwargs)
+        return fn(*args, **kwargs)
+
     def count(
         self, collection: str, query: Optional[Dict[str, Any]] = None, **kwargs
     ) -> int:
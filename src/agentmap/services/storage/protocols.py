@@ -76,6 +76,26 @@ class StorageReader(Protocol):
         """
         ...
 
+    async def aread(
+        self,
+        collection: str,
+        document_id: Optional[str] = None,
+        query: Optional[Dict[str, Any]] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> Any:
+        """
+        Async read; same arguments and result as ``read``.
+
+        Never blocks the event loop: natively async backends await their
+        client, others run ``read`` in a worker thread.
+        """
+        ...
+
+    async def aexists(self, collection: str, document_id: Optional[str] = None) -> bool:
+        """Async ``exists``; never blocks the event loop."""
+        ...
+
 
 @runtime_checkable
 class StorageWriter(Protocol):
@@ -132,6 +152,28 @@ class StorageWriter(Protocol):
         """
         ...
 
+    async def awrite(
+        self,
+        collection: str,
+        data: Any,
+        document_id: Optional[str] = None,
+        mode: WriteMode = WriteMode.WRITE,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> StorageResult:
+        """Async write; same arguments and result as ``write``."""
+        ...
+
+    async def adelete(
+        self,
+        collection: str,
+        document_id: Optional[str] = None,
+        path: Optional[str] = None,
+        **kwargs,
+    ) -> StorageResult:
+        """Async delete; same arguments and result as ``delete``."""
+        ...
+
     def batch_write(
         self,
         collection: str,
@@ -149,7 +191,8 @@ class StorageWriter(Protocol):
             **kwargs: Provider-specific parameters
 
         Returns:
-            StorageResult with batch operation details
+            StorageResult with batch operation details and one entry per
+            item in ``item_results``
         """
         ...
 
@@ -0,0 +1,158 @@
+"""
+Staged, atomically committed writes for file-backed storage services.
+
+``BaseStorageService.transaction()`` opens a ``StorageTransaction`` for the
+current context (thread or asyncio task).  While it is open, file-backed
+services (JSON, CSV) keep the parsed content of every file they touch in
+memory: the first access reads the file, later reads and writes work on
+the staged copy, and nothing reaches disk.  Leaving the block normally
+writes each touched file exactly once; leaving it on an exception discards
+everything.
+
+Commit is two-phase: every file is first written to a temporary sibling
+and fsynced, then all of them are renamed over their targets.  Each file
+is replaced atomically (readers see the old or the new content, never a
+partial write); a transaction spanning several files narrows, but cannot
+close, the window in which only some of them are replaced.
+"""
+
+import os
+import shutil
+import uuid
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+#: Staged content marking a file deleted inside the transaction.
+DELETED = object()
+
+# Open transactions for the current context, keyed by id(service).  Storage
+# services are shared singletons, so the staging area cannot live on them.
+_ACTIVE_TRANSACTIONS: ContextVar[Dict[int, "StorageTransaction"]] = ContextVar(
+    "agentmap_storage_transactions", default={}
+)
+
+
+def get_active_transaction(service: Any) -> Optional["StorageTransaction"]:
+    """The transaction ``service`` has open in this context, if any."""
+    return _ACTIVE_TRANSACTIONS.get().get(id(service))
+
+
+def activate_transaction(transaction: "StorageTransaction") -> Any:
+    """Make ``transaction`` current for its service; returns a reset token."""
+    active = dict(_ACTIVE_TRANSACTIONS.get())
+    active[id(transaction.service)] = transaction
+    return _ACTIVE_TRANSACTIONS.set(active)
+
+
+def deactivate_transaction(token: Any) -> None:
+    """Undo ``activate_transaction``."""
+    _ACTIVE_TRANSACTIONS.reset(token)
+
+
+class StorageTransaction:
+    """
+    Per-file staging area for one service.
+
+    Content is whatever the service parses files into (JSON values, pandas
+    DataFrames); ``options`` are the serializer keyword arguments the last
+    write asked for, replayed at commit.
+    """
+
+    def __init__(self, service: Any):
+        self.service = service
+        self._files: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+
+    @staticmethod
+    def _key(file_path: str) -> str:
+        return os.path.abspath(file_path)
+
+    @property
+    def staged_paths(self) -> List[str]:
+        """Files this transaction will write or delete on commit."""
+        return list(self._files)
+
+    def is_staged(self, file_path: str) -> bool:
+        """Whether ``file_path`` has been written or deleted in this transaction."""
+        return self._key(file_path) in self._files
+
+    def get(self, file_path: str) -> Any:
+        """Staged content for ``file_path`` (``DELETED`` if removed).
+
+        Raises:
+            KeyError: If the file has not been staged
+        """
+        return self._files[self._key(file_path)][0]
+
+    def exists(self, file_path: str) -> bool:
+        """Whether ``file_path`` exists as seen from inside the transaction."""
+        key = self._key(file_path)
+        if key in self._files:
+            return self._files[key][0] is not DELETED
+        return os.path.exists(key)
+
+    def stage(self, file_path: str, content: Any, **options: Any) -> None:
+        """Replace the staged content of ``file_path``."""
+        self._files[self._key(file_path)] = (content, options)
+
+    def stage_delete(self, file_path: str) -> None:
+        """Mark ``file_path`` for deletion on commit."""
+        self._files[self._key(file_path)] = (DELETED, {})
+
+    def discard(self) -> None:
+        """Drop everything staged."""
+        self._files.clear()
+
+    def commit(self, write_file: Callable[..., None]) -> None:
+        """Write every staged file with ``write_file(path, content, **options)``.
+
+        ``write_file`` receives a temporary path next to the target; the
+        result is fsynced and then renamed into place once all files have
+        been written.  On failure no target is touched by the failing phase
+        and all temporary files are removed.
+        """
+        prepared: List[Tuple[str, Optional[str]]] = []
+        try:
+            for file_path, (content, options) in self._files.items():
+                if content is DELETED:
+                    prepared.append((file_path, None))
+                    continue
+                temp_path = _temp_path_for(file_path)
+                prepared.append((file_path, temp_path))
+                write_file(temp_path, content, **options)
+                _fsync(temp_path)
+                if os.path.exists(file_path):
+                    shutil.copymode(file_path, temp_path)
+            for index, (file_path, temp_path) in enumerate(prepared):
+                if temp_path is None:
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                else:
+                    os.replace(temp_path, file_path)
+                prepared[index] = (file_path, None)
+        finally:
+            for _, temp_path in prepared:
+                if temp_path is not None and os.path.exists(temp_path):
+                    os.remove(temp_path)
+        self._files.clear()
+
+
+def _temp_path_for(file_path: str) -> str:
+    directory, name = os.path.split(file_path)
+    os.makedirs(directory, exist_ok=True)
+    # Left for the writer to create with open(), so it gets the usual umask
+    # mode rather than mkstemp's 0600.
+    return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+
+
+def _fsync(path: str) -> None:
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+__all__ = [
+    "DELETED",
+    "StorageTransaction",
+    "activate_transaction",
+    "deactivate_transaction",
+    "get_active_transaction",
+]
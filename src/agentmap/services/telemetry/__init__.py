@@ -30,6 +30,7 @@ from .constants import (
     GRAPH_NODE_COUNT,
     LLM_CALL_SPAN,
     METRIC_DIM_ERROR_TYPE,
+    METRIC_DIM_HEDGE_OUTCOME,
     METRIC_DIM_MODEL,
     METRIC_DIM_PROVIDER,
     METRIC_DIM_TIER,
@@ -37,6 +38,7 @@ from .constants import (
     METRIC_LLM_DURATION,
     METRIC_LLM_ERRORS,
     METRIC_LLM_FALLBACK,
+    METRIC_LLM_HEDGE,
     METRIC_LLM_ROUTING_CACHE_HIT,
     METRIC_LLM_TOKENS_INPUT,
     METRIC_LLM_TOKENS_OUTPUT,
@@ -116,9 +118,11 @@ __all__ = [
     "METRIC_LLM_ROUTING_CACHE_HIT",
     "METRIC_LLM_CIRCUIT_BREAKER",
     "METRIC_LLM_FALLBACK",
+    "METRIC_LLM_HEDGE",
     # Metric dimension constants
     "METRIC_DIM_PROVIDER",
     "METRIC_DIM_MODEL",
     "METRIC_DIM_ERROR_TYPE",
     "METRIC_DIM_TIER",
+    "METRIC_DIM_HEDGE_OUTCOME",
 ]
@@ -11,7 +11,7 @@ the SDK is not installed.
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 # Obtain AgentMap version at import time -- fallback to "unknown".
 try:
@@ -29,6 +29,9 @@ trace: Any = None
 Resource: Any = None
 TracerProvider: Any = None
 BatchSpanProcessor: Any = None
+SpanLimits: Any = None
+build_sampler: Any = None
+TailRetentionSpanProcessor: Any = None
 ConsoleSpanExporter: Any = None
 GrpcOTLPSpanExporter: Any = None
 HttpOTLPSpanExporter: Any = None
@@ -40,6 +43,7 @@ def _load_otel_imports() -> None:
     Raises ``ImportError`` if the SDK is not installed.
     """
     global trace, Resource, TracerProvider, BatchSpanProcessor
+    global SpanLimits, build_sampler, TailRetentionSpanProcessor
     global ConsoleSpanExporter, GrpcOTLPSpanExporter, HttpOTLPSpanExporter
 
     from opentelemetry import trace as _trace
@@ -58,6 +62,15 @@ def _load_otel_imports() -> None:
 
     BatchSpanProcessor = _BatchSpanProcessor
 
+    from opentelemetry.sdk.trace import SpanLimits as _SpanLimits
+
+    SpanLimits = _SpanLimits
+
+    from agentmap.services.telemetry import sampling as _sampling
+
+    build_sampler = _sampling.build_sampler
+    TailRetentionSpanProcessor = _sampling.TailRetentionSpanProcessor
+
     from opentelemetry.sdk.trace.export import (
         ConsoleSpanExporter as _ConsoleSpanExporter,
     )
@@ -83,9 +96,16 @@ def bootstrap_standalone_tracer_provider(
     protocol: str,
     resource_attributes: Dict[str, str],
     logger: logging.Logger,
+    sampling: Optional[Dict[str, Any]] = None,
+    limits: Optional[Dict[str, Any]] = None,
+    batch: Optional[Dict[str, Any]] = None,
 ) -> bool:
     """Bootstrap a TracerProvider for standalone mode.
 
+    ``sampling``, ``limits`` and ``batch`` are the matching
+    ``telemetry.*`` config sections. When omitted the SDK defaults apply:
+    sample everything, default span limits and default batch sizes.
+
     Returns True if bootstrap succeeded or was skipped (host provider
     detected), False if degraded to no-op due to error.
     """
@@ -133,8 +153,36 @@ def bootstrap_standalone_tracer_provider(
             return False
 
         # Step 5: Configure TracerProvider
-        tp = TracerProvider(resource=resource)
-        tp.add_span_processor(BatchSpanProcessor(span_exporter))
+        provider_kwargs: Dict[str, Any] = {"resource": resource}
+        if sampling:
+            provider_kwargs["sampler"] = build_sampler(sampling)
+        if limits:
+            provider_kwargs["span_limits"] = SpanLimits(
+                max_span_attribute_length=limits.get("max_attribute_length"),
+                max_span_attributes=limits.get("max_attributes_per_span"),
+                max_events=limits.get("max_events_per_span"),
+            )
+        tp = TracerProvider(**provider_kwargs)
+
+        if batch:
+            processor = BatchSpanProcessor(
+                span_exporter,
+                max_queue_size=batch.get("max_queue_size"),
+                schedule_delay_millis=batch.get("schedule_delay_ms"),
+                max_export_batch_size=batch.get("max_export_batch_size"),
+                export_timeout_millis=batch.get("export_timeout_ms"),
+            )
+        else:
+            processor = BatchSpanProcessor(span_exporter)
+        if sampling and (
+            sampling.get("keep_errors") or sampling.get("slow_span_ms") is not None
+        ):
+            processor = TailRetentionSpanProcessor(
+                processor,
+                keep_errors=bool(sampling.get("keep_errors")),
+                slow_span_ms=sampling.get("slow_span_ms"),
+            )
+        tp.add_span_processor(processor)
         trace.set_tracer_provider(tp)
 
         return True
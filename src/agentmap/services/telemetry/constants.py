@@ -147,6 +147,18 @@ STORAGE_RECORD_COUNT: str = "agentmap.storage.record_count"
 STORAGE_RESOURCE: str = "agentmap.storage.resource"
 """Opt-in resource identifier (file path or collection name). Controlled by config flag."""
 
+# ---------------------------------------------------------------------------
+# Instrumented subsystems
+# ---------------------------------------------------------------------------
+
+SUBSYSTEM_SPANS = {
+    "workflow": (WORKFLOW_RUN_SPAN,),
+    "agent": (AGENT_RUN_SPAN,),
+    "llm": (LLM_CALL_SPAN,),
+    "storage": (STORAGE_READ_SPAN, STORAGE_WRITE_SPAN),
+}
+"""Span names owned by each subsystem that ``telemetry.subsystems`` can switch off."""
+
 # ---------------------------------------------------------------------------
 # Metric name constants (LLM operations)
 # ---------------------------------------------------------------------------
@@ -175,6 +187,9 @@ METRIC_LLM_CIRCUIT_BREAKER: str = "agentmap.llm.circuit_breaker"
 METRIC_LLM_FALLBACK: str = "agentmap.llm.fallback"
 """Counter for LLM fallback events."""
 
+METRIC_LLM_HEDGE: str = "agentmap.llm.hedge"
+"""Counter for hedged-request events, dimensioned by route and hedge outcome."""
+
 # ---------------------------------------------------------------------------
 # Metric dimension (attribute key) constants
 # ---------------------------------------------------------------------------
@@ -191,6 +206,9 @@ METRIC_DIM_ERROR_TYPE: str = "error_type"
 METRIC_DIM_TIER: str = "tier"
 """Tier dimension for metric attributes."""
 
+METRIC_DIM_HEDGE_OUTCOME: str = "hedge_outcome"
+"""Hedge outcome dimension (fired, won, lost, failed, budget_refused, rate_limited)."""
+
 # ---------------------------------------------------------------------------
 # Metric name constants (LLM batch operations) — ADR-7 additive only
 # ---------------------------------------------------------------------------
@@ -12,9 +12,10 @@ this module and ``di/container_parts/telemetry.py``.
 
 from __future__ import annotations
 
+import contextlib
 import logging
 import re
-from typing import Any, ContextManager, Dict, Optional
+from typing import Any, ContextManager, Dict, Iterable, Optional
 
 from opentelemetry import metrics, trace
 from opentelemetry.trace import StatusCode
@@ -32,6 +33,8 @@ from opentelemetry.trace import StatusCode
 # ``opentelemetry`` itself; ``llm_error_utils`` has no reverse dependency on
 # telemetry, so there is no import cycle.
 from agentmap.services.llm_error_utils import CREDENTIAL_PREFIXED_RE
+from agentmap.services.telemetry.constants import SUBSYSTEM_SPANS
+from agentmap.services.telemetry.noop_telemetry_service import _NOOP_SPAN
 
 logger = logging.getLogger(__name__)
 
@@ -82,13 +85,29 @@ class OTELTelemetryService:
     which automatically participates in the host application's
     ``TracerProvider``.  When no SDK is configured the OTEL API returns a
     built-in no-op tracer.
+
+    Args:
+        disabled_subsystems: Subsystems (keys of ``SUBSYSTEM_SPANS``) whose
+            spans are replaced by the shared no-op span
+        max_attribute_length: Truncate string attribute values to this many
+            characters; ``None`` leaves them untouched
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        disabled_subsystems: Iterable[str] = (),
+        max_attribute_length: Optional[int] = None,
+    ) -> None:
         self._tracer = trace.get_tracer(
             "agentmap", instrumenting_library_version=_agentmap_version
         )
         self._meter = metrics.get_meter("agentmap", version=_agentmap_version)
+        self._disabled_spans = frozenset(
+            span_name
+            for subsystem in disabled_subsystems
+            for span_name in SUBSYSTEM_SPANS.get(subsystem, ())
+        )
+        self._max_attribute_length = max_attribute_length
 
     # -- Protocol methods ---------------------------------------------------
 
@@ -100,10 +119,18 @@ class OTELTelemetryService:
     ) -> ContextManager[Any]:
         """Start a span using the OTEL tracer.
 
-        Delegates to ``tracer.start_as_current_span()``.
+        Delegates to ``tracer.start_as_current_span()``. Spans of a
+        disabled subsystem yield the shared no-op span instead, so they
+        cost no more than a ``nullcontext``.
         """
+        if name in self._disabled_spans:
+            return contextlib.nullcontext(_NOOP_SPAN)
         kwargs: Dict[str, Any] = {}
         if attributes is not None:
+            if self._max_attribute_length is not None:
+                attributes = {
+                    key: self._cap(value) for key, value in attributes.items()
+                }
             kwargs["attributes"] = attributes
         if kind is not None:
             kwargs["kind"] = kind
@@ -134,6 +161,8 @@ class OTELTelemetryService:
         matches, *exception* is recorded unchanged. Callers do not need to
         pre-sanitize exceptions before calling this method.
         """
+        if span is _NOOP_SPAN:
+            return
         try:
             message = str(exception)
             redacted_message = _redact_credentials(message)
@@ -152,9 +181,11 @@ class OTELTelemetryService:
         Individual failures (``TypeError``, ``ValueError``) are logged as
         warnings; they never propagate.
         """
+        if span is _NOOP_SPAN:
+            return
         for key, value in attributes.items():
             try:
-                span.set_attribute(key, value)
+                span.set_attribute(key, self._cap(value))
             except (TypeError, ValueError) as exc:
                 logger.warning("Failed to set span attribute %r: %s", key, exc)
             except Exception as exc:
@@ -171,6 +202,8 @@ class OTELTelemetryService:
         attributes: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Add an event to *span*."""
+        if span is _NOOP_SPAN:
+            return
         try:
             kwargs: Dict[str, Any] = {}
             if attributes is not None:
@@ -183,6 +216,12 @@ class OTELTelemetryService:
         """Return the underlying OTEL tracer."""
         return self._tracer
 
+    def _cap(self, value: Any) -> Any:
+        limit = self._max_attribute_length
+        if limit is not None and isinstance(value, str) and len(value) > limit:
+            return value[:limit]
+        return value
+
     # -- Metrics methods ----------------------------------------------------
 
     def get_meter(self, name: str = "agentmap", version: Optional[str] = None) -> Any:
@@ -0,0 +1,193 @@
+"""Sampling and tail retention for the standalone TracerProvider.
+
+Head sampling is trace-id ratio based, with per-graph ratios keyed on the
+workflow span's ``agentmap.graph.name`` attribute, optionally wrapped in a
+parent-based sampler so child spans follow their root's decision.
+
+Tail retention keeps spans that head sampling dropped when they end in
+error or run longer than a threshold. Those spans are recorded but not
+marked sampled; ``TailRetentionSpanProcessor`` forwards only the ones worth
+keeping to the export processor. Recording a span costs nearly as much as
+sampling it, so tail retention trades some of the savings of a low ratio
+for visibility of failures.
+
+This module imports ``opentelemetry.sdk`` at module level. It is loaded by
+``bootstrap._load_otel_imports()`` only after the SDK import succeeded.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from opentelemetry import trace
+from opentelemetry.sdk.trace import SpanProcessor
+from opentelemetry.sdk.trace.sampling import (
+    ALWAYS_OFF,
+    Decision,
+    ParentBased,
+    Sampler,
+    SamplingResult,
+    TraceIdRatioBased,
+)
+from opentelemetry.trace import SpanContext, StatusCode, TraceFlags
+
+from agentmap.services.telemetry.constants import GRAPH_NAME
+
+
+def _parent_trace_state(parent_context: Any) -> Any:
+    span_context = trace.get_current_span(parent_context).get_span_context()
+    return span_context.trace_state if span_context.is_valid else None
+
+
+class GraphRatioSampler(Sampler):
+    """Trace-id ratio sampler with per-graph ratio overrides.
+
+    Spans that fall outside the ratio are dropped, or recorded without
+    being sampled when ``record_unsampled`` is set so tail retention can
+    still keep them.
+    """
+
+    def __init__(
+        self,
+        ratio: float,
+        graph_ratios: Optional[Dict[str, float]] = None,
+        record_unsampled: bool = False,
+    ) -> None:
+        self._bound = TraceIdRatioBased.get_bound_for_rate(ratio)
+        self._graph_bounds = {
+            graph: TraceIdRatioBased.get_bound_for_rate(graph_ratio)
+            for graph, graph_ratio in (graph_ratios or {}).items()
+        }
+        self._unsampled = Decision.RECORD_ONLY if record_unsampled else Decision.DROP
+        self._description = (
+            f"GraphRatioSampler{{{ratio}, graphs={sorted(self._graph_bounds)}, "
+            f"record_unsampled={record_unsampled}}}"
+        )
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id,
+        name,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        bound = self._bound
+        if self._graph_bounds and attributes:
+            bound = self._graph_bounds.get(attributes.get(GRAPH_NAME), bound)
+        if trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < bound:
+            decision = Decision.RECORD_AND_SAMPLE
+        else:
+            decision = self._unsampled
+        if decision is Decision.DROP:
+            attributes = None
+        return SamplingResult(decision, attributes, _parent_trace_state(parent_context))
+
+    def get_description(self) -> str:
+        return self._description
+
+
+class _RecordOnlySampler(Sampler):
+    """Records every span without sampling it (children of unsampled roots)."""
+
+    def should_sample(
+        self,
+        parent_context,
+        trace_id,
+        name,
+        kind=None,
+        attributes=None,
+        links=None,
+        trace_state=None,
+    ) -> SamplingResult:
+        return SamplingResult(
+            Decision.RECORD_ONLY, attributes, _parent_trace_state(parent_context)
+        )
+
+    def get_description(self) -> str:
+        return "RecordOnlySampler"
+
+
+def build_sampler(sampling: Dict[str, Any]) -> Sampler:
+    """Build the head sampler described by ``telemetry.sampling``."""
+    tail = bool(sampling.get("keep_errors")) or (
+        sampling.get("slow_span_ms") is not None
+    )
+    root = GraphRatioSampler(
+        float(sampling.get("ratio", 1.0)),
+        sampling.get("graph_overrides") or {},
+        record_unsampled=tail,
+    )
+    if not sampling.get("parent_based", True):
+        return root
+    not_sampled = _RecordOnlySampler() if tail else ALWAYS_OFF
+    return ParentBased(
+        root,
+        remote_parent_not_sampled=not_sampled,
+        local_parent_not_sampled=not_sampled,
+    )
+
+
+class _RetainedSpan:
+    """Read-only view of an unsampled span that reports itself as sampled."""
+
+    def __init__(self, span: Any) -> None:
+        self._span = span
+        original = span.context
+        self.context = SpanContext(
+            original.trace_id,
+            original.span_id,
+            original.is_remote,
+            TraceFlags(TraceFlags.SAMPLED),
+            original.trace_state,
+        )
+
+    def get_span_context(self) -> SpanContext:
+        return self.context
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._span, name)
+
+
+class TailRetentionSpanProcessor(SpanProcessor):
+    """Forward sampled spans, plus unsampled ones that failed or ran slow.
+
+    Args:
+        delegate: Export processor (usually a ``BatchSpanProcessor``)
+        keep_errors: Keep spans whose status is ERROR
+        slow_span_ms: Keep spans at least this long; ``None`` disables
+    """
+
+    def __init__(
+        self,
+        delegate: SpanProcessor,
+        keep_errors: bool = True,
+        slow_span_ms: Optional[float] = None,
+    ) -> None:
+        self._delegate = delegate
+        self._keep_errors = keep_errors
+        self._slow_ns = None if slow_span_ms is None else int(slow_span_ms * 1e6)
+
+    def on_start(self, span: Any, parent_context: Any = None) -> None:
+        self._delegate.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: Any) -> None:
+        if span.context.trace_flags.sampled:
+            self._delegate.on_end(span)
+        elif self._should_retain(span):
+            self._delegate.on_end(_RetainedSpan(span))
+
+    def _should_retain(self, span: Any) -> bool:
+        if self._keep_errors and span.status.status_code is StatusCode.ERROR:
+            return True
+        if self._slow_ns is not None and span.end_time and span.start_time:
+            return span.end_time - span.start_time >= self._slow_ns
+        return False
+
+    def shutdown(self) -> None:
+        self._delegate.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._delegate.force_flush(timeout_millis)
@@ -4,6 +4,9 @@ Performance benchmark suite for OTEL instrumentation overhead.
 Validates REQ-NF06-001: instrumentation overhead < 5% for workflows
 with per-node execution times above 10ms.
 
+Also gates the low-overhead settings: sampled-out traces and disabled
+subsystems must cost a fraction of a fully recorded span.
+
 Run with: pytest -m benchmark -s tests/benchmark/
 """
 
@@ -13,12 +16,13 @@ import time
 import pytest
 
 
-def _create_telemetry_service():
+def _create_telemetry_service(sampling=None, **service_kwargs):
     """Create a real OTEL telemetry service backed by InMemorySpanExporter.
 
     Returns the telemetry service instance configured with a
     SimpleSpanProcessor and InMemorySpanExporter for deterministic,
-    low-overhead span collection.
+    low-overhead span collection. *sampling* is a ``telemetry.sampling``
+    section; *service_kwargs* are passed to ``OTELTelemetryService``.
     """
     from opentelemetry.sdk.trace import TracerProvider
     from opentelemetry.sdk.trace.export import SimpleSpanProcessor
@@ -31,10 +35,15 @@ def _create_telemetry_service():
     )
 
     exporter = InMemorySpanExporter()
-    provider = TracerProvider()
+    if sampling is None:
+        provider = TracerProvider()
+    else:
+        from agentmap.services.telemetry.sampling import build_sampler
+
+        provider = TracerProvider(sampler=build_sampler(sampling))
     provider.add_span_processor(SimpleSpanProcessor(exporter))
 
-    service = OTELTelemetryService()
+    service = OTELTelemetryService(**service_kwargs)
     # Inject the provider's tracer so spans are actually recorded
     service._tracer = provider.get_tracer("agentmap")
     return service
@@ -165,3 +174,65 @@ class TestInstrumentationOverhead:
             f"Baseline: {baseline_median:.6f}s, "
             f"Instrumented: {instrumented_median:.6f}s"
         )
+
+
+def _per_node_cost_us(telemetry_service, span_name, iterations=5000):
+    """Median microseconds spent instrumenting one node (span + 4 events)."""
+    samples = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for i in range(iterations):
+            with telemetry_service.start_span(
+                span_name,
+                attributes={
+                    "agentmap.agent.name": f"node_{i}",
+                    "agentmap.agent.type": "DefaultAgent",
+                },
+            ) as span:
+                telemetry_service.add_span_event(span, "pre_process.start")
+                telemetry_service.add_span_event(span, "process.start")
+                telemetry_service.add_span_event(span, "post_process.start")
+                telemetry_service.add_span_event(span, "agent.complete")
+        samples.append((time.perf_counter() - start) / iterations * 1e6)
+    return statistics.median(samples)
+
+
+@pytest.mark.benchmark
+class TestLowOverheadModes:
+    """Gate the cost of sampled-out traces and disabled subsystems.
+
+    Both are compared against a fully recorded span on the same machine,
+    so the ratios hold regardless of absolute CPU speed.
+    """
+
+    MAX_SAMPLED_OUT_FRACTION = 0.5
+    MAX_DISABLED_FRACTION = 0.1
+
+    def test_sampled_out_and_disabled_spans_are_cheap(self):
+        from agentmap.services.telemetry.constants import AGENT_RUN_SPAN
+
+        full = _per_node_cost_us(_create_telemetry_service(), AGENT_RUN_SPAN)
+        sampled_out = _per_node_cost_us(
+            _create_telemetry_service(sampling={"ratio": 0.0}), AGENT_RUN_SPAN
+        )
+        disabled = _per_node_cost_us(
+            _create_telemetry_service(disabled_subsystems=["agent"]),
+            AGENT_RUN_SPAN,
+        )
+
+        print(f"\n{'=' * 60}")
+        print("LOW-OVERHEAD MODES BENCHMARK (per node)")
+        print(f"{'=' * 60}")
+        print(f"Full recording:       {full:.2f}us")
+        print(f"Sampled out:          {sampled_out:.2f}us")
+        print(f"Subsystem disabled:   {disabled:.2f}us")
+        print(f"{'=' * 60}")
+
+        assert sampled_out < full * self.MAX_SAMPLED_OUT_FRACTION, (
+            f"Sampled-out span costs {sampled_out:.2f}us, more than "
+            f"{self.MAX_SAMPLED_OUT_FRACTION:.0%} of a full span ({full:.2f}us)"
+        )
+        assert disabled < full * self.MAX_DISABLED_FRACTION, (
+            f"Disabled-subsystem span costs {disabled:.2f}us, more than "
+            f"{self.MAX_DISABLED_FRACTION:.0%} of a full span ({full:.2f}us)"
+        )
@@ -0,0 +1,89 @@
+"""
+Performance benchmark for agent logging overhead on large state.
+
+Agents log their inputs and outputs on every run. Formatting those eagerly
+costs time proportional to the state size even when the message is
+filtered out, so a node handling a multi-megabyte document pays for it on
+every hop. This gates that a run at INFO (DEBUG filtered) on a ~5MB state
+costs about the same as on a tiny one.
+
+Run with: pytest -m benchmark -s tests/benchmark/
+"""
+
+import io
+import logging
+import statistics
+import time
+from typing import Any, Dict
+
+import pytest
+
+from agentmap.agents.base_agent import BaseAgent
+from agentmap.agents.builtins.echo_agent import EchoAgent
+from agentmap.services.state_adapter_service import StateAdapterService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+ITERATIONS = 50
+
+
+class _PassThroughAgent(BaseAgent):
+    def process(self, inputs: Dict[str, Any]) -> Any:
+        return inputs["document"]
+
+
+def _make_logger(level: int) -> logging.Logger:
+    logger = logging.getLogger(f"benchmark.logging_overhead.{level}")
+    logger.handlers[:] = [logging.StreamHandler(io.StringIO())]
+    logger.setLevel(level)
+    logger.propagate = False
+    return logger
+
+
+def _make_agent(agent_class, logger):
+    return agent_class(
+        name="node",
+        prompt="",
+        context={"input_fields": ["document"], "output_field": "result"},
+        logger=logger,
+        execution_tracking_service=(
+            MockServiceFactory.create_mock_execution_tracking_service()
+        ),
+        state_adapter_service=StateAdapterService(),
+    )
+
+
+def _median_run_ms(agent, state) -> float:
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        agent.run(state)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("agent_class", [_PassThroughAgent, EchoAgent])
+def test_large_state_does_not_inflate_run_time_at_info(agent_class):
+    logger = _make_logger(logging.INFO)
+    small = {"document": {"text": "x" * 100}}
+    large = {"document": {f"section_{i}": "lorem ipsum " * 40 for i in range(10_000)}}
+    agent = _make_agent(agent_class, logger)
+    agent.set_execution_tracker(
+        MockServiceFactory.create_mock_execution_tracking_service().create_tracker()
+    )
+
+    # Warm up
+    _median_run_ms(agent, small)
+
+    small_ms = _median_run_ms(agent, small)
+    large_ms = _median_run_ms(agent, large)
+
+    print(
+        f"\n  {agent_class.__name__}: small state {small_ms:.3f}ms, "
+        f"~5MB state {large_ms:.3f}ms"
+    )
+
+    # Eager formatting of the ~5MB state costs tens of milliseconds per run.
+    assert (
+        large_ms < small_ms + 2.0
+    ), f"Run time grows with state size: {large_ms:.3f}ms vs {small_ms:.3f}ms"
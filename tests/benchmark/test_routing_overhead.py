@@ -0,0 +1,129 @@
+"""
+Performance benchmark for per-call LLM routing overhead on large prompts.
+
+Models the routing work done for every routed LLM call -- prompt complexity
+analysis plus a routing cache lookup/store -- on 50KB prompts, comparing
+the old one-regex-pass-per-category matching, uncapped/unmemoized analysis,
+capped analysis, and memoized repeats.
+
+Run with: pytest -m benchmark -s tests/benchmark/
+"""
+
+import logging
+import statistics
+import time
+from unittest.mock import Mock
+
+import pytest
+
+PROMPT_BYTES = 50_000
+
+
+def _make_prompt(seed: int) -> str:
+    """Build a ~50KB prompt with keywords, questions, lists and paragraphs."""
+    paragraph = (
+        "Please analyze the API response and explain why the SQL algorithm is "
+        "slow. What changed? Provide a detailed, comprehensive review.\n"
+        "- check the JSON schema\n- compare HTTP timings\n\n"
+    )
+    body = paragraph * (PROMPT_BYTES // len(paragraph) + 1)
+    return f"Request {seed}: " + body[:PROMPT_BYTES]
+
+
+def _make_analyzer(max_analysis_chars: int, cache_size: int):
+    from agentmap.services.routing.complexity_analyzer import PromptComplexityAnalyzer
+
+    config = Mock()
+    config.get_routing_config.return_value = {
+        "complexity_analysis": {
+            "max_analysis_chars": max_analysis_chars,
+            "cache_size": cache_size,
+        },
+        "task_types": {
+            "analysis": {
+                "default_complexity": "medium",
+                "complexity_keywords": {
+                    "high": ["detailed", "comprehensive"],
+                    "critical": ["urgent", "emergency"],
+                },
+            }
+        },
+    }
+    logging_service = Mock()
+    logging_service.get_class_logger.return_value = logging.getLogger("benchmark")
+    return PromptComplexityAnalyzer(config, logging_service)
+
+
+def _make_cache():
+    from agentmap.services.routing.cache import RoutingCache
+
+    logging_service = Mock()
+    logging_service.get_class_logger.return_value = logging.getLogger("benchmark")
+    return RoutingCache(logging_service)
+
+
+def _route_once(analyzer, cache, prompt) -> float:
+    """Time one call's routing overhead (analysis + cache lookup/store)."""
+    from agentmap.services.routing.types import RoutingContext, RoutingDecision
+
+    context = RoutingContext(task_type="analysis")
+    start = time.perf_counter()
+    complexity = analyzer.determine_overall_complexity(prompt, "analysis", context)
+    if cache.get("analysis", complexity, prompt, ["anthropic", "openai"]) is None:
+        cache.put(
+            "analysis",
+            complexity,
+            prompt,
+            ["anthropic", "openai"],
+            RoutingDecision(provider="anthropic", model="m", complexity=complexity),
+        )
+    return time.perf_counter() - start
+
+
+def _time_per_pattern_passes(analyzer, prompt) -> float:
+    """Time one findall per pattern category (the pre-combined approach)."""
+    start = time.perf_counter()
+    for pattern in analyzer.patterns.values():
+        pattern.findall(prompt)
+    return (time.perf_counter() - start) * 1000
+
+
+@pytest.mark.benchmark
+class TestRoutingOverhead:
+    """Per-call routing overhead on 50KB prompts."""
+
+    N_CALLS = 30
+
+    def _median_ms(self, analyzer, prompts) -> float:
+        cache = _make_cache()
+        return (
+            statistics.median(_route_once(analyzer, cache, p) for p in prompts) * 1000
+        )
+
+    def test_large_prompt_routing_overhead(self):
+        distinct = [_make_prompt(i) for i in range(self.N_CALLS)]
+        repeated = [distinct[0]] * self.N_CALLS
+
+        uncapped = _make_analyzer(0, 0)
+        per_pattern_ms = statistics.median(
+            _time_per_pattern_passes(uncapped, p) for p in distinct
+        )
+        uncapped_ms = self._median_ms(uncapped, distinct)
+        capped_ms = self._median_ms(_make_analyzer(20_000, 0), distinct)
+        memo_analyzer = _make_analyzer(20_000, 1024)
+        memoized_ms = self._median_ms(memo_analyzer, repeated)
+
+        print(f"\n{'=' * 60}")
+        print("ROUTING OVERHEAD BENCHMARK (50KB prompts)")
+        print(f"{'=' * 60}")
+        print(f"Calls per scenario:          {self.N_CALLS}")
+        print(f"Per-pattern regex passes:    {per_pattern_ms:.3f}ms (matching only)")
+        print(f"Uncapped, no memo (median):  {uncapped_ms:.3f}ms")
+        print(f"Capped 20K, no memo:         {capped_ms:.3f}ms")
+        print(f"Capped + memoized repeats:   {memoized_ms:.3f}ms")
+        print(f"Memo cache:                  {memo_analyzer.get_cache_stats()}")
+        print(f"{'=' * 60}")
+
+        assert uncapped_ms < per_pattern_ms
+        assert capped_ms < uncapped_ms
+        assert memoized_ms < capped_ms
@@ -0,0 +1,54 @@
+"""
+Cold-start benchmark: import time of agentmap.runtime_api and DI container build.
+
+Fails when either exceeds the checked-in baseline (tests/benchmark/
+startup_baseline.json) by more than the allowed tolerance. Regenerate the
+baseline on the reference machine with:
+
+    agentmap diagnose --startup --baseline-out tests/benchmark/startup_baseline.json
+
+Run with: pytest -m benchmark -s tests/benchmark/test_startup_time.py
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from agentmap.runtime.startup_ops import compare_to_baseline, profile_startup
+
+BASELINE_PATH = Path(
+    os.environ.get(
+        "AGENTMAP_STARTUP_BASELINE", Path(__file__).parent / "startup_baseline.json"
+    )
+)
+TOLERANCE = float(os.environ.get("AGENTMAP_STARTUP_TOLERANCE", "0.5"))
+
+
+@pytest.mark.benchmark
+class TestStartupTime:
+    """Startup regressions against the recorded baseline."""
+
+    def test_startup_within_baseline(self):
+        baseline = json.loads(BASELINE_PATH.read_text())
+
+        # Best of three runs to damp filesystem-cache and scheduler noise.
+        runs = [profile_startup()["outputs"] for _ in range(3)]
+        best = {
+            "runtime_api_import_ms": min(r["runtime_api_import_ms"] for r in runs),
+            "container_build_ms": min(r["container_build_ms"] for r in runs),
+        }
+        print(
+            f"\nimport agentmap.runtime_api: {best['runtime_api_import_ms']:.1f} ms "
+            f"(baseline {baseline['runtime_api_import_ms']:.1f} ms)"
+            f"\ninitialize_di(): {best['container_build_ms']:.1f} ms "
+            f"(baseline {baseline['container_build_ms']:.1f} ms)"
+        )
+
+        regressions = compare_to_baseline(best, baseline, tolerance=TOLERANCE)
+        assert not regressions, "Startup regressed:\n" + "\n".join(regressions)
+
+    def test_runtime_api_import_stays_lazy(self):
+        outputs = profile_startup(providers=[])["outputs"]
+        assert outputs["heavy_modules_loaded"] == []
@@ -0,0 +1,105 @@
+"""
+Performance benchmark for per-node state handling versus state size.
+
+Models a 40-node workflow whose agents each record a couple of fields in
+their hooks. With plain dict state every ``set_value`` copies the whole
+state, so per-node cost grows with the number of keys; with a
+copy-on-write overlay it depends only on the keys that node changed.
+
+Run with: pytest -m benchmark -s tests/benchmark/
+"""
+
+import logging
+import statistics
+import time
+from typing import Any, Dict
+
+import pytest
+
+from agentmap.agents.base_agent import BaseAgent
+from agentmap.services.state_adapter_service import StateAdapterService
+
+NODE_COUNT = 40
+ITERATIONS = 20
+STATE_SIZES = (100, 10_000)
+
+
+class _HookAgent(BaseAgent):
+    """Records bookkeeping fields in its hooks, optionally copy-on-write."""
+
+    copy_on_write = False
+
+    def _pre_process(self, state, inputs):
+        if self.copy_on_write:
+            state = self.state_adapter_service.copy_on_write(state)
+        state = self.state_adapter_service.set_value(state, "visited", self.name)
+        return state, inputs
+
+    def _post_process(self, state, inputs, output):
+        state = self.state_adapter_service.set_value(state, "last_node", self.name)
+        return state, output
+
+    def process(self, inputs: Dict[str, Any]) -> Any:
+        return inputs["input"]
+
+
+class _NullTracking:
+    """Tracking stub so the timings measure state handling, not mocks."""
+
+    def record_node_start(self, tracker, node_name, inputs=None):
+        pass
+
+    def record_node_result(self, tracker, node_name, success, result=None, **kw):
+        pass
+
+
+def _make_agents(copy_on_write: bool):
+    tracking = _NullTracking()
+    logger = logging.getLogger("benchmark.state_overhead")
+    logger.setLevel(logging.WARNING)
+    agents = []
+    for index in range(NODE_COUNT):
+        agent = _HookAgent(
+            name=f"node_{index}",
+            prompt="",
+            context={"input_fields": ["input"], "output_field": "result"},
+            logger=logger,
+            execution_tracking_service=tracking,
+            state_adapter_service=StateAdapterService(),
+        )
+        agent.copy_on_write = copy_on_write
+        agent.set_execution_tracker(object())
+        agents.append(agent)
+    return agents
+
+
+def _per_node_us(agents, state) -> float:
+    samples = []
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        for agent in agents:
+            agent.run(state)
+        samples.append((time.perf_counter() - start) / len(agents) * 1e6)
+    return statistics.median(samples)
+
+
+@pytest.mark.benchmark
+def test_copy_on_write_node_overhead_is_independent_of_state_size():
+    results = {}
+    for copy_on_write in (False, True):
+        agents = _make_agents(copy_on_write)
+        for size in STATE_SIZES:
+            state = {f"key_{i}": i for i in range(size)}
+            state["input"] = "payload"
+            _per_node_us(agents, state)  # warm up
+            results[(copy_on_write, size)] = _per_node_us(agents, state)
+
+    print()
+    for (copy_on_write, size), per_node in sorted(results.items()):
+        mode = "copy-on-write" if copy_on_write else "dict copies"
+        print(f"  {mode:>13} {size:>6} keys: {per_node:8.1f}us per node")
+
+    small, large = STATE_SIZES
+    # Dict copies scale with the state; the overlay should not.
+    assert results[(True, large)] < results[(True, small)] * 1.5 + 10
+    assert results[(True, large)] * 3 < results[(False, large)]
@@ -393,6 +393,40 @@ edge_graph,node-with-dashes,default,Test dashes in names,Node with dashes,output
 
         self.run_with_admin_auth(run_test)
 
+    def test_list_workflows_search_and_pagination(self):
+        """Test filtering and paging the workflow list."""
+        headers = self.create_admin_headers(self.admin_api_key)
+
+        response = self.client.get(
+            "/workflows", params={"search": "graph_b"}, headers=headers
+        )
+        self.assert_response_success(response)
+        data = response.json()
+        self.assertEqual(data["total_count"], 1)
+        (workflow,) = data["workflows"]
+        self.assertEqual(workflow["name"], "complex_workflow")
+        self.assertEqual(workflow["graphs"], ["graph_b"])
+        self.assertEqual(workflow["graph_count"], 2)
+        self.assertEqual(workflow["agent_types"], ["default"])
+
+        response = self.client.get(
+            "/workflows", params={"limit": 2, "offset": 1}, headers=headers
+        )
+        self.assert_response_success(response)
+        data = response.json()
+        self.assertEqual(
+            [w["name"] for w in data["workflows"]],
+            ["edge_case_workflow", "simple_workflow"],
+        )
+        self.assertEqual(data["total_count"], 3)
+        self.assertEqual((data["offset"], data["limit"]), (1, 2))
+
+        response = self.client.get(
+            "/workflows", params={"agent_type": "llm"}, headers=headers
+        )
+        self.assert_response_success(response)
+        self.assertEqual(response.json()["total_count"], 0)
+
     def test_list_workflows_no_auth_returns_401(self):
         """Test that workflows endpoint requires authentication."""
         # Try to access workflows without authentication
@@ -91,6 +91,20 @@ class TestBudgetGuardDIWiring:
         assert isinstance(llm_service, LLMService)
         assert llm_service._budget_guard is None
 
+    def test_enabled_budget_ledger_becomes_the_default_guard(self, tmp_path):
+        """``llm.budget_ledger.enabled`` registers the built-in SQLite
+        ledger without any override."""
+        from agentmap.services.llm.budget_ledger import LocalBudgetLedger
+
+        container = _make_container()
+        container.app_config_service().get_llm_budget_ledger_config.return_value = {
+            "enabled": True,
+            "path": str(tmp_path / "ledger.sqlite3"),
+            "limits": [{"daily_limit": 1}],
+        }
+
+        assert isinstance(container.llm_service()._budget_guard, LocalBudgetLedger)
+
     def test_overriding_budget_guard_provider_wires_it_into_llm_service(self):
         """``container.budget_guard.override(...)`` is the single canonical
         registration path -- the resulting ``LLMService`` instance carries
@@ -0,0 +1,137 @@
+"""
+Unit tests for storage agents on the async execution path.
+
+process_async() should await the storage service's native async API
+(aread/awrite, aread_blob/awrite_blob) and fall back to the sync method in
+an executor only when the service has no coroutine for the operation.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from agentmap.agents.builtins.storage.blob.blob_reader_agent import BlobReaderAgent
+from agentmap.agents.builtins.storage.blob.blob_writer_agent import BlobWriterAgent
+from agentmap.agents.builtins.storage.csv.reader import CSVReaderAgent
+from agentmap.agents.builtins.storage.json.writer import JSONDocumentWriterAgent
+from agentmap.agents.builtins.storage.vector.reader import VectorReaderAgent
+from agentmap.models.storage import WriteMode
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _agent(cls, **context):
+    logging_service = MockServiceFactory.create_mock_logging_service()
+    return cls(
+        name=f"test_{cls.__name__}",
+        prompt="data/test_file",
+        context={"input_fields": ["collection"], "output_field": "out", **context},
+        logger=logging_service.get_class_logger(cls),
+        execution_tracking_service=(
+            MockServiceFactory.create_mock_execution_tracking_service()
+        ),
+        state_adapter_service=MockServiceFactory.create_mock_state_adapter_service(),
+    )
+
+
+class TestStorageAgentsAsync(unittest.TestCase):
+    def test_reader_awaits_native_aread(self):
+        service = Mock()
+        service.aread = AsyncMock(return_value=[{"id": "1"}])
+        agent = _agent(CSVReaderAgent)
+        agent.configure_csv_service(service)
+
+        result = asyncio.run(agent.process_async({"collection": "users.csv"}))
+
+        self.assertEqual(result, [{"id": "1"}])
+        service.aread.assert_awaited_once()
+        self.assertEqual(service.aread.call_args.kwargs["collection"], "users.csv")
+        service.read.assert_not_called()
+
+    def test_writer_awaits_native_awrite(self):
+        service = Mock()
+        service.awrite = AsyncMock(return_value="written")
+        agent = _agent(JSONDocumentWriterAgent)
+        agent.configure_json_service(service)
+
+        result = asyncio.run(
+            agent.process_async(
+                {"collection": "docs.json", "data": {"a": 1}, "mode": "write"}
+            )
+        )
+
+        self.assertEqual(result, "written")
+        kwargs = service.awrite.call_args.kwargs
+        self.assertEqual(kwargs["data"], {"a": 1})
+        self.assertEqual(kwargs["mode"], WriteMode.WRITE)
+
+    def test_sync_only_service_falls_back_to_executor(self):
+        service = Mock(spec=["read"])
+        service.read.return_value = [{"id": "2"}]
+        agent = _agent(CSVReaderAgent)
+        agent.configure_csv_service(service)
+
+        result = asyncio.run(agent.process_async({"collection": "users.csv"}))
+
+        self.assertEqual(result, [{"id": "2"}])
+
+    def test_async_errors_use_the_agent_error_handling(self):
+        service = Mock()
+        service.aread = AsyncMock(side_effect=RuntimeError("disk gone"))
+        agent = _agent(CSVReaderAgent)
+        agent.configure_csv_service(service)
+
+        result = asyncio.run(agent.process_async({"collection": "users.csv"}))
+
+        self.assertFalse(result.success)
+        self.assertIn("disk gone", result.error)
+
+    def test_agents_without_async_override_run_sync_operation(self):
+        service = Mock()
+        service.read.return_value = [{"content": "hit"}]
+        agent = _agent(VectorReaderAgent, input_fields=["query"])
+        agent.configure_vector_service(service)
+
+        result = asyncio.run(agent.process_async({"query": "hello"}))
+
+        self.assertEqual(result["status"], "success")
+        service.read.assert_called_once()
+
+
+class TestBlobAgentsAsync(unittest.TestCase):
+    def test_reader_awaits_aread_blob(self):
+        service = Mock()
+        service.aread_blob = AsyncMock(return_value=b"bytes")
+        agent = _agent(BlobReaderAgent)
+        agent.configure_blob_storage_service(service)
+
+        result = asyncio.run(agent.process_async({"blob_uri": "s3://b/k"}))
+
+        self.assertEqual(result, b"bytes")
+        service.read_blob.assert_not_called()
+
+    def test_writer_awaits_awrite_blob(self):
+        service = Mock()
+        service.awrite_blob = AsyncMock(return_value={"success": True})
+        agent = _agent(BlobWriterAgent)
+        agent.configure_blob_storage_service(service)
+
+        result = asyncio.run(
+            agent.process_async({"blob_uri": "s3://b/k", "data": {"a": 1}})
+        )
+
+        self.assertEqual(result, {"success": True})
+        uri, data = service.awrite_blob.call_args.args
+        self.assertEqual((uri, data[:1]), ("s3://b/k", b"{"))
+
+    def test_missing_uri_still_raises(self):
+        service = Mock()
+        service.aread_blob = AsyncMock()
+        agent = _agent(BlobReaderAgent)
+        agent.configure_blob_storage_service(service)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(agent.process_async({}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit tests for the batch mode of the CSV and JSON writer agents.
+
+With ``batch`` set (as an input or in the agent context) and a list of
+records as data, the writers call the service's transactional batch_write
+instead of write.
+"""
+
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from agentmap.agents.builtins.storage.csv.writer import CSVWriterAgent
+from agentmap.agents.builtins.storage.json.writer import JSONDocumentWriterAgent
+from agentmap.models.storage import WriteMode
+from agentmap.services.storage.json_service import JSONStorageService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _agent(cls, **context):
+    logging_service = MockServiceFactory.create_mock_logging_service()
+    return cls(
+        name=f"test_{cls.__name__}",
+        prompt="data/test_file",
+        context={"input_fields": ["collection"], "output_field": "out", **context},
+        logger=logging_service.get_class_logger(cls),
+        execution_tracking_service=(
+            MockServiceFactory.create_mock_execution_tracking_service()
+        ),
+        state_adapter_service=MockServiceFactory.create_mock_state_adapter_service(),
+    )
+
+
+class TestWriterBatchMode(unittest.TestCase):
+    def test_csv_batch_input_calls_batch_write(self):
+        service = Mock()
+        agent = _agent(CSVWriterAgent)
+        agent.configure_csv_service(service)
+        rows = [{"id": "1"}, {"id": "2"}]
+
+        agent._execute_operation(
+            "rows.csv", {"data": rows, "batch": True, "id_field": "id"}
+        )
+
+        service.write.assert_not_called()
+        service.batch_write.assert_called_once_with(
+            collection="rows.csv",
+            data=rows,
+            mode=WriteMode.APPEND,
+            id_field="id",
+            atomic=True,
+        )
+
+    def test_context_flag_enables_batch_mode(self):
+        service = Mock()
+        agent = _agent(JSONDocumentWriterAgent, batch="true", atomic="false")
+        agent.configure_json_service(service)
+
+        agent._execute_operation("docs.json", {"data": [{"id": "a"}]})
+
+        kwargs = service.batch_write.call_args.kwargs
+        self.assertFalse(kwargs["atomic"])
+        self.assertEqual(kwargs["id_field"], "id")
+
+    def test_single_record_ignores_batch_flag(self):
+        service = Mock()
+        agent = _agent(JSONDocumentWriterAgent)
+        agent.configure_json_service(service)
+
+        agent._execute_operation("docs.json", {"data": {"id": "a"}, "batch": True})
+
+        service.batch_write.assert_not_called()
+        service.write.assert_called_once()
+
+    def test_async_batch_runs_batch_write_off_the_loop(self):
+        service = Mock(spec=["batch_write"])
+        service.batch_write.return_value = "batched"
+        agent = _agent(CSVWriterAgent)
+        agent.configure_csv_service(service)
+
+        result = asyncio.run(
+            agent._execute_operation_async(
+                "rows.csv", {"data": [{"id": "1"}], "batch": True}
+            )
+        )
+
+        self.assertEqual(result, "batched")
+
+
+class TestJSONWriterBatchWithService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        config = MockServiceFactory.create_mock_storage_config_service(
+            {"json": {"enabled": True, "default_directory": self.temp_dir}}
+        )
+        self.service = JSONStorageService(
+            provider_name="json",
+            configuration=config,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_batch_returns_per_item_results(self):
+        agent = _agent(JSONDocumentWriterAgent)
+        agent.configure_json_service(self.service)
+        docs = [{"id": "a", "v": 1}, {"id": "b", "v": 2}]
+
+        result = agent._execute_operation(
+            "docs", {"data": docs, "mode": "write", "batch": True}
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual([r.document_id for r in result.item_results], ["a", "b"])
+        with open(os.path.join(self.temp_dir, "docs.json")) as f:
+            self.assertEqual(set(json.load(f)), {"a", "b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
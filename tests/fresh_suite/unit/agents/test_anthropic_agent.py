@@ -517,7 +517,9 @@ class TestAnthropicAgent(unittest.TestCase):
         self.assertTrue(len(info_calls) > 0)
 
         # Verify relevant information is logged
-        log_messages = [call[1] for call in info_calls]
+        log_messages = [
+            call[1] % call[2] if call[2] else call[1] for call in info_calls
+        ]
         prompt_logged = any("Explain constitutional AI" in msg for msg in log_messages)
         self.assertTrue(prompt_logged, f"Expected prompt logged, got: {log_messages}")
 
@@ -5,17 +5,20 @@ This test suite validates the new protocol-based dependency injection pattern
 that serves as the foundation for all AgentMap agents.
 """
 
+import logging
 import unittest
 from typing import Any, Dict
 from unittest.mock import Mock
 
 from agentmap.agents.base_agent import BaseAgent
+from agentmap.services.logging_service import lazy_log
 from agentmap.services.protocols import (
     LLMCapableAgent,
     LLMServiceProtocol,
     StorageCapableAgent,
     StorageServiceProtocol,
 )
+from agentmap.services.state_adapter_service import StateAdapterService
 from tests.utils.mock_service_factory import MockServiceFactory
 
 
@@ -486,6 +489,23 @@ class TestBaseAgent(unittest.TestCase):
                 f"Expected call {expected_call} not found in {logger_calls}",
             )
 
+    def test_log_skips_formatting_when_level_disabled(self):
+        """Disabled levels return before message arguments are rendered."""
+        logger = logging.getLogger("test_base_agent.lazy")
+        logger.setLevel(logging.INFO)
+        agent = ConcreteAgent(name="lazy_test", prompt="Test", logger=logger)
+        rendered = Mock(side_effect=lambda: "payload")
+
+        with self.assertLogs(logger, level="INFO") as captured:
+            agent.log_debug("state: %s", lazy_log(rendered))
+            agent.log_info("rendered %s", lazy_log(rendered))
+
+        self.assertEqual(rendered.call_count, 1)
+        self.assertEqual(
+            captured.records[0].getMessage(),
+            "[ConcreteAgent:lazy_test] rendered payload",
+        )
+
     def test_generic_log_method(self):
         """Test generic log method with different levels."""
         agent = ConcreteAgent(
@@ -797,6 +817,40 @@ class TestBaseAgent(unittest.TestCase):
         # Should be post-processed
         self.assertEqual(output, "post_processed: original_output")
 
+    def test_copy_on_write_state_changes_are_returned_as_updates(self):
+        """Test keys set through a copy-on-write overlay reach the update."""
+
+        class OverlayAgent(BaseAgent):
+            def _pre_process(self, state, inputs):
+                state = self.state_adapter_service.copy_on_write(state)
+                state = self.state_adapter_service.set_value(state, "seen", True)
+                return state, inputs
+
+            def _post_process(self, state, inputs, output):
+                state = self.state_adapter_service.set_value(state, "output", "old")
+                state = self.state_adapter_service.set_value(state, "count", 2)
+                return state, output
+
+            def process(self, inputs):
+                return "new"
+
+        agent = OverlayAgent(
+            name="overlay_test",
+            prompt="Test",
+            context={"input_fields": ["input"], "output_field": "output"},
+            logger=self.mock_logger,
+            execution_tracking_service=self.mock_execution_tracking_service,
+            state_adapter_service=StateAdapterService(),
+        )
+        agent.set_execution_tracker(self.mock_tracker)
+        test_state = {"input": "value", "document": "x" * 1000}
+
+        result_state = agent.run(test_state)
+
+        # Only changed keys are returned; the agent's output wins
+        self.assertEqual(result_state, {"seen": True, "count": 2, "output": "new"})
+        self.assertEqual(test_state, {"input": "value", "document": "x" * 1000})
+
     # =============================================================================
     # 9. LangGraph Compatibility Tests
     # =============================================================================
@@ -195,7 +195,9 @@ class TestEchoAgent(unittest.TestCase):
         self.assertTrue(len(info_calls) > 0)
 
         # Verify log message contains input information
-        log_messages = [call[1] for call in info_calls]
+        log_messages = [
+            call[1] % call[2] if call[2] else call[1] for call in info_calls
+        ]
         input_logged = any(
             "test_input" in msg and "test_value" in msg for msg in log_messages
         )
@@ -0,0 +1,137 @@
+"""
+Unit tests for GraphAgent map mode.
+
+With ``map_over`` set, the agent builds one subgraph state per list item,
+hands them to GraphRunnerService.run_map (run_map_async on async runs) and
+returns ordered per-item outputs with per-item errors.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, Mock
+
+from agentmap.agents.builtins.graph_agent import GraphAgent
+from agentmap.exceptions.base_exceptions import ConfigurationException
+from agentmap.models.execution.result import ExecutionResult
+from agentmap.models.graph_bundle import GraphBundle
+from agentmap.models.node import Node
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _result(final_state=None, error=None):
+    return ExecutionResult(
+        graph_name="score_item",
+        final_state=final_state or {},
+        execution_summary=None,
+        success=error is None,
+        total_duration=0.0,
+        error=error,
+    )
+
+
+class TestGraphAgentMapMode(unittest.TestCase):
+    def setUp(self):
+        self.bundle = GraphBundle.create_metadata(
+            graph_name="score_item",
+            nodes={"score": Node(name="score", agent_type="default")},
+            required_agents=set(),
+            required_services=set(),
+            function_mappings={},
+            csv_hash="hash",
+        )
+        self.runner = Mock()
+
+    def _agent(self, **context):
+        agent = GraphAgent(
+            name="score_all",
+            prompt="score_item",
+            context={"input_fields": ["items", "threshold"], **context},
+            logger=MockServiceFactory.create_mock_logging_service().get_class_logger(
+                GraphAgent
+            ),
+            execution_tracking_service=(
+                MockServiceFactory.create_mock_execution_tracking_service()
+            ),
+            state_adapter_service=MockServiceFactory.create_mock_state_adapter_service(),
+        )
+        agent.configure_graph_runner_service(self.runner)
+        return agent
+
+    def _inputs(self, items):
+        return {
+            "items": items,
+            "threshold": 0.5,
+            "subgraph_bundles": {"score_all": self.bundle},
+        }
+
+    def test_directives_in_raw_context_enable_map_mode(self):
+        agent = self._agent(
+            context="{workflow=::score_item}{map_over=items}{max_concurrency=8}"
+        )
+
+        self.assertEqual(
+            agent._map_options,
+            {"map_over": "items", "item_field": "item", "max_concurrency": 8},
+        )
+        self.assertIsNone(self._agent()._map_options)
+
+    def test_malformed_max_concurrency_names_the_node(self):
+        for value in ("x", "0", True):
+            with self.subTest(value=value):
+                with self.assertRaises(ConfigurationException) as raised:
+                    self._agent(map_over="items", max_concurrency=value)
+                self.assertIn("score_all", str(raised.exception))
+                self.assertIn("max_concurrency", str(raised.exception))
+
+    def test_builds_one_state_per_item_and_collects_ordered_results(self):
+        agent = self._agent(map_over="items", item_field="doc", output_field="score")
+        self.runner.run_map.return_value = [
+            _result({"score": 1, "doc": "a"}),
+            _result(error="model timeout"),
+            _result({"score": 3, "doc": "c"}),
+        ]
+
+        output = agent.process(self._inputs(["a", "b", "c"]))
+
+        kwargs = self.runner.run_map.call_args.kwargs
+        self.assertIs(kwargs["bundle"], self.bundle)
+        self.assertEqual(kwargs["max_concurrency"], 4)
+        self.assertEqual(
+            kwargs["item_states"],
+            [{"threshold": 0.5, "doc": item} for item in ["a", "b", "c"]],
+        )
+        self.runner.run.assert_not_called()
+        self.assertEqual(output["results"], [1, None, 3])
+        self.assertEqual(output["errors"], [{"index": 1, "error": "model timeout"}])
+        self.assertEqual((output["succeeded"], output["failed"]), (2, 1))
+        self.assertFalse(output["graph_success"])
+
+    def test_non_list_field_is_reported_as_an_error(self):
+        agent = self._agent(map_over="items")
+
+        output = agent.process(self._inputs("not a list"))
+
+        self.assertFalse(output["last_action_success"])
+        self.assertIn("must be a list", output["error"])
+        self.runner.run_map.assert_not_called()
+
+    def test_process_async_awaits_native_runner_methods(self):
+        self.runner.run_map_async = AsyncMock(return_value=[_result({"item": 1})])
+        self.runner.run_async = AsyncMock(return_value=_result({"out": "done"}))
+
+        mapped = asyncio.run(
+            self._agent(map_over="items").process_async(self._inputs([1]))
+        )
+        single = asyncio.run(
+            self._agent(output_field="out").process_async(self._inputs([1]))
+        )
+
+        self.assertEqual(mapped["results"], [{"item": 1}])
+        self.assertEqual(single, "done")
+        self.runner.run_map.assert_not_called()
+        self.runner.run.assert_not_called()
+        self.assertTrue(self.runner.run_async.call_args.kwargs["is_subgraph"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,393 @@
+"""
+Unit tests for LLM agent memory: list helpers and token-aware memory.
+
+Covers the no-copy/no-mutation contract of the list helpers, token counting
+fallback, append-only segments (including forks when resuming from an older
+reference), budgeted message building with summarization, and LLMAgent's
+``memory_strategy: token`` path.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from agentmap.agents.builtins.llm import memory as memory_module
+from agentmap.agents.builtins.llm.llm_agent import LLMAgent
+from agentmap.agents.builtins.llm.memory import (
+    MEMORY_REFERENCE_KEY,
+    ConversationMemory,
+    MemorySegmentStore,
+    add_user_message,
+    count_tokens,
+    get_memory,
+    is_memory_reference,
+)
+from agentmap.exceptions.base_exceptions import ConfigurationException
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.config.config_service import ConfigService
+from agentmap.services.protocols import LLMServiceProtocol
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+class TestListMemoryHelpers(unittest.TestCase):
+    def test_get_memory_returns_normalized_list_without_copying(self):
+        history = [{"role": "user", "content": "hi"}]
+        state = {"memory": history}
+
+        self.assertIs(get_memory(state), history)
+
+    def test_add_message_does_not_mutate_previous_list(self):
+        history = [{"role": "user", "content": "hi"}]
+        state = {"memory": history}
+
+        add_user_message(state, "again")
+
+        self.assertEqual(len(history), 1)
+        self.assertEqual([m["content"] for m in state["memory"]], ["hi", "again"])
+
+
+class TestTokenCounting(unittest.TestCase):
+    def test_heuristic_fallback_without_tokenizer(self):
+        original = dict(memory_module._encodings)
+        memory_module._encodings["no-tokenizer"] = None
+        try:
+            self.assertEqual(count_tokens("x" * 40, "no-tokenizer"), 10)
+            self.assertEqual(count_tokens("", "no-tokenizer"), 0)
+        finally:
+            memory_module._encodings.clear()
+            memory_module._encodings.update(original)
+
+
+class TestConversationMemory(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = MemorySegmentStore(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _memory(self, value=None, **kwargs):
+        kwargs.setdefault("max_tokens", 10_000)
+        return ConversationMemory.from_state(value, store=self.store, **kwargs)
+
+    def test_reference_round_trip_reads_segment_from_disk(self):
+        memory = self._memory()
+        memory.add("system", "be brief")
+        memory.add("user", "hello")
+        memory.add("assistant", "hi")
+        reference = memory.to_state()
+
+        self.assertTrue(is_memory_reference(reference))
+        self.assertEqual(reference["length"], 2)
+        fresh_store = MemorySegmentStore(self.temp_dir.name)
+        restored = ConversationMemory.from_state(reference, store=fresh_store)
+        self.assertEqual(
+            [m["content"] for m in restored.history()], ["be brief", "hello", "hi"]
+        )
+        self.assertEqual(
+            get_memory({"memory": reference}, store=fresh_store), restored.history()
+        )
+
+    def test_appending_to_older_reference_forks_segment(self):
+        memory = self._memory()
+        memory.add("user", "one")
+        old_reference = memory.to_state()
+        memory.add("user", "two")
+        new_reference = memory.to_state()
+
+        branch = self._memory(old_reference)
+        branch.add("user", "branch")
+        branch_reference = branch.to_state()
+
+        self.assertNotEqual(
+            branch_reference[MEMORY_REFERENCE_KEY], old_reference[MEMORY_REFERENCE_KEY]
+        )
+        self.assertEqual(
+            [m["content"] for m in self._memory(branch_reference).history()],
+            ["one", "branch"],
+        )
+        self.assertEqual(
+            [m["content"] for m in self._memory(new_reference).history()],
+            ["one", "two"],
+        )
+
+    def test_traversal_segment_id_is_rejected(self):
+        outside = os.path.join(self.temp_dir.name, "escaped.jsonl")
+        for segment_id in ("../escaped", "../../escaped", "a" * 32 + "\n"):
+            with self.subTest(segment_id=segment_id):
+                with self.assertRaises(ValueError):
+                    self.store.append(segment_id, 0, [{"role": "user", "content": "x"}])
+                with self.assertRaises(ValueError):
+                    self.store.read(segment_id)
+        self.assertFalse(os.path.exists(outside))
+        self.assertEqual(os.listdir(self.temp_dir.name), [])
+
+    def test_reference_store_from_state_is_ignored(self):
+        memory = self._memory()
+        memory.add("user", "hello")
+        reference = memory.to_state()
+        self.assertNotIn("store", reference)
+
+        with tempfile.TemporaryDirectory() as foreign_dir:
+            restored = self._memory({**reference, "store": foreign_dir})
+            restored.add("user", "again")
+            restored.to_state()
+
+            self.assertIs(restored.store, self.store)
+            self.assertEqual(os.listdir(foreign_dir), [])
+            self.assertIs(
+                ConversationMemory.from_state(
+                    {**reference, "store": foreign_dir}
+                ).store,
+                memory_module.get_segment_store(),
+            )
+        self.assertEqual([m["content"] for m in restored.history()], ["hello", "again"])
+
+    def test_legacy_list_is_migrated(self):
+        memory = self._memory(
+            [{"role": "system", "content": "sys"}, {"role": "user", "content": "q"}]
+        )
+
+        reference = memory.to_state()
+
+        self.assertEqual(reference["system"], [{"role": "system", "content": "sys"}])
+        self.assertEqual(reference["length"], 1)
+
+    def test_summary_rolls_up_older_turns_within_budget(self):
+        memory = self._memory(max_tokens=60, keep_recent=2)
+        for i in range(6):
+            memory.add("user" if i % 2 == 0 else "assistant", f"turn {i} " + "w" * 40)
+
+        self.assertTrue(memory.needs_summary())
+        request = memory.summary_request()
+        self.assertIn("turn 0", request[1]["content"])
+        self.assertNotIn("turn 5", request[1]["content"])
+        memory.apply_summary("short summary")
+
+        messages = memory.build_messages()
+        self.assertEqual(messages[0]["role"], "system")
+        self.assertIn("short summary", messages[0]["content"])
+        self.assertIn("turn 5", messages[-1]["content"])
+        reference = memory.to_state()
+        self.assertEqual((reference["summarized"], reference["length"]), (4, 6))
+        self.assertFalse(self._memory(reference, max_tokens=60).needs_summary())
+
+    def test_failed_summary_drops_older_turns(self):
+        memory = self._memory(max_tokens=40, keep_recent=1)
+        memory.add("user", "a" * 100)
+        memory.add("user", "b" * 10)
+        memory.summary_request()
+
+        memory.apply_summary(None)
+
+        self.assertEqual(memory.summary, "")
+        self.assertEqual([m["content"] for m in memory.build_messages()], ["b" * 10])
+
+    def test_build_messages_always_keeps_latest_turn(self):
+        memory = self._memory(max_tokens=5, keep_recent=10)
+        memory.add("user", "old")
+        memory.add("user", "x" * 400)
+
+        self.assertEqual([m["content"] for m in memory.build_messages()], ["x" * 400])
+
+
+class TestSegmentRetention(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _segment(self, store, age_seconds):
+        segment_id, _ = store.append(None, 0, [{"role": "user", "content": "hi"}])
+        stamp = time.time() - age_seconds
+        os.utime(store._path(segment_id), (stamp, stamp))
+        return segment_id
+
+    def test_prune_deletes_expired_then_oldest_segments(self):
+        store = MemorySegmentStore(self.temp_dir.name, ttl_seconds=3600, max_files=2)
+        expired = self._segment(store, 7200)
+        oldest, middle, newest = (self._segment(store, age) for age in (30, 20, 10))
+
+        self.assertEqual(store.prune(), 2)
+
+        remaining = {p.stem for p in store.directory.glob("*.jsonl")}
+        self.assertEqual(remaining, {middle, newest})
+        self.assertEqual(store.read(expired), [])
+        self.assertEqual(store.read(oldest), [])
+
+    def test_forked_segments_are_subject_to_retention(self):
+        store = MemorySegmentStore(self.temp_dir.name, ttl_seconds=0, max_files=1)
+        memory = ConversationMemory.from_state(None, store=store)
+        memory.add("user", "one")
+        old_reference = memory.to_state()
+        memory.add("user", "two")
+        memory.to_state()
+
+        branch = ConversationMemory.from_state(old_reference, store=store)
+        branch.add("user", "branch")
+        with patch.object(memory_module, "_PRUNE_INTERVAL_SECONDS", 0):
+            branch_reference = branch.to_state()
+
+        self.assertEqual(
+            [p.stem for p in store.directory.glob("*.jsonl")],
+            [branch_reference[MEMORY_REFERENCE_KEY]],
+        )
+
+    def test_pruned_segment_keeps_summary_and_continues(self):
+        store = MemorySegmentStore(self.temp_dir.name)
+        memory = ConversationMemory.from_state(None, store=store, keep_recent=1)
+        memory.add("user", "old question")
+        memory.add("assistant", "old answer")
+        memory.summary_request()
+        memory.apply_summary("talked about old things")
+        reference = memory.to_state()
+        store._path(reference[MEMORY_REFERENCE_KEY]).unlink()
+
+        restored = ConversationMemory.from_state(
+            reference, store=MemorySegmentStore(self.temp_dir.name)
+        )
+        restored.add("user", "new question")
+        new_reference = restored.to_state()
+
+        self.assertEqual((new_reference["summarized"], new_reference["length"]), (0, 1))
+        contents = [m["content"] for m in restored.build_messages()]
+        self.assertIn("talked about old things", contents[0])
+        self.assertEqual(contents[-1], "new question")
+
+
+def _make_app_config(memory=None):
+    config_service = Mock(spec=ConfigService)
+    config_service.load_config.return_value = {
+        "paths": {"cache": "/var/cache/agentmap"},
+        "llm": {"memory": memory} if memory is not None else {},
+    }
+
+    def get_value(config_data, path, default=None):
+        current = config_data
+        for part in path.split("."):
+            if not isinstance(current, dict) or part not in current:
+                return default
+            current = current[part]
+        return current
+
+    config_service.get_value_from_config.side_effect = get_value
+    return AppConfigService(config_service=config_service, config_path="test.yaml")
+
+
+class TestLLMMemoryConfig(unittest.TestCase):
+    def test_defaults_live_under_cache_path(self):
+        config = _make_app_config().get_llm_memory_config()
+
+        self.assertEqual(
+            config["segment_dir"],
+            os.path.join("/var/cache/agentmap", "memory_segments"),
+        )
+        self.assertEqual(config["segment_ttl_seconds"], 7 * 86400)
+        self.assertEqual(config["max_segment_files"], 10000)
+
+    def test_invalid_values_raise(self):
+        for memory in ("nope", {"max_segment_files": -1}, {"segment_ttl_seconds": "x"}):
+            with self.subTest(memory=memory):
+                with self.assertRaises(ConfigurationException):
+                    _make_app_config(memory).get_llm_memory_config()
+
+
+class TestLLMAgentTokenMemory(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.llm_service = Mock(spec=LLMServiceProtocol)
+        self.llm_service.call_llm.side_effect = self._call_llm
+        self.calls = []
+        self.agent = LLMAgent(
+            name="chat",
+            prompt="You are helpful.",
+            context={
+                "input_fields": ["prompt"],
+                "output_field": "response",
+                "provider": "openai",
+                "model": "gpt-4",
+                "memory_max_tokens": 80,
+                "memory_keep_recent": 2,
+                "memory_segment_dir": self.temp_dir.name,
+            },
+            logger=MockServiceFactory.create_mock_logging_service().get_class_logger(
+                LLMAgent
+            ),
+        )
+        self.agent.configure_llm_service(self.llm_service)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _call_llm(self, **kwargs):
+        self.calls.append(kwargs)
+        if kwargs.get("routing_context", {}).get("task_type") == "summarization":
+            return "the user asked several questions"
+        return "answer " + "z" * 60
+
+    def test_state_holds_reference_and_history_is_summarized(self):
+        memory_value = None
+        for i in range(4):
+            inputs = {"prompt": f"question {i}"}
+            if memory_value is not None:
+                inputs["memory"] = memory_value
+            result = self.agent.process(inputs)
+            memory_value = result["memory"]
+            self.assertTrue(is_memory_reference(memory_value))
+
+        self.assertEqual(self.agent.memory_strategy, "token")
+        summary_calls = [c for c in self.calls if "routing_context" in c]
+        self.assertTrue(summary_calls)
+        self.assertEqual(
+            summary_calls[0]["routing_context"]["complexity_override"], "low"
+        )
+        self.assertEqual(memory_value["summary"], "the user asked several questions")
+        self.assertEqual(memory_value["length"], 8)
+
+        last_messages = self.calls[-1]["messages"]
+        self.assertEqual(
+            last_messages[0], {"role": "system", "content": "You are helpful."}
+        )
+        self.assertIn("Summary", last_messages[1]["content"])
+        self.assertEqual(last_messages[-1]["content"], "question 3")
+
+    def test_default_strategy_keeps_message_list(self):
+        agent = LLMAgent(
+            name="chat",
+            prompt="p",
+            context={"input_fields": ["prompt"], "provider": "openai"},
+            logger=Mock(),
+        )
+        agent.configure_llm_service(self.llm_service)
+
+        result = agent.process({"prompt": "hi"})
+
+        self.assertEqual(agent.memory_strategy, "messages")
+        self.assertIsInstance(result["memory"], list)
+
+    def test_segment_store_comes_from_llm_memory_config(self):
+        del self.agent.context["memory_segment_dir"]
+        segment_dir = os.path.join(self.temp_dir.name, "configured")
+        self.llm_service.get_memory_segment_config = Mock(
+            return_value={
+                "segment_dir": segment_dir,
+                "segment_ttl_seconds": 60,
+                "max_segment_files": 5,
+            }
+        )
+
+        result = self.agent.process({"prompt": "hi"})
+
+        segment_id = result["memory"][MEMORY_REFERENCE_KEY]
+        self.assertTrue(
+            os.path.exists(os.path.join(segment_dir, f"{segment_id}.jsonl"))
+        )
+        store = memory_module.get_segment_store(segment_dir)
+        self.assertEqual((store.ttl_seconds, store.max_files), (60, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+Unit tests for WarmStartSnapshotService and its use by DeclarationRegistryService.
+
+Covers snapshot keying on config contents, per-section dependency
+validation, corrupt/disabled (the default) snapshots and a declaration
+registry round trip.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from agentmap.models.declaration_models import (
+    AgentDeclaration,
+    ProtocolRequirement,
+    ServiceDeclaration,
+    ServiceRequirement,
+)
+from agentmap.services.config.warm_start_snapshot_service import (
+    WarmStartSnapshotService,
+)
+from agentmap.services.declaration_registry_service import DeclarationRegistryService
+from agentmap.services.declaration_sources.base import DeclarationSource
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+class _CountingSource(DeclarationSource):
+    """Declaration source backed by a file, counting how often it is parsed."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.loads = 0
+
+    def load_agents(self):
+        self.loads += 1
+        return {
+            "echo": AgentDeclaration(
+                agent_type="echo",
+                class_path="pkg.EchoAgent",
+                service_requirements=[ServiceRequirement("llm_service", True)],
+                protocol_requirements=[
+                    ProtocolRequirement("LLMCapableAgent", implements=True)
+                ],
+                capabilities={"b", "a"},
+                source=self.path.read_text(),
+            )
+        }
+
+    def load_services(self):
+        return {
+            "llm_service": ServiceDeclaration(
+                service_name="llm_service",
+                class_path="pkg.LLMService",
+                implements_protocols=["LLMServiceProtocol"],
+            )
+        }
+
+    def get_source_files(self):
+        return [self.path]
+
+
+class TestWarmStartSnapshotService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        self.snapshot_path = self.root / "cache" / "warm_start_snapshot.json"
+        self.config_file = self.root / "agentmap_config.yaml"
+        self.config_file.write_text("logging: {}\n")
+        self.logging_service = MockServiceFactory.create_mock_logging_service()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_snapshot(self, **kwargs):
+        kwargs.setdefault("config_files", [self.config_file])
+        kwargs.setdefault("enabled", True)
+        return WarmStartSnapshotService(
+            snapshot_path=self.snapshot_path,
+            logging_service=self.logging_service,
+            **kwargs,
+        )
+
+    def test_section_round_trip_across_instances(self):
+        self.assertIsNone(self._make_snapshot().load_section("s"))
+
+        self.assertTrue(self._make_snapshot().save_section("s", {"x": 1}))
+
+        reloaded = self._make_snapshot()
+        self.assertEqual(reloaded.load_section("s"), {"x": 1})
+        self.assertEqual(reloaded.get_snapshot_info()["sections"], ["s"])
+
+    def test_config_change_makes_snapshot_stale(self):
+        self._make_snapshot().save_section("s", {"x": 1})
+
+        self.config_file.write_text("logging: {level: DEBUG}\n")
+
+        self.assertIsNone(self._make_snapshot().load_section("s"))
+
+    def test_dependency_change_invalidates_only_that_section(self):
+        dep = self.root / "custom_agents.yaml"
+        dep.write_text("agents: {}\n")
+        snapshot = self._make_snapshot()
+        snapshot.save_section("deps", {"v": 1}, [dep])
+        snapshot.save_section("other", {"v": 2})
+
+        dep.write_text("agents: {a: {}}\n")
+
+        reloaded = self._make_snapshot()
+        self.assertIsNone(reloaded.load_section("deps", [dep]))
+        self.assertEqual(reloaded.load_section("other"), {"v": 2})
+
+    def test_corrupt_snapshot_is_ignored_and_rebuilt(self):
+        self.snapshot_path.parent.mkdir(parents=True)
+        self.snapshot_path.write_text("{not json")
+
+        snapshot = self._make_snapshot()
+        self.assertIsNone(snapshot.load_section("s"))
+        self.assertTrue(snapshot.save_section("s", {"ok": True}))
+        self.assertEqual(self._make_snapshot().load_section("s"), {"ok": True})
+
+    def test_disabled_snapshot_never_reads_or_writes(self):
+        snapshot = self._make_snapshot(enabled=False)
+
+        self.assertFalse(snapshot.save_section("s", {"x": 1}))
+        self.assertIsNone(snapshot.load_section("s"))
+        self.assertFalse(self.snapshot_path.exists())
+
+    def test_snapshot_is_opt_in(self):
+        snapshot = WarmStartSnapshotService(
+            snapshot_path=self.snapshot_path, logging_service=self.logging_service
+        )
+
+        self.assertFalse(snapshot.enabled)
+        self.assertFalse(snapshot.save_section("s", {"x": 1}))
+        self.assertFalse(self.snapshot_path.exists())
+
+    def test_invalidate_removes_file(self):
+        snapshot = self._make_snapshot()
+        snapshot.save_section("s", {"x": 1})
+
+        snapshot.invalidate()
+
+        self.assertFalse(self.snapshot_path.exists())
+        self.assertIsNone(snapshot.load_section("s"))
+
+    def test_declaration_registry_restores_from_snapshot(self):
+        source_file = self.root / "decls.yaml"
+        source_file.write_text("v1")
+
+        def make_registry():
+            registry = DeclarationRegistryService(
+                MockServiceFactory.create_mock_app_config_service(),
+                self.logging_service,
+                snapshot_service=self._make_snapshot(),
+            )
+            source = _CountingSource(source_file)
+            registry.add_source(source)
+            return registry, source
+
+        first, first_source = make_registry()
+        first.load_all()
+        self.assertEqual(first_source.loads, 1)
+
+        second, second_source = make_registry()
+        second.load_all()
+        self.assertEqual(second_source.loads, 0)
+        restored = second.get_agent_declaration("echo")
+        self.assertEqual(restored, first.get_agent_declaration("echo"))
+        self.assertEqual(restored.capabilities, {"a", "b"})
+        self.assertEqual(
+            second.get_protocol_service_map(), {"LLMServiceProtocol": "llm_service"}
+        )
+
+        source_file.write_text("v2")
+        third, third_source = make_registry()
+        third.load_all()
+        self.assertEqual(third_source.loads, 1)
+        self.assertEqual(third.get_agent_declaration("echo").source, "v2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,290 @@
+"""
+Unit tests for LocalBudgetLedger, the SQLite-backed LLMBudgetGuardProtocol.
+
+Covers reserve-then-settle against daily limits, per-tenant/per-graph
+scoping, reconciliation through the guard protocol (including reservations
+shared by the tasks of one hedged call), expiry of unsettled
+reservations, thread- and process-level atomicity, and spend reports.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from decimal import Decimal
+
+from agentmap.exceptions.service_exceptions import LLMBudgetExceededError
+from agentmap.models.llm_cost import LLMBudgetCheck, LLMCostBreakdown, LLMModelRates
+from agentmap.models.llm_execution import LLMResponse
+from agentmap.services.llm.budget_ledger import (
+    LocalBudgetLedger,
+    budget_scope,
+    call_reservations,
+    current_budget_scope,
+)
+from agentmap.services.protocols import LLMBudgetGuardProtocol
+from tests.utils.mock_service_factory import MockServiceFactory
+
+RATES = LLMModelRates(
+    currency="USD", input_per_1m=Decimal("1"), output_per_1m=Decimal("2")
+)
+
+
+def _ledger(path, limits, **overrides):
+    config = {"path": path, "limits": limits, **overrides}
+    return LocalBudgetLedger(config, MockServiceFactory.create_mock_logging_service())
+
+
+def _check(max_output_cost="0.5", model="m", attempt_kind="primary", rates=RATES):
+    return LLMBudgetCheck(
+        resolved_provider="p",
+        resolved_model=model,
+        rates=rates,
+        catalog_version="v1",
+        max_output_tokens=None,
+        max_possible_output_cost=Decimal(max_output_cost),
+        message_count=1,
+        input_chars=0,
+        attempt_kind=attempt_kind,
+    )
+
+
+def _receipt(cost, model="m"):
+    breakdown = LLMCostBreakdown(
+        total_cost=Decimal(cost),
+        currency="USD",
+        catalog_version="v1",
+        input_cost=Decimal(0),
+        output_cost=Decimal(cost),
+        cache_write_cost=Decimal(0),
+        cache_read_cost=Decimal(0),
+    )
+    return LLMResponse(
+        text="", resolved_provider="p", resolved_model=model, cost=breakdown
+    )
+
+
+def _reserve_in_process(path, results):
+    ledger = _ledger(path, [{"daily_limit": 10}])
+    for _ in range(5):
+        try:
+            ledger.reserve(Decimal(1), "p", "m")
+            results.put(True)
+        except LLMBudgetExceededError:
+            results.put(False)
+
+
+class TestLocalBudgetLedger(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "ledger.sqlite3")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _status(self, ledger, **scope):
+        return ledger.get_budget_status(**scope)[0]
+
+    def test_implements_budget_guard_protocol(self):
+        self.assertIsInstance(_ledger(self.path, []), LLMBudgetGuardProtocol)
+
+    def test_reservations_are_refused_once_the_limit_is_reached(self):
+        ledger = _ledger(self.path, [{"daily_limit": "1.0"}])
+
+        ledger.reserve(Decimal("0.6"), "p", "m")
+        with self.assertRaises(LLMBudgetExceededError) as ctx:
+            ledger.reserve(Decimal("0.6"), "p", "m")
+
+        self.assertIn("all spend", str(ctx.exception))
+        status = self._status(ledger)
+        self.assertEqual(status["reserved"], Decimal("0.6"))
+        self.assertEqual(status["remaining"], Decimal("0.4"))
+
+    def test_receipt_settles_reservation_at_actual_cost(self):
+        ledger = _ledger(self.path, [{"daily_limit": 1}])
+
+        async def call():
+            await ledger.check_before_dispatch(_check("0.9"))
+            await ledger.observe_receipt(_receipt("0.1"))
+
+        asyncio.run(call())
+
+        status = self._status(ledger)
+        self.assertEqual(status["settled"], Decimal("0.1"))
+        self.assertEqual(status["reserved"], Decimal(0))
+        # The estimate no longer blocks further calls.
+        asyncio.run(ledger.check_before_dispatch(_check("0.8")))
+
+    def test_failed_tier_reservation_is_released_with_the_receipt(self):
+        ledger = _ledger(self.path, [{"daily_limit": 5}])
+
+        async def call_with_fallback():
+            await ledger.check_before_dispatch(_check("1", model="primary"))
+            await ledger.check_before_dispatch(
+                _check("1", model="fallback", attempt_kind="fallback")
+            )
+            await ledger.observe_receipt(_receipt("0.25", model="fallback"))
+
+        asyncio.run(call_with_fallback())
+
+        status = self._status(ledger)
+        self.assertEqual((status["settled"], status["reserved"]), (Decimal("0.25"), 0))
+        report = ledger.spend_report(group_by=("model",))
+        self.assertEqual(
+            [(r["model"], r["cost"]) for r in report], [("fallback", Decimal("0.25"))]
+        )
+
+    def test_call_reservations_are_shared_with_child_tasks(self):
+        ledger = _ledger(self.path, [{"daily_limit": 5}])
+
+        async def hedged_call():
+            async with call_reservations():
+                await asyncio.gather(
+                    asyncio.ensure_future(
+                        ledger.check_before_dispatch(_check("1", model="slow"))
+                    ),
+                    asyncio.ensure_future(
+                        ledger.check_before_dispatch(
+                            _check("1", model="fast", attempt_kind="hedge")
+                        )
+                    ),
+                )
+                await ledger.observe_receipt(_receipt("0.25", model="fast"))
+
+        asyncio.run(hedged_call())
+
+        status = self._status(ledger)
+        self.assertEqual((status["settled"], status["reserved"]), (Decimal("0.25"), 0))
+
+    def test_call_without_receipt_releases_its_reservations(self):
+        ledger = _ledger(self.path, [{"daily_limit": 5}])
+
+        async def failed_call():
+            async with call_reservations():
+                await ledger.check_before_dispatch(_check("1"))
+                raise RuntimeError("provider down")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(failed_call())
+
+        self.assertEqual(self._status(ledger)["reserved"], Decimal(0))
+
+    def test_receipt_never_settles_another_calls_reservation(self):
+        ledger = _ledger(self.path, [{"daily_limit": 5}])
+        other = ledger.reserve(Decimal(1), "p", "m")
+
+        asyncio.run(ledger.observe_receipt(_receipt("0.25")))
+
+        status = self._status(ledger)
+        self.assertEqual((status["settled"], status["reserved"]), (Decimal("0.25"), 1))
+        ledger.release([other])
+
+    def test_limits_apply_per_tenant_and_per_graph(self):
+        ledger = _ledger(
+            self.path,
+            [
+                {"tenant": "*", "daily_limit": 1},
+                {"tenant": "acme", "graph": "Report", "daily_limit": "0.3"},
+            ],
+        )
+
+        async def spend(tenant, graph, amount):
+            with budget_scope(tenant=tenant):
+                with budget_scope(graph=graph):
+                    self.assertEqual(current_budget_scope(), (tenant, graph))
+                    await ledger.check_before_dispatch(_check(amount))
+                    await ledger.observe_receipt(_receipt(amount))
+
+        asyncio.run(spend("acme", "Chat", "0.9"))
+        asyncio.run(spend("globex", "Chat", "0.9"))
+        with self.assertRaises(LLMBudgetExceededError):
+            asyncio.run(spend("acme", "Report", "0.2"))
+        self.assertEqual(current_budget_scope(), ("default", "default"))
+
+        rows = ledger.spend_report(group_by=("tenant",))
+        self.assertEqual(
+            [(r["tenant"], r["cost"], r["calls"]) for r in rows],
+            [("acme", Decimal("0.9"), 1), ("globex", Decimal("0.9"), 1)],
+        )
+        self.assertEqual(
+            [s["scope"] for s in ledger.get_budget_status("acme", "Report")],
+            ["tenant=acme", "tenant=acme, graph=Report"],
+        )
+
+    def test_unsettled_reservations_expire(self):
+        ledger = _ledger(self.path, [{"daily_limit": 1}], reservation_ttl_seconds=0.05)
+        ledger.reserve(Decimal(1), "p", "m")
+        with self.assertRaises(LLMBudgetExceededError):
+            ledger.reserve(Decimal(1), "p", "m")
+
+        time.sleep(0.1)
+        ledger.reserve(Decimal(1), "p", "m")
+
+    def test_unpriced_calls_follow_policy(self):
+        allow = _ledger(self.path, [{"daily_limit": 0}])
+        asyncio.run(allow.check_before_dispatch(_check(rates=None)))
+
+        deny = _ledger(self.path, [], unpriced="deny")
+        with self.assertRaises(LLMBudgetExceededError):
+            asyncio.run(deny.check_before_dispatch(_check(rates=None)))
+
+    def test_estimate_uses_input_size_and_default_output_bound(self):
+        ledger = _ledger(self.path, [], default_output_tokens=1000)
+        check = LLMBudgetCheck(
+            resolved_provider="p",
+            resolved_model="m",
+            rates=RATES,
+            catalog_version=None,
+            max_output_tokens=None,
+            max_possible_output_cost=None,
+            message_count=1,
+            input_chars=4000,
+            attempt_kind="fallback",
+        )
+
+        # 1000 input tokens at $1/M plus 1000 output tokens at $2/M.
+        self.assertEqual(ledger.estimate_cost(check), Decimal("0.003"))
+
+    def test_concurrent_threads_never_overshoot(self):
+        ledger = _ledger(self.path, [{"daily_limit": 10}])
+        granted = []
+
+        def worker():
+            for _ in range(5):
+                try:
+                    ledger.reserve(Decimal(1), "p", "m")
+                    granted.append(True)
+                except LLMBudgetExceededError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(granted), 10)
+
+    def test_concurrent_processes_never_overshoot(self):
+        _ledger(self.path, [])
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        processes = [
+            ctx.Process(target=_reserve_in_process, args=(self.path, results))
+            for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        outcomes = [results.get(timeout=30) for _ in range(20)]
+        for process in processes:
+            process.join()
+
+        self.assertEqual(outcomes.count(True), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+"""
+Unit tests for hedged LLM requests (services/llm/hedging.py).
+
+Covers the per-route percentile delay, the primary/hedge race (winner
+selection, loser cancellation, error fallthrough), the hedge-rate cap,
+budget-guard refusals, and LLMService wiring through the fallback ladder.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from agentmap.models.llm_execution import LLMResponse
+from agentmap.services.llm._budget_guard_refusal import BudgetGuardRefusal
+from agentmap.services.llm.hedging import HedgeConfig, LLMHedgeController
+from agentmap.services.llm_service import LLMService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _controller(**overrides) -> LLMHedgeController:
+    settings = {
+        "enabled": True,
+        "initial_delay_seconds": 0.02,
+        "min_delay_seconds": 0.0,
+        "max_hedge_rate": 1.0,
+        "min_samples": 3,
+    }
+    settings.update(overrides)
+    return LLMHedgeController(HedgeConfig.from_dict(settings))
+
+
+def _after(seconds, value=None, error=None, cancelled=None):
+    async def run():
+        try:
+            await asyncio.sleep(seconds)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(value)
+            raise
+        if error is not None:
+            raise error
+        return value
+
+    return run
+
+
+class TestHedgeDelay:
+    def test_initial_delay_until_min_samples(self):
+        controller = _controller(initial_delay_seconds=1.5)
+        controller.record_latency("openai", "gpt", 0.1)
+
+        assert controller.hedge_delay("openai", "gpt") == 1.5
+
+    def test_percentile_of_route_latencies_clamped(self):
+        controller = _controller(percentile=90, max_delay_seconds=5.0)
+        for seconds in [0.1 * i for i in range(1, 11)]:
+            controller.record_latency("openai", "gpt", seconds)
+        controller.record_latency("openai", "slow", 60.0)
+
+        assert controller.hedge_delay("openai", "gpt") == pytest.approx(0.9)
+        assert controller.hedge_delay("anthropic", "other") == 0.02
+        assert controller.hedge_delay("openai", "slow") == 0.02  # < min_samples
+
+    def test_defaults_are_disabled(self):
+        assert HedgeConfig.from_dict(None).enabled is False
+
+
+class TestHedgeRace:
+    def test_fast_primary_never_hedges(self):
+        controller = _controller()
+        hedge = Mock()
+
+        result = asyncio.run(controller.run("p", "m", _after(0, "primary"), hedge))
+
+        assert result == "primary"
+        hedge.assert_not_called()
+        assert controller.get_stats()["p:m"]["hedges"] == 0
+
+    def test_hedge_wins_and_primary_is_cancelled(self):
+        controller = _controller()
+        cancelled = []
+
+        result = asyncio.run(
+            controller.run(
+                "p",
+                "m",
+                _after(5, "primary", cancelled=cancelled),
+                _after(0, "hedge"),
+            )
+        )
+
+        assert result == "hedge"
+        assert cancelled == ["primary"]
+        stats = controller.get_stats()["p:m"]
+        assert (stats["calls"], stats["hedges"], stats["hedge_wins"]) == (1, 1, 1)
+
+    def test_primary_wins_and_hedge_is_cancelled(self):
+        controller = _controller()
+        cancelled = []
+
+        result = asyncio.run(
+            controller.run(
+                "p",
+                "m",
+                _after(0.05, "primary"),
+                _after(5, "hedge", cancelled=cancelled),
+            )
+        )
+
+        assert result == "primary"
+        assert cancelled == ["hedge"]
+        assert controller.get_stats()["p:m"]["hedge_wins"] == 0
+
+    def test_hedge_rescues_failed_primary(self):
+        controller = _controller()
+
+        result = asyncio.run(
+            controller.run(
+                "p",
+                "m",
+                _after(0.05, error=RuntimeError("primary down")),
+                _after(0.1, "hedge"),
+            )
+        )
+
+        assert result == "hedge"
+
+    def test_both_failing_raises_primary_error(self):
+        controller = _controller()
+
+        with pytest.raises(RuntimeError, match="primary down"):
+            asyncio.run(
+                controller.run(
+                    "p",
+                    "m",
+                    _after(0.05, error=RuntimeError("primary down")),
+                    _after(0, error=ValueError("hedge down")),
+                )
+            )
+
+    def test_budget_refused_hedge_keeps_waiting_on_primary(self):
+        outcomes = []
+        controller = LLMHedgeController(
+            _controller().config, on_outcome=lambda p, m, o: outcomes.append(o)
+        )
+
+        result = asyncio.run(
+            controller.run(
+                "p",
+                "m",
+                _after(0.05, "primary"),
+                _after(0, error=BudgetGuardRefusal(RuntimeError("over budget"))),
+            )
+        )
+
+        assert result == "primary"
+        assert outcomes == ["fired", "budget_refused"]
+        assert controller.get_stats()["p:m"]["budget_refused"] == 1
+
+    def test_hedge_rate_is_capped_per_route(self):
+        controller = _controller(max_hedge_rate=0.5, min_samples=100)
+        hedge = Mock(side_effect=_after(0, "hedge"))
+
+        async def run_calls():
+            return [
+                await controller.run("p", "m", _after(0.04, "primary"), hedge)
+                for _ in range(4)
+            ]
+
+        results = asyncio.run(run_calls())
+
+        assert hedge.call_count == 2
+        assert results.count("hedge") == 2
+        stats = controller.get_stats()["p:m"]
+        assert stats["hedge_rate"] == 0.5
+        assert stats["rate_limited"] == 2
+
+
+class TestLLMServiceHedging:
+    def _service(self, budget_guard=None):
+        config = MockServiceFactory.create_mock_app_config_service()
+        config.get_llm_resilience_config.return_value = {
+            "retry": {"max_attempts": 1},
+            "circuit_breaker": {"failure_threshold": 5, "reset_timeout": 60},
+            "hedging": {
+                "enabled": True,
+                "initial_delay_seconds": 0.02,
+                "max_hedge_rate": 1.0,
+            },
+        }
+        features_registry = Mock()
+        features_registry.is_provider_available.return_value = True
+        features_registry.get_available_providers.return_value = []
+        routing_config = Mock()
+        routing_config.fallback = {"default_provider": "anthropic"}
+        routing_config.routing_matrix = {"anthropic": {"low": "claude-haiku"}}
+        routing_config.supports_prompt_caching.return_value = False
+        service = LLMService(
+            configuration=config,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            routing_service=Mock(),
+            llm_models_config_service=(
+                MockServiceFactory.create_mock_llm_models_config_service()
+            ),
+            features_registry_service=features_registry,
+            routing_config_service=routing_config,
+            budget_guard=budget_guard,
+        )
+        service._provider_utils.normalize_provider = Mock(side_effect=lambda p: p)
+        service._provider_utils.get_provider_config = Mock(
+            side_effect=lambda provider: {"model": f"{provider}-default"}
+        )
+        service._message_utils.convert_messages_to_langchain = Mock(
+            return_value=[Mock()]
+        )
+
+        async def slow_primary(messages):
+            await asyncio.sleep(0.2)
+            return Mock(content="primary response")
+
+        primary_client = Mock()
+        primary_client.ainvoke = AsyncMock(side_effect=slow_primary)
+        hedge_client = Mock()
+        hedge_client.ainvoke = AsyncMock(return_value=Mock(content="hedge response"))
+        service._client_factory.get_or_create_client = Mock(
+            side_effect=lambda provider, config: (
+                primary_client if provider == "openai" else hedge_client
+            )
+        )
+        return service
+
+    async def _call(self, service) -> LLMResponse:
+        return await service.call_llm_async(
+            messages=[{"role": "user", "content": "hello"}],
+            provider="openai",
+            model="gpt-4o-mini",
+        )
+
+    def test_slow_primary_is_hedged_to_first_ladder_tier(self):
+        service = self._service()
+
+        result = asyncio.run(self._call(service))
+
+        assert result.text == "hedge response"
+        assert (result.resolved_provider, result.resolved_model) == (
+            "anthropic",
+            "claude-haiku",
+        )
+        assert service.get_hedge_stats()["openai:gpt-4o-mini"]["hedge_wins"] == 1
+
+    def test_budget_guard_sees_and_can_refuse_the_hedge(self):
+        guard = Mock()
+        attempt_kinds = []
+
+        async def check(budget_check):
+            attempt_kinds.append(budget_check.attempt_kind)
+            if budget_check.attempt_kind == "hedge":
+                raise RuntimeError("hedge would exceed the cap")
+
+        guard.check_before_dispatch = AsyncMock(side_effect=check)
+        guard.observe_receipt = AsyncMock()
+        service = self._service(budget_guard=guard)
+
+        result = asyncio.run(self._call(service))
+
+        assert result.text == "primary response"
+        assert attempt_kinds == ["primary", "hedge"]
+        assert service.get_hedge_stats()["openai:gpt-4o-mini"]["budget_refused"] == 1
+
+    def test_budget_ledger_settles_the_winner_and_releases_the_loser(self, tmp_path):
+        import sqlite3
+
+        from agentmap.services.llm.budget_ledger import LocalBudgetLedger
+
+        path = str(tmp_path / "ledger.sqlite3")
+        ledger = LocalBudgetLedger(
+            {"path": path, "limits": [{"daily_limit": 100}]},
+            MockServiceFactory.create_mock_logging_service(),
+        )
+        service = self._service(budget_guard=ledger)
+
+        result = asyncio.run(self._call(service))
+
+        assert result.text == "hedge response"
+        with sqlite3.connect(path) as conn:
+            rows = sorted(
+                conn.execute(
+                    "SELECT provider, model, attempt_kind, status FROM budget_ledger"
+                ).fetchall()
+            )
+        assert rows == [
+            ("anthropic", "claude-haiku", "hedge", "settled"),
+            ("openai", "gpt-4o-mini", "primary", "released"),
+        ]
@@ -5,11 +5,18 @@ These tests validate the routing decision caching system using actual interface
 and follow the established MockServiceFactory patterns for consistent testing.
 """
 
+import os
+import tempfile
+import threading
 import time
 import unittest
 from unittest.mock import patch
 
-from agentmap.services.routing.cache import CacheEntry, RoutingCache
+from agentmap.services.routing.cache import (
+    CacheEntry,
+    RoutingCache,
+    SQLiteRoutingCacheBackend,
+)
 from agentmap.services.routing.types import RoutingDecision, TaskComplexity
 from tests.utils.mock_service_factory import MockServiceFactory
 
@@ -97,7 +104,7 @@ class TestRoutingCache(unittest.TestCase):
 
         # Verify internal state
         self.assertEqual(self.cache._cache, {})
-        self.assertEqual(self.cache._access_order, [])
+        self.assertIsNone(self.cache._backend)
 
         # Verify statistics
         self.assertEqual(self.cache._hits, 0)
@@ -276,7 +283,6 @@ class TestRoutingCache(unittest.TestCase):
 
         expired_entry = CacheEntry(decision=decision, timestamp=expired_time)
         self.cache._cache[cache_key] = expired_entry
-        self.cache._access_order.append(cache_key)
 
         # Try to get with short TTL
         result = self.cache.get(
@@ -319,7 +325,7 @@ class TestRoutingCache(unittest.TestCase):
             [],
             True,
         )
-        self.assertEqual(self.cache._access_order[-1], key1)
+        self.assertEqual(list(self.cache._cache)[-1], key1)
 
     # =============================================================================
     # 4. Cache Put Operations Tests
@@ -346,7 +352,6 @@ class TestRoutingCache(unittest.TestCase):
 
         # Verify entry was stored
         self.assertEqual(len(self.cache._cache), 1)
-        self.assertEqual(len(self.cache._access_order), 1)
 
         # Verify we can retrieve it
         result = self.cache.get(
@@ -439,7 +444,6 @@ class TestRoutingCache(unittest.TestCase):
 
         # Verify cache is empty
         self.assertEqual(len(self.cache._cache), 0)
-        self.assertEqual(len(self.cache._access_order), 0)
 
     def test_cache_cleanup_expired(self):
         """Test cleaning up expired cache entries."""
@@ -462,7 +466,6 @@ class TestRoutingCache(unittest.TestCase):
         self.cache._cache[key1] = expired_entry1
         self.cache._cache[key2] = expired_entry2
         self.cache._cache[key3] = valid_entry
-        self.cache._access_order = [key1, key2, key3]
 
         # Cleanup with 300 second TTL
         expired_count = self.cache.cleanup_expired(ttl=300)
@@ -484,7 +487,6 @@ class TestRoutingCache(unittest.TestCase):
         # Create entry older than default TTL
         old_entry = CacheEntry(decision=decision, timestamp=current_time - 400)
         self.cache._cache["old_key"] = old_entry
-        self.cache._access_order = ["old_key"]
 
         # Cleanup without specifying TTL (should use default 300)
         expired_count = self.cache.cleanup_expired()
@@ -536,10 +538,9 @@ class TestRoutingCache(unittest.TestCase):
 
         # Cache should still be empty
         self.assertEqual(len(self.cache._cache), 0)
-        self.assertEqual(len(self.cache._access_order), 0)
 
     def test_remove_entry_cleanup(self):
-        """Test that _remove_entry cleans up both cache and access order."""
+        """Test that _remove_entry removes the entry."""
         decision = RoutingDecision(
             provider="test", model="test", complexity=TaskComplexity.LOW
         )
@@ -549,14 +550,11 @@ class TestRoutingCache(unittest.TestCase):
         self.cache._cache[test_key] = CacheEntry(
             decision=decision, timestamp=time.time()
         )
-        self.cache._access_order.append(test_key)
 
         # Remove entry
         self.cache._remove_entry(test_key)
 
-        # Should be removed from both structures
         self.assertNotIn(test_key, self.cache._cache)
-        self.assertNotIn(test_key, self.cache._access_order)
 
     # =============================================================================
     # 7. Statistics Tests
@@ -573,6 +571,8 @@ class TestRoutingCache(unittest.TestCase):
             "misses": 0,
             "hit_rate": 0.0,
             "evictions": 0,
+            "expirations": 0,
+            "shared_hits": 0,
             "total_requests": 0,
         }
 
@@ -719,5 +719,141 @@ class TestRoutingCache(unittest.TestCase):
         self.assertIsNone(result_miss)
 
 
+class TestRoutingCacheConcurrencyAndTTL(unittest.TestCase):
+    """Tests for per-entry TTL, copy-on-hit and thread safety."""
+
+    def setUp(self):
+        self.cache = RoutingCache(
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            max_size=50,
+            default_ttl=300,
+        )
+        self.decision = RoutingDecision(
+            provider="openai", model="gpt-4", complexity=TaskComplexity.HIGH
+        )
+
+    def test_per_entry_ttl_overrides_default(self):
+        """Entries stored with their own TTL expire on that TTL."""
+        self.cache.put(
+            "t", TaskComplexity.HIGH, "short", ["openai"], self.decision, ttl=10
+        )
+        self.cache.put("t", TaskComplexity.HIGH, "long", ["openai"], self.decision)
+
+        with patch("time.time", return_value=time.time() + 60):
+            self.assertIsNone(
+                self.cache.get("t", TaskComplexity.HIGH, "short", ["openai"])
+            )
+            self.assertIsNotNone(
+                self.cache.get("t", TaskComplexity.HIGH, "long", ["openai"])
+            )
+
+        self.assertEqual(self.cache.get_stats()["expirations"], 1)
+
+    def test_hits_return_copies(self):
+        """Marking a hit never mutates the cached (shared) decision."""
+        self.cache.put("t", TaskComplexity.HIGH, "p", ["openai"], self.decision)
+
+        result = self.cache.get("t", TaskComplexity.HIGH, "p", ["openai"])
+
+        self.assertTrue(result.cache_hit)
+        self.assertIsNot(result, self.decision)
+        self.assertFalse(self.decision.cache_hit)
+
+    def test_concurrent_access_keeps_bounds_and_counters(self):
+        """Concurrent puts/gets never exceed max_size or lose counter updates."""
+        per_thread = 200
+
+        def worker(worker_id):
+            for i in range(per_thread):
+                prompt = f"prompt-{worker_id}-{i % 80}"
+                self.cache.put(
+                    "t", TaskComplexity.LOW, prompt, ["openai"], self.decision
+                )
+                self.cache.get("t", TaskComplexity.LOW, prompt, ["openai"])
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = self.cache.get_stats()
+        self.assertLessEqual(stats["size"], 50)
+        self.assertEqual(stats["total_requests"], 8 * per_thread)
+        self.assertEqual(len(self.cache._cache), stats["size"])
+
+
+class TestSQLiteRoutingCacheBackend(unittest.TestCase):
+    """Tests for sharing routing decisions between cache instances."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "routing_cache.sqlite")
+        self.decision = RoutingDecision(
+            provider="anthropic",
+            model="claude",
+            complexity=TaskComplexity.MEDIUM,
+            confidence=0.7,
+            max_tokens=512,
+        )
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _cache(self):
+        cache = RoutingCache(
+            logging_service=MockServiceFactory.create_mock_logging_service()
+        )
+        cache.set_backend(SQLiteRoutingCacheBackend(self.path))
+        return cache
+
+    def test_decision_is_shared_between_caches(self):
+        """A decision cached by one worker is a hit for another."""
+        writer, reader = self._cache(), self._cache()
+        writer.put("t", TaskComplexity.MEDIUM, "p", ["anthropic"], self.decision)
+
+        result = reader.get("t", TaskComplexity.MEDIUM, "p", ["anthropic"])
+
+        self.assertEqual(result.provider, "anthropic")
+        self.assertEqual(result.complexity, TaskComplexity.MEDIUM)
+        self.assertEqual(result.max_tokens, 512)
+        self.assertTrue(result.cache_hit)
+        stats = reader.get_stats()
+        self.assertEqual((stats["hits"], stats["shared_hits"]), (1, 1))
+
+        # Promoted locally: the next hit does not touch the backend
+        reader.get("t", TaskComplexity.MEDIUM, "p", ["anthropic"])
+        self.assertEqual(reader.get_stats()["shared_hits"], 1)
+
+    def test_expired_and_cleared_rows_miss(self):
+        """Shared rows honour the TTL they were written with, and clear()."""
+        writer, reader = self._cache(), self._cache()
+        writer.put(
+            "t", TaskComplexity.MEDIUM, "old", ["anthropic"], self.decision, ttl=5
+        )
+        writer.put("t", TaskComplexity.MEDIUM, "new", ["anthropic"], self.decision)
+
+        with patch("time.time", return_value=time.time() + 60):
+            self.assertIsNone(
+                reader.get("t", TaskComplexity.MEDIUM, "old", ["anthropic"])
+            )
+
+        writer.clear()
+        self.assertIsNone(reader.get("t", TaskComplexity.MEDIUM, "new", ["anthropic"]))
+        self.assertEqual(reader.get_stats()["misses"], 2)
+
+    def test_prune_caps_rows(self):
+        """prune() drops the oldest rows beyond max_rows."""
+        backend = SQLiteRoutingCacheBackend(self.path, max_rows=3, prune_every=1000)
+        for i in range(5):
+            backend.put(f"k{i}", self.decision.to_dict(), 300)
+
+        backend.prune()
+
+        self.assertIsNone(backend.get("k0"))
+        self.assertIsNone(backend.get("k1"))
+        self.assertIsNotNone(backend.get("k4"))
+
+
 if __name__ == "__main__":
     unittest.main()
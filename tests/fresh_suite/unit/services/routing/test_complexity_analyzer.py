@@ -7,6 +7,7 @@ and follow the established MockServiceFactory patterns for consistent testing.
 
 import re
 import unittest
+import unittest.mock
 
 from agentmap.services.routing.complexity_analyzer import PromptComplexityAnalyzer
 from agentmap.services.routing.types import (
@@ -657,6 +658,85 @@ class TestPromptComplexityAnalyzer(unittest.TestCase):
         # Should find complexity indicators
         self.assertGreater(len(complexity), 0)
 
+    # =============================================================================
+    # 12. Combined Pass, Sampling and Memoization Tests
+    # =============================================================================
+
+    def test_combined_pass_matches_individual_patterns(self):
+        """The single combined pass counts exactly what each pattern finds."""
+        prompt = (
+            "Why is this URGENT? Analyze the API and write a detailed, in-depth "
+            "story about the SQL algorithm. What class? How, when and who? "
+            "Imagine a creative, comprehensive and critical HTTP function."
+        )
+
+        counts = self.analyzer._count_pattern_matches(prompt)
+
+        for name, pattern in self.analyzer.patterns.items():
+            self.assertEqual(counts[name], len(pattern.findall(prompt)), name)
+
+    def test_long_prompt_is_sampled_for_keywords_only(self):
+        """Keyword analysis sees head+tail; length analysis sees full length."""
+        self.analyzer.max_analysis_chars = 100
+        prompt = "urgent " + "filler " * 1000 + "critical"
+
+        sample = self.analyzer._analysis_text(prompt)
+        self.assertLessEqual(len(sample), 101)
+        self.assertIn("urgent", sample)
+        self.assertIn("critical", sample)
+
+        with unittest.mock.patch.object(
+            self.analyzer,
+            "_count_pattern_matches",
+            wraps=self.analyzer._count_pattern_matches,
+        ) as count:
+            self.analyzer.analyze_prompt_complexity(prompt)
+        self.assertEqual(count.call_count, 1)
+        self.assertLessEqual(len(count.call_args[0][0]), 101)
+        self.assertEqual(
+            self.analyzer._analyze_prompt_length(prompt).complexity,
+            TaskComplexity.CRITICAL,
+        )
+        keyword_signal = self.analyzer._analyze_prompt_keywords(sample)
+        self.assertEqual(keyword_signal.complexity, TaskComplexity.CRITICAL)
+
+    def test_overall_complexity_is_memoized_per_prompt_and_task_type(self):
+        """Repeated prompts skip re-analysis; task type is part of the key."""
+        context = RoutingContext(task_type="analysis")
+        prompt = "Provide a detailed analysis of the system. " * 20
+
+        with unittest.mock.patch.object(
+            self.analyzer,
+            "analyze_prompt_complexity",
+            wraps=self.analyzer.analyze_prompt_complexity,
+        ) as analyze:
+            first = self.analyzer.determine_overall_complexity(
+                prompt, "analysis", context
+            )
+            second = self.analyzer.determine_overall_complexity(
+                prompt, "analysis", context
+            )
+            self.analyzer.determine_overall_complexity(prompt, "general", context)
+
+        self.assertEqual(first, second)
+        self.assertEqual(analyze.call_count, 2)
+        stats = self.analyzer.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 2))
+
+    def test_memo_cache_is_bounded(self):
+        """The memo cache evicts least recently used prompts beyond cache_size."""
+        self.analyzer.cache_size = 3
+        context = RoutingContext(task_type="general")
+
+        for i in range(5):
+            self.analyzer.determine_overall_complexity(
+                f"prompt {i}", "general", context
+            )
+
+        self.assertEqual(self.analyzer.get_cache_stats()["size"], 3)
+        self.analyzer.clear_cache()
+        self.assertEqual(self.analyzer.get_cache_stats()["size"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,175 @@
+"""
+Unit tests for the async storage API (aread/awrite/adelete/aexists).
+
+Covers the BaseStorageService thread-offload defaults (via JSONStorageService),
+MemoryStorageService running inline on the event loop, and the blob service's
+async methods through LocalFileConnector.
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from agentmap.services.storage.azure_blob_connector import AzureBlobConnector
+from agentmap.services.storage.blob_storage_service import BlobStorageService
+from agentmap.services.storage.json_service import JSONStorageService
+from agentmap.services.storage.local_file_connector import LocalFileConnector
+from agentmap.services.storage.memory_service import MemoryStorageService
+from agentmap.services.storage.types import WriteMode
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+class TestThreadOffloadDefaults(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        config = MockServiceFactory.create_mock_storage_config_service(
+            {"json": {"enabled": True, "default_directory": self.temp_dir}}
+        )
+        self.service = JSONStorageService(
+            provider_name="json",
+            configuration=config,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        async def scenario():
+            write = await self.service.awrite(
+                "docs", {"id": "a", "value": 1}, document_id="a", mode=WriteMode.WRITE
+            )
+            return (
+                write,
+                await self.service.aread("docs", document_id="a"),
+                await self.service.aexists("docs", document_id="a"),
+                await self.service.adelete("docs", document_id="a"),
+                await self.service.aexists("docs", document_id="a"),
+            )
+
+        write, doc, existed, delete, exists_after = asyncio.run(scenario())
+
+        self.assertTrue(write.success)
+        self.assertEqual(doc["value"], 1)
+        self.assertTrue(existed)
+        self.assertTrue(delete.success)
+        self.assertFalse(exists_after)
+
+    def test_sync_call_runs_off_the_event_loop(self):
+        threads = []
+
+        def read(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return {"ok": True}
+
+        async def scenario():
+            with patch.object(self.service, "read", side_effect=read):
+                result = await self.service.aread("docs", path="x")
+            return threading.get_ident(), result
+
+        loop_thread, result = asyncio.run(scenario())
+
+        self.assertEqual(result, {"ok": True})
+        self.assertNotEqual(threads, [loop_thread])
+
+
+class TestMemoryServiceRunsInline(unittest.TestCase):
+    def setUp(self):
+        self.service = MemoryStorageService(
+            provider_name="memory",
+            configuration=MockServiceFactory.create_mock_storage_config_service(),
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+        )
+        self.service._client = {}
+
+    def test_operations_skip_the_thread_hop(self):
+        async def scenario():
+            with patch("asyncio.to_thread") as to_thread:
+                await self.service.awrite("users", {"name": "Ada"}, document_id="1")
+                doc = await self.service.aread("users", document_id="1")
+                exists = await self.service.aexists("users", "1")
+                await self.service.adelete("users", document_id="1")
+            return doc, exists, to_thread
+
+        doc, exists, to_thread = asyncio.run(scenario())
+
+        self.assertEqual(doc, {"name": "Ada"})
+        self.assertTrue(exists)
+        self.assertFalse(self.service.exists("users", "1"))
+        to_thread.assert_not_called()
+
+
+class TestBlobAsyncAPI(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        config = MockServiceFactory.create_mock_storage_config_service({})
+        config.get_blob_config.return_value = {}
+        self.service = BlobStorageService(
+            configuration=config,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            availability_cache=Mock(get_availability=Mock(return_value=None)),
+        )
+        self.service._connectors["file"] = LocalFileConnector({})
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        path = os.path.join(self.temp_dir, "nested", "blob.bin")
+
+        async def scenario():
+            write = await self.service.awrite_blob(path, b"payload")
+            return (
+                write,
+                await self.service.aread_blob(path),
+                await self.service.ablob_exists(path),
+            )
+
+        write, data, exists = asyncio.run(scenario())
+
+        self.assertEqual(write["size"], 7)
+        self.assertEqual(data, b"payload")
+        self.assertTrue(exists)
+
+    def test_missing_blob_raises_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(self.service.aread_blob(os.path.join(self.temp_dir, "nope")))
+
+
+class TestAzureAsyncClientLifecycle(unittest.TestCase):
+    def setUp(self):
+        self.connector = AzureBlobConnector({})
+        self.service_client = Mock(close=AsyncMock())
+        self.service_client.get_blob_client.return_value = Mock(
+            exists=AsyncMock(return_value=True)
+        )
+        self.connector._create_async_client = Mock(return_value=self.service_client)
+
+    def test_client_is_reused_and_closed_when_loop_shuts_down(self):
+        async def scenario():
+            await self.connector.ablob_exists("azure://container/a.json")
+            await self.connector.ablob_exists("azure://container/b.json")
+            return self.service_client.close.await_count
+
+        self.assertEqual(asyncio.run(scenario()), 0)
+
+        self.connector._create_async_client.assert_called_once()
+        self.service_client.close.assert_awaited_once()
+        self.assertEqual(self.connector._async_clients, {})
+
+    def test_aclose_closes_the_running_loops_client(self):
+        async def scenario():
+            await self.connector.ablob_exists("azure://container/a.json")
+            await self.connector.aclose()
+            return self.service_client.close.await_count
+
+        self.assertEqual(asyncio.run(scenario()), 1)
+        self.service_client.close.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
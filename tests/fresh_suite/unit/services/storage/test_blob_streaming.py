@@ -0,0 +1,310 @@
+"""
+Unit tests for streaming, ranged and multipart blob I/O and the ETag disk cache.
+
+Runs offline against LocalFileConnector (plus a fake parallel upload for the
+multipart path) and covers ranged reads, part splitting and concurrency,
+checksum verification, abort semantics, and cache hit/revalidation/eviction.
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from agentmap.exceptions import StorageChecksumError, StorageOperationError
+from agentmap.services.storage.blob_cache import BlobDiskCache
+from agentmap.services.storage.blob_storage_service import BlobStorageService
+from agentmap.services.storage.blob_streaming import (
+    BlobReader,
+    BlobWriter,
+    MultipartUpload,
+)
+from agentmap.services.storage.local_file_connector import LocalFileConnector
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+class _FakeParallelUpload(MultipartUpload):
+    """Records parts and peak concurrency like a provider multipart session."""
+
+    parallel = True
+
+    def __init__(self):
+        self.parts = {}
+        self.completed = None
+        self.aborted = False
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def upload_part(self, part_number, data):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+            self.parts[part_number] = data
+        return f"etag-{part_number}"
+
+    def complete(self, parts):
+        self.completed = list(parts)
+        return {"etag": "final"}
+
+    def abort(self):
+        self.aborted = True
+
+
+class _StreamingTestBase(unittest.TestCase):
+    cache_config = None
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        blob_config = {"providers": {"file": {}}}
+        if self.cache_config is not None:
+            blob_config["cache"] = {
+                "directory": os.path.join(self.temp_dir, "cache"),
+                **self.cache_config,
+            }
+        config = MockServiceFactory.create_mock_storage_config_service({})
+        config.get_blob_config.return_value = blob_config
+        self.service = BlobStorageService(
+            configuration=config,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            availability_cache=Mock(get_availability=Mock(return_value=None)),
+        )
+        self.connector = LocalFileConnector({})
+        self.service._connectors["file"] = self.connector
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir, name)
+
+    def _write(self, name, data):
+        with open(self._path(name), "wb") as f:
+            f.write(data)
+        return self._path(name)
+
+
+class TestStreamingReads(_StreamingTestBase):
+    def test_ranged_reads_transfer_only_the_range(self):
+        path = self._write("data.bin", bytes(range(256)) * 4)
+
+        self.assertEqual(self.service.read_range(path, 10, 20), bytes(range(10, 20)))
+        self.assertEqual(self.service.read_range(path, 1020), bytes(range(252, 256)))
+        self.assertEqual(self.service.read_range(path, 2000), b"")
+        chunks = list(self.service.iter_blob(path, 0, 100, chunk_size=30))
+        self.assertEqual([len(c) for c in chunks], [30, 30, 30, 10])
+
+    def test_open_read_is_a_file_object(self):
+        path = self._write("lines.txt", b"alpha\nbeta\ngamma\n")
+
+        with self.service.open_read(path, chunk_size=4) as reader:
+            self.assertEqual(reader.readline(), b"alpha\n")
+            self.assertEqual(reader.read(4), b"beta")
+            self.assertEqual(reader.read(), b"\ngamma\n")
+
+    def test_checksum_mismatch_raises(self):
+        data = b"x" * 1000
+        path = self._write("data.bin", data)
+
+        good = self.service.open_read(
+            path, expected_sha256=hashlib.sha256(data).hexdigest()
+        )
+        self.assertEqual(good.readall(), data)
+        self.assertEqual(good.sha256, hashlib.sha256(data).hexdigest())
+
+        bad = self.service.open_read(path, expected_sha256="0" * 64)
+        with self.assertRaises(StorageChecksumError):
+            bad.readall()
+
+    def test_missing_blob_raises_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            self.service.open_read(self._path("missing.bin"))
+
+
+class TestStreamingWrites(_StreamingTestBase):
+    def test_open_write_splits_into_parts_and_renames_atomically(self):
+        path = self._path("out/data.bin")
+        payload = os.urandom(10_000)
+
+        with self.service.open_write(path, part_size=4096) as writer:
+            for offset in range(0, len(payload), 1000):
+                writer.write(payload[offset : offset + 1000])
+            self.assertFalse(os.path.exists(path))
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), payload)
+        self.assertEqual(writer.result["parts"], 3)
+        self.assertEqual(writer.result["size"], len(payload))
+        self.assertEqual(writer.result["sha256"], hashlib.sha256(payload).hexdigest())
+        self.assertIn("etag", writer.result)
+
+    def test_parallel_parts_are_bounded_and_ordered(self):
+        upload = _FakeParallelUpload()
+        writer = BlobWriter(upload, part_size=10, max_concurrency=3)
+
+        writer.write(b"a" * 95)
+        writer.close()
+
+        self.assertEqual(upload.completed, [f"etag-{n}" for n in range(1, 11)])
+        self.assertEqual(b"".join(upload.parts[n] for n in range(1, 11)), b"a" * 95)
+        self.assertLessEqual(upload.peak, 3)
+        self.assertGreater(upload.peak, 1)
+        self.assertEqual(writer.result["etag"], "final")
+
+    def test_exception_inside_with_aborts_and_leaves_no_file(self):
+        path = self._path("aborted.bin")
+
+        with self.assertRaises(RuntimeError):
+            with self.service.open_write(path, part_size=16) as writer:
+                writer.write(b"z" * 100)
+                raise RuntimeError("producer failed")
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+    def test_write_stream_verifies_checksum_before_commit(self):
+        path = self._write("existing.bin", b"original")
+
+        with self.assertRaises(StorageChecksumError):
+            self.service.write_stream(
+                path, [b"new ", b"data"], expected_sha256="0" * 64
+            )
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), b"original")
+
+        result = self.service.write_stream(
+            path,
+            [b"new ", b"data"],
+            expected_sha256=hashlib.sha256(b"new data").hexdigest(),
+        )
+        self.assertTrue(result["success"])
+        self.assertEqual(result["size"], 8)
+
+    def test_write_stream_accepts_file_objects(self):
+        source = self._write("source.bin", os.urandom(5000))
+        target = self._path("copy.bin")
+
+        with open(source, "rb") as f:
+            result = self.service.write_stream(target, f, part_size=1024)
+
+        self.assertEqual(result["parts"], 5)
+        self.assertEqual(self.service.read_blob(target), self.service.read_blob(source))
+
+    def test_failed_abort_is_reported(self):
+        upload = _FakeParallelUpload()
+        upload.abort = Mock(side_effect=RuntimeError("network down"))
+
+        with self.assertRaises(StorageOperationError):
+            BlobWriter(upload).abort()
+
+
+class TestBlobDiskCache(_StreamingTestBase):
+    cache_config = {"enabled": True, "revalidate_seconds": 60}
+
+    def test_repeat_reads_within_window_skip_the_provider(self):
+        path = self._write("data.bin", b"cached payload")
+        self.assertEqual(self.service.read_blob(path), b"cached payload")
+
+        with (
+            patch.object(
+                self.connector, "get_blob_info", wraps=self.connector.get_blob_info
+            ) as info,
+            patch.object(
+                self.connector, "iter_blob", wraps=self.connector.iter_blob
+            ) as download,
+        ):
+            self.assertEqual(self.service.read_blob(path), b"cached payload")
+            self.assertEqual(self.service.read_range(path, 7, 10), b"pay")
+
+        info.assert_not_called()
+        download.assert_not_called()
+        stats = self.service.get_cache_stats()
+        self.assertEqual((stats["misses"], stats["hits"]), (1, 2))
+
+    def test_changed_etag_is_downloaded_again(self):
+        path = self._write("data.bin", b"version one")
+        self.service.read_blob(path)
+        self.service._cache.revalidate_seconds = 0
+        self._write("data.bin", b"version two!")
+
+        self.assertEqual(self.service.read_blob(path), b"version two!")
+        self.assertEqual(self.service.get_cache_stats()["misses"], 2)
+
+    def test_unchanged_etag_revalidates_without_download(self):
+        path = self._write("data.bin", b"stable")
+        self.service.read_blob(path)
+        self.service._cache.revalidate_seconds = 0
+
+        with patch.object(self.connector, "iter_blob") as download:
+            self.assertEqual(self.service.read_blob(path), b"stable")
+        download.assert_not_called()
+
+    def test_writes_through_service_invalidate(self):
+        path = self._write("data.bin", b"before")
+        self.service.read_blob(path)
+
+        self.service.write_blob(path, b"after")
+        self.assertEqual(self.service.read_blob(path), b"after")
+
+        with self.service.open_write(path) as writer:
+            writer.write(b"streamed")
+        self.assertEqual(self.service.read_blob(path), b"streamed")
+
+    def test_abandoned_read_stores_nothing(self):
+        path = self._write("data.bin", b"x" * 100)
+
+        reader = self.service.open_read(path, chunk_size=10)
+        reader.read(10)
+        reader.close()
+
+        self.assertIsNone(self.service._cache.lookup(path, "any"))
+        self.assertEqual(self.service.get_cache_stats()["stores"], 0)
+
+    def test_least_recently_read_entries_are_evicted(self):
+        cache = BlobDiskCache(os.path.join(self.temp_dir, "lru"), max_bytes=250)
+        for name in ("a", "b", "c"):
+            list(cache.tee(name, "etag", [b"x" * 100]))
+            time.sleep(0.01)
+
+        self.assertIsNone(cache.lookup("a", "etag"))
+        self.assertIsNotNone(cache.lookup("b", "etag"))
+        self.assertIsNotNone(cache.lookup("c", "etag"))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_cache_disabled_by_default(self):
+        config = MockServiceFactory.create_mock_storage_config_service({})
+        service = BlobStorageService(
+            configuration=config,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            availability_cache=Mock(get_availability=Mock(return_value=None)),
+        )
+        self.assertIsNone(service.get_cache_stats())
+
+
+class TestBlobReader(unittest.TestCase):
+    def test_close_releases_the_source_iterator(self):
+        closed = []
+
+        def source():
+            try:
+                yield b"abc"
+                yield b"def"
+            finally:
+                closed.append(True)
+
+        reader = BlobReader(source())
+        reader.read(1)
+        reader.close()
+
+        self.assertEqual(closed, [True])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+"""
+Unit tests for storage transactions and transactional batch_write.
+
+Covers staging inside transaction() (reads see staged writes, nothing hits
+disk before commit), single-pass atomic commit, rollback on exceptions and
+failed batch items, and the per-item results of batch_write for the JSON
+and CSV services.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from agentmap.services.storage.csv_service import CSVStorageService
+from agentmap.services.storage.json_service import JSONStorageService
+from agentmap.services.storage.memory_service import MemoryStorageService
+from agentmap.services.storage.types import WriteMode
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+class _TransactionTestBase(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = MockServiceFactory.create_mock_storage_config_service(
+            {
+                "json": {"enabled": True, "default_directory": self.temp_dir},
+                "csv": {
+                    "enabled": True,
+                    "default_directory": self.temp_dir,
+                    "auto_create_files": True,
+                },
+            }
+        )
+        self.logging_service = MockServiceFactory.create_mock_logging_service()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _path(self, name):
+        return os.path.join(self.temp_dir, name)
+
+
+class TestJSONTransactions(_TransactionTestBase):
+    def setUp(self):
+        super().setUp()
+        self.service = JSONStorageService(
+            provider_name="json",
+            configuration=self.config,
+            logging_service=self.logging_service,
+        )
+
+    def _load(self, name="docs.json"):
+        with open(self._path(name)) as f:
+            return json.load(f)
+
+    def test_writes_are_staged_until_commit(self):
+        with self.service.transaction():
+            self.service.write("docs", {"v": 1}, document_id="a")
+            self.service.write("docs", {"v": 2}, document_id="b")
+            self.assertFalse(os.path.exists(self._path("docs.json")))
+            self.assertEqual(self.service.read("docs", document_id="a"), {"v": 1})
+            self.assertTrue(self.service.exists("docs", document_id="b"))
+
+        self.assertEqual(self._load(), {"a": {"v": 1}, "b": {"v": 2}})
+        self.assertEqual(os.listdir(self.temp_dir), ["docs.json"])
+
+    def test_exception_discards_staged_writes(self):
+        self.service.write("docs", {"v": 0}, document_id="keep")
+
+        with self.assertRaises(RuntimeError):
+            with self.service.transaction():
+                self.service.write("docs", {"v": 1}, document_id="a")
+                self.service.delete("docs")
+                raise RuntimeError("boom")
+
+        self.assertEqual(self._load(), {"keep": {"v": 0}})
+
+    def test_staged_delete_is_applied_on_commit(self):
+        self.service.write("docs", {"v": 0}, document_id="a")
+
+        with self.service.transaction():
+            self.assertTrue(self.service.delete("docs").success)
+            self.assertFalse(self.service.exists("docs"))
+            self.assertTrue(os.path.exists(self._path("docs.json")))
+
+        self.assertFalse(os.path.exists(self._path("docs.json")))
+
+    def test_nested_transactions_commit_once(self):
+        with patch.object(
+            self.service,
+            "_write_staged_file",
+            wraps=self.service._write_staged_file,
+        ) as commit_write:
+            with self.service.transaction() as outer:
+                with self.service.transaction() as inner:
+                    self.service.write("docs", {"v": 1}, document_id="a")
+                self.assertIs(inner, outer)
+                self.assertFalse(os.path.exists(self._path("docs.json")))
+
+        commit_write.assert_called_once()
+
+    def test_batch_write_reads_and_writes_the_file_once(self):
+        self.service.write("docs", {"v": 0}, document_id="seed")
+        items = [{"id": str(i), "v": i} for i in range(50)]
+
+        with patch.object(
+            self.service, "_open_json_file", wraps=self.service._open_json_file
+        ) as opened:
+            result = self.service.batch_write("docs", items, id_field="id")
+
+        modes = [call.args[1] for call in opened.call_args_list]
+        self.assertEqual(sorted(modes), ["r", "w"])
+        self.assertTrue(result.success)
+        self.assertEqual(result.total_affected, 50)
+        self.assertEqual(len(result.item_results), 50)
+        self.assertEqual(result.item_results[7].document_id, "7")
+        self.assertEqual(len(self._load()), 51)
+
+    def test_failed_item_rolls_back_the_batch(self):
+        self.service.write("docs", {"id": "a", "v": 0}, document_id="a")
+        items = [{"id": "a", "v": 1}, {"id": "missing", "v": 2}]
+
+        result = self.service.batch_write(
+            "docs", items, mode=WriteMode.UPDATE, id_field="id"
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("rolled back", result.error)
+        self.assertEqual(result.total_affected, 0)
+        self.assertEqual(result.error_count, 1)
+        self.assertEqual([r.success for r in result.item_results], [True, False])
+        self.assertEqual(self._load()["a"]["v"], 0)
+
+    def test_non_atomic_batch_commits_successful_items(self):
+        self.service.write("docs", {"id": "a", "v": 0}, document_id="a")
+        items = [{"id": "a", "v": 1}, {"id": "missing", "v": 2}]
+
+        result = self.service.batch_write(
+            "docs", items, mode=WriteMode.UPDATE, id_field="id", atomic=False
+        )
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.total_affected, 1)
+        self.assertEqual(self._load()["a"]["v"], 1)
+
+    def test_commit_failure_leaves_target_untouched(self):
+        self.service.write("docs", {"v": 0}, document_id="a")
+
+        result = self.service.batch_write(
+            "docs", [{"id": "b", "v": object()}], id_field="id"
+        )
+
+        self.assertFalse(result.success)
+        self.assertIn("commit failed", result.error)
+        self.assertEqual(self._load(), {"a": {"v": 0}})
+        self.assertEqual(os.listdir(self.temp_dir), ["docs.json"])
+
+
+class TestCSVTransactions(_TransactionTestBase):
+    def setUp(self):
+        super().setUp()
+        self.service = CSVStorageService(
+            provider_name="csv",
+            configuration=self.config,
+            logging_service=self.logging_service,
+        )
+
+    def _rows(self):
+        with open(self._path("rows.csv")) as f:
+            return f.read().splitlines()
+
+    def test_appends_are_merged_and_written_once(self):
+        self.service.write("rows.csv", [{"id": "r0", "v": 0}], mode=WriteMode.WRITE)
+
+        with patch.object(
+            self.service._file_handler,
+            "write_csv_file",
+            wraps=self.service._file_handler.write_csv_file,
+        ) as written:
+            result = self.service.batch_write(
+                "rows.csv",
+                [{"id": f"r{i}", "v": i} for i in range(1, 20)],
+                mode=WriteMode.APPEND,
+            )
+
+        self.assertTrue(result.success)
+        written.assert_called_once()
+        rows = self._rows()
+        self.assertEqual(rows[0], "id,v")
+        self.assertEqual(len(rows), 21)
+
+    def test_updates_by_id_see_earlier_items(self):
+        self.service.write(
+            "rows.csv", [{"id": "a", "v": 0}, {"id": "b", "v": 0}], mode=WriteMode.WRITE
+        )
+
+        result = self.service.batch_write(
+            "rows.csv",
+            [{"id": "c", "v": 3}, {"id": "a", "v": 1}, {"id": "c", "v": 4}],
+            mode=WriteMode.UPDATE,
+            id_field="id",
+        )
+
+        self.assertTrue(result.success, result.error)
+        self.assertEqual(self._rows(), ["id,v", "a,1", "b,0", "c,4"])
+
+    def test_reads_with_parser_options_see_staged_rows(self):
+        with self.service.transaction():
+            self.service.write("rows.csv", [{"id": "a", "v": 1}])
+            df = self.service.read("rows.csv", format="dataframe", dtype=str)
+
+        self.assertEqual(df.to_dict("records"), [{"id": "a", "v": "1"}])
+
+
+class TestServicesWithoutTransactions(_TransactionTestBase):
+    def test_batch_write_applies_items_directly(self):
+        service = MemoryStorageService(
+            provider_name="memory",
+            configuration=MockServiceFactory.create_mock_storage_config_service(),
+            logging_service=self.logging_service,
+        )
+
+        with service.transaction() as txn:
+            self.assertIsNone(txn)
+
+        result = service.batch_write(
+            "users", [{"id": "1", "name": "Ada"}, {"id": "2"}], id_field="id"
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(service.read("users", document_id="2"), {"id": "2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
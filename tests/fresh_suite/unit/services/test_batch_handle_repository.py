@@ -5,11 +5,14 @@ Covers:
 - TC-AC1-03: handle.to_dict() is a plain dict; json.dumps() succeeds; no anthropic SDK types
 - TC-AC2-03: BatchHandleRepository.load_from_dict preserves request_id_map
 - TC-AC9-01: saved JSON contains no api_key field
+- The SQLite index: queries, bulk status updates, retention and file migration
 """
 
 import json
 import os
 import tempfile
+import time
+from datetime import datetime, timedelta, timezone
 
 from agentmap.models.llm_batch import LLMBatchHandle, LLMBatchStatus
 
@@ -331,3 +334,196 @@ class TestBatchHandleRepositoryDelete:
             assert os.path.exists(
                 os.path.join(tmp_path, f"{handle_b.agentmap_batch_id}.json")
             )
+
+
+# ---------------------------------------------------------------------------
+# SQLite index: queries, bulk updates, retention and migration
+# ---------------------------------------------------------------------------
+
+
+def _batch_id(n):
+    return "amatch_" + f"{n:032x}"
+
+
+def _aged_handle(n, days_old=0, **kwargs):
+    created = datetime.now(timezone.utc) - timedelta(days=days_old)
+    return _make_handle(
+        agentmap_batch_id=_batch_id(n), created_at=created.isoformat(), **kwargs
+    )
+
+
+def _ids(handles):
+    return [handle.agentmap_batch_id for handle in handles]
+
+
+class TestBatchHandleRepositoryIndex:
+    """Indexed queries by status, provider, graph, thread and age."""
+
+    def test_query_filters_by_status_provider_graph_and_thread(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save(_aged_handle(1), graph_name="g1", thread_id="t1")
+        repo.save(
+            _aged_handle(2, status=LLMBatchStatus.ENDED, provider="openai"),
+            graph_name="g1",
+        )
+        repo.save(_aged_handle(3), graph_name="g2")
+
+        assert _ids(repo.query(status=LLMBatchStatus.IN_PROGRESS)) == [
+            _batch_id(1),
+            _batch_id(3),
+        ]
+        assert _ids(repo.query(status="in_progress", graph_name="g1")) == [_batch_id(1)]
+        assert _ids(repo.query(provider="openai")) == [_batch_id(2)]
+        assert _ids(repo.query(thread_id="t1")) == [_batch_id(1)]
+        assert _ids(repo.query(status=[])) == []
+        assert repo.query(graph_name="g1")[0].request_id_map == {
+            "spec-1": "spec-1",
+            "needs/sanitize": "a3f9c2",
+        }
+
+    def test_query_by_age_oldest_first(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save(_aged_handle(1, days_old=1))
+        repo.save(_aged_handle(2, days_old=10))
+        repo.save(_aged_handle(3, days_old=30))
+        week = 7 * 86400
+
+        assert _ids(repo.query(older_than=week)) == [_batch_id(3), _batch_id(2)]
+        assert _ids(repo.query(newer_than=week)) == [_batch_id(1)]
+        assert _ids(repo.query(limit=1)) == [_batch_id(3)]
+
+    def test_resave_keeps_tags_and_tag_updates_them(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        handle = _aged_handle(1)
+        repo.save(handle, graph_name="g1")
+        handle.status = LLMBatchStatus.ENDED
+        repo.save(handle)
+
+        assert _ids(repo.query(graph_name="g1", status="ended")) == [_batch_id(1)]
+        assert repo.tag(_batch_id(1), thread_id="t9") is True
+        assert _ids(repo.query(graph_name="g1", thread_id="t9")) == [_batch_id(1)]
+        assert repo.tag(_batch_id(2), thread_id="t9") is False
+
+    def test_delete_removes_index_row(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save(_aged_handle(1))
+
+        assert repo.delete(_batch_id(1)) is True
+        assert repo.query() == []
+
+
+class TestBatchHandleRepositoryBulkOperations:
+    """save_many / set_status / purge keep files and index in step."""
+
+    def test_save_many_writes_every_file(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save_many([_aged_handle(1), _aged_handle(2)], graph_name="g")
+
+        for n in (1, 2):
+            assert os.path.exists(os.path.join(tmp_path, f"{_batch_id(n)}.json"))
+        assert len(repo.query(graph_name="g")) == 2
+
+    def test_save_many_rejects_unsafe_ids_before_writing(self, tmp_path):
+        from agentmap.exceptions import LLMServiceError
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        try:
+            repo.save_many([_aged_handle(1), _make_handle(agentmap_batch_id="../../x")])
+            assert False, "save_many() must reject a path-traversal id"
+        except LLMServiceError:
+            pass
+        assert not os.path.exists(os.path.join(tmp_path, f"{_batch_id(1)}.json"))
+
+    def test_set_status_updates_files_and_index(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save_many([_aged_handle(1), _aged_handle(2), _aged_handle(3)])
+
+        updated = repo.set_status(
+            [_batch_id(1), _batch_id(2), _batch_id(9)], LLMBatchStatus.EXPIRED
+        )
+
+        assert updated == 2
+        assert repo.load(_batch_id(1)).status == LLMBatchStatus.EXPIRED
+        assert _ids(repo.query(status="expired")) == [_batch_id(1), _batch_id(2)]
+        assert _ids(repo.query(status="in_progress")) == [_batch_id(3)]
+
+    def test_purge_removes_only_old_terminal_handles_by_default(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save(_aged_handle(1, days_old=10, status=LLMBatchStatus.ENDED))
+        repo.save(_aged_handle(2, days_old=10))
+        repo.save(_aged_handle(3, days_old=1, status=LLMBatchStatus.ENDED))
+
+        assert repo.purge(7 * 86400) == [_batch_id(1)]
+        assert not os.path.exists(os.path.join(tmp_path, f"{_batch_id(1)}.json"))
+        assert _ids(repo.query()) == [_batch_id(2), _batch_id(3)]
+
+        assert repo.purge(7 * 86400, status="in_progress") == [_batch_id(2)]
+        assert _ids(repo.query()) == [_batch_id(3)]
+
+
+class TestBatchHandleRepositoryMigration:
+    """Existing per-file handles are imported into the index."""
+
+    def _write_legacy_files(self, batch_dir, handles):
+        os.makedirs(batch_dir, exist_ok=True)
+        for handle in handles:
+            path = os.path.join(batch_dir, f"{handle.agentmap_batch_id}.json")
+            with open(path, "w") as f:
+                json.dump(handle.to_dict(), f)
+
+    def test_existing_files_are_imported_on_first_query(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        self._write_legacy_files(
+            str(tmp_path),
+            [_aged_handle(1), _aged_handle(2, status=LLMBatchStatus.ENDED)],
+        )
+        (tmp_path / "watchlist.json").write_text('{"watches": []}')
+        (tmp_path / f"{_batch_id(3)}.json").write_text("{not json")
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+
+        assert _ids(repo.query()) == [_batch_id(1), _batch_id(2)]
+        assert _ids(repo.query(status="ended")) == [_batch_id(2)]
+
+    def test_import_files_picks_up_files_changed_outside_the_index(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        repo = BatchHandleRepository(batch_dir=str(tmp_path))
+        repo.save(_aged_handle(1), graph_name="g")
+        assert repo.import_files() == 0
+
+        changed = _aged_handle(1, status=LLMBatchStatus.ENDED)
+        self._write_legacy_files(str(tmp_path), [changed])
+        path = os.path.join(tmp_path, f"{_batch_id(1)}.json")
+        os.utime(path, (time.time() + 5, time.time() + 5))
+
+        assert repo.import_files() == 1
+        assert _ids(repo.query(status="ended", graph_name="g")) == [_batch_id(1)]
+
+    def test_custom_index_path(self, tmp_path):
+        from agentmap.services.llm_batch_repository import BatchHandleRepository
+
+        index_path = str(tmp_path / "index" / "batches.sqlite3")
+        repo = BatchHandleRepository(
+            batch_dir=str(tmp_path / "handles"), index_path=index_path
+        )
+        repo.save(_aged_handle(1))
+
+        assert os.path.exists(index_path)
+        assert _ids(repo.query()) == [_batch_id(1)]
@@ -0,0 +1,286 @@
+"""
+Unit tests for the static execution plan stored in graph bundles.
+
+Covers routing kinds, reachability, topological levels, fan-out/fan-in,
+cycle detection, orchestrator candidate pre-filtering, validation warnings,
+serialization round-trips, and how edge processing, graph assembly and the
+OrchestratorAgent consume the precomputed plan.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from agentmap.agents.builtins.orchestrator_agent import OrchestratorAgent
+from agentmap.models.execution_plan import ExecutionPlan
+from agentmap.models.node import Node
+from agentmap.services.graph.edge_processor import EdgeProcessor
+from agentmap.services.graph.execution_plan_builder import (
+    build_execution_plan,
+    execution_plan_from_dict,
+    execution_plan_to_dict,
+    validate_execution_plan,
+)
+from agentmap.services.graph.graph_assembly_service import GraphAssemblyService
+from agentmap.services.orchestrator_node_filtering import NodeFilter
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _node(name, agent_type="default", context=None, **edges):
+    node = Node(name=name, agent_type=agent_type, context=context)
+    for condition, target in edges.items():
+        node.add_edge(condition, target)
+    return node
+
+
+def _graph(*nodes):
+    return {node.name: node for node in nodes}
+
+
+class TestBuildExecutionPlan(unittest.TestCase):
+    def test_linear_graph(self):
+        plan = build_execution_plan(
+            _graph(_node("a", default="b"), _node("b", default="c"), _node("c"))
+        )
+
+        self.assertEqual(plan.entry_point, "a")
+        self.assertEqual(plan.levels, [["a"], ["b"], ["c"]])
+        self.assertEqual(plan.routing, {"a": "static", "b": "static", "c": "none"})
+        self.assertEqual(plan.terminal_nodes, ["c"])
+        self.assertEqual(plan.unreachable, [])
+        self.assertEqual(plan.cycles, [])
+
+    def test_parallel_fan_out_and_fan_in(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("start", default=["x", "y", "z"]),
+                _node("x", default="join"),
+                _node("y", default="join"),
+                _node("z", default="join"),
+                _node("join"),
+            )
+        )
+
+        self.assertEqual(plan.levels, [["start"], ["x", "y", "z"], ["join"]])
+        self.assertEqual(
+            plan.parallel_groups,
+            [{"node": "start", "condition": "default", "targets": ["x", "y", "z"]}],
+        )
+        self.assertEqual(plan.fan_in, {"join": ["x", "y", "z"]})
+
+    def test_level_is_longest_path(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("a", success="b", failure="c"),
+                _node("b", default="c"),
+                _node("c"),
+            )
+        )
+
+        self.assertEqual(plan.levels, [["a"], ["b"], ["c"]])
+
+    def test_unreachable_nodes(self):
+        plan = build_execution_plan(
+            _graph(_node("a", default="b"), _node("b"), _node("orphan", default="b")),
+            entry_point="a",
+        )
+
+        self.assertEqual(plan.reachable, ["a", "b"])
+        self.assertEqual(plan.unreachable, ["orphan"])
+        self.assertNotIn("orphan", [n for level in plan.levels for n in level])
+        self.assertIn("orphan", validate_execution_plan(plan)[0])
+
+    def test_cycles_and_self_loops(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("a", default="b"),
+                _node("b", success="c", failure="a"),
+                _node("c", failure="c", success="end"),
+                _node("end"),
+            )
+        )
+
+        self.assertEqual(plan.cycles, [["a", "b"], ["c"]])
+        self.assertEqual(plan.levels, [["a", "b"], ["c"], ["end"]])
+        warnings = validate_execution_plan(plan)
+        self.assertIn("Cycle detected: a -> b -> a", warnings)
+        self.assertIn("Cycle detected: c -> c", warnings)
+
+    def test_function_routing(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("a", success="func:choose", failure="err"),
+                _node("ok"),
+                _node("err"),
+            )
+        )
+
+        self.assertEqual(plan.routing["a"], "function")
+        self.assertEqual(plan.successors["a"], ["err"])
+
+    def test_orchestrator_candidates_by_node_type(self):
+        plan = build_execution_plan(
+            _graph(
+                _node(
+                    "router",
+                    "orchestrator",
+                    {"nodeType": "llm"},
+                    failure="fallback",
+                ),
+                _node("summarize", "llm"),
+                _node("translate", "LLM"),
+                _node("fallback", "echo"),
+            )
+        )
+
+        orchestrator = plan.orchestrators["router"]
+        self.assertEqual(plan.routing["router"], "orchestrator")
+        self.assertEqual(orchestrator.filter_kind, "node_type")
+        self.assertEqual(orchestrator.candidates, ["summarize", "translate"])
+        self.assertEqual(
+            plan.successors["router"], ["summarize", "translate", "fallback"]
+        )
+        self.assertEqual(plan.unreachable, [])
+
+    def test_orchestrator_excludes_itself_and_warns_on_empty_filter(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("router", "orchestrator", {"nodes": "router|missing"}),
+                _node("a"),
+            )
+        )
+
+        orchestrator = plan.orchestrators["router"]
+        self.assertEqual(orchestrator.filter_kind, "names")
+        self.assertEqual(orchestrator.candidates, ["router"])
+        self.assertEqual(plan.successors["router"], [])
+        self.assertEqual(plan.cycles, [])
+        self.assertTrue(
+            any("matches no other nodes" in w for w in validate_execution_plan(plan))
+        )
+
+    def test_round_trip_and_stale_version(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("router", "orchestrator", failure="a"),
+                _node("a", default=["b", "c"]),
+                _node("b", default="a"),
+                _node("c"),
+            )
+        )
+        data = execution_plan_to_dict(plan)
+
+        self.assertEqual(execution_plan_from_dict(data), plan)
+        self.assertIsNone(execution_plan_from_dict({**data, "version": 0}))
+        self.assertIsNone(execution_plan_from_dict(None))
+
+    def test_empty_graph(self):
+        plan = build_execution_plan({})
+
+        self.assertIsNone(plan.entry_point)
+        self.assertEqual(plan.levels, [])
+
+
+class TestNodeFilterParsing(unittest.TestCase):
+    def test_parsed_filter_matches_apply_node_filter(self):
+        nodes = {"a": {"type": "llm"}, "b": {"type": "echo"}, "c": {"type": "LLM"}}
+        for node_filter in ("all", "a|c", "nodeType:llm", "unknown"):
+            with self.subTest(node_filter=node_filter):
+                kind, values = NodeFilter.parse_node_filter(node_filter)
+                self.assertEqual(
+                    NodeFilter.apply_parsed_filter(nodes, kind, values),
+                    NodeFilter.apply_node_filter(nodes, node_filter),
+                )
+
+    def test_filter_from_context(self):
+        self.assertEqual(NodeFilter.filter_from_context(None), "all")
+        self.assertEqual(NodeFilter.filter_from_context({"nodes": "a|b"}), "a|b")
+        self.assertEqual(
+            NodeFilter.filter_from_context({"node_type": "llm"}), "nodeType:llm"
+        )
+
+
+class TestExecutionPlanConsumers(unittest.TestCase):
+    def setUp(self):
+        self.logging_service = MockServiceFactory.create_mock_logging_service()
+
+    def test_edge_processor_skips_terminal_and_static_function_scan(self):
+        processor = EdgeProcessor(self.logging_service, Mock(), Mock())
+        processor._try_add_function_edge = Mock(return_value=False)
+        processor._add_standard_edges = Mock()
+        builder = Mock()
+
+        processor.process_node_edges(builder, "a", {"default": "b"}, [], "none")
+        processor._add_standard_edges.assert_not_called()
+
+        processor.process_node_edges(builder, "a", {"default": "b"}, [], "static")
+        processor._try_add_function_edge.assert_not_called()
+        processor._add_standard_edges.assert_called_once()
+
+        processor.process_node_edges(builder, "a", {"default": "b"}, [])
+        processor._try_add_function_edge.assert_called_once()
+
+    def _assembly(self, plan):
+        service = GraphAssemblyService.__new__(GraphAssemblyService)
+        service.execution_plan = plan
+        service.orchestrator_node_registry = {
+            "router": {"type": "orchestrator"},
+            "summarize": {"type": "llm"},
+            "fallback": {"type": "echo"},
+        }
+        return service
+
+    def test_assembly_injects_prefiltered_registry(self):
+        plan = build_execution_plan(
+            _graph(
+                _node("router", "orchestrator", {"nodeType": "llm"}),
+                _node("summarize", "llm"),
+                _node("fallback", "echo"),
+            )
+        )
+        agent = Mock(node_registry_prefiltered=False)
+
+        self._assembly(plan)._inject_orchestrator_registry("router", agent)
+
+        self.assertEqual(agent.node_registry, {"summarize": {"type": "llm"}})
+        self.assertTrue(agent.node_registry_prefiltered)
+
+    def test_assembly_without_plan_injects_full_registry(self):
+        agent = Mock(node_registry_prefiltered=False)
+        service = self._assembly(None)
+
+        service._inject_orchestrator_registry("router", agent)
+
+        self.assertIs(agent.node_registry, service.orchestrator_node_registry)
+        self.assertFalse(agent.node_registry_prefiltered)
+
+    def test_orchestrator_agent_skips_filter_for_prefiltered_registry(self):
+        agent = OrchestratorAgent(
+            name="router",
+            prompt="",
+            context={"input_fields": ["request"], "nodeType": "llm"},
+            logger=self.logging_service.get_class_logger(OrchestratorAgent),
+        )
+        orchestrator_service = Mock()
+        orchestrator_service.select_best_node.return_value = "summarize"
+        agent.configure_orchestrator_service(orchestrator_service)
+        agent.node_registry = {"summarize": {"type": "llm"}}
+
+        agent.process({"request": "sum it up"})
+        self.assertEqual(
+            orchestrator_service.select_best_node.call_args.kwargs["node_filter"],
+            "nodeType:llm",
+        )
+
+        agent.node_registry_prefiltered = True
+        agent.process({"request": "sum it up"})
+        self.assertEqual(
+            orchestrator_service.select_best_node.call_args.kwargs["node_filter"],
+            "all",
+        )
+
+    def test_plan_defaults_to_current_version(self):
+        self.assertEqual(ExecutionPlan(entry_point=None).version, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
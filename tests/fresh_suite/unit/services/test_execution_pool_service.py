@@ -0,0 +1,301 @@
+"""
+Unit tests for ExecutionPoolService and its use by async graph assembly.
+
+Covers execution.executors config parsing, named pool dispatch, saturation
+metrics, per-graph concurrency caps, BaseAgent.process_async routing, the
+process pool opt-in and checkpoint I/O on the storage_io pool.
+"""
+
+import asyncio
+import contextvars
+import logging
+import os
+import threading
+import unittest
+from unittest.mock import Mock
+
+from agentmap.agents.base_agent import BaseAgent
+from agentmap.exceptions.base_exceptions import ConfigurationException
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.config.config_service import ConfigService
+from agentmap.services.execution_pool_service import ExecutionPoolService
+from agentmap.services.graph.graph_checkpoint_service import GraphCheckpointService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+
+
+class PidAgent(BaseAgent):
+    """CPU-bound style agent: reports the process it ran in."""
+
+    def process(self, inputs):
+        return os.getpid()
+
+
+class ThreadNameAgent(BaseAgent):
+    def process(self, inputs):
+        return threading.current_thread().name
+
+
+class SyncOnlyAgent:
+    """Agent without run_async; assembly wraps its run()."""
+
+    def __init__(self, name):
+        self.name = name
+        self.context = {}
+
+    def run(self, state):
+        return {"thread": threading.current_thread().name}
+
+
+def _make_app_config(executors=None):
+    config_service = Mock(spec=ConfigService)
+    config_service.load_config.return_value = {
+        "execution": {"executors": executors} if executors is not None else {}
+    }
+
+    def get_value(config_data, path, default=None):
+        current = config_data
+        for part in path.split("."):
+            if not isinstance(current, dict) or part not in current:
+                return default
+            current = current[part]
+        return current
+
+    config_service.get_value_from_config.side_effect = get_value
+    return AppConfigService(config_service=config_service, config_path="test.yaml")
+
+
+class TestExecutorConfig(unittest.TestCase):
+    def test_defaults(self):
+        config = _make_app_config().get_executor_config()
+
+        self.assertEqual(
+            config["pools"]["agent"], {"kind": "thread", "max_workers": 16}
+        )
+        self.assertEqual(config["pools"]["storage_io"]["max_workers"], 8)
+        self.assertEqual(config["pools"]["process"]["max_workers"], 0)
+        self.assertEqual(config["default_agent_pool"], "agent")
+        self.assertEqual(config["max_concurrent_per_graph"], 0)
+
+    def test_custom_pool_and_graph_limits(self):
+        config = _make_app_config(
+            {
+                "pools": {"agent": {"max_workers": "4"}, "gpu": {"max_workers": 1}},
+                "graph_limits": {"heavy": "2"},
+            }
+        ).get_executor_config()
+
+        self.assertEqual(config["pools"]["agent"]["max_workers"], 4)
+        self.assertEqual(config["pools"]["gpu"], {"kind": "thread", "max_workers": 1})
+        self.assertEqual(config["graph_limits"], {"heavy": 2})
+
+    def test_invalid_values_raise(self):
+        for executors in (
+            "nope",
+            {"pools": {"agent": {"kind": "fiber"}}},
+            {"pools": {"agent": {"max_workers": -1}}},
+            {"max_concurrent_per_graph": -2},
+            {"graph_limits": {"heavy": "two"}},
+        ):
+            with self.subTest(executors=executors):
+                with self.assertRaises(ConfigurationException):
+                    _make_app_config(executors).get_executor_config()
+
+    def test_disabled_default_agent_pool_is_rejected(self):
+        with self.assertRaises(ConfigurationException):
+            ExecutionPoolService(
+                _make_app_config({"pools": {"agent": {"max_workers": 0}}}),
+                MockServiceFactory.create_mock_logging_service(),
+            )
+
+
+class TestExecutionPoolService(unittest.TestCase):
+    def setUp(self):
+        self.services = []
+
+    def tearDown(self):
+        for service in self.services:
+            service.shutdown()
+
+    def _make_service(self, executors=None):
+        service = ExecutionPoolService(
+            _make_app_config(executors),
+            MockServiceFactory.create_mock_logging_service(),
+        )
+        self.services.append(service)
+        return service
+
+    def test_run_uses_named_pool_and_propagates_context(self):
+        service = self._make_service()
+
+        async def main():
+            _request_id.set("req-1")
+            return await service.run(
+                "storage_io",
+                lambda: (threading.current_thread().name, _request_id.get()),
+            )
+
+        thread_name, request_id = asyncio.run(main())
+
+        self.assertTrue(thread_name.startswith("agentmap-storage_io"))
+        self.assertEqual(request_id, "req-1")
+        metrics = service.get_metrics()["pools"]["storage_io"]
+        self.assertEqual((metrics["submitted"], metrics["completed"]), (1, 1))
+        self.assertFalse(service.get_metrics()["pools"]["agent"]["started"])
+
+    def test_unknown_or_disabled_pool_falls_back_to_agent_pool(self):
+        service = self._make_service()
+
+        self.assertEqual(service.resolve_pool("process"), "agent")
+        self.assertEqual(service.resolve_pool("missing"), "agent")
+        self.assertNotIn("process", service.get_metrics()["pools"])
+
+    def test_saturation_metrics(self):
+        service = self._make_service({"pools": {"agent": {"max_workers": 1}}})
+        release = threading.Event()
+        seen = {}
+
+        async def main():
+            tasks = [
+                asyncio.create_task(service.run("agent", release.wait, 5))
+                for _ in range(3)
+            ]
+            while service.get_metrics()["pools"]["agent"]["submitted"] < 3:
+                await asyncio.sleep(0.01)
+            seen.update(service.get_metrics()["pools"]["agent"])
+            release.set()
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+
+        self.assertEqual((seen["active"], seen["queued"]), (1, 2))
+        self.assertEqual(seen["saturation"], 3.0)
+        self.assertEqual(seen["saturated_submissions"], 2)
+        final = service.get_metrics()["pools"]["agent"]
+        self.assertEqual((final["active"], final["completed"]), (0, 3))
+        self.assertEqual(final["peak_in_flight"], 3)
+
+    def test_failures_are_counted_and_raised(self):
+        service = self._make_service()
+
+        def boom():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(service.run("agent", boom))
+        self.assertEqual(service.get_metrics()["pools"]["agent"]["failed"], 1)
+
+    def test_per_graph_cap_limits_in_flight_work(self):
+        service = self._make_service({"graph_limits": {"capped": 1}})
+        lock = threading.Lock()
+        state = {"current": 0, "peak": 0}
+
+        def work():
+            with lock:
+                state["current"] += 1
+                state["peak"] = max(state["peak"], state["current"])
+            threading.Event().wait(0.02)
+            with lock:
+                state["current"] -= 1
+
+        async def main(graph_name):
+            run = service.bind("agent", graph_name)
+            await asyncio.gather(*(run(work) for _ in range(4)))
+
+        asyncio.run(main("capped"))
+        self.assertEqual(state["peak"], 1)
+        self.assertEqual(
+            service.get_metrics()["graphs"]["capped"],
+            {"limit": 1, "running": 0, "waiting": 0},
+        )
+
+        state["peak"] = 0
+        asyncio.run(main("uncapped"))
+        self.assertGreater(state["peak"], 1)
+
+    def test_base_agent_process_async_uses_configured_runner(self):
+        service = self._make_service()
+        agent = ThreadNameAgent("n", "p")
+
+        agent.configure_executor(service.bind("agent", "g"))
+        thread_name = asyncio.run(agent.process_async({}))
+
+        self.assertTrue(thread_name.startswith("agentmap-agent"))
+
+    def test_process_pool_agent_runs_in_worker_process(self):
+        service = self._make_service({"pools": {"process": {"max_workers": 1}}})
+        agent = PidAgent(
+            "cpu", "p", context={"executor": "process"}, logger=logging.getLogger("t")
+        )
+
+        pool = service.resolve_agent_pool(agent)
+        agent.configure_executor(
+            service.bind(pool), in_process=service.is_process_pool(pool)
+        )
+
+        self.assertEqual(pool, "process")
+        self.assertNotEqual(asyncio.run(agent.process_async({})), os.getpid())
+
+    def test_unpicklable_agent_falls_back_from_process_pool(self):
+        service = self._make_service({"pools": {"process": {"max_workers": 1}}})
+        agent = SyncOnlyAgent("n")
+        agent.context = {"executor": "process"}
+        agent.lock = threading.Lock()
+
+        self.assertEqual(service.resolve_agent_pool(agent), "agent")
+
+
+class TestExecutionPoolIntegration(unittest.TestCase):
+    def setUp(self):
+        self.service = ExecutionPoolService(
+            _make_app_config(), MockServiceFactory.create_mock_logging_service()
+        )
+
+    def tearDown(self):
+        self.service.shutdown()
+
+    def test_assembly_wraps_sync_only_agent_in_agent_pool(self):
+        from agentmap.services.graph.graph_assembly_service import GraphAssemblyService
+
+        assembly = GraphAssemblyService.__new__(GraphAssemblyService)
+        assembly.logger = Mock()
+        assembly.builder = Mock()
+        assembly.orchestrator_nodes = []
+        assembly.execution_pools = self.service
+
+        assembly.add_node("n", SyncOnlyAgent("n"), use_async=True, graph_name="g")
+        node_callable = assembly.builder.add_node.call_args[0][1]
+        result = asyncio.run(node_callable({}))
+
+        self.assertTrue(result["thread"].startswith("agentmap-agent"))
+
+    def test_checkpoint_io_uses_storage_io_pool(self):
+        storage_manager = Mock()
+        checkpoint_service = GraphCheckpointService(
+            storage_manager,
+            MockServiceFactory.create_mock_logging_service(),
+            execution_pool_service=self.service,
+        )
+        checkpoint_service.get_tuple = Mock(return_value=None)
+
+        self.assertIsNone(
+            asyncio.run(checkpoint_service.aget_tuple({"configurable": {}}))
+        )
+        self.assertEqual(
+            self.service.get_metrics()["pools"]["storage_io"]["completed"], 1
+        )
+
+    def test_checkpoint_io_without_pools_uses_to_thread(self):
+        checkpoint_service = GraphCheckpointService(
+            Mock(), MockServiceFactory.create_mock_logging_service()
+        )
+        checkpoint_service.put_writes = Mock()
+
+        asyncio.run(checkpoint_service.aput_writes({}, [], "task"))
+
+        checkpoint_service.put_writes.assert_called_once_with({}, [], "task", "")
+
+
+if __name__ == "__main__":
+    unittest.main()
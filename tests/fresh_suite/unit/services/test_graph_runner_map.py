@@ -0,0 +1,194 @@
+"""
+Unit tests for GraphRunnerService.run_map / run_map_async.
+
+The graph is prepared (registry, agents, assembly) once and invoked per
+item; results come back in item order with per-item errors, and at most
+max_concurrency items run at once.
+"""
+
+import asyncio
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, create_autospec
+
+from agentmap.models.graph_bundle import GraphBundle
+from agentmap.models.node import Node
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.declaration_registry_service import DeclarationRegistryService
+from agentmap.services.execution_tracking_service import ExecutionTrackingService
+from agentmap.services.graph.graph_agent_instantiation_service import (
+    GraphAgentInstantiationService,
+)
+from agentmap.services.graph.graph_assembly_service import GraphAssemblyService
+from agentmap.services.graph.graph_bootstrap_service import GraphBootstrapService
+from agentmap.services.graph.graph_bundle_service import GraphBundleService
+from agentmap.services.graph.graph_checkpoint_service import GraphCheckpointService
+from agentmap.services.graph.graph_execution_service import GraphExecutionService
+from agentmap.services.graph.graph_runner_service import GraphRunnerService
+from agentmap.services.interaction_handler_service import InteractionHandlerService
+from agentmap.services.logging_service import LoggingService
+
+
+class _FakeGraph:
+    """Compiled-graph stand-in that doubles ``x`` and records concurrency."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+
+    def _exit(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _result(state):
+        if state["x"] == "boom":
+            raise RuntimeError("item exploded")
+        if state["x"] == "soft":
+            return {**state, "last_action_success": False, "error": "bad item"}
+        return {**state, "y": state["x"] * 2}
+
+    def invoke(self, state, config=None):
+        self._enter()
+        try:
+            time.sleep(0.01)
+            return self._result(state)
+        finally:
+            self._exit()
+
+    async def ainvoke(self, state, config=None):
+        self._enter()
+        try:
+            await asyncio.sleep(0.01)
+            return self._result(state)
+        finally:
+            self._exit()
+
+
+class TestGraphRunnerMap(unittest.TestCase):
+    def setUp(self):
+        self.instantiation = create_autospec(
+            GraphAgentInstantiationService, instance=True
+        )
+        self.assembly = create_autospec(GraphAssemblyService, instance=True)
+        self.tracking = create_autospec(ExecutionTrackingService, instance=True)
+        self.bundle_service = create_autospec(GraphBundleService, instance=True)
+        self.bundle_service.requires_checkpoint_support.return_value = False
+        logging_service = create_autospec(LoggingService, instance=True)
+        logging_service.get_class_logger.return_value = MagicMock()
+
+        self.runner = GraphRunnerService(
+            app_config_service=create_autospec(AppConfigService, instance=True),
+            graph_bootstrap_service=create_autospec(
+                GraphBootstrapService, instance=True
+            ),
+            graph_agent_instantiation_service=self.instantiation,
+            graph_assembly_service=self.assembly,
+            graph_execution_service=create_autospec(
+                GraphExecutionService, instance=True
+            ),
+            execution_tracking_service=self.tracking,
+            logging_service=logging_service,
+            interaction_handler_service=create_autospec(
+                InteractionHandlerService, instance=True
+            ),
+            graph_checkpoint_service=create_autospec(
+                GraphCheckpointService, instance=True
+            ),
+            graph_bundle_service=self.bundle_service,
+            declaration_registry_service=create_autospec(
+                DeclarationRegistryService, instance=True
+            ),
+        )
+
+        self.bundle = GraphBundle.create_metadata(
+            graph_name="ItemGraph",
+            nodes={"double": Node(name="double", agent_type="default")},
+            required_agents=set(),
+            required_services=set(),
+            function_mappings={},
+            csv_hash="hash",
+        )
+        self.bundle.node_instances = {"double": MagicMock()}
+        self.instantiation.instantiate_agents.side_effect = lambda b, t: b
+        self.graph = _FakeGraph()
+        self.assembly.assemble_graph.return_value = self.graph
+        self.assembly.assemble_graph_async.return_value = self.graph
+
+    def _states(self, values):
+        return [{"x": value} for value in values]
+
+    def test_prepares_once_and_keeps_item_order(self):
+        parent_tracker = MagicMock()
+
+        results = self.runner.run_map(
+            self.bundle,
+            self._states(range(20)),
+            max_concurrency=3,
+            parent_tracker=parent_tracker,
+        )
+
+        self.assertEqual([r.final_state["y"] for r in results], list(range(0, 40, 2)))
+        self.instantiation.instantiate_agents.assert_called_once()
+        self.assembly.assemble_graph.assert_called_once()
+        self.assertLessEqual(self.graph.peak, 3)
+        self.assertGreater(self.graph.peak, 1)
+        self.tracking.record_subgraph_execution.assert_called_once_with(
+            tracker=parent_tracker,
+            subgraph_name="ItemGraph",
+            subgraph_tracker=self.tracking.create_tracker.return_value,
+        )
+
+    def test_failed_items_do_not_stop_the_others(self):
+        results = self.runner.run_map(self.bundle, self._states([1, "boom", "soft", 4]))
+
+        self.assertEqual([r.success for r in results], [True, False, False, True])
+        self.assertEqual(results[1].error, "item exploded")
+        self.assertEqual(results[2].error, "bad item")
+        self.assertEqual(results[3].final_state["y"], 8)
+
+    def test_async_map_runs_on_the_loop_with_bounded_concurrency(self):
+        threads = set()
+        ainvoke = self.graph.ainvoke
+
+        async def recording_ainvoke(state, config=None):
+            threads.add(threading.get_ident())
+            return await ainvoke(state, config)
+
+        self.graph.ainvoke = recording_ainvoke
+
+        async def scenario():
+            results = await self.runner.run_map_async(
+                self.bundle, self._states(list(range(10)) + ["boom"]), max_concurrency=4
+            )
+            return results, threading.get_ident()
+
+        results, loop_thread = asyncio.run(scenario())
+
+        self.assertEqual(threads, {loop_thread})
+        self.assertEqual(self.graph.peak, 4)
+        self.assertEqual(results[9].final_state["y"], 18)
+        self.assertFalse(results[10].success)
+        self.assembly.assemble_graph_async.assert_called_once()
+        self.assembly.assemble_graph.assert_not_called()
+
+    def test_checkpoint_graphs_are_rejected(self):
+        self.bundle_service.requires_checkpoint_support.return_value = True
+
+        with self.assertRaises(ValueError):
+            self.runner.run_map(self.bundle, self._states([1]))
+        self.instantiation.instantiate_agents.assert_not_called()
+
+    def test_empty_list_runs_nothing(self):
+        self.assertEqual(self.runner.run_map(self.bundle, []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
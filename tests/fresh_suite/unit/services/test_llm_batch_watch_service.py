@@ -0,0 +1,321 @@
+"""
+Unit tests for multiplexed LLM batch watching.
+
+Covers list-endpoint polling (poll_via_listing), LLMService.poll_batches
+grouping/fallback, the persisted LLMBatchWatchService (backoff, completion,
+callbacks, restart survival, writers in several processes) and the runtime watcher's workflow resume.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from agentmap.models.llm_batch import BatchPollResult, LLMBatchHandle, LLMBatchStatus
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.config.config_service import ConfigService
+from agentmap.services.llm._batch_listing import poll_via_listing
+from agentmap.services.llm_batch_repository import BatchHandleRepository
+from agentmap.services.llm_batch_watch_service import LLMBatchWatchService
+from agentmap.services.llm_service import LLMService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _handle(index: int, status=LLMBatchStatus.IN_PROGRESS, provider="anthropic"):
+    return LLMBatchHandle(
+        agentmap_batch_id=f"amatch_{index:032x}",
+        provider_batch_id=f"pb-{index}",
+        status=status,
+        provider=provider,
+        model="m",
+        request_id_map={"r": "r"},
+    )
+
+
+def _listed(batch_id):
+    batch = Mock()
+    batch.id = batch_id
+    return batch
+
+
+class TestPollViaListing:
+    def test_stops_listing_once_all_ids_are_found(self):
+        listing = iter([_listed("a"), _listed("b"), _listed("c")])
+        poll_one = Mock()
+
+        results = poll_via_listing(
+            ["b", "a"],
+            listing,
+            lambda b: BatchPollResult(status=LLMBatchStatus.ENDED),
+            poll_one,
+        )
+
+        assert set(results) == {"a", "b"}
+        assert next(listing).id == "c"
+        poll_one.assert_not_called()
+
+    def test_ids_missing_from_listing_are_polled_individually(self):
+        poll_one = Mock(return_value=BatchPollResult(status=LLMBatchStatus.FAILED))
+
+        results = poll_via_listing(
+            ["a", "old"],
+            [_listed("a"), _listed("x"), _listed("y")],
+            lambda b: BatchPollResult(status=LLMBatchStatus.ENDED),
+            poll_one,
+            max_scan=2,
+        )
+
+        assert results["a"].status == LLMBatchStatus.ENDED
+        assert results["old"].status == LLMBatchStatus.FAILED
+        poll_one.assert_called_once_with("old")
+
+
+def _make_watcher(tmp_path, repo, llm_service):
+    config = Mock()
+    config.get_batch_watch_config.return_value = {
+        "poll_interval_seconds": 10.0,
+        "max_poll_interval_seconds": 30.0,
+        "tick_seconds": 1.0,
+        "watchlist_path": str(tmp_path / "batches" / "watchlist.json"),
+        "start_with_server": False,
+    }
+    return LLMBatchWatchService(
+        llm_service,
+        repo,
+        config,
+        MockServiceFactory.create_mock_logging_service(),
+    )
+
+
+def _watch_from_process(tmp_path, indexes):
+    repo = BatchHandleRepository(batch_dir=str(tmp_path / "batches"))
+    watcher = _make_watcher(tmp_path, repo, Mock())
+    for index in indexes:
+        watcher.watch(_handle(index))
+
+
+class TestLLMServicePollBatches:
+    def _service(self, adapters):
+        service = LLMService(
+            configuration=MockServiceFactory.create_mock_app_config_service(),
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            routing_service=Mock(),
+            llm_models_config_service=(
+                MockServiceFactory.create_mock_llm_models_config_service()
+            ),
+        )
+        service._batch_adapters = adapters
+        service._batch_repo = MagicMock()
+        return service
+
+    def test_groups_by_provider_and_uses_poll_many(self):
+        anthropic = MagicMock()
+        anthropic.poll_many.return_value = {
+            "pb-1": BatchPollResult(status=LLMBatchStatus.ENDED),
+            "pb-2": BatchPollResult(status=LLMBatchStatus.IN_PROGRESS),
+        }
+        google = Mock(spec=["poll", "provider_name", "supports_cancel"])
+        google.poll.return_value = BatchPollResult(status=LLMBatchStatus.ENDED)
+        service = self._service({"anthropic": anthropic, "google": google})
+        handles = [
+            _handle(1),
+            _handle(3, provider="google"),
+            _handle(2),
+            _handle(4, status=LLMBatchStatus.EXPIRED),
+        ]
+
+        updated = service.poll_batches(handles)
+
+        anthropic.poll_many.assert_called_once_with(["pb-1", "pb-2"])
+        anthropic.poll.assert_not_called()
+        google.poll.assert_called_once_with("pb-3")
+        assert [h.agentmap_batch_id for h in updated] == [
+            h.agentmap_batch_id for h in handles
+        ]
+        assert [h.status for h in updated] == [
+            LLMBatchStatus.ENDED,
+            LLMBatchStatus.ENDED,
+            LLMBatchStatus.IN_PROGRESS,
+            LLMBatchStatus.EXPIRED,
+        ]
+        service._batch_repo.save.assert_not_called()
+        service._batch_repo.save_many.assert_called_once()
+        assert len(service._batch_repo.save_many.call_args[0][0]) == 3
+
+    def test_poll_many_failure_falls_back_and_isolates_errors(self):
+        adapter = MagicMock()
+        adapter.poll_many.side_effect = RuntimeError("list endpoint down")
+        adapter.poll.side_effect = [
+            BatchPollResult(status=LLMBatchStatus.ENDED),
+            RuntimeError("boom"),
+        ]
+        service = self._service({"anthropic": adapter})
+
+        updated = service.poll_batches([_handle(1), _handle(2)])
+
+        assert [h.status for h in updated] == [
+            LLMBatchStatus.ENDED,
+            LLMBatchStatus.IN_PROGRESS,
+        ]
+
+
+class TestLLMBatchWatchService:
+    @pytest.fixture
+    def repo(self, tmp_path):
+        return BatchHandleRepository(batch_dir=str(tmp_path / "batches"))
+
+    @pytest.fixture
+    def llm_service(self):
+        service = Mock()
+        service.statuses = {}
+        service.poll_batches.side_effect = lambda handles: [
+            LLMBatchHandle.from_dict(
+                {
+                    **h.to_dict(),
+                    "status": service.statuses.get(h.agentmap_batch_id, h.status).value,
+                }
+            )
+            for h in handles
+        ]
+        return service
+
+    def _watcher(self, tmp_path, repo, llm_service):
+        return _make_watcher(tmp_path, repo, llm_service)
+
+    def test_watches_survive_restart(self, tmp_path, repo, llm_service):
+        watcher = self._watcher(tmp_path, repo, llm_service)
+        watcher.watch(_handle(1), resume_thread_id="thread-1")
+        watcher.watch(_handle(1).agentmap_batch_id)
+
+        restarted = self._watcher(tmp_path, repo, llm_service)
+        watches = restarted.list_watches()
+
+        assert len(watches) == 1
+        assert watches[0]["resume_thread_id"] == "thread-1"
+        assert watches[0]["provider"] == "anthropic"
+
+    def test_open_batches_back_off_until_due(self, tmp_path, repo, llm_service):
+        watcher = self._watcher(tmp_path, repo, llm_service)
+        watcher.watch(_handle(1))
+        watcher.watch(_handle(2))
+
+        assert watcher.poll_due() == []
+        llm_service.poll_batches.assert_called_once()
+        assert len(llm_service.poll_batches.call_args[0][0]) == 2
+        assert [w["interval"] for w in watcher.list_watches()] == [20.0, 20.0]
+
+        watcher.poll_due()
+        assert llm_service.poll_batches.call_count == 1  # nothing due yet
+
+        watcher.poll_due(force=True)
+        watcher.poll_due(force=True)
+        assert [w["interval"] for w in watcher.list_watches()] == [30.0, 30.0]
+
+    def test_terminal_batches_complete_and_fire_callbacks(
+        self, tmp_path, repo, llm_service
+    ):
+        watcher = self._watcher(tmp_path, repo, llm_service)
+        seen = []
+        done, running = _handle(1), _handle(2)
+        watcher.watch(done, resume_thread_id="thread-1", on_complete=seen.append)
+        watcher.watch(running)
+        llm_service.statuses[done.agentmap_batch_id] = LLMBatchStatus.ENDED
+
+        completions = watcher.poll_due()
+
+        assert [(c["handle"].status, c["resume_thread_id"]) for c in completions] == [
+            (LLMBatchStatus.ENDED, "thread-1")
+        ]
+        assert [h.agentmap_batch_id for h in seen] == [done.agentmap_batch_id]
+        assert [w["agentmap_batch_id"] for w in watcher.list_watches()] == [
+            running.agentmap_batch_id
+        ]
+
+    def test_watch_without_persisted_handle_is_rejected(
+        self, tmp_path, repo, llm_service
+    ):
+        from agentmap.exceptions import LLMServiceError
+
+        watcher = self._watcher(tmp_path, repo, llm_service)
+
+        with pytest.raises(LLMServiceError):
+            watcher.watch(_handle(9).agentmap_batch_id)
+
+    def test_watch_whose_handle_disappears_is_dropped(
+        self, tmp_path, repo, llm_service
+    ):
+        watcher = self._watcher(tmp_path, repo, llm_service)
+        watcher.watch(_handle(1))
+        repo.delete(_handle(1).agentmap_batch_id)
+
+        assert watcher.poll_due() == []
+        assert watcher.list_watches() == []
+        llm_service.poll_batches.assert_not_called()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    def test_watches_added_by_concurrent_processes_are_kept(
+        self, tmp_path, repo, llm_service
+    ):
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(
+                target=_watch_from_process,
+                args=(tmp_path, range(start, start + 10)),
+            )
+            for start in range(0, 40, 10)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            assert worker.exitcode == 0
+
+        watches = self._watcher(tmp_path, repo, llm_service).list_watches()
+        assert sorted(w["agentmap_batch_id"] for w in watches) == [
+            _handle(i).agentmap_batch_id for i in range(40)
+        ]
+
+
+class TestBatchWatchConfig:
+    def _config(self, batch_watch):
+        config_service = Mock(spec=ConfigService)
+        config_service.load_config.return_value = {"llm": {"batch_watch": batch_watch}}
+        config_service.get_value_from_config.side_effect = (
+            lambda data, path, default=None: (
+                data["llm"]["batch_watch"] if path == "llm.batch_watch" else default
+            )
+        )
+        return AppConfigService(
+            config_service=config_service, config_path="test.yaml"
+        ).get_batch_watch_config()
+
+    def test_server_watcher_is_opt_in(self):
+        assert self._config({})["start_with_server"] is False
+        assert self._config({"start_with_server": True})["start_with_server"] is True
+
+
+class TestRuntimeResume:
+    def test_completed_batch_resumes_waiting_thread(self):
+        from agentmap.runtime import batch_ops
+
+        completions = [
+            {
+                "handle": _handle(1, status=LLMBatchStatus.ENDED),
+                "resume_thread_id": "thread-1",
+            },
+            {"handle": _handle(2, status=LLMBatchStatus.FAILED)},
+        ]
+        resume = AsyncMock(return_value={"success": True})
+
+        with patch.object(batch_ops, "resume_workflow_async", resume):
+            summaries = asyncio.run(batch_ops._process_completions(completions, None))
+
+        token = json.loads(resume.call_args[0][0])
+        assert token["thread_id"] == "thread-1"
+        assert token["response_data"]["batch"]["status"] == "ended"
+        assert "request_id_map" not in token["response_data"]["batch"]
+        assert summaries[0]["resumed"] is True
+        assert "resumed" not in summaries[1]
@@ -0,0 +1,238 @@
+"""
+Unit tests for the segmented-log LocalMessageAdapter.
+
+Covers offset assignment across segment rolls, batched publish, lookups
+through the index, consumer groups with committed positions, segment-level
+retention, recovery of a log whose index write was interrupted, writers
+in several processes sharing one storage path, and migration of per-message JSON files written by the previous layout.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+import unittest
+import uuid
+from pathlib import Path
+from unittest.mock import Mock
+
+from agentmap.services.messaging.local_adapter import LocalMessageAdapter
+
+
+def _publish_from_process(config, count):
+    adapter = LocalMessageAdapter(config, Mock())
+    for i in range(count):
+        asyncio.run(adapter.publish("events", {"n": i}))
+
+
+class TestLocalMessageAdapter(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.config = {"storage_path": self.temp_dir, "segment_max_messages": 3}
+        self.adapter = self._adapter()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _adapter(self):
+        return LocalMessageAdapter(self.config, Mock())
+
+    def _publish_batch(self, count, topic="events", adapter=None):
+        adapter = adapter or self.adapter
+        result = asyncio.run(
+            adapter.publish_batch(topic, [{"n": i} for i in range(count)])
+        )
+        self.assertTrue(result.success, result.error)
+        return result
+
+    def _segments(self, topic="events"):
+        return sorted(p.name for p in (Path(self.temp_dir) / topic).glob("*.log"))
+
+    def test_publish_assigns_offsets_and_is_readable_by_id(self):
+        first = asyncio.run(self.adapter.publish("events", {"n": 0}, {"k": "v"}))
+        second = asyncio.run(self.adapter.publish("events", {"n": 1}))
+
+        self.assertEqual((first.data["offset"], second.data["offset"]), (0, 1))
+        message = self.adapter.read_message("events", first.data["message_id"])
+        self.assertEqual(message["payload"], {"n": 0})
+        self.assertEqual(message["attributes"], {"k": "v"})
+        self.assertIsNone(self.adapter.read_message("events", "not-a-uuid"))
+
+    def test_batch_rolls_segments_and_reads_across_them(self):
+        result = self._publish_batch(7)
+
+        self.assertEqual(
+            (result.data["first_offset"], result.data["last_offset"]), (0, 6)
+        )
+        self.assertEqual(
+            self._segments(),
+            [
+                "00000000000000000000.log",
+                "00000000000000000003.log",
+                "00000000000000000006.log",
+            ],
+        )
+        self.assertEqual(
+            [m["payload"]["n"] for m in self.adapter.read_from("events", 2, 4)],
+            [2, 3, 4, 5],
+        )
+        self.assertEqual(
+            [m["offset"] for m in self.adapter.list_messages("events", limit=4)],
+            [6, 5, 4, 3],
+        )
+        last_id = result.data["message_ids"][4]
+        self.assertEqual(self.adapter.read_message("events", last_id)["offset"], 4)
+
+        # A restarted publisher continues the newest segment.
+        self._publish_batch(2, adapter=self._adapter())
+        self.assertEqual(self.adapter.get_offsets("events")["end_offset"], 9)
+        self.assertEqual(len(self._segments()), 3)
+
+    def test_consumer_groups_resume_from_committed_offsets(self):
+        self._publish_batch(5)
+
+        batch = self.adapter.consume("events", "workers", max_messages=2)
+        self.assertEqual([m["offset"] for m in batch], [0, 1])
+        self.adapter.commit("events", "workers")
+        batch = self.adapter.consume("events", "workers", max_messages=2)
+        self.assertEqual([m["offset"] for m in batch], [2, 3])
+
+        # Uncommitted messages are redelivered after a restart.
+        restarted = self._adapter()
+        self.assertEqual(restarted.get_committed_offset("events", "workers"), 2)
+        batch = restarted.consume("events", "workers", 10, auto_commit=True)
+        self.assertEqual([m["offset"] for m in batch], [2, 3, 4])
+        self.assertEqual(restarted.consume("events", "workers"), [])
+
+        # Groups are independent.
+        self.assertEqual(len(restarted.consume("events", "audit", 10)), 5)
+
+        topic = restarted.get_storage_info()["topics"][0]
+        self.assertEqual(topic["message_count"], 5)
+        self.assertEqual(topic["consumer_groups"]["workers"]["lag"], 0)
+        self.assertNotIn("audit", topic["consumer_groups"])
+
+    def test_retention_drops_whole_segments_and_keeps_offsets(self):
+        self._publish_batch(7)
+        self.adapter.commit("events", "workers", 1)
+        topic_dir = Path(self.temp_dir) / "events"
+        old = time.time() - 3 * 24 * 60 * 60
+        for name in self._segments()[:2]:
+            os.utime(topic_dir / name, (old, old))
+
+        self.assertEqual(self.adapter.cleanup_old_messages("events", 1), 6)
+        self.assertEqual(self.adapter.get_offsets("events")["start_offset"], 6)
+        # A group behind the retained range skips to the oldest message.
+        self.assertEqual(
+            [m["offset"] for m in self.adapter.consume("events", "workers")], [6]
+        )
+
+        # Expiring the newest segment leaves an empty one at the next offset.
+        os.utime(topic_dir / self._segments()[0], (old, old))
+        self.assertEqual(self.adapter.cleanup_old_messages("events", 1), 1)
+        self.assertEqual(self._segments(), ["00000000000000000007.log"])
+        self.assertEqual(
+            asyncio.run(self.adapter.publish("events", {})).data["offset"], 7
+        )
+
+    def test_recovers_records_missing_from_the_index(self):
+        self._publish_batch(2)
+        log_path = Path(self.temp_dir) / "events" / "00000000000000000000.log"
+        record = {"message_id": "6b0d5f4e-2f51-4a8f-9d77-0e6b1c2e9a10", "offset": 2}
+        with open(log_path, "a", encoding="utf-8") as log:
+            log.write(json.dumps(record) + "\n")
+            log.write('{"message_id": "trunc')
+
+        restarted = self._adapter()
+        result = asyncio.run(restarted.publish("events", {"n": "after"}))
+
+        self.assertEqual(result.data["offset"], 3)
+        self.assertEqual(
+            restarted.read_message("events", record["message_id"])["offset"], 2
+        )
+        self.assertEqual(
+            restarted.read_from("events", 3, 1)[0]["payload"]["n"], "after"
+        )
+
+    def test_publishers_sharing_a_path_never_reuse_offsets(self):
+        other = self._adapter()
+        self._publish_batch(2)
+        self._publish_batch(2, adapter=other)
+        self._publish_batch(1)
+        self._publish_batch(3, adapter=other)
+
+        records = self.adapter.read_from("events", 0, 20)
+        self.assertEqual([m["offset"] for m in records], list(range(8)))
+        self.assertEqual([m["payload"]["n"] for m in records], [0, 1, 0, 1, 0, 0, 1, 2])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_concurrent_publishing_processes_get_unique_offsets(self):
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_publish_from_process, args=(self.config, 20))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+            self.assertEqual(worker.exitcode, 0)
+
+        records = self._adapter().read_from("events", 0, 200)
+        self.assertEqual([m["offset"] for m in records], list(range(80)))
+        self.assertEqual(len({m["message_id"] for m in records}), 80)
+
+    def _write_legacy(self, topic, timestamp, payload, message_id=None):
+        topic_dir = Path(self.temp_dir) / topic
+        topic_dir.mkdir(parents=True, exist_ok=True)
+        message_id = message_id or str(uuid.uuid4())
+        name = f"{timestamp.replace(':', '-').replace('.', '-')}_{message_id}.json"
+        (topic_dir / name).write_text(
+            json.dumps(
+                {
+                    "message_id": message_id,
+                    "timestamp": timestamp,
+                    "topic": topic,
+                    "payload": payload,
+                    "attributes": {"k": "v"},
+                    "source": "local_adapter",
+                }
+            )
+        )
+        return message_id
+
+    def test_legacy_message_files_are_migrated_on_first_open(self):
+        later = self._write_legacy("old", "2024-01-02T00:00:00", {"n": 1})
+        earlier = self._write_legacy("old", "2024-01-01T00:00:00", {"n": 0})
+        (Path(self.temp_dir) / "old" / "broken.json").write_text("{")
+        adapter = self._adapter()
+
+        messages = adapter.read_from("old", 0, 10)
+
+        self.assertEqual([m["message_id"] for m in messages], [earlier, later])
+        self.assertEqual([m["offset"] for m in messages], [0, 1])
+        self.assertEqual(adapter.read_message("old", later)["payload"], {"n": 1})
+        self.assertEqual(messages[0]["attributes"], {"k": "v"})
+        remaining = sorted(p.name for p in (Path(self.temp_dir) / "old").glob("*.json"))
+        self.assertEqual(remaining, ["broken.json"])
+
+        published = asyncio.run(self._adapter().publish("old", {"n": 2}))
+        self.assertEqual(published.data["offset"], 2)
+
+    def test_interrupted_migration_does_not_duplicate_messages(self):
+        message_id = self._write_legacy("old", "2024-01-01T00:00:00", {"n": 0})
+        self._adapter().read_from("old", 0, 10)
+        # A crash before the legacy files were deleted leaves them behind.
+        self._write_legacy("old", "2024-01-01T00:00:00", {"n": 0}, message_id)
+        self._write_legacy("old", "2024-01-02T00:00:00", {"n": 1})
+
+        messages = self._adapter().read_from("old", 0, 10)
+
+        self.assertEqual([m["payload"] for m in messages], [{"n": 0}, {"n": 1}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Unit tests for the deferred log-formatting helpers in logging_service.
+"""
+
+import unittest
+from unittest.mock import Mock
+
+from agentmap.services.logging_service import lazy_log, log_payload
+
+
+class TestLogPayload(unittest.TestCase):
+    def test_small_values_render_like_repr(self):
+        self.assertEqual(
+            str(log_payload({"a": 1, "b": [1, 2]})), "{'a': 1, 'b': [1, 2]}"
+        )
+        self.assertEqual(str(log_payload("hello")), "hello")
+
+    def test_long_strings_are_clipped_with_a_count(self):
+        text = str(log_payload("x" * 150, max_chars=100))
+
+        self.assertEqual(text, "x" * 100 + "... [50 more chars]")
+
+    def test_large_containers_are_not_walked_in_full(self):
+        state = {f"key_{i}": "v" * 10_000 for i in range(10_000)}
+
+        text = str(log_payload(state))
+
+        self.assertLessEqual(len(text), 1000 + len("... [] more chars]") + 10)
+        self.assertTrue(text.startswith("{'key_0': "))
+
+    def test_repr_matches_str(self):
+        payload = log_payload([1, 2, 3])
+        self.assertEqual(repr(payload), str(payload))
+
+
+class TestLazyLog(unittest.TestCase):
+    def test_function_runs_only_when_rendered(self):
+        func = Mock(return_value=["a", "b"])
+        message = lazy_log(func, 1, 2)
+
+        func.assert_not_called()
+        self.assertEqual(str(message), "['a', 'b']")
+        func.assert_called_once_with(1, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+"""
+Unit tests for batched publishing in MessagingService.
+
+Covers publish_batch through the local adapter, per-message results and
+retry of only the failed messages, the fallback for adapters without a
+batch call, the background batcher, and AWS request chunking.
+"""
+
+import asyncio
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from agentmap.models.storage.types import StorageResult
+from agentmap.services.messaging.aws_adapter import AWSMessageAdapter
+from agentmap.services.messaging.messaging_service import (
+    CloudProvider,
+    MessagePriority,
+    MessagingService,
+)
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _ok(message_id):
+    return StorageResult(
+        success=True, data={"message_id": message_id}, operation="publish_message"
+    )
+
+
+class _RecordingBatchAdapter:
+    """Adapter whose batch call fails the listed message types once."""
+
+    def __init__(self, fail_once=()):
+        self.batches = []
+        self.fail_once = set(fail_once)
+
+    async def publish_batch(self, topic, messages, attributes):
+        self.batches.append([m["message_type"] for m in messages])
+        results = []
+        for message in messages:
+            if message["message_type"] in self.fail_once:
+                self.fail_once.discard(message["message_type"])
+                results.append(StorageResult(success=False, error="throttled"))
+            else:
+                results.append(_ok(f"id-{message['message_type']}"))
+        return StorageResult(success=True, item_results=results)
+
+    def get_provider(self):
+        return CloudProvider.LOCAL
+
+
+class TestMessagingBatching(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.messaging_config = {
+            "default_provider": "local",
+            "providers": {"local": {"enabled": True, "storage_path": self.temp_dir}},
+            "retry_policy": {"max_retries": 3, "backoff_seconds": [0]},
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _service(self):
+        app_config = Mock()
+        app_config.get_messaging_config.return_value = self.messaging_config
+        availability = Mock()
+        availability.get_availability.return_value = None
+        return MessagingService(
+            app_config, MockServiceFactory.create_mock_logging_service(), availability
+        )
+
+    def test_publish_batch_through_local_adapter(self):
+        service = self._service()
+        specs = [
+            {"message_type": "item_done", "payload": {"n": i}, "thread_id": "t1"}
+            for i in range(3)
+        ]
+        specs[2]["priority"] = "high"
+
+        result = asyncio.run(service.publish_batch("events", specs))
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.total_affected, 3)
+        self.assertEqual([r.data["offset"] for r in result.item_results], [0, 1, 2])
+        stored = service.adapters[CloudProvider.LOCAL].read_from("events", 0, 3)
+        self.assertEqual([m["payload"]["message_id"] for m in stored], result.ids)
+        self.assertEqual(stored[2]["attributes"]["priority"], "high")
+        self.assertEqual(stored[0]["attributes"]["thread_id"], "t1")
+
+    def test_only_failed_messages_are_retried(self):
+        service = self._service()
+        adapter = _RecordingBatchAdapter(fail_once={"b"})
+        service.adapters[CloudProvider.LOCAL] = adapter
+        specs = [{"message_type": t, "payload": {}} for t in "abc"]
+
+        result = asyncio.run(service.publish_batch("events", specs))
+
+        self.assertTrue(result.success)
+        self.assertEqual(adapter.batches, [["a", "b", "c"], ["b"]])
+        self.assertEqual(
+            [r.data["message_id"] for r in result.item_results],
+            ["id-a", "id-b", "id-c"],
+        )
+
+    def test_persistent_failures_are_reported_per_message(self):
+        self.messaging_config["retry_policy"]["max_retries"] = 1
+        service = self._service()
+        service.adapters[CloudProvider.LOCAL] = _RecordingBatchAdapter(fail_once={"b"})
+        specs = [{"message_type": t, "payload": {}} for t in "ab"]
+
+        result = asyncio.run(service.publish_batch("events", specs))
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.error_count, 1)
+        self.assertIn("Message 1: throttled", result.error)
+        self.assertEqual([r.success for r in result.item_results], [True, False])
+
+    def test_adapter_without_batch_call_publishes_concurrently(self):
+        service = self._service()
+        adapter = Mock(spec=["publish", "get_provider"])
+        in_flight, peak = [0], [0]
+
+        async def publish(topic, message, attributes):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return _ok(message["message_id"])
+
+        adapter.publish.side_effect = publish
+        service.adapters[CloudProvider.LOCAL] = adapter
+        specs = [{"message_type": "e", "payload": {}} for _ in range(4)]
+
+        result = asyncio.run(service.publish_batch("events", specs))
+
+        self.assertTrue(result.success)
+        self.assertEqual(peak[0], 4)
+
+    def test_background_batcher_coalesces_publish_message_calls(self):
+        self.messaging_config["batching"] = {
+            "enabled": True,
+            "max_messages": 3,
+            "linger_ms": 20,
+        }
+        service = self._service()
+        adapter = _RecordingBatchAdapter()
+        service.adapters[CloudProvider.LOCAL] = adapter
+
+        async def publish_all():
+            return await asyncio.gather(
+                *(
+                    service.publish_message(
+                        "events", str(i), {}, priority=MessagePriority.LOW
+                    )
+                    for i in range(7)
+                )
+            )
+
+        results = asyncio.run(publish_all())
+
+        self.assertEqual(adapter.batches, [["0", "1", "2"], ["3", "4", "5"], ["6"]])
+        self.assertEqual(
+            [r.data["message_id"] for r in results], [f"id-{i}" for i in range(7)]
+        )
+
+    def test_flush_sends_lingering_messages(self):
+        self.messaging_config["batching"] = {"enabled": True, "linger_ms": 60000}
+        service = self._service()
+        adapter = _RecordingBatchAdapter()
+        service.adapters[CloudProvider.LOCAL] = adapter
+
+        async def publish_then_flush():
+            pending = asyncio.ensure_future(service.publish_message("events", "x", {}))
+            await asyncio.sleep(0)
+            await service.flush()
+            return await pending
+
+        self.assertTrue(asyncio.run(publish_then_flush()).success)
+        self.assertEqual(adapter.batches, [["x"]])
+
+
+class TestAWSBatchChunking(unittest.TestCase):
+    def test_entries_are_chunked_and_mapped_back_by_id(self):
+        adapter = AWSMessageAdapter.__new__(AWSMessageAdapter)
+        adapter.logger = Mock()
+        adapter.service_type = "sqs"
+        requests = []
+
+        def send(entries):
+            requests.append([e["Id"] for e in entries])
+            return {
+                "Successful": [
+                    {"Id": e["Id"], "MessageId": f"m{e['Id']}"}
+                    for e in entries
+                    if e["Id"] != "12"
+                ],
+                "Failed": (
+                    [{"Id": "12", "Code": "Throttled", "Message": "slow down"}]
+                    if any(e["Id"] == "12" for e in entries)
+                    else []
+                ),
+            }
+
+        messages = [{"n": i} for i in range(23)]
+        results = adapter._send_in_chunks("q", messages, [{"k": "v"}] * 23, send)
+
+        self.assertEqual([len(r) for r in requests], [10, 10, 3])
+        self.assertEqual(results[0].data["message_id"], "m0")
+        self.assertFalse(results[12].success)
+        self.assertIn("Throttled", results[12].error)
+        self.assertEqual(sum(r.success for r in results), 22)
+
+    def test_chunks_respect_the_byte_limit(self):
+        adapter = AWSMessageAdapter.__new__(AWSMessageAdapter)
+        adapter.logger = Mock()
+        adapter.service_type = "sns"
+        requests = []
+
+        def send(entries):
+            requests.append(len(entries))
+            return {"Successful": [{"Id": e["Id"]} for e in entries]}
+
+        big = {"blob": "x" * (100 * 1024)}
+        adapter._send_in_chunks("t", [big] * 5, [None] * 5, send)
+
+        self.assertEqual(requests, [2, 2, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,317 @@
+"""
+Unit tests for NodeResultCache and per-node memoization in the agent lifecycle.
+
+Covers execution.node_cache config parsing, key derivation from agent
+type / prompt / context / inputs, TTL expiry, LRU eviction by entry count
+and size, non-JSON bypass, the side-effect opt-out, and sync/async agent
+runs replaying a cached state update instead of calling process().
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from agentmap.agents.base_agent import BaseAgent
+from agentmap.agents.builtins.storage.file.writer import FileWriterAgent
+from agentmap.exceptions.base_exceptions import ConfigurationException
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.config.config_service import ConfigService
+from agentmap.services.graph.graph_agent_instantiation_service import (
+    GraphAgentInstantiationService,
+)
+from agentmap.services.graph.node_result_cache import NodeResultCache
+from agentmap.services.state_adapter_service import StateAdapterService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+class CountingAgent(BaseAgent):
+    """Upper-cases its input and counts process() calls."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.calls = 0
+
+    def process(self, inputs):
+        self.calls += 1
+        return str(inputs.get("text")).upper()
+
+
+class SideEffectAgent(CountingAgent):
+    has_side_effects = True
+
+
+def _make_app_config(node_cache=None):
+    config_service = Mock(spec=ConfigService)
+    config_service.load_config.return_value = {
+        "execution": {"node_cache": node_cache} if node_cache is not None else {}
+    }
+
+    def get_value(config_data, path, default=None):
+        current = config_data
+        for part in path.split("."):
+            if not isinstance(current, dict) or part not in current:
+                return default
+            current = current[part]
+        return current
+
+    config_service.get_value_from_config.side_effect = get_value
+    return AppConfigService(config_service=config_service, config_path="test.yaml")
+
+
+def _agent(cls=CountingAgent, name="upper", prompt="Upper-case it", **context):
+    agent = cls(
+        name=name,
+        prompt=prompt,
+        context={"input_fields": ["text"], "output_field": "result", **context},
+        logger=MockServiceFactory.create_mock_logging_service().get_class_logger(cls),
+        execution_tracking_service=Mock(),
+        state_adapter_service=StateAdapterService(),
+    )
+    agent.set_execution_tracker(object())
+    return agent
+
+
+class TestNodeCacheConfig(unittest.TestCase):
+    def test_defaults(self):
+        config = _make_app_config().get_node_cache_config()
+
+        self.assertFalse(config["enabled"])
+        self.assertFalse(config["memoize_all"])
+        self.assertTrue(config["path"].endswith("node_results.sqlite3"))
+        self.assertEqual(config["ttl_seconds"], 86400)
+        self.assertEqual(config["max_entries"], 10000)
+        self.assertEqual(config["max_bytes"], 256 * 1024 * 1024)
+
+    def test_string_flags_and_numbers_are_coerced(self):
+        config = _make_app_config(
+            {"enabled": "yes", "max_entries": "50", "ttl_seconds": "0"}
+        ).get_node_cache_config()
+
+        self.assertTrue(config["enabled"])
+        self.assertEqual(config["max_entries"], 50)
+        self.assertEqual(config["ttl_seconds"], 0)
+
+    def test_invalid_values_raise(self):
+        for node_cache in ("nope", {"max_entries": -1}, {"ttl_seconds": "soon"}):
+            with self.subTest(node_cache=node_cache):
+                with self.assertRaises(ConfigurationException):
+                    _make_app_config(node_cache).get_node_cache_config()
+
+
+class TestNodeResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _cache(self, **overrides):
+        config = {
+            "path": os.path.join(self.temp_dir, "cache", "nodes.sqlite3"),
+            "ttl_seconds": 0,
+            "max_entries": 0,
+            "max_bytes": 0,
+            **overrides,
+        }
+        return NodeResultCache(config, MockServiceFactory.create_mock_logging_service())
+
+    def test_put_then_get_round_trips(self):
+        cache = self._cache()
+        agent = _agent()
+        key = cache.make_key(agent, {"text": "hi"})
+
+        self.assertIsNone(cache.get(key))
+        self.assertTrue(cache.put(key, agent, {"result": "HI", "n": [1, 2]}))
+        self.assertEqual(cache.get(key), {"result": "HI", "n": [1, 2]})
+        self.assertEqual(cache.get_stats()["entries"], 1)
+
+    def test_key_depends_on_agent_prompt_context_inputs_and_namespace(self):
+        cache = self._cache()
+        base = cache.make_key(_agent(), {"text": "hi"})
+
+        self.assertEqual(base, cache.make_key(_agent(name="other"), {"text": "hi"}))
+        self.assertEqual(
+            base, cache.make_key(_agent(), {"text": "hi"}), "key must be stable"
+        )
+        for changed in (
+            cache.make_key(_agent(), {"text": "ho"}),
+            cache.make_key(_agent(prompt="Shout it"), {"text": "hi"}),
+            cache.make_key(_agent(model="gpt-x"), {"text": "hi"}),
+            cache.make_key(_agent(SideEffectAgent), {"text": "hi"}),
+            self._cache(namespace="v2").make_key(_agent(), {"text": "hi"}),
+        ):
+            self.assertNotEqual(base, changed)
+
+    def test_unencodable_inputs_and_results_bypass_the_cache(self):
+        cache = self._cache()
+        agent = _agent()
+
+        self.assertIsNone(cache.make_key(agent, {"text": object()}))
+        key = cache.make_key(agent, {"text": "hi"})
+        self.assertFalse(cache.put(key, agent, {"result": object()}))
+        self.assertFalse(cache.put(key, agent, {"result": ("a", "b")}))
+        self.assertIsNone(cache.get(key))
+
+    def test_expired_entries_are_misses(self):
+        cache = self._cache(ttl_seconds=60)
+        agent = _agent()
+        cache.put("old", agent, {"result": 1})
+        cache.put("new", agent, {"result": 2})
+        cache.ttl_seconds = 0.05
+        time.sleep(0.1)
+        cache.put("new", agent, {"result": 2})
+
+        self.assertIsNone(cache.get("old"))
+        self.assertEqual(cache.get("new"), {"result": 2})
+
+    def test_evicts_least_recently_used_over_entry_limit(self):
+        cache = self._cache(max_entries=2)
+        agent = _agent()
+        cache.put("a", agent, {"result": "a"})
+        time.sleep(0.01)
+        cache.put("b", agent, {"result": "b"})
+        time.sleep(0.01)
+        cache.get("a")  # refresh "a" so "b" is the oldest
+        time.sleep(0.01)
+        cache.put("c", agent, {"result": "c"})
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), {"result": "a"})
+        self.assertEqual(cache.get("c"), {"result": "c"})
+
+    def test_evicts_over_byte_limit_and_skips_oversized_results(self):
+        cache = self._cache(max_bytes=60)
+        agent = _agent()
+        cache.put("a", agent, {"result": "x" * 30})
+        time.sleep(0.01)
+        cache.put("b", agent, {"result": "y" * 30})
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+        self.assertFalse(cache.put("c", agent, {"result": "z" * 100}))
+        self.assertLessEqual(cache.get_stats()["bytes"], 60)
+
+    def test_clear_removes_everything(self):
+        cache = self._cache()
+        cache.put("a", _agent(), {"result": "a"})
+
+        self.assertEqual(cache.clear(), 1)
+        self.assertIsNone(cache.get("a"))
+
+    def test_should_memoize_honours_opt_in_and_side_effects(self):
+        cache = self._cache()
+
+        self.assertFalse(cache.should_memoize(_agent()))
+        self.assertTrue(cache.should_memoize(_agent(memoize=True)))
+        self.assertTrue(cache.should_memoize(_agent(memoize="true")))
+        self.assertFalse(cache.should_memoize(_agent(memoize="false")))
+        self.assertFalse(cache.should_memoize(_agent(SideEffectAgent, memoize=True)))
+        self.assertTrue(FileWriterAgent.has_side_effects)
+
+        memoize_all = self._cache(memoize_all=True)
+        self.assertTrue(memoize_all.should_memoize(_agent()))
+        self.assertFalse(memoize_all.should_memoize(_agent(memoize=False)))
+        self.assertFalse(memoize_all.should_memoize(_agent(SideEffectAgent)))
+
+    def test_instantiation_attaches_cache_only_to_memoized_agents(self):
+        cache = self._cache()
+        service = GraphAgentInstantiationService.__new__(GraphAgentInstantiationService)
+        service.node_result_cache = cache
+        service.logger = Mock()
+        opted_in, plain, writer = (
+            _agent(memoize=True),
+            _agent(),
+            _agent(SideEffectAgent, memoize=True),
+        )
+        for agent in (opted_in, plain, writer):
+            service._configure_node_result_cache(agent, agent.name)
+
+        self.assertIs(opted_in._node_result_cache, cache)
+        self.assertFalse(hasattr(plain, "_node_result_cache"))
+        self.assertFalse(hasattr(writer, "_node_result_cache"))
+
+
+class TestMemoizedLifecycle(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = NodeResultCache(
+            {"path": os.path.join(self.temp_dir, "nodes.sqlite3")},
+            MockServiceFactory.create_mock_logging_service(),
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _memoized_agent(self, **context):
+        agent = _agent(memoize=True, **context)
+        agent.configure_node_result_cache(self.cache)
+        return agent
+
+    def test_second_run_replays_cached_update(self):
+        first, second = self._memoized_agent(), self._memoized_agent()
+
+        self.assertEqual(first.run({"text": "hi"}), {"result": "HI"})
+        self.assertEqual(second.run({"text": "hi"}), {"result": "HI"})
+        self.assertEqual((first.calls, second.calls), (1, 0))
+        second.execution_tracking_service.record_node_result.assert_called_once()
+        _, kwargs = second.execution_tracking_service.record_node_result.call_args
+        self.assertEqual(kwargs["result"], {"result": "HI"})
+
+    def test_changed_inputs_or_config_run_again(self):
+        agent = self._memoized_agent()
+        agent.run({"text": "hi"})
+        agent.run({"text": "ho"})
+        edited = self._memoized_agent(temperature=0.1)
+        edited.run({"text": "hi"})
+
+        self.assertEqual(agent.calls, 2)
+        self.assertEqual(edited.calls, 1)
+
+    def test_errors_are_not_cached(self):
+        agent = self._memoized_agent()
+        agent.process = Mock(side_effect=RuntimeError("boom"))
+        agent.run({"text": "hi"})
+
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+    def test_reported_failures_are_not_replayed(self):
+        failing = {"error": "provider timeout", "last_action_success": False}
+        first, second = self._memoized_agent(), self._memoized_agent()
+        first.process = Mock(return_value=failing)
+
+        first.run({"text": "hi"})
+        asyncio.run(first.run_async({"text": "hi"}))
+
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+        self.assertEqual(second.run({"text": "hi"}), {"result": "HI"})
+        self.assertEqual(second.calls, 1)
+
+    def test_cache_failures_fall_back_to_running_the_node(self):
+        agent = self._memoized_agent()
+        agent._node_result_cache = Mock()
+        agent._node_result_cache.make_key.side_effect = OSError("disk full")
+
+        self.assertEqual(agent.run({"text": "hi"}), {"result": "HI"})
+        self.assertEqual(agent.calls, 1)
+
+    def test_async_run_uses_the_same_cache(self):
+        first, second = self._memoized_agent(), self._memoized_agent()
+
+        first.run({"text": "hi"})
+        result = asyncio.run(second.run_async({"text": "hi"}))
+
+        self.assertEqual(result, {"result": "HI"})
+        self.assertEqual(second.calls, 0)
+
+    def test_cache_is_not_shipped_to_process_pool_copies(self):
+        agent = self._memoized_agent()
+
+        self.assertIsNone(agent._detached_for_process_pool()._node_result_cache)
+
+
+if __name__ == "__main__":
+    unittest.main()
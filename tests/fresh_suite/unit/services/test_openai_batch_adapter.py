@@ -10,6 +10,8 @@ Covers:
 - TC-089: With SDK installed (mocked), adapter instantiates successfully
 - TC-005: provider_name and supports_cancel class attributes
 - poll: OpenAI status → LLMBatchStatus mapping
+- Spooling/sharding: request/byte limits split a submission into shards under
+  one logical id; shard retry and request-ordered result merge
 """
 
 import builtins
@@ -17,7 +19,7 @@ import datetime
 import importlib
 import json
 import sys
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, patch
 
 import pytest
 
@@ -53,19 +55,40 @@ def _make_resolved(specs, model="gpt-4o", max_tokens=1024, request_options=None)
     return [dict(rp) for _ in specs]
 
 
-def _make_adapter(client_instance=None):
+def _record_uploads(ci):
+    """Read each spool file handed to files.create while it is still open."""
+    uploads = []
+
+    def create(file=None, purpose=None):
+        content = file[1] if isinstance(file, tuple) else file
+        uploads.append(content if isinstance(content, bytes) else content.read())
+        return DEFAULT
+
+    ci.files.create.side_effect = create
+    ci.uploaded_files = uploads
+
+
+def _uploaded_bytes(ci, index=-1):
+    """Return the JSONL bytes of an uploaded batch input file."""
+    return ci.uploaded_files[index]
+
+
+def _make_adapter(client_instance=None, **adapter_kwargs):
     """Create an OpenAIBatchAdapter with the openai SDK mocked out."""
     mock_sdk, ci = _make_mock_openai_module()
     if client_instance is not None:
         mock_sdk.OpenAI.return_value = client_instance
         ci = client_instance
+    _record_uploads(ci)
 
     adapter_key = "agentmap.services.llm.openai_batch_adapter"
     # Remove and reload so the import gate fires against our mock
     sys.modules.pop(adapter_key, None)
     with patch.dict("sys.modules", {"openai": mock_sdk}):
         mod = importlib.import_module(adapter_key)
-        adapter = mod.OpenAIBatchAdapter(api_key="sk-test", logger=MagicMock())
+        adapter = mod.OpenAIBatchAdapter(
+            api_key="sk-test", logger=MagicMock(), **adapter_kwargs
+        )
     # Re-register module under the real key so teardown is clean
     sys.modules[adapter_key] = mod
     return adapter, ci
@@ -196,15 +219,8 @@ class TestSubmit:
         )
 
         # The file data must be JSONL with exactly 2 lines
-        file_arg = call_kwargs.kwargs.get("file") or (
-            call_kwargs.args[0] if call_kwargs.args else None
-        )
-        assert file_arg is not None
-        # file_arg may be a tuple (name, bytes) or bytes-like
-        if isinstance(file_arg, tuple):
-            raw_bytes = file_arg[1]
-        else:
-            raw_bytes = file_arg
+        assert call_kwargs.kwargs.get("file") is not None
+        raw_bytes = _uploaded_bytes(ci)
         lines = [ln for ln in raw_bytes.split(b"\n") if ln.strip()]
         assert len(lines) == 2
         for line in lines:
@@ -273,15 +289,7 @@ class TestSubmit:
             resolved_params=[{"model": "gpt-3.5-turbo", "max_tokens": 256}],
         )
 
-        file_arg = (
-            ci.files.create.call_args.kwargs.get("file")
-            or ci.files.create.call_args.args[0]
-        )
-        if isinstance(file_arg, tuple):
-            raw_bytes = file_arg[1]
-        else:
-            raw_bytes = file_arg
-        record = json.loads(raw_bytes.split(b"\n")[0])
+        record = json.loads(_uploaded_bytes(ci).split(b"\n")[0])
         assert record["body"]["model"] == "gpt-3.5-turbo"
 
 
@@ -697,7 +705,7 @@ class TestOpenAISubmitSerializesResolvedParams:
     OpenAI adapter builds body = {"messages": ...}; body.update(rp), so
     temperature/max_tokens/passthroughs all end up inside body of each JSONL line.
 
-    Counter-factual: removing body.update(rp) in _build_jsonl would drop all
+    Counter-factual: removing body.update(rp) in _iter_jsonl_lines would drop all
     these keys and make every assertion below fail.
     """
 
@@ -718,17 +726,7 @@ class TestOpenAISubmitSerializesResolvedParams:
 
     def _extract_jsonl_bodies(self, client_instance):
         """Parse the JSONL bytes passed to files.create and return list of body dicts."""
-        call_args = client_instance.files.create.call_args
-        # files.create(file=("batch_requests.jsonl", jsonl_bytes), purpose="batch")
-        if call_args.kwargs:
-            file_arg = call_args.kwargs.get("file")
-        else:
-            file_arg = call_args.args[0] if call_args.args else None
-
-        if isinstance(file_arg, tuple):
-            jsonl_bytes = file_arg[1]
-        else:
-            jsonl_bytes = file_arg
+        jsonl_bytes = _uploaded_bytes(client_instance)
 
         import json as _json
 
@@ -835,3 +833,178 @@ class TestOpenAISubmitSerializesResolvedParams:
         assert (
             by_custom_id["spec-b"]["temperature"] == 0.8
         ), "spec-b JSONL line must carry temperature=0.8, not spec-a's 0.1"
+
+
+# ---------------------------------------------------------------------------
+# Spooling and sharding
+# ---------------------------------------------------------------------------
+
+
+def _batch_obj(batch_id, status="in_progress", output_file_id=None):
+    batch = MagicMock()
+    batch.id = batch_id
+    batch.status = status
+    batch.output_file_id = output_file_id
+    batch.request_counts = None
+    batch.expires_at = None
+    batch.completed_at = None
+    return batch
+
+
+def _output_records(custom_ids):
+    return [
+        {
+            "custom_id": cid,
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "model": "gpt-4o",
+                    "choices": [{"message": {"content": f"answer {cid}"}}],
+                },
+            },
+        }
+        for cid in custom_ids
+    ]
+
+
+class TestSharding:
+    """Submissions over the per-file limits become one logical sharded batch."""
+
+    def _make(self, tmp_path, **kwargs):
+        ci = MagicMock()
+        ci.files.create.return_value = MagicMock(id="file-in")
+        created = iter(f"b{i}" for i in range(100))
+        ci.batches.create.side_effect = lambda **_: _batch_obj(next(created))
+        adapter, _ = _make_adapter(
+            client_instance=ci, spool_dir=str(tmp_path), **kwargs
+        )
+        return adapter, ci
+
+    def _submit(self, adapter, count):
+        specs = [_make_spec(f"s{i}") for i in range(count)]
+        return adapter.submit(specs, resolved_params=_make_resolved(specs))
+
+    def test_request_limit_splits_into_shards(self, tmp_path):
+        adapter, ci = self._make(tmp_path, max_requests_per_shard=2)
+
+        batch_id, request_id_map, _ = self._submit(adapter, 5)
+
+        assert batch_id.startswith("amshard_")
+        assert list(request_id_map) == [f"s{i}" for i in range(5)]
+        assert ci.batches.create.call_count == 3
+        shard_ids = [
+            [json.loads(line)["custom_id"] for line in upload.splitlines()]
+            for upload in ci.uploaded_files
+        ]
+        assert shard_ids == [["s0", "s1"], ["s2", "s3"], ["s4"]]
+        assert (tmp_path / batch_id / "manifest.json").exists()
+
+    def test_byte_limit_splits_into_shards(self, tmp_path):
+        adapter, ci = self._make(tmp_path)
+        specs = [_make_spec(f"s{i}") for i in range(3)]
+        line_size = len(next(adapter._iter_jsonl_lines(specs[:1], {"s0": "s0"}, [{}])))
+        adapter._max_bytes = 2 * (line_size + 1) + 1
+
+        adapter.submit(specs, resolved_params=[{} for _ in specs])
+
+        assert [len(upload.splitlines()) for upload in ci.uploaded_files] == [2, 1]
+
+    def test_single_shard_submits_plain_batch_and_removes_spool(self, tmp_path):
+        adapter, ci = self._make(tmp_path)
+
+        batch_id, _, _ = self._submit(adapter, 3)
+
+        assert batch_id == "b0"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_poll_retries_expired_shard_then_ends(self, tmp_path):
+        adapter, ci = self._make(tmp_path, max_requests_per_shard=2)
+        batch_id, _, _ = self._submit(adapter, 4)
+        states = {
+            "b0": _batch_obj("b0", "completed", "file-0"),
+            "b1": _batch_obj("b1", "expired"),
+            "b2": _batch_obj("b2", "in_progress"),
+        }
+        ci.batches.retrieve.side_effect = lambda bid: states[bid]
+
+        first = adapter.poll(batch_id)
+
+        assert first.status == LLMBatchStatus.IN_PROGRESS
+        assert first.result_ref is None
+        assert ci.batches.create.call_count == 3
+        assert ci.uploaded_files[2] == ci.uploaded_files[1]
+
+        states["b2"] = _batch_obj("b2", "completed", "file-2")
+        second = adapter.poll(batch_id)
+
+        assert second.status == LLMBatchStatus.ENDED
+        assert second.result_ref == batch_id
+        manifest = json.loads((tmp_path / batch_id / "manifest.json").read_text())
+        assert [s["batch_id"] for s in manifest["shards"]] == ["b0", "b2"]
+        assert sorted(p.name for p in (tmp_path / batch_id).iterdir()) == [
+            "manifest.json"
+        ]
+
+    def test_fetch_merges_shards_in_request_order(self, tmp_path):
+        adapter, ci = self._make(tmp_path, max_requests_per_shard=2)
+        batch_id, request_id_map, _ = self._submit(adapter, 4)
+        outputs = {
+            "b0": _batch_obj("b0", "completed", "file-0"),
+            "b1": _batch_obj("b1", "completed", "file-1"),
+        }
+        ci.batches.retrieve.side_effect = lambda bid: outputs[bid]
+        contents = {
+            "file-0": _jsonl_bytes(_output_records(["s1", "s0"])),
+            "file-1": _jsonl_bytes(_output_records(["s3", "s2"])),
+        }
+        ci.files.content.side_effect = lambda fid: MagicMock(
+            iter_lines=None, content=contents[fid]
+        )
+        poll_result = adapter.poll(batch_id)
+
+        results = list(
+            adapter.fetch_results(batch_id, request_id_map, poll_result.result_ref)
+        )
+
+        assert [r.request_id for r in results] == ["s0", "s1", "s2", "s3"]
+        assert all(r.status == "succeeded" for r in results)
+
+    def test_exhausted_retries_report_shard_items(self, tmp_path):
+        adapter, ci = self._make(
+            tmp_path, max_requests_per_shard=2, max_shard_retries=0
+        )
+        batch_id, request_id_map, _ = self._submit(adapter, 3)
+        states = {
+            "b0": _batch_obj("b0", "completed", "file-0"),
+            "b1": _batch_obj("b1", "failed"),
+        }
+        ci.batches.retrieve.side_effect = lambda bid: states[bid]
+        ci.files.content.return_value = MagicMock(
+            iter_lines=None, content=_jsonl_bytes(_output_records(["s0", "s1"]))
+        )
+
+        poll_result = adapter.poll(batch_id)
+        results = list(
+            adapter.fetch_results(batch_id, request_id_map, poll_result.result_ref)
+        )
+
+        assert poll_result.status == LLMBatchStatus.ENDED
+        assert ci.batches.create.call_count == 2
+        assert [(r.request_id, r.status) for r in results] == [
+            ("s0", "succeeded"),
+            ("s1", "succeeded"),
+            ("s2", "errored"),
+        ]
+        assert results[2].error.error_type == "shard_failed"
+
+    def test_cancel_cancels_open_shards_and_stops_retries(self, tmp_path):
+        adapter, ci = self._make(tmp_path, max_requests_per_shard=1)
+        batch_id, _, _ = self._submit(adapter, 2)
+
+        adapter.cancel(batch_id)
+        ci.batches.retrieve.side_effect = lambda bid: _batch_obj(bid, "expired")
+        result = adapter.poll(batch_id)
+
+        assert [c.args[0] for c in ci.batches.cancel.call_args_list] == ["b0", "b1"]
+        assert ci.batches.create.call_count == 2
+        assert result.status == LLMBatchStatus.EXPIRED
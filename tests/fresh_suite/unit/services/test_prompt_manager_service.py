@@ -440,24 +440,31 @@ class TestPromptManagerService(unittest.TestCase):
     # 6. Prompt Formatting Tests
     # =============================================================================
 
-    def test_format_prompt_with_langchain(self):
-        """Test format_prompt() using LangChain PromptTemplate."""
+    def test_format_prompt_uses_compiled_template_cache(self):
+        """Test format_prompt() compiles each template once and reuses it."""
         template = "Hello {name}, you have {count} messages."
-        values = {"name": "Alice", "count": 5}
 
-        with patch("langchain_core.prompts.PromptTemplate") as mock_template_class:
-            mock_template = Mock()
-            mock_template.format.return_value = "Hello Alice, you have 5 messages."
-            mock_template_class.return_value = mock_template
+        first = self.service.format_prompt(template, {"name": "Alice", "count": 5})
+        second = self.service.format_prompt(
+            template, {"name": "Bob", "count": 2, "unused": "x"}
+        )
 
-            result = self.service.format_prompt(template, values)
-            self.assertEqual(result, "Hello Alice, you have 5 messages.")
+        self.assertEqual(first, "Hello Alice, you have 5 messages.")
+        self.assertEqual(second, "Hello Bob, you have 2 messages.")
+        stats = self.service._template_cache.stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(
+            self.service._template_cache.get(template).variables, ("name", "count")
+        )
 
-            # Verify LangChain was used correctly
-            mock_template_class.assert_called_once_with(
-                template=template, input_variables=["name", "count"]
-            )
-            mock_template.format.assert_called_once_with(**values)
+    def test_format_prompt_format_spec_and_attribute_fields(self):
+        """Test format_prompt() keeps str.format semantics for specs and lookups."""
+        result = self.service.format_prompt(
+            "{score:.2f} {{literal}} {items[0]} {user!r}",
+            {"score": 3.14159, "items": ["first"], "user": "ann"},
+        )
+        self.assertEqual(result, "3.14 {literal} first 'ann'")
 
     def test_format_prompt_langchain_fallback_to_standard(self):
         """Test format_prompt() falls back to standard formatting when LangChain fails."""
@@ -523,6 +530,89 @@ class TestPromptManagerService(unittest.TestCase):
             self.assertIn("Charlie", result)
             self.assertIn("{score}", result)
 
+    # =============================================================================
+    # 6b. Cache Bounds and Invalidation Tests
+    # =============================================================================
+
+    def test_resolve_file_prompt_reloads_when_file_changes(self):
+        """Test cached file: prompts are invalidated when the file is modified."""
+        import os
+
+        prompt_file = self.test_prompts_dir / "greeting.txt"
+        prompt_file.write_text("Version one")
+        ref = f"file:{prompt_file}"
+
+        self.assertEqual(self.service.resolve_prompt(ref), "Version one")
+
+        prompt_file.write_text("Version two, longer")
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertEqual(self.service.resolve_prompt(ref), "Version two, longer")
+
+    def test_resolve_prompt_cache_is_bounded_lru(self):
+        """Test the resolved-prompt cache evicts the least recently used entry."""
+        self.service.cache_max_entries = 2
+        self.service._registry = self.mock_registry
+
+        self.service.resolve_prompt("prompt:welcome")
+        self.service.resolve_prompt("prompt:error")
+        self.service.resolve_prompt("prompt:welcome")  # refresh recency
+        self.service.resolve_prompt("prompt:success")
+
+        self.assertEqual(set(self.service._cache), {"prompt:welcome", "prompt:success"})
+
+    def test_resolve_prompt_cache_is_thread_safe_under_eviction(self):
+        """Test concurrent resolves and evictions never fail a valid reference."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.service.cache_max_entries = 2
+        self.service._registry = {f"p{i}": f"text {i}" for i in range(6)}
+
+        def resolve(n):
+            i = n % 6
+            if n % 50 == 0:
+                self.service.clear_cache()
+            return self.service.resolve_prompt(f"prompt:p{i}") == f"text {i}"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(resolve, range(4000)))
+
+        self.assertTrue(all(results))
+        self.assertLessEqual(len(self.service._cache), 2)
+
+    def test_cache_lookup_of_evicted_entry_is_a_miss(self):
+        """Test an entry evicted by another thread is treated as uncached."""
+        self.assertIsNone(self.service._get_cached("prompt:evicted"))
+
+    def test_yaml_file_parsed_once_for_many_keys(self):
+        """Test many yaml:file#key references share one parse of the file."""
+        yaml_file = self.test_prompts_dir / "prompts.yaml"
+        yaml_file.write_text(yaml.dump({"a": {"x": "X"}, "b": "B", "c": 3}))
+
+        with patch(
+            "agentmap.services.prompt_manager_service.yaml.safe_load",
+            wraps=yaml.safe_load,
+        ) as mock_load:
+            results = [
+                self.service.resolve_prompt(f"yaml:{yaml_file}#{key}")
+                for key in ("a.x", "b", "c")
+            ]
+
+        self.assertEqual(results, ["X", "B", "3"])
+        self.assertEqual(mock_load.call_count, 1)
+
+    def test_missing_file_result_not_cached(self):
+        """Test 'not found' placeholders are not cached so later files are seen."""
+        prompt_file = self.test_prompts_dir / "later.txt"
+        ref = f"file:{prompt_file}"
+
+        self.assertIn("not found", self.service.resolve_prompt(ref))
+        self.assertNotIn(ref, self.service._cache)
+
+        prompt_file.write_text("Now present")
+        self.assertEqual(self.service.resolve_prompt(ref), "Now present")
+
     # =============================================================================
     # 7. Service Management Tests
     # =============================================================================
@@ -8,7 +8,7 @@ and follow the established MockServiceFactory patterns for consistent testing.
 import unittest
 from unittest.mock import Mock, patch
 
-from agentmap.services.state_adapter_service import StateAdapterService
+from agentmap.services.state_adapter_service import StateAdapterService, StateOverlay
 
 
 class TestStateAdapterService(unittest.TestCase):
@@ -318,6 +318,69 @@ class TestStateAdapterService(unittest.TestCase):
             with self.assertRaises(Exception):
                 StateAdapterService.set_value(simple_object, "key", "value")
 
+    # =============================================================================
+    # 6b. Copy-on-write overlay Tests
+    # =============================================================================
+
+    def test_copy_on_write_set_value_shares_the_base_state(self):
+        """Test set_value() on an overlay records changes without copying."""
+        overlay = StateAdapterService.copy_on_write(self.dict_state)
+
+        first = StateAdapterService.set_value(overlay, "key1", "changed")
+        second = StateAdapterService.set_value(first, "new_key", "new")
+
+        self.assertIsInstance(second, StateOverlay)
+        self.assertEqual(
+            second, {**self.dict_state, "key1": "changed", "new_key": "new"}
+        )
+        self.assertEqual(second.changes, {"key1": "changed", "new_key": "new"})
+        self.assertEqual(first.changes, {"key1": "changed"})
+        self.assertEqual(overlay.changes, {})
+        self.assertEqual(self.dict_state["key1"], "value1")
+        self.assertIs(second._base, self.dict_state)
+
+    def test_copy_on_write_overlay_behaves_as_mapping(self):
+        """Test overlays support the read operations agents use on state."""
+        overlay = StateAdapterService.copy_on_write(self.dict_state)
+        overlay["key2"] = 43
+        overlay["extra"] = True
+
+        self.assertEqual(len(overlay), 5)
+        self.assertEqual(list(overlay)[-1], "extra")
+        self.assertIn("nested", overlay)
+        self.assertEqual(StateAdapterService.get_value(overlay, "key2"), 43)
+        self.assertEqual(overlay.get("missing", "default"), "default")
+        self.assertEqual(
+            StateAdapterService.get_inputs(overlay, ["key1", "key2"]),
+            {"key1": "value1", "key2": 43},
+        )
+        self.assertEqual(overlay.to_dict()["key2"], 43)
+        with self.assertRaises(TypeError):
+            del overlay["key1"]
+
+    def test_copy_on_write_leaves_non_mappings_unchanged(self):
+        """Test copy_on_write() passes through objects and existing overlays."""
+        overlay = StateAdapterService.copy_on_write(self.dict_state)
+
+        self.assertIs(StateAdapterService.copy_on_write(overlay), overlay)
+        self.assertIs(
+            StateAdapterService.copy_on_write(self.object_state), self.object_state
+        )
+
+    def test_merge_updates(self):
+        """Test merge_updates() applies several updates in one step."""
+        merged = StateAdapterService.merge_updates(self.dict_state, {"a": 1, "b": 2})
+        self.assertEqual(merged, {**self.dict_state, "a": 1, "b": 2})
+        self.assertNotIn("a", self.dict_state)
+
+        overlay = StateAdapterService.copy_on_write(self.dict_state)
+        merged = StateAdapterService.merge_updates(overlay, {"a": 1})
+        self.assertEqual(merged.changes, {"a": 1})
+
+        self.assertIs(
+            StateAdapterService.merge_updates(self.dict_state, {}), self.dict_state
+        )
+
     # =============================================================================
     # 7. get_inputs() Method Tests
     # =============================================================================
@@ -0,0 +1,185 @@
+"""
+Unit tests for WorkflowCatalogService.
+
+Covers CSV parsing into graph/node/agent-type summaries, incremental
+refresh (only files whose stat signature changed are read, unchanged
+content is not re-parsed), persistence across instances, filtering, and
+the background poller.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from agentmap.services.graph.workflow_catalog_service import WorkflowCatalogService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+ORDERS_CSV = (
+    "GraphName,Node,AgentType,Prompt\n"
+    "Checkout,start,input,Ask\n"
+    "Checkout,pay,llm,Charge\n"
+    "Refund,start,echo,Start\n"
+    "\n"
+)
+
+
+class TestWorkflowCatalogService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.repository = Path(self.temp_dir) / "workflows"
+        (self.repository / "shop").mkdir(parents=True)
+        self.catalog_path = os.path.join(self.temp_dir, "cache", "catalog.json")
+        self.config = Mock()
+        self.config.get_csv_repository_path.return_value = self.repository
+        self.catalog_config = {
+            "watch": False,
+            "poll_interval_seconds": 0.05,
+            "catalog_path": self.catalog_path,
+        }
+        self.config.get_workflow_catalog_config.return_value = self.catalog_config
+        self.service = self._service()
+
+    def tearDown(self):
+        self.service.stop_watching()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _service(self):
+        return WorkflowCatalogService(
+            self.config, MockServiceFactory.create_mock_logging_service()
+        )
+
+    def _write(self, relative, content, age=10.0):
+        path = self.repository / relative
+        path.write_text(content)
+        # Back-date the file so its signature is outside the racy window.
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_catalogues_graphs_nodes_and_agent_types(self):
+        self._write("shop/orders.csv", ORDERS_CSV)
+        self._write("notes.csv", "Step,Type\na,echo\n")
+
+        workflows = {w["workflow"]: w for w in self.service.list_workflows()}
+
+        orders = workflows["shop/orders"]
+        self.assertEqual(orders["graph_count"], 2)
+        self.assertEqual(orders["total_nodes"], 3)
+        self.assertEqual(orders["agent_types"], ["echo", "input", "llm"])
+        self.assertEqual(
+            [(g["name"], g["node_count"]) for g in orders["graphs"]],
+            [("Checkout", 2), ("Refund", 1)],
+        )
+        self.assertEqual(len(orders["content_hash"]), 64)
+        # No GraphName column: one graph named after the workflow.
+        self.assertEqual(workflows["notes"]["graphs"][0]["name"], "notes")
+
+    def test_refresh_only_reads_changed_files(self):
+        self._write("shop/orders.csv", ORDERS_CSV)
+        self._write("other.csv", "GraphName,Node\nOther,a\n")
+        self.assertEqual(self.service.refresh()["added"], 2)
+
+        with patch.object(
+            self.service, "_parse_workflow", wraps=self.service._parse_workflow
+        ) as parse:
+            self.assertEqual(self.service.refresh()["unchanged"], 2)
+            parse.assert_not_called()
+
+            # Same content, new mtime: hashed again but not re-parsed.
+            os.utime(self.repository / "other.csv", (time.time() - 5,) * 2)
+            self.assertEqual(self.service.refresh()["updated"], 0)
+            parse.assert_not_called()
+
+            self._write("other.csv", "GraphName,Node\nOther,a\nOther,b\n")
+            (self.repository / "shop" / "orders.csv").unlink()
+            stats = self.service.refresh()
+            parse.assert_called_once()
+
+        self.assertEqual((stats["updated"], stats["removed"]), (1, 1))
+        self.assertEqual([w["total_nodes"] for w in self.service.list_workflows()], [2])
+
+    def test_catalog_persists_across_instances(self):
+        self._write("shop/orders.csv", ORDERS_CSV)
+        self.service.refresh()
+        self.assertTrue(os.path.exists(self.catalog_path))
+
+        restarted = self._service()
+        with patch.object(restarted, "_parse_workflow") as parse:
+            stats = restarted.refresh()
+
+        parse.assert_not_called()
+        self.assertEqual(stats["unchanged"], 1)
+
+    def test_catalog_for_another_repository_is_discarded(self):
+        self._write("shop/orders.csv", ORDERS_CSV)
+        self.service.refresh()
+        self.config.get_csv_repository_path.return_value = Path(self.temp_dir) / "x"
+
+        self.assertEqual(self._service().list_workflows(), [])
+
+    def test_find_graphs_filters_by_name_agent_type_and_workflow(self):
+        self._write("shop/orders.csv", ORDERS_CSV)
+        self._write("other.csv", "GraphName,Node,AgentType\nReport,a,llm\n")
+
+        def names(**filters):
+            return [
+                (r["workflow"], r["graph_name"])
+                for r in self.service.find_graphs(**filters)
+            ]
+
+        self.assertEqual(
+            names(),
+            [
+                ("shop/orders", "Checkout"),
+                ("shop/orders", "Refund"),
+                ("other", "Report"),
+            ],
+        )
+        self.assertEqual(names(search="SHOP"), names(workflow="shop/orders"))
+        self.assertEqual(names(search="ref"), [("shop/orders", "Refund")])
+        self.assertEqual(
+            names(agent_type="LLM"),
+            [("shop/orders", "Checkout"), ("other", "Report")],
+        )
+
+    def test_watching_serves_listings_without_walking(self):
+        self.catalog_config["watch"] = True
+        self._write("shop/orders.csv", ORDERS_CSV)
+
+        self.assertEqual(len(self.service.list_workflows()), 1)
+        self.assertTrue(self.service.is_watching)
+
+        self._write("late.csv", "GraphName,Node\nLate,a\n")
+        scanning_threads = []
+        scan = self.service._scan
+
+        def recording_scan(repository):
+            scanning_threads.append(threading.get_ident())
+            return scan(repository)
+
+        with patch.object(self.service, "_scan", side_effect=recording_scan):
+            self.service.list_workflows()
+        self.assertNotIn(threading.get_ident(), scanning_threads)
+
+        deadline = time.time() + 5
+        while len(self.service.list_workflows()) < 2 and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(len(self.service.list_workflows()), 2)
+
+    def test_unparseable_file_is_listed_with_error(self):
+        path = self.repository / "broken.csv"
+        path.write_bytes(b"GraphName,Node\n\xff\xfe,a\n")
+
+        (entry,) = self.service.list_workflows()
+
+        self.assertIsNotNone(entry["parse_error"])
+        self.assertEqual(entry["graphs"][0]["name"], "broken")
+
+
+if __name__ == "__main__":
+    unittest.main()
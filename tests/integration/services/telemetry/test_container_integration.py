@@ -56,6 +56,9 @@ class TestContainerIntegration:
             # _load_otel_imports() for standalone TracerProvider setup
             # (E02-F04, Architecture Section 5.6).
             "services/telemetry/bootstrap.py",
+            # sampling.py subclasses SDK Sampler/SpanProcessor; it is only
+            # imported from bootstrap._load_otel_imports().
+            "services/telemetry/sampling.py",
             # base_agent.py uses a function-level import of StatusCode
             # inside _set_span_status_ok (ADR-E02F02-005: no module-level
             # OTEL dependency, but function-level is permitted).
@@ -22,6 +22,20 @@ from agentmap.runtime_api import (
     run_workflow,
     validate_workflow,
 )
+from agentmap.services.graph.workflow_catalog_service import WorkflowCatalogService
+
+
+def _use_workflow_catalog(mock_container, mock_app_config):
+    """Serve list_graphs from a real WorkflowCatalogService over the mocked config."""
+    repository = mock_app_config.get_csv_repository_path.return_value
+    mock_app_config.get_workflow_catalog_config.return_value = {
+        "watch": False,
+        "poll_interval_seconds": 5.0,
+        "catalog_path": str(repository / ".workflow_catalog.json"),
+    }
+    mock_container.workflow_catalog_service.return_value = WorkflowCatalogService(
+        mock_app_config, Mock()
+    )
 
 
 class TestAdapterIntegration:
@@ -182,6 +196,7 @@ test_graph,End,EndAgent,Final node,ProcessAgent"""
 
             mock_app_config.get_csv_repository_path.return_value = csv_repo
             mock_container.app_config_service.return_value = mock_app_config
+            _use_workflow_catalog(mock_container, mock_app_config)
             mock_runtime_manager.get_container.return_value = mock_container
 
             # Test list_graphs
@@ -514,6 +529,7 @@ class TestResponseFormatConsistency:
                         "/nonexistent"
                     )
                     mock_container.app_config_service.return_value = mock_app_config
+                    _use_workflow_catalog(mock_container, mock_app_config)
 
                 elif func_name == "diagnose_system":
                     # Setup comprehensive mocks for diagnose_system
@@ -26,6 +26,20 @@ from agentmap.runtime import (
 )
 from agentmap.runtime.init_ops import _is_cache_initialized, _refresh_cache
 from agentmap.runtime.workflow_ops import _resolve_csv_path
+from agentmap.services.graph.workflow_catalog_service import WorkflowCatalogService
+
+
+def _use_workflow_catalog(mock_container, mock_app_config):
+    """Serve list_graphs from a real WorkflowCatalogService over the mocked config."""
+    repository = mock_app_config.get_csv_repository_path.return_value
+    mock_app_config.get_workflow_catalog_config.return_value = {
+        "watch": False,
+        "poll_interval_seconds": 5.0,
+        "catalog_path": str(repository / ".workflow_catalog.json"),
+    }
+    mock_container.workflow_catalog_service.return_value = WorkflowCatalogService(
+        mock_app_config, Mock()
+    )
 
 
 class TestEnsureInitialized:
@@ -509,6 +523,7 @@ class TestListGraphs:
 
             mock_app_config.get_csv_repository_path.return_value = csv_repo
             mock_container.app_config_service.return_value = mock_app_config
+            _use_workflow_catalog(mock_container, mock_app_config)
             mock_runtime_manager.get_container.return_value = mock_container
 
             # Test
@@ -541,6 +556,7 @@ class TestListGraphs:
         # Non-existent path
         mock_app_config.get_csv_repository_path.return_value = Path("/nonexistent")
         mock_container.app_config_service.return_value = mock_app_config
+        _use_workflow_catalog(mock_container, mock_app_config)
         mock_runtime_manager.get_container.return_value = mock_container
 
         # Test
@@ -963,6 +979,7 @@ class TestAsyncFacadeExports:
         mock_app_config = Mock()
         mock_app_config.get_csv_repository_path.return_value = self._csv_repo
         mock_container.app_config_service.return_value = mock_app_config
+        _use_workflow_catalog(mock_container, mock_app_config)
         mock_runtime_manager.get_container.return_value = mock_container
 
         result = await list_graphs_async()
@@ -1151,6 +1168,7 @@ class TestAsyncWrapperNonBlocking:
                 "/nonexistent_repo"
             )
             mock_container.app_config_service.return_value = mock_app_config
+            _use_workflow_catalog(mock_container, mock_app_config)
             mock_rm.get_container.return_value = mock_container
 
             await list_graphs_async()
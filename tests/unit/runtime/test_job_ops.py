@@ -0,0 +1,124 @@
+"""
+Unit tests for the queued execution worker pool (runtime/job_ops.py).
+
+The graph invocation seam (``run_workflow_async``) is patched; the queue is a
+real JobQueueService on a temporary SQLite file.
+"""
+
+import asyncio
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from agentmap.models.execution.job import JobStatus
+from agentmap.runtime.job_ops import JobWorkerPool
+from agentmap.services.job_queue_service import JobQueueService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+@pytest.fixture
+def queue():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield JobQueueService(
+            db_path=os.path.join(temp_dir, "jobs.db"),
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+        )
+
+
+async def _wait_for_status(queue, job_id, *statuses, timeout=5.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        job = queue.get(job_id)
+        if job.status in statuses:
+            return job
+        await asyncio.sleep(0.02)
+    raise AssertionError(f"job {job_id} never reached {statuses}: {job.status}")
+
+
+@pytest.mark.asyncio
+async def test_pool_runs_job_and_stores_result(queue):
+    async def fake_run(**kwargs):
+        return {"success": True, "outputs": {"echo": kwargs["inputs"]["x"]}}
+
+    with patch("agentmap.runtime.job_ops.run_workflow_async", side_effect=fake_run):
+        pool = JobWorkerPool(queue, workers=1, poll_interval=0.05)
+        await pool.start()
+        try:
+            job = queue.submit("wf::g", {"x": 7})
+            pool.notify()
+            done = await _wait_for_status(queue, job.job_id, JobStatus.COMPLETED)
+        finally:
+            await pool.stop()
+
+    assert done.result["outputs"] == {"echo": 7}
+
+
+@pytest.mark.asyncio
+async def test_pool_maps_interrupt_and_errors(queue):
+    async def fake_run(**kwargs):
+        if kwargs["graph_name"] == "suspends":
+            return {"success": False, "interrupted": True, "thread_id": "t-1"}
+        raise RuntimeError("kaboom")
+
+    with patch("agentmap.runtime.job_ops.run_workflow_async", side_effect=fake_run):
+        pool = JobWorkerPool(queue, workers=2, poll_interval=0.05)
+        await pool.start()
+        try:
+            suspended = queue.submit("suspends", {})
+            failed = queue.submit("fails", {})
+            pool.notify()
+            s = await _wait_for_status(queue, suspended.job_id, JobStatus.SUSPENDED)
+            f = await _wait_for_status(queue, failed.job_id, JobStatus.FAILED)
+        finally:
+            await pool.stop()
+
+    assert s.result["thread_id"] == "t-1"
+    assert "kaboom" in f.error
+
+
+@pytest.mark.asyncio
+async def test_cancel_request_cancels_running_job(queue):
+    started = asyncio.Event()
+
+    async def slow_run(**kwargs):
+        started.set()
+        await asyncio.sleep(30)
+
+    with patch("agentmap.runtime.job_ops.run_workflow_async", side_effect=slow_run):
+        pool = JobWorkerPool(queue, workers=1, poll_interval=0.05)
+        await pool.start()
+        try:
+            job = queue.submit("wf", {})
+            pool.notify()
+            await asyncio.wait_for(started.wait(), timeout=5)
+            # Cross-process path: only the queue flag is set; the worker's
+            # heartbeat must observe it.
+            queue.request_cancel(job.job_id)
+            done = await _wait_for_status(queue, job.job_id, JobStatus.CANCELLED)
+        finally:
+            await pool.stop()
+
+    assert done.error == "Cancelled by request"
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_in_flight_job(queue):
+    started = asyncio.Event()
+
+    async def slow_run(**kwargs):
+        started.set()
+        await asyncio.sleep(30)
+
+    with patch("agentmap.runtime.job_ops.run_workflow_async", side_effect=slow_run):
+        pool = JobWorkerPool(queue, workers=1, poll_interval=0.05)
+        await pool.start()
+        job = queue.submit("wf", {})
+        pool.notify()
+        await asyncio.wait_for(started.wait(), timeout=5)
+        await pool.stop()
+
+    released = queue.get(job.job_id)
+    assert released.status == JobStatus.QUEUED
+    assert released.attempts == 1
@@ -0,0 +1,80 @@
+"""
+Unit tests for startup profiling helpers (runtime/startup_ops.py).
+
+Includes the lazy-import guard: importing agentmap.runtime_api must not pull
+in pandas, langchain, langgraph or provider SDKs.
+"""
+
+import json
+import subprocess
+import sys
+
+from agentmap.runtime.startup_ops import (
+    HEAVY_MODULES,
+    compare_to_baseline,
+    parse_importtime,
+    write_startup_baseline,
+)
+
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2000 |       5000 | json
+import time:       300 |        300 |     agentmap.models
+noise line from a logger
+"""
+
+
+def test_parse_importtime_reads_records_and_depth():
+    records = parse_importtime(IMPORTTIME_SAMPLE)
+
+    assert [r["module"] for r in records] == ["_io", "json", "agentmap.models"]
+    assert records[1]["self_ms"] == 2.0
+    assert records[1]["cumulative_ms"] == 5.0
+    assert [r["depth"] for r in records] == [1, 0, 2]
+
+
+def test_compare_to_baseline_flags_only_metrics_over_tolerance():
+    baseline = {"runtime_api_import_ms": 100.0, "container_build_ms": 10.0}
+
+    assert (
+        compare_to_baseline(
+            {"runtime_api_import_ms": 149.0, "container_build_ms": 14.0}, baseline
+        )
+        == []
+    )
+
+    regressions = compare_to_baseline(
+        {"runtime_api_import_ms": 151.0, "container_build_ms": 14.0}, baseline
+    )
+    assert len(regressions) == 1
+    assert regressions[0].startswith("runtime_api_import_ms")
+
+
+def test_write_startup_baseline(tmp_path):
+    path = tmp_path / "nested" / "baseline.json"
+    profile = {
+        "python": "3.11.0",
+        "runtime_api_import_ms": 1.0,
+        "container_build_ms": 2.0,
+        "providers": [{"name": "llm_service", "ms": 3.04, "error": None}],
+    }
+
+    write_startup_baseline(profile, str(path))
+
+    assert json.loads(path.read_text())["providers"] == {"llm_service": 3.0}
+
+
+def test_runtime_api_import_does_not_load_heavy_modules():
+    code = (
+        "import json, sys\n"
+        "import agentmap.runtime_api\n"
+        f"heavy = {sorted(HEAVY_MODULES)!r}\n"
+        "print(json.dumps(sorted(m for m in heavy if m in sys.modules)))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=120
+    )
+
+    assert completed.returncode == 0, completed.stderr
+    assert json.loads(completed.stdout.strip().splitlines()[-1]) == []
@@ -340,6 +340,54 @@ class TestValidation:
             manager.get_telemetry_config()
 
 
+class TestSamplingAndOverheadSettings:
+    """Sampling, subsystem, limit and batch settings."""
+
+    def test_defaults_sample_everything_with_sdk_batch_sizes(self, make_manager):
+        config = make_manager({}).get_telemetry_config()
+
+        assert config["sampling"]["ratio"] == 1.0
+        assert config["sampling"]["keep_errors"] is False
+        assert all(config["subsystems"].values())
+        assert config["limits"]["max_attribute_length"] == 4096
+        assert config["batch"]["max_queue_size"] == 2048
+
+    def test_partial_sections_merge_with_defaults(self, make_manager):
+        manager = make_manager(
+            {
+                "telemetry": {
+                    "sampling": {"ratio": 0.1, "graph_overrides": {"Pay": 1}},
+                    "subsystems": {"storage": False},
+                }
+            }
+        )
+        config = manager.get_telemetry_config()
+
+        assert config["sampling"]["ratio"] == 0.1
+        assert config["sampling"]["parent_based"] is True
+        assert config["subsystems"]["storage"] is False
+        assert config["subsystems"]["llm"] is True
+
+    @pytest.mark.parametrize(
+        "telemetry, match",
+        [
+            ({"sampling": {"ratio": 1.5}}, "sampling.ratio"),
+            ({"sampling": {"graph_overrides": {"Pay": -1}}}, "graph_overrides.Pay"),
+            ({"sampling": {"keep_errors": "yes"}}, "keep_errors"),
+            ({"sampling": {"slow_span_ms": -5}}, "slow_span_ms"),
+            ({"subsystems": {"cache": False}}, "subsystem"),
+            ({"subsystems": {"llm": "off"}}, "subsystems.llm"),
+            ({"limits": {"max_attribute_length": 0}}, "max_attribute_length"),
+            ({"batch": {"max_queue_size": 100}}, "max_export_batch_size"),
+            ({"batch": "small"}, "batch"),
+        ],
+    )
+    def test_invalid_values_raise(self, make_manager, telemetry, match):
+        manager = make_manager({"telemetry": telemetry})
+        with pytest.raises(ConfigurationException, match=match):
+            manager.get_telemetry_config()
+
+
 # ============================================================================
 # Typed accessors
 # ============================================================================
@@ -479,6 +479,98 @@ class TestGracefulDegradation:
         mock_logger.warning.assert_called()
 
 
+class TestSamplingLimitsAndBatching:
+    """Sampler, span limits and batch sizing on the bootstrapped provider."""
+
+    def _bootstrap(self, mock_logger, **settings):
+        mocks = {
+            name: MagicMock()
+            for name in (
+                "TracerProvider",
+                "BatchSpanProcessor",
+                "ConsoleSpanExporter",
+                "Resource",
+                "SpanLimits",
+                "build_sampler",
+                "TailRetentionSpanProcessor",
+            )
+        }
+        mocks["trace"] = _make_proxy_trace()
+        patches = [patch(f"{_B}._load_otel_imports")] + [
+            patch(f"{_B}.{name}", mock) for name, mock in mocks.items()
+        ]
+        for p in patches:
+            p.start()
+        try:
+            result = bootstrap_standalone_tracer_provider(
+                exporter="console",
+                endpoint="",
+                protocol="grpc",
+                resource_attributes={},
+                logger=mock_logger,
+                **settings,
+            )
+        finally:
+            for p in patches:
+                p.stop()
+        assert result is True
+        return mocks
+
+    def test_sampler_limits_and_batch_sizes_are_applied(
+        self, mock_logger: MagicMock
+    ) -> None:
+        sampling = {"ratio": 0.1, "keep_errors": False, "slow_span_ms": None}
+        mocks = self._bootstrap(
+            mock_logger,
+            sampling=sampling,
+            limits={"max_attribute_length": 256, "max_attributes_per_span": None},
+            batch={
+                "max_queue_size": 4096,
+                "max_export_batch_size": 256,
+                "schedule_delay_ms": 1000,
+                "export_timeout_ms": 10000,
+            },
+        )
+
+        mocks["build_sampler"].assert_called_once_with(sampling)
+        mocks["SpanLimits"].assert_called_once_with(
+            max_span_attribute_length=256, max_span_attributes=None, max_events=None
+        )
+        mocks["TracerProvider"].assert_called_once_with(
+            resource=mocks["Resource"].create.return_value,
+            sampler=mocks["build_sampler"].return_value,
+            span_limits=mocks["SpanLimits"].return_value,
+        )
+        mocks["BatchSpanProcessor"].assert_called_once_with(
+            mocks["ConsoleSpanExporter"].return_value,
+            max_queue_size=4096,
+            schedule_delay_millis=1000,
+            max_export_batch_size=256,
+            export_timeout_millis=10000,
+        )
+        mocks["TailRetentionSpanProcessor"].assert_not_called()
+        mocks["TracerProvider"].return_value.add_span_processor.assert_called_once_with(
+            mocks["BatchSpanProcessor"].return_value
+        )
+
+    def test_tail_retention_wraps_the_batch_processor(
+        self, mock_logger: MagicMock
+    ) -> None:
+        mocks = self._bootstrap(
+            mock_logger,
+            sampling={"ratio": 0.1, "keep_errors": True, "slow_span_ms": 500},
+        )
+
+        mocks["TailRetentionSpanProcessor"].assert_called_once_with(
+            mocks["BatchSpanProcessor"].return_value,
+            keep_errors=True,
+            slow_span_ms=500,
+        )
+        mocks["TracerProvider"].return_value.add_span_processor.assert_called_once_with(
+            mocks["TailRetentionSpanProcessor"].return_value
+        )
+
+
 class TestModuleImportability:
     """Verify module can be imported without opentelemetry-sdk."""
 
@@ -19,6 +19,7 @@ class TestOTELTelemetryService:
         self,
         mock_tracer: MagicMock | None = None,
         mock_meter: MagicMock | None = None,
+        **service_kwargs: object,
     ) -> object:
         """Create an OTELTelemetryService with mocked tracer and meter."""
         if mock_tracer is None:
@@ -39,7 +40,7 @@ class TestOTELTelemetryService:
                 OTELTelemetryService,
             )
 
-            svc = OTELTelemetryService()
+            svc = OTELTelemetryService(**service_kwargs)
         # Patch to use our mocks
         svc._tracer = mock_tracer
         svc._meter = mock_meter
@@ -116,6 +117,42 @@ class TestOTELTelemetryService:
             "test.span", kind="SERVER"
         )
 
+    def test_disabled_subsystem_yields_noop_span(self) -> None:
+        """Spans of a disabled subsystem never reach the tracer."""
+        from agentmap.services.telemetry.constants import (
+            AGENT_RUN_SPAN,
+            STORAGE_READ_SPAN,
+            STORAGE_WRITE_SPAN,
+        )
+        from agentmap.services.telemetry.noop_telemetry_service import _NOOP_SPAN
+
+        mock_tracer = MagicMock()
+        svc = self._make_service(mock_tracer, disabled_subsystems=["storage"])
+
+        for name in (STORAGE_READ_SPAN, STORAGE_WRITE_SPAN):
+            with svc.start_span(name, attributes={"k": "v"}) as span:
+                assert span is _NOOP_SPAN
+                svc.set_span_attributes(span, {"k": "v"})
+                svc.add_span_event(span, "event")
+                svc.record_exception(span, ValueError("boom"))
+        svc.start_span(AGENT_RUN_SPAN)
+
+        mock_tracer.start_as_current_span.assert_called_once_with(AGENT_RUN_SPAN)
+
+    def test_long_string_attributes_are_truncated(self) -> None:
+        """max_attribute_length caps string values at start and on set."""
+        mock_tracer = MagicMock()
+        svc = self._make_service(mock_tracer, max_attribute_length=4)
+        mock_span = MagicMock()
+
+        svc.start_span("test.span", attributes={"text": "abcdefgh", "n": 12345})
+        svc.set_span_attributes(mock_span, {"text": "abcdefgh"})
+
+        mock_tracer.start_as_current_span.assert_called_once_with(
+            "test.span", attributes={"text": "abcd", "n": 12345}
+        )
+        mock_span.set_attribute.assert_called_once_with("text", "abcd")
+
     def test_record_exception_delegates(self) -> None:
         """TC-013: record_exception delegates and sets ERROR status."""
         svc = self._make_service()
@@ -0,0 +1,137 @@
+"""Unit tests for head sampling and tail retention.
+
+These tests require ``opentelemetry-sdk`` to be installed.  They are
+skipped automatically when the SDK is not available.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+try:
+    from opentelemetry.sdk.trace import TracerProvider as _TracerProvider  # noqa: F401
+
+    _sdk_available = True
+except ImportError:
+    _sdk_available = False
+
+pytestmark = pytest.mark.skipif(
+    not _sdk_available,
+    reason="opentelemetry-sdk not installed",
+)
+
+from agentmap.services.telemetry.constants import (  # noqa: E402
+    AGENT_RUN_SPAN,
+    GRAPH_NAME,
+    WORKFLOW_RUN_SPAN,
+)
+
+
+@pytest.fixture()
+def make_tracer():
+    """Build a tracer from a sampling config, exporting to memory."""
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from agentmap.services.telemetry.sampling import (
+        TailRetentionSpanProcessor,
+        build_sampler,
+    )
+
+    def _make(sampling):
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider(sampler=build_sampler(sampling))
+        processor = SimpleSpanProcessor(exporter)
+        if sampling.get("keep_errors") or sampling.get("slow_span_ms") is not None:
+            processor = TailRetentionSpanProcessor(
+                processor,
+                keep_errors=bool(sampling.get("keep_errors")),
+                slow_span_ms=sampling.get("slow_span_ms"),
+            )
+        provider.add_span_processor(processor)
+        return provider.get_tracer("test"), exporter
+
+    return _make
+
+
+def _run_workflow(tracer, graph="g", fail=False, slow=False):
+    try:
+        with tracer.start_as_current_span(
+            WORKFLOW_RUN_SPAN, attributes={GRAPH_NAME: graph}
+        ):
+            with tracer.start_as_current_span(AGENT_RUN_SPAN):
+                if slow:
+                    time.sleep(0.02)
+                if fail:
+                    raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+
+def _names(exporter):
+    return sorted(span.name for span in exporter.get_finished_spans())
+
+
+class TestHeadSampling:
+    def test_ratio_zero_drops_without_recording(self, make_tracer) -> None:
+        tracer, exporter = make_tracer({"ratio": 0.0})
+
+        with tracer.start_as_current_span(WORKFLOW_RUN_SPAN) as span:
+            assert not span.is_recording()
+
+        assert exporter.get_finished_spans() == ()
+
+    def test_children_follow_the_root_decision(self, make_tracer) -> None:
+        tracer, exporter = make_tracer({"ratio": 0.5})
+
+        for _ in range(200):
+            _run_workflow(tracer)
+
+        spans = exporter.get_finished_spans()
+        roots = [s for s in spans if s.name == WORKFLOW_RUN_SPAN]
+        children = [s for s in spans if s.name == AGENT_RUN_SPAN]
+        assert 40 < len(roots) < 160
+        assert {s.context.trace_id for s in children} == {
+            s.context.trace_id for s in roots
+        }
+
+    def test_graph_overrides_take_precedence(self, make_tracer) -> None:
+        tracer, exporter = make_tracer(
+            {"ratio": 0.0, "graph_overrides": {"Payments": 1.0}}
+        )
+
+        _run_workflow(tracer, graph="Payments")
+        _run_workflow(tracer, graph="Other")
+
+        assert _names(exporter) == [AGENT_RUN_SPAN, WORKFLOW_RUN_SPAN]
+        assert {
+            s.attributes.get(GRAPH_NAME)
+            for s in exporter.get_finished_spans()
+            if s.name == WORKFLOW_RUN_SPAN
+        } == {"Payments"}
+
+
+class TestTailRetention:
+    def test_failed_spans_of_unsampled_traces_are_kept(self, make_tracer) -> None:
+        tracer, exporter = make_tracer({"ratio": 0.0, "keep_errors": True})
+
+        _run_workflow(tracer)
+        assert exporter.get_finished_spans() == ()
+
+        _run_workflow(tracer, fail=True)
+        spans = exporter.get_finished_spans()
+        assert sorted(s.name for s in spans) == [AGENT_RUN_SPAN, WORKFLOW_RUN_SPAN]
+        assert all(s.context.trace_flags.sampled for s in spans)
+
+    def test_slow_spans_of_unsampled_traces_are_kept(self, make_tracer) -> None:
+        tracer, exporter = make_tracer({"ratio": 0.0, "slow_span_ms": 10})
+
+        _run_workflow(tracer)
+        _run_workflow(tracer, slow=True)
+
+        assert _names(exporter) == [AGENT_RUN_SPAN, WORKFLOW_RUN_SPAN]
@@ -0,0 +1,217 @@
+"""
+Unit tests for JobQueueService (durable SQLite job queue).
+
+Covers priority ordering, per-graph concurrency caps, cancellation of queued
+and running jobs, result retention/purge, stale-job recovery and the
+execution.job_queue config accessor.
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from agentmap.exceptions.base_exceptions import ConfigurationException
+from agentmap.models.execution.job import JobStatus
+from agentmap.services.config.app_config_service import AppConfigService
+from agentmap.services.config.config_service import ConfigService
+from agentmap.services.job_queue_service import JobQueueService
+from tests.utils.mock_service_factory import MockServiceFactory
+
+
+def _make_app_config(job_queue=None):
+    config_service = Mock(spec=ConfigService)
+    config_service.load_config.return_value = {
+        "execution": {"job_queue": job_queue} if job_queue is not None else {}
+    }
+
+    def get_value(config_data, path, default=None):
+        current = config_data
+        for part in path.split("."):
+            if not isinstance(current, dict) or part not in current:
+                return default
+            current = current[part]
+        return current
+
+    config_service.get_value_from_config.side_effect = get_value
+    return AppConfigService(config_service=config_service, config_path="test.yaml")
+
+
+class TestJobQueueConfig(unittest.TestCase):
+    def test_max_attempts_and_graph_limits_are_coerced(self):
+        config = _make_app_config(
+            {"max_attempts": "5", "graph_limits": {"wide": "2"}}
+        ).get_job_queue_config()
+
+        self.assertEqual(config["max_attempts"], 5)
+        self.assertEqual(config["graph_limits"], {"wide": 2})
+        self.assertEqual(_make_app_config().get_job_queue_config()["max_attempts"], 3)
+
+    def test_server_workers_are_opt_in(self):
+        self.assertFalse(_make_app_config().get_job_queue_config()["start_with_server"])
+        config = _make_app_config({"start_with_server": True}).get_job_queue_config()
+        self.assertTrue(config["start_with_server"])
+
+    def test_invalid_values_raise(self):
+        for job_queue in (
+            {"max_attempts": 0},
+            {"graph_limits": {"wide": "many"}},
+            {"graph_limits": {"wide": -1}},
+        ):
+            with self.subTest(job_queue=job_queue):
+                with self.assertRaises(ConfigurationException):
+                    _make_app_config(job_queue).get_job_queue_config()
+
+
+class TestJobQueueService(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, "jobs", "jobs.db")
+        self.queue = self._make_queue()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _make_queue(self, **kwargs):
+        return JobQueueService(
+            db_path=self.db_path,
+            logging_service=MockServiceFactory.create_mock_logging_service(),
+            **kwargs,
+        )
+
+    def test_submit_persists_queued_job(self):
+        job = self.queue.submit("wf::graph", {"x": 1}, priority=2, execution_id="e1")
+
+        self.assertTrue(job.job_id.startswith("job_"))
+        loaded = self._make_queue().get(job.job_id)
+        self.assertEqual(loaded.status, JobStatus.QUEUED)
+        self.assertEqual(loaded.inputs, {"x": 1})
+        self.assertEqual(loaded.priority, 2)
+        self.assertEqual(loaded.execution_id, "e1")
+
+    def test_claim_orders_by_priority_then_age(self):
+        low = self.queue.submit("a", {})
+        high = self.queue.submit("b", {}, priority=5)
+        low2 = self.queue.submit("c", {})
+
+        claimed = [self.queue.claim_next("w").job_id for _ in range(3)]
+
+        self.assertEqual(claimed, [high.job_id, low.job_id, low2.job_id])
+        self.assertIsNone(self.queue.claim_next("w"))
+
+    def test_claim_marks_running_and_counts_attempts(self):
+        job = self.queue.submit("a", {})
+        claimed = self.queue.claim_next("worker-1")
+
+        self.assertEqual(claimed.job_id, job.job_id)
+        self.assertEqual(claimed.status, JobStatus.RUNNING)
+        self.assertEqual(claimed.worker_id, "worker-1")
+        self.assertEqual(claimed.attempts, 1)
+
+    def test_per_graph_cap_skips_saturated_graph(self):
+        queue = self._make_queue(max_concurrent_per_graph=1)
+        first = queue.submit("busy", {}, priority=9)
+        queue.submit("busy", {}, priority=9)
+        other = queue.submit("other", {})
+
+        self.assertEqual(queue.claim_next("w").job_id, first.job_id)
+        # Second "busy" job is higher priority but its graph is at the cap.
+        self.assertEqual(queue.claim_next("w").job_id, other.job_id)
+        self.assertIsNone(queue.claim_next("w"))
+
+    def test_graph_limit_override(self):
+        queue = self._make_queue(max_concurrent_per_graph=1, graph_limits={"wide": 2})
+        queue.submit("wide", {})
+        queue.submit("wide", {})
+
+        self.assertIsNotNone(queue.claim_next("w"))
+        self.assertIsNotNone(queue.claim_next("w"))
+
+    def test_finish_records_result_and_ttl(self):
+        queue = self._make_queue(result_ttl_seconds=60)
+        job = queue.submit("a", {})
+        queue.claim_next("w")
+
+        self.assertTrue(
+            queue.finish(job.job_id, JobStatus.COMPLETED, result={"outputs": {"y": 2}})
+        )
+
+        done = queue.get(job.job_id)
+        self.assertEqual(done.status, JobStatus.COMPLETED)
+        self.assertEqual(done.result, {"outputs": {"y": 2}})
+        self.assertAlmostEqual(done.expires_at - done.finished_at, 60, places=3)
+
+    def test_finish_rejects_non_terminal_status(self):
+        job = self.queue.submit("a", {})
+        with self.assertRaises(ValueError):
+            self.queue.finish(job.job_id, JobStatus.RUNNING)
+
+    def test_cancel_queued_job_is_immediate(self):
+        job = self.queue.submit("a", {})
+
+        cancelled = self.queue.request_cancel(job.job_id)
+
+        self.assertEqual(cancelled.status, JobStatus.CANCELLED)
+        self.assertIsNone(self.queue.claim_next("w"))
+
+    def test_cancel_running_job_sets_flag_seen_by_heartbeat(self):
+        job = self.queue.submit("a", {})
+        self.queue.claim_next("w")
+        self.assertFalse(self.queue.heartbeat(job.job_id))
+
+        flagged = self.queue.request_cancel(job.job_id)
+
+        self.assertEqual(flagged.status, JobStatus.RUNNING)
+        self.assertTrue(flagged.cancel_requested)
+        self.assertTrue(self.queue.heartbeat(job.job_id))
+
+    def test_cancel_unknown_job_returns_none(self):
+        self.assertIsNone(self.queue.request_cancel("job_missing"))
+
+    def test_purge_expired_removes_only_expired_results(self):
+        queue = self._make_queue(result_ttl_seconds=10)
+        finished = queue.submit("a", {})
+        pending = queue.submit("b", {})
+        queue.claim_next("w")
+        queue.finish(finished.job_id, JobStatus.FAILED, error="boom")
+
+        self.assertEqual(queue.purge_expired(now=time.time() + 5), 0)
+        self.assertEqual(queue.purge_expired(now=time.time() + 11), 1)
+        self.assertIsNone(queue.get(finished.job_id))
+        self.assertIsNotNone(queue.get(pending.job_id))
+
+    def test_recover_stale_requeues_then_fails_after_max_attempts(self):
+        queue = self._make_queue(max_attempts=2)
+        job = queue.submit("a", {})
+
+        queue.claim_next("w")
+        self.assertEqual(queue.recover_stale(stale_after_seconds=-1), 1)
+        self.assertEqual(queue.get(job.job_id).status, JobStatus.QUEUED)
+
+        queue.claim_next("w")
+        queue.recover_stale(stale_after_seconds=-1)
+        failed = queue.get(job.job_id)
+        self.assertEqual(failed.status, JobStatus.FAILED)
+        self.assertIn("Worker lost", failed.error)
+
+    def test_release_returns_running_job_to_queue(self):
+        job = self.queue.submit("a", {})
+        self.queue.claim_next("w")
+
+        self.assertTrue(self.queue.release(job.job_id))
+        self.assertEqual(self.queue.claim_next("w2").job_id, job.job_id)
+
+    def test_list_and_count(self):
+        self.queue.submit("a", {})
+        self.queue.submit("b", {})
+        self.queue.claim_next("w")
+
+        self.assertEqual(len(self.queue.list_jobs()), 2)
+        self.assertEqual(len(self.queue.list_jobs(graph_name="b")), 1)
+        self.assertEqual(len(self.queue.list_jobs(status="running")), 1)
+        self.assertEqual(self.queue.count_by_status(), {"queued": 1, "running": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
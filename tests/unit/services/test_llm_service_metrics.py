@@ -32,6 +32,7 @@ from agentmap.services.telemetry.constants import (
     METRIC_LLM_DURATION,
     METRIC_LLM_ERRORS,
     METRIC_LLM_FALLBACK,
+    METRIC_LLM_HEDGE,
     METRIC_LLM_ROUTING_CACHE_HIT,
     METRIC_LLM_TOKENS_INPUT,
     METRIC_LLM_TOKENS_OUTPUT,
@@ -181,13 +182,13 @@ class TestAC1InstrumentsCreatedAtInit:
         assert METRIC_LLM_DURATION in called_names
 
     def test_create_counter_called_five_times(self):
-        """create_counter called 9 times: tokens_input, tokens_output, errors,
-        cache_hit, fallback, batch_submitted, batch_poll, batch_results_fetched,
-        batch_cancel."""
+        """create_counter called 10 times: tokens_input, tokens_output, errors,
+        cache_hit, fallback, hedge, batch_submitted, batch_poll,
+        batch_results_fetched, batch_cancel."""
         mock_telemetry, _, instruments = _make_mock_telemetry()
         _make_llm_service(telemetry_service=mock_telemetry)
 
-        assert mock_telemetry.create_counter.call_count == 9
+        assert mock_telemetry.create_counter.call_count == 10
         names = [c[0][0] for c in mock_telemetry.create_counter.call_args_list]
         assert METRIC_LLM_TOKENS_INPUT in names
         assert METRIC_LLM_TOKENS_OUTPUT in names
@@ -211,12 +212,20 @@ class TestAC1InstrumentsCreatedAtInit:
         names = [c[0][0] for c in mock_telemetry.create_counter.call_args_list]
         assert METRIC_LLM_FALLBACK in names
 
+    def test_create_counter_for_hedge(self):
+        """create_counter includes METRIC_LLM_HEDGE."""
+        mock_telemetry, _, instruments = _make_mock_telemetry()
+        _make_llm_service(telemetry_service=mock_telemetry)
+
+        names = [c[0][0] for c in mock_telemetry.create_counter.call_args_list]
+        assert METRIC_LLM_HEDGE in names
+
     def test_total_counter_calls_is_five(self):
-        """create_counter called 9 times total (5 realtime + 4 batch)."""
+        """create_counter called 10 times total (6 realtime + 4 batch)."""
         mock_telemetry, _, instruments = _make_mock_telemetry()
         _make_llm_service(telemetry_service=mock_telemetry)
 
-        assert mock_telemetry.create_counter.call_count == 9
+        assert mock_telemetry.create_counter.call_count == 10
 
     def test_instruments_stored_as_instance_attributes(self):
         """All seven instruments stored on self."""
@@ -13,6 +13,8 @@ SERVICE_NAMES = [
     "file_path_service",
     "prompt_manager_service",
     "auth_service",
+    "job_queue_service",
+    "warm_start_snapshot_service",
     # storage_di
     "storage_config_service",
     "blob_storage_service",
@@ -43,6 +45,7 @@ SERVICE_NAMES = [
     "routing_cache",
     "llm_routing_service",
     "llm_service",
+    "llm_batch_watch_service",
     # host_registry
     "host_service_registry",
     "host_protocol_configuration_service",
@@ -57,6 +60,7 @@ SERVICE_NAMES = [
     "execution_tracking_service",
     "execution_policy_service",
     "graph_factory_service",
+    "execution_pool_service",
     "graph_assembly_service",
     "protocol_requirements_analyzer",
     "graph_registry_service",